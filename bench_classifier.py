@@ -0,0 +1,116 @@
+import json
+import random
+import re
+import time
+
+from event_classifier import EventClassifier, HEADER_MAP, DESC_MAP
+
+# Per-event classification cost, old inline build_schedule loop vs EventClassifier,
+# on a synthetic timetable 100x the size of parsed_timetable_v6.json. Its
+# (header, desc) pairs repeat, so EventClassifier mostly answers from its memo;
+# the cold number instead classifies the real timetable SCALE times with a
+# fresh EventClassifier for each pass.
+
+SCALE = 100
+
+def legacy_classify(e):
+    # The per-event body build_schedule.py used before EventClassifier
+    desc = e['desc']
+    event_header = e['event']
+    full_text = f"{event_header or ''} {desc}".strip()
+
+    gender_pattern = r'\b(M/W|MIXED|MIX|M|W|X)\b'
+    age_pattern = r'(\d{2}(?:-\d{2})?(?:\+)?)(?![0-9])'
+    gap_pattern = r'(?:\s*(?:Final|Heats|m|SF|QF|Semi|gr\.\d)\s*)*'
+    pattern = f'{gender_pattern}{gap_pattern}{age_pattern}'
+    matches = re.findall(pattern, full_text, re.IGNORECASE)
+    if not matches:
+        concat_pattern = r'\b(M|W)(\d{2}(?:-\d{2})?(?:\+)?)(?![0-9])'
+        matches = re.findall(concat_pattern, full_text, re.IGNORECASE)
+
+    event_code = None
+    header_map = dict(HEADER_MAP)
+    if event_header:
+        for k, v in header_map.items():
+            if k.lower() in event_header.lower():
+                event_code = v
+                break
+
+    desc_map = dict(DESC_MAP)
+    for k, v in desc_map.items():
+        if k.lower() in desc.lower():
+            if v == '3000' and 'RW' in desc.upper(): continue
+            if v == '60' and 'hurdles' in desc.lower(): continue
+            if event_code in ['PEN', '4x200', 'XC', '5K', '5KW', '3000W']:
+                break
+            event_code = v
+            break
+
+    if not (event_code and matches):
+        return []
+    slots = []
+    for genders_str, ag in matches:
+        gs = genders_str.upper()
+        if gs in ['MIX', 'MIXED', 'X']: target_genders = ['X']
+        elif '/' in gs or gs == 'M+W': target_genders = ['M', 'F']
+        elif gs == 'W': target_genders = ['F']
+        else: target_genders = ['M']
+        target_ages = []
+        if '-' in ag:
+            parts = ag.split('-')
+            start = int(parts[0])
+            end_str = re.sub(r'\D', '', parts[1])
+            end = int(end_str) if end_str else start
+            for age_val in range(start, end + 5, 5):
+                target_ages.append(f'V{age_val}')
+        elif '+' in ag:
+            start = int(ag.replace('+', ''))
+            for age_val in range(start, 100, 5):
+                target_ages.append(f'V{age_val}')
+        else:
+            target_ages.append(f'V{ag}')
+        slots.append((event_code, tuple(target_genders), tuple(target_ages)))
+    return slots
+
+def synthetic_timetable(events, scale, seed=2026):
+    # Re-pairs headers and descriptions so the big timetable is not just the
+    # same strings over and over
+    rng = random.Random(seed)
+    headers = [e['event'] for e in events]
+    out = list(events)
+    for _ in range(scale - 1):
+        for e in events:
+            out.append({**e, 'event': rng.choice(headers)})
+    return out
+
+def timed(fn, events):
+    start = time.perf_counter()
+    result = fn(events)
+    return result, time.perf_counter() - start
+
+def timed_cold(events, passes):
+    elapsed = 0.0
+    for _ in range(passes):
+        classifier = EventClassifier()
+        result, seconds = timed(classifier.classify_batch, events)
+        elapsed += seconds
+    return result, elapsed
+
+if __name__ == '__main__':
+    with open('parsed_timetable_v6.json', 'r') as f:
+        base = json.load(f)
+    events = synthetic_timetable(base, SCALE)
+
+    legacy, legacy_s = timed(lambda evs: [legacy_classify(e) for e in evs], events)
+    classifier = EventClassifier()
+    compiled, compiled_s = timed(classifier.classify_batch, events)
+    cold, cold_s = timed_cold(base, SCALE)
+
+    assert legacy == compiled, 'EventClassifier disagrees with the legacy matcher'
+    assert cold == compiled[:len(base)], 'a fresh EventClassifier disagrees with a warm one'
+    n = len(events)
+    print(f"{n} events ({SCALE}x parsed_timetable_v6.json)")
+    print(f"legacy loop      {legacy_s:8.3f} s  {legacy_s / n * 1e6:7.2f} us/event")
+    print(f"EventClassifier  {compiled_s:8.3f} s  {compiled_s / n * 1e6:7.2f} us/event  (memo warm)")
+    print(f"EventClassifier  {cold_s:8.3f} s  {cold_s / n * 1e6:7.2f} us/event  (fresh per pass)")
+    print(f"speedup          {legacy_s / compiled_s:8.1f}x warm, {legacy_s / cold_s:.1f}x cold")
@@ -0,0 +1,57 @@
+import argparse
+import time
+import tracemalloc
+
+import parse_engine
+
+# Wall time, peak memory and accuracy of every parser strategy over one
+# extraction. Each strategy is checked against a golden file: by default its
+# own committed parsed_timetable_*.json, so any refactor that changes output
+# shows up as changed/missing/extra events and the fields that moved.
+# --golden compares every strategy against one reference instead (e.g. the
+# hand-checked v6 output), which is how to see how far the older parsers are
+# from it.
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def format_fields(fields):
+    return ', '.join(f'{k} {v}' for k, v in sorted(fields.items(), key=lambda kv: -kv[1])) or '-'
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('strategies', nargs='*', help='strategies to run (default: all)')
+    parser.add_argument('--golden', help='compare every strategy against this file instead of its own output')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per strategy; the fastest is reported')
+    parser.add_argument('--no-cache', action='store_true', help='extract the PDF without the on-disk cache')
+    args = parser.parse_args()
+
+    doc = parse_engine.Document(use_cache=not args.no_cache)
+    _, elapsed, peak = measure(lambda: (doc.pages, doc.text))
+    print(f"extraction: {len(doc.pages)} pages in {elapsed:.2f} s, peak {peak / 2**20:.1f} MB (once for all strategies)")
+    print()
+    print(f"{'strategy':8} {'ms':>8} {'peak MB':>8} {'events':>7} {'golden':>7} {'same':>6} {'changed':>8} {'missing':>8} {'extra':>6}  fields")
+
+    failed = False
+    for name in args.strategies or parse_engine.STRATEGIES:
+        runs = [measure(parse_engine.run_strategy, doc, name) for _ in range(args.repeat)]
+        events = runs[0][0]
+        elapsed = min(r[1] for r in runs)
+        peak = max(r[2] for r in runs)
+        golden = parse_engine.load_golden(args.golden or parse_engine.STRATEGIES[name]['output'])
+        # Against a shared reference, only compare the fields both outputs have
+        fields = None
+        if args.golden and events and golden:
+            fields = sorted(set(events[0]) & set(golden[0]))
+        report = parse_engine.compare(events, golden, fields)
+        failed |= report['same'] != report['count'] or report['count'] != report['golden']
+        print(f"{name:8} {elapsed * 1000:8.1f} {peak / 2**20:8.2f} {report['count']:7} {report['golden']:7} {report['same']:6} "
+              f"{report['changed']:8} {report['missing']:8} {report['extra']:6}  {format_fields(report['fields'])}")
+    if failed and not args.golden:
+        print("\nsome strategies no longer reproduce their golden output")
@@ -0,0 +1,162 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import socket
+import subprocess
+import sys
+import time
+
+from compact_schedule import decode, expand
+from query_service import DEFAULT_PORT
+
+# Load test for query_service.py: starts the service in its own process and
+# drives it from --workers client processes, each holding --connections
+# keep-alive connections that send requests back to back for --seconds. The
+# URL mix is drawn from the meeting itself (athletes by bib, event groups,
+# times during the schedule, teams). A --conditional share of requests
+# resends the ETag of an earlier response for the same URL, as a polling
+# page would, and every request accepts gzip.
+#
+# Reports throughput, latency percentiles and status counts; --touch
+# rewrites prog.json halfway through (same content, new mtime and a changed
+# name) to show requests keep being served across a hot swap.
+
+MIX = (('athlete', 0.4), ('event', 0.3), ('at', 0.15), ('team', 0.1), ('status', 0.05))
+
+def request_urls(prog_path, schedule_path, count, seed=2026):
+    with open(prog_path, 'r') as f:
+        meeting = json.load(f)
+    with open(schedule_path, 'r') as f:
+        rows = expand(decode(json.load(f)))
+    rng = random.Random(seed)
+    bibs = [c['competitorId'] for c in meeting['competitors']]
+    teams = sorted({c['teamId'] for c in meeting['competitors'] if c.get('teamId')})
+    groups = sorted({(r['eventCode'], ('W' if r['gender'] == 'F' else r['gender']) + r['ageGroup'][1:]) for r in rows})
+    days = sorted({r['day'] for r in rows})
+
+    kinds, weights = zip(*MIX)
+    urls = []
+    for kind in rng.choices(kinds, weights, k=count):
+        if kind == 'athlete':
+            urls.append(f'/athlete?bib={rng.choice(bibs)}')
+        elif kind == 'event':
+            code, group = rng.choice(groups)
+            urls.append(f'/event?code={code}&group={group}')
+        elif kind == 'at':
+            urls.append(f'/at?day={rng.choice(days)}&time={rng.randint(8, 19):02d}:{rng.choice((0, 15, 30, 45)):02d}')
+        elif kind == 'team':
+            urls.append(f'/team?id={rng.choice(teams)}')
+        else:
+            urls.append('/status')
+    return urls
+
+async def connection(host, port, urls, offset, deadline, conditional, rng, stats):
+    reader, writer = await asyncio.open_connection(host, port)
+    etags = {}
+    i = offset
+    while time.perf_counter() < deadline:
+        url = urls[i % len(urls)]
+        i += 1
+        lines = [f'GET {url} HTTP/1.1', f'Host: {host}', 'Accept-Encoding: gzip']
+        if url in etags and rng.random() < conditional:
+            lines.append(f'If-None-Match: {etags[url]}')
+        start = time.perf_counter()
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        head = await reader.readuntil(b'\r\n\r\n')
+        status = int(head[9:12])
+        length = 0
+        for line in head.split(b'\r\n')[1:]:
+            name, _, value = line.partition(b':')
+            name = name.lower()
+            if name == b'content-length':
+                length = int(value)
+            elif name == b'etag':
+                etags[url] = value.strip().decode('latin-1')
+        if length:
+            await reader.readexactly(length)
+        stats['latencies'].append(time.perf_counter() - start)
+        stats['status'][status] = stats['status'].get(status, 0) + 1
+        stats['bytes'] += len(head) + length
+    writer.close()
+
+def client(args):
+    host, port, urls, connections, seconds, conditional, seed = args
+    stats = {'latencies': [], 'status': {}, 'bytes': 0}
+    rng = random.Random(seed)
+
+    async def run():
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(*(connection(host, port, urls, rng.randrange(len(urls)), deadline, conditional, rng, stats)
+                               for _ in range(connections)))
+
+    asyncio.run(run())
+    return stats
+
+def wait_for_port(host, port, proc, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit('query_service.py exited before it was ready')
+        try:
+            socket.create_connection((host, port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise SystemExit(f'query_service.py did not listen on {host}:{port} within {timeout} s')
+
+def touch_prog(prog_path):
+    with open(prog_path, 'r') as f:
+        meeting = json.load(f)
+    meeting['competitors'][0]['lastName'] += ' '
+    with open(prog_path, 'w') as f:
+        json.dump(meeting, f)
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--prog', default='prog.json')
+    parser.add_argument('--schedule', default='schedule_compact.json')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT + 1)
+    parser.add_argument('--workers', type=int, default=2, help='client processes')
+    parser.add_argument('--connections', type=int, default=32, help='keep-alive connections per client process')
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--urls', type=int, default=5000, help='distinct request URLs to draw from')
+    parser.add_argument('--conditional', type=float, default=0.3, help='share of repeat requests sent with If-None-Match')
+    parser.add_argument('--touch', action='store_true', help='rewrite --prog halfway through to force a hot swap (use a copy)')
+    args = parser.parse_args()
+
+    host = '127.0.0.1'
+    urls = request_urls(args.prog, args.schedule, args.urls)
+    server = subprocess.Popen([sys.executable, 'query_service.py', '--port', str(args.port), '--prog', args.prog,
+                               '--schedule', args.schedule, '--interval', '0.5'], stdout=subprocess.PIPE, text=True)
+    try:
+        wait_for_port(host, args.port, server)
+        jobs = [(host, args.port, urls, args.connections, args.seconds, args.conditional, seed) for seed in range(args.workers)]
+        with multiprocessing.Pool(args.workers) as pool:
+            pending = pool.map_async(client, jobs)
+            if args.touch:
+                time.sleep(args.seconds / 2)
+                touch_prog(args.prog)
+            results = pending.get()
+    finally:
+        server.terminate()
+        log, _ = server.communicate()
+
+    latencies = sorted(l for r in results for l in r['latencies'])
+    status = {}
+    for r in results:
+        for code, n in r['status'].items():
+            status[code] = status.get(code, 0) + n
+    total_bytes = sum(r['bytes'] for r in results)
+    print(f"{len(latencies)} requests in {args.seconds:.1f} s over {args.workers * args.connections} connections: "
+          f"{len(latencies) / args.seconds:.0f} req/s, {total_bytes / args.seconds / 1e6:.1f} MB/s")
+    print(f"latency: p50 {percentile(latencies, 0.5) * 1000:.2f} ms   p95 {percentile(latencies, 0.95) * 1000:.2f} ms   "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f} ms   max {latencies[-1] * 1000:.2f} ms")
+    print('status: ' + ', '.join(f'{code} x{n}' for code, n in sorted(status.items())))
+    for line in log.splitlines():
+        if line.startswith('swapped'):
+            print(f'service: {line}')
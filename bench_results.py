@@ -0,0 +1,116 @@
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from common import HIGHER_IS_BETTER
+from results import ResultsStore
+
+# Per-update latency of results.ResultsStore on a synthetic meet: every
+# event's entrants are split into heats (pools for field events) and the
+# feed publishes each heat one result (or one round of trials) at a time,
+# the way the timing system does. Each update is applied and flushed on its
+# own; the comparison is reloading the finished meeting into a fresh store
+# and writing everything, which is what a full-document rebuild costs. The
+# incremental rankings are checked against the fresh store's.
+
+HEAT_SIZE = 8
+POOL_SIZE = 16
+FIELD_ATTEMPTS = 3
+
+def performance(rng, event_code):
+    if event_code in HIGHER_IS_BETTER:
+        return f'{rng.uniform(1, 60):.2f}'
+    seconds = rng.uniform(7, 1500)
+    return f'{int(seconds // 60)}:{seconds % 60:05.2f}' if seconds >= 60 else f'{seconds:.2f}'
+
+def feed(meeting, seed=2026):
+    # Yields each heat as published so far, one result or trial at a time
+    rng = random.Random(seed)
+    entrants = {}
+    for c in meeting['competitors']:
+        for e in c.get('eventsEntered') or []:
+            entrants.setdefault(e['eventId'], []).append(c['competitorId'])
+
+    for event in meeting['events']:
+        bibs = entrants.get(event['eventId'], [])
+        field = event['eventCode'] in HIGHER_IS_BETTER
+        size = POOL_SIZE if field else HEAT_SIZE
+        for heat, start in enumerate(range(0, len(bibs), size), 1):
+            unit = {'eventId': event['eventId'], 'eventCode': event['eventCode'], 'round': 1, 'heat': heat,
+                    'roundName': 'Final', 'heatName': f'Heat {heat}', 'resultsStatus': 'in_progress', 'results': [], 'trials': []}
+            heat_bibs = bibs[start:start + size]
+            if field:
+                for attempt in range(1, FIELD_ATTEMPTS + 1):
+                    for bib in heat_bibs:
+                        unit['trials'].append({'bib': bib, 'attempt': attempt, 'performance': performance(rng, event['eventCode']), 'valid': rng.random() > 0.25})
+                        if attempt == 1:
+                            unit['results'].append({'bib': bib, 'status': 'OK'})
+                        yield json.loads(json.dumps(unit))
+            else:
+                for place, bib in enumerate(heat_bibs, 1):
+                    unit['results'].append({'bib': bib, 'place': place, 'performance': performance(rng, event['eventCode']), 'status': 'OK'})
+                    yield json.loads(json.dumps(unit))
+            unit['resultsStatus'] = 'final'
+            yield unit
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--prog', default='prog.json')
+    parser.add_argument('--limit', type=int, default=None, help='stop after this many updates')
+    parser.add_argument('--tmp', default=None, help='directory for the output files (e.g. /dev/shm to leave the disk out)')
+    args = parser.parse_args()
+
+    with open(args.prog, 'r') as f:
+        meeting = json.load(f)
+
+    with tempfile.TemporaryDirectory(dir=args.tmp) as tmp:
+        store = ResultsStore(os.path.join(tmp, 'live'))
+        store.load_meeting(args.prog)
+        store.flush()
+
+        latencies = []
+        written = 0
+        final_units = {}
+        for n, unit in enumerate(feed(meeting)):
+            if args.limit is not None and n >= args.limit:
+                break
+            start = time.perf_counter()
+            store.apply_unit(unit)
+            units, rankings = store.flush()
+            latencies.append(time.perf_counter() - start)
+            written += units + rankings
+            final_units[unit['eventId'], unit['round'], unit['heat']] = unit
+
+        print(f"{len(latencies)} updates, {written} files written, "
+              f"{sum(latencies):.2f} s total ({len(latencies) / sum(latencies):.0f} updates/s)")
+        print(f"per update: p50 {percentile(latencies, 0.5) * 1000:.2f} ms   "
+              f"p95 {percentile(latencies, 0.95) * 1000:.2f} ms   max {max(latencies) * 1000:.2f} ms")
+
+        # The finished meeting as one document, reloaded from scratch
+        by_event = {}
+        for unit in final_units.values():
+            by_event.setdefault(unit['eventId'], []).append(unit)
+        for event in meeting['events']:
+            event['units'] = by_event.get(event['eventId'], [])
+        full_path = os.path.join(tmp, 'full.json')
+        with open(full_path, 'w') as f:
+            json.dump(meeting, f)
+
+        start = time.perf_counter()
+        fresh = ResultsStore(os.path.join(tmp, 'fresh'))
+        fresh.load_meeting(full_path)
+        units, rankings = fresh.flush()
+        elapsed = time.perf_counter() - start
+        print(f"full reload: {elapsed * 1000:.0f} ms for {units} unit and {rankings} ranking files "
+              f"({elapsed / percentile(latencies, 0.5):.0f}x the median update)")
+
+        assert fresh.rankings == store.rankings, 'incremental rankings differ from a full reload'
+        assert fresh.manifest == store.manifest, 'incremental files differ from a full reload'
+        print(f"rankings match a full reload ({len(store.rankings)} event/age group rankings)")
@@ -0,0 +1,120 @@
+import argparse
+import gc
+import json
+import random
+import resource
+import subprocess
+import sys
+import time
+
+from competitor_store import CompetitorStore
+from prog_stream import iter_competitors
+
+# Memory and speed of competitor_store.CompetitorStore against the raw dicts
+# json.load gives, on prog.json's field copied --scales times over (each
+# copy with its own bibs). Every form and scale runs in a fresh process, so
+# the memory figure is the peak RSS it took to hold that field (for the
+# store, including the one copy being decoded at a time). Timed per form:
+#
+#   load     building the form from the records
+#   counts   entries per (eventCode, gender, ageGroup), the pass most tools make
+#   index    building bib/team lookups (the store has them already)
+#   lookup   --lookups random bibs, each to its team name and entry count
+
+def copies(competitors, scale):
+    # Each copy as its own JSON document, so the dicts share nothing across
+    # copies, as separate json.load calls would not
+    text = json.dumps(competitors)
+    for copy in range(scale):
+        for athlete in json.loads(text):
+            if copy:
+                athlete['competitorId'] = f"{athlete['competitorId']}-{copy}"
+            yield athlete
+
+def rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def measure_dicts(competitors, scale, bibs):
+    start = time.perf_counter()
+    field = list(copies(competitors, scale))
+    loaded = time.perf_counter()
+
+    counts = {}
+    for athlete in field:
+        for event in athlete.get('eventsEntered') or []:
+            key = (event['eventCode'], athlete['gender'], athlete['ageGroup'])
+            counts[key] = counts.get(key, 0) + 1
+    counted = time.perf_counter()
+
+    by_bib = {a['competitorId']: a for a in field}
+    by_team = {}
+    for a in field:
+        by_team.setdefault(a.get('teamId'), []).append(a)
+    indexed = time.perf_counter()
+
+    found = 0
+    for bib in bibs:
+        athlete = by_bib[bib]
+        found += len(athlete.get('teamName') or '') + len(athlete.get('eventsEntered') or [])
+    looked_up = time.perf_counter()
+    return field, counts, (loaded - start, counted - loaded, indexed - counted, looked_up - indexed), found
+
+def measure_store(competitors, scale, bibs):
+    start = time.perf_counter()
+    store = CompetitorStore()
+    for athlete in copies(competitors, scale):
+        store.add(athlete)
+    loaded = time.perf_counter()
+
+    counts = store.group_counts()
+    counted = time.perf_counter()
+
+    found = 0
+    for bib in bibs:
+        athlete = store.find(bib)
+        row = athlete.row
+        found += len(athlete.team_name or '') + store.entry_offsets[row + 1] - store.entry_offsets[row]
+    looked_up = time.perf_counter()
+    return store, counts, (loaded - start, counted - loaded, 0.0, looked_up - counted), found
+
+FORMS = {'dicts': measure_dicts, 'store': measure_store}
+
+def child(form, prog_path, scale, lookups):
+    competitors = list(iter_competitors(prog_path))
+    rng = random.Random(scale)
+    bibs = [f"{a['competitorId']}-{rng.randrange(1, scale)}" if scale > 1 and rng.random() < 0.9 else a['competitorId']
+            for a in rng.choices(competitors, k=lookups)]
+    gc.collect()
+    baseline = rss_mb()
+    held, counts, timings, found = FORMS[form](competitors, scale, bibs)
+    gc.collect()
+    print(json.dumps({'form': form, 'scale': scale, 'memory': rss_mb() - baseline, 'timings': timings,
+                      'entries': sum(counts.values()), 'groups': len(counts), 'found': found}))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--prog', default='prog.json')
+    parser.add_argument('--scales', default='1,10,100', help='comma-separated copies of the field to test')
+    parser.add_argument('--lookups', type=int, default=100000)
+    parser.add_argument('--child', nargs=2, metavar=('FORM', 'SCALE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child[0], args.prog, int(args.child[1]), args.lookups)
+        sys.exit(0)
+
+    print(f"{'':14}{'memory':>10}{'load':>10}{'counts':>10}{'index':>10}{'lookup':>12}")
+    for scale in (int(s) for s in args.scales.split(',')):
+        results = {}
+        for form in FORMS:
+            out = subprocess.run([sys.executable, __file__, '--prog', args.prog, '--lookups', str(args.lookups),
+                                  '--child', form, str(scale)], capture_output=True, text=True, check=True)
+            results[form] = r = json.loads(out.stdout)
+            load, counts, index, lookup = r['timings']
+            print(f"{form:>6} x{scale:<6}{r['memory']:8.0f} MB{load:9.2f}s{counts * 1000:8.0f}ms{index * 1000:8.0f}ms"
+                  f"{lookup / args.lookups * 1e6:9.2f} us")
+        dicts, store = results['dicts'], results['store']
+        assert (dicts['entries'], dicts['groups'], dicts['found']) == (store['entries'], store['groups'], store['found']), \
+            'store and dicts disagree'
+        print(f"{'':8}{dicts['entries']} entries: store uses {store['memory'] / max(dicts['memory'], 1):.0%} of the memory, "
+              f"counts {dicts['timings'][1] / max(store['timings'][1], 1e-9):.0f}x faster")
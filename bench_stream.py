@@ -0,0 +1,108 @@
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from prog_stream import walk
+
+# Peak RSS and wall time of json.load vs prog_stream.walk on a synthetic
+# meeting feed. The feed is prog.json with the competitor list repeated and
+# every unit filled with results and field trials, the way the file grows
+# during the championships. Each reader runs in its own child process so
+# its peak RSS is measured in isolation.
+
+def synthetic_result(rng, bib, place):
+    return {
+        'bib': bib, 'place': place, 'performance': f'{rng.uniform(7, 70):.2f}',
+        'points': rng.randint(400, 1100), 'wind': None, 'status': 'OK',
+        'trials': [{'attempt': n, 'performance': f'{rng.uniform(5, 70):.2f}', 'valid': rng.random() > 0.2} for n in range(1, 7)]
+    }
+
+def write_feed(path, target_mb, seed=2026):
+    with open('prog.json', 'r') as f:
+        meeting = json.load(f)
+    rng = random.Random(seed)
+    competitors = meeting.pop('competitors')
+    events = meeting.pop('events')
+    bibs = [c['competitorId'] for c in competitors]
+
+    # Split the budget: a third for competitors, the rest for unit results
+    target = target_mb * 1024 * 1024
+    competitor_bytes = sum(len(json.dumps(c)) + 2 for c in competitors)
+    copies = max(1, target // 3 // competitor_bytes)
+    unit_count = sum(len(e['units']) for e in events)
+    result_bytes = len(json.dumps(synthetic_result(rng, bibs[0], 1))) + 2
+    results_per_unit = max(1, (target - copies * competitor_bytes) // unit_count // result_bytes)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{')
+        for key, value in meeting.items():
+            f.write(f'{json.dumps(key)}: {json.dumps(value)}, ')
+        f.write('"competitors": [')
+        first = True
+        for copy in range(copies):
+            for c in competitors:
+                f.write(('' if first else ', ') + json.dumps({**c, 'competitorId': f"{c['competitorId']}-{copy}"}))
+                first = False
+        f.write('], "events": [')
+        for i, event in enumerate(events):
+            units = event.pop('units')
+            f.write(('' if i == 0 else ', ') + json.dumps(event)[:-1] + ', "units": [')
+            for j, unit in enumerate(units):
+                unit = {**unit, 'results': [synthetic_result(rng, rng.choice(bibs), n + 1) for n in range(results_per_unit)]}
+                f.write(('' if j == 0 else ', ') + json.dumps(unit))
+            f.write(']}')
+        f.write(']}')
+    return os.path.getsize(path)
+
+def read_load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        meeting = json.load(f)
+    return len(meeting['competitors']), sum(len(u['results']) for e in meeting['events'] for u in e['units'])
+
+def read_stream(path):
+    competitors = results = 0
+    for kind, record in walk(path):
+        if kind == 'competitor':
+            competitors += 1
+        elif kind == 'unit':
+            results += len(record['results'])
+    return competitors, results
+
+READERS = {'json.load': read_load, 'stream': read_stream}
+
+def child(reader, path):
+    start = time.perf_counter()
+    counts = READERS[reader](path)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({'counts': counts, 'seconds': elapsed, 'peak_kb': peak_kb}))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--mb', type=int, default=200, help='approximate size of the synthetic feed')
+    parser.add_argument('--child', nargs=2, metavar=('READER', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        sys.exit(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'feed.json')
+        size = write_feed(path, args.mb)
+        print(f"synthetic feed: {size / 2**20:.0f} MB")
+        baseline = None
+        for reader in READERS:
+            out = subprocess.run([sys.executable, __file__, '--child', reader, path], capture_output=True, text=True, check=True)
+            stats = json.loads(out.stdout)
+            if baseline is None:
+                baseline = stats['counts']
+            assert stats['counts'] == baseline, f'{reader} read different records'
+            print(f"{reader:10} {stats['seconds']:7.2f} s   peak RSS {stats['peak_kb'] / 1024:8.1f} MB   "
+                  f"{stats['counts'][0]} competitors, {stats['counts'][1]} results")
@@ -0,0 +1,213 @@
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import profiling
+from common import write_atomic
+
+# Single entry point for regenerating the site's artifacts. Each step lists
+# the files it reads (data and the code that processes it) and the files it
+# writes; a step only re-runs when one of those fingerprints changed since its
+# last successful run. Steps whose inputs are ready run concurrently, so the
+# timetable and competitor pipelines build side by side.
+
+STATE_FILE = '.build_state.json'
+
+STEPS = {
+    'timetable': {
+        'inputs': ['timetable.pdf', 'parse_v6.py', 'page_layout.py', 'extract_cache.py', 'profiling.py'],
+        'outputs': ['parsed_timetable_v6.json'],
+        'command': ['parse_v6.py'],
+    },
+    'schedule': {
+        'inputs': ['parsed_timetable_v6.json', 'build_schedule.py', 'event_classifier.py', 'compact_schedule.py', 'common.py',
+                   'profiling.py'],
+        'outputs': ['schedule.json', 'schedule_compact.json', 'src/js/schedule.js'],
+        'command': ['build_schedule.py'],
+    },
+    'join': {
+        'inputs': ['prog.json', 'schedule_compact.json', 'join_schedule.py', 'compact_schedule.py', 'common.py', 'prog_stream.py',
+                   'profiling.py'],
+        'outputs': ['src/js/schedule_lookup.js'],
+        'command': ['join_schedule.py'],
+    },
+    'conflicts': {
+        'inputs': ['prog.json', 'schedule_compact.json', 'conflicts.py', 'compact_schedule.py', 'event_classifier.py', 'prog_stream.py'],
+        'outputs': ['conflicts.json'],
+        'command': ['conflicts.py', '-q', '--json', 'conflicts.json'],
+    },
+    'occupancy': {
+        'inputs': ['prog.json', 'schedule_compact.json', 'parsed_timetable_v6.json', 'occupancy.py', 'conflicts.py',
+                   'seeding.py', 'competitor_store.py', 'compact_schedule.py', 'event_classifier.py', 'common.py', 'prog_stream.py',
+                   'profiling.py'],
+        'outputs': ['occupancy.json'],
+        'command': ['occupancy.py', '-q', '--json', 'occupancy.json'],
+    },
+    'seeding': {
+        'inputs': ['prog.json', 'seeding.py', 'common.py', 'prog_stream.py', 'profiling.py'],
+        'outputs': ['seeding.json'],
+        'command': ['seeding.py', '--json', 'seeding.json'],
+    },
+    # Reads nothing from schedule_lookup.js, but runs after join so the two
+    # never rewrite index.html at the same time
+    'bundle': {
+        'inputs': ['prog.json', 'schedule_compact.json', 'src/js/schedule_lookup.js', 'bundle_data.py', 'compact_schedule.py',
+                   'common.py', 'prog_stream.py', 'profiling.py'],
+        'outputs': ['src/js/data.js', 'src/shards/manifest.json'],
+        'command': ['bundle_data.py'],
+    },
+    # Reads nothing from data.js, but runs after bundle so the two never
+    # rewrite index.html at the same time
+    'search': {
+        'inputs': ['prog.json', 'src/js/data.js', 'search_index.py', 'common.py', 'prog_stream.py', 'profiling.py'],
+        'outputs': ['src/js/search.js'],
+        'command': ['search_index.py'],
+    },
+    # Runs after bundle (the facets name data.js by hash) and search, and owns
+    # index.html, which schedule, join, bundle, search and facets all stamp
+    # with cache-busting hashes
+    'facets': {
+        'inputs': ['prog.json', 'schedule_compact.json', 'src/js/data.js', 'src/js/search.js', 'facets.py', 'bundle_data.py',
+                   'join_schedule.py', 'compact_schedule.py', 'common.py', 'prog_stream.py', 'profiling.py'],
+        'outputs': ['src/js/facets.js', 'index.html'],
+        'command': ['facets.py'],
+    },
+}
+
+def file_hash(path):
+    if not os.path.exists(path):
+        return None
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def fingerprint(paths):
+    return {path: file_hash(path) for path in paths}
+
+def load_state(path=STATE_FILE):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_state(state, path=STATE_FILE):
+    write_atomic(path, json.dumps(state, indent=2, sort_keys=True))
+
+def dependencies(steps):
+    producers = {out: name for name, step in steps.items() for out in step['outputs']}
+    return {name: {producers[i] for i in step['inputs'] if i in producers and producers[i] != name}
+            for name, step in steps.items()}
+
+def is_stale(step, previous):
+    # Stale if never built, an input changed, or an output was deleted or edited by hand
+    if not previous:
+        return True
+    if fingerprint(step['inputs']) != previous['inputs']:
+        return True
+    return fingerprint(step['outputs']) != previous['outputs']
+
+def run_step(name, step, previous, force):
+    if not force and not is_stale(step, previous):
+        return 'up to date', previous, ''
+
+    inputs = fingerprint(step['inputs'])
+    missing = [path for path, digest in inputs.items() if digest is None]
+    if missing:
+        return 'failed', None, f"missing inputs: {', '.join(missing)}\n"
+
+    start = time.perf_counter()
+    with profiling.stage(f'step {name}'):
+        proc = subprocess.run([sys.executable, *step['command']], capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    log = proc.stdout + proc.stderr
+    if proc.returncode != 0:
+        return 'failed', None, log
+
+    record = {'inputs': inputs, 'outputs': fingerprint(step['outputs'])}
+    return f'rebuilt in {elapsed:.2f}s', record, log
+
+def select(steps, targets):
+    # The requested steps plus everything upstream of them
+    deps = dependencies(steps)
+    wanted = set()
+    stack = list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in wanted:
+            wanted.add(name)
+            stack.extend(deps[name])
+    return {name: steps[name] for name in steps if name in wanted}
+
+def build(steps=STEPS, targets=None, jobs=None, force=False, verbose=False, state_file=STATE_FILE):
+    if targets:
+        steps = select(steps, targets)
+    deps = dependencies(steps)
+    state = load_state(state_file)
+    pending = set(steps)
+    done = set()
+    failed = set()
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=jobs or len(steps) or 1) as pool:
+        while pending or running:
+            for name in sorted(pending):
+                if deps[name] & failed:
+                    pending.discard(name)
+                    failed.add(name)
+                    print(f"[{name}] skipped, upstream step failed")
+                elif deps[name] <= done:
+                    pending.discard(name)
+                    running[pool.submit(run_step, name, steps[name], state.get(name), force)] = name
+            if not running:
+                # Whatever is left sits downstream of a failure
+                for name in sorted(pending):
+                    failed.add(name)
+                    print(f"[{name}] skipped, upstream step failed")
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                status, record, log = future.result()
+                print(f"[{name}] {status}")
+                if log and (verbose or status == 'failed'):
+                    print(''.join(f"    {line}\n" for line in log.splitlines()), end='')
+                if status == 'failed':
+                    failed.add(name)
+                    state.pop(name, None)
+                else:
+                    done.add(name)
+                    state[name] = record
+                save_state(state, state_file)
+
+    return not failed
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Rebuild stale artifacts.')
+    parser.add_argument('targets', nargs='*', help=f"steps to bring up to date: {', '.join(STEPS)} (default: all)")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='steps to run at once')
+    parser.add_argument('-f', '--force', action='store_true', help='rebuild even if nothing changed')
+    parser.add_argument('-v', '--verbose', action='store_true', help='show the output of each step')
+    parser.add_argument('--profile', metavar='PATH', help='record stage timings of the steps that run to PATH and print a summary (add -f to profile every step)')
+    args = parser.parse_args()
+    unknown = [t for t in args.targets if t not in STEPS]
+    if unknown:
+        parser.error(f"unknown step(s): {', '.join(unknown)}")
+
+    if args.profile:
+        open(args.profile, 'w').close()
+        profiling.enable(args.profile)
+    ok = build(targets=args.targets, jobs=args.jobs, force=args.force, verbose=args.verbose)
+    if args.profile:
+        profiling.flush()
+        print()
+        profiling.print_summary(profiling.load(args.profile))
+    sys.exit(0 if ok else 1)
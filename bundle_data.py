@@ -0,0 +1,166 @@
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import profiling
+from common import Dictionary, bust_cache, content_hash, write_atomic, write_js
+from compact_schedule import ScheduleIndex
+from prog_stream import iter_competitors
+
+# Writes src/js/data.js as a slim, columnar bundle holding only what the
+# report table reads: bib, names, age group, gender, team and entered events
+# with their qp. Team names, event codes, age groups and genders are
+# dictionary-encoded; each competitor's events are a slice of the flat event
+# columns given by eventOffsets[i]:eventOffsets[i + 1].
+#
+# It also writes the same bundle split into shards under src/shards: one per
+# team (team/<teamId>.json) and one per event code and day
+# (event/<eventCode>-d<day>.json, holding only that event's entries), plus
+# manifest.json listing each shard's file, hash and competitor count. A shard
+# is only rewritten when its hash differs from the one in the manifest.
+
+BUNDLE_VERSION = 1
+DICT_COLUMNS = ('ageGroup', 'gender', 'teamName', 'eventCode')
+SHARD_DIR = 'src/shards'
+NO_TEAM = 'none'
+
+def slim_competitor(athlete):
+    return {
+        'bib': athlete['competitorId'],
+        'firstName': athlete['firstName'],
+        'lastName': athlete['lastName'],
+        'ageGroup': athlete['ageGroup'],
+        'gender': athlete['gender'],
+        'teamName': athlete.get('teamName'),
+        'events': [(e['eventCode'], e.get('qp') or '') for e in athlete.get('eventsEntered') or []]
+    }
+
+def slim_competitors(competitors):
+    for athlete in competitors:
+        yield slim_competitor(athlete)
+
+def encode_columns(rows):
+    dicts = {name: Dictionary() for name in DICT_COLUMNS}
+    columns = {'bib': [], 'firstName': [], 'lastName': [], 'ageGroup': [], 'gender': [], 'teamName': []}
+    event_offsets = [0]
+    event_codes = []
+    qps = []
+
+    count = 0
+    for row in rows:
+        count += 1
+        for name in ('bib', 'firstName', 'lastName'):
+            columns[name].append(row[name])
+        for name in ('ageGroup', 'gender', 'teamName'):
+            columns[name].append(dicts[name].code(row[name]))
+        for event_code, qp in row['events']:
+            event_codes.append(dicts['eventCode'].code(event_code))
+            qps.append(qp)
+        event_offsets.append(len(event_codes))
+
+    bundle = {'version': BUNDLE_VERSION, 'count': count}
+    bundle['dicts'] = {name: d.values for name, d in dicts.items()}
+    bundle.update(columns)
+    bundle['eventOffsets'] = event_offsets
+    bundle['eventCode'] = event_codes
+    bundle['qp'] = qps
+    return bundle
+
+def dump_bundle(bundle):
+    # The hash covers everything but itself, so an unchanged prog.json gives
+    # the same hash (and the same file) on every run
+    payload = json.dumps(bundle, separators=(',', ':'), ensure_ascii=False)
+    return content_hash(payload), payload
+
+def build_bundle(prog_path):
+    with profiling.stage('encode') as s:
+        bundle = encode_columns(slim_competitors(iter_competitors(prog_path)))
+        s.count(competitors=bundle['count'], entries=len(bundle['qp']))
+    with profiling.stage('write_js') as s:
+        digest, payload = dump_bundle(bundle)
+        bundle['hash'] = digest
+        write_js('src/js/data.js', 'emacs2026Data', json.dumps(bundle, separators=(',', ':'), ensure_ascii=False))
+        bust_cache('index.html', 'src/js/data.js', digest)
+        s.count(bytes=len(payload))
+    return bundle, digest, payload
+
+def group_shards(competitors, index):
+    # shard file -> (manifest section, key, extra manifest fields, rows)
+    shards = {}
+    for athlete in competitors:
+        row = slim_competitor(athlete)
+        team = athlete.get('teamId') or NO_TEAM
+        shard = shards.setdefault(f'team/{team}.json', ('teams', team, {'teamName': row['teamName']}, {}))
+        shard[3][row['bib']] = row
+
+        for event_code, qp in row['events']:
+            slot = index.lookup_group(event_code, row['gender'], row['ageGroup'])
+            day = slot['day'] if slot else None
+            name = f"{event_code}-d{day}" if day is not None else f"{event_code}-unscheduled"
+            shard = shards.setdefault(f'event/{name}.json', ('events', name, {'eventCode': event_code, 'day': day}, {}))
+            if row['bib'] not in shard[3]:
+                shard[3][row['bib']] = {**row, 'events': []}
+            shard[3][row['bib']]['events'].append((event_code, qp))
+    return shards
+
+def write_shard(path, rows, previous_hash):
+    bundle = encode_columns(rows)
+    digest, payload = dump_bundle(bundle)
+    written = digest != previous_hash or not os.path.exists(path)
+    if written:
+        bundle['hash'] = digest
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, json.dumps(bundle, separators=(',', ':'), ensure_ascii=False))
+    return digest, bundle['count'], written
+
+def load_manifest(shard_dir):
+    try:
+        with open(os.path.join(shard_dir, 'manifest.json'), 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def write_shards(prog_path, index, shard_dir=SHARD_DIR, jobs=None):
+    previous = load_manifest(shard_dir)
+    old_hashes = {entry['file']: entry['hash'] for section in ('teams', 'events') for entry in previous.get(section, {}).values()}
+    with profiling.stage('group_shards') as s:
+        shards = group_shards(iter_competitors(prog_path), index)
+        s.count(shards=len(shards))
+
+    files = sorted(shards)
+    with profiling.stage('write_shards') as s:
+        args = ([os.path.join(shard_dir, f) for f in files], [list(shards[f][3].values()) for f in files], [old_hashes.get(f) for f in files])
+        if jobs == 1:
+            results = list(map(write_shard, *args))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(write_shard, *args, chunksize=8))
+        s.count(shards=len(files), written=sum(1 for r in results if r[2]))
+
+    manifest = {'version': BUNDLE_VERSION, 'teams': {}, 'events': {}}
+    for f, (digest, count, written) in zip(files, results):
+        section, key, extra, rows = shards[f]
+        manifest[section][key] = {'file': f, 'hash': digest, 'count': count, **extra}
+    for section in ('teams', 'events'):
+        manifest[section] = dict(sorted(manifest[section].items()))
+
+    # Shards whose team or event is gone
+    for f in set(old_hashes) - set(files):
+        try:
+            os.remove(os.path.join(shard_dir, f))
+        except FileNotFoundError:
+            pass
+
+    write_atomic(os.path.join(shard_dir, 'manifest.json'), json.dumps(manifest, indent=2, ensure_ascii=False))
+    return manifest, sum(1 for r in results if r[2])
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write src/js/data.js and the per-team / per-event shards.')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='processes for shard encoding (default: all cores)')
+    args = parser.parse_args()
+
+    bundle, digest, payload = build_bundle('prog.json')
+    print(f"Bundled {bundle['count']} competitors, {len(bundle['qp'])} entries ({len(payload) // 1024} KB, hash {digest}).")
+    manifest, written = write_shards('prog.json', ScheduleIndex.load('schedule_compact.json'), jobs=args.jobs)
+    print(f"Sharded into {len(manifest['teams'])} team and {len(manifest['events'])} event files ({written} rewritten).")
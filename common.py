@@ -0,0 +1,70 @@
+import hashlib
+import os
+import re
+
+# Small helpers shared by the build scripts, kept free of any project import
+# so that reading a mark or writing a file does not pull in the parsers, the
+# schedule or the bundler:
+#
+#   write_atomic, write_js   replace a file in one rename, so readers (the
+#                            page, a running watch.py) never see half of it
+#   bust_cache               stamp index.html with a file's ?v=<hash>
+#   content_hash             short sha256 of a text payload
+#   delta_encode/decode      sorted ids <-> gaps between them (search, facets)
+#   Dictionary               value <-> small integer code, in first-seen order
+#   parse_mark               a printed mark -> seconds, metres or points
+
+HIGHER_IS_BETTER = {'HJ', 'PV', 'LJ', 'TJ', 'SP', 'DT', 'HT', 'JT', 'WT', 'OT', 'PEN'}
+MARK_PATTERN = re.compile(r'^(?:(\d+):)?(?:(\d+):)?(\d+(?:\.\d+)?)$')
+
+def write_atomic(path, text):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+def write_js(path, var_name, payload):
+    write_atomic(path, f'const {var_name} = {payload};\n')
+
+def bust_cache(html_path, script_path, digest):
+    # Point index.html (a <script src> or the data.js <meta content>) at
+    # script_path?v=<hash> so browsers refetch only on change
+    with open(html_path, 'r', encoding='utf-8') as f:
+        html = f.read()
+    pattern = re.compile(r'("' + re.escape(script_path) + r')(\?v=[0-9a-f]*)?(")')
+    write_atomic(html_path, pattern.sub(lambda m: f'{m.group(1)}?v={digest}{m.group(3)}', html))
+
+def content_hash(payload):
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+def delta_encode(ids):
+    return [ids[0]] + [b - a for a, b in zip(ids, ids[1:])]
+
+def delta_decode(deltas):
+    ids = []
+    current = 0
+    for d in deltas:
+        current += d
+        ids.append(current)
+    return ids
+
+class Dictionary:
+    def __init__(self):
+        self.values = []
+        self.index = {}
+
+    def code(self, value):
+        if value not in self.index:
+            self.index[value] = len(self.values)
+            self.values.append(value)
+        return self.index[value]
+
+def parse_mark(text):
+    # "12.34", "2:01.5", "1:02:03" -> seconds (or metres / points); None for DNS, NM, X, ...
+    m = MARK_PATTERN.match(str(text or '').strip())
+    if not m:
+        return None
+    hours, minutes, seconds = m.groups()
+    if minutes is None and hours is not None:
+        hours, minutes = None, hours
+    return int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds)
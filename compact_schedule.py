@@ -0,0 +1,107 @@
+import json
+
+# Compact schedule: one record per timetable slot with an age range instead of
+# one row per age group, and every string (event code, time, description)
+# stored once in a shared table.
+#
+#   {"version": 1, "columns": [...], "strings": [...], "slots": [[...], ...]}
+#
+# ageMax is null for open-ended groups such as "W80+".
+
+FORMAT_VERSION = 1
+COLUMNS = ['eventCode', 'genders', 'ageMin', 'ageMax', 'day', 'time', 'desc']
+INTERNED = ('eventCode', 'time', 'desc')
+
+# The oldest age group the expanded schedule lists for "+" groups (V95)
+OPEN_AGE_LIMIT = 95
+
+def encode(slots):
+    strings = []
+    index = {}
+
+    def intern(s):
+        if s not in index:
+            index[s] = len(strings)
+            strings.append(s)
+        return index[s]
+
+    rows = []
+    for slot in slots:
+        rows.append([intern(slot[c]) if c in INTERNED else slot[c] for c in COLUMNS])
+    return {'version': FORMAT_VERSION, 'columns': COLUMNS, 'strings': strings, 'slots': rows}
+
+def decode(compact):
+    strings = compact['strings']
+    columns = compact['columns']
+    slots = []
+    for row in compact['slots']:
+        slot = dict(zip(columns, row))
+        for c in INTERNED:
+            slot[c] = strings[slot[c]]
+        slots.append(slot)
+    return slots
+
+def expand(slots):
+    # The per-age-group rows schedule.json has always carried
+    rows = []
+    for slot in slots:
+        age_max = slot['ageMax'] if slot['ageMax'] is not None else OPEN_AGE_LIMIT
+        for gender in slot['genders']:
+            for age in range(slot['ageMin'], age_max + 5, 5):
+                rows.append({
+                    'eventCode': slot['eventCode'],
+                    'gender': gender,
+                    'ageGroup': f'V{age}',
+                    'day': slot['day'],
+                    'time': slot['time'],
+                    'desc': slot['desc']
+                })
+    return rows
+
+def age_of(age_group):
+    digits = ''.join(ch for ch in str(age_group) if ch.isdigit())
+    return int(digits) if digits else None
+
+class ScheduleIndex:
+    # Answers "which slot covers (eventCode, gender, age)". Slots are bucketed
+    # by (eventCode, gender) and kept sorted by ageMin, so a lookup only walks
+    # the handful of intervals that start at or below the age.
+    #
+    # Within the expanded age groups the earliest slot in timetable order wins,
+    # like the old first-match search over schedule.json. Older athletes fall
+    # back to the open-ended group with the highest lower bound.
+    def __init__(self, slots):
+        self.slots = slots
+        self.buckets = {}
+        for pos, slot in enumerate(slots):
+            for gender in slot['genders']:
+                self.buckets.setdefault((slot['eventCode'], gender), []).append((slot['ageMin'], pos))
+        for bucket in self.buckets.values():
+            bucket.sort()
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            return cls(decode(json.load(f)))
+
+    def lookup(self, event_code, gender, age):
+        bucket = self.buckets.get((event_code, gender))
+        if not bucket or age is None:
+            return None
+
+        best = None
+        for age_min, pos in bucket:
+            if age_min > age: break
+            slot = self.slots[pos]
+            if age <= OPEN_AGE_LIMIT:
+                age_max = slot['ageMax'] if slot['ageMax'] is not None else OPEN_AGE_LIMIT
+                if age <= age_max and (best is None or pos < best):
+                    best = pos
+            elif slot['ageMax'] is None:
+                # bucket is sorted by ageMin, so a later hit has the higher bound
+                if best is None or age_min > self.slots[best]['ageMin']:
+                    best = pos
+        return self.slots[best] if best is not None else None
+
+    def lookup_group(self, event_code, gender, age_group):
+        return self.lookup(event_code, gender, age_of(age_group))
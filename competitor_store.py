@@ -0,0 +1,219 @@
+import sys
+from array import array
+
+import numpy as np
+
+from common import Dictionary, parse_mark
+from prog_stream import walk
+
+# Compact in-memory form of prog.json's competitors and their entries, for
+# tools that keep the whole field around (or walk it many times). Instead of
+# one ~30-key dict per competitor plus a dict per entry, the store keeps
+# parallel columns:
+#
+#   bib, firstName, lastName   lists of interned strings
+#   gender, ageGroup, team     typed arrays of codes into a Dictionary
+#   entries                    flat columns (event id, event code, qp,
+#                              parsed mark); competitor i's entries are
+#                              entry_offsets[i]:entry_offsets[i + 1]
+#
+# and indexes by bib, team and event. Competitor and Entry are __slots__
+# views over one row, made on demand; dicts() gives back the slim dicts the
+# other tools take (competitorId, names, gender, ageGroup, team and
+# eventsEntered), so anything written against iter_competitors() can read a
+# store instead.
+
+NO_MARK = float('nan')
+
+class Entry:
+    __slots__ = ('store', 'pos')
+
+    def __init__(self, store, pos):
+        self.store = store
+        self.pos = pos
+
+    @property
+    def event_id(self):
+        return self.store.events.values[self.store.entry_event[self.pos]]
+
+    @property
+    def event_code(self):
+        return self.store.codes.values[self.store.entry_code[self.pos]]
+
+    @property
+    def qp(self):
+        return self.store.entry_qp[self.pos]
+
+    @property
+    def mark(self):
+        mark = self.store.entry_mark[self.pos]
+        return None if mark != mark else mark
+
+    @property
+    def competitor(self):
+        return Competitor(self.store, self.store.entry_row[self.pos])
+
+    def __repr__(self):
+        return f"Entry({self.event_id} {self.event_code} {self.qp!r})"
+
+class Competitor:
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    @property
+    def bib(self):
+        return self.store.bib[self.row]
+
+    @property
+    def first_name(self):
+        return self.store.first_name[self.row]
+
+    @property
+    def last_name(self):
+        return self.store.last_name[self.row]
+
+    @property
+    def gender(self):
+        return self.store.genders.values[self.store.gender[self.row]]
+
+    @property
+    def age_group(self):
+        return self.store.age_groups.values[self.store.age_group[self.row]]
+
+    @property
+    def team_id(self):
+        return self.store.teams.values[self.store.team[self.row]]
+
+    @property
+    def team_name(self):
+        return self.store.team_names.get(self.team_id)
+
+    @property
+    def entries(self):
+        offsets = self.store.entry_offsets
+        return [Entry(self.store, pos) for pos in range(offsets[self.row], offsets[self.row + 1])]
+
+    def as_dict(self):
+        return {
+            'competitorId': self.bib,
+            'firstName': self.first_name,
+            'lastName': self.last_name,
+            'gender': self.gender,
+            'ageGroup': self.age_group,
+            'teamId': self.team_id,
+            'teamName': self.team_name,
+            'eventsEntered': [{'eventCode': e.event_code, 'eventId': e.event_id, 'qp': e.qp} for e in self.entries]
+        }
+
+    def __repr__(self):
+        return f"Competitor({self.bib} {self.first_name} {self.last_name})"
+
+class CompetitorStore:
+    def __init__(self):
+        self.bib = []
+        self.first_name = []
+        self.last_name = []
+        self.gender = array('H')
+        self.age_group = array('H')
+        self.team = array('H')
+        self.genders = Dictionary()
+        self.age_groups = Dictionary()
+        self.teams = Dictionary()
+        self.team_names = {}
+
+        self.entry_offsets = array('I', [0])
+        self.entry_event = array('H')
+        self.entry_code = array('H')
+        self.entry_row = array('I')
+        self.entry_qp = []
+        self.entry_mark = array('d')
+        self.events = Dictionary()
+        self.codes = Dictionary()
+
+        self.by_bib = {}
+        self.by_team = {}
+        self.by_event = {}
+
+    @classmethod
+    def load(cls, prog_path):
+        store = cls()
+        for kind, record in walk(prog_path, want=('meeting', 'competitor')):
+            if kind == 'competitor':
+                store.add(record)
+            elif record[0] == 'teams':
+                store.team_names.update((t['teamId'], t['teamName']) for t in record[1])
+        return store
+
+    def add(self, athlete):
+        intern = sys.intern
+        row = len(self.bib)
+        bib = intern(athlete['competitorId'])
+        self.bib.append(bib)
+        self.first_name.append(intern(athlete['firstName'] or ''))
+        self.last_name.append(intern(athlete['lastName'] or ''))
+        self.gender.append(self.genders.code(athlete['gender']))
+        self.age_group.append(self.age_groups.code(athlete['ageGroup']))
+        team = self.teams.code(athlete.get('teamId'))
+        self.team.append(team)
+        if athlete.get('teamName') is not None:
+            self.team_names.setdefault(athlete.get('teamId'), athlete['teamName'])
+        self.by_bib[bib] = row
+        self.by_team.setdefault(team, array('I')).append(row)
+
+        for entry in athlete.get('eventsEntered') or []:
+            event = self.events.code(entry['eventId'])
+            pos = len(self.entry_row)
+            self.entry_event.append(event)
+            self.entry_code.append(self.codes.code(entry['eventCode']))
+            self.entry_row.append(row)
+            qp = intern(entry.get('qp') or '')
+            self.entry_qp.append(qp)
+            mark = parse_mark(qp)
+            self.entry_mark.append(NO_MARK if mark is None or mark <= 0 else mark)
+            self.by_event.setdefault(event, array('I')).append(pos)
+        self.entry_offsets.append(len(self.entry_row))
+        return row
+
+    def __len__(self):
+        return len(self.bib)
+
+    def __getitem__(self, row):
+        return Competitor(self, row)
+
+    def __iter__(self):
+        for row in range(len(self.bib)):
+            yield Competitor(self, row)
+
+    def find(self, bib):
+        row = self.by_bib.get(bib)
+        return None if row is None else Competitor(self, row)
+
+    def team_members(self, team_id):
+        code = self.teams.index.get(team_id)
+        return [Competitor(self, row) for row in self.by_team.get(code, ())]
+
+    def event_entries(self, event_id):
+        code = self.events.index.get(event_id)
+        return [Entry(self, pos) for pos in self.by_event.get(code, ())]
+
+    def dicts(self):
+        for competitor in self:
+            yield competitor.as_dict()
+
+    def group_counts(self):
+        # Entries per (eventCode, gender, ageGroup)
+        rows = np.frombuffer(self.entry_row, dtype=np.uint32) if len(self.entry_row) else np.zeros(0, np.uint32)
+        codes = np.frombuffer(self.entry_code, dtype=np.uint16) if len(self.entry_code) else np.zeros(0, np.uint16)
+        genders = np.frombuffer(self.gender, dtype=np.uint16)[rows] if len(self.gender) else np.zeros(0, np.uint16)
+        ages = np.frombuffer(self.age_group, dtype=np.uint16)[rows] if len(self.age_group) else np.zeros(0, np.uint16)
+        keys = (codes.astype(np.int64) << 32) + (genders.astype(np.int64) << 16) + ages
+        found, counts = np.unique(keys, return_counts=True)
+        result = {}
+        for key, count in zip(found.tolist(), counts.tolist()):
+            code, rest = divmod(key, 1 << 32)
+            gender, age = divmod(rest, 1 << 16)
+            result[self.codes.values[code], self.genders.values[gender], self.age_groups.values[age]] = count
+        return result
@@ -0,0 +1,166 @@
+import argparse
+import json
+import sys
+import time
+
+from compact_schedule import decode, expand
+from event_classifier import EventClassifier
+from prog_stream import iter_competitors
+
+# Flags athletes whose entered events overlap or follow each other too
+# closely. Every entry is resolved to all of its schedule rows (heats, semis
+# and finals alike) with one dict lookup, each athlete's rows are sorted into
+# a timeline of (start, end) intervals, and one pass over that timeline
+# compares each interval against the latest-ending earlier interval of a
+# different event. Rounds of the same event never conflict with each other,
+# and neither do alternatives such as "Final A" / "Final B".
+#
+# The timetable only has start times, so each session is given a length from
+# SESSION_MINUTES (override with --duration CODE=MINUTES).
+
+RECOVERY_MINUTES = 30
+DEFAULT_SESSION_MINUTES = 30
+SESSION_MINUTES = {
+    '60': 15, '60H': 15, '200': 20, '400': 20, '800': 20, '1500': 20, '3000': 25,
+    '4x200': 15, '3000W': 30, '5KW': 45, '5K': 40, 'XC': 45,
+    'HJ': 120, 'PV': 150, 'LJ': 90, 'TJ': 90,
+    'SP': 90, 'DT': 90, 'HT': 90, 'JT': 90, 'WT': 90, 'PEN': 60
+}
+
+def minute_of(day, time_str):
+    hours, minutes = time_str.split(':')
+    return (day - 1) * 1440 + int(hours) * 60 + int(minutes)
+
+def rows_by_group(rows):
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['eventCode'], row['gender'], row['ageGroup']), []).append(row)
+    return groups
+
+def timeline(athlete, groups, classifier, durations):
+    # Every schedule row the athlete's entries resolve to, sorted by start.
+    # Also returns the entries that have no row in the schedule.
+    intervals = []
+    unresolved = []
+    for event in athlete.get('eventsEntered') or []:
+        code = event['eventCode']
+        rows = groups.get((code, athlete['gender'], athlete['ageGroup']))
+        if not rows:
+            unresolved.append(code)
+            continue
+        length = durations.get(code, DEFAULT_SESSION_MINUTES)
+        for row in rows:
+            start = minute_of(row['day'], row['time'])
+            intervals.append((start, start + length, code, classifier.round_of(row['desc']), row))
+    intervals.sort(key=lambda iv: (iv[0], iv[1]))
+    return intervals, unresolved
+
+def scan(intervals, recovery):
+    # latest = the earlier interval with the latest end; runner_up = the
+    # latest-ending one from a different event than latest. One of them is
+    # always the right interval to compare against, which keeps this linear.
+    found = []
+    latest = runner_up = None
+    for iv in intervals:
+        prev = latest if latest is None or latest[2] != iv[2] else runner_up
+        if prev is not None:
+            gap = iv[0] - prev[1]
+            if gap < 0:
+                found.append(('overlap', prev, iv, gap))
+            elif gap < recovery:
+                found.append(('tight', prev, iv, gap))
+        if latest is None or iv[1] > latest[1]:
+            if latest is not None and latest[2] != iv[2]:
+                runner_up = latest
+            latest = iv
+        elif iv[2] != latest[2] and (runner_up is None or iv[1] > runner_up[1]):
+            runner_up = iv
+    return found
+
+def describe(iv):
+    row = iv[4]
+    return {'eventCode': iv[2], 'round': iv[3], 'day': row['day'], 'time': row['time']}
+
+def detect(competitors, rows, recovery=RECOVERY_MINUTES, durations=None):
+    durations = {**SESSION_MINUTES, **(durations or {})}
+    classifier = EventClassifier()
+    groups = rows_by_group(rows)
+    conflicts = []
+    unresolved = 0
+    athletes = 0
+    for athlete in competitors:
+        athletes += 1
+        intervals, missing = timeline(athlete, groups, classifier, durations)
+        unresolved += len(missing)
+        for kind, first, second, gap in scan(intervals, recovery):
+            conflicts.append({
+                'competitorId': athlete['competitorId'],
+                'firstName': athlete['firstName'],
+                'lastName': athlete['lastName'],
+                'teamName': athlete.get('teamName'),
+                'kind': kind,
+                'gap': gap,
+                'first': describe(first),
+                'second': describe(second)
+            })
+    return {'athletes': athletes, 'unresolved': unresolved, 'recovery': recovery, 'conflicts': conflicts}
+
+def by_team(conflicts):
+    teams = {}
+    for c in conflicts:
+        team = teams.setdefault(c['teamName'] or '(no team)', {'athletes': set(), 'overlap': 0, 'tight': 0})
+        team['athletes'].add(c['competitorId'])
+        team[c['kind']] += 1
+    return teams
+
+def format_slot(s):
+    return f"{s['eventCode']} {s['round']} (day {s['day']} {s['time']})"
+
+def report(result, out=sys.stdout):
+    conflicts = result['conflicts']
+    overlaps = sum(1 for c in conflicts if c['kind'] == 'overlap')
+    print(f"{result['athletes']} athletes: {overlaps} overlaps, {len(conflicts) - overlaps} gaps under "
+          f"{result['recovery']} min, {result['unresolved']} entries without a schedule slot", file=out)
+
+    print("\nBy team:", file=out)
+    teams = by_team(conflicts)
+    for team, t in sorted(teams.items(), key=lambda kv: (-len(kv[1]['athletes']), kv[0])):
+        print(f"  {team:28} {len(t['athletes']):4} athletes  {t['overlap']:4} overlaps  {t['tight']:4} tight", file=out)
+
+    print("\nBy athlete:", file=out)
+    for c in sorted(conflicts, key=lambda c: (c['teamName'] or '', c['lastName'], c['firstName'], c['first']['day'], c['first']['time'])):
+        what = f"overlaps by {-c['gap']} min" if c['kind'] == 'overlap' else f"{c['gap']} min after"
+        print(f"  {c['competitorId']:>8} {c['lastName']}, {c['firstName']} ({c['teamName'] or '-'}): "
+              f"{format_slot(c['second'])} {what} {format_slot(c['first'])}", file=out)
+
+def parse_durations(items):
+    durations = {}
+    for item in items:
+        code, _, minutes = item.partition('=')
+        durations[code] = int(minutes)
+    return durations
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Find athletes whose events overlap or leave too little recovery time.')
+    parser.add_argument('--prog', default='prog.json')
+    parser.add_argument('--schedule', default='schedule_compact.json')
+    parser.add_argument('--recovery', type=int, default=RECOVERY_MINUTES, help='minimum minutes between two events')
+    parser.add_argument('--duration', action='append', default=[], metavar='CODE=MINUTES', help='session length for an event code')
+    parser.add_argument('--json', metavar='PATH', help='also write the conflicts as JSON')
+    parser.add_argument('-q', '--quiet', action='store_true', help='only print the summary line')
+    args = parser.parse_args()
+
+    with open(args.schedule, 'r') as f:
+        rows = expand(decode(json.load(f)))
+    start = time.perf_counter()
+    result = detect(iter_competitors(args.prog), rows, args.recovery, parse_durations(args.duration))
+    elapsed = time.perf_counter() - start
+
+    if args.quiet:
+        print(f"{len(result['conflicts'])} conflicts for {result['athletes']} athletes")
+    else:
+        report(result)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
+    print(f"({elapsed * 1000:.1f} ms)", file=sys.stderr)
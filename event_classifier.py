@@ -0,0 +1,187 @@
+import re
+
+# Maps parsed timetable events to (eventCode, genders, ages). All patterns are
+# compiled once; the lookup tables keep the priority order build_schedule has
+# always used (first key in table order wins, header before description).
+
+HEADER_MAP = {
+    'High Jump': 'HJ', 'Long Jump': 'LJ', 'Triple Jump': 'TJ', 'TripleJump': 'TJ',
+    'Pole Vault': 'PV', 'Shot Put': 'SP', 'Discus': 'DT', 'Hammer': 'HT',
+    'Javelin': 'JT', 'Weight Throw': 'WT', 'Pentathlon': 'PEN',
+    'Cross Country': 'XC', 'XC': 'XC', 'Road Race': '5K', 'RW': '3000W', '4x200': '4x200',
+    '60 m': '60', '200 m': '200', '400 m': '400', '800 m': '800', '1500 m': '1500', '3000 m': '3000',
+    '60m': '60', '200m': '200', '400m': '400', '800m': '800', '1500m': '1500', '3000m': '3000', '60H': '60H'
+}
+
+DESC_MAP = {
+    '4x200': '4x200', '60m hurdles': '60H', '60 m hurdles': '60H', '60H': '60H',
+    '60 m': '60', '60m': '60', '200 m': '200', '200m': '200',
+    '400 m': '400', '400m': '400', '800 m': '800', '800m': '800',
+    '1500 m': '1500', '1500m': '1500', '3000 m': '3000', '3000m': '3000',
+    '3000m RW': '3000W', '3000 m RW': '3000W', '5 km RW': '5KW', '5 km': '5K',
+    'Cross Country': 'XC', 'XC': 'XC'
+}
+
+# A description match must not override these header codes
+# e.g. "Pentathlon 1500m" -> should be PEN, not 1500
+PROTECTED_CODES = {'PEN', '4x200', 'XC', '5K', '5KW', '3000W'}
+
+# Gender + Age, allowing words like "Final" or "Heats" between them.
+# (?![0-9]) instead of \b at the end allows the + symbol
+GENDER_PATTERN = r'\b(M/W|MIXED|MIX|M|W|X)\b'
+AGE_PATTERN = r'(\d{2}(?:-\d{2})?(?:\+)?)(?![0-9])'
+GAP_PATTERN = r'(?:\s*(?:Final|Heats|m|SF|QF|Semi|gr\.\d)\s*)*'
+# Concatenated forms like M35, W70+
+CONCAT_PATTERN = r'\b(M|W)(\d{2}(?:-\d{2})?(?:\+)?)(?![0-9])'
+# Round of a slot: "Heats", "SF", "Final B", "gr.2"
+ROUND_PATTERN = r'\b(Heats|QF|SF|Semi|Final(?:\s+[A-D]\b)?|gr\.\s*\d)'
+
+class KeywordTable:
+    # Finds the first key (in table order) that occurs anywhere in a text.
+    # One compiled alternation over every key rejects texts that contain none
+    # of them; the ordered scan that follows runs on pre-lowered keys.
+    def __init__(self, mapping):
+        self.keys = [k.lower() for k in mapping]
+        self.values = list(mapping.values())
+        alternation = '|'.join(re.escape(k) for k in sorted(mapping, key=len, reverse=True))
+        self.regex = re.compile(alternation, re.IGNORECASE)
+
+    def first(self, text):
+        if not self.regex.search(text):
+            return None
+        return self.scan_from(text, 0)
+
+    def scan_from(self, text, start):
+        lowered = text.lower()
+        for idx in range(start, len(self.keys)):
+            if self.keys[idx] in lowered:
+                return idx
+        return None
+
+class EventClassifier:
+    def __init__(self):
+        self.headers = KeywordTable(HEADER_MAP)
+        self.descs = KeywordTable(DESC_MAP)
+        self.group_regex = re.compile(f'{GENDER_PATTERN}{GAP_PATTERN}{AGE_PATTERN}', re.IGNORECASE)
+        self.concat_regex = re.compile(CONCAT_PATTERN, re.IGNORECASE)
+        self.day_regex = re.compile(r'Day (\d)')
+        self.round_regex = re.compile(ROUND_PATTERN, re.IGNORECASE)
+        self._rounds = {}
+        self._expansions = {}
+        self._days = {}
+        # Timetable headers and descriptions repeat a lot (every age group of
+        # a heat series), so results are memoised per (header, desc)
+        self._matches = {}
+        self._results = {}
+
+    def event_code(self, event_header, desc):
+        event_code = None
+        if event_header:
+            idx = self.headers.first(event_header)
+            if idx is not None:
+                event_code = self.headers.values[idx]
+
+        idx = self.descs.first(desc)
+        while idx is not None:
+            v = self.descs.values[idx]
+            if (v == '3000' and 'RW' in desc.upper()) or (v == '60' and 'hurdles' in desc.lower()):
+                idx = self.descs.scan_from(desc, idx + 1)
+                continue
+            if event_code not in PROTECTED_CODES:
+                event_code = v
+            break
+        return event_code
+
+    def groups(self, full_text):
+        matches = self.group_regex.findall(full_text)
+        if not matches:
+            matches = self.concat_regex.findall(full_text)
+        return matches
+
+    def genders(self, genders_str):
+        gs = genders_str.upper()
+        if gs in ['MIX', 'MIXED', 'X']: return ('X',)
+        elif '/' in gs or gs == 'M+W': return ('M', 'F')
+        elif gs == 'W': return ('F',)
+        return ('M',)
+
+    def age_range(self, ag):
+        # (ageMin, ageMax) of an age token; ageMax is None for "70+"
+        if '-' in ag:
+            parts = ag.split('-')
+            start = int(parts[0])
+            # Clean up end part (could be 50+)
+            end_str = re.sub(r'\D', '', parts[1])
+            return start, int(end_str) if end_str else start
+        elif '+' in ag:
+            return int(ag.replace('+', '')), None
+        return int(ag), int(ag)
+
+    def expand(self, genders_str, ag):
+        key = (genders_str, ag)
+        if key not in self._expansions:
+            age_min, age_max = self.age_range(ag)
+            if age_max is None:
+                age_max = 95
+            target_ages = tuple(f'V{age_val}' for age_val in range(age_min, age_max + 5, 5))
+            self._expansions[key] = (self.genders(genders_str), target_ages)
+        return self._expansions[key]
+
+    def day_index(self, day_text):
+        if day_text not in self._days:
+            day_match = self.day_regex.search(day_text)
+            self._days[day_text] = int(day_match.group(1)) if day_match else 1
+        return self._days[day_text]
+
+    def round_of(self, desc):
+        # The round words of a slot description ("Final B", "Heats"). Slots
+        # without any (the pentathlon disciplines) are told apart by the rest
+        # of the description once the gender/age groups are taken out.
+        if desc not in self._rounds:
+            found = [re.sub(r'\s+', ' ', r).replace('Semi', 'SF') for r in self.round_regex.findall(desc)]
+            if found:
+                name = ' '.join(found)
+            else:
+                rest = self.concat_regex.sub(' ', self.group_regex.sub(' ', desc))
+                name = ' '.join(rest.split()).lower()
+            self._rounds[desc] = name
+        return self._rounds[desc]
+
+    def match(self, e):
+        # (eventCode, [(gender token, age token), ...]) or None if the event
+        # cannot be placed in the schedule
+        key = (e['event'], e['desc'])
+        if key not in self._matches:
+            self._matches[key] = self._match(*key)
+        return self._matches[key]
+
+    def _match(self, event_header, desc):
+        full_text = f"{event_header or ''} {desc}".strip()
+        matches = self.groups(full_text)
+        if not matches:
+            return None
+        event_code = self.event_code(event_header, desc)
+        if not event_code:
+            return None
+        return event_code, matches
+
+    def classify(self, e):
+        # One (eventCode, genders, ages) tuple per gender/age group mentioned
+        # in the event, with "+" and "-" groups expanded to every age group.
+        # The returned list is shared between calls; do not modify it.
+        key = (e['event'], e['desc'])
+        if key not in self._results:
+            found = self.match(e)
+            self._results[key] = [(found[0], *self.expand(gs, ag)) for gs, ag in found[1]] if found else []
+        return self._results[key]
+
+    def classify_ranges(self, e):
+        # Like classify(), but as (eventCode, genders, ageMin, ageMax) ranges
+        found = self.match(e)
+        if not found:
+            return []
+        event_code, matches = found
+        return [(event_code, self.genders(gs), *self.age_range(ag)) for gs, ag in matches]
+
+    def classify_batch(self, events):
+        return [self.classify(e) for e in events]
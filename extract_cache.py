@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import zlib
+
+import pdfplumber
+from pdfminer.pdftypes import PDFObjRef, PDFStream
+from pdfminer.psparser import PSLiteral
+
+# On-disk cache for pdfplumber word extraction and per-page parser output.
+# Entries are keyed by a hash of the page's content (content streams, fonts,
+# page boxes) rather than by file name, so a revised PDF only misses on the
+# pages that actually changed.
+
+CACHE_DIR = '.extract_cache'
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+FORMAT_VERSION = 1
+
+WORD_FLOATS = ('x0', 'x1', 'top', 'doctop', 'bottom', 'height', 'width')
+DIRECTIONS = ('ltr', 'rtl', 'ttb', 'btt')
+_WORD = struct.Struct('<7dBH')  # box floats, upright/direction flags, text length
+
+# Dict keys that point back up the object tree and would drag in other pages
+_SKIP_KEYS = {'Parent', 'P', 'Length', 'Filter', 'DecodeParms'}
+
+def _feed(h, obj, path=frozenset()):
+    # Hash a PDF object by value. References are followed (not hashed by object
+    # number) so re-exporting the same timetable gives the same keys.
+    if isinstance(obj, PDFObjRef):
+        if obj.objid in path:
+            h.update(b'R')
+            return
+        path = path | {obj.objid}
+        obj = obj.resolve()
+
+    if isinstance(obj, PDFStream):
+        h.update(b'S')
+        _feed(h, obj.attrs, path)
+        data = obj.get_data()
+        h.update(struct.pack('<Q', len(data)))
+        h.update(data)
+    elif isinstance(obj, dict):
+        h.update(b'D%d' % len(obj))
+        for k in sorted(obj):
+            if k in _SKIP_KEYS: continue
+            h.update(str(k).encode('utf-8') + b'\0')
+            _feed(h, obj[k], path)
+    elif isinstance(obj, (list, tuple)):
+        h.update(b'L%d' % len(obj))
+        for v in obj:
+            _feed(h, v, path)
+    elif isinstance(obj, PSLiteral):
+        name = obj.name if isinstance(obj.name, bytes) else str(obj.name).encode('utf-8')
+        h.update(b'N' + name + b'\0')
+    elif isinstance(obj, bytes):
+        h.update(b'B%d:' % len(obj) + obj)
+    else:
+        h.update(repr(obj).encode('utf-8') + b'\0')
+
+def page_content_hash(page):
+    page_obj = page.page_obj
+    h = hashlib.sha256(b'page-v%d' % FORMAT_VERSION)
+    _feed(h, page_obj.contents)
+    _feed(h, page_obj.resources)
+    _feed(h, [page_obj.mediabox, page_obj.cropbox, page_obj.rotate])
+    return h.hexdigest()
+
+def encode_words(words):
+    out = [struct.pack('<I', len(words))]
+    for w in words:
+        text = w['text'].encode('utf-8')
+        flags = (1 if w['upright'] else 0) | (DIRECTIONS.index(w['direction']) << 1)
+        out.append(_WORD.pack(*[w[k] for k in WORD_FLOATS], flags, len(text)))
+        out.append(text)
+    return zlib.compress(b''.join(out))
+
+def decode_words(blob):
+    data = zlib.decompress(blob)
+    count, = struct.unpack_from('<I', data)
+    offset = 4
+    words = []
+    for _ in range(count):
+        x0, x1, top, doctop, bottom, height, width, flags, size = _WORD.unpack_from(data, offset)
+        offset += _WORD.size
+        text = data[offset:offset + size].decode('utf-8')
+        offset += size
+        # Same key order as pdfplumber's extract_words()
+        words.append({
+            'text': text, 'x0': x0, 'x1': x1, 'top': top, 'doctop': doctop, 'bottom': bottom,
+            'upright': bool(flags & 1), 'height': height, 'width': width, 'direction': DIRECTIONS[flags >> 1]
+        })
+    return words
+
+class ExtractCache:
+    def __init__(self, root=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._last_page = None
+        os.makedirs(root, exist_ok=True)
+        self._size = sum(e.stat().st_size for e in os.scandir(root) if e.name.endswith('.bin'))
+
+    def page_key(self, page):
+        # Callers usually ask for words and a parser result of the same page
+        # back to back, so remember the last hash instead of recomputing it.
+        if self._last_page is None or self._last_page[0] is not page:
+            self._last_page = (page, page_content_hash(page))
+        return self._last_page[1]
+
+    def _path(self, kind, key):
+        return os.path.join(self.root, f'{kind}-{key}.bin')
+
+    def load(self, kind, key):
+        path = self._path(kind, key)
+        try:
+            with open(path, 'rb') as f:
+                blob = f.read()
+            os.utime(path)  # mtime doubles as the LRU clock
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return blob
+
+    def store(self, kind, key, blob):
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(blob)
+        # Atomic, so pool workers sharing the directory never see half a file
+        os.replace(tmp, self._path(kind, key))
+        self._size += len(blob)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        entries = [e for e in os.scandir(self.root) if e.name.endswith('.bin')]
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        self._size = sum(e.stat().st_size for e in entries)
+        for e in entries:
+            if self._size <= self.max_bytes * 3 // 4: break
+            try:
+                size = e.stat().st_size
+                os.remove(e.path)
+            except FileNotFoundError:
+                continue
+            self._size -= size
+
+    def words(self, page):
+        # doctop depends on where the page sits in the document, so it is part of the key
+        h = hashlib.sha256(f'{self.page_key(page)}|{pdfplumber.__version__}|{page.initial_doctop!r}'.encode('utf-8'))
+        key = h.hexdigest()
+        blob = self.load('words', key)
+        if blob is not None:
+            return decode_words(blob)
+        words = page.extract_words()
+        self.store('words', key, encode_words(words))
+        return words
+
+    def result(self, page, name, version, compute):
+        # Caches the JSON-serialisable output of compute(page) for a given parser version
+        h = hashlib.sha256(f'{self.page_key(page)}|{pdfplumber.__version__}|{name}|{version}'.encode('utf-8'))
+        key = h.hexdigest()
+        blob = self.load(name, key)
+        if blob is not None:
+            return json.loads(zlib.decompress(blob))
+        value = compute(page)
+        self.store(name, key, zlib.compress(json.dumps(value, separators=(',', ':')).encode('utf-8')))
+        return value
@@ -0,0 +1,140 @@
+import json
+import re
+
+import profiling
+from bundle_data import dump_bundle, encode_columns, slim_competitors
+from common import bust_cache, content_hash, delta_encode, write_js
+from compact_schedule import ScheduleIndex
+from join_schedule import resolve_entries
+from prog_stream import iter_competitors
+
+# Prebuilt filter facets for the report table, written to src/js/facets.js.
+# The rows are the ones app.js processData() builds from data.js (one per
+# entered event, in the same order), and for every filter column the file
+# holds, per distinct value, its row count and the sorted ids of its rows.
+# The page intersects those lists for filtering and cascading dropdowns
+# instead of rescanning every row once per column.
+#
+#   {"version": 2, "data": <data.js hash>, "rows": n,
+#    "columns": {"Event": {"counts": [...], "rows": [[...], ...], "ranks": [...]}, ...}}
+#
+# Values are listed in the order the dropdowns show them (JS sort order), but
+# the value strings themselves are not repeated: the page reads each one from
+# the first row in its list. Row id lists are delta-encoded (first id, then
+# gaps). The file only applies to the data.js whose hash it names.
+#
+# ranks give each value's position in the table's ascending sort order, with
+# the keys sortData() compares (parseInt for Bib, minutes for When, lowercase
+# text otherwise); values that compare equal share a rank. The page turns
+# them into row permutations with two counting sorts (Last Name first, as the
+# secondary key), so sorting a column never calls a comparator.
+
+FACETS_VERSION = 2
+FILTER_COLUMNS = ["Bib", "Last Name", "First Name", "Age Group", "Gender", "Event", "When", "Team Name", "QP", "RESULT"]
+
+# Same tables as processData() in app.js
+DATE_MAPPING = {
+    1: "Fri, 27 Mar", 2: "Sat, 28 Mar", 3: "Sun, 29 Mar", 4: "Mon, 30 Mar",
+    5: "Tue, 31 Mar", 6: "Wed, 01 Apr", 7: "Thu, 02 Apr"
+}
+EVENT_TO_DAY = {
+    "3000": 1, "3000W": 1,
+    "60": 2, "60H": 2,
+    "200": 3, "HJ": 3, "LJ": 3, "PV": 3, "TJ": 3,
+    "400": 4, "DT": 4, "HT": 4, "JT": 4, "OT": 4, "SP": 4, "WT": 4,
+    "800": 6, "1500": 6, "5K": 6, "5KW": 6, "PEN": 6, "XC": 6
+}
+
+# sortData() scores
+WHEN_SCORES = {label: day * 10000 for day, label in DATE_MAPPING.items()}
+UNKNOWN_DAY_SCORE = 99000
+NO_WHEN_SCORE = 999999
+
+def when(event_code, slot):
+    if slot:
+        return f"{DATE_MAPPING.get(slot['day'], '-')} at {slot['time']}" if slot['time'] else DATE_MAPPING.get(slot['day'], '-')
+    return DATE_MAPPING[EVENT_TO_DAY.get(event_code, 1)]
+
+def report_rows(rows, table):
+    for row in rows:
+        base = {
+            "Bib": row['bib'],
+            "First Name": row['firstName'],
+            "Last Name": row['lastName'],
+            "Age Group": row['ageGroup'],
+            "Gender": row['gender'],
+            "Team Name": row['teamName']
+        }
+        if not row['events']:
+            yield {**base, "Event": "-", "When": "-", "QP": "-", "RESULT": "-"}
+            continue
+        for event_code, qp in row['events']:
+            slot = table.get((event_code, row['gender'], row['ageGroup']))
+            yield {**base, "Event": event_code, "When": when(event_code, slot), "QP": qp or "-", "RESULT": "-"}
+
+def js_sort_key(value):
+    # Array.prototype.sort(): UTF-16 code unit order, undefined last
+    return (value is None, (value or '').encode('utf-16-be'))
+
+def js_parse_int(text):
+    m = re.match(r'\s*([+-]?\d+)', text or '')
+    return int(m.group(1)) if m else None
+
+def when_minutes(value):
+    # parseWhenScore(): day score plus minutes into the day
+    if not value or value == '-':
+        return NO_WHEN_SCORE
+    parts = value.split(' at ')
+    score = WHEN_SCORES.get(parts[0], UNKNOWN_DAY_SCORE)
+    if len(parts) > 1:
+        hm = parts[1].split(':')
+        if len(hm) == 2:
+            score += js_parse_int(hm[0]) * 60 + js_parse_int(hm[1])
+    return score
+
+def sort_key(col, value):
+    if col == 'Bib':
+        return js_parse_int(value) or 0
+    if col == 'When':
+        return when_minutes(value)
+    return ('undefined' if value is None else value).lower().encode('utf-16-be')
+
+def sort_ranks(col, values):
+    keys = [sort_key(col, v) for v in values]
+    rank = {key: i for i, key in enumerate(sorted(set(keys)))}
+    return [rank[key] for key in keys]
+
+def build_facets(report, data_hash):
+    by_column = {col: {} for col in FILTER_COLUMNS}
+    count = 0
+    for row_id, row in enumerate(report):
+        count += 1
+        for col in FILTER_COLUMNS:
+            by_column[col].setdefault(row[col], []).append(row_id)
+
+    columns = {}
+    for col, groups in by_column.items():
+        values = sorted(groups, key=js_sort_key)
+        columns[col] = {
+            'counts': [len(groups[v]) for v in values],
+            'rows': [delta_encode(groups[v]) for v in values],
+            'ranks': sort_ranks(col, values)
+        }
+    return {'version': FACETS_VERSION, 'data': data_hash, 'rows': count, 'columns': columns}
+
+def write_facets(prog_path, index, path='src/js/facets.js'):
+    with profiling.stage('facets') as s:
+        bundle = encode_columns(slim_competitors(iter_competitors(prog_path)))
+        data_hash, _ = dump_bundle(bundle)
+        table, entries = resolve_entries(iter_competitors(prog_path), index)
+        facets = build_facets(report_rows(slim_competitors(iter_competitors(prog_path)), table), data_hash)
+        payload = json.dumps(facets, separators=(',', ':'), ensure_ascii=False)
+        write_js(path, 'emacs2026Facets', payload)
+        bust_cache('index.html', path, content_hash(payload))
+        s.count(rows=facets['rows'], bytes=len(payload))
+    return facets, payload
+
+if __name__ == '__main__':
+    facets, payload = write_facets('prog.json', ScheduleIndex.load('schedule_compact.json'))
+    values = sum(len(c['counts']) for c in facets['columns'].values())
+    print(f"Facets for {facets['rows']} rows, {values} values over {len(facets['columns'])} columns ({len(payload) // 1024} KB).")
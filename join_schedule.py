@@ -0,0 +1,61 @@
+import json
+from collections import Counter
+
+import profiling
+from common import bust_cache, content_hash, write_js
+from compact_schedule import ScheduleIndex
+from prog_stream import iter_competitors
+
+# Resolves every entered event in prog.json against the compact schedule once,
+# at build time, and writes a direct (eventCode, gender, ageGroup) -> [day, time]
+# table for the page. Entries the timetable does not cover map to null so the
+# page can tell "no slot" apart from "not in the table" (e.g. restored data).
+# index.html loads the table as schedule_lookup.js?v=<hash>.
+
+def join_key(event_code, gender, age_group):
+    return f'{event_code}|{gender}|{age_group}'
+
+def resolve_entries(competitors, index):
+    table = {}
+    entries = Counter()
+    for athlete in competitors:
+        for event in athlete.get('eventsEntered') or []:
+            key = (event['eventCode'], athlete['gender'], athlete['ageGroup'])
+            entries[key] += 1
+            if key not in table:
+                table[key] = index.lookup_group(*key)
+    return table, entries
+
+def lookup_table(table):
+    return {join_key(*key): [slot['day'], slot['time']] if slot else None for key, slot in sorted(table.items())}
+
+def report_unmatched(table, entries):
+    unmatched = [(key, entries[key]) for key, slot in table.items() if slot is None]
+    unmatched.sort(key=lambda item: (-item[1], item[0]))
+    missing = sum(count for key, count in unmatched)
+    print(f"{missing} of {sum(entries.values())} entries have no timetable slot ({len(unmatched)} event/gender/age groups):")
+    for (event_code, gender, age_group), count in unmatched:
+        print(f"  {event_code:6} {gender} {age_group:6} {count:4d}")
+    return unmatched
+
+def write_lookup(table, path='src/js/schedule_lookup.js'):
+    with profiling.stage('write_js') as s:
+        payload = json.dumps(lookup_table(table), separators=(',', ':'))
+        write_js(path, 'emacs2026When', payload)
+        bust_cache('index.html', path, content_hash(payload))
+        s.count(groups=len(table))
+
+def join(prog_path, index, competitors=None):
+    with profiling.stage('resolve') as s:
+        table, entries = resolve_entries(iter_competitors(prog_path) if competitors is None else competitors, index)
+        s.count(groups=len(table), entries=sum(entries.values()))
+    write_lookup(table)
+    return table, entries
+
+if __name__ == '__main__':
+    with profiling.stage('load_schedule'):
+        index = ScheduleIndex.load('schedule_compact.json')
+
+    table, entries = join('prog.json', index)
+    report_unmatched(table, entries)
+    print(f"Resolved {len(table)} event/gender/age groups for {sum(entries.values())} entries.")
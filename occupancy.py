@@ -0,0 +1,228 @@
+import argparse
+import json
+import re
+import sys
+import time
+
+import numpy as np
+
+from compact_schedule import decode, expand
+from competitor_store import CompetitorStore
+from conflicts import DEFAULT_SESSION_MINUTES, SESSION_MINUTES, minute_of, parse_durations, rows_by_group
+from event_classifier import EventClassifier
+from prog_stream import walk
+from seeding import DEFAULT_LANES
+
+# Per-minute crowding of each venue area (the TRACK / FIELD / OUTSIDE columns
+# of the timetable), for the call room and warm-up planning. Every session in
+# the schedule becomes three intervals in its area:
+#
+#   warmup     WARMUP_MINUTES before the call room
+#   callroom   CALL_ROOM_MINUTES before the start
+#   competing  from the start for the session length (conflicts.SESSION_MINUTES)
+#
+# each carrying the number of athletes in the session: the entries for its
+# event/gender/age groups, split between alternative finals ("Final A" /
+# "Final B"), capped at the prog.json event's lanes for a final or semi that
+# follows an earlier round, and dropping to cutSurvivors once cutAfterRound
+# of maxFieldAttempts are done in the horizontal jumps and throws. The
+# intervals are added into one difference array (+n at the start,
+# -n at the end) and a cumulative sum along the minutes gives every area's
+# occupancy for the whole meet in one pass.
+#
+# The area comes from the column the session was parsed from in
+# parsed_timetable_v6.json, matched the way build_schedule.py builds its
+# slots; sessions it cannot find fall back to AREA_BY_CODE.
+
+AREAS = ['TRACK', 'FIELD', 'OUTSIDE']
+LAYERS = ['warmup', 'callroom', 'competing']
+# parse_v6 COLUMNS, in header order
+COLUMN_AREAS = {'col1': 'TRACK', 'col2': 'FIELD', 'col3': 'OUTSIDE'}
+AREA_BY_CODE = {
+    'HJ': 'FIELD', 'PV': 'FIELD', 'LJ': 'FIELD', 'TJ': 'FIELD', 'SP': 'FIELD',
+    'DT': 'OUTSIDE', 'HT': 'OUTSIDE', 'JT': 'OUTSIDE', 'WT': 'OUTSIDE',
+    '5K': 'OUTSIDE', '5KW': 'OUTSIDE', 'XC': 'OUTSIDE'
+}
+CALL_ROOM_MINUTES = 20
+WARMUP_MINUTES = 40
+CUT_EVENTS = {'LJ', 'TJ', 'SP', 'DT', 'HT', 'JT', 'WT'}
+# Heats of a later round that follows an earlier one
+ROUND_HEATS = {'SF': 2, 'Final': 1}
+ALTERNATIVE_PATTERN = re.compile(r'^Final [A-Z]$')
+
+def areas_by_slot(parsed_events, classifier):
+    areas = {}
+    for e in parsed_events:
+        full_text = f"{e['event'] or ''} {e['desc']}".strip()
+        areas[classifier.day_index(e['day_text']), e['time'], full_text] = COLUMN_AREAS.get(e['column'])
+    return areas
+
+def event_rules(prog_path):
+    # (eventCode, gender) -> the prog.json event's lanes and cut settings
+    rules = {}
+    for kind, event in walk(prog_path, want=('event',)):
+        for gender in event.get('genders') or '':
+            rules.setdefault((event['eventCode'], gender), event)
+    return rules
+
+def round_heats(round_name):
+    for prefix, heats in ROUND_HEATS.items():
+        if round_name.startswith(prefix):
+            return heats
+    return None
+
+def build_sessions(rows, counts, rules, areas, classifier, durations):
+    # One session per timetable line; its rows are the age groups it covers
+    later = set()
+    shares = {}
+    for key, group_rows in rows_by_group(rows).items():
+        group_rows = sorted(group_rows, key=lambda r: minute_of(r['day'], r['time']))
+        first_round = classifier.round_of(group_rows[0]['desc'])
+        for row in group_rows[1:]:
+            name = classifier.round_of(row['desc'])
+            if name != first_round and round_heats(name):
+                later.add(id(row))
+        # Alternatives ("Final A" / "Final B") split the group between them
+        alternatives = [r for r in group_rows if ALTERNATIVE_PATTERN.match(classifier.round_of(r['desc']))]
+        if len(alternatives) > 1:
+            base, extra = divmod(counts.get(key, 0), len(alternatives))
+            for i, row in enumerate(alternatives):
+                shares[id(row)] = base + (i < extra)
+
+    sessions = {}
+    for row in rows:
+        if not row['time']:
+            continue
+        key = (row['eventCode'], row['day'], row['time'], row['desc'])
+        session = sessions.get(key)
+        if session is None:
+            code = row['eventCode']
+            start = minute_of(row['day'], row['time'])
+            session = sessions[key] = {
+                'eventCode': code, 'day': row['day'], 'time': row['time'], 'desc': row['desc'],
+                'area': areas.get((row['day'], row['time'], row['desc'])) or AREA_BY_CODE.get(code, 'TRACK'),
+                'round': classifier.round_of(row['desc']),
+                'start': start, 'end': start + durations.get(code, DEFAULT_SESSION_MINUTES),
+                'athletes': 0, 'later': False, 'rule': rules.get((code, row['gender']), {})
+            }
+        session['athletes'] += shares.get(id(row), counts.get((row['eventCode'], row['gender'], row['ageGroup']), 0))
+        session['later'] = session['later'] or id(row) in later
+
+    result = []
+    for session in sorted(sessions.values(), key=lambda s: (s['start'], s['eventCode'], s['desc'])):
+        rule = session.pop('rule')
+        if session['later']:
+            lanes = rule.get('lanes') or DEFAULT_LANES
+            session['athletes'] = min(session['athletes'], lanes * round_heats(session['round']))
+        session['cut'] = None
+        if session['eventCode'] in CUT_EVENTS and rule.get('cutSurvivors') and rule.get('maxFieldAttempts'):
+            share = min(1, (rule.get('cutAfterRound') or 0) / rule['maxFieldAttempts'])
+            cut_at = session['start'] + round((session['end'] - session['start']) * share)
+            if session['athletes'] > rule['cutSurvivors'] and cut_at < session['end']:
+                session['cut'] = {'at': cut_at, 'athletes': rule['cutSurvivors']}
+        if session['athletes']:
+            result.append(session)
+    return result
+
+def intervals(sessions, call_room=CALL_ROOM_MINUTES, warmup=WARMUP_MINUTES):
+    # (area index, layer index, start, end, athletes) for every layer of every session
+    area_ids = {a: i for i, a in enumerate(AREAS)}
+    out = []
+    for s in sessions:
+        area = area_ids[s['area']]
+        n = s['athletes']
+        out.append((area, 0, s['start'] - call_room - warmup, s['start'] - call_room, n))
+        out.append((area, 1, s['start'] - call_room, s['start'], n))
+        if s['cut']:
+            out.append((area, 2, s['start'], s['cut']['at'], n))
+            out.append((area, 2, s['cut']['at'], s['end'], s['cut']['athletes']))
+        else:
+            out.append((area, 2, s['start'], s['end'], n))
+    return np.array(out, dtype=np.int64).reshape(-1, 5)
+
+def sweep(spans, minutes):
+    # occupancy[area, layer, minute] from the intervals, by prefix sum
+    diff = np.zeros((len(AREAS), len(LAYERS), minutes + 1), dtype=np.int64)
+    start = np.clip(spans[:, 2], 0, minutes)
+    end = np.clip(spans[:, 3], 0, minutes)
+    np.add.at(diff, (spans[:, 0], spans[:, 1], start), spans[:, 4])
+    np.add.at(diff, (spans[:, 0], spans[:, 1], end), -spans[:, 4])
+    return np.cumsum(diff[:, :, :-1], axis=2)
+
+def format_minute(minute):
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+def timeline(sessions, call_room=CALL_ROOM_MINUTES, warmup=WARMUP_MINUTES):
+    spans = intervals(sessions, call_room, warmup)
+    days = max(s['day'] for s in sessions) if sessions else 0
+    occupancy = sweep(spans, days * 1440)
+
+    result = []
+    for day in range(1, days + 1):
+        window = occupancy[:, :, (day - 1) * 1440:day * 1440]
+        busy = np.flatnonzero(window.sum(axis=(0, 1)))
+        if not len(busy):
+            continue
+        first, last = int(busy[0]), int(busy[-1]) + 1
+        areas = {}
+        peaks = {}
+        for a, area in enumerate(AREAS):
+            areas[area] = {layer: window[a, l, first:last].tolist() for l, layer in enumerate(LAYERS)}
+            peaks[area] = {}
+            for l, layer in enumerate(LAYERS):
+                at = int(window[a, l].argmax())
+                peak = int(window[a, l, at])
+                peaks[area][layer] = {'athletes': peak, 'time': format_minute(at) if peak else None}
+        result.append({'day': day, 'start': format_minute(first), 'end': format_minute(last), 'areas': areas, 'peaks': peaks})
+    return result
+
+def build_occupancy(prog_path, rows, parsed_path='parsed_timetable_v6.json', call_room=CALL_ROOM_MINUTES,
+                    warmup=WARMUP_MINUTES, durations=None, store=None):
+    durations = {**SESSION_MINUTES, **(durations or {})}
+    classifier = EventClassifier()
+    try:
+        with open(parsed_path, 'r') as f:
+            areas = areas_by_slot(json.load(f), classifier)
+    except FileNotFoundError:
+        areas = {}
+    counts = (store or CompetitorStore.load(prog_path)).group_counts()
+    sessions = build_sessions(rows, counts, event_rules(prog_path), areas, classifier, durations)
+    return {
+        'areas': AREAS, 'layers': LAYERS, 'callRoom': call_room, 'warmup': warmup,
+        'sessions': len(sessions), 'days': timeline(sessions, call_room, warmup)
+    }
+
+def report(result, out=sys.stdout):
+    print(f"{result['sessions']} sessions, call room {result['callRoom']} min, warm-up {result['warmup']} min before it", file=out)
+    for day in result['days']:
+        print(f"\nDay {day['day']} ({day['start']}-{day['end']}):", file=out)
+        for area in AREAS:
+            peaks = day['peaks'][area]
+            print(f"  {area:8}" + ''.join(f"  {layer} peak {p['athletes']:4} at {p['time'] or '-':5}" for layer, p in peaks.items()), file=out)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Per-minute call room, warm-up and competition occupancy of each venue area.')
+    parser.add_argument('--prog', default='prog.json')
+    parser.add_argument('--schedule', default='schedule_compact.json')
+    parser.add_argument('--timetable', default='parsed_timetable_v6.json', help='parsed timetable the venue areas are read from')
+    parser.add_argument('--call-room', type=int, default=CALL_ROOM_MINUTES, help='minutes athletes spend in the call room before the start')
+    parser.add_argument('--warmup', type=int, default=WARMUP_MINUTES, help='minutes of warm-up before the call room')
+    parser.add_argument('--duration', action='append', default=[], metavar='CODE=MINUTES', help='session length for an event code')
+    parser.add_argument('--json', metavar='PATH', help='also write the timelines as JSON')
+    parser.add_argument('-q', '--quiet', action='store_true', help='only print the summary line')
+    args = parser.parse_args()
+
+    with open(args.schedule, 'r') as f:
+        rows = expand(decode(json.load(f)))
+    start = time.perf_counter()
+    result = build_occupancy(args.prog, rows, args.timetable, args.call_room, args.warmup, parse_durations(args.duration))
+    elapsed = time.perf_counter() - start
+
+    if args.quiet:
+        print(f"Occupancy for {result['sessions']} sessions over {len(result['days'])} days")
+    else:
+        report(result)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, separators=(',', ':'))
+    print(f"({elapsed * 1000:.1f} ms)", file=sys.stderr)
@@ -0,0 +1,118 @@
+import re
+
+import numpy as np
+
+# Shared word-box layout for the pdfplumber parsers: line clustering, column
+# assignment and time-token segmentation on NumPy arrays instead of per-word
+# Python loops. Results are identical to the loops the parsers used to run:
+#
+#   words.sort(key=lambda w: (round(w['top'], 1), w['x0']))
+#   a new line starts when abs(w['top'] - <top of the line's first word>) >= tolerance
+#   column = first boundary the word's x0 is below (last column otherwise)
+#   a new segment starts at every time token
+
+# ^\d{2}:\d{2}$ (parse_v5, parse_v6)
+STRICT_TIME = re.compile(r'^\d{2}:\d{2}$', re.M)
+# ":" in text and len(text) == 5 and text[0].isdigit() (parse_v2 - parse_v4, parse_timetable_plumber)
+LOOSE_TIME = re.compile(r'^\d(?=.*:).{4}$', re.M)
+
+def round1(values):
+    # np.round(x, 1) can differ from Python's correctly rounded round(x, 1)
+    # on values sitting right at a .x5 boundary; redo just those in Python
+    rounded = np.round(values, 1)
+    scaled = values * 10
+    near_half = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    for i in near_half:
+        rounded[i] = round(float(values[i]), 1)
+    return rounded
+
+def word_arrays(words):
+    n = len(words)
+    top = np.fromiter((w['top'] for w in words), dtype=float, count=n)
+    x0 = np.fromiter((w['x0'] for w in words), dtype=float, count=n)
+    return top, x0
+
+def reading_order(top, x0):
+    # Stable, like list.sort, so ties keep extraction order
+    return np.lexsort((x0, round1(top)))
+
+def line_starts(top, tolerance):
+    # top is in reading order. A line is anchored on its first word, so the
+    # next line starts at the first later word at least `tolerance` below the
+    # anchor. Tops are sorted to within the 0.05 rounding of the sort key, so
+    # that word is found with a binary search plus a look at the few words
+    # that share its rounded top.
+    n = len(top)
+    key = round1(top)
+    starts = [0]
+    i = 0
+    while True:
+        limit = top[i] + tolerance
+        lo = np.searchsorted(key, limit - 0.05 - 1e-9, side='left')
+        hi = np.searchsorted(key, limit + 0.05 + 1e-9, side='right')
+        lo = max(lo, i + 1)
+        if lo >= n:
+            break
+        hits = np.flatnonzero(np.abs(top[lo:hi] - top[i]) >= tolerance)
+        i = lo + hits[0] if len(hits) else hi
+        if i >= n:
+            break
+        starts.append(i)
+    return np.asarray(starts)
+
+def group_lines(words, tolerance):
+    # Drop-in for the sort + grouping loop: returns lists of the word dicts
+    if not words:
+        return []
+    top, x0 = word_arrays(words)
+    order = reading_order(top, x0)
+    starts = line_starts(top[order], tolerance)
+    ends = np.append(starts[1:], len(order))
+    ordered = [words[i] for i in order]
+    return [ordered[s:e] for s, e in zip(starts.tolist(), ends.tolist())]
+
+def assign_columns(x0, boundaries, columns):
+    col = np.searchsorted(np.asarray(boundaries, dtype=float), x0, side='right')
+    return np.minimum(col, columns - 1)
+
+def time_mask(texts, pattern=STRICT_TIME):
+    # One regex pass over all words joined by newlines instead of one match per word
+    mask = np.zeros(len(texts), dtype=bool)
+    if not texts:
+        return mask
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    offsets = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+    hits = np.fromiter((m.start() for m in pattern.finditer('\n'.join(texts))), dtype=np.int64)
+    mask[np.searchsorted(offsets, hits, side='right') - 1] = True
+    return mask
+
+def segments(line_ids, x0, texts, boundaries, columns, pattern=STRICT_TIME):
+    # Splits every line into columns and every column into time segments.
+    # Returns (line, column, [texts]) in the order the parsers walk them:
+    # line by line, columns left to right, words in reading order.
+    n = len(texts)
+    if n == 0:
+        return []
+    line_ids = np.asarray(line_ids)
+    col = assign_columns(np.asarray(x0, dtype=float), boundaries, columns)
+    order = np.lexsort((np.arange(n), col, line_ids))
+    lines = line_ids[order]
+    cols = col[order]
+
+    start = time_mask(texts, pattern)[order]
+    start[0] = True
+    start[1:] |= (lines[1:] != lines[:-1]) | (cols[1:] != cols[:-1])
+    bounds = np.flatnonzero(start).tolist() + [n]
+
+    ordered = [texts[i] for i in order]
+    lines = lines.tolist()
+    cols = cols.tolist()
+    return [(lines[s], cols[s], ordered[s:e]) for s, e in zip(bounds[:-1], bounds[1:])]
+
+def line_segments(lines, boundaries, columns, pattern=STRICT_TIME):
+    # segments() for lines of word dicts, as produced by group_lines()
+    lengths = [len(line) for line in lines]
+    words = [w for line in lines for w in line]
+    line_ids = np.repeat(np.arange(len(lines)), lengths)
+    x0 = np.fromiter((w['x0'] for w in words), dtype=float, count=len(words))
+    return segments(line_ids, x0, [w['text'] for w in words], boundaries, columns, pattern)
@@ -0,0 +1,128 @@
+import argparse
+import difflib
+import json
+
+import pdfplumber
+
+import parse_timetable
+import parse_timetable_plumber
+import parse_v2
+import parse_v3
+import parse_v4
+import parse_v5
+import parse_v6
+import profiling
+from extract_cache import ExtractCache
+
+# Runs any number of timetable parsers over one extraction. The PDF is opened
+# and its words extracted once; every strategy then reads the same in-memory
+# word lists (or the same text, for the text-based parser), so comparing all
+# parser variants costs one extraction instead of one per script.
+#
+# A strategy is a function that takes the document's pages (or text) and
+# returns the parsed events. Strategies must not modify the word dicts they
+# are given, since the next strategy sees the same objects.
+
+STRATEGIES = {
+    'raw': {'source': 'text', 'parse': parse_timetable.parse_text, 'output': 'parsed_timetable_raw.json'},
+    'plumber': {'source': 'words', 'parse': parse_timetable_plumber.parse_pages, 'output': 'parsed_timetable_plumber.json'},
+    'v2': {'source': 'words', 'parse': parse_v2.parse_pages, 'output': 'parsed_timetable_v2.json'},
+    'v3': {'source': 'words', 'parse': parse_v3.parse_pages, 'output': 'parsed_timetable_v3.json'},
+    'v4': {'source': 'words', 'parse': parse_v4.parse_pages, 'output': 'parsed_timetable_v4.json'},
+    'v5': {'source': 'words', 'parse': parse_v5.parse_pages, 'output': 'parsed_timetable_v5.json'},
+    'v6': {'source': 'words', 'parse': parse_v6.parse_pages, 'output': 'parsed_timetable_v6.json'},
+}
+
+def register(name, parse, output, source='words'):
+    STRATEGIES[name] = {'source': source, 'parse': parse, 'output': output}
+
+class Document:
+    def __init__(self, pdf_path='timetable.pdf', text_path='timetable_extracted.txt', use_cache=True):
+        self.pdf_path = pdf_path
+        self.text_path = text_path
+        self.use_cache = use_cache
+        self._pages = None
+        self._text = None
+
+    @property
+    def pages(self):
+        if self._pages is None:
+            cache = ExtractCache() if self.use_cache else None
+            self._pages = []
+            with pdfplumber.open(self.pdf_path) as pdf:
+                for page_num, page in enumerate(pdf.pages):
+                    with profiling.stage('extract_words', page_num) as s:
+                        self._pages.append(cache.words(page) if cache else page.extract_words())
+                        s.count(words=len(self._pages[-1]))
+        return self._pages
+
+    @property
+    def text(self):
+        if self._text is None:
+            with open(self.text_path, 'r') as f:
+                self._text = f.read()
+        return self._text
+
+    def source(self, kind):
+        return self.pages if kind == 'words' else self.text
+
+def run_strategy(doc, name):
+    strategy = STRATEGIES[name]
+    source = doc.source(strategy['source'])
+    with profiling.stage(f'strategy {name}') as s:
+        events = strategy['parse'](source)
+        s.count(events=len(events))
+    return events
+
+def run(doc, names=None):
+    for name in names or STRATEGIES:
+        yield name, run_strategy(doc, name)
+
+def _canonical(event):
+    return json.dumps(event, sort_keys=True)
+
+def compare(events, golden, fields=None):
+    # Aligns the two event lists as sequences. Events that line up one-to-one
+    # inside a changed stretch count as changed (with the differing fields
+    # tallied); the rest of the stretch counts as missing or extra. fields
+    # restricts the comparison, e.g. to the fields two parsers have in common.
+    if fields is not None:
+        events = [{k: e[k] for k in fields if k in e} for e in events]
+        golden = [{k: e[k] for k in fields if k in e} for e in golden]
+    report = {'count': len(events), 'golden': len(golden), 'same': 0, 'changed': 0,
+              'missing': 0, 'extra': 0, 'fields': {}}
+    matcher = difflib.SequenceMatcher(None, [_canonical(e) for e in golden], [_canonical(e) for e in events], autojunk=False)
+    for op, g0, g1, e0, e1 in matcher.get_opcodes():
+        if op == 'equal':
+            report['same'] += g1 - g0
+            continue
+        paired = min(g1 - g0, e1 - e0) if op == 'replace' else 0
+        for old, new in zip(golden[g0:g0 + paired], events[e0:e0 + paired]):
+            report['changed'] += 1
+            for field in sorted(set(old) | set(new)):
+                if old.get(field) != new.get(field):
+                    report['fields'][field] = report['fields'].get(field, 0) + 1
+        report['missing'] += g1 - g0 - paired
+        report['extra'] += e1 - e0 - paired
+    return report
+
+def load_golden(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run timetable parser strategies over a single extraction.')
+    parser.add_argument('strategies', nargs='*', help=f"strategies to run: {', '.join(STRATEGIES)} (default: all)")
+    parser.add_argument('--write', action='store_true', help="write each strategy's parsed_timetable_*.json")
+    parser.add_argument('--no-cache', action='store_true', help='always re-extract every page')
+    args = parser.parse_args()
+    unknown = [s for s in args.strategies if s not in STRATEGIES]
+    if unknown:
+        parser.error(f"unknown strategy: {', '.join(unknown)}")
+
+    doc = Document(use_cache=not args.no_cache)
+    for name, events in run(doc, args.strategies):
+        if args.write:
+            with open(STRATEGIES[name]['output'], 'w') as f:
+                json.dump(events, f, indent=2)
+        print(f"{name:8} {len(events):5} events")
@@ -2,72 +2,52 @@ import pdfplumber
 import json
 import traceback
 
-events = []
+import page_layout
+from extract_cache import ExtractCache
 
-try:
-    with pdfplumber.open('timetable.pdf') as pdf:
-        for page_num, page in enumerate(pdf.pages):
-            words = page.extract_words()
-            
-            # Sort words top-to-bottom, then left-to-right
-            words.sort(key=lambda w: (round(w['top'], 1), w['x0']))
-            
-            # Group words into lines based on vertical position
-            lines = []
-            if not words: continue
-            
-            current_line = [words[0]]
-            current_top = words[0]['top']
-            
-            for w in words[1:]:
-                # If word is roughly on the same line (within 3 points)
-                if abs(w['top'] - current_top) < 3:
-                    current_line.append(w)
-                else:
-                    lines.append(current_line)
-                    current_line = [w]
-                    current_top = w['top']
-            if current_line:
-                lines.append(current_line)
-                
-            day_text = ""
-            for line in lines:
-                text = " ".join([w['text'] for w in line])
+def parse_pages(pages):
+    # pages: each page's word list, in page order
+    events = []
+    for page_num, words in enumerate(pages):
+        if not words: continue
+
+        # Sort words top-to-bottom, then left-to-right, and group words
+        # into lines based on vertical position (within 3 points)
+        lines = page_layout.group_lines(words, 3)
+
+        day_text = ""
+        current_line = None
+        # A line could have multiple HH:MM, each starting an event string,
+        # so the line is broken into segments that each start at a time
+        for line_idx, col_idx, seg in page_layout.line_segments(lines, [], 1, page_layout.LOOSE_TIME):
+            if line_idx != current_line:
+                current_line = line_idx
+                text = " ".join([w['text'] for w in lines[line_idx]])
                 if "Day" in text:
                     day_text = text
-                
-                # We need to find words that look like HH:MM
-                # A line could have multiple HH:MM, each starting a column
-                # Let's break the line into event strings based on HH:MM
-                
-                idx = 0
-                while idx < len(line):
-                    w = line[idx]
-                    if ":" in w['text'] and len(w['text']) == 5 and w['text'][0].isdigit():
-                        time_str = w['text']
-                        event_words = []
-                        idx += 1
-                        # Collect words until next time_str
-                        while idx < len(line):
-                            next_w = line[idx]
-                            if ":" in next_w['text'] and len(next_w['text']) == 5 and next_w['text'][0].isdigit():
-                                break
-                            event_words.append(next_w['text'])
-                            idx += 1
-                        
-                        desc = " ".join(event_words)
-                        if desc:
-                            events.append({
-                                'page': page_num,
-                                'time': time_str,
-                                'desc': desc,
-                                'day_text': day_text
-                            })
-                    else:
-                        idx += 1
 
-    with open('parsed_timetable_plumber.json', 'w') as f:
-        json.dump(events, f, indent=2)
+            # Words before the first time on a line are not part of an event
+            if not page_layout.LOOSE_TIME.match(seg[0]):
+                continue
+            time_str = seg[0]
+            desc = " ".join(seg[1:])
+            if desc:
+                events.append({
+                    'page': page_num,
+                    'time': time_str,
+                    'desc': desc,
+                    'day_text': day_text
+                })
+    return events
+
+if __name__ == '__main__':
+    cache = ExtractCache()
+    try:
+        with pdfplumber.open('timetable.pdf') as pdf:
+            events = parse_pages(cache.words(page) for page in pdf.pages)
+
+        with open('parsed_timetable_plumber.json', 'w') as f:
+            json.dump(events, f, indent=2)
 
-except Exception as e:
-    print(traceback.format_exc())
+    except Exception as e:
+        print(traceback.format_exc())
@@ -1,109 +1,185 @@
 import pdfplumber
+import argparse
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 
-def parse_pdf_to_columns(pdf_path):
-    extracted_events = []
-    
-    with pdfplumber.open(pdf_path) as pdf:
-        # Default boundaries
-        boundaries = [300, 500] 
-        active_events = {'col1': None, 'col2': None, 'col3': None}
-        day_text = ""
-
-        for page_num, page in enumerate(pdf.pages):
-            words = page.extract_words()
-            if not words: continue
-            
-            # Detect headers on this page
-            headers = [w for w in words if w['text'] in ['TRACK', 'FIELD', 'OUTSIDE']]
-            if len(headers) >= 2:
-                # Sort headers by x0
-                headers.sort(key=lambda h: h['x0'])
-                new_boundaries = []
-                for i in range(len(headers) - 1):
-                    new_boundaries.append((headers[i]['x0'] + headers[i+1]['x0']) / 2)
-                # Ensure we have at least 2 boundaries for 3 columns
-                if len(new_boundaries) == 1:
-                    new_boundaries.append(new_boundaries[0] + 200)
-                boundaries = new_boundaries
-            
-            # Sort words
-            words.sort(key=lambda w: (round(w['top'], 1), w['x0']))
-            
-            # Group into lines
-            lines = []
-            current_line = [words[0]]
-            current_top = words[0]['top']
-            for w in words[1:]:
-                if abs(w['top'] - current_top) < 5:
-                    current_line.append(w)
-                else:
-                    lines.append(current_line)
-                    current_line = [w]
-                    current_top = w['top']
-            if current_line: lines.append(current_line)
-            
-            
-            for line in lines:
-                line_text = " ".join([w['text'] for w in line])
+import numpy as np
+
+import page_layout
+import profiling
+from extract_cache import ExtractCache
+
+# Bump when layout_page changes so cached page layouts are not reused
+LAYOUT_VERSION = 2
+
+COLUMNS = ['col1', 'col2', 'col3']
+
+EVENT_NAMES = ["High Jump", "Long Jump", "Triple Jump", "TripleJump", "Pole Vault", "Shot Put", "Discus", "Hammer", "Javelin", "Weight Throw", "Cross Country", "XC", "Pentathlon", "Road Race", "RW", "3000W", "4x200", "60H", "60 m", "200 m", "400 m", "800 m", "1500 m", "3000 m", "60m", "200m", "400m", "800m", "1500m", "3000m"]
+
+def layout_page(page, cache=None):
+    # Everything here depends on the page alone, so it can run in any process.
+    # Returns the column boundaries found on this page (None if the page has no
+    # headers) and its words in reading order, split into lines.
+    page_num = page.page_number - 1
+    with profiling.stage('extract_words', page_num) as s:
+        words = cache.words(page) if cache else page.extract_words()
+        s.count(words=len(words))
+    with profiling.stage('group_lines', page_num) as s:
+        boundaries, layout = layout_words(words)
+        s.count(lines=len(layout['line_lengths']))
+    return boundaries, layout
+
+def layout_words(words):
+    if not words: return None, {'text': [], 'x0': [], 'line_lengths': []}
+
+    # Detect headers on this page
+    boundaries = None
+    headers = [w for w in words if w['text'] in ['TRACK', 'FIELD', 'OUTSIDE']]
+    if len(headers) >= 2:
+        # Sort headers by x0
+        headers.sort(key=lambda h: h['x0'])
+        boundaries = []
+        for i in range(len(headers) - 1):
+            boundaries.append((headers[i]['x0'] + headers[i+1]['x0']) / 2)
+        # Ensure we have at least 2 boundaries for 3 columns
+        if len(boundaries) == 1:
+            boundaries.append(boundaries[0] + 200)
+
+    # Sort words and group into lines
+    lines = page_layout.group_lines(words, 5)
+
+    # Lines as flat word columns: texts, x0s and the number of words per line
+    return boundaries, {
+        'text': [w['text'] for line in lines for w in line],
+        'x0': [w['x0'] for line in lines for w in line],
+        'line_lengths': [len(line) for line in lines]
+    }
+
+def segment_page(page_num, boundaries, layout, state, extracted_events):
+    # Carries the page-to-page state (boundaries, day_text, active column headers)
+    # forward, so pages must be fed in page order.
+    if boundaries:
+        state['boundaries'] = boundaries
+    boundaries = state['boundaries']
+    active_events = state['active_events']
+
+    texts = layout['text']
+    line_starts = [0]
+    for n in layout['line_lengths']:
+        line_starts.append(line_starts[-1] + n)
+    line_ids = np.repeat(np.arange(len(layout['line_lengths'])), layout['line_lengths'])
+
+    with profiling.stage('segment', page_num) as s:
+        events_before = len(extracted_events)
+        current_line = None
+        segments = page_layout.segments(line_ids, layout['x0'], texts, boundaries, 3)
+        for line_idx, col_idx, seg in segments:
+            if line_idx != current_line:
+                current_line = line_idx
+                line_text = " ".join(texts[line_starts[line_idx]:line_starts[line_idx + 1]])
                 if "Day" in line_text:
-                    day_text = line_text
-                
-                # Split words into detected columns
-                col_words = {'col1': [], 'col2': [], 'col3': []}
-                for w in line:
-                    if w['x0'] < boundaries[0]:
-                        col_words['col1'].append(w)
-                    elif len(boundaries) > 1 and w['x0'] < boundaries[1]:
-                        col_words['col2'].append(w)
-                    else:
-                        col_words['col3'].append(w)
-                
-                for col_name, words in col_words.items():
-                    if not words: continue
-                    
-                    segments = []
-                    current_segment = []
-                    for w in words:
-                        if re.match(r'^\d{2}:\d{2}$', w['text']):
-                            if current_segment: segments.append(current_segment)
-                            current_segment = [w]
-                        else:
-                            current_segment.append(w)
-                    if current_segment: segments.append(current_segment)
-                    
-                    for seg in segments:
-                        seg_text = " ".join([w['text'] for w in seg])
-                        time_match = re.search(r'(\d{2}:\d{2})', seg_text)
-                        
-                        event_names = ["High Jump", "Long Jump", "Triple Jump", "TripleJump", "Pole Vault", "Shot Put", "Discus", "Hammer", "Javelin", "Weight Throw", "Cross Country", "XC", "Pentathlon", "Road Race", "RW", "3000W", "4x200", "60H", "60 m", "200 m", "400 m", "800 m", "1500 m", "3000 m", "60m", "200m", "400m", "800m", "1500m", "3000m"]
-                        
-                        local_header = None
-                        for en in event_names:
-                            if en.lower() in seg_text.lower():
-                                local_header = en
-                                active_events[col_name] = en
-                                break
-                        
-                        if time_match:
-                            time_str = time_match.group(1)
-                            desc = seg_text.replace(time_str, "").strip()
-                            final_event = local_header or active_events[col_name]
-                            
-                            if desc:
-                                extracted_events.append({
-                                    'day_text': day_text,
-                                    'time': time_str,
-                                    'event': final_event,
-                                    'desc': desc,
-                                    'column': col_name,
-                                    'page': page_num
-                                })
-                            
+                    state['day_text'] = line_text
+
+            col_name = COLUMNS[col_idx]
+            seg_text = " ".join(seg)
+            time_match = re.search(r'(\d{2}:\d{2})', seg_text)
+
+            local_header = None
+            for en in EVENT_NAMES:
+                if en.lower() in seg_text.lower():
+                    local_header = en
+                    active_events[col_name] = en
+                    break
+
+            if time_match:
+                time_str = time_match.group(1)
+                desc = seg_text.replace(time_str, "").strip()
+                final_event = local_header or active_events[col_name]
+
+                if desc:
+                    extracted_events.append({
+                        'day_text': state['day_text'],
+                        'time': time_str,
+                        'event': final_event,
+                        'desc': desc,
+                        'column': col_name,
+                        'page': page_num
+                    })
+        s.count(segments=len(segments), events=len(extracted_events) - events_before)
+
+def cached_layout_page(page, cache):
+    if cache is None:
+        return layout_page(page)
+    # On a cache hit the extract_words and group_lines stages never run
+    with profiling.stage('cached_layout', page.page_number - 1):
+        return cache.result(page, 'v6-layout', LAYOUT_VERSION, lambda p: layout_page(p, cache))
+
+# Each pool worker opens the PDF once and then lays out the pages it is handed
+_worker_pdf = None
+_worker_cache = None
+
+def _open_worker_pdf(pdf_path, use_cache):
+    global _worker_pdf, _worker_cache
+    _worker_pdf = pdfplumber.open(pdf_path)
+    _worker_cache = ExtractCache() if use_cache else None
+
+def _layout_page_num(page_num):
+    result = cached_layout_page(_worker_pdf.pages[page_num], _worker_cache)
+    profiling.flush()
+    return result
+
+def iter_page_layouts(pdf_path, jobs=1, use_cache=True):
+    with pdfplumber.open(pdf_path) as pdf:
+        if jobs <= 1:
+            cache = ExtractCache() if use_cache else None
+            for page in pdf.pages:
+                yield cached_layout_page(page, cache)
+            return
+        page_count = len(pdf.pages)
+
+    # map() hands results back in page order, so the merge can stream them
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_open_worker_pdf, initargs=(pdf_path, use_cache)) as pool:
+        yield from pool.map(_layout_page_num, range(page_count))
+
+def initial_state():
+    # Default boundaries
+    return {
+        'boundaries': [300, 500],
+        'active_events': {'col1': None, 'col2': None, 'col3': None},
+        'day_text': ""
+    }
+
+def parse_pages(pages):
+    # pages: each page's word list, in page order
+    extracted_events = []
+    state = initial_state()
+    for page_num, words in enumerate(pages):
+        boundaries, layout = layout_words(words)
+        segment_page(page_num, boundaries, layout, state, extracted_events)
+    return extracted_events
+
+def parse_pdf_to_columns(pdf_path, jobs=1, use_cache=True):
+    extracted_events = []
+    state = initial_state()
+
+    for page_num, (boundaries, layout) in enumerate(iter_page_layouts(pdf_path, jobs, use_cache)):
+        segment_page(page_num, boundaries, layout, state, extracted_events)
+
     return extracted_events
 
-events = parse_pdf_to_columns('timetable.pdf')
-with open('parsed_timetable_v6.json', 'w') as f:
-    json.dump(events, f, indent=2)
-print(f"Extracted {len(events)} events with v6 dynamic boundaries.")
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--jobs', type=int, default=1, help='worker processes for page extraction (0 = all cores)')
+    parser.add_argument('--no-cache', action='store_true', help='always re-extract every page')
+    parser.add_argument('--profile', metavar='PATH', help='append stage timings to PATH (see profiling.py)')
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable(args.profile)
+
+    events = parse_pdf_to_columns('timetable.pdf', jobs=args.jobs or os.cpu_count(), use_cache=not args.no_cache)
+    with profiling.stage('write_json') as s, open('parsed_timetable_v6.json', 'w') as f:
+        json.dump(events, f, indent=2)
+        s.count(events=len(events))
+    print(f"Extracted {len(events)} events with v6 dynamic boundaries.")
@@ -0,0 +1,140 @@
+import argparse
+import atexit
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+# Opt-in stage timing for the parse and build scripts. Set TIMETABLE_PROFILE
+# to a file (or pass --profile to build.py / parse_v6.py) and every
+# instrumented stage records its wall and CPU time, the page it ran on and
+# whatever counts it reports:
+#
+#   with profiling.stage('segment', page_num) as s:
+#       ...
+#       s.count(segments=n, events=m)
+#
+# Each process appends one JSON line ({"script", "pid", "stages": [...]}) to
+# the file when it exits, so a whole build run, its subprocesses and parse
+# workers included, ends up in one profile. `python3 profiling.py` prints it
+# as a summary table.
+#
+# When profiling is off, stage() hands back one shared no-op object, so an
+# instrumented block costs a function call and nothing is recorded.
+
+ENV_VAR = 'TIMETABLE_PROFILE'
+DEFAULT_PATH = 'profile.jsonl'
+
+_path = os.environ.get(ENV_VAR)
+enabled = bool(_path)
+_records = []
+
+class _Stage:
+    def __init__(self, name, page):
+        self.record = {'stage': name}
+        if page is not None:
+            self.record['page'] = page
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc):
+        self.record['wall'] = time.perf_counter() - self._wall
+        self.record['cpu'] = time.process_time() - self._cpu
+        _records.append(self.record)
+        return False
+
+    def count(self, **counts):
+        self.record.setdefault('counts', {}).update(counts)
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def count(self, **counts):
+        pass
+
+_NULL_STAGE = _NullStage()
+
+def stage(name, page=None):
+    if not enabled:
+        return _NULL_STAGE
+    return _Stage(name, page)
+
+def flush():
+    # Called at exit; pool workers call it themselves since they never run atexit
+    if not enabled or not _records:
+        return
+    line = json.dumps({'script': os.path.basename(sys.argv[0]) or 'python', 'pid': os.getpid(), 'stages': _records})
+    with open(_path, 'a') as f:
+        f.write(line + '\n')
+    _records.clear()
+
+def enable(path=DEFAULT_PATH):
+    # Also exported to the environment so subprocesses and workers profile too
+    global _path, enabled
+    _path = os.path.abspath(path)
+    os.environ[ENV_VAR] = _path
+    if not enabled:
+        enabled = True
+        atexit.register(flush)
+
+if enabled:
+    atexit.register(flush)
+
+def load(path):
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def summarize(runs):
+    # (script, stage) -> calls, wall, cpu, max wall and summed counts
+    rows = {}
+    for run in runs:
+        for rec in run['stages']:
+            row = rows.setdefault((run['script'], rec['stage']), {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'max': 0.0, 'counts': defaultdict(int)})
+            row['calls'] += 1
+            row['wall'] += rec['wall']
+            row['cpu'] += rec['cpu']
+            row['max'] = max(row['max'], rec['wall'])
+            for k, v in rec.get('counts', {}).items():
+                row['counts'][k] += v
+    return rows
+
+def page_table(runs):
+    # (script, page) -> {stage: wall}
+    pages = defaultdict(lambda: defaultdict(float))
+    for run in runs:
+        for rec in run['stages']:
+            if 'page' in rec:
+                pages[(run['script'], rec['page'])][rec['stage']] += rec['wall']
+    return pages
+
+def format_counts(counts):
+    return ', '.join(f'{k} {v}' for k, v in counts.items())
+
+def print_summary(runs, pages=False, out=sys.stdout):
+    rows = summarize(runs)
+    print(f"{'script':22} {'stage':26} {'calls':>6} {'wall ms':>9} {'cpu ms':>9} {'max ms':>8}  counts", file=out)
+    for (script, name), row in rows.items():
+        print(f"{script:22} {name:26} {row['calls']:6} {row['wall'] * 1000:9.1f} {row['cpu'] * 1000:9.1f} "
+              f"{row['max'] * 1000:8.1f}  {format_counts(row['counts'])}", file=out)
+    if pages:
+        table = page_table(runs)
+        stages = sorted({name for per_page in table.values() for name in per_page})
+        print(file=out)
+        print(f"{'script':22} {'page':>4} " + ' '.join(f'{name[:14]:>14}' for name in stages), file=out)
+        for (script, page), per_page in sorted(table.items()):
+            print(f"{script:22} {page:4} " + ' '.join(f'{per_page.get(name, 0) * 1000:14.1f}' for name in stages), file=out)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Summarise a stage-timing profile.')
+    parser.add_argument('path', nargs='?', default=_path or DEFAULT_PATH)
+    parser.add_argument('--pages', action='store_true', help='also show per-page timings')
+    args = parser.parse_args()
+    print_summary(load(args.path), pages=args.pages)
@@ -0,0 +1,173 @@
+import json
+import re
+
+# Streaming reader for prog.json and the data/EMACI_2026_Torun_Backup_*.json
+# snapshots. Instead of json.load-ing the whole meeting, it walks the document
+# with a small buffer and decodes one competitor, event or unit at a time, so
+# memory stays at roughly the size of the largest single record no matter how
+# many results have been filled in.
+#
+#   for kind, record in walk('prog.json'):
+#       kind is 'meeting' (record = (key, value) for small top-level fields),
+#       'competitor', 'unit' or 'event' (the event without its units; its
+#       units are yielded before it, and each carries its own eventId)
+
+CHUNK_SIZE = 1 << 16
+_WHITESPACE = re.compile(r'[ \t\r\n]*')
+
+class JsonStream:
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.base = 0  # document offset of buf[0]
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _more(self, size=None):
+        if self.eof:
+            return False
+        chunk = self.f.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what has been consumed so the buffer only holds the record in hand
+        self.base += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._more():
+                raise ValueError('unexpected end of JSON document')
+
+    def take(self, ch):
+        if self.peek() != ch:
+            raise ValueError(f'expected {ch!r} at offset {self.offset()}, got {self.buf[self.pos]!r}')
+        self.pos += 1
+
+    def value(self):
+        # Decode the next complete value. If the buffer ends mid-value, read
+        # a larger chunk each retry so a big record costs O(size), not O(size^2).
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._more(size):
+                    raise
+                size *= 2
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._more(size):
+                continue
+            self.pos = end
+            return value
+
+    def offset(self):
+        return self.base + self.pos
+
+    def items(self):
+        # Yields once per array element; the caller reads it with value(),
+        # skip(), items() or keys() before asking for the next one.
+        self.take('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            start = self.offset()
+            yield
+            if self.offset() == start:
+                self.skip()
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.take(']')
+                return
+
+    def keys(self):
+        # Like items(), for objects: yields each key with the reader positioned at its value
+        self.take('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.take(':')
+            start = self.offset()
+            yield key
+            if self.offset() == start:
+                self.skip()
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.take('}')
+                return
+
+    def skip(self):
+        # Containers are skipped one member at a time, so skipping costs no
+        # more memory than the largest member
+        ch = self.peek()
+        if ch == '[':
+            for _ in self.items():
+                self.value()
+        elif ch == '{':
+            for _ in self.keys():
+                self.value()
+        else:
+            self.value()
+
+def _walk_event(stream, want):
+    event = {}
+    for key in stream.keys():
+        if key == 'units':
+            if 'unit' in want:
+                for _ in stream.items():
+                    yield 'unit', stream.value()
+            else:
+                stream.skip()
+        elif 'event' in want:
+            event[key] = stream.value()
+        else:
+            stream.skip()
+    if 'event' in want:
+        yield 'event', event
+
+def walk(path, want=('meeting', 'competitor', 'event', 'unit'), chunk_size=CHUNK_SIZE):
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = JsonStream(f, chunk_size)
+        for key in stream.keys():
+            if key == 'competitors':
+                if 'competitor' in want:
+                    for _ in stream.items():
+                        yield 'competitor', stream.value()
+                else:
+                    stream.skip()
+            elif key == 'events':
+                if 'event' in want or 'unit' in want:
+                    for _ in stream.items():
+                        yield from _walk_event(stream, want)
+                else:
+                    stream.skip()
+            elif 'meeting' in want:
+                yield 'meeting', (key, stream.value())
+            else:
+                stream.skip()
+
+def iter_competitors(path):
+    for kind, competitor in walk(path, want=('competitor',)):
+        yield competitor
+
+def iter_events(path):
+    for kind, event in walk(path, want=('event',)):
+        yield event
+
+def iter_units(path):
+    for kind, unit in walk(path, want=('unit',)):
+        yield unit
@@ -0,0 +1,332 @@
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import time
+from email.utils import formatdate
+from urllib.parse import parse_qs, urlsplit
+
+from common import content_hash
+from compact_schedule import decode, expand
+from conflicts import DEFAULT_SESSION_MINUTES, SESSION_MINUTES, minute_of, rows_by_group
+
+# Local JSON API over the built schedule (schedule_compact.json) and
+# prog.json, answering the questions the page can only answer with both
+# bundles loaded:
+#
+#   GET /event?code=LJ&group=W65       sessions of an event for a gender/age group
+#                                      (or gender=F&age=V65)
+#   GET /at?day=3&time=14:00           sessions running at that moment and who is in them
+#   GET /team?id=GER                   a team's competitors and their sessions
+#   GET /athlete?bib=_00TR             one competitor and their sessions
+#   GET /status                        artifact version and index sizes
+#
+# A Snapshot holds every index (event/gender/age, day and time bucket, team,
+# bib), built once per artifact version. Each response body is cached per
+# snapshot with its gzip encoding and an ETag, so a repeated query is a dict
+# lookup and If-None-Match gets a 304. The artifacts are polled; when a
+# rebuild replaces them, a new snapshot is built off the event loop and
+# swapped in, and in-flight requests finish on the old one.
+#
+# Single process, asyncio streams and the standard library only.
+
+DEFAULT_PORT = 8026
+POLL_SECONDS = 1.0
+BUCKET_MINUTES = 15
+CACHE_LIMIT = 4096
+GZIP_MIN_BYTES = 512
+MAX_HEADER_BYTES = 16 * 1024
+GROUP_GENDERS = {'W': 'F', 'F': 'F', 'M': 'M', 'X': 'X'}
+
+class QueryError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def format_minute(minute):
+    return f"{minute % 1440 // 60:02d}:{minute % 60:02d}"
+
+def parse_group(params):
+    # group=W65 / M50, or gender=F&age=V65 (age also as plain 65)
+    group = params.get('group')
+    if group:
+        gender, digits = group[:1].upper(), group[1:]
+    else:
+        gender, digits = (params.get('gender') or '').upper(), (params.get('age') or '').upper().lstrip('V')
+    if gender not in GROUP_GENDERS or not digits.isdigit():
+        raise QueryError(400, 'expected group=W65 or gender=F&age=V65')
+    return GROUP_GENDERS[gender], f'V{int(digits)}'
+
+class Snapshot:
+    def __init__(self, slots, competitors, teams, version):
+        self.version = version
+        rows = expand(slots)
+        self.by_group = rows_by_group(rows)
+
+        # (day, bucket) -> sessions that are running at some point in that bucket
+        self.by_bucket = {}
+        for row in rows:
+            if not row['time']:
+                continue
+            start = minute_of(row['day'], row['time'])
+            end = start + SESSION_MINUTES.get(row['eventCode'], DEFAULT_SESSION_MINUTES)
+            session = (start, end, row)
+            for bucket in range(start // BUCKET_MINUTES, (end - 1) // BUCKET_MINUTES + 1):
+                self.by_bucket.setdefault(bucket, []).append(session)
+
+        self.by_bib = {}
+        self.by_team = {}
+        self.entrants = {}
+        for athlete in competitors:
+            bib = athlete['competitorId']
+            self.by_bib[bib] = {
+                'bib': bib,
+                'firstName': athlete['firstName'],
+                'lastName': athlete['lastName'],
+                'gender': athlete['gender'],
+                'ageGroup': athlete['ageGroup'],
+                'teamId': athlete.get('teamId'),
+                'teamName': athlete.get('teamName'),
+                'events': [e['eventCode'] for e in athlete.get('eventsEntered') or []]
+            }
+            self.by_team.setdefault(athlete.get('teamId'), []).append(bib)
+            for code in self.by_bib[bib]['events']:
+                self.entrants.setdefault((code, athlete['gender'], athlete['ageGroup']), []).append(bib)
+        self.teams = teams
+
+    @classmethod
+    def load(cls, schedule_path, prog_path):
+        with open(schedule_path, 'rb') as f:
+            schedule = f.read()
+        with open(prog_path, 'rb') as f:
+            prog = f.read()
+        version = content_hash(content_hash(schedule.decode('utf-8')) + content_hash(prog.decode('utf-8')))
+        meeting = json.loads(prog)
+        teams = {t['teamId']: t['teamName'] for t in meeting.get('teams') or []}
+        return cls(decode(json.loads(schedule)), meeting['competitors'], teams, version)
+
+    def summary(self, athlete):
+        return {k: athlete[k] for k in ('bib', 'firstName', 'lastName', 'ageGroup', 'teamId')}
+
+    def sessions_of(self, athlete):
+        sessions = []
+        for code in athlete['events']:
+            rows = self.by_group.get((code, athlete['gender'], athlete['ageGroup']))
+            if not rows:
+                sessions.append({'eventCode': code, 'day': None, 'time': None, 'desc': None})
+            sessions.extend(rows or ())
+        return sorted(sessions, key=lambda r: (r['day'] is None, r['day'] or 0, r['time'] or ''))
+
+    def event(self, params):
+        code = params.get('code')
+        if not code:
+            raise QueryError(400, 'missing code')
+        gender, age_group = parse_group(params)
+        rows = self.by_group.get((code, gender, age_group), [])
+        entrants = self.entrants.get((code, gender, age_group), [])
+        if not rows and not entrants:
+            raise QueryError(404, f'no {code} sessions or entries for {gender} {age_group}')
+        return {'eventCode': code, 'gender': gender, 'ageGroup': age_group, 'sessions': rows, 'entrants': len(entrants)}
+
+    def at(self, params):
+        try:
+            day = int(params.get('day', ''))
+            hours, minutes = (int(x) for x in params.get('time', '').split(':'))
+        except ValueError:
+            raise QueryError(400, 'expected day=3&time=14:00')
+        if day < 1 or not (0 <= hours < 24 and 0 <= minutes < 60):
+            raise QueryError(400, 'expected a day from 1 and a time from 00:00 to 23:59')
+        minute = minute_of(day, f'{hours}:{minutes}')
+        sessions = []
+        for start, end, row in self.by_bucket.get(minute // BUCKET_MINUTES, ()):
+            if start <= minute < end:
+                bibs = self.entrants.get((row['eventCode'], row['gender'], row['ageGroup']), [])
+                sessions.append({**row, 'end': format_minute(end), 'competitors': [self.summary(self.by_bib[b]) for b in bibs]})
+        sessions.sort(key=lambda s: (s['time'], s['eventCode'], s['gender'], s['ageGroup']))
+        return {'day': day, 'time': format_minute(minute), 'sessions': sessions,
+                'competitors': sum(len(s['competitors']) for s in sessions)}
+
+    def team(self, params):
+        team_id = params.get('id')
+        if not team_id:
+            raise QueryError(400, 'missing id')
+        if team_id not in self.by_team:
+            raise QueryError(404, f'unknown team {team_id}')
+        athletes = [self.by_bib[b] for b in self.by_team[team_id]]
+        return {'teamId': team_id, 'teamName': self.teams.get(team_id),
+                'competitors': [{**a, 'sessions': self.sessions_of(a)} for a in athletes]}
+
+    def athlete(self, params):
+        if not params.get('bib'):
+            raise QueryError(400, 'missing bib')
+        athlete = self.by_bib.get(params.get('bib'))
+        if athlete is None:
+            raise QueryError(404, f"unknown bib {params.get('bib')}")
+        return {**athlete, 'sessions': self.sessions_of(athlete)}
+
+    def status(self, params):
+        return {'version': self.version, 'groups': len(self.by_group), 'competitors': len(self.by_bib),
+                'teams': len(self.by_team), 'buckets': len(self.by_bucket)}
+
+ROUTES = {
+    '/event': Snapshot.event,
+    '/at': Snapshot.at,
+    '/team': Snapshot.team,
+    '/athlete': Snapshot.athlete,
+    '/status': Snapshot.status
+}
+
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           431: 'Request Header Fields Too Large', 500: 'Internal Server Error'}
+
+def file_signature(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+class QueryService:
+    def __init__(self, schedule_path='schedule_compact.json', prog_path='prog.json'):
+        self.paths = (schedule_path, prog_path)
+        self.signature = tuple(file_signature(p) for p in self.paths)
+        self.snapshot = Snapshot.load(*self.paths)
+        self.cache = {}
+        self.requests = 0
+
+    def response(self, target):
+        # (status, body, gzipped body or None, etag) for a request target, cached per snapshot
+        cached = self.cache.get(target)
+        if cached is not None:
+            return cached
+        snapshot = self.snapshot
+        url = urlsplit(target)
+        handler = ROUTES.get(url.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        try:
+            if handler is None:
+                raise QueryError(404, f'unknown path {url.path}')
+            status, doc = 200, handler(snapshot, params)
+        except QueryError as e:
+            status, doc = e.status, {'error': str(e)}
+        body = json.dumps(doc, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        gzipped = gzip.compress(body, 6) if len(body) >= GZIP_MIN_BYTES else None
+        etag = f'"{snapshot.version}-{content_hash(body.decode("utf-8"))}"'
+        cached = (status, body, gzipped, etag)
+        if snapshot is self.snapshot:
+            if len(self.cache) >= CACHE_LIMIT:
+                self.cache.clear()
+            self.cache[target] = cached
+        return cached
+
+    def render(self, method, target, headers):
+        if method not in ('GET', 'HEAD'):
+            return 405, [('Allow', 'GET, HEAD')], b''
+        status, body, gzipped, etag = self.response(target)
+        encoded = gzipped is not None and 'gzip' in headers.get('accept-encoding', '')
+        if encoded:
+            # Each encoding is its own representation, so it gets its own tag
+            etag = etag[:-1] + '-gz"'
+        extra = [('ETag', etag), ('Cache-Control', 'no-cache'), ('Vary', 'Accept-Encoding'),
+                 ('Content-Type', 'application/json; charset=utf-8')]
+        if status == 200 and etag in [t.strip() for t in headers.get('if-none-match', '').split(',')]:
+            return 304, extra[:3], b''
+        if encoded:
+            extra.append(('Content-Encoding', 'gzip'))
+            body = gzipped
+        return status, extra, b'' if method == 'HEAD' else body
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(b'HTTP/1.1 431 Request Header Fields Too Large\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ')
+                except ValueError:
+                    writer.write(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(':')
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get('content-length', '0'))
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    writer.write(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+                    break
+                if length:
+                    await reader.readexactly(length)
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+                try:
+                    status, extra, body = self.render(method, target, headers)
+                except Exception as e:
+                    status, extra, body = 500, [('Content-Type', 'application/json; charset=utf-8')], json.dumps({'error': repr(e)}).encode()
+                self.requests += 1
+
+                out = [f'HTTP/1.1 {status} {REASONS[status]}', f'Date: {formatdate(usegmt=True)}', f'Content-Length: {len(body)}']
+                out += [f'{name}: {value}' for name, value in extra]
+                if not keep_alive:
+                    out.append('Connection: close')
+                writer.write(('\r\n'.join(out) + '\r\n\r\n').encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def watch_artifacts(self, interval=POLL_SECONDS):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                signature = tuple(file_signature(p) for p in self.paths)
+            except FileNotFoundError:
+                continue
+            if signature == self.signature:
+                continue
+            start = time.perf_counter()
+            try:
+                snapshot = await loop.run_in_executor(None, Snapshot.load, *self.paths)
+            except (OSError, ValueError) as e:
+                print(f"reload failed, still serving {self.snapshot.version}: {e}", flush=True)
+                continue
+            self.signature = signature
+            if snapshot.version != self.snapshot.version:
+                self.snapshot, self.cache = snapshot, {}
+                print(f"swapped in {snapshot.version} ({(time.perf_counter() - start) * 1000:.0f} ms)", flush=True)
+
+    async def serve(self, host, port, interval=POLL_SECONDS):
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES, backlog=1024)
+        print(f"serving {self.snapshot.version} on http://{host}:{port}", flush=True)
+        async with server:
+            watcher = asyncio.create_task(self.watch_artifacts(interval))
+            try:
+                await server.serve_forever()
+            finally:
+                watcher.cancel()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve schedule and competitor queries as a local JSON API.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--schedule', default='schedule_compact.json')
+    parser.add_argument('--prog', default='prog.json')
+    parser.add_argument('--interval', type=float, default=POLL_SECONDS, help='seconds between checks for rebuilt artifacts')
+    args = parser.parse_args()
+
+    service = QueryService(args.schedule, args.prog)
+    try:
+        asyncio.run(service.serve(args.host, args.port, args.interval))
+    except KeyboardInterrupt:
+        pass
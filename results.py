@@ -0,0 +1,351 @@
+import argparse
+import json
+import os
+import time
+
+import profiling
+from common import HIGHER_IS_BETTER, content_hash, parse_mark, write_atomic
+from prog_stream import walk
+
+# Incremental results ingestion for the meet. The store is loaded once from
+# prog.json, then takes unit updates (a unit as it appears in
+# events[].units[], carrying eventId, round, heat, results and trials) one at
+# a time:
+#
+#   units     (eventId, round, heat) -> normalised unit
+#   entries   competitorId -> unit keys
+#   best      (eventId, ageGroup) -> competitorId -> (round, result row)
+#             (best_group: (eventId, competitorId) -> the group they are in)
+#   rankings  (eventId, ageGroup) -> ranked competitors
+#
+# An update that changes nothing is dropped after one comparison. Otherwise
+# only the best marks of the competitors in that unit are recomputed (from
+# their own few units), only their age groups are re-ranked, and flush()
+# writes only the unit and ranking files whose content changed, under
+# src/results:
+#
+#   units/<eventId>-r<round>-h<heat>.json
+#   rankings/<eventId>-<ageGroup>.json
+#   manifest.json   file, hash and status/count of each
+#
+# Results are read the way the timing feed writes them: bib, place,
+# performance and status per result, with field trials either nested in the
+# result or listed in the unit's trials with their bib. A competitor's
+# ranking uses the latest round they reached, then their best mark there.
+
+RESULTS_DIR = 'src/results'
+RESULTS_VERSION = 1
+
+def unit_key(unit):
+    return unit['eventId'], unit['round'], unit['heat']
+
+def unit_name(key):
+    event_id, round_num, heat = key
+    return f"{event_id}-r{round_num}-h{heat}"
+
+def better(event_code, a, b):
+    return a > b if event_code in HIGHER_IS_BETTER else a < b
+
+def normalise_unit(unit):
+    event_code = unit.get('eventCode')
+    trials = {}
+    for trial in unit.get('trials') or []:
+        trials.setdefault(trial.get('bib'), []).append(trial)
+
+    rows = {}
+    for result in unit.get('results') or []:
+        bib = result.get('bib')
+        attempts = sorted(result.get('trials') or trials.get(bib, []), key=lambda t: t.get('attempt') or 0)
+        performance = result.get('performance')
+        mark = parse_mark(performance) if result.get('status', 'OK') == 'OK' else None
+        if mark is None and performance is None:
+            # Field events in progress: best valid trial so far
+            for t in attempts:
+                value = parse_mark(t.get('performance')) if t.get('valid', True) else None
+                if value is not None and (mark is None or better(event_code, value, mark)):
+                    mark, performance = value, t['performance']
+        rows[bib] = {
+            'bib': bib,
+            'place': result.get('place'),
+            'performance': performance,
+            'status': result.get('status', 'OK'),
+            'mark': mark,
+            'trials': [t.get('performance') if t.get('valid', True) else 'X' for t in attempts]
+        }
+    return {
+        'eventId': unit['eventId'],
+        'eventCode': event_code,
+        'round': unit['round'],
+        'heat': unit['heat'],
+        'roundName': unit.get('roundName'),
+        'heatName': unit.get('heatName'),
+        'status': unit.get('resultsStatus'),
+        'rows': rows
+    }
+
+class ResultsStore:
+    def __init__(self, results_dir=RESULTS_DIR):
+        self.results_dir = results_dir
+        self.competitors = {}
+        self.events = {}
+        self.units = {}
+        self.by_competitor = {}
+        self.best = {}
+        self.best_group = {}
+        self.rankings = {}
+        self.dirty_units = set()
+        self.dirty_rankings = set()
+        self.stale_units = set()
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self):
+        try:
+            with open(os.path.join(self.results_dir, 'manifest.json'), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'version': RESULTS_VERSION, 'units': {}, 'rankings': {}}
+
+    def load_meeting(self, prog_path):
+        # One streaming pass; units already in the store are only rewritten if they changed
+        with profiling.stage('load_meeting') as s:
+            changed = 0
+            seen = set()
+            for kind, record in walk(prog_path, want=('competitor', 'event', 'unit')):
+                if kind == 'competitor':
+                    self.update_competitor(record)
+                elif kind == 'event':
+                    self.events[record['eventId']] = {'eventCode': record['eventCode'], 'name': record['name']}
+                else:
+                    seen.add(unit_key(record))
+                    changed += self.apply_unit(record)
+            # Units an earlier snapshot had but this one dropped
+            for key in self.units.keys() - seen:
+                changed += self.drop_unit(key)
+            # Files from an earlier run that this meeting no longer backs
+            self.stale_units = set(self.manifest['units']) - {unit_name(key) for key in self.units}
+            # and rankings left without marks
+            self.dirty_rankings.update(group for group in (tuple(name.rsplit('-', 1)) for name in self.manifest['rankings'])
+                                       if not self.best.get(group))
+            s.count(competitors=len(self.competitors), units=len(self.units), changed=changed)
+        return changed
+
+    def update_competitor(self, record):
+        bib = record['competitorId']
+        athlete = {
+            'firstName': record['firstName'],
+            'lastName': record['lastName'],
+            'ageGroup': record['ageGroup'],
+            'gender': record['gender'],
+            'teamName': record.get('teamName')
+        }
+        old = self.competitors.get(bib)
+        self.competitors[bib] = athlete
+        if old is None or old == athlete:
+            return
+        # Their rankings show the new name or team, or move to the new age group
+        for event_id in {key[0] for key in self.by_competitor.get(bib, ())}:
+            self._update_best(event_id, bib)
+            group = self.best_group.get((event_id, bib))
+            if group:
+                self.dirty_rankings.add(group)
+
+    def apply_unit(self, unit):
+        key = unit_key(unit)
+        new = normalise_unit(unit)
+        old = self.units.get(key)
+        if old == new:
+            return False
+
+        self.units[key] = new
+        self.dirty_units.add(key)
+        before = old['rows'] if old else {}
+        for bib in before.keys() - new['rows'].keys():
+            self.by_competitor.get(bib, set()).discard(key)
+        for bib in new['rows']:
+            self.by_competitor.setdefault(bib, set()).add(key)
+        for bib in before.keys() | new['rows'].keys():
+            self._update_best(key[0], bib)
+        return True
+
+    def drop_unit(self, key):
+        unit = self.units.pop(key)
+        self.dirty_units.discard(key)
+        for bib in unit['rows']:
+            self.by_competitor.get(bib, set()).discard(key)
+            self._update_best(key[0], bib)
+        return True
+
+    def _update_best(self, event_id, bib):
+        athlete = self.competitors.get(bib)
+        if not athlete:
+            return  # relay teams and unknown bibs are not ranked
+        best = None
+        for key in self.by_competitor.get(bib, ()):
+            if key[0] != event_id:
+                continue
+            unit = self.units[key]
+            row = unit['rows'][bib]
+            if row['mark'] is None:
+                continue
+            # Units stream before their event record, so the code comes from the unit
+            if best is None or key[1] > best[0] or (key[1] == best[0] and better(unit['eventCode'], row['mark'], best[1]['mark'])):
+                best = (key[1], row)
+
+        group = (event_id, athlete['ageGroup'])
+        previous = self.best_group.get((event_id, bib))
+        if previous and previous != group:
+            # Changed age group: leave the old ranking
+            del self.best[previous][bib]
+            del self.best_group[event_id, bib]
+            self.dirty_rankings.add(previous)
+        marks = self.best.setdefault(group, {})
+        if best != marks.get(bib):
+            if best is None:
+                del marks[bib]
+                del self.best_group[event_id, bib]
+            else:
+                marks[bib] = best
+                self.best_group[event_id, bib] = group
+            self.dirty_rankings.add(group)
+
+    def ranking(self, event_id, age_group):
+        event_code = self.events.get(event_id, {}).get('eventCode')
+        sign = -1 if event_code in HIGHER_IS_BETTER else 1
+        best = self.best.get((event_id, age_group), {})
+        ordered = sorted(best.items(), key=lambda kv: (-kv[1][0], sign * kv[1][1]['mark'], kv[0]))
+        ranked = []
+        for i, (bib, (round_num, row)) in enumerate(ordered):
+            # Equal marks in the same round share a place
+            tied = ranked and ranked[-1]['round'] == round_num and ranked[-1]['mark'] == row['mark']
+            athlete = self.competitors[bib]
+            ranked.append({
+                'place': ranked[-1]['place'] if tied else i + 1,
+                'bib': bib,
+                'firstName': athlete['firstName'],
+                'lastName': athlete['lastName'],
+                'teamName': athlete['teamName'],
+                'round': round_num,
+                'performance': row['performance'],
+                'mark': row['mark']
+            })
+        return ranked
+
+    def _write(self, section, name, path, doc, extra):
+        payload = json.dumps(doc, separators=(',', ':'), ensure_ascii=False)
+        digest = content_hash(payload)
+        entry = self.manifest[section].get(name)
+        full_path = os.path.join(self.results_dir, path)
+        if entry and entry['hash'] == digest and os.path.exists(full_path):
+            return False
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        write_atomic(full_path, payload)
+        self.manifest[section][name] = {'file': path, 'hash': digest, **extra}
+        return True
+
+    def _remove(self, section, name):
+        entry = self.manifest[section].pop(name, None)
+        if entry is None:
+            return False
+        try:
+            os.remove(os.path.join(self.results_dir, entry['file']))
+        except FileNotFoundError:
+            pass
+        return True
+
+    def flush(self):
+        # Writes what changed since the last flush; returns (units, rankings) written or removed
+        with profiling.stage('flush') as s:
+            units = rankings = 0
+            for name in sorted(self.stale_units):
+                units += self._remove('units', name)
+            for key in sorted(self.dirty_units):
+                unit = self.units[key]
+                name = unit_name(key)
+                if unit['rows'] or unit['status'] not in (None, 'none'):
+                    rows = sorted(unit['rows'].values(), key=lambda r: (r['place'] is None, r['place'] or 0, r['bib']))
+                    units += self._write('units', name, f'units/{name}.json', {**unit, 'rows': rows}, {'status': unit['status']})
+                else:
+                    units += self._remove('units', name)
+
+            for event_id, age_group in sorted(self.dirty_rankings):
+                ranked = self.ranking(event_id, age_group)
+                self.rankings[event_id, age_group] = ranked
+                name = f"{event_id}-{age_group}"
+                if ranked:
+                    doc = {'eventId': event_id, **self.events.get(event_id, {}), 'ageGroup': age_group, 'ranking': ranked}
+                    rankings += self._write('rankings', name, f'rankings/{name}.json', doc, {'count': len(ranked)})
+                else:
+                    rankings += self._remove('rankings', name)
+
+            self.dirty_units.clear()
+            self.dirty_rankings.clear()
+            self.stale_units.clear()
+            if units or rankings or not os.path.exists(os.path.join(self.results_dir, 'manifest.json')):
+                for section in ('units', 'rankings'):
+                    self.manifest[section] = dict(sorted(self.manifest[section].items()))
+                os.makedirs(self.results_dir, exist_ok=True)
+                # Compact: rewritten on every flush, and indent= would bypass the C encoder
+                payload = json.dumps(self.manifest, separators=(',', ':'), ensure_ascii=False)
+                write_atomic(os.path.join(self.results_dir, 'manifest.json'), payload)
+            s.count(units=units, rankings=rankings)
+        return units, rankings
+
+def read_updates(path):
+    # A unit, a list of units, or one unit per line
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    try:
+        doc = json.loads(text)
+    except json.JSONDecodeError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    return doc if isinstance(doc, list) else [doc]
+
+def follow(path, interval):
+    # Yields batches of units appended to a JSON-lines file
+    with open(path, 'r', encoding='utf-8') as f:
+        pending = ''
+        while True:
+            chunk = f.read()
+            if not chunk:
+                time.sleep(interval)
+                continue
+            pending += chunk
+            lines = pending.split('\n')
+            pending = lines.pop()
+            batch = [json.loads(line) for line in lines if line.strip()]
+            if batch:
+                yield batch
+
+def ingest(store, batch):
+    start = time.perf_counter()
+    changed = sum(store.apply_unit(unit) for unit in batch)
+    units, rankings = store.flush()
+    elapsed = time.perf_counter() - start
+    print(f"{len(batch)} updates, {changed} changed: {units} unit and {rankings} ranking files updated ({elapsed * 1000:.1f} ms)")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Apply unit result updates and write the changed unit and ranking files.')
+    parser.add_argument('updates', nargs='*', help='files with a unit, a list of units or one unit per line')
+    parser.add_argument('--prog', default='prog.json', help='meeting to load competitors, events and current results from')
+    parser.add_argument('--dir', default=RESULTS_DIR, help='output directory')
+    parser.add_argument('--follow', action='store_true', help='keep reading units appended to the last updates file')
+    parser.add_argument('--interval', type=float, default=0.2, help='seconds between reads with --follow')
+    args = parser.parse_args()
+    if args.follow and not args.updates:
+        parser.error('--follow needs an updates file')
+
+    store = ResultsStore(args.dir)
+    start = time.perf_counter()
+    store.load_meeting(args.prog)
+    units, rankings = store.flush()
+    print(f"Loaded {len(store.competitors)} competitors and {len(store.units)} units: "
+          f"{units} unit and {rankings} ranking files updated ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    for path in args.updates[:-1] if args.follow else args.updates:
+        ingest(store, read_updates(path))
+    if args.follow:
+        try:
+            for batch in follow(args.updates[-1], args.interval):
+                ingest(store, batch)
+        except KeyboardInterrupt:
+            pass
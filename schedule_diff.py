@@ -0,0 +1,137 @@
+import argparse
+import json
+import sys
+import time
+
+import compact_schedule
+from build_schedule import build_slots
+from event_classifier import EventClassifier
+from prog_stream import iter_competitors
+
+# Which slots moved between two timetable revisions, and who is affected.
+# Either side can be a parsed timetable (parsed_timetable_v6.json), an
+# expanded schedule (schedule.json) or a compact one (schedule_compact.json).
+#
+# Rows are matched on (eventCode, gender, ageGroup, round, n), where round
+# comes from EventClassifier.round_of and n numbers rows that would otherwise
+# share a key (e.g. the two W70 race walk finals), in timetable order. Both
+# sides and the competitor join are dict lookups, so a full prog.json run is
+# one pass over the entries.
+
+def load_rows(path, classifier=None):
+    with open(path, 'r') as f:
+        doc = json.load(f)
+    if isinstance(doc, dict):
+        return compact_schedule.expand(compact_schedule.decode(doc))
+    if doc and 'eventCode' not in doc[0]:
+        return compact_schedule.expand(build_slots(doc, classifier))
+    return doc
+
+def keyed(rows, classifier):
+    seen = {}
+    table = {}
+    for row in rows:
+        base = (row['eventCode'], row['gender'], row['ageGroup'], classifier.round_of(row['desc']))
+        n = seen.get(base, 0)
+        seen[base] = n + 1
+        table[base + (n,)] = row
+    return table
+
+def diff(old_rows, new_rows, classifier=None):
+    classifier = classifier or EventClassifier()
+    before = keyed(old_rows, classifier)
+    after = keyed(new_rows, classifier)
+    moved = []
+    added = []
+    for key, row in after.items():
+        old = before.get(key)
+        if old is None:
+            added.append((key, row))
+        elif (old['day'], old['time']) != (row['day'], row['time']):
+            moved.append((key, old, row))
+    removed = [(key, row) for key, row in before.items() if key not in after]
+    return {'moved': moved, 'added': added, 'removed': removed}
+
+def affected_competitors(changes, competitors):
+    # (eventCode, gender, ageGroup) -> change keys, then one pass over the entries
+    by_group = {}
+    for kind in ('moved', 'removed'):
+        for change in changes[kind]:
+            by_group.setdefault(change[0][:3], []).append((kind, change[0]))
+    affected = []
+    for athlete in competitors:
+        for event in athlete.get('eventsEntered') or []:
+            hits = by_group.get((event['eventCode'], athlete['gender'], athlete['ageGroup']))
+            if not hits:
+                continue
+            for kind, key in hits:
+                affected.append({
+                    'competitorId': athlete['competitorId'],
+                    'firstName': athlete['firstName'],
+                    'lastName': athlete['lastName'],
+                    'teamName': athlete.get('teamName'),
+                    'change': kind,
+                    'key': key
+                })
+    return affected
+
+def format_key(key):
+    event_code, gender, age_group, round_name, n = key
+    return f"{event_code} {gender} {age_group} {round_name}" + (f" #{n + 1}" if n else '')
+
+def format_when(row):
+    return f"day {row['day']} {row['time']}"
+
+def report(changes, affected, out=sys.stdout):
+    print(f"{len(changes['moved'])} moved, {len(changes['added'])} added, {len(changes['removed'])} removed slot rows", file=out)
+    for key, old, new in changes['moved']:
+        print(f"  moved   {format_key(key):32} {format_when(old)} -> {format_when(new)}", file=out)
+    for key, row in changes['removed']:
+        print(f"  removed {format_key(key):32} was {format_when(row)}", file=out)
+    for key, row in changes['added']:
+        print(f"  added   {format_key(key):32} {format_when(row)}", file=out)
+    if affected is None:
+        return
+
+    by_team = {}
+    for a in affected:
+        by_team.setdefault(a['teamName'] or '(no team)', []).append(a)
+    print(f"\n{len({a['competitorId'] for a in affected})} competitors affected ({len(affected)} entries)", file=out)
+    for team in sorted(by_team):
+        print(f"  {team}", file=out)
+        for a in sorted(by_team[team], key=lambda a: (a['lastName'], a['firstName'], a['key'])):
+            print(f"    {a['competitorId']:>8} {a['lastName']}, {a['firstName']}: {a['change']} {format_key(a['key'])}", file=out)
+
+def to_json(changes, affected):
+    def slot(key, row):
+        return {'key': list(key), 'day': row['day'], 'time': row['time'], 'desc': row['desc']}
+    return {
+        'moved': [{'key': list(key), 'from': [old['day'], old['time']], 'to': [new['day'], new['time']], 'desc': new['desc']}
+                  for key, old, new in changes['moved']],
+        'added': [slot(key, row) for key, row in changes['added']],
+        'removed': [slot(key, row) for key, row in changes['removed']],
+        'affected': [{**a, 'key': list(a['key'])} for a in affected or []]
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Report slots that moved between two timetable revisions and the competitors they affect.')
+    parser.add_argument('old', help='parsed timetable, schedule.json or schedule_compact.json')
+    parser.add_argument('new', help='parsed timetable, schedule.json or schedule_compact.json')
+    parser.add_argument('--prog', default='prog.json', help='competitor data to join against')
+    parser.add_argument('--no-competitors', action='store_true', help='only report the slots')
+    parser.add_argument('--json', metavar='PATH', help='also write the report as JSON')
+    args = parser.parse_args()
+
+    classifier = EventClassifier()
+    old_rows = load_rows(args.old, classifier)
+    new_rows = load_rows(args.new, classifier)
+    start = time.perf_counter()
+    changes = diff(old_rows, new_rows, classifier)
+    affected = None if args.no_competitors else affected_competitors(changes, iter_competitors(args.prog))
+    elapsed = time.perf_counter() - start
+
+    report(changes, affected)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(to_json(changes, affected), f, indent=2)
+    print(f"\n({elapsed * 1000:.1f} ms)", file=sys.stderr)
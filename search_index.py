@@ -0,0 +1,147 @@
+import argparse
+import bisect
+import json
+import re
+import unicodedata
+
+import profiling
+from common import bust_cache, content_hash, delta_decode, delta_encode, write_js
+from prog_stream import iter_competitors, walk
+
+# Offline athlete search for the page, written to src/js/search.js. Names
+# are lowercased, decomposed and stripped of diacritics (plus the FOLD table
+# for letters that do not decompose, e.g. Polish ł), split into words, and
+# each word padded with spaces and cut into trigrams. The index maps every
+# trigram to the sorted ids of the athletes whose name contains it:
+#
+#   {"version": 1, "fold": {...}, "teams": {teamId: teamName},
+#    "bib": [bib of each id, null once removed], "grams": {" ko": [delta-encoded ids], ...}}
+#
+# The page scores athletes by the share of trigrams they have in common with
+# the query, so misspellings and missing accents still match, takes bibs and
+# team codes or names as exact filters, and reads names, team and age group
+# from data.js by bib rather than shipping them twice.
+#
+# A rebuild reads the previous index back. New competitors are appended,
+# renamed ones move between trigram lists under the same id, and removed
+# ones leave a null bib behind; once a COMPACT_RATIO share of ids is null the
+# index is rebuilt from scratch.
+
+SEARCH_VERSION = 1
+SEARCH_PATH = 'src/js/search.js'
+VAR_NAME = 'emacs2026Search'
+FOLD = {'ł': 'l', 'ø': 'o', 'đ': 'd', 'ð': 'd', 'ħ': 'h', 'ı': 'i', 'ß': 'ss', 'æ': 'ae', 'œ': 'oe', 'þ': 'th'}
+COMPACT_RATIO = 0.2
+WORD_PATTERN = re.compile(r'[^\W_]+')
+
+def fold(text):
+    # Same steps as foldText() in app.js: lowercase, NFKD, drop marks, FOLD
+    text = unicodedata.normalize('NFKD', (text or '').lower())
+    return ''.join(FOLD.get(ch, ch) for ch in text if not unicodedata.category(ch).startswith('M'))
+
+def words(text):
+    return WORD_PATTERN.findall(fold(text))
+
+def trigrams(word):
+    padded = f' {word} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def name_grams(athlete):
+    grams = set()
+    for word in words(f"{athlete['firstName']} {athlete['lastName']}"):
+        grams |= trigrams(word)
+    return grams
+
+def empty_index():
+    return {'version': SEARCH_VERSION, 'fold': FOLD, 'teams': {}, 'bib': [], 'grams': {}}
+
+def load_index(path=SEARCH_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except FileNotFoundError:
+        return None
+    index = json.loads(text[text.index('=') + 1:].rstrip().rstrip(';'))
+    if index.get('version') != SEARCH_VERSION or index.get('fold') != FOLD:
+        return None
+    index['grams'] = {gram: delta_decode(ids) for gram, ids in index['grams'].items()}
+    return index
+
+def update_index(index, competitors, teams):
+    # Returns (added, renamed, removed) counts; index is updated in place
+    bibs = index['bib']
+    grams = index['grams']
+    ids = {bib: i for i, bib in enumerate(bibs) if bib is not None}
+    current = {}
+    for gram, members in grams.items():
+        for i in members:
+            current.setdefault(i, set()).add(gram)
+
+    added = renamed = 0
+    seen = set()
+    for athlete in competitors:
+        bib = athlete['competitorId']
+        seen.add(bib)
+        wanted = name_grams(athlete)
+        athlete_id = ids.get(bib)
+        if athlete_id is None:
+            athlete_id = ids[bib] = len(bibs)
+            bibs.append(bib)
+            added += 1
+            for gram in wanted:
+                # New ids are the largest so far, so the lists stay sorted
+                grams.setdefault(gram, []).append(athlete_id)
+            continue
+        have = current.get(athlete_id, set())
+        if have == wanted:
+            continue
+        renamed += 1
+        for gram in have - wanted:
+            grams[gram].remove(athlete_id)
+        for gram in wanted - have:
+            bisect.insort(grams.setdefault(gram, []), athlete_id)
+
+    removed = [i for bib, i in ids.items() if bib not in seen]
+    for i in removed:
+        bibs[i] = None
+        for gram in current.get(i, ()):
+            grams[gram].remove(i)
+    for gram in [g for g, members in grams.items() if not members]:
+        del grams[gram]
+    index['teams'] = teams
+    return added, renamed, len(removed)
+
+def build_index(prog_path, previous=None):
+    # Returns (index, how, counts) where how is 'full' or 'incremental'
+    teams = {}
+    for kind, (key, value) in walk(prog_path, want=('meeting',)):
+        if key == 'teams':
+            teams = {t['teamId']: t['teamName'] for t in value}
+    if previous is not None:
+        counts = update_index(previous, iter_competitors(prog_path), teams)
+        if previous['bib'].count(None) <= COMPACT_RATIO * len(previous['bib']):
+            return previous, 'incremental', counts
+    index = empty_index()
+    counts = update_index(index, iter_competitors(prog_path), teams)
+    return index, 'full', counts
+
+def write_index(prog_path='prog.json', path=SEARCH_PATH, full=False):
+    with profiling.stage('search_index') as s:
+        index, how, counts = build_index(prog_path, None if full else load_index(path))
+        grams = {gram: delta_encode(ids) for gram, ids in sorted(index['grams'].items())}
+        payload = json.dumps({**index, 'grams': grams}, separators=(',', ':'), ensure_ascii=False)
+        write_js(path, VAR_NAME, payload)
+        bust_cache('index.html', path, content_hash(payload))
+        s.count(athletes=len(index['bib']), grams=len(grams), bytes=len(payload))
+    return index, how, counts, payload
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write the offline athlete search index, src/js/search.js.')
+    parser.add_argument('--prog', default='prog.json')
+    parser.add_argument('--full', action='store_true', help='rebuild from scratch instead of updating the previous index')
+    args = parser.parse_args()
+
+    index, how, (added, renamed, removed), payload = write_index(args.prog, full=args.full)
+    live = len(index['bib']) - index['bib'].count(None)
+    print(f"Search index ({how}): {live} athletes, {len(index['grams'])} trigrams, "
+          f"{added} added, {renamed} renamed, {removed} removed ({len(payload) // 1024} KB).")
@@ -0,0 +1,262 @@
+import argparse
+import bisect
+import json
+import math
+import random
+import sys
+import time
+
+import profiling
+from common import HIGHER_IS_BETTER, parse_mark, write_atomic
+from prog_stream import walk
+
+# Heat and flight allocation for every (event, gender, age group) from the
+# entries' qp marks. Each entry's qp is parsed once into a seed key (seconds
+# ascending, metres and points descending, no mark or a "0.00" placeholder
+# last, bib as tiebreak) and kept in a list sorted by that key, so a group
+# never needs sorting again: late entries are inserted with bisect and
+# scratches are removed in place, and only the groups they touch are marked
+# dirty and re-allocated by the next seed().
+#
+# A group is split into units of at most its unit size, as evenly as
+# possible, with any extra places in the later units:
+#
+#   lane races   heats of `lanes`, best seeds in the centre lanes (lane_draw)
+#   mass starts  heats of MASS_START_SIZE, or one race when it is None
+#   field        flights of FLIGHT_SIZE, ordered within a flight by poolOrder
+#
+# The event's seedingMethod says which seeds go into which unit (see
+# SEEDING_METHODS); an unknown method falls back to DEFAULT_METHOD.
+
+SEEDING_VERSION = 1
+SEEDING_PATH = 'seeding.json'
+LANE_EVENTS = {'60', '60H', '200', '400', '800', '4x200'}
+MASS_START_SIZE = {'1500': 15, '3000': 20, '3000W': 20, '5K': None, '5KW': None, 'XC': None, 'PEN': None}
+FLIGHT_SIZE = 12
+DEFAULT_LANES = 8
+DEFAULT_METHOD = 'fastest_last'
+
+def seed_key(event_code, qp, bib):
+    mark = parse_mark(qp)
+    if mark is None or mark <= 0:
+        # No mark, or a "0.00" placeholder
+        return (1, 0, bib)
+    return (0, -mark if event_code in HIGHER_IS_BETTER else mark, bib)
+
+def unit_sizes(count, size):
+    if not size or count <= size:
+        return [count]
+    units = math.ceil(count / size)
+    base, extra = divmod(count, units)
+    return [base] * (units - extra) + [base + 1] * extra
+
+def fastest_last(seeds, sizes):
+    # Best seeds fill the last unit, the next best the one before, ...
+    units = []
+    start = 0
+    for size in reversed(sizes):
+        units.append(seeds[start:start + size])
+        start += size
+    return units[::-1]
+
+def fastest_first(seeds, sizes):
+    units = []
+    start = 0
+    for size in sizes:
+        units.append(seeds[start:start + size])
+        start += size
+    return units
+
+def serpentine(seeds, sizes):
+    # Seeds snake across the units (1-2-3-3-2-1 ...), skipping full ones
+    units = [[] for _ in sizes]
+    order = list(range(len(sizes)))
+    i = 0
+    for seed in seeds:
+        while True:
+            lap, pos = divmod(i, len(order))
+            unit = order[pos] if lap % 2 == 0 else order[-1 - pos]
+            i += 1
+            if len(units[unit]) < sizes[unit]:
+                units[unit].append(seed)
+                break
+    return units
+
+SEEDING_METHODS = {
+    'fastest_last': fastest_last,
+    'fastest_first': fastest_first,
+    'serpentine': serpentine
+}
+
+def lane_draw(lanes):
+    # Lanes in seed order, centre out: 8 lanes -> 4 5 3 6 2 7 1 8
+    centre = (lanes + 1) // 2
+    order = [centre]
+    for step in range(1, lanes):
+        lane = centre + (step + 1) // 2 if step % 2 else centre - step // 2
+        order.append(lane)
+    return order
+
+def pool_order(order, flight, rng):
+    # Competition order within a flight; flight is best seed first
+    if order == 'random':
+        flight = flight[:]
+        rng.shuffle(flight)
+        return flight
+    # Seeded: the best seed competes last
+    return flight[::-1]
+
+class Seeding:
+    def __init__(self, flight_size=FLIGHT_SIZE):
+        self.flight_size = flight_size
+        self.events = {}
+        self.groups = {}
+        self.entries = {}
+        self.units = {}
+        self.dirty = set()
+
+    def load_meeting(self, prog_path):
+        # Reconciles with what is already loaded, so only groups whose
+        # entries, marks or event settings changed get re-seeded
+        with profiling.stage('load_seeding') as s:
+            events = {}
+            entries = {}
+            for kind, record in walk(prog_path, want=('competitor', 'event')):
+                if kind == 'event':
+                    events[record['eventId']] = {k: record.get(k) for k in
+                                                 ('eventId', 'eventCode', 'name', 'lanes', 'seedingMethod', 'poolOrder', 'cutSurvivors')}
+                    continue
+                for entry in record.get('eventsEntered') or []:
+                    group = (entry['eventId'], record['gender'], record['ageGroup'])
+                    entries[record['competitorId'], entry['eventId']] = (group, entry.get('qp'))
+
+            for event_id, event in events.items():
+                old = self.events.get(event_id)
+                if old == event:
+                    continue
+                self.events[event_id] = event
+                for group in [g for g in self.groups if g[0] == event_id]:
+                    if old is None or old['eventCode'] != event['eventCode']:
+                        # Seeded before the event was known, or marks now compare the other way round
+                        self.groups[group] = sorted((seed_key(event['eventCode'], qp, bib), bib, qp) for key, bib, qp in self.groups[group])
+                    self.dirty.add(group)
+            for key in self.entries.keys() - entries.keys():
+                self.scratch(*key)
+            for (bib, event_id), (group, qp) in entries.items():
+                if self.entries.get((bib, event_id)) != (group, qp):
+                    self.enter(bib, group, qp)
+            s.count(entries=len(self.entries), groups=len(self.groups), dirty=len(self.dirty))
+        return len(self.dirty)
+
+    def enter(self, bib, group, qp):
+        if (bib, group[0]) in self.entries:
+            self.scratch(bib, group[0])
+        event_code = self.events.get(group[0], {}).get('eventCode')
+        bisect.insort(self.groups.setdefault(group, []), (seed_key(event_code, qp, bib), bib, qp))
+        self.entries[bib, group[0]] = (group, qp)
+        self.dirty.add(group)
+
+    def scratch(self, bib, event_id):
+        found = self.entries.pop((bib, event_id), None)
+        if found is None:
+            return False
+        group, qp = found
+        seeds = self.groups[group]
+        event_code = self.events.get(event_id, {}).get('eventCode')
+        del seeds[bisect.bisect_left(seeds, (seed_key(event_code, qp, bib), bib, qp))]
+        if not seeds:
+            del self.groups[group]
+        self.dirty.add(group)
+        return True
+
+    def allocate(self, group):
+        event = self.events.get(group[0]) or {'eventCode': None}
+        code = event['eventCode']
+        seeds = [(bib, qp) for key, bib, qp in self.groups[group]]
+        method = SEEDING_METHODS.get(event.get('seedingMethod'), SEEDING_METHODS[DEFAULT_METHOD])
+
+        if code in LANE_EVENTS:
+            kind, size = 'heat', event.get('lanes') or DEFAULT_LANES
+        elif code in HIGHER_IS_BETTER and code not in MASS_START_SIZE:
+            kind, size = 'flight', self.flight_size
+        else:
+            kind, size = 'heat', MASS_START_SIZE.get(code, FLIGHT_SIZE)
+
+        rng = random.Random('-'.join(group))
+        units = []
+        for number, unit in enumerate(method(seeds, unit_sizes(len(seeds), size)), 1):
+            if kind == 'flight':
+                athletes = [{'bib': bib, 'qp': qp, 'order': i} for i, (bib, qp) in enumerate(pool_order(event.get('poolOrder'), unit, rng), 1)]
+            elif code in LANE_EVENTS:
+                draw = lane_draw(size)
+                athletes = sorted(({'bib': bib, 'qp': qp, 'lane': draw[i]} for i, (bib, qp) in enumerate(unit)), key=lambda a: a['lane'])
+            else:
+                athletes = [{'bib': bib, 'qp': qp, 'order': i} for i, (bib, qp) in enumerate(unit, 1)]
+            units.append({kind: number, 'athletes': athletes})
+        return {
+            'eventId': group[0], 'eventCode': code, 'gender': group[1], 'ageGroup': group[2],
+            'method': event.get('seedingMethod') if event.get('seedingMethod') in SEEDING_METHODS else DEFAULT_METHOD,
+            'kind': kind, 'cutSurvivors': event.get('cutSurvivors') if kind == 'flight' else None, 'units': units
+        }
+
+    def seed(self):
+        # Re-allocates the dirty groups; returns the ones whose units changed
+        with profiling.stage('seed') as s:
+            changed = []
+            for group in sorted(self.dirty):
+                if group not in self.groups:
+                    if self.units.pop(group, None) is not None:
+                        changed.append(group)
+                    continue
+                allocation = self.allocate(group)
+                if self.units.get(group) != allocation:
+                    self.units[group] = allocation
+                    changed.append(group)
+            s.count(dirty=len(self.dirty), changed=len(changed))
+            self.dirty.clear()
+        return changed
+
+    def document(self):
+        return {'version': SEEDING_VERSION, 'groups': [self.units[g] for g in sorted(self.units)]}
+
+def write_seeding(seeding, path=SEEDING_PATH):
+    payload = json.dumps(seeding.document(), separators=(',', ':'), ensure_ascii=False)
+    write_atomic(path, payload)
+    return payload
+
+def parse_scratches(items):
+    # BIB:EVENTID
+    scratches = []
+    for item in items:
+        bib, _, event_id = item.partition(':')
+        scratches.append((bib, event_id))
+    return scratches
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Seed every event into heats and flights from the entries\' qp marks.')
+    parser.add_argument('--prog', default='prog.json')
+    parser.add_argument('--flight-size', type=int, default=FLIGHT_SIZE, help='athletes per field event flight')
+    parser.add_argument('--scratch', action='append', default=[], metavar='BIB:EVENTID', help='withdraw an entry and re-seed its group')
+    parser.add_argument('--json', metavar='PATH', help='write the allocations as JSON')
+    args = parser.parse_args()
+
+    seeding = Seeding(args.flight_size)
+    start = time.perf_counter()
+    seeding.load_meeting(args.prog)
+    loaded = time.perf_counter()
+    seeding.seed()
+    elapsed = time.perf_counter() - loaded
+    units = sum(len(g['units']) for g in seeding.units.values())
+    print(f"Seeded {len(seeding.entries)} entries in {len(seeding.units)} groups into {units} heats and flights "
+          f"({elapsed * 1000:.1f} ms, {(loaded - start) * 1000:.0f} ms to load)")
+
+    if args.scratch:
+        start = time.perf_counter()
+        missing = [f'{bib}:{event_id}' for bib, event_id in parse_scratches(args.scratch) if not seeding.scratch(bib, event_id)]
+        changed = seeding.seed()
+        print(f"Scratched {len(args.scratch) - len(missing)} entries, re-seeded {len(changed)} groups "
+              f"({(time.perf_counter() - start) * 1000:.2f} ms)")
+        if missing:
+            print(f"not entered: {', '.join(missing)}", file=sys.stderr)
+    if args.json:
+        write_seeding(seeding, args.json)
@@ -0,0 +1,205 @@
+import argparse
+import hashlib
+import json
+import os
+
+# Keyed structural diff between two prog.json snapshots, and the matching
+# patch. Competitors are matched by competitorId, events by eventId and units
+# (inside each event) by id, so a check-in or a qp edit costs one small patch
+# instead of another 4 MB snapshot.
+#
+# A delta looks like
+#   {"version": 1, "base": <hash>, "target": <hash>,
+#    "meeting": {"set": {...}, "del": [...]},
+#    "competitors": {"add": [...], "del": [...], "patch": {id: {"set": {...}, "del": [...]}}, "order": [...]},
+#    "events": {... same, and an event patch may carry "units": {... same ...}}}
+# "order" is only present when applying adds and deletes would not reproduce
+# the target's order by itself.
+#
+# With --page, both snapshots are first cut down to what the page holds
+# (page_snapshot(), app.js pageSnapshot()): competitors with the fields the
+# report reads. Such a delta carries "form": "page", and app.js applies it to
+# its data.js bundle or a restored backup, after checking the base hash.
+
+DELTA_VERSION = 1
+COLLECTIONS = {'competitors': 'competitorId', 'events': 'eventId'}
+UNIT_KEY = 'id'
+PAGE_FORM = 'page'
+
+def snapshot_hash(doc):
+    canonical = json.dumps(doc, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+def page_snapshot(doc):
+    competitors = []
+    for athlete in doc.get('competitors', []):
+        slim = {k: athlete[k] for k in ('competitorId', 'firstName', 'lastName', 'ageGroup', 'gender')}
+        if athlete.get('teamName') is not None:
+            slim['teamName'] = athlete['teamName']
+        slim['eventsEntered'] = [{'eventCode': e['eventCode'], 'qp': e.get('qp') or ''} for e in athlete.get('eventsEntered') or []]
+        competitors.append(slim)
+    return {'competitors': competitors}
+
+def diff_fields(old, new, skip=()):
+    patch = {}
+    changed = {k: v for k, v in new.items() if k not in skip and (k not in old or old[k] != v)}
+    removed = [k for k in old if k not in skip and k not in new]
+    if changed:
+        patch['set'] = changed
+    if removed:
+        patch['del'] = removed
+    return patch
+
+def diff_records(old_list, new_list, key, nested=None):
+    # nested = (field, key) diffs that field as its own keyed collection
+    old_by_key = {r[key]: r for r in old_list}
+    new_by_key = {r[key]: r for r in new_list}
+    delta = {}
+
+    added = [r for r in new_list if r[key] not in old_by_key]
+    removed = [k for k in old_by_key if k not in new_by_key]
+    patches = {}
+    for k, new in new_by_key.items():
+        old = old_by_key.get(k)
+        if old is None or old == new:
+            continue
+        skip = (nested[0],) if nested else ()
+        patch = diff_fields(old, new, skip)
+        if nested:
+            sub = diff_records(old.get(nested[0], []), new.get(nested[0], []), nested[1])
+            if sub:
+                patch[nested[0]] = sub
+        if patch:
+            patches[k] = patch
+
+    if added:
+        delta['add'] = added
+    if removed:
+        delta['del'] = removed
+    if patches:
+        delta['patch'] = patches
+
+    gone = set(removed)
+    predicted = [k for k in old_by_key if k not in gone] + [r[key] for r in added]
+    order = [r[key] for r in new_list]
+    if predicted != order:
+        delta['order'] = order
+    return delta
+
+def diff(old, new, page=False):
+    if page:
+        old, new = page_snapshot(old), page_snapshot(new)
+    delta = {'version': DELTA_VERSION, 'base': snapshot_hash(old), 'target': snapshot_hash(new)}
+    if page:
+        delta['form'] = PAGE_FORM
+    meeting = diff_fields(old, new, skip=COLLECTIONS)
+    if meeting:
+        delta['meeting'] = meeting
+    for name, key in COLLECTIONS.items():
+        nested = ('units', UNIT_KEY) if name == 'events' else None
+        sub = diff_records(old.get(name, []), new.get(name, []), key, nested)
+        if sub:
+            delta[name] = sub
+    return delta
+
+def patch_fields(record, patch):
+    for k in patch.get('del', []):
+        record.pop(k, None)
+    record.update(patch.get('set', {}))
+
+def patch_records(records, delta, key, nested=None):
+    by_key = {r[key]: r for r in records}
+    for k in delta.get('del', []):
+        if k not in by_key:
+            raise KeyError(f'delta removes {key}={k!r}, which is not in the base')
+        del by_key[k]
+    for k, patch in delta.get('patch', {}).items():
+        if k not in by_key:
+            raise KeyError(f'delta patches {key}={k!r}, which is not in the base')
+        record = dict(by_key[k])
+        patch_fields(record, patch)
+        if nested and nested[0] in patch:
+            record[nested[0]] = patch_records(record.get(nested[0], []), patch[nested[0]], nested[1])
+        by_key[k] = record
+    for record in delta.get('add', []):
+        by_key[record[key]] = record
+    order = delta.get('order') or list(by_key)
+    return [by_key[k] for k in order]
+
+def apply(base, delta, verify=True):
+    # Returns a new document; base is left untouched
+    if delta.get('version') != DELTA_VERSION:
+        raise ValueError(f"unsupported delta version {delta.get('version')!r}")
+    if delta.get('form') == PAGE_FORM:
+        base = page_snapshot(base)
+    if verify and snapshot_hash(base) != delta['base']:
+        raise ValueError('delta was computed against a different base snapshot')
+    doc = dict(base)
+    patch_fields(doc, delta.get('meeting', {}))
+    for name, key in COLLECTIONS.items():
+        if name in delta:
+            nested = ('units', UNIT_KEY) if name == 'events' else None
+            doc[name] = patch_records(base.get(name, []), delta[name], key, nested)
+    if verify and snapshot_hash(doc) != delta['target']:
+        raise ValueError('applying the delta did not reproduce the target snapshot')
+    return doc
+
+def summary(delta):
+    parts = []
+    for name in COLLECTIONS:
+        sub = delta.get(name, {})
+        counts = [f"{len(sub.get(op, []))} {op}" for op in ('add', 'del', 'patch') if sub.get(op)]
+        if counts:
+            parts.append(f"{name}: {', '.join(counts)}")
+    if 'meeting' in delta:
+        parts.append(f"meeting: {len(delta['meeting'].get('set', {})) + len(delta['meeting'].get('del', []))} fields")
+    return '; '.join(parts) or 'no changes'
+
+def load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def dump(doc, path, compact=False):
+    with open(path, 'w', encoding='utf-8') as f:
+        if compact:
+            json.dump(doc, f, separators=(',', ':'), ensure_ascii=False)
+        else:
+            json.dump(doc, f, indent=2)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Diff, patch and publish prog.json snapshot deltas.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('diff', help='write the delta from OLD to NEW')
+    p.add_argument('old')
+    p.add_argument('new')
+    p.add_argument('-o', '--output', required=True)
+    p.add_argument('--page', action='store_true', help='diff only what the page holds')
+    p = sub.add_parser('apply', help='apply DELTA to BASE')
+    p.add_argument('base')
+    p.add_argument('delta')
+    p.add_argument('-o', '--output', required=True)
+    p = sub.add_parser('publish', help='write one delta per base snapshot, named by the base hash')
+    p.add_argument('bases', nargs='+')
+    p.add_argument('--target', default='prog.json')
+    p.add_argument('--out', default='data/deltas')
+    p.add_argument('--page', action='store_true', help='diff only what the page holds')
+    args = parser.parse_args()
+
+    if args.command == 'diff':
+        delta = diff(load(args.old), load(args.new), args.page)
+        dump(delta, args.output, compact=True)
+        print(f"{summary(delta)} ({os.path.getsize(args.output)} bytes)")
+    elif args.command == 'apply':
+        dump(apply(load(args.base), load(args.delta)), args.output)
+        print(f"Wrote {args.output}")
+    elif args.command == 'publish':
+        target = load(args.target)
+        os.makedirs(args.out, exist_ok=True)
+        manifest = {'target': snapshot_hash(page_snapshot(target) if args.page else target), 'deltas': {}}
+        for base_path in args.bases:
+            delta = diff(load(base_path), target, args.page)
+            name = f"{delta['base']}.json"
+            dump(delta, os.path.join(args.out, name), compact=True)
+            manifest['deltas'][delta['base']] = name
+            print(f"{base_path}: {summary(delta)} -> {name}")
+        dump(manifest, os.path.join(args.out, 'manifest.json'))
@@ -9,7 +9,10 @@ document.addEventListener('DOMContentLoaded', () => {
     const backupBtn = document.getElementById('backup-btn');
     if (backupBtn) {
         backupBtn.addEventListener('click', () => {
-            const dataStr = JSON.stringify(emacs2026Data, null, 2);
+            // The bundle is exported as a prog.json-shaped snapshot, so a backup
+            // restores like prog.json and can be the base of a delta
+            const snapshot = emacs2026Data.eventOffsets ? pageSnapshot(emacs2026Data) : emacs2026Data;
+            const dataStr = JSON.stringify(snapshot, null, 2);
             const blob = new Blob([dataStr], { type: 'application/json' });
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
@@ -28,15 +31,20 @@ document.addEventListener('DOMContentLoaded', () => {
             if (!file) return;
 
             const reader = new FileReader();
-            reader.onload = (event) => {
+            reader.onload = async (event) => {
                 try {
-                    const newData = JSON.parse(event.target.result);
-                    if (!newData.competitors) {
+                    let newData = JSON.parse(event.target.result);
+                    // A delta from snapshot_delta.py applies on top of the data the page holds
+                    if (newData.base && newData.target && !newData.competitors) {
+                        newData = await applySnapshotDelta(emacs2026Data, newData);
+                    }
+                    if (!newData.competitors && !newData.eventOffsets) {
                         throw new Error('Invalid data format: Missing "competitors" array.');
                     }
 
                     window.emacs2026Data = newData;
                     allData = processData(newData);
+                    facetIndex = buildFacetIndex(newData, allData);
                     initializeFilters(allData);
                     renderTable(allData);
 
@@ -48,8 +56,90 @@ document.addEventListener('DOMContentLoaded', () => {
             reader.readAsText(file);
         });
     }
+
+    // Athlete search
+    const searchInput = document.getElementById('athlete-search');
+    const searchResults = document.getElementById('search-results');
+    if (searchInput && searchResults && typeof emacs2026Search !== 'undefined') {
+        searchInput.addEventListener('input', () => renderSearchResults(searchInput.value, searchResults));
+        searchResults.addEventListener('click', (e) => {
+            const item = e.target.closest('[data-bib]');
+            if (!item || e.target.closest('a')) return;
+            updateFilter('Bib', item.dataset.bib);
+            searchResults.innerHTML = '';
+        });
+    } else if (searchInput) {
+        searchInput.style.display = 'none';
+    }
 });
 
+// Mirrors snapshot_delta.apply(): competitors keyed by competitorId, events by
+// eventId and units by id. A page delta (snapshot_delta.py --page) applies to
+// pageSnapshot() of the bundle or a restored backup; a full one needs a full
+// prog.json restored first. Throws if the base or the result does not hash to
+// what the delta expects, or if it touches records the base lacks.
+async function applySnapshotDelta(data, delta) {
+    if (delta.version !== 1) throw new Error(`Unsupported delta version ${delta.version}`);
+    let base = data;
+    if (delta.form === 'page') {
+        base = pageSnapshot(data);
+    } else if (!data.competitors) {
+        throw new Error('This delta needs a full prog.json: restore one first, or publish page deltas.');
+    }
+    if (await snapshotHash(base) !== delta.base) {
+        throw new Error('This delta was made against different data than the page holds.');
+    }
+
+    const patchFields = (record, patch) => {
+        (patch.del || []).forEach(k => { delete record[k]; });
+        Object.assign(record, patch.set || {});
+    };
+
+    const patchRecords = (records, sub, key, nested) => {
+        const byKey = new Map(records.map(r => [r[key], r]));
+        (sub.del || []).forEach(k => {
+            if (!byKey.has(k)) throw new Error(`Delta removes unknown ${key} ${k}`);
+            byKey.delete(k);
+        });
+        Object.entries(sub.patch || {}).forEach(([k, patch]) => {
+            if (!byKey.has(k)) throw new Error(`Delta patches unknown ${key} ${k}`);
+            const record = { ...byKey.get(k) };
+            patchFields(record, patch);
+            if (nested && patch[nested.field]) {
+                record[nested.field] = patchRecords(record[nested.field] || [], patch[nested.field], nested.key);
+            }
+            byKey.set(k, record);
+        });
+        (sub.add || []).forEach(r => byKey.set(r[key], r));
+        const order = sub.order || [...byKey.keys()];
+        return order.map(k => byKey.get(k));
+    };
+
+    const doc = { ...base };
+    patchFields(doc, delta.meeting || {});
+    if (delta.competitors) doc.competitors = patchRecords(base.competitors || [], delta.competitors, 'competitorId');
+    if (delta.events) doc.events = patchRecords(base.events || [], delta.events, 'eventId', { field: 'units', key: 'id' });
+    if (await snapshotHash(doc) !== delta.target) {
+        throw new Error('Applying the delta did not reproduce its target.');
+    }
+    return doc;
+}
+
+// snapshot_delta.snapshot_hash(): SHA-256 of the document as JSON with sorted
+// keys, first 16 hex digits
+async function snapshotHash(doc) {
+    const canonical = value => {
+        if (Array.isArray(value)) return `[${value.map(canonical).join(',')}]`;
+        if (value && typeof value === 'object') {
+            const keys = Object.keys(value).filter(k => value[k] !== undefined).sort();
+            return `{${keys.map(k => `${JSON.stringify(k)}:${canonical(value[k])}`).join(',')}}`;
+        }
+        return JSON.stringify(value);
+    };
+    const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(canonical(doc)));
+    return [...new Uint8Array(digest)].map(b => b.toString(16).padStart(2, '0')).join('').slice(0, 16);
+}
+
 function showSection(id) {
     const section = document.getElementById(id);
     if (section) {
@@ -60,6 +150,7 @@ function showSection(id) {
 }
 
 let allData = [];
+let facetIndex = null;
 let activeFilters = {};
 let currentSort = { column: 'When', direction: 'asc' };
 const FILTER_COLUMNS = ["Bib", "Last Name", "First Name", "Age Group", "Gender", "Event", "When", "Team Name", "QP", "RESULT"];
@@ -78,6 +169,14 @@ async function loadReportData() {
         updateProgress(20, 'Loading competitors...');
         await new Promise(resolve => setTimeout(resolve, 500));
 
+        // Shard pages never download the full data.js
+        const shardData = await loadShardData();
+        if (shardData) {
+            window.emacs2026Data = shardData;
+        } else {
+            const bundle = document.querySelector('meta[name="emacs2026-data"]');
+            await loadScript(bundle ? bundle.content : 'src/js/data.js');
+        }
         if (typeof emacs2026Data === 'undefined') {
             throw new Error('Data not found. Please ensure data.js is loaded correctly.');
         }
@@ -86,6 +185,7 @@ async function loadReportData() {
         await new Promise(resolve => setTimeout(resolve, 500));
 
         allData = processData(emacs2026Data);
+        facetIndex = buildFacetIndex(emacs2026Data, allData);
 
         updateProgress(80, 'Preparing interface...');
         await new Promise(resolve => setTimeout(resolve, 300));
@@ -108,7 +208,79 @@ async function loadReportData() {
     }
 }
 
+function loadScript(src) {
+    return new Promise((resolve, reject) => {
+        const script = document.createElement('script');
+        script.src = src;
+        script.onload = resolve;
+        script.onerror = () => reject(new Error(`Could not load ${src}`));
+        document.body.appendChild(script);
+    });
+}
+
+// Loads only the shards bundle_data.py wrote for ?team=GER or ?event=800-d6
+// (several keys may be comma-separated) instead of the full data.js. Returns
+// null without such a parameter or when the shards cannot be fetched, e.g.
+// when the page is opened from file://.
+async function loadShardData(params = new URLSearchParams(window.location.search)) {
+    const kind = params.has('team') ? 'teams' : params.has('event') ? 'events' : null;
+    if (!kind) return null;
+    const keys = params.get(kind === 'teams' ? 'team' : 'event').split(',');
+    try {
+        const manifest = await (await fetch('src/shards/manifest.json')).json();
+        const entries = keys.map(key => manifest[kind][key]).filter(Boolean);
+        if (entries.length === 0) return null;
+        const bundles = await Promise.all(entries.map(entry =>
+            fetch(`src/shards/${entry.file}?v=${entry.hash}`).then(response => response.json())));
+        return { competitors: bundles.flatMap(bundle => expandBundle(bundle).competitors) };
+    } catch (error) {
+        console.warn('Could not load shards, falling back to data.js:', error);
+        return null;
+    }
+}
+
+// Turns the columnar bundle written by bundle_data.py back into competitor
+// objects with the handful of fields the report uses.
+function expandBundle(bundle) {
+    const { dicts, eventOffsets } = bundle;
+    const competitors = [];
+    for (let i = 0; i < bundle.count; i++) {
+        const eventsEntered = [];
+        for (let j = eventOffsets[i]; j < eventOffsets[i + 1]; j++) {
+            eventsEntered.push({ eventCode: dicts.eventCode[bundle.eventCode[j]], qp: bundle.qp[j] });
+        }
+        competitors.push({
+            competitorId: bundle.bib[i],
+            firstName: bundle.firstName[i],
+            lastName: bundle.lastName[i],
+            ageGroup: dicts.ageGroup[bundle.ageGroup[i]],
+            gender: dicts.gender[bundle.gender[i]],
+            teamName: dicts.teamName[bundle.teamName[i]] ?? undefined, // a few entries have no team
+            eventsEntered
+        });
+    }
+    return { competitors };
+}
+
+// The page's data as a prog.json-shaped document: competitors with just the
+// fields the report reads, under their prog.json names.
+function pageSnapshot(data) {
+    const source = data.eventOffsets ? expandBundle(data) : data;
+    return {
+        competitors: (source.competitors || []).map(athlete => ({
+            competitorId: athlete.competitorId,
+            firstName: athlete.firstName,
+            lastName: athlete.lastName,
+            ageGroup: athlete.ageGroup,
+            gender: athlete.gender,
+            ...(athlete.teamName != null && { teamName: athlete.teamName }), // absent, as in prog.json
+            eventsEntered: (athlete.eventsEntered || []).map(event => ({ eventCode: event.eventCode, qp: event.qp || '' }))
+        }))
+    };
+}
+
 function processData(source) {
+    if (source.eventOffsets) source = expandBundle(source);
     if (!source.competitors) return [];
 
     const dateMapping = {
@@ -129,6 +301,15 @@ function processData(source) {
         "800": "6", "1500": "6", "5K": "6", "5KW": "6", "PEN": "6", "XC": "6"
     };
 
+    const whenLookup = typeof emacs2026When !== 'undefined' ? emacs2026When : null;
+    let scheduleIndex = null;
+    const getScheduleIndex = () => {
+        if (!scheduleIndex && typeof emacs2026Schedule !== 'undefined' && emacs2026Schedule.slots) {
+            scheduleIndex = buildScheduleIndex(emacs2026Schedule);
+        }
+        return scheduleIndex;
+    };
+
     const processed = [];
     source.competitors.forEach(athlete => {
         const base = {
@@ -148,51 +329,23 @@ function processData(source) {
                 let exactTime = "";
                 let scheduledDateStr = dateMapping[dayNum] || "-";
 
-                // Try to find exact time from the generated schedule
-                if (typeof emacs2026Schedule !== 'undefined' && emacs2026Schedule.length > 0) {
-                    let match = emacs2026Schedule.find(s =>
-                        s.eventCode === event.eventCode &&
-                        s.gender === athlete.gender &&
-                        s.ageGroup === athlete.ageGroup
-                    );
-
-                    // Fallback: If no exact match, look for a "plus" category that covers this athlete
-                    // This handles cases where the schedule expansion might have missed an extreme age
-                    if (!match) {
-                        const athleteAge = parseInt(String(athlete.ageGroup).replace(/\D/g, ''));
-                        // Find all potential fallback matches for this event and gender
-                        const potentialFallbacks = emacs2026Schedule.filter(s =>
-                            s.eventCode === event.eventCode &&
-                            s.gender === athlete.gender &&
-                            s.desc.includes('+')
-                        );
-
-                        if (potentialFallbacks.length > 0) {
-                            // Find the highest "plus" category that is still <= athlete's age
-                            // e.g. If athlete is 85 and we have 70+ and 80+, pick 80+
-                            let bestFallback = null;
-                            let maxBaseAge = -1;
-
-                            potentialFallbacks.forEach(s => {
-                                const matchPlus = s.desc.match(/(\d{2})\+/);
-                                if (matchPlus) {
-                                    const baseAge = parseInt(matchPlus[1]);
-                                    if (athleteAge >= baseAge && baseAge > maxBaseAge) {
-                                        maxBaseAge = baseAge;
-                                        bestFallback = s;
-                                    }
-                                }
-                            });
-
-                            if (bestFallback) match = bestFallback;
-                        }
-                    }
+                // Exact time, resolved at build time by join_schedule.py. The
+                // schedule index is only consulted for groups the build did not
+                // see, e.g. after restoring a backup with new entries.
+                const joinKey = `${event.eventCode}|${athlete.gender}|${athlete.ageGroup}`;
+                let match = null;
+                if (whenLookup && joinKey in whenLookup) {
+                    const resolved = whenLookup[joinKey];
+                    if (resolved) match = { day: resolved[0], time: resolved[1] };
+                } else if (getScheduleIndex()) {
+                    const athleteAge = parseInt(String(athlete.ageGroup).replace(/\D/g, ''));
+                    match = getScheduleIndex().lookup(event.eventCode, athlete.gender, athleteAge);
+                }
 
-                    if (match) {
-                        dayNum = String(match.day);
-                        exactTime = match.time;
-                        scheduledDateStr = dateMapping[dayNum] || "-";
-                    }
+                if (match) {
+                    dayNum = String(match.day);
+                    exactTime = match.time;
+                    scheduledDateStr = dateMapping[dayNum] || "-";
                 }
 
                 let whenStr = scheduledDateStr;
@@ -213,6 +366,58 @@ function processData(source) {
     return processed;
 }
 
+// Interval index over the compact schedule written by build_schedule.py.
+// Each slot covers an age range (ageMax is null for open-ended "W80+" groups);
+// slots are bucketed by event and gender and sorted by ageMin.
+function buildScheduleIndex(compact) {
+    const OPEN_AGE_LIMIT = 95; // oldest age group the timetable expands "+" groups to
+    const col = {};
+    compact.columns.forEach((name, i) => { col[name] = i; });
+
+    const slots = compact.slots.map(row => ({
+        eventCode: compact.strings[row[col.eventCode]],
+        genders: row[col.genders],
+        ageMin: row[col.ageMin],
+        ageMax: row[col.ageMax],
+        day: row[col.day],
+        time: compact.strings[row[col.time]],
+        desc: compact.strings[row[col.desc]]
+    }));
+
+    const buckets = new Map();
+    slots.forEach((slot, pos) => {
+        for (const gender of slot.genders) {
+            const key = `${slot.eventCode}|${gender}`;
+            if (!buckets.has(key)) buckets.set(key, []);
+            buckets.get(key).push({ ageMin: slot.ageMin, pos });
+        }
+    });
+    buckets.forEach(bucket => bucket.sort((a, b) => a.ageMin - b.ageMin || a.pos - b.pos));
+
+    return {
+        slots,
+        // Earliest slot in timetable order that covers the age; athletes older
+        // than the expanded groups get the open-ended group with the highest bound
+        lookup(eventCode, gender, age) {
+            const bucket = buckets.get(`${eventCode}|${gender}`);
+            if (!bucket || isNaN(age)) return null;
+
+            let best = -1;
+            for (const { ageMin, pos } of bucket) {
+                if (ageMin > age) break;
+                const slot = slots[pos];
+                if (age <= OPEN_AGE_LIMIT) {
+                    const ageMax = slot.ageMax !== null ? slot.ageMax : OPEN_AGE_LIMIT;
+                    if (age <= ageMax && (best < 0 || pos < best)) best = pos;
+                } else if (slot.ageMax === null) {
+                    if (best < 0 || ageMin > slots[best].ageMin) best = pos;
+                }
+            }
+            return best >= 0 ? slots[best] : null;
+        }
+    };
+}
+
 function initializeFilters(data) {
     const filterContainer = document.querySelector('.filter-controls');
     if (!filterContainer) return;
@@ -262,6 +467,124 @@ function initializeFilters(data) {
     updateFilterOptions();
 }
 
+// Decodes the facets facets.py wrote for data.js: per filter column, the
+// sorted row ids of every distinct value plus a row -> value code array.
+// Returns null (and the page scans rows as before) for shards, restored
+// snapshots of other data, or facets that do not match the rows built here.
+function buildFacetIndex(source, data) {
+    if (typeof emacs2026Facets === 'undefined') return null;
+    const facets = emacs2026Facets;
+    if (facets.version !== 2 || facets.data !== source.hash || facets.rows !== data.length) return null;
+
+    const index = {};
+    for (const col of FILTER_COLUMNS) {
+        const { counts, rows, ranks } = facets.columns[col];
+        const codes = new Int32Array(data.length);
+        const lists = rows.map((deltas, code) => {
+            const list = new Int32Array(counts[code]);
+            let id = 0;
+            for (let i = 0; i < deltas.length; i++) {
+                id += deltas[i];
+                list[i] = id;
+                codes[id] = code;
+            }
+            return list;
+        });
+        const values = lists.map(list => data[list[0]][col]);
+        // One pass to make sure the facets were built from the same schedule
+        for (let i = 0; i < data.length; i++) {
+            if (data[i][col] !== values[codes[i]]) return null;
+        }
+        const byValue = new Map(values.map((value, code) => [String(value), code]));
+        index[col] = { values, lists, codes, byValue, ranks: Int32Array.from(ranks), orders: {} };
+    }
+    index.rowIds = new Map(data.map((row, id) => [row, id]));
+    return index;
+}
+
+// Row ids of the whole table in sortData() order for a column, built from
+// the facet ranks with a counting sort over the Last Name order (the
+// secondary key) and cached. Descending walks the rank groups backwards but
+// keeps each group in ascending Last Name order, as sortData() does.
+function facetOrder(col, direction) {
+    const facet = facetIndex[col];
+    if (facet.orders[direction]) return facet.orders[direction];
+
+    const n = facet.codes.length;
+    const base = col === 'Last Name' ? null : facetOrder('Last Name', 'asc');
+    const groups = Math.max(...facet.ranks) + 1;
+    const starts = new Int32Array(groups + 1);
+    for (let id = 0; id < n; id++) starts[facet.ranks[facet.codes[id]] + 1]++;
+    for (let g = 0; g < groups; g++) starts[g + 1] += starts[g];
+
+    const next = starts.slice(0, groups);
+    const asc = new Int32Array(n);
+    for (let i = 0; i < n; i++) {
+        const id = base ? base[i] : i;
+        asc[next[facet.ranks[facet.codes[id]]]++] = id;
+    }
+    facet.orders.asc = asc;
+
+    const desc = new Int32Array(n);
+    let pos = 0;
+    for (let g = groups - 1; g >= 0; g--) {
+        desc.set(asc.subarray(starts[g], starts[g + 1]), pos);
+        pos += starts[g + 1] - starts[g];
+    }
+    facet.orders.desc = desc;
+    return facet.orders[direction];
+}
+
+// The rows of data in sortData() order via the cached permutation, or null
+// if data holds rows the facets do not know
+function facetSort(data, column, direction) {
+    const order = facetOrder(column, direction);
+    if (data === allData) return Array.from(order, id => allData[id]);
+
+    const keep = new Uint8Array(order.length);
+    for (const row of data) {
+        const id = facetIndex.rowIds.get(row);
+        if (id === undefined) return null;
+        keep[id] = 1;
+    }
+    const sorted = [];
+    for (const id of order) {
+        if (keep[id]) sorted.push(allData[id]);
+    }
+    return sorted;
+}
+
+// Row ids matching every filter, found by walking the shortest row id list
+// and checking the other filters against the code arrays. null = all rows.
+function facetRows(filters) {
+    const wanted = [];
+    for (const col of Object.keys(filters)) {
+        if (!filters[col]) continue;
+        const facet = facetIndex[col];
+        const code = facet.byValue.get(filters[col]);
+        if (code === undefined) return [];
+        wanted.push({ list: facet.lists[code], codes: facet.codes, code });
+    }
+    if (wanted.length === 0) return null;
+    wanted.sort((a, b) => a.list.length - b.list.length);
+
+    const [shortest, ...rest] = wanted;
+    const ids = [];
+    for (const id of shortest.list) {
+        if (rest.every(w => w.codes[id] === w.code)) ids.push(id);
+    }
+    return ids;
+}
+
+// Values of col present in the given rows, in the dropdown's sort order
+function facetValues(col, ids) {
+    const facet = facetIndex[col];
+    if (ids === null) return facet.values;
+    const present = new Uint8Array(facet.values.length);
+    for (const id of ids) present[facet.codes[id]] = 1;
+    return facet.values.filter((value, code) => present[code]);
+}
+
 function updateFilterOptions() {
     FILTER_COLUMNS.forEach(col => {
         const select = document.querySelector(`select[data-filter-column="${col}"]`);
@@ -272,11 +595,15 @@ function updateFilterOptions() {
         const otherFilters = { ...activeFilters };
         delete otherFilters[col];
 
-        const filteredSubset = allData.filter(item => {
-            return Object.keys(otherFilters).every(key => String(item[key]) === otherFilters[key]);
-        });
-
-        const availableValues = [...new Set(filteredSubset.map(item => item[col]))].sort();
+        let availableValues;
+        if (facetIndex) {
+            availableValues = facetValues(col, facetRows(otherFilters));
+        } else {
+            const filteredSubset = allData.filter(item => {
+                return Object.keys(otherFilters).every(key => String(item[key]) === otherFilters[key]);
+            });
+            availableValues = [...new Set(filteredSubset.map(item => item[col]))].sort();
+        }
 
         // Rebuild options
         const optionsHTML = [`<option value="">All ${col}s (${availableValues.length})</option>`];
@@ -290,6 +617,10 @@ function updateFilterOptions() {
 }
 
 function applyFilters(data) {
+    if (facetIndex && data === allData) {
+        const ids = facetRows(activeFilters);
+        return ids === null ? [...data] : ids.map(id => data[id]);
+    }
     return data.filter(item => {
         return Object.keys(activeFilters).every(col => {
             if (!activeFilters[col]) return true;
@@ -361,61 +692,62 @@ function handleSort(column) {
     renderTable(sortedData);
 }
 
-function sortData(data, column, direction) {
-    const dateScore = {
-        "Fri, 27 Mar": 10000,
-        "Sat, 28 Mar": 20000,
-        "Sun, 29 Mar": 30000,
-        "Mon, 30 Mar": 40000,
-        "Tue, 31 Mar": 50000,
-        "Wed, 01 Apr": 60000,
-        "Thu, 02 Apr": 70000
-    };
-
-    function parseWhenScore(whenStr) {
-        if (!whenStr || whenStr === '-') return 999999;
-        const parts = whenStr.split(' at ');
-        const datePart = parts[0];
-        const timePart = parts[1];
+const DATE_SCORE = {
+    "Fri, 27 Mar": 10000,
+    "Sat, 28 Mar": 20000,
+    "Sun, 29 Mar": 30000,
+    "Mon, 30 Mar": 40000,
+    "Tue, 31 Mar": 50000,
+    "Wed, 01 Apr": 60000,
+    "Thu, 02 Apr": 70000
+};
+
+function parseWhenScore(whenStr) {
+    if (!whenStr || whenStr === '-') return 999999;
+    const parts = whenStr.split(' at ');
+    const datePart = parts[0];
+    const timePart = parts[1];
+
+    let score = DATE_SCORE[datePart] || 99000;
+
+    if (timePart) {
+        const timeParts = timePart.split(':');
+        if (timeParts.length === 2) {
+            score += (parseInt(timeParts[0]) * 60) + parseInt(timeParts[1]);
+        }
+    }
+    return score;
+}
 
-        let score = dateScore[datePart] || 99000;
+function sortKey(item, col) {
+    if (col === 'Bib') return parseInt(item[col]) || 0;
+    if (col === 'When') return parseWhenScore(item[col]);
+    return String(item[col]).toLowerCase();
+}
 
-        if (timePart) {
-            const timeParts = timePart.split(':');
-            if (timeParts.length === 2) {
-                score += (parseInt(timeParts[0]) * 60) + parseInt(timeParts[1]);
-            }
-        }
-        return score;
+function sortData(data, column, direction) {
+    if (facetIndex) {
+        const sorted = facetSort(data, column, direction);
+        if (sorted) return sorted;
     }
 
-    return [...data].sort((a, b) => {
+    // Keys are computed once per row rather than on every comparison
+    const primary = data.map(item => sortKey(item, column));
+    const secondary = column !== 'Last Name' ? data.map(item => sortKey(item, 'Last Name')) : null;
+
+    return data.map((item, i) => i).sort((a, b) => {
         // Primary sort
-        let res = compare(a, b, column, direction);
+        let res = compare(primary[a], primary[b], direction);
 
         // Secondary sort: if primary is equal, sort by Last Name (always asc for secondary conventionally)
-        if (res === 0 && column !== 'Last Name') {
-            res = compare(a, b, 'Last Name', 'asc');
+        if (res === 0 && secondary) {
+            res = compare(secondary[a], secondary[b], 'asc');
         }
 
         return res;
-    });
-
-    function compare(a, b, col, dir) {
-        let valA = a[col];
-        let valB = b[col];
-
-        if (col === 'Bib') {
-            valA = parseInt(valA) || 0;
-            valB = parseInt(valB) || 0;
-        } else if (col === 'When') {
-            valA = parseWhenScore(valA);
-            valB = parseWhenScore(valB);
-        } else {
-            valA = String(valA).toLowerCase();
-            valB = String(valB).toLowerCase();
-        }
+    }).map(i => data[i]);
 
+    function compare(valA, valB, dir) {
         if (valA < valB) return dir === 'asc' ? -1 : 1;
         if (valA > valB) return dir === 'asc' ? 1 : -1;
         return 0;
@@ -436,3 +768,128 @@ function updateFilter(column, value) {
     const finalData = currentSort.column ? sortData(filtered, currentSort.column, currentSort.direction) : filtered;
     renderTable(finalData);
 }
+
+// Athlete search over the trigram index search_index.py writes to search.js.
+// Decoded on first use; names, team and age group come from data.js by bib.
+let searchIndex = null;
+const SEARCH_WORD = /[\p{L}\p{N}]+/gu;
+
+// Same steps as search_index.fold()
+function foldText(text, fold) {
+    return Array.from(text.toLowerCase().normalize('NFKD').replace(/\p{M}/gu, ''), ch => fold[ch] ?? ch).join('');
+}
+
+function foldWords(text, fold) {
+    return foldText(text, fold).match(SEARCH_WORD) || [];
+}
+
+function buildSearchIndex(raw, source) {
+    if (source.eventOffsets) source = expandBundle(source);
+    const competitors = new Map((source.competitors || []).map(c => [c.competitorId, c]));
+
+    const grams = new Map();
+    const gramCount = new Uint16Array(raw.bib.length);
+    for (const [gram, deltas] of Object.entries(raw.grams)) {
+        const ids = new Int32Array(deltas.length);
+        let id = 0;
+        for (let i = 0; i < deltas.length; i++) {
+            id += deltas[i];
+            ids[i] = id;
+            gramCount[id]++;
+        }
+        grams.set(gram, ids);
+    }
+
+    const bibs = new Map();
+    raw.bib.forEach((bib, id) => {
+        if (bib !== null) bibs.set(foldWords(bib, raw.fold).join(' '), id);
+    });
+    const teams = new Map();
+    for (const [teamId, teamName] of Object.entries(raw.teams)) {
+        teams.set(foldWords(teamId, raw.fold).join(' '), teamName);
+        teams.set(foldWords(teamName, raw.fold).join(' '), teamName);
+    }
+    const athletes = raw.bib.map(bib => (bib === null ? null : competitors.get(bib) || null));
+    return { fold: raw.fold, grams, gramCount, bibs, teams, athletes, hits: new Uint16Array(raw.bib.length) };
+}
+
+// Best matches first: share of the query's trigrams an athlete has, then
+// how closely the whole name matches. Bibs and team codes or names in the
+// query are exact filters. The last word matches as a prefix while typing.
+function searchAthletes(query, limit = 20) {
+    if (typeof emacs2026Data === 'undefined') return []; // still loading
+    // In shard mode only the athletes in the loaded shards can be found
+    if (!searchIndex) searchIndex = buildSearchIndex(emacs2026Search, emacs2026Data);
+    const index = searchIndex;
+    const words = foldWords(query, index.fold);
+    let team = index.teams.get(words.join(' '));
+    const bibIds = [];
+    const nameWords = [];
+    if (!team) {
+        for (const word of words) {
+            if (index.bibs.has(word)) bibIds.push(index.bibs.get(word));
+            else if (index.teams.has(word)) team = index.teams.get(word);
+            else nameWords.push(word);
+        }
+    }
+
+    const queryGrams = new Set();
+    const typing = !/\s$/.test(query);
+    nameWords.forEach((word, i) => {
+        const padded = i === nameWords.length - 1 && typing ? ` ${word}` : ` ${word} `;
+        for (let j = 0; j + 3 <= padded.length; j++) queryGrams.add(padded.slice(j, j + 3));
+    });
+
+    const matches = [];
+    const accept = (id, coverage, similarity) => {
+        const athlete = index.athletes[id];
+        if (athlete && (!team || athlete.teamName === team)) matches.push({ athlete, coverage, similarity });
+    };
+
+    if (queryGrams.size > 0) {
+        const { hits } = index;
+        const touched = [];
+        for (const gram of queryGrams) {
+            const ids = index.grams.get(gram);
+            if (!ids) continue;
+            for (const id of ids) {
+                if (hits[id]++ === 0) touched.push(id);
+            }
+        }
+        for (const id of touched) {
+            const coverage = hits[id] / queryGrams.size;
+            if (coverage >= 0.5) accept(id, coverage, 2 * hits[id] / (queryGrams.size + index.gramCount[id]));
+            hits[id] = 0;
+        }
+    } else if (bibIds.length > 0) {
+        bibIds.forEach(id => accept(id, 1, 1));
+    } else if (team) {
+        index.athletes.forEach((athlete, id) => accept(id, 1, 0));
+    }
+
+    matches.sort((a, b) => b.coverage - a.coverage || b.similarity - a.similarity ||
+        a.athlete.lastName.localeCompare(b.athlete.lastName) || a.athlete.firstName.localeCompare(b.athlete.firstName));
+    return matches.slice(0, limit).map(m => m.athlete);
+}
+
+function renderSearchResults(query, container) {
+    if (!query.trim()) {
+        container.innerHTML = '';
+        return;
+    }
+    const athletes = searchAthletes(query);
+    if (athletes.length === 0) {
+        container.innerHTML = '<li class="search-empty">No athletes found.</li>';
+        return;
+    }
+    container.innerHTML = athletes.map(a => {
+        const searchName = encodeURIComponent(`${a.firstName} ${a.lastName}`);
+        return `
+            <li class="search-result" data-bib="${a.competitorId}">
+                <span class="search-name">${a.lastName}, ${a.firstName}</span>
+                <span class="search-meta">${a.competitorId} · ${a.ageGroup} · ${a.teamName || '-'}</span>
+                <a href="https://www.mastersrankings.com/athlete-search/?x8=${searchName}" target="_blank" title="Rankings" class="btn-profile">View</a>
+            </li>
+        `;
+    }).join('');
+}
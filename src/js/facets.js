@@ -0,0 +1 @@
+const emacs2026Facets = {"version":2,"data":"ef14dcf30c2827b3","rows":6987,"columns":{"Bib":{"counts":[3,5,1,2,1,2,1,2,2,1,2,1,3,3,1,3,2,1,1,1,1,2,2,1,2,1,2,3,1,3,3,1,1,2,1,2,1,2,3,1,1,2,3,3,2,6,2,2,2,1,3,3,2,2,3,2,1,1,2,1,4,2,1,2,1,1,2,4,2,2,3,2,1,1,1,1,2,1,1,2,1,2,1,2,3,2,2,1,5,2,2,2,4,1,2,2,1,7,2,1,1,4,2,2,1,1,2,2,2,4,2,2,2,4,1,3,1,1,2,3,2,2,2,2,4,1,2,3,2,1,1,3,2,4,2,2,2,3,1,1,1,1,1,1,2,2,1,3,2,1,2,1,1,2,2,2,2,1,2,1,4,2,2,2,1,1,1,1,2,3,1,1,1,2,2,2,5,2,1,1,1,2,1,1,3,1,1,2,1,4,2,1,1,2,2,3,2,2,1,2,1,3,3,2,2,2,1,1,1,3,2,1,1,2,2,4,4,3,3,1,2,1,1,1,1,1,2,3,2,1,1,2,2,1,3,2,2,2,7,2,2,3,2,1,3,3,1,3,3,2,1,4,1,4,2,2,1,2,3,2,2,1,2,2,2,2,1,2,1,1,1,1,1,1,2,2,2,2,2,2,2,4,1,2,2,5,2,3,3,1,4,1,2,3,2,3,1,3,2,1,3,1,1,2,2,1,1,2,2,2,4,2,2,2,1,3,3,1,2,1,2,1,3,2,2,2,6,1,2,1,3,2,1,1,2,1,3,4,1,2,2,1,2,2,4,3,4,2,2,2,1,4,3,3,1,1,1,1,1,2,1,2,2,1,3,1,1,4,2,2,3,2,1,1,3,3,3,2,2,1,5,2,2,3,3,4,2,1,2,1,1,1,3,2,1,1,3,2,1,3,1,2,2,2,3,2,1,2,2,1,3,2,1,3,2,2,2,1,1,2,2,3,1,2,2,1,2,2,3,2,1,3,3,1,2,2,1,2,1,1,2,1,3,3,1,2,3,2,1,2,2,2,2,1,9,5,1,3,2,4,1,2,2,1,1,2,3,1,1,4,1,3,3,1,6,2,2,1,1,1,1,3,2,2,3,1,3,1,3,2,3,3,2,2,1,2,2,1,3,2,1,1,1,1,1,3,1,2,3,4,2,1,1,4,1,2,2,5,3,1,3,2,1,2,4,1,2,5,1,1,2,2,2,2,4,1,1,2,2,2,4,2,1,3,1,4,1,1,3,1,5,2,2,1,2,1,4,1,1,3,3,1,1,2,2,1,1,3,2,2,1,1,1,1,3,3,5,1,1,1,2,2,1,2,3,1,1,2,3,2,1,4,4,3,2,1,2,1,2,2,2,3,2,5,1,3,2,2,3,1,1,1,3,1,2,1,1,4,1,3,3,1,1,2,2,1,2,1,2,1,2,2,2,1,2,1,1,3,3,2,3,1,2,2,4,1,1,2,2,1,2,1,2,2,1,3,1,3,1,1,3,1,3,2,2,1,2,3,1,1,3,1,2,1,2,2,1,2,3,1,1,3,1,2,4,3,4,1,2,1,1,3,1,2,1,2,3,1,3,1,1,2,1,5,3,2,1,1,3,3,1,4,1,3,2,1,2,1,4,2,1,1,3,4,1,3,3,4,2,2,4,2,1,4,2,1,3,3,2,1,4,1,2,1,2,1,2,1,1,2,2,1,1,2,1,1,1,1,2,2,1,1,1,1,1,4,2,2,3,3,5,2,1,1,1,2,2,2,2,1,8,1,1,2,1,2,2,2,1,1,3,1,1,2,3,1,1,1,2,3,1,1,1,2,1,2,1,1,2,2,1,1,4,4,1,3,1,2,1,2,2,1,3,1,5,2,3,2,3,3,3,1,3,2,1,2,6,2,1,3,2,2,2,1,2,1,2,1,1,1,1,1,2,2,1,2,1,3,1,5,1,1,1,2,1,4,1,1,1,1,1,2,2,1,1,3,2,1,1,2,2,1,2,1,1,1,2,1,1,1,2,2,2,1,1,1,3,3,2,3,1,1,1,2,1,1,1,1,1,3,1,1,3,4,3,2,3,3,2,1,2,1,2,2,3,1,2,2,1,3,2,1,4,3,1,1,2,2,2,1,3,1,2,1,1,2,2,1,2,1,4,2,1,4,3,3,1,1,1,3,5,2,2,2,1,2,1,3,1,2,3,1,1,2,3,1,1,1,2,1,1,2,1,1,1,1,1,2,1,1,1,1,2,2,1,1,4,2,2,2,6,1,2,2,2,2,1,2,2,1,2,4,1,2,2,2,2,1,2,2,2,2,3,1,2,1,2,1,3,2,1,2,2,2,3,3,2,1,1,2,2,3,3,1,1,1,2,1,2,2,3,1,1,2,3,2,1,2,1,4,1,5,1,1,2,1,2,1,3,3,3,4,4,3,2,1,2,2,1,3,1,1,3,2,2,3,2,2,1,1,1,1,2,1,2,2,4,2,1,3,5,1,2,1,3,1,3,2,6,1,2,4,2,3,1,1,3,3,2,1,5,2,1,2,2,1,2,3,2,2,2,1,1,3,1,1,2,5,1,2,3,2,1,2,1,1,2,2,1,2,2,1,1,2,5,5,1,2,2,2,4,2,1,2,5,1,2,2,3,2,1,1,1,1,2,1,1,3,2,3,1,1,3,3,2,1,3,2,1,1,3,2,2,2,4,1,1,1,1,2,1,2,2,2,5,1,1,4,2,3,1,1,3,2,1,3,2,5,4,2,3,2,1,2,3,1,1,2,2,1,2,3,1,2,1,1,1,1,1,1,4,1,3,4,2,1,2,3,5,1,1,1,2,1,2,1,3,2,2,1,1,1,4,1,3,1,1,2,2,1,1,2,1,3,2,2,1,1,2,2,3,3,2,1,2,3,1,2,2,1,1,2,1,2,1,2,2,1,1,1,3,3,2,1,2,4,2,2,4,3,1,3,1,3,1,5,1,1,3,3,6,1,2,2,1,1,1,2,1,1,1,1,3,3,1,1,2,1,1,1,1,1,2,2,1,1,2,2,1,1,2,2,1,1,2,1,4,2,3,3,3,3,3,4,1,1,2,1,2,2,1,1,2,1,3,1,1,1,2,1,3,2,1,2,1,1,4,1,1,1,2,2,3,2,1,3,3,3,1,2,1,2,1,3,2,4,4,2,2,1,2,2,2,2,5,1,4,1,1,2,2,2,1,1,3,2,1,2,2,2,2,2,2,3,3,3,1,2,2,4,2,2,3,1,1,1,3,4,1,2,3,1,2,1,2,3,2,2,2,2,2,2,1,2,2,1,2,2,2,1,3,3,2,1,1,2,1,3,1,2,1,1,2,2,1,4,1,2,4,3,2,2,1,2,3,3,3,2,3,1,1,2,1,2,2,1,2,2,1,2,2,2,1,3,2,2,3,2,1,4,3,3,5,2,1,1,1,1,5,3,2,2,4,1,2,2,1,1,2,4,1,1,1,1,1,1,1,2,2,2,5,2,2,2,2,1,2,1,1,2,2,3,4,1,1,5,2,1,2,2,3,2,4,2,1,1,1,1,2,1,2,2,1,1,1,1,2,2,1,1,1,2,1,2,2,1,1,1,3,1,1,1,2,2,1,4,4,3,2,1,2,3,1,2,1,2,2,3,2,1,2,4,2,5,1,2,3,1,3,3,2,1,4,1,1,4,1,3,2,2,1,2,6,2,2,2,1,1,7,1,2,1,1,1,2,2,2,1,2,2,2,2,2,1,1,2,1,4,2,1,2,2,2,2,1,1,2,2,4,2,2,2,1,1,1,1,1,2,2,2,4,2,1,2,1,1,1,3,1,2,3,2,5,2,2,1,2,2,2,2,1,4,3,2,2,1,1,2,2,2,3,1,2,1,1,5,2,2,1,2,1,1,3,1,2,7,1,2,2,1,1,3,1,2,1,2,1,4,2,3,5,2,1,2,2,2,2,1,4,1,2,1,5,1,1,1,1,2,1,1,1,5,2,4,1,2,2,1,3,2,1,3,1,1,3,1,2,5,2,3,3,2,4,3,3,1,2,3,2,2,1,1,4,3,2,1,3,4,1,2,4,1,2,1,2,3,3,1,1,2,3,3,2,2,2,1,2,3,2,3,1,1,2,1,1,3,2,3,2,2,1,2,2,3,2,2,1,2,1,2,1,2,3,2,1,1,2,2,1,1,1,2,2,3,2,1,3,2,2,4,2,2,1,3,4,1,3,2,2,2,1,2,1,2,5,2,1,1,2,1,4,1,1,5,1,1,4,2,2,1,1,1,3,2,1,2,1,3,2,1,2,1,3,3,1,2,1,1,1,1,2,6,1,2,3,2,2,1,3,2,1,2,1,2,1,1,1,3,1,2,2,3,2,2,2,2,2,1,5,1,1,5,1,1,5,2,1,3,2,3,4,2,2,1,2,1,3,1,1,2,1,4,2,1,3,1,1,2,1,1,4,4,3,2,2,3,1,2,3,2,3,1,2,2,1,4,3,3,4,1,2,2,3,2,1,5,3,2,1,2,3,2,2,2,3,1,1,4,1,2,2,4,1,5,1,2,3,3,2,2,3,1,2,2,1,2,1,1,3,2,1,2,1,5,2,4,1,2,2,1,2,3,1,1,1,3,2,2,2,2,1,1,2,1,1,1,1,2,1,1,3,1,2,3,1,3,2,1,3,1,1,2,2,1,2,2,1,2,1,2,1,1,3,1,3,2,2,2,1,1,3,4,2,2,1,1,1,1,2,2,4,3,1,1,5,1,1,3,2,3,2,1,2,2,1,2,2,4,2,2,3,1,1,2,3,3,1,1,2,1,2,2,3,2,3,4,1,7,1,1,2,4,1,2,2,2,2,3,2,1,1,2,3,1,3,1,2,1,2,1,3,1,2,5,3,2,2,2,1,2,1,1,2,1,2,1,2,1,3,2,1,4,3,3,2,1,2,3,1,1,2,2,2,2,5,2,3,2,1,3,1,2,3,4,1,2,5,1,3,1,1,1,1,2,2,2,2,4,2,2,1,5,2,1,1,3,2,1,2,3,1,2,1,2,3,2,1,2,2,2,1,1,2,1,4,1,2,1,2,1,2,3,1,4,3,2,1,2,1,1,2,4,2,2,3,3,3,2,2,2,2,2,4,2,2,2,2,2,2,3,2,3,3,1,1,1,2,3,1,1,2,3,3,3,1,3,2,2,1,1,1,3,3,1,3,1,3,4,1,1,2,1,3,2,1,1,2,2,3,2,1,1,1,3,2,2,1,2,2,2,1,1,3,1,4,1,1,3,2,2,1,2,1,1,1,3,1,1,1,2,1,1,17,1,1,2,2,3,3,1,3,1,3,2,1,2,2,2,1,3,1,2,1,2,4,1,2,2,3,2,4,3,2,3,2,4,2,7,1,2,1,2,2,1,2,3,4,1,3,1,1,2,4,1,2,5,1,2,2,1,1,2,1,3,2,1,1,2,1,2,2,1,4,1,1,2,1,2,1,1,1,1,2,2,1,3,2,2,1,2,1,2,2,2,1,3,2,3,2,2,3,2,4,2,1,2,2,1,1,1,3,1,4,5,1,2,2,1,2,1,1,2,3,2,2,2,4,2,3,3,1,1,2,1,2,1,2,2,3,2,2,1,2,2,5,2,2,2,5,4,3,4,2,1,2,1,2,2,1,2,3,1,2,1,2,2,2,1,3,3,1,1,2,1,1,1,3,5,2,1,1,4,2,1,2,1,1,1,3,2,2,2,2,3,2,1,2,3,3,3,2,2,2,1,2,3,1,2,1,3,1,3,2,3,1,4,1,2,2,1,2,3,1,4,1,1,2,2,3,1,1,2,2,3,1,2,2,2,2,1,3,3,1,2,3,1,2,2,3,2,3,2,1,1,2,1,3,2,2,4,3,5,2,1,2,4,1,5,1,1,2,2,2,1,2,1,1,3,4,3,2,2,1,1,2,3,1,2,2,2,2,2,3,1,3,3,1,1,2,1,2,1,2,1,2,2,5,2,1,1,1,3,1,2,2,2,1,4,3,2,2,1,2,2,2,2,2,2,2,3,2,2,1,2,2,2,2,2,4,2,1,3,3,1,3,2,1,2,1,3,2,3,2,1,2,1,2,4,1,1,2,1,4,3,1,1,4,1,4,2,5,1,4,2,3,1,3,4,3,2,2,3,1,2,2,2,1,2,2,1,4,4,2,2,7,2,1,2,4,5,2,2,3,1,1,1,3,2,1,1,1,2,2,1,2,2,2,2,1,2,3,1,2,2,3,1,3,2,2,1,2,1,1,1,2,4,4,1,1,5,1,1,2,2,4,3,2,1,2,2,3,2,2,2,2,1,3,2,3,1,2,1,3,5,1,4,3,3,2,3,1,2,1,3,1,1,1,2,2,5,8,1,1,3,2,2,2,1,1,2,3,2,5,2,4,2,4,2,2,3,3,1,3,1,1,2,2,2,1,1,1,2,2,1,1,1,3,1,2,1,3,2,1,3,2,2,2,3,3,2,1,9,1,4,2,1,2,4,2,5,2,4,3,1,1,3,2,2,3,3,3,1,1,1,3,3,1,2,2,3,1,2,1,2,1,2,4,2,1,1,1,2,5,2,1,2,4,5,1,1,2,3,1,1,4,1,2,3,2,1,1,3,5,1,3,2,1,3,1,2,1,4,2,1,1,2,1,4,3,1,1,1,1,2,3,1,2,1,2,1,3,2,1,1,2,1,4,3,1,1,4,2,1,1,2,1,2,1,3,1,1,2,1,2,2,2,2,2,2,2,1,3,2,2,1,2,1,3,2,5,1,3,1,2,2,1,1,2,1,1,2,2,2,1,1,2,1,2,4,2,1,2,2,2,1,2,3,1,2,3,1,1,3,2,2,2,1,3,1,1,1,1,4,2,1,1,1,3,2,3,3,4,3,1,3,1,3,1,1,2,1,3,2,2,1,3,2,2,3,3,3,2,1,1,2,1,4,1,2,1,2,5,1,1,4,2,3,2,2,1,1,3,3,2,2,2,2,1,3,2,2,2,3,3,4,2,4,1,2,3,3,2,3,1,4,3,2,2,1,2,2,2,4,3,2,2,3,3,1,1,2,2,1,3,2,3,2,3,1,12,2,5,3,3,1,1,2,1,3,2,2,1,3,3,3,1,1,1,2,1,4,1,1,2,1,1,1,1,1,1,3,5,2,2,2,2,3,1,1,2,2,2,3,3,3,1,1,1,1,3,2,1,2,1,1,2,3,2,2,2,2,1,3,2,4,2,2,1,2,2,3,2,2,2,1,2,1,1,2,1,1,3,1,2,4,2,2,2,1,1,1,2,3,2,2,4,1,2,3,1,1,1,1,2,1,1,2,1,1,3,3,1,3,2,1,3,3,3,2,2,1,3,1,3,2,2,1,4,2,2,2,2,2,2,1,1,1,2,5,1,1,2,1,2,5,1,1,2,2,2,1,2,1,2,2,3,1,1,2,1,3,1,2,2,3,3,5,4,3,2,3,4,1,1,2,2,1,3,1,1,3,1,2,1,1,2,2,2,5,4,1,2,3,2,1,2,2,1,1,1,2,3,2,2,2,1,3,1,3,2,1,1,2,2,2,1,4,3,2,2,2,1,2,1,1,2,2,2,2,2,1,2,2,3,2,4,2,4,4,1,3,2,3,1,2,2,3,2,6,1,2,2,2,4,1,2,2,1,1,1,2,4,1,1,4,2,2,2,2,2,2,2,2,2,2,2,2,2,1,2,2,2,2,3,3,2,1,1,1,3,4,3,2,1,1,3,2,2,2,2,2,1,2,3,2,1,1,3,1,2,2,3,2,2,1,2,2,1,2,2,2,3,2,1],"rows":[[0,1,1],[3,1,1,1,1],[8],[9,1],[11],[12,1],[14],[15,1],[17,1],[19],[20,1],[22],[23,1,1],[26,1,1],[29],[30,1,1],[33,1],[35],[36],[37],[38],[39,1],[41,1],[43],[44,1],[46],[47,1],[49,1,1],[52],[53,1,1],[56,1,1],[59],[60],[61,1],[63],[64,1],[66],[67,1],[69,1,1],[72],[73],[74,1],[76,1,1],[79,1,1],[82,1],[84,1,1,1,1,1],[90,1],[92,1],[94,1],[96],[97,1,1],[100,1,1],[103,1],[105,1],[107,1,1],[110,1],[112],[113],[114,1],[116],[117,1,1,1],[121,1],[123],[124,1],[126],[127],[128,1],[130,1,1,1],[134,1],[136,1],[138,1,1],[141,1],[143],[144],[145],[146],[147,1],[149],[150],[151,1],[153],[154,1],[156],[157,1],[159,1,1],[162,1],[164,1],[166],[167,1,1,1,1],[172,1],[174,1],[176,1],[178,1,1,1],[182],[183,1],[185,1],[187],[188,1,1,1,1,1,1],[195,1],[197],[198],[199,1,1,1],[203,1],[205,1],[207],[208],[209,1],[211,1],[213,1],[215,1,1,1],[219,1],[221,1],[223,1],[225,1,1,1],[229],[230,1,1],[233],[234],[235,1],[237,1,1],[240,1],[242,1],[244,1],[246,1],[248,1,1,1],[252],[253,1],[255,1,1],[258,1],[260],[261],[262,1,1],[265,1],[267,1,1,1],[271,1],[273,1],[275,1],[277,1,1],[280],[281],[282],[283],[284],[285],[286,1],[288,1],[290],[291,1,1],[294,1],[296],[297,1],[299],[300],[301,1],[303,1],[305,1],[307,1],[309],[310,1],[312],[313,1,1,1],[317,1],[319,1],[321,1],[323],[324],[325],[326],[327,1],[329,1,1],[332],[333],[334],[335,1],[337,1],[339,1],[341,1,1,1,1],[346,1],[348],[349],[350],[351,1],[353],[354],[355,1,1],[358],[359],[360,1],[362],[363,1,1,1],[367,1],[369],[370],[371,1],[373,1],[375,1,1],[378,1],[380,1],[382],[383,1],[385],[386,1,1],[389,1,1],[392,1],[394,1],[396,1],[398],[399],[400],[401,1,1],[404,1],[406],[407],[408,1],[410,1],[412,1,1,1],[416,1,1,1],[420,1,1],[423,1,1],[426],[427,1],[429],[430],[431],[432],[433],[434,1],[436,1,1],[439,1],[441],[442],[443,1],[445,1],[447],[448,1,1],[451,1],[453,1],[455,1],[457,1,1,1,1,1,1],[464,1],[466,1],[468,1,1],[471,1],[473],[474,1,1],[477,1,1],[480],[481,1,1],[484,1,1],[487,1],[489],[490,1,1,1],[494],[495,1,1,1],[499,1],[501,1],[503],[504,1],[506,1,1],[509,1],[511,1],[513],[514,1],[516,1],[518,1],[520,1],[522],[523,1],[525],[526],[527],[528],[529],[530],[531,1],[533,1],[535,1],[537,1],[539,1],[541,1],[543,1],[545,1,1,1],[549],[550,1],[552,1],[554,1,1,1,1],[559,1],[561,1,1],[564,1,1],[567],[568,1,1,1],[572],[573,1],[575,1,1],[578,1],[580,1,1],[583],[584,1,1],[587,1],[589],[590,1,1],[593],[594],[595,1],[597,1],[599],[600],[601,1],[603,1],[605,1],[607,1,1,1],[611,1],[613,1],[615,1],[617],[618,1,1],[621,1,1],[624],[625,1],[627],[628,1],[630],[631,1,1],[634,1],[636,1],[638,1],[640,1,1,1,1,1],[646],[647,1],[649],[650,1,1],[653,1],[655],[656],[657,1],[659],[660,1,1],[663,1,1,1],[667],[668,1],[670,1],[672],[673,1],[675,1],[677,1,1,1],[681,1,1],[684,1,1,1],[688,1],[690,1],[692,1],[694],[695,1,1,1],[699,1,1],[702,1,1],[705],[706],[707],[708],[709],[710,1],[712],[713,1],[715,1],[717],[718,1,1],[721],[722],[723,1,1,1],[727,1],[729,1],[731,1,1],[734,1],[736],[737],[738,1,1],[741,1,1],[744,1,1],[747,1],[749,1],[751],[752,1,1,1,1],[757,1],[759,1],[761,1,1],[764,1,1],[767,1,1,1],[771,1],[773],[774,1],[776],[777],[778],[779,1,1],[782,1],[784],[785],[786,1,1],[789,1],[791],[792,1,1],[795],[796,1],[798,1],[800,1],[802,1,1],[805,1],[807],[808,1],[810,1],[812],[813,1,1],[816,1],[818],[819,1,1],[822,1],[824,1],[826,1],[828],[829],[830,1],[832,1],[834,1,1],[837],[838,1],[840,1],[842],[843,1],[845,1],[847,1,1],[850,1],[852],[853,1,1],[856,1,1],[859],[860,1],[862,1],[864],[865,1],[867],[868],[869,1],[871],[872,1,1],[875,1,1],[878],[879,1],[881,1,1],[884,1],[886],[887,1],[889,1],[891,1],[893,1],[895],[896,1,1,1,1,1,1,1,1],[905,1,1,1,1],[910],[911,1,1],[914,1],[916,1,1,1],[920],[921,1],[923,1],[925],[926],[927,1],[929,1,1],[932],[933],[934,1,1,1],[938],[939,1,1],[942,1,1],[945],[946,1,1,1,1,1],[952,1],[954,1],[956],[957],[958],[959],[960,1,1],[963,1],[965,1],[967,1,1],[970],[971,1,1],[974],[975,1,1],[978,1],[980,1,1],[983,1,1],[986,1],[988,1],[990],[991,1],[993,1],[995],[996,1,1],[999,1],[1001],[1002],[1003],[1004],[1005],[1006,1,1],[1009],[1010,1],[1012,1,1],[1015,1,1,1],[1019,1],[1021],[1022],[1023,1,1,1],[1027],[1028,1],[1030,1],[1032,1,1,1,1],[1037,1,1],[1040],[1041,1,1],[1044,1],[1046],[1047,1],[1049,1,1,1],[1053],[1054,1],[1056,1,1,1,1],[1061],[1062],[1063,1],[1065,1],[1067,1],[1069,1],[1071,1,1,1],[1075],[1076],[1077,1],[1079,1],[1081,1],[1083,1,1,1],[1087,1],[1089],[1090,1,1],[1093],[1094,1,1,1],[1098],[1099],[1100,1,1],[1103],[1104,1,1,1,1],[1109,1],[1111,1],[1113],[1114,1],[1116],[1117,1,1,1],[1121],[1122],[1123,1,1],[1126,1,1],[1129],[1130],[1131,1],[1133,1],[1135],[1136],[1137,1,1],[1140,1],[1142,1],[1144],[1145],[1146],[1147],[1148,1,1],[1151,1,1],[1154,1,1,1,1],[1159],[1160],[1161],[1162,1],[1164,1],[1166],[1167,1],[1169,1,1],[1172],[1173],[1174,1],[1176,1,1],[1179,1],[1181],[1182,1,1,1],[1186,1,1,1],[1190,1,1],[1193,1],[1195],[1196,1],[1198],[1199,1],[1201,1],[1203,1],[1205,1,1],[1208,1],[1210,1,1,1,1],[1215],[1216,1,1],[1219,1],[1221,1],[1223,1,1],[1226],[1227],[1228],[1229,1,1],[1232],[1233,1],[1235],[1236],[1237,1,1,1],[1241],[1242,1,1],[1245,1,1],[1248],[1249],[1250,1],[1252,1],[1254],[1255,1],[1257],[1258,1],[1260],[1261,1],[1263,1],[1265,1],[1267],[1268,1],[1270],[1271],[1272,1,1],[1275,1,1],[1278,1],[1280,1,1],[1283],[1284,1],[1286,1],[1288,1,1,1],[1292],[1293],[1294,1],[1296,1],[1298],[1299,1],[1301],[1302,1],[1304,1],[1306],[1307,1,1],[1310],[1311,1,1],[1314],[1315],[1316,1,1],[1319],[1320,1,1],[1323,1],[1325,1],[1327],[1328,1],[1330,1,1],[1333],[1334],[1335,1,1],[1338],[1339,1],[1341],[1342,1],[1344,1],[1346],[1347,1],[1349,1,1],[1352],[1353],[1354,1,1],[1357],[1358,1],[1360,1,1,1],[1364,1,1],[1367,1,1,1],[1371],[1372,1],[1374],[1375],[1376,1,1],[1379],[1380,1],[1382],[1383,1],[1385,1,1],[1388],[1389,1,1],[1392],[1393],[1394,1],[1396],[1397,1,1,1,1],[1402,1,1],[1405,1],[1407],[1408],[1409,1,1],[1412,1,1],[1415],[1416,1,1,1],[1420],[1421,1,1],[1424,1],[1426],[1427,1],[1429],[1430,1,1,1],[1434,1],[1436],[1437],[1438,1,1],[1441,1,1,1],[1445],[1446,1,1],[1449,1,1],[1452,1,1,1],[1456,1],[1458,1],[1460,1,1,1],[1464,1],[1466],[1467,1,1,1],[1471,1],[1473],[1474,1,1],[1477,1,1],[1480,1],[1482],[1483,1,1,1],[1487],[1488,1],[1490],[1491,1],[1493],[1494,1],[1496],[1497],[1498,1],[1500,1],[1502],[1503],[1504,1],[1506],[1507],[1508],[1509],[1510,1],[1512,1],[1514],[1515],[1516],[1517],[1518],[1519,1,1,1],[1523,1],[1525,1],[1527,1,1],[1530,1,1],[1533,1,1,1,1],[1538,1],[1540],[1541],[1542],[1543,1],[1545,1],[1547,1],[1549,1],[1551],[1552,1,1,1,1,1,1,1],[1560],[1561],[1562,1],[1564],[1565,1],[1567,1],[1569,1],[1571],[1572],[1573,1,1],[1576],[1577],[1578,1],[1580,1,1],[1583],[1584],[1585],[1586,1],[1588,1,1],[1591],[1592],[1593],[1594,1],[1596],[1597,1],[1599],[1600],[1601,1],[1603,1],[1605],[1606],[1607,1,1,1],[1611,1,1,1],[1615],[1616,1,1],[1619],[1620,1],[1622],[1623,1],[1625,1],[1627],[1628,1,1],[1631],[1632,1,1,1,1],[1637,1],[1639,1,1],[1642,1],[1644,1,1],[1647,1,1],[1650,1,1],[1653],[1654,1,1],[1657,1],[1659],[1660,1],[1662,1,1,1,1,1],[1668,1],[1670],[1671,1,1],[1674,1],[1676,1],[1678,1],[1680],[1681,1],[1683],[1684,1],[1686],[1687],[1688],[1689],[1690],[1691,1],[1693,1],[1695],[1696,1],[1698],[1699,1,1],[1702],[1703,1,1,1,1],[1708],[1709],[1710],[1711,1],[1713],[1714,1,1,1],[1718],[1719],[1720],[1721],[1722],[1723,1],[1725,1],[1727],[1728],[1729,1,1],[1732,1],[1734],[1735],[1736,1],[1738,1],[1740],[1741,1],[1743],[1744],[1745],[1746,1],[1748],[1749],[1750],[1751,1],[1753,1],[1755,1],[1757],[1758],[1759],[1760,1,1],[1763,1,1],[1766,1],[1768,1,1],[1771],[1772],[1773],[1774,1],[1776],[1777],[1778],[1779],[1780],[1781,1,1],[1784],[1785],[1786,1,1],[1789,1,1,1],[1793,1,1],[1796,1],[1798,1,1],[1801,1,1],[1804,1],[1806],[1807,1],[1809],[1810,1],[1812,1],[1814,1,1],[1817],[1818,1],[1820,1],[1822],[1823,1,1],[1826,1],[1828],[1829,1,1,1],[1833,1,1],[1836],[1837],[1838,1],[1840,1],[1842,1],[1844],[1845,1,1],[1848],[1849,1],[1851],[1852],[1853,1],[1855,1],[1857],[1858,1],[1860],[1861,1,1,1],[1865,1],[1867],[1868,1,1,1],[1872,1,1],[1875,1,1],[1878],[1879],[1880],[1881,1,1],[1884,1,1,1,1],[1889,1],[1891,1],[1893,1],[1895],[1896,1],[1898],[1899,1,1],[1902],[1903,1],[1905,1,1],[1908],[1909],[1910,1],[1912,1,1],[1915],[1916],[1917],[1918,1],[1920],[1921],[1922,1],[1924],[1925],[1926],[1927],[1928],[1929,1],[1931],[1932],[1933],[1934],[1935,1],[1937,1],[1939],[1940],[1941,1,1,1],[1945,1],[1947,1],[1949,1],[1951,1,1,1,1,1],[1957],[1958,1],[1960,1],[1962,1],[1964,1],[1966],[1967,1],[1969,1],[1971],[1972,1],[1974,1,1,1],[1978],[1979,1],[1981,1],[1983,1],[1985,1],[1987],[1988,1],[1990,1],[1992,1],[1994,1],[1996,1,1],[1999],[2000,1],[2002],[2003,1],[2005],[2006,1,1],[2009,1],[2011],[2012,1],[2014,1],[2016,1],[2018,1,1],[2021,1,1],[2024,1],[2026],[2027],[2028,1],[2030,1],[2032,1,1],[2035,1,1],[2038],[2039],[2040],[2041,1],[2043],[2044,1],[2046,1],[2048,1,1],[2051],[2052],[2053,1],[2055,1,1],[2058,1],[2060],[2061,1],[2063],[2064,1,1,1],[2068],[2069,1,1,1,1],[2074],[2075],[2076,1],[2078],[2079,1],[2081],[2082,1,1],[2085,1,1],[2088,1,1],[2091,1,1,1],[2095,1,1,1],[2099,1,1],[2102,1],[2104],[2105,1],[2107,1],[2109],[2110,1,1],[2113],[2114],[2115,1,1],[2118,1],[2120,1],[2122,1,1],[2125,1],[2127,1],[2129],[2130],[2131],[2132],[2133,1],[2135],[2136,1],[2138,1],[2140,1,1,1],[2144,1],[2146],[2147,1,1],[2150,1,1,1,1],[2155],[2156,1],[2158],[2159,1,1],[2162],[2163,1,1],[2166,1],[2168,1,1,1,1,1],[2174],[2175,1],[2177,1,1,1],[2181,1],[2183,1,1],[2186],[2187],[2188,1,1],[2191,1,1],[2194,1],[2196],[2197,1,1,1,1],[2202,1],[2204],[2205,1],[2207,1],[2209],[2210,1],[2212,1,1],[2215,1],[2217,1],[2219,1],[2221],[2222],[2223,1,1],[2226],[2227],[2228,1],[2230,1,1,1,1],[2235],[2236,1],[2238,1,1],[2241,1],[2243],[2244,1],[2246],[2247],[2248,1],[2250,1],[2252],[2253,1],[2255,1],[2257],[2258],[2259,1],[2261,1,1,1,1],[2266,1,1,1,1],[2271],[2272,1],[2274,1],[2276,1],[2278,1,1,1],[2282,1],[2284],[2285,1],[2287,1,1,1,1],[2292],[2293,1],[2295,1],[2297,1,1],[2300,1],[2302],[2303],[2304],[2305],[2306,1],[2308],[2309],[2310,1,1],[2313,1],[2315,1,1],[2318],[2319],[2320,1,1],[2323,1,1],[2326,1],[2328],[2329,1,1],[2332,1],[2334],[2335],[2336,1,1],[2339,1],[2341,1],[2343,1],[2345,1,1,1],[2349],[2350],[2351],[2352],[2353,1],[2355],[2356,1],[2358,1],[2360,1],[2362,1,1,1,1],[2367],[2368],[2369,1,1,1],[2373,1],[2375,1,1],[2378],[2379],[2380,1,1],[2383,1],[2385],[2386,1,1],[2389,1],[2391,1,1,1,1],[2396,1,1,1],[2400,1],[2402,1,1],[2405,1],[2407],[2408,1],[2410,1,1],[2413],[2414],[2415,1],[2417,1],[2419],[2420,1],[2422,1,1],[2425],[2426,1],[2428],[2429],[2430],[2431],[2432],[2433],[2434,1,1,1],[2438],[2439,1,1],[2442,1,1,1],[2446,1],[2448],[2449,1],[2451,1,1],[2454,1,1,1,1],[2459],[2460],[2461],[2462,1],[2464],[2465,1],[2467],[2468,1,1],[2471,1],[2473,1],[2475],[2476],[2477],[2478,1,1,1],[2482],[2483,1,1],[2486],[2487],[2488,1],[2490,1],[2492],[2493],[2494,1],[2496],[2497,1,1],[2500,1],[2502,1],[2504],[2505],[2506,1],[2508,1],[2510,1,1],[2513,1,1],[2516,1],[2518],[2519,1],[2521,1,1],[2524],[2525,1],[2527,1],[2529],[2530],[2531,1],[2533],[2534,1],[2536],[2537,1],[2539,1],[2541],[2542],[2543],[2544,1,1],[2547,1,1],[2550,1],[2552],[2553,1],[2555,1,1,1],[2559,1],[2561,1],[2563,1,1,1],[2567,1,1],[2570],[2571,1,1],[2574],[2575,1,1],[2578],[2579,1,1,1,1],[2584],[2585],[2586,1,1],[2589,1,1],[2592,1,1,1,1,1],[2598],[2599,1],[2601,1],[2603],[2604],[2605],[2606,1],[2608],[2609],[2610],[2611],[2612,1,1],[2615,1,1],[2618],[2619],[2620,1],[2622],[2623],[2624],[2625],[2626],[2627,1],[2629,1],[2631],[2632],[2633,1],[2635,1],[2637],[2638],[2639,1],[2641,1],[2643],[2644],[2645,1],[2647],[2648,1,1,1],[2652,1],[2654,1,1],[2657,1,1],[2660,1,1],[2663,1,1],[2666,1,1],[2669,1,1,1],[2673],[2674],[2675,1],[2677],[2678,1],[2680,1],[2682],[2683],[2684,1],[2686],[2687,1,1],[2690],[2691],[2692],[2693,1],[2695],[2696,1,1],[2699,1],[2701],[2702,1],[2704],[2705],[2706,1,1,1],[2710],[2711],[2712],[2713,1],[2715,1],[2717,1,1],[2720,1],[2722],[2723,1,1],[2726,1,1],[2729,1,1],[2732],[2733,1],[2735],[2736,1],[2738],[2739,1,1],[2742,1],[2744,1,1,1],[2748,1,1,1],[2752,1],[2754,1],[2756],[2757,1],[2759,1],[2761,1],[2763,1],[2765,1,1,1,1],[2770],[2771,1,1,1],[2775],[2776],[2777,1],[2779,1],[2781,1],[2783],[2784],[2785,1,1],[2788,1],[2790],[2791,1],[2793,1],[2795,1],[2797,1],[2799,1],[2801,1],[2803,1,1],[2806,1,1],[2809,1,1],[2812],[2813,1],[2815,1],[2817,1,1,1],[2821,1],[2823,1],[2825,1,1],[2828],[2829],[2830],[2831,1,1],[2834,1,1,1],[2838],[2839,1],[2841,1,1],[2844],[2845,1],[2847],[2848,1],[2850,1,1],[2853,1],[2855,1],[2857,1],[2859,1],[2861,1],[2863,1],[2865],[2866,1],[2868,1],[2870],[2871,1],[2873,1],[2875,1],[2877],[2878,1,1],[2881,1,1],[2884,1],[2886],[2887],[2888,1],[2890],[2891,1,1],[2894],[2895,1],[2897],[2898],[2899,1],[2901,1],[2903],[2904,1,1,1],[2908],[2909,1],[2911,1,1,1],[2915,1,1],[2918,1],[2920,1],[2922],[2923,1],[2925,1,1],[2928,1,1],[2931,1,1],[2934,1],[2936,1,1],[2939],[2940],[2941,1],[2943],[2944,1],[2946,1],[2948],[2949,1],[2951,1],[2953],[2954,1],[2956,1],[2958,1],[2960],[2961,1,1],[2964,1],[2966,1],[2968,1,1],[2971,1],[2973],[2974,1,1,1],[2978,1,1],[2981,1,1],[2984,1,1,1,1],[2989,1],[2991],[2992],[2993],[2994],[2995,1,1,1,1],[3000,1,1],[3003,1],[3005,1],[3007,1,1,1],[3011],[3012,1],[3014,1],[3016],[3017],[3018,1],[3020,1,1,1],[3024],[3025],[3026],[3027],[3028],[3029],[3030],[3031,1],[3033,1],[3035,1],[3037,1,1,1,1],[3042,1],[3044,1],[3046,1],[3048,1],[3050],[3051,1],[3053],[3054],[3055,1],[3057,1],[3059,1,1],[3062,1,1,1],[3066],[3067],[3068,1,1,1,1],[3073,1],[3075],[3076,1],[3078,1],[3080,1,1],[3083,1],[3085,1,1,1],[3089,1],[3091],[3092],[3093],[3094],[3095,1],[3097],[3098,1],[3100,1],[3102],[3103],[3104],[3105],[3106,1],[3108,1],[3110],[3111],[3112],[3113,1],[3115],[3116,1],[3118,1],[3120],[3121],[3122],[3123,1,1],[3126],[3127],[3128],[3129,1],[3131,1],[3133],[3134,1,1,1],[3138,1,1,1],[3142,1,1],[3145,1],[3147],[3148,1],[3150,1,1],[3153],[3154,1],[3156],[3157,1],[3159,1],[3161,1,1],[3164,1],[3166],[3167,1],[3169,1,1,1],[3173,1],[3175,1,1,1,1],[3180],[3181,1],[3183,1,1],[3186],[3187,1,1],[3190,1,1],[3193,1],[3195],[3196,1,1,1],[3200],[3201],[3202,1,1,1],[3206],[3207,1,1],[3210,1],[3212,1],[3214],[3215,1],[3217,1,1,1,1,1],[3223,1],[3225,1],[3227,1],[3229],[3230],[3231,1,1,1,1,1,1],[3238],[3239,1],[3241],[3242],[3243],[3244,1],[3246,1],[3248,1],[3250],[3251,1],[3253,1],[3255,1],[3257,1],[3259,1],[3261],[3262],[3263,1],[3265],[3266,1,1,1],[3270,1],[3272],[3273,1],[3275,1],[3277,1],[3279,1],[3281],[3282],[3283,1],[3285,1],[3287,1,1,1],[3291,1],[3293,1],[3295,1],[3297],[3298],[3299],[3300],[3301],[3302,1],[3304,1],[3306,1],[3308,1,1,1],[3312,1],[3314],[3315,1],[3317],[3318],[3319],[3320,1,1],[3323],[3324,1],[3326,1,1],[3329,1],[3331,1,1,1,1],[3336,1],[3338,1],[3340],[3341,1],[3343,1],[3345,1],[3347,1],[3349],[3350,1,1,1],[3354,1,1],[3357,1],[3359,1],[3361],[3362],[3363,1],[3365,1],[3367,1],[3369,1,1],[3372],[3373,1],[3375],[3376],[3377,1,1,1,1],[3382,1],[3384,1],[3386],[3387,1],[3389],[3390],[3391,1,1],[3394],[3395,1],[3397,1,1,1,1,1,1],[3404],[3405,1],[3407,1],[3409],[3410],[3411,1,1],[3414],[3415,1],[3417],[3418,1],[3420],[3421,1,1,1],[3425,1],[3427,1,1],[3430,1,1,1,1],[3435,1],[3437],[3438,1],[3440,1],[3442,1],[3444,1],[3446],[3447,1,1,1],[3451],[3452,1],[3454],[3455,1,1,1,1],[3460],[3461],[3462],[3463],[3464,1],[3466],[3467],[3468],[3469,1,1,1,1],[3474,1],[3476,1,1,1],[3480],[3481,1],[3483,1],[3485],[3486,1,1],[3489,1],[3491],[3492,1,1],[3495],[3496],[3497,1,1],[3500],[3501,1],[3503,1,1,1,1],[3508,1],[3510,1,1],[3513,1,1],[3516,1],[3518,1,1,1],[3522,1,1],[3525,1,1],[3528],[3529,1],[3531,1,1],[3534,1],[3536,1],[3538],[3539],[3540,1,1,1],[3544,1,1],[3547,1],[3549],[3550,1,1],[3553,1,1,1],[3557],[3558,1],[3560,1,1,1],[3564],[3565,1],[3567],[3568,1],[3570,1,1],[3573,1,1],[3576],[3577],[3578,1],[3580,1,1],[3583,1,1],[3586,1],[3588,1],[3590,1],[3592],[3593,1],[3595,1,1],[3598,1],[3600,1,1],[3603],[3604],[3605,1],[3607],[3608],[3609,1,1],[3612,1],[3614,1,1],[3617,1],[3619,1],[3621],[3622,1],[3624,1],[3626,1,1],[3629,1],[3631,1],[3633],[3634,1],[3636],[3637,1],[3639],[3640,1],[3642,1,1],[3645,1],[3647],[3648],[3649,1],[3651,1],[3653],[3654],[3655],[3656,1],[3658,1],[3660,1,1],[3663,1],[3665],[3666,1,1],[3669,1],[3671,1],[3673,1,1,1],[3677,1],[3679,1],[3681],[3682,1,1],[3685,1,1,1],[3689],[3690,1,1],[3693,1],[3695,1],[3697,1],[3699],[3700,1],[3702],[3703,1],[3705,1,1,1,1],[3710,1],[3712],[3713],[3714,1],[3716],[3717,1,1,1],[3721],[3722],[3723,1,1,1,1],[3728],[3729],[3730,1,1,1],[3734,1],[3736,1],[3738],[3739],[3740],[3741,1,1],[3744,1],[3746],[3747,1],[3749],[3750,1,1],[3753,1],[3755],[3756,1],[3758],[3759,1,1],[3762,1,1],[3765],[3766,1],[3768],[3769],[3770],[3771],[3772,1],[3774,1,1,1,1,1],[3780],[3781,1],[3783,1,1],[3786,1],[3788,1],[3790],[3791,1,1],[3794,1],[3796],[3797,1],[3799],[3800,1],[3802],[3803],[3804],[3805,1,1],[3808],[3809,1],[3811,1],[3813,1,1],[3816,1],[3818,1],[3820,1],[3822,1],[3824,1],[3826],[3827,1,1,1,1],[3832],[3833],[3834,1,1,1,1],[3839],[3840],[3841,1,1,1,1],[3846,1],[3848],[3849,1,1],[3852,1],[3854,1,1],[3857,1,1,1],[3861,1],[3863,1],[3865],[3866,1],[3868],[3869,1,1],[3872],[3873],[3874,1],[3876],[3877,1,1,1],[3881,1],[3883],[3884,1,1],[3887],[3888],[3889,1],[3891],[3892],[3893,1,1,1],[3897,1,1,1],[3901,1,1],[3904,1],[3906,1],[3908,1,1],[3911],[3912,1],[3914,1,1],[3917,1],[3919,1,1],[3922],[3923,1],[3925,1],[3927],[3928,1,1,1],[3932,1,1],[3935,1,1],[3938,1,1,1],[3942],[3943,1],[3945,1],[3947,1,1],[3950,1],[3952],[3953,1,1,1,1],[3958,1,1],[3961,1],[3963],[3964,1],[3966,1,1],[3969,1],[3971,1],[3973,1],[3975,1,1],[3978],[3979],[3980,1,1,1],[3984],[3985,1],[3987,1],[3989,1,1,1],[3993],[3994,1,1,1,1],[3999],[4000,1],[4002,1,1],[4005,1,1],[4008,1],[4010,1],[4012,1,1],[4015],[4016,1],[4018,1],[4020],[4021,1],[4023],[4024],[4025,1,1],[4028,1],[4030],[4031,1],[4033],[4034,1,1,1,1],[4039,1],[4041,1,1,1],[4045],[4046,1],[4048,1],[4050],[4051,1],[4053,1,1],[4056],[4057],[4058],[4059,1,1],[4062,1],[4064,1],[4066,1],[4068,1],[4070],[4071],[4072,1],[4074],[4075],[4076],[4077],[4078,1],[4080],[4081],[4082,1,1],[4085],[4086,1],[4088,1,1],[4091],[4092,1,1],[4095,1],[4097],[4098,1,1],[4101],[4102],[4103,1],[4105,1],[4107],[4108,1],[4110,1],[4112],[4113,1],[4115],[4116,1],[4118],[4119],[4120,1,1],[4123],[4124,1,1],[4127,1],[4129,1],[4131,1],[4133],[4134],[4135,1,1],[4138,1,1,1],[4142,1],[4144,1],[4146],[4147],[4148],[4149],[4150,1],[4152,1],[4154,1,1,1],[4158,1,1],[4161],[4162],[4163,1,1,1,1],[4168],[4169],[4170,1,1],[4173,1],[4175,1,1],[4178,1],[4180],[4181,1],[4183,1],[4185],[4186,1],[4188,1],[4190,1,1,1],[4194,1],[4196,1],[4198,1,1],[4201],[4202],[4203,1],[4205,1,1],[4208,1,1],[4211],[4212],[4213,1],[4215],[4216,1],[4218,1],[4220,1,1],[4223,1],[4225,1,1],[4228,1,1,1],[4232],[4233,1,1,1,1,1,1],[4240],[4241],[4242,1],[4244,1,1,1],[4248],[4249,1],[4251,1],[4253,1],[4255,1],[4257,1,1],[4260,1],[4262],[4263],[4264,1],[4266,1,1],[4269],[4270,1,1],[4273],[4274,1],[4276],[4277,1],[4279],[4280,1,1],[4283],[4284,1],[4286,1,1,1,1],[4291,1,1],[4294,1],[4296,1],[4298,1],[4300],[4301,1],[4303],[4304],[4305,1],[4307],[4308,1],[4310],[4311,1],[4313],[4314,1,1],[4317,1],[4319],[4320,1,1,1],[4324,1,1],[4327,1,1],[4330,1],[4332],[4333,1],[4335,1,1],[4338],[4339],[4340,1],[4342,1],[4344,1],[4346,1],[4348,1,1,1,1],[4353,1],[4355,1,1],[4358,1],[4360],[4361,1,1],[4364],[4365,1],[4367,1,1],[4370,1,1,1],[4374],[4375,1],[4377,1,1,1,1],[4382],[4383,1,1],[4386],[4387],[4388],[4389],[4390,1],[4392,1],[4394,1],[4396,1],[4398,1,1,1],[4402,1],[4404,1],[4406],[4407,1,1,1,1],[4412,1],[4414],[4415],[4416,1,1],[4419,1],[4421],[4422,1],[4424,1,1],[4427],[4428,1],[4430],[4431,1],[4433,1,1],[4436,1],[4438],[4439,1],[4441,1],[4443,1],[4445],[4446],[4447,1],[4449],[4450,1,1,1],[4454],[4455,1],[4457],[4458,1],[4460],[4461,1],[4463,1,1],[4466],[4467,1,1,1],[4471,1,1],[4474,1],[4476],[4477,1],[4479],[4480],[4481,1],[4483,1,1,1],[4487,1],[4489,1],[4491,1,1],[4494,1,1],[4497,1,1],[4500,1],[4502,1],[4504,1],[4506,1],[4508,1],[4510,1,1,1],[4514,1],[4516,1],[4518,1],[4520,1],[4522,1],[4524,1],[4526,1,1],[4529,1],[4531,1,1],[4534,1,1],[4537],[4538],[4539],[4540,1],[4542,1,1],[4545],[4546],[4547,1],[4549,1,1],[4552,1,1],[4555,1,1],[4558],[4559,1,1],[4562,1],[4564,1],[4566],[4567],[4568],[4569,1,1],[4572,1,1],[4575],[4576,1,1],[4579],[4580,1,1],[4583,1,1,1],[4587],[4588],[4589,1],[4591],[4592,1,1],[4595,1],[4597],[4598],[4599,1],[4601,1],[4603,1,1],[4606,1],[4608],[4609],[4610],[4611,1,1],[4614,1],[4616,1],[4618],[4619,1],[4621,1],[4623,1],[4625],[4626],[4627,1,1],[4630],[4631,1,1,1],[4635],[4636],[4637,1,1],[4640,1],[4642,1],[4644],[4645,1],[4647],[4648],[4649],[4650,1,1],[4653],[4654],[4655],[4656,1],[4658],[4659],[4660,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],[4677],[4678],[4679,1],[4681,1],[4683,1,1],[4686,1,1],[4689],[4690,1,1],[4693],[4694,1,1],[4697,1],[4699],[4700,1],[4702,1],[4704,1],[4706],[4707,1,1],[4710],[4711,1],[4713],[4714,1],[4716,1,1,1],[4720],[4721,1],[4723,1],[4725,1,1],[4728,1],[4730,1,1,1],[4734,1,1],[4737,1],[4739,1,1],[4742,1],[4744,1,1,1],[4748,1],[4750,1,1,1,1,1,1],[4757],[4758,1],[4760],[4761,1],[4763,1],[4765],[4766,1],[4768,1,1],[4771,1,1,1],[4775],[4776,1,1],[4779],[4780],[4781,1],[4783,1,1,1],[4787],[4788,1],[4790,1,1,1,1],[4795],[4796,1],[4798,1],[4800],[4801],[4802,1],[4804],[4805,1,1],[4808,1],[4810],[4811],[4812,1],[4814],[4815,1],[4817,1],[4819],[4820,1,1,1],[4824],[4825],[4826,1],[4828],[4829,1],[4831],[4832],[4833],[4834],[4835,1],[4837,1],[4839],[4840,1,1],[4843,1],[4845,1],[4847],[4848,1],[4850],[4851,1],[4853,1],[4855,1],[4857],[4858,1,1],[4861,1],[4863,1,1],[4866,1],[4868,1],[4870,1,1],[4873,1],[4875,1,1,1],[4879,1],[4881],[4882,1],[4884,1],[4886],[4887],[4888],[4889,1,1],[4892],[4893,1,1,1],[4897,1,1,1,1],[4902],[4903,1],[4905,1],[4907],[4908,1],[4910],[4911],[4912,1],[4914,1,1],[4917,1],[4919,1],[4921,1],[4923,1,1,1],[4927,1],[4929,1,1],[4932,1,1],[4935],[4936],[4937,1],[4939],[4940,1],[4942],[4943,1],[4945,1],[4947,1,1],[4950,1],[4952,1],[4954],[4955,1],[4957,1],[4959,1,1,1,1],[4964,1],[4966,1],[4968,1],[4970,1,1,1,1],[4975,1,1,1],[4979,1,1],[4982,1,1,1],[4986,1],[4988],[4989,1],[4991],[4992,1],[4994,1],[4996],[4997,1],[4999,1,1],[5002],[5003,1],[5005],[5006,1],[5008,1],[5010,1],[5012],[5013,1,1],[5016,1,1],[5019],[5020],[5021,1],[5023],[5024],[5025],[5026,1,1],[5029,1,1,1,1],[5034,1],[5036],[5037],[5038,1,1,1],[5042,1],[5044],[5045,1],[5047],[5048],[5049],[5050,1,1],[5053,1],[5055,1],[5057,1],[5059,1],[5061,1,1],[5064,1],[5066],[5067,1],[5069,1,1],[5072,1,1],[5075,1,1],[5078,1],[5080,1],[5082,1],[5084],[5085,1],[5087,1,1],[5090],[5091,1],[5093],[5094,1,1],[5097],[5098,1,1],[5101,1],[5103,1,1],[5106],[5107,1,1,1],[5111],[5112,1],[5114,1],[5116],[5117,1],[5119,1,1],[5122],[5123,1,1,1],[5127],[5128],[5129,1],[5131,1],[5133,1,1],[5136],[5137],[5138,1],[5140,1],[5142,1,1],[5145],[5146,1],[5148,1],[5150,1],[5152,1],[5154],[5155,1,1],[5158,1,1],[5161],[5162,1],[5164,1,1],[5167],[5168,1],[5170,1],[5172,1,1],[5175,1],[5177,1,1],[5180,1],[5182],[5183],[5184,1],[5186],[5187,1,1],[5190,1],[5192,1],[5194,1,1,1],[5198,1,1],[5201,1,1,1,1],[5206,1],[5208],[5209,1],[5211,1,1,1],[5215],[5216,1,1,1,1],[5221],[5222],[5223,1],[5225,1],[5227,1],[5229],[5230,1],[5232],[5233],[5234,1,1],[5237,1,1,1],[5241,1,1],[5244,1],[5246,1],[5248],[5249],[5250,1],[5252,1,1],[5255],[5256,1],[5258,1],[5260,1],[5262,1],[5264,1],[5266,1,1],[5269],[5270,1,1],[5273,1,1],[5276],[5277],[5278,1],[5280],[5281,1],[5283],[5284,1],[5286],[5287,1],[5289,1],[5291,1,1,1,1],[5296,1],[5298],[5299],[5300],[5301,1,1],[5304],[5305,1],[5307,1],[5309,1],[5311],[5312,1,1,1],[5316,1,1],[5319,1],[5321,1],[5323],[5324,1],[5326,1],[5328,1],[5330,1],[5332,1],[5334,1],[5336,1],[5338,1,1],[5341,1],[5343,1],[5345],[5346,1],[5348,1],[5350,1],[5352,1],[5354,1],[5356,1,1,1],[5360,1],[5362],[5363,1,1],[5366,1,1],[5369],[5370,1,1],[5373,1],[5375],[5376,1],[5378],[5379,1,1],[5382,1],[5384,1,1],[5387,1],[5389],[5390,1],[5392],[5393,1],[5395,1,1,1],[5399],[5400],[5401,1],[5403],[5404,1,1,1],[5408,1,1],[5411],[5412],[5413,1,1,1],[5417],[5418,1,1,1],[5422,1],[5424,1,1,1,1],[5429],[5430,1,1,1],[5434,1],[5436,1,1],[5439],[5440,1,1],[5443,1,1,1],[5447,1,1],[5450,1],[5452,1],[5454,1,1],[5457],[5458,1],[5460,1],[5462,1],[5464],[5465,1],[5467,1],[5469],[5470,1,1,1],[5474,1,1,1],[5478,1],[5480,1],[5482,1,1,1,1,1,1],[5489,1],[5491],[5492,1],[5494,1,1,1],[5498,1,1,1,1],[5503,1],[5505,1],[5507,1,1],[5510],[5511],[5512],[5513,1,1],[5516,1],[5518],[5519],[5520],[5521,1],[5523,1],[5525],[5526,1],[5528,1],[5530,1],[5532,1],[5534],[5535,1],[5537,1,1],[5540],[5541,1],[5543,1],[5545,1,1],[5548],[5549,1,1],[5552,1],[5554,1],[5556],[5557,1],[5559],[5560],[5561],[5562,1],[5564,1,1,1],[5568,1,1,1],[5572],[5573],[5574,1,1,1,1],[5579],[5580],[5581,1],[5583,1],[5585,1,1,1],[5589,1,1],[5592,1],[5594],[5595,1],[5597,1],[5599,1,1],[5602,1],[5604,1],[5606,1],[5608,1],[5610],[5611,1,1],[5614,1],[5616,1,1],[5619],[5620,1],[5622],[5623,1,1],[5626,1,1,1,1],[5631],[5632,1,1,1],[5636,1,1],[5639,1,1],[5642,1],[5644,1,1],[5647],[5648,1],[5650],[5651,1,1],[5654],[5655],[5656],[5657,1],[5659,1],[5661,1,1,1,1],[5666,1,1,1,1,1,1,1],[5674],[5675],[5676,1,1],[5679,1],[5681,1],[5683,1],[5685],[5686],[5687,1],[5689,1,1],[5692,1],[5694,1,1,1,1],[5699,1],[5701,1,1,1],[5705,1],[5707,1,1,1],[5711,1],[5713,1],[5715,1,1],[5718,1,1],[5721],[5722,1,1],[5725],[5726],[5727,1],[5729,1],[5731,1],[5733],[5734],[5735],[5736,1],[5738,1],[5740],[5741],[5742],[5743,1,1],[5746],[5747,1],[5749],[5750,1,1],[5753,1],[5755],[5756,1,1],[5759,1],[5761,1],[5763,1],[5765,1,1],[5768,1,1],[5771,1],[5773],[5774,1,1,1,1,1,1,1,1],[5783],[5784,1,1,1],[5788,1],[5790],[5791,1],[5793,1,1,1],[5797,1],[5799,1,1,1,1],[5804,1],[5806,1,1,1],[5810,1,1],[5813],[5814],[5815,1,1],[5818,1],[5820,1],[5822,1,1],[5825,1,1],[5828,1,1],[5831],[5832],[5833],[5834,1,1],[5837,1,1],[5840],[5841,1],[5843,1],[5845,1,1],[5848],[5849,1],[5851],[5852,1],[5854],[5855,1],[5857,1,1,1],[5861,1],[5863],[5864],[5865],[5866,1],[5868,1,1,1,1],[5873,1],[5875],[5876,1],[5878,1,1,1],[5882,1,1,1,1],[5887],[5888],[5889,1],[5891,1,1],[5894],[5895],[5896,1,1,1],[5900],[5901,1],[5903,1,1],[5906,1],[5908],[5909],[5910,1,1],[5913,1,1,1,1],[5918],[5919,1,1],[5922,1],[5924],[5925,1,1],[5928],[5929,1],[5931],[5932,1,1,1],[5936,1],[5938],[5939],[5940,1],[5942],[5943,1,1,1],[5947,1,1],[5950],[5951],[5952],[5953],[5954,1],[5956,1,1],[5959],[5960,1],[5962],[5963,1],[5965],[5966,1,1],[5969,1],[5971],[5972],[5973,1],[5975],[5976,1,1,1],[5980,1,1],[5983],[5984],[5985,1,1,1],[5989,1],[5991],[5992],[5993,1],[5995],[5996,1],[5998],[5999,1,1],[6002],[6003],[6004,1],[6006],[6007,1],[6009,1],[6011,1],[6013,1],[6015,1],[6017,1],[6019,1],[6021],[6022,1,1],[6025,1],[6027,1],[6029],[6030,1],[6032],[6033,1,1],[6036,1],[6038,1,1,1,1],[6043],[6044,1,1],[6047],[6048,1],[6050,1],[6052],[6053],[6054,1],[6056],[6057],[6058,1],[6060,1],[6062,1],[6064],[6065],[6066,1],[6068],[6069,1],[6071,1,1,1],[6075,1],[6077],[6078,1],[6080,1],[6082,1],[6084],[6085,1],[6087,1,1],[6090],[6091,1],[6093,1,1],[6096],[6097],[6098,1,1],[6101,1],[6103,1],[6105,1],[6107],[6108,1,1],[6111],[6112],[6113],[6114],[6115,1,1,1],[6119,1],[6121],[6122],[6123],[6124,1,1],[6127,1],[6129,1,1],[6132,1,1],[6135,1,1,1],[6139,1,1],[6142],[6143,1,1],[6146],[6147,1,1],[6150],[6151],[6152,1],[6154],[6155,1,1],[6158,1],[6160,1],[6162],[6163,1,1],[6166,1],[6168,1],[6170,1,1],[6173,1,1],[6176,1,1],[6179,1],[6181],[6182],[6183,1],[6185],[6186,1,1,1],[6190],[6191,1],[6193],[6194,1],[6196,1,1,1,1],[6201],[6202],[6203,1,1,1],[6207,1],[6209,1,1],[6212,1],[6214,1],[6216],[6217],[6218,1,1],[6221,1,1],[6224,1],[6226,1],[6228,1],[6230,1],[6232],[6233,1,1],[6236,1],[6238,1],[6240,1],[6242,1,1],[6245,1,1],[6248,1,1,1],[6252,1],[6254,1,1,1],[6258],[6259,1],[6261,1,1],[6264,1,1],[6267,1],[6269,1,1],[6272],[6273,1,1,1],[6277,1,1],[6280,1],[6282,1],[6284],[6285,1],[6287,1],[6289,1],[6291,1,1,1],[6295,1,1],[6298,1],[6300,1],[6302,1,1],[6305,1,1],[6308],[6309],[6310,1],[6312,1],[6314],[6315,1,1],[6318,1],[6320,1,1],[6323,1],[6325,1,1],[6328],[6329,1,1,1,1,1,1,1,1,1,1,1],[6341,1],[6343,1,1,1,1],[6348,1,1],[6351,1,1],[6354],[6355],[6356,1],[6358],[6359,1,1],[6362,1],[6364,1],[6366],[6367,1,1],[6370,1,1],[6373,1,1],[6376],[6377],[6378],[6379,1],[6381],[6382,1,1,1],[6386],[6387],[6388,1],[6390],[6391],[6392],[6393],[6394],[6395],[6396,1,1],[6399,1,1,1,1],[6404,1],[6406,1],[6408,1],[6410,1],[6412,1,1],[6415],[6416],[6417,1],[6419,1],[6421,1],[6423,1,1],[6426,1,1],[6429,1,1],[6432],[6433],[6434],[6435],[6436,1,1],[6439,1],[6441],[6442,1],[6444],[6445],[6446,1],[6448,1,1],[6451,1],[6453,1],[6455,1],[6457,1],[6459],[6460,1,1],[6463,1],[6465,1,1,1],[6469,1],[6471,1],[6473],[6474,1],[6476,1],[6478,1,1],[6481,1],[6483,1],[6485,1],[6487],[6488,1],[6490],[6491],[6492,1],[6494],[6495],[6496,1,1],[6499],[6500,1],[6502,1,1,1],[6506,1],[6508,1],[6510,1],[6512],[6513],[6514],[6515,1],[6517,1,1],[6520,1],[6522,1],[6524,1,1,1],[6528],[6529,1],[6531,1,1],[6534],[6535],[6536],[6537],[6538,1],[6540],[6541],[6542,1],[6544],[6545],[6546,1,1],[6549,1,1],[6552],[6553,1,1],[6556,1],[6558],[6559,1,1],[6562,1,1],[6565,1,1],[6568,1],[6570,1],[6572],[6573,1,1],[6576],[6577,1,1],[6580,1],[6582,1],[6584],[6585,1,1,1],[6589,1],[6591,1],[6593,1],[6595,1],[6597,1],[6599,1],[6601],[6602],[6603],[6604,1],[6606,1,1,1,1],[6611],[6612],[6613,1],[6615],[6616,1],[6618,1,1,1,1],[6623],[6624],[6625,1],[6627,1],[6629,1],[6631],[6632,1],[6634],[6635,1],[6637,1],[6639,1,1],[6642],[6643],[6644,1],[6646],[6647,1,1],[6650],[6651,1],[6653,1],[6655,1,1],[6658,1,1],[6661,1,1,1,1],[6666,1,1,1],[6670,1,1],[6673,1],[6675,1,1],[6678,1,1,1],[6682],[6683],[6684,1],[6686,1],[6688],[6689,1,1],[6692],[6693],[6694,1,1],[6697],[6698,1],[6700],[6701],[6702,1],[6704,1],[6706,1],[6708,1,1,1,1],[6713,1,1,1],[6717],[6718,1],[6720,1,1],[6723,1],[6725],[6726,1],[6728,1],[6730],[6731],[6732],[6733,1],[6735,1,1],[6738,1],[6740,1],[6742,1],[6744],[6745,1,1],[6748],[6749,1,1],[6752,1],[6754],[6755],[6756,1],[6758,1],[6760,1],[6762],[6763,1,1,1],[6767,1,1],[6770,1],[6772,1],[6774,1],[6776],[6777,1],[6779],[6780],[6781,1],[6783,1],[6785,1],[6787,1],[6789,1],[6791],[6792,1],[6794,1],[6796,1,1],[6799,1],[6801,1,1,1],[6805,1],[6807,1,1,1],[6811,1,1,1],[6815],[6816,1,1],[6819,1],[6821,1,1],[6824],[6825,1],[6827,1],[6829,1,1],[6832,1],[6834,1,1,1,1,1],[6840],[6841,1],[6843,1],[6845,1],[6847,1,1,1],[6851],[6852,1],[6854,1],[6856],[6857],[6858],[6859,1],[6861,1,1,1],[6865],[6866],[6867,1,1,1],[6871,1],[6873,1],[6875,1],[6877,1],[6879,1],[6881,1],[6883,1],[6885,1],[6887,1],[6889,1],[6891,1],[6893,1],[6895,1],[6897],[6898,1],[6900,1],[6902,1],[6904,1],[6906,1,1],[6909,1,1],[6912,1],[6914],[6915],[6916],[6917,1,1],[6920,1,1,1],[6924,1,1],[6927,1],[6929],[6930],[6931,1,1],[6934,1],[6936,1],[6938,1],[6940,1],[6942,1],[6944],[6945,1],[6947,1,1],[6950,1],[6952],[6953],[6954,1,1],[6957],[6958,1],[6960,1],[6962,1,1],[6965,1],[6967,1],[6969],[6970,1],[6972,1],[6974],[6975,1],[6977,1],[6979,1],[6981,1,1],[6984,1],[6986]],"ranks":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"Last Name":{"counts":[3,4,2,2,1,2,2,1,2,2,7,2,1,3,2,2,2,3,1,5,2,1,1,3,3,1,1,1,1,2,1,2,1,1,1,11,2,2,2,1,2,1,2,2,1,1,1,2,4,2,3,2,1,2,2,1,3,1,1,3,1,3,1,2,8,2,3,2,1,3,3,3,1,1,3,1,2,2,2,1,3,1,1,2,1,3,2,1,1,1,4,1,1,1,1,1,2,5,3,2,4,1,2,1,1,3,1,1,1,1,1,1,3,1,3,1,3,2,3,1,3,1,1,2,2,1,1,2,2,1,2,1,1,4,1,3,1,1,3,2,2,2,2,4,2,5,3,3,1,3,2,2,1,3,2,3,2,1,2,5,3,5,3,2,2,2,1,3,2,2,4,7,1,1,2,4,1,4,3,2,2,1,2,3,3,1,1,1,1,2,2,3,3,3,2,2,2,2,1,3,2,2,4,1,4,2,1,3,3,4,2,2,1,2,2,2,1,2,1,2,2,1,2,2,2,2,2,2,2,2,1,2,3,3,1,1,1,5,2,1,2,5,1,3,4,3,2,1,2,3,2,1,2,9,1,3,2,1,3,1,3,1,2,4,2,2,1,1,2,2,1,1,2,8,1,1,2,2,2,2,2,2,1,2,3,2,5,5,1,2,3,1,1,1,3,3,2,1,3,7,1,4,2,2,2,1,1,2,1,2,2,4,2,2,2,2,2,1,2,1,1,4,4,4,2,2,3,1,1,6,3,1,2,1,2,2,3,2,2,2,2,2,3,1,2,2,3,1,2,2,1,2,1,2,2,1,2,1,2,2,1,1,2,1,2,2,2,4,1,1,1,1,3,2,4,1,3,4,1,1,4,2,4,1,3,1,2,2,2,4,1,2,1,1,1,3,1,1,1,3,2,1,1,3,2,1,3,3,2,1,2,3,2,2,3,2,2,2,1,2,3,3,1,4,1,1,4,2,5,3,1,1,2,2,2,1,4,2,2,2,4,2,1,2,1,1,3,1,1,1,4,2,2,3,2,2,6,2,2,1,2,1,1,1,1,1,2,4,3,2,1,1,2,12,2,3,2,3,4,2,4,1,3,3,2,2,2,3,4,5,1,3,2,2,2,1,1,1,4,3,2,2,1,2,2,4,3,2,2,2,3,2,2,1,1,2,2,4,1,2,2,2,2,1,2,1,3,2,2,3,1,1,2,1,5,2,1,1,1,2,4,2,1,1,1,2,1,2,2,4,2,1,2,3,3,3,3,1,3,1,2,2,4,1,3,1,3,3,1,3,1,2,4,1,2,2,2,1,1,1,3,1,1,2,1,3,3,3,2,1,2,3,1,2,2,2,2,2,2,1,2,1,2,2,1,3,2,2,2,2,3,2,2,1,7,2,1,2,1,3,1,4,2,1,2,1,2,3,2,2,1,2,1,1,3,1,2,3,3,1,1,1,5,3,6,7,1,1,3,1,2,4,1,4,1,1,3,2,2,1,1,1,2,5,2,1,2,1,3,2,3,1,2,1,3,2,2,2,2,1,1,3,2,2,1,1,3,3,2,1,2,1,1,2,1,2,4,2,3,2,5,5,1,2,1,2,1,2,2,1,3,1,3,1,4,2,1,1,1,1,2,2,1,2,1,2,4,1,3,4,4,1,2,7,1,1,2,1,1,5,7,5,4,1,2,2,4,3,4,2,1,2,2,2,1,2,1,2,3,1,1,1,2,2,2,1,1,1,2,3,2,2,3,1,2,4,2,7,3,3,1,4,4,2,1,5,3,2,3,1,2,2,2,2,2,1,2,2,3,1,1,2,2,2,1,1,1,3,1,1,2,2,2,2,4,3,1,5,2,3,1,1,3,3,2,1,4,2,4,2,3,1,2,4,4,1,1,1,2,3,3,1,2,2,2,3,3,1,2,5,3,2,1,1,2,2,2,3,1,1,2,1,2,3,1,1,4,3,1,2,1,2,1,1,1,3,3,2,1,1,2,2,3,4,2,1,2,2,2,1,1,2,3,2,1,1,2,1,2,2,2,1,1,2,1,1,1,1,1,2,2,2,1,3,1,2,3,1,1,4,1,1,2,3,2,2,1,2,1,1,2,1,4,1,1,1,1,1,4,1,2,1,1,3,2,2,1,1,3,5,4,1,1,2,1,1,4,1,1,1,2,1,3,4,1,2,2,3,2,5,2,1,1,2,1,1,3,2,2,2,2,3,6,1,3,3,4,3,3,1,1,3,1,1,3,2,3,2,2,2,2,2,5,2,3,5,2,2,5,2,1,3,1,5,1,2,3,2,3,2,1,2,2,3,2,1,1,2,1,1,3,3,1,1,4,3,2,1,1,1,2,2,2,3,2,2,5,2,4,2,1,2,1,5,2,1,5,1,1,3,2,3,2,2,2,1,4,2,1,7,1,2,2,3,1,2,2,7,4,1,2,3,3,2,1,3,3,2,1,3,2,2,4,1,2,14,3,2,3,4,6,1,2,2,3,3,2,4,1,4,2,1,2,1,3,6,1,1,2,2,1,3,2,1,1,3,1,4,5,1,2,3,3,1,1,6,4,1,3,1,1,1,3,1,3,1,1,2,1,1,2,2,2,2,2,2,3,5,3,2,2,1,2,4,2,3,1,2,2,2,3,3,3,1,4,3,2,2,1,2,3,3,1,1,4,1,2,1,2,1,1,1,2,2,3,2,3,1,3,4,2,2,1,1,1,3,1,2,1,2,2,3,5,3,2,1,2,2,3,2,1,4,2,1,1,1,3,2,3,1,3,2,1,1,1,2,3,2,2,2,1,4,2,1,1,1,2,3,2,4,3,2,5,2,4,3,9,1,2,7,2,2,1,2,1,2,2,3,2,4,3,2,1,1,2,2,3,2,3,3,1,2,1,2,2,3,2,4,1,1,1,1,2,3,2,2,2,2,1,1,2,2,2,4,1,1,3,1,2,2,4,1,2,2,2,2,4,1,3,2,2,1,1,3,1,3,3,2,1,3,2,2,1,1,3,1,2,2,1,2,4,2,5,1,6,4,3,1,2,3,2,2,1,5,1,1,2,2,3,2,1,3,4,2,3,3,2,2,1,1,1,1,1,2,1,2,2,4,2,1,2,4,2,2,1,2,3,5,2,2,5,2,4,1,2,1,1,5,5,2,4,3,2,2,5,2,1,1,1,1,2,1,1,3,1,1,1,1,1,4,1,2,5,1,2,1,1,1,2,2,1,3,2,1,3,2,1,2,6,2,2,5,2,1,2,2,6,2,1,1,3,2,3,1,2,1,2,1,2,4,2,1,2,2,1,2,3,1,2,1,3,1,1,2,1,4,2,3,1,1,1,4,1,5,1,1,2,1,1,3,1,1,2,2,1,1,2,2,3,2,2,2,1,3,1,4,2,3,3,2,1,3,1,2,4,2,2,2,1,3,2,3,2,2,1,1,2,3,1,3,3,3,2,5,1,1,4,2,2,2,2,1,1,1,2,2,2,1,1,2,2,1,2,5,3,1,3,1,2,1,1,2,1,2,2,1,3,2,1,2,1,3,2,4,3,2,3,3,1,2,1,3,7,2,3,3,1,1,3,1,6,1,2,2,2,1,2,2,3,2,3,6,1,3,2,2,1,1,2,3,1,2,3,3,1,2,2,1,1,7,2,1,2,4,4,1,3,2,2,1,3,4,2,1,3,1,1,1,4,1,6,5,4,3,2,2,3,2,3,1,2,2,1,2,1,4,1,1,4,2,1,1,5,4,2,3,1,3,1,1,3,1,3,2,3,2,1,1,1,2,2,5,2,2,5,1,2,2,4,3,1,3,1,2,2,2,1,3,3,2,2,3,2,1,2,1,3,2,1,1,1,1,3,1,4,5,1,3,4,6,2,2,2,2,2,7,3,1,2,2,5,1,3,3,1,2,1,2,2,2,1,3,1,1,4,2,7,2,1,2,1,1,4,3,2,1,3,4,2,1,4,1,3,1,5,3,2,2,1,1,1,1,2,3,5,3,2,2,1,1,3,3,1,3,1,2,1,1,1,2,2,2,1,2,2,2,2,1,2,1,4,2,1,1,2,2,2,1,1,2,1,1,1,1,1,1,2,3,1,2,3,2,1,3,2,1,3,4,4,1,4,1,1,1,2,1,1,1,1,1,1,3,1,2,2,2,6,3,1,4,2,3,2,2,1,2,2,2,2,1,1,3,2,7,4,3,2,2,2,3,2,1,2,1,2,1,2,1,1,1,1,4,3,1,1,2,2,4,1,3,2,7,1,2,2,7,2,2,1,1,5,2,4,2,2,1,3,1,1,6,3,2,1,4,2,2,1,4,2,2,2,2,2,1,1,1,5,1,2,2,2,2,2,2,2,2,2,5,1,2,2,5,2,2,1,1,2,2,2,1,2,1,2,1,2,1,2,2,1,2,2,2,1,1,1,2,1,2,1,1,5,1,1,2,1,8,6,2,1,7,1,4,2,1,2,2,3,1,2,1,3,6,3,1,2,3,3,1,1,9,2,1,1,1,1,2,2,3,2,1,2,3,1,2,4,1,3,2,2,2,2,3,1,1,1,1,2,2,2,12,3,1,1,2,2,1,1,2,3,1,3,3,4,2,3,2,5,3,4,2,2,4,1,1,1,3,2,2,4,2,2,2,2,1,1,2,2,2,3,4,2,3,6,7,3,1,3,3,1,2,2,2,2,1,1,2,1,4,1,2,2,1,4,1,2,1,3,1,1,3,1,2,8,5,2,1,3,1,5,1,2,2,2,2,2,2,2,1,1,1,2,2,1,3,2,3,2,1,4,2,4,1,1,3,2,1,3,2,1,3,1,1,1,1,4,4,1,1,3,1,3,2,1,1,1,2,4,2,1,1,2,1,2,2,2,1,1,2,4,1,2,1,1,2,1,3,2,2,2,4,5,1,1,2,1,1,2,1,1,3,1,2,1,1,2,2,5,2,1,3,2,4,1,2,1,1,3,1,2,2,2,3,1,1,3,2,2,2,2,4,2,1,3,2,3,1,2,3,1,3,1,1,2,2,1,9,1,1,2,3,1,17,6,3,1,2,2,2,2,3,3,3,2,2,2,3,2,2,1,1,3,2,2,3,2,1,1,5,1,1,1,2,1,2,2,6,1,2,1,1,2,3,2,1,3,1,2,2,1,1,1,2,1,1,1,3,3,2,2,2,1,2,3,4,1,4,4,2,2,1,2,3,1,2,1,1,2,1,1,1,1,2,2,3,2,1,1,4,2,1,3,5,1,2,1,2,2,1,2,1,5,1,2,1,2,2,3,2,4,3,2,2,2,3,2,2,3,1,3,4,1,3,1,1,4,1,4,2,1,1,2,3,1,3,3,1,3,2,1,2,2,3,1,3,3,2,4,2,1,1,5,2,3,1,7,3,2,2,1,3,3,2,2,3,3,2,1,19,2,2,4,2,2,3,1,1,3,1,2,3,4,1,1,9,1,1,1,1,1,1,2,1,3,1,5,5,2,1,2,3,2,3,1,3,2,1,2,2,1,1,1,2,1,1,1,1,1,3,1,2,2,2,3,3,1,1,4,2,4,4,2,1,2,2,2,2,1,1,2,1,3,1,1,2,1,1,3,1,1,3,1,1,1,1,1,3,1,3,1,1,3,5,3,1,1,2,1,2,2,2,1,1,3,5,2,1,1,3,2,3,4,1,1,4,1,1,2,3,4,3,1,2,2,2,8,2,1,2,2,2,2,2,2,2,2,3,9,4,2,6,1,2,3,1,1,2,7,3,2,6,4,5,2,4,1,5,2,2,2,3,1,2,1,6,2,2,1,1,1,2,1,2,1,3,2,3,2,1,2,2,1,3,4,2,4,1,1,2,1,1,2,1,4,2,2,1,2,2,2,3,4,1,2,1,1,1,4,2,1,4,2,1,4,4,2,5,1,3,2,1,1,2,3,4,3,1,1,4,4,3,1,10,2,1,2,3,1,2,1,1,1,2,2,5,1,1,1,1,2,3,2,1,1,3,2,1,1,1,1,1,3,4,2,3,2,1,1,2,1,3,2,4,2,1,2,3,4,1,3,2,2,1,1,2,1,2,3,2,3,4,1,2,1,1,1,1,2,5,2,3,3,1,2,1,3,1,1,3,2,3,3,3,2,3,2,2,1,3,2,3,1,1,3,1,3,2,2,2,4,1,3,4,3,2,2,3,1,3,4,3,1,1,1,1,1,2,5,1,2,2,1,3,3,1,3,3,4,3,2,3,2,1,2,2,2,1,1,4,3,2,1,2,1,3,1,1,2,1,1,2,1,4,1,1,3,1,2,2,1,2,2,4,1,2,1,2,2,2,1,2,2,1,1,2,1,2,1,2,1,1,1,2,2,2,2,2,2,3,2,4,2,5,1,2,1,4,3,2,3,2,2,2,4,2,1,4,12,1,2,3,5,3,2,4,2,1,1,2,1,2,1,6,1,2,2,1,3,3,1,2,2,2,2,3,2,2,1,2,3,1,3,1,3,4,2,2,2,1,2,2,5,2,2,3,1,2,2,3,1,1,1,3,2,2,1,3,2,3,2,1,3,1,1,1,2,1,1,2,2,1,1,1,2,2,2,5,3,1,2,1,2,2,2,2,4,1,1,1,2,2,3,1,1,3,2,2,2,2,3,2,2,3,2,2,8,1,3,2,2,1,1,1,1,2,2,1,2,2,1,2,5,1,1,2,2,1,1,2,1,2,2,2,3,5,1,1,2,1,7,3,1,4,3,2,2,1,1,1,2,5,3,1,5,1,6,3,1,3,1,4,3,1,1,4,1,1,2,2,4,2,4,3,4,2,1,1,5,1,3,2,2,1,1,1,3,1,1,4,6,1,4,5,1,2,1,3,4,3,1,1,3,2,1,3,4,5,2,1,2,3,4,2,2,1,1,3,5,4,2,4,2,3,4,2,2,1,1,3,8,2,2,4,3,3,1,2,5,4,2,1,2,1,2,2,2,1,1,4,2,5,2,3,1,6,1,2,1,2,2,2,2,6,2,1,2,6,2,1,2,1,1,1,2,1,1,1,1,1,2,1,3,1,2,1,2,2,1,1,1,4,1,2,2,1,1,2,2,3,1,2,1,4,1,2,1,1,1,3,3,1,1,2,3,2,1,2,2,2,4,3,1,2,4,2,3,2,2,3,3,3,2,1,1,1,3,4,4,1,1,5,3,2,4,3,4,5,3,1,4,1,4,2,5,1,3,2,4,3,2,3,2,4,1,1,1,1,2,2,1],"rows":[[6373,1,1],[934,1,1,1],[92,1],[5246,1],[4279],[6950,1],[3083,1],[208],[2244,1],[82,1],[1129,923,464,1,3474,94,1],[271,1],[852],[6816,1,1],[213,1],[3820,1],[1258,1],[2925,1,1],[2838],[5882,1,1,1,1],[3418,1],[1540],[6615],[6962,1,1],[5810,1,1],[1293],[6576],[1374],[1517],[3818,1],[1596],[573,1],[2712],[3299],[1172],[1823,1,1,1178,1,1771,339,1,1297,1,1],[891,1],[1133,1],[2274,1],[1009],[3031,1],[2351],[5843,1],[1010,1],[600],[4942],[6815],[6635,1],[3673,1,1,1],[6726,1],[4979,1,1],[5289,1],[3500],[3164,1],[2272,1],[717],[6647,1,1],[5233],[1878],[1527,1,1],[1727],[996,1,1],[4030],[6406,1],[1552,1,1,1,1,1,1,1],[4196,1],[3600,1,1],[3373,1],[3771],[3142,1,1],[5164,1,1],[6517,1,1],[2043],[6858],[1801,1,1],[6386],[4728,1],[6075,1],[3435,1],[5491],[6670,1,1],[2619],[2638],[6048,1],[6552],[6423,1,1],[2300,1],[6700],[6494],[3887],[1242,1,1,5725],[4454],[2973],[3999],[3755],[4202],[5562,1],[554,1,1,1,1],[6359,1,1],[1858,1],[2744,1,1,1],[3799],[1131,1],[1496],[2492],[6562,1,1],[4119],[6732],[6185],[4939],[705],[4658],[1280,1,1],[5938],[731,1,1],[4625],[4840,1,1],[3809,1],[584,1,1],[398],[445,1,1331],[1319],[3128],[1268,1],[2553,1],[2305],[5439],[2250,1],[5969,1],[2695],[6783,1],[3297],[3738],[1028,1,1360,1],[3376],[4889,1,1],[4248],[430],[2496,403,1],[2561,1],[3257,1],[4194,1],[3306,1],[141,1,5851,1],[4481,1],[3430,1,1,1,1],[5750,1,1],[4463,1,1],[1122],[932,276,1],[3923,1],[6212,1],[123],[3690,1,1],[4274,1],[291,1,1],[810,1],[751],[6103,1],[527,5180,1,1,1],[4433,1,1],[2266,1,1,1,1],[1311,1,1],[5849,1],[2859,1],[4301,1],[1860],[5379,1,1],[747,1],[6912,1],[545,1,1,1],[1530,1,1,442,1,1,1],[6916],[2414],[869,1],[5145,96,1,1],[6824],[105,1,6854,1],[0,1,1],[4213,1],[6970,1],[1773],[5336,1],[1650,1,1],[230,1,1],[2475],[4310],[1583],[4070],[5262,1],[4010,1],[3609,1,1],[6277,1,1],[2297,1,1],[1464,1],[2060,2787],[2601,1],[6877,1],[1571],[681,1,1],[2848,1],[6442,1],[3730,1,1,1],[5024],[4923,1,1,1],[5117,1],[5918],[6448,1,1],[702,1,1],[3717,1,1,1],[4431,1],[4447,1],[4262],[4796,1],[4142,1],[1605,5029],[3993],[1233,1],[1879],[2028,1],[6781,1],[2536],[4412,1],[988,1],[5936,1],[339,1],[5489,1],[4086,1],[3508,1],[1738,1],[2477],[537,1],[2575,1,1],[76,1,1],[312],[5650],[3103],[4034,1,1,1,1],[2641,1],[1687],[5861,1],[301,1,5247,1,1],[4024],[2510,1,1],[3291,1,2419,1],[4863,1,1],[2024,1],[149],[6653,1],[779,1,1],[628,1],[5249],[4851,1],[188,1,1,1,1,1,1,3069,1],[5300],[2032,1,1],[3407,1],[432],[5689,1,1],[1551],[6796,1,1],[5908],[1746,1],[267,1,1,1],[6421,1],[5390,1],[5864],[2428],[6101,1],[373,1],[2026],[6851],[5131,1],[2984,1,1,1,1,3448,1,1],[2686],[2448],[90,1],[3889,1],[2795,1],[5657,1],[5170,1],[3073,1],[3420],[5581,1],[5436,1,1],[5973,1],[2579,1,1,1,1],[3331,1,1,1,1],[3016],[3637,1],[971,1,1],[3883],[3186],[4134],[3854,1,1],[2018,1,1],[5080,1],[1844],[5198,1,1],[4750,1,1,1,1,1,1],[5362],[5430,1,1,1],[889,1],[3536,1],[2046,1],[1490],[4319],[487,1],[3349],[1543,1],[2537,1],[713,1,3541,1],[4540,1],[4436,1],[3345,1],[1203,1],[6481,1],[4800],[1657,1],[5875],[1235],[6248,1,1,1],[1094,1,1,1],[2752,1,1961,1],[2105,1],[4845,1],[329,1,1],[3927],[4097],[151,1,1696,3844,1,414],[2603,528,1],[3375],[6591,1],[2162],[2639,1],[6050,1],[1639,1,1],[4346,1],[380,1],[1201,1],[5763,1],[17,1],[2439,1,1],[5269],[4937,1],[2527,1],[5919,1,1],[2438],[4008,1],[1325,1],[3539],[6282,1],[3607],[443,1],[6637,1],[707],[1774,1],[112],[6471,1],[1434,1],[6857],[2284],[124,1],[5186],[5244,1],[6582,1],[6593,1],[3055,1,2680,1],[2460],[5580],[3261],[4935],[5270,1,1],[3971,1],[1510,1,418,1],[2186],[4367,1,1],[1071,1,1,1],[1743],[6915],[684,1,1,1],[6019,1],[2095,1,1,1],[1778],[1090,1,1],[5520],[5761,1],[94,1],[67,1],[4693,1632,1,1],[5020],[1889,1],[3739],[4757],[382],[439,1,4147],[3826],[5952],[2887],[875,1,1],[1394,1],[1734],[5229],[4025,1,1],[1405,1],[3528],[6745,1,1],[3746,650,1],[2801,1],[6381],[4945,1],[5013,1,1],[5552,1],[2462,1],[5743,1,1],[3129,1],[5818,1],[2888,1],[1940],[6078,1],[2739,1,1],[6348,1,1],[706],[4075,239,1,1],[359],[589],[6254,1,1,1],[4422,1],[4163,1,1,1,1],[2110,1,1],[2187],[3298],[6774,1],[305,1],[3273,1],[4147],[3410,76,1,1],[5150,1],[4589,1],[6902,1],[3085,1,1,1],[6323,1],[6490],[1981,1],[2830],[6077],[929,1,1],[4630],[4273],[1198],[5896,1,1,1],[4296,1],[3239,1],[4002,1,1],[240,1],[5138,1],[1628,1,1,4690,1,1],[335,1],[1822,3114],[1698],[1111,1],[2903],[1145],[2335],[1144],[4283],[2534,1],[4450,1,1,1],[6675,1,1],[6485,1],[3243],[3716],[6975,1],[1740,1091,1,1,2309,1,1,655,1,1,1,1],[3108,1],[4569,1,1],[3744,1],[2318,2448,1],[4190,1,1,1],[4105,1],[2369,1,1,1],[29],[6463,1,233],[4683,1,1],[6036,1],[3617,1],[3277,1],[660,1,1],[865,1,2518,1],[6399,1,1,1,1],[5924],[2223,1,1],[843,1],[6451,1],[4048,1],[233],[1099],[599],[1714,1,1,1],[2968,1,1],[4389,1346],[5206,1],[2705],[5148,1],[5727,1],[4228,1,1,1],[2696,1,1],[1372,1],[4066,1],[3329,1],[911,1,1],[5554,1],[1562,1],[6232],[5299],[1565,1],[6772,1],[1117,1,1,1],[5909],[595,1],[2255,1],[605,1],[5434,1],[5111],[6058,1],[3549],[5133,1,1],[541,1],[1937,1],[6261,1,1],[6865],[6513],[5281,1],[2682],[6196,1,1,1,1],[464,1],[1721],[2939],[6537],[2136,1],[3138,1,1,1],[4758,1],[1341],[3053],[4760],[5346,1],[2775],[1179,1],[3985,1],[1607,1,1,1],[6945,1],[4597],[6476,1],[5338,1,1],[3207,1,1],[4158,1,1],[4552,1,1],[958],[983,1,1],[3749],[5679,1],[4317,1],[3897,1,1,1],[5286],[2483,1,1],[332],[1176,1,1],[1307,1,1],[1780],[1616,1,1],[3848],[4392,1],[4893,1,1,1],[5733],[1047,1],[1891,1],[2966,1],[6643],[5534],[3201],[3326,1,1],[4598],[2674],[4183,1],[2334],[5837,1,1],[4603,1,1],[4135,1,1],[4216,1],[3984],[5360,1],[4053,1,1],[5895],[1684,1],[2868,1],[1162,1],[6066,1],[3246,1],[273,1],[4232],[796,1],[2487],[5841,1],[3824,1],[3390],[6553,1,1],[4917,1],[3649,1],[3736,1],[5296,1],[2521,1,1],[4129,1],[1199,1],[4149],[1067,1,2544,1,711,1,1],[828,609],[2530],[4873,1],[3608],[6720,1,1],[5049],[2064,1,1,1],[2873,1],[2632],[5929,1],[4833],[6236,1],[737,5991,1],[2293,1],[1736,1],[1473],[310,1],[5865],[655],[1845,1,1],[2624],[6704,1],[5061,1,1],[2122,1,1],[1771],[1228],[5734],[1104,1,1,1,1],[6565,1,1],[2951,1,2171,1,1,1],[523,1,1018,663,1,2969,1],[6190],[1817],[6829,1,1],[1749],[1504,1],[1452,1,1,1],[3564],[215,1,1,1],[1508],[400],[3975,1,1],[3781,1],[5034,1],[3808],[6193],[3721],[2956,1],[1659,4434,1,1,857],[6873,1],[1928],[845,1],[795],[97,1,1],[4298,1],[4124,1,1],[4689],[1344,1],[3780],[5513,1,1],[6469,1],[6252,1],[1853,1],[840,1],[4115],[1852],[3626,1,1],[2519,1],[6792,1],[1248],[1757],[744,1,1],[6821,1,1],[6580,1],[3054],[3578,1],[5280],[4810],[4564,1],[5400],[578,1],[4072,1,2194,1],[2133,1],[4220,1,1],[6733,1],[3455,1,1,1,1],[1674,1,3540,1070,1],[6544],[5753,1],[4579],[4487,1],[4991],[2742,1],[6060,1],[5511],[1814,1,1],[3712],[2055,1,1],[1857],[294,1,2783,1],[826,1],[1518],[2104],[5540],[2005],[2058,1],[6228,1],[1254],[5526,1],[4045],[3822,1],[6678,1,1,1],[22],[834,1,1],[3308,1,1,1],[4398,1,1,1],[5851],[668,1],[5482,1,1,1,1,1,1],[3603],[1895],[2285,1],[1375],[4180],[1154,1,1,1,1],[3397,1,1,1,1,1,1],[887,1,2692,1,1],[313,1,1,1],[5971],[6599,1],[6977,1],[4320,1,1,1],[3805,1,1],[677,1,1,1],[3634,1],[776],[172,1],[5101,1],[103,1],[4269],[219,1],[2784],[4997,1],[4335,1,1],[2174],[3557],[4610],[3590,1],[3753,1],[3212,1],[3892],[6096],[36],[2408,1],[4580,1,1],[2217,1],[1910,1],[4471,1,1],[3115],[1967,1],[3553,1,1,1],[6017,1],[3231,1,1,1,1,1,1],[6954,1,1],[3642,1,1],[3214],[4711,1,1586,1],[1519,1,1,1],[6506,1],[3230],[6661,1,1,1,1],[6155,1,1],[2934,1],[107,1,1],[5411],[6889,1],[954,1],[2853,1],[2645,1],[4723,1],[1062],[2813,1],[2606,1],[2422,1,1],[4215],[2476],[3363,1],[1549,1],[6214,1],[3942],[2352],[1506],[4208,1,1],[2129],[6047],[3253,1],[1969,1],[3014,1],[2920,1],[6203,1,1,1],[1137,1,1],[5848],[3503,1,1,1,1],[5255,471],[2082,1,1],[3891],[1744],[995,1240,3724],[5545,1,1],[6651,1],[5221],[2771,1,1,1],[690,1],[607,1,1,1],[39,1],[561,1,1],[4023],[6832,1],[5413,1,1,1],[2091,1,1,1],[1502],[5161],[667],[4249,1],[2191,1,1],[4690,1,1],[6432],[4882,1],[61,1],[4178,1],[1409,1,1],[4098,1,1],[11],[1678,1],[4439,1,654,1,1],[3583,1,1],[4443,1],[1713],[3340],[4514,1],[5343,1],[2061,1],[2978,1,1],[5832],[5594],[3148,1],[6791],[4992,1],[6242,1,1],[1215],[1600],[1789,1,1,1],[6098,1,1],[5560],[5759,1],[2644],[2684,1],[4618],[5610],[3462],[2375,1,1],[5366,1,1],[410,1],[3180],[2870],[4108,1],[4144,1],[6124,1,1],[4041,1,1,1],[3671,1],[4834],[2871,1],[6240,1],[1347,1],[2828],[3093],[2699,1],[6906,1,1],[5450,1],[1226],[4476],[4390,1],[2626],[4375,1],[1893,1],[5460,1],[1357],[2243],[1625,1],[3796],[198],[284],[6957],[868],[134,1],[509,1],[2016,1],[1004],[159,1,1],[3740],[4524,1],[1316,1,1],[5888],[4313],[3007,1,1,1],[6434],[5298],[3097,3444],[6022,1,1],[1512,1],[734,1],[2609],[611,1],[6068],[4888],[3210,1],[5863],[3287,1,1,1],[1271],[6162],[5783],[1338],[1379],[2478,1,1,1],[1227],[6841,1],[1093],[6897],[741,1,1],[4188,1],[321,1],[2461],[867],[6129,1,1],[5868,1,1,1,1],[136,1,1781,1],[2722],[5097],[5602,1],[290],[1301],[416,1,1,1],[3461],[4414],[3702],[74,1],[818],[621,1,1],[999,1,4168,1],[1147],[3629,1],[2356,1],[5910,1,1],[367,1],[4959,1,1,1,1],[5541,1],[6623],[4801],[5192,1],[1445],[5953],[6108,1,1],[3624,1],[1077,1],[2014,1],[1983,1],[2878,1,1],[3573,1,1,1159,1,1],[1561],[6924,1,1],[6147,1,1],[2434,1,1,1],[277,1,1],[3000,1,1],[4654],[5831],[138,1,1],[6201],[1333],[975,1,1],[3227,1],[2336,1,1],[1693,1],[4260,1],[1903,1],[4518,1],[2971,1],[3183,1,1,471,1],[5319,1],[4120,1,1],[1881,1,1,4570,1],[1054,1],[360,1],[3068,1,1,1,1],[3367,1],[6856],[4059,1,1],[3317],[1056,1,1,1,1],[6154],[2923,1],[423,1,1],[2506,1],[5440,1,1],[3547,1],[1257],[636,1],[4802,1],[4291,1,1],[205,1],[1352],[5622],[1945,1],[6182],[2302],[4082,1,1],[3190,1,1],[1688],[4427],[4510,1,1,1],[802,1,1],[5543,1],[1772],[2227],[5675],[164,1],[1065,1],[5284,1],[5676,1,1],[4798,1],[4964,1],[1032,1,1,1,1],[6742,1],[6382,1,1,1],[4905,1],[3460],[6595,1],[1002],[2230,1,1,1,1],[5465,1],[925],[5119,1,1,1103,1],[3323],[5048],[79,1,1],[5227,1],[5980,1,1],[1342,1],[6009,1],[2550,1],[2578],[5107,1,1,1],[3044,1],[2350],[1786,1,1,4517,1,1,437],[3639],[1812,1],[2446,1],[5266,1,1],[2482],[2400,1],[1193,1],[1533,1,1,1,1,281,1],[4138,1,1,1],[6688],[434,1],[4739,1,1],[1006,1,1],[207,1759],[3122],[5301,1,1],[5644,1,1],[2539,1],[1408],[3497,1,1],[3622,1],[4068,1],[6273,1,1,1],[1828],[3275,1],[1436,1884,1,1,794,1,2442,1,1,57,1,1,1,1],[49,1,1],[157,1],[2323,1,1],[4483,1,1,1],[3928,1,1,1,2263,1],[4388],[3285,1],[4601,1],[2776,3746,1],[6315,1,1],[4952,1],[3169,1,1,1],[1908],[6291,1,1,1],[6183,1],[261],[624,6007],[926],[4725,1,1],[1951,1,1,1,1,1],[260],[6366],[3295,1],[3324,1],[1971],[2961,1,1],[6238,1],[1116],[5518],[3869,1,1],[1515],[3476,1,1,1],[3723,1,1,1,1],[5894],[1597,1],[6460,1,1],[5507,1,1],[281],[2209],[946,1,1,1,1,1],[2563,1,1,1],[3468],[5454,1,1],[956],[4386],[567],[2660,1,1],[829],[2159,1,1],[6512],[370],[4595,1],[2529],[2430],[1339,1],[501,1],[6740,1],[4131,1],[2629,1],[5503,1],[4276,1437,1],[4790,1,1,1,1],[3187,1,1],[5954,1],[317,1],[4710],[4344,1],[3734,1,304,1],[2353,1],[792,1,1],[5417],[6875,1],[2326,1],[2763,1],[5616,1,1],[4932,1,1],[3080,1,1],[2711],[4783,1,1,1],[484,1,1],[3225,1],[5129,1],[6309],[5250,1],[5956,1,1],[2222,3392,1],[6535],[1160],[5806,1,1,1],[2847],[2788,1],[2226],[6542,1],[4074],[6725],[2541],[1642,1],[1538,1],[1588,1,1],[4989,1],[3483,1,1],[2922],[3394,1034,1],[2003,1,328,1],[533,1],[4986,1],[4649],[6064],[2132],[3682,1,1],[323],[1380,1],[1061],[5162,1],[1219,1],[6218,1,1],[2713,1,2441,1,1],[506,1,1],[6179,1],[1689],[3534,1],[1488,1],[6573,1,1],[2733,1],[2829],[5564,1,1,1],[2076,1],[334],[5469],[1867],[5822,1,1],[3558,1],[6295,1,1],[1161],[1001,1106,1],[6030,1],[5122],[2604],[3839],[5852,1],[1349,1,1],[4781,1],[6799,1],[850,1],[5277],[879,1,4911,1],[3943,1],[1916],[3105],[406],[6091,1],[4559,1,1],[6758,1],[3350,1,1,1],[4637,1,1],[3341,1],[3312,1,601,1,1],[6520,1],[878,4837,1,1],[872,1,1],[5774,1,1,1,1,1,1,1,1],[3112],[4264,1],[3794,1,1779,1,1,1,1],[114,1],[6752,1],[5556],[3669,1],[3156],[2144,1],[6723,1],[5072,1,1],[5278,1],[3938,1,1,1],[1320,1,1],[6900,1],[4077],[2407],[5393,1],[1766,1],[6221,1,1],[3852,1],[1126,1,1],[3791,1,1],[4910],[4588,1225],[2011],[6891,1],[800,1],[1135,3691,1],[3415,1],[2748,1,1,1],[549],[1564],[6378],[72],[774,1],[280,4628,1],[511,1],[6025,1],[3057,1],[3964,1],[5037],[5773],[4181,1],[6706,1],[2759,1],[5443,1,1,1],[4954],[4659],[761,1,1],[6029],[1221,1],[3464,1],[1430,1,1,1],[5457],[4110,1],[5940,1],[4697,1],[3695,1],[767,1,1,1],[5740],[2891,1,1],[4879,1],[3973,1],[1260],[4332],[2006,1,1],[2027],[3666,1,1],[255,1,1],[1725,1],[6122],[590,1,1],[4404,1],[675,1],[6393],[4415],[3908,1,1],[4338],[6984,1],[4866,1],[6495],[3100,1],[5237,1,1,1],[3089,1],[399,4957,1,1,1],[6377],[518,1,5409,71,1,1],[5568,1,1,1],[1376,1,1],[3790],[5324,1],[2841,1,1],[4968,1],[2358,1],[6065],[2989,1,772,1,1],[3758],[2292],[183,1],[5659,1],[1100,1,1],[1294,1],[5995],[121,1,6609],[5932,1,1,1],[6794,1],[3354,1,1],[3919,1,1],[1252,1],[2599,1],[4558],[1708],[3538],[4466],[5154],[816,1],[1932],[986,1],[6364,1],[2396,1,1,1],[203,1],[5790],[3770,2233],[3020,1,1,1],[6011,1],[5260,1],[3028],[6417,1],[2825,1,1],[2150,1,1,1,1],[6958,1],[2675,1],[3827,1,1,1,1],[5516,1],[3196,1,1,1],[144],[3357,1],[4857],[2908],[2391,1,1,1,1],[3953,1,1,1,1],[2494,1],[3134,1,1,1],[2115,1,1],[3154,1],[1304,1],[3705,1,1,1,1],[471,1],[2068],[6435],[4374],[5276],[1603,1],[2897],[5036],[6033,1,1],[3314],[2948],[6558],[1327],[4568],[723,1,1,1],[4825],[991,1],[5216,1,1,1,1],[1735],[2000,1],[2877],[3067],[6611],[1840,1],[952,1],[1627],[2035,1,1],[3343,1],[6944],[5016,1,1],[2909,1],[429],[5606,1],[3774,1,1,1,1,1],[6698,1],[5140,1],[4407,1,1,1,1],[1323,1],[3166],[3405,1],[2102,1],[2259,1,4264,1,1,1],[3619,1],[4795],[2467],[1875,1,1],[5382,1],[6478,1,1],[3978],[6883,1],[6780],[6318,1],[3567],[1458,1],[615,1,94,1],[5906,1],[2994],[5309,1],[6410,1],[1181],[3586,1],[1729,1,1],[5746],[6942,1],[113],[6351,1,1],[3454],[5814],[5330,1],[5025],[1861,1,1,1],[2757,1],[3660,1,1],[4811],[2081],[3803],[2974,1,1,1],[4081],[3994,1,1,1,1],[4300],[1999],[2465,1],[1503],[1388],[1335,1,1],[1415],[442],[2459,1642],[4333,1],[3480],[2355],[3095,1],[383,1],[5722,1,1],[6785,1],[649,1070],[2490,1],[6540],[3123,1,1],[2898],[4716,1,1,1],[1299,1],[1594,1,2133],[1402,1,1],[2373,1],[3011],[5845,1,1],[3281],[185,1],[6115,1,1,1],[3950,1],[5738,1],[647,1],[5579],[3570,1,1],[2702,1],[2803,1,1],[1263,1],[2652,1],[1429],[1599],[6105,1],[4198,1,1],[3147],[6694,1,1],[5828,1,1],[4361,1,1],[4284,1],[3037,1,1,1,1],[1720],[350],[1460,1,1,1],[2779,1],[6871,1],[3703,1],[860,1],[3576],[4996],[229],[3035,1],[634,1],[1979,1],[1577],[4545],[246,1],[3440,1],[3127],[1601,1],[2866,1,1744,1,1],[4576,1,1],[1270],[4491,1,1],[4902],[6404,1],[1776],[2257],[2502,1],[3765],[5334,1],[3925,1],[2704],[1654,1,1],[1947,1],[583],[3501,1],[5972],[2048,1,1],[688,1],[1186,1,1,1],[2615,1,1],[1567,1],[5098,1,1],[4092,1,1],[4814],[4150,1],[4648],[2717,1,1],[3411,1,1,464,1,1,1],[6927,1],[6209,1,1],[6143,1,1],[5983],[2221],[2894,2573,1],[1053],[2367,2662,1,1,1,1],[3665],[1732,1],[893,1],[3474,1],[2543],[147,1],[4721,1],[1647,1,1],[5889,1],[2915,1,1],[2442,1,1,1,1321,1],[2953],[4914,1,1],[2821,1],[307,1],[6090],[5572],[4848,1],[6233,1,1],[3272],[4861,1],[2654,1,1],[3161,1,1],[4575],[3906,1],[978,1],[3409],[1426],[12,1,1678,1,518,1,1935],[2276,1],[1022],[5078,1],[490,1,1,1],[3989,1,1,1],[5399],[3595,1,1],[4616,1],[3663,1],[871],[53,1,1],[1360,1,1,1],[394,1],[1098],[5187,1,1],[4539],[4653],[426],[1525,1,224,3904],[2040],[167,1,1,1,1,4549],[2449,1,3315,1,1],[2253,1,2246,1],[5177,1,1],[6881,1],[6604,1],[2657,1,1],[1807,1],[26,1,1],[2584],[6160,1],[805,1],[4699],[6500,1],[1541],[1994,1,759,1],[2368],[2943],[4244,1,1,1],[44,1],[4887],[1683],[5498,1,1,1,1],[6811,1,1,1],[4203,1],[4999,1,1],[2610],[3741,1,1],[3066],[4057],[5537,1,1],[3769],[1477,1,1],[3033,1],[3513,1,1],[6684,1],[5833],[6601],[3621],[514,1],[2041,1],[3175,1,1,1,1],[2508,1],[6938,1],[4526,1,1,624,1],[4881],[4474,1],[516,1],[920,47,1,1],[2468,1,1],[1075],[1041,1,1],[4091],[4028,1],[4966,1],[3565,1],[1572],[5947,1,1],[30,1,1],[2181,1],[5523,1],[847,1,1],[5042,1],[4161],[6388,1],[6395],[813,1,1],[4599,1],[3768],[1353],[348],[4479],[4686,1,1],[3265],[1829,1,1,1],[1703,1,1,1,1],[6683],[2310,1,1],[5404,1,1,1],[3217,1,1,1,1,1],[5085,1],[6488,1],[5053,1],[6756,1],[6898,1],[2723,1,1,2907,1,1,1],[1354,1,1],[812],[4812,1],[2855,1],[1632,1,1,1,1],[5047],[3783,1,1],[4280,1,1],[5741],[749,1],[6181],[1545,1],[1286,1],[2341,1],[19],[1644,1,1],[2432],[3654],[4982,1,1,1],[6616,1],[47,1,5016,1,313,1041,1],[2282,1],[777],[234,711],[2647],[2605],[3518,1,1,1],[2850,1,1],[1196,1],[2735],[1760,1,1],[4339,1429,1,1],[4162,516],[4185],[1868,1,1,1],[5998],[6658,1,1],[6415],[3,1,1,1,1],[6370,1,1],[5067,1],[4855,1],[6612],[1957],[96],[5005],[6289,1],[4355,1,1],[4631,1,1,1,1350],[699,1,1],[1241,4269],[1696,1],[6445],[6284],[2936,1,1],[1960,1,2946],[4071],[6577,1,1],[3865],[963,1],[2865],[6114],[4445],[2620,1],[3046,1],[4365,1],[156],[4113,1],[3593,1],[3336,1],[1660,1],[1021],[5873,1],[3229],[3945,1,2583,1],[6013,1],[3963],[5019],[4522,1],[3697,1],[2236,1],[2622],[513],[5350,1],[2464],[6392],[4263],[1925],[6642],[4430],[2884,1],[4707,1,1],[473],[6166,1],[5611,1,1],[3786,1],[2692],[2687,1,1],[3645,1],[6730],[1421,1,1],[1288,1,1,1],[3266,1,1,1],[46],[4154,1,1,1],[1306],[1027],[5721],[6356,1],[5951],[5962],[282],[4765],[4169],[52],[4304,755,1],[2701],[5478,1],[5008,1],[2202,1],[2271,1745,1,2532,1,1],[5069,1,1],[4644],[225,1,1,1],[832,1],[2021,1,1],[530,427],[3904,1],[4988],[4046,1],[2793,1],[993,1],[3444,1],[1121],[4387],[2567,1,1],[1142,1],[2799,1,1081,1,1391,1,1],[2817,1,1,1],[4555,1,1],[3048,1],[3181,1],[2781,1],[3492,1,1],[824,1],[4240],[5592,1],[3091],[1424,1],[3404],[453,1],[5392],[3025],[4537],[2637],[4583,1,1,1],[5589,1,1],[354],[1514],[4943,1],[715,1],[808,1,1269,3965],[2585],[2981,1,1],[5804,1],[980,1,1,5204,1,1,1],[4421],[4031,1],[6845,1],[1884,1,1,1,1,1564,1],[1296,1],[862,1],[4780],[593],[1123,1,1,5727,1],[4504,1],[4730,1,1,1],[5729,1],[6854,1],[5323],[2212,1,1],[126],[2940],[2410,1,1,1600,1,1],[4627,1,1],[4127,1],[3017],[248,1,1,1],[5326,1],[2295,1],[5403],[4771,1,1,1],[1988,1],[4903,1],[3756,1],[2488,1],[5256,1],[6534],[5464],[116],[5626,1,1,1,1],[1046],[6967,1],[4808,1],[3605,1],[6054,1],[4358,1],[2720,1],[4884,1],[378,1],[5492,1],[727,1,1070,1,1],[2790],[4748,1],[5557,1],[2261,1,1,1,1],[3658,1],[1796,1],[859],[6314],[3293,1],[5258,1],[5597,1],[6376],[4843,1],[4591],[6625,1],[5685],[6062,1],[933],[2219,1],[3969,1],[6692],[3302,1],[2125,1],[757,1],[3389],[2135],[4446],[3283,1],[1909],[351,1],[6514],[3873],[6343,1,1,1,1],[2252],[3648],[1523,1],[1836],[1182,1,1,1,990,1,1422,1],[3215,1,586,2371,1,1],[6127,1],[3110],[288,1,5372,1,1,1,1],[1482],[5395,1,1,1],[539,1],[3495],[337,1],[4868,1],[6947,1,1],[659],[3106,1],[4566],[4572,1,1],[923,1,5794,1,176,1],[3958,1,1],[3318],[3481,1],[389,1,1],[2238,1,1],[3804],[3446],[670,1,2275,1,212,1,1432,1,1],[64,1],[4828],[3121],[3496],[4058],[4927,1],[625,1],[1407,1124,1],[1044,1],[1686],[6934,1],[448,1,1],[6121],[789,1],[1367,1,1,1],[3319],[6735,1,1],[3438,1],[4994,1],[2207,1],[2012,1],[5304,1521,1],[3840],[2608],[1509],[2625],[6492,1],[3012,1],[3442,1],[6329,1,1,1,1,1,1,1,1,1,1,1],[2513,1,1],[38],[785],[6940,1],[4000,1],[1920],[990],[6887,1],[6749,1,1],[2303],[480,1505,1],[1151,1,1],[1441,1,1,1],[4186,1],[1389,1,1],[6787,1],[3841,1,1,1,1],[1898,5038,1],[5857,1,1,1],[531,1],[6843,1],[663,1,1,1],[6394],[3075],[910],[6170,1,1],[5608,1],[2228,1],[916,1,1,1],[4078,1],[3425,1],[9,1],[3679,1],[1779],[3282],[4308,1],[1358,1],[2471,1],[6689,1,1],[4441,1,564,1],[209,1],[631,1,1],[2343,1,2133,1,1117,1],[1146,4165,1185,1,1,240,1],[3868,2647,1],[5686],[3813,1,1],[2729,1,1],[6499],[822,1],[3018,1],[838,1],[3076,1],[2431],[4168],[5996,1],[722],[1690,143,1,1],[503],[1328,1],[921,1],[2574],[5470,1,1,1],[2844],[2839,1],[5248],[4787,153,1],[2505],[1591],[2586,1,1],[1130],[6439,1],[2127,1,1123,1,768,809,1,1794],[5699,1,1209,1,1],[535,1],[5631],[1272,1,1],[2643],[3377,1,1,1,1],[842],[5180,1],[2861,1],[3167,1],[798,1],[6686,1],[1063,1],[2949,1],[5725],[4609],[6258],[1302,1],[6191,1],[6390],[3525,1,1],[543,1],[5903,1,1],[1284,1],[1915],[3202,1,1,1],[2736,1],[3893,1,1,1],[5975],[5525],[477,1,1],[5184,1],[5222],[6429,1,1],[297,1],[4382],[4170,1,1],[5429],[5167],[886],[2109],[5784,1,1,1],[1941,1,1,1],[2114],[736],[6531,1,1],[4076],[5756,1,1],[4330,1],[143],[5389],[6272],[195,1],[6920,1,1,1],[2009,1],[4406],[572],[3111,3243],[5090],[5620,1],[3710,1],[1865,1],[2677],[3027],[1922,1],[2904,1,1,1],[1939],[2958,1],[1396],[1346],[6885,1],[299],[1205,1,1],[1710,4039],[2044,1],[4018,1],[1826,1,4292,1],[6004,1,362,1,1],[5887],[5559],[5082,1],[627],[3104],[6568,1],[1089],[6866],[5651,1,1],[4839],[1741,1],[5840],[1695],[303,1],[3098,1],[1210,1,1,1,1],[1810,1],[325],[2147,1,1],[4520,1],[6207,1,275,1],[6142],[1480,1],[4050],[6682],[1474,1,1],[2993],[5223,1],[3693,1],[2761,1],[5384,1,1],[4655],[150],[1385,1,1],[4353,1],[3315,1],[613,1],[2426,1],[5878,1,1,1],[6556,1],[1758],[1446,1,1],[1849,1],[4549,1,1],[59],[2500,1],[375,1,1],[5345],[4494,1,1],[5183],[6355],[1723,1],[3866,1],[5283],[896,1,1,1,1,1,1,1,1],[4438],[3633],[729,1],[1019,1,5954],[4360],[4660,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],[6834,1,1,1,1,1],[3544,1,1],[4647],[5648,1],[6015,1],[5583,1],[2918,1],[1174,1,631],[3510,1,1],[1912,1,1],[3051,1],[3248,1],[6777,1],[4383,1,1],[1753,1],[2313,1],[6433],[333],[3369,1,1],[2156,1],[6226,1],[3901,1,1],[4815,1],[447],[959],[5694,1,1,1,1],[4626],[4538],[6840],[6508,1],[4635],[3874,1],[4064,1],[1573,1,1,4727,1,1],[3206],[3259,1],[3238],[3250],[4621,1],[481,1,1],[1491,1],[594],[6176,1,1],[1076],[2248,1],[6770,1],[489],[3262],[1334],[5354,1],[1722],[6528],[1497],[5370,1,1],[3029,3312,1],[3118,1],[3863,1],[6805,1],[5519],[914,1],[100,1,1],[5604,1,774,1],[2598],[695,1,1,1],[2140,1,1,1],[3255,1],[4835,1],[2319],[6027,1],[5050,1,1],[3979],[5530,1],[4307],[4112],[638,1],[1493],[4886],[1622],[2063],[1114,1],[4679,1],[3884,1,1],[4223,1],[1314],[63],[6585,1,1,1],[1972,1],[4241],[6655,1,1],[5913,1,1,1,1],[5992],[3365,1],[1466],[692,1],[286,1],[3126],[427,1],[1315],[752,1,1,1,1],[2074],[3987,1],[6111],[2791,1],[4656,1],[2402,1,1],[601,1],[1467,1,1,1],[1190,1,1],[5452,1],[392,1],[6597,1],[4650,1,1],[4614,1],[6152,1],[650,1,1],[433],[6639,1,1],[5494,1,1,1],[3729],[1216,1,1],[3833],[5939],[1611,1,1,1],[1292],[1069,1,2776,1],[4763,1],[6953],[1653],[3788,1],[6132,1,1],[2204],[4257,1,1],[4205,1,1],[3604],[56,1,1],[4173,1],[3491],[2777,1],[4394,1],[1990,1,155],[1927],[5252,1,1],[2666,1,1],[5876,1],[178,1,1,1],[3816,1],[1606],[362],[646,619,1,1847,1],[6979,1],[3932,1,1],[2992],[2571,1,1,261,1,1,1],[1005,1074,1],[2118,1],[3797,1],[1159],[5158,1,1],[853,1,1],[153,6623],[4508,1],[3872,2180,389],[2612,1,1],[3772,1],[4850],[457,1,1,1,1,1,1,3770,1,1,1,1,1,1,109,1,1,1,1],[4461,1],[4506,1],[1049,1,1,1],[3714,1],[1949,1],[2497,1,1],[6762],[2504],[5599,1,1],[5561],[4919,1],[630,335,1],[4744,1,1,1],[938],[1933],[2345,1,1,1,4360,1,1,1,1],[6701],[1680],[1631],[2075],[3362],[2570],[2633,1],[37],[1728,76,1],[672],[2197,1,1,1,1],[341,1,1,1,1],[4311,1],[2732],[5619,438],[738,1,1],[3861,1],[5103,1,1],[3713],[2589,1,1],[1896,1],[1195],[5480,1],[3640,1],[5742],[4123],[6717],[6362,1],[6113],[1236],[6416],[1249],[3241],[2726,1,1],[694],[4955,1],[2405,1],[4623,1],[386,1,1],[1768,1,1],[3301],[6986],[6502,1,1,1],[3387,1],[385,4432,1,694],[1416,1,1,1],[830,1],[5066],[2693,1],[4704,1],[1619,3518],[6455,1],[3102],[6006],[2241,1],[1232],[1438,1,1],[778],[2542],[319,1],[1166],[3414],[580,1,1],[283],[2890],[4768,1,1],[3876],[4102],[6056],[5093],[2673],[2183,1,1],[5023],[1699,1,1],[2783],[2419],[1245,1,1],[2362,1,1,1,1],[5636,1,1],[2308],[773],[1456,1],[5106],[5057,1],[6230,1],[1547,1],[3577],[369],[6981,1,1],[3469,1,1,1,1],[5458,1],[3026],[525],[3550,1,1],[2944,1],[819,1,1],[2315,1,1,3829],[6603],[2770],[6801,1,1,1],[2158],[1759],[1487,4534],[4531,1,1],[199,1,1,1],[564,1,1],[6328],[6082,1],[1494,1],[2417,1],[1586,1,89,1,3785,1,218,1],[371,1],[5412],[244,1],[4342,1],[3677,1],[4912,1],[5401,1],[396,1],[211,1],[499,1],[3150,1,1],[1397,1,1,1,1,3745,1,650,1],[6474,1,352,1],[653,1],[4957,1,1507,1,1,1],[1784],[597,1],[782,1,6147],[2552],[791],[235,1],[2592,1,1,1,1,1,1970],[5639,1,1],[1855,1],[84,1,1,1,1,1],[1483,1,1,1],[1500,1,619,1,3015],[4619,1],[2278,1,1,1],[3094],[1037,1,1,5634,1],[3359,1],[3279,1],[6150,395],[2928,1,1],[324],[242,1],[6217],[939,1,1,4950,1,1],[6819,1],[2797,1],[197],[1113],[4148],[1578,1],[2131],[4402,1],[1173],[6767,1,1],[466,1],[6245,1,1],[5055,1],[5656],[6613,1],[4502,1],[5655],[718,1,1],[4305,1,1042,1],[6644,1],[5585,1,1,1],[6646],[1576],[603,1],[2756],[145],[550,1],[1585],[5976,1,1,1],[4737,1],[2194,1],[6387],[5328,1],[2678,1],[5855,1],[618,1,1],[3560,1,1,1],[5900],[2215,1],[3372],[3195],[441],[1136,963,1,1],[3270,1],[5208],[2911,1,1,1],[6457,1],[6391],[6867,1,1,1],[5474,1,1,1],[2845,1],[4897,1,1,1,1],[6491],[436,1,1],[4606,1],[3242],[1902],[6702,1],[6269,1,1],[1023,1,1,1],[3531,1,1],[3922],[617],[4975,1,1,1],[6071,1,1,1],[4947,1,1],[2196],[2386,1,1,1243,1,910,1,1,1322,1],[657,1],[6602],[6538,1],[2544,1,1],[5127],[4761,1],[1931],[2493],[3888],[221,1],[3116,1],[4377,1,1,1,1],[3952],[4636],[3153],[6929],[6627,1],[5316,1,1],[15,1],[4460],[5369],[2188,1,1],[3223,1],[656],[5232],[5128],[6487],[784],[960,1,1],[495,1,1,1],[2954,1],[5026,1,1],[6287,1],[2991],[2738],[4103,1],[3636],[2451,1,1],[5989,1],[5194,1,1,1],[6280,1],[6444],[2053,1],[6931,1,1],[1015,1,1,1],[4080],[4694,1,1],[6168,1],[5901,1],[2623],[4107],[5352,1],[3386],[1637,1],[4175,1,1],[6259,1],[6917,1,1],[130,1,1,1],[35],[5091,1],[2379],[146],[4677],[5755],[2030,1],[5424,1,1,1,1],[6629,1],[237,1,1],[4858,1,1],[166],[3568,1],[326],[2320,1,1],[4706],[3361],[3935,1,1],[3912,1],[1223,1,1],[5172,1,1],[2806,1,1],[2524,3935],[5408,1,1],[1140,1],[4642,1],[4133],[6087,1,1],[3042,1],[6546,1,1],[60],[526],[2088,1,1],[1392],[4870,1,1],[6859,1],[4251,1],[1820,1],[4467,1,1,1],[5931],[5447,1,1],[5418,1,1,1],[1012,1,1],[3961,1],[455,1],[1899,1,1],[3699],[5966,1,1],[2177,1,1,1],[1412,1,1],[2258],[1785],[252],[1837],[5573],[5922,1],[2765,1,1,1,1],[708],[5341,1],[1383,1],[3120],[3614,1,1],[2785,1,1],[4546],[3059,1,1],[4416,1,1],[3685,1,1,1],[4424,1,1],[154,1],[5925,1,1],[408,1],[6032],[6080,1],[2875,1],[3133,923],[5548],[4832],[117,1,1,1],[2809,1,1],[2895,1],[1003],[3700,1],[6097],[4270,1,1],[5674],[709],[2863,1],[3024],[3653],[110,1],[407],[1237,1,1,1],[2886],[522],[6163,1,1],[3681],[5209,1],[3173,1],[6002],[5705,1],[5521,1],[575,1,1,3787],[2002],[3145,1],[6358],[5532,1],[6879,1],[884,1],[6112],[1958,1],[759,1],[4303],[1748],[3588,1],[2429],[2420,1],[2683],[1278,1],[5116],[807],[864],[1255,1],[1668,1],[1081,1],[1623,1],[3811,1],[2339,1],[66,96,1],[5771,1],[3447,1,1,1],[6789,1],[5201,1,1,1,1],[2038],[2823,1],[2631],[5701,1,1,1],[2433,3530,1],[1261,1],[2329,1,1],[1471,1],[6069,1],[5376,1],[3857,1,1,1],[5687,1],[1934],[856,1,1,3227],[927,1,774,1689,1,1,1412,1,1,1619,1,1],[358],[3244,1],[3759,1,1],[2454,1,1,1,1],[1275,1,1],[5225,1],[6847,1,1,1],[327,1],[1851],[1310],[2360,1],[4713],[174,1],[1670],[640,1,1,1,1,1],[4480],[4742,1],[1030,1],[3722],[265,1,3645],[128,1,974],[1926],[4700,1],[3005,1],[3516,1],[2964,1],[5234,1,1],[2635,1],[1964,1],[187],[3917,1],[1763,1,1],[721],[262,1,1],[285],[3849,1,1],[3540,1,1,1],[6408,1],[3193,1],[404,1],[1921],[2815,1],[1838,1],[587,1,1575,1,1],[1751,1],[6893,1],[2085,1,1],[1593],[2715,1],[4853,1],[23,1,1],[3832],[3466],[4449],[881,1,1],[1681,1],[559,1],[300],[1872,1,1],[6312,1],[4266,1,1],[2138,1],[2611],[5623,1,1],[5965],[6754],[1809],[4640,1],[5375],[1917],[5287,1],[4242,1],[1978],[4911],[1615],[5230,1],[1164,1],[4489,1],[4970,1,1,1,1],[1449,1,1],[2155],[520,1],[6202],[4294,1],[4458,1],[2415,1],[4419,1],[363,1,1,1],[6693],[1560],[1040],[275,1],[6965,1],[5815,1,1],[2385],[3092],[1169,1,1],[2901,1],[3338,1],[504,1],[5642,1],[3522,1,1],[1427,1],[4340,1],[468,1,1],[6158,1],[4921,1],[5666,1,1,1,1,1,1,1],[6572],[942,1,1],[1711,1],[2383,1],[2051],[14],[2413],[5012],[4516,1],[258,1],[4033],[2525,1],[4562,1],[5002],[6446,1],[6713,1,1,1,198],[4212],[2960],[33,1],[5321,1],[6650],[2113],[5535,1],[529],[3800,1],[3489,1],[253,1],[4225,1,1],[2069,1,1,1,1],[1718],[6473],[1109,1],[3592],[309,5064,1,1292,1,1,1],[1671,1,1],[2349],[5038,1,1,1],[786,1,1],[3395,1],[5264,1],[2039],[43],[2710],[1498,1],[2995,1,1,1,1],[1905,1,1],[3050],[6606,1,1,1,1],[1592],[771,1,1783,1,1,1],[2881,1,1],[1745],[1330,1,1],[1393],[1083,1,1,1],[474,1,1],[2533],[2378],[4820,1,1,1],[4608],[1880],[2306,1],[2627,1],[1420,361,1,1],[1992,1],[4875,1,1,1],[2380,1,1],[4370,1,1,1],[3747,1],[182],[6308],[1842,1,2162,1,1],[4201],[4211,577,1],[4529,1],[2473,1],[1283],[5044],[5950],[2547,1,1],[127],[2130],[1569,1,2582,1],[1662,1,1,1,1,1],[4831],[6807,1,1,1],[6038,1,1,1,1],[974],[3304,1],[3463],[1996,1,1],[2669,1,1,1],[6139,1,1],[1584],[3437],[5825,1,1],[4950,1],[353],[1364,1,1],[2706,1,1,1],[346,1,5371,1,1],[6300,1],[2304],[5045,1],[764,1,1],[3347,1,3222,1],[6632,1],[1371,2276],[4819],[296],[1148,1,1],[1935,1,2561,1,1],[6135,1,1,1],[6589,1],[6763,1,1,1],[5307,1],[2663,1,1],[4218,1,784,1],[4253,1],[2559,1],[970],[5084],[1229,1,1],[3966,1,1,566,1,1,2436,1],[5683,1],[5820,1],[73,1720,1,1],[401,1,1],[5075,1,1],[2486],[5332,1],[5291,1,1,1,1],[3062,1,1,1],[1962,1],[1298],[4837,1],[5647],[5010,1],[41,1],[3651,1],[2690],[494],[412,1,1,1],[2680,1],[4286,1,1,1,1],[5422,1],[5087,1,1],[2328],[223,1,3864,1,1,2446],[5182],[1079,1],[2425],[2941,1],[1087,1],[4681,1],[1167,1],[2168,1,1,1,1,1],[5387,1],[1516],[5788,1],[2518,413,1,1,3027,1],[2857,1],[349],[2166,1],[4457],[3200],[3300],[3157,1],[6584],[3451],[2247],[4118],[3689],[1755,1],[3655],[528,4977,1],[4892],[5528,1],[2812],[4095,1],[8,4816],[431],[4804],[3467],[6861,1,1,1],[2246],[6510,1],[3529,1],[6123],[1987],[4277,1],[6007,1],[6044,1,1],[837],[4062,1],[6084],[3382,1,3377,1],[2309],[4702,1],[1267],[6748],[6216],[3427,1,1],[5363,1,1],[6151],[712],[451,1],[6396,1,1],[5112,1],[5942],[6310,1],[176,1],[6904,1],[5943,1,1,1],[355,1,1],[3417],[5731,1],[5312,1,1,1],[5190,1],[4327,1,1],[552,1],[673,1],[420,1,1],[3947,1,1],[4929,1,1],[4645,1],[5854],[895],[2618],[1580,1,1],[5985,1,1,1],[3421,1,1,1],[6053],[4015],[905,1,1,1,1],[6264,1,1],[20,1],[568,1,1,1],[69,1,1],[2648,1,1,1],[2287,1,1,1,1],[4776,1,1],[1709],[5211,1,1,1],[6755],[4051,1,403,1],[4547,1],[3834,1,1,1,1],[1924],[3750,1,1],[5747,1],[5793,1,1,1],[5834,1,1],[1250,1],[1507,3514,1],[1620,1],[3980,1,1,1],[4779],[1382],[3030],[6779],[4021,1],[5305,1],[2691]],"ranks":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,564,565,566,567,570,571,574,576,577,568,578,579,580,581,582,583,584,586,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1211,1212,1213,1214,1215,1216,1217,1218,1219,1220,1221,1222,1223,1224,1225,1226,1227,1228,1229,1230,1231,1232,1233,1234,1235,1236,1237,1238,1239,1240,1241,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1278,1279,1280,1281,1282,1283,1284,1285,1286,1287,1288,1289,1290,1291,1292,1293,1294,1295,1296,1297,1298,1299,1300,1301,1302,1303,1304,1305,1306,1307,1308,1309,1310,1311,1312,1313,1314,1315,1316,1317,1318,1319,1320,1321,1322,1323,1324,1325,1326,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1357,1358,1359,1360,1361,1362,1363,1364,1365,1366,1367,1368,1369,1370,1371,1372,1373,1374,1375,1376,1377,1378,1379,1380,1381,1382,1383,1384,1385,1386,1387,1388,1389,1390,1391,1392,1393,1394,1395,1396,1397,1398,1399,1400,1401,1402,1403,1404,1405,1406,1407,1408,1409,1410,1411,1412,1413,1414,1415,1416,1417,1418,1419,1420,1421,1422,1423,1424,1425,1426,1427,1428,1429,1430,1431,1432,1433,1434,1435,1436,1437,1438,1439,1440,1441,1442,1443,1444,1445,1446,1447,1448,1449,1450,1451,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1466,1467,1468,1469,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1482,1483,1484,1485,1486,1487,1488,1489,1490,1491,1492,1493,1494,1495,1496,1497,1498,1499,1500,1501,1502,1503,1504,1505,1506,1507,1508,1509,1510,1511,1512,1513,1514,1515,1516,1517,1518,1519,1520,1521,1522,1523,1524,1525,1526,1527,1528,1529,1530,1531,1532,1533,1534,1535,1536,1537,1538,1539,1540,1541,1542,1543,1544,1545,1546,1547,1548,1549,1550,1551,1552,1553,1554,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1570,1571,1572,1573,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1590,1591,1592,1593,1594,1595,1596,1597,1598,1599,1600,1601,1602,1603,1604,1605,1606,1607,1608,1609,1610,1611,1612,1613,1614,1615,1616,1617,1618,1619,1620,1621,1622,1623,1624,1625,1626,1627,1628,1629,1630,1631,1632,1633,1634,1635,1636,1637,1638,1639,1640,1641,1642,1643,1644,1645,1646,1647,1648,1649,1650,1651,1652,1653,1654,1655,1656,1657,1658,1659,1660,1661,1662,1663,1664,1665,1666,1667,1668,1669,1670,1671,1672,1673,1674,1675,1676,1677,1678,1679,1680,1681,1682,1683,1684,1685,1686,1687,1688,1689,1690,1691,1692,1693,1694,1695,1696,1697,1698,1699,1700,1701,1702,1703,1704,1705,1706,1707,1708,1709,1710,1711,1712,1713,1714,1715,1716,1717,1718,1719,1720,1721,1722,1723,1724,1725,1726,1727,1728,1729,1730,1731,1732,1733,1734,1735,1736,1737,1738,1739,1740,1741,1742,1744,1743,1745,1746,1747,1748,1749,1750,1751,1752,1753,1754,1755,1756,1757,1758,1759,1760,1761,1762,1763,1764,1765,1766,1767,1768,1769,1770,1771,1772,1773,1774,1775,1776,1777,1778,1779,1780,1781,1782,1783,1784,1785,1786,1787,1788,1789,1790,1791,1792,1793,1794,1795,1796,1797,1798,1799,1800,1801,1802,1803,1804,1805,1806,1807,1808,1809,1810,1811,1812,1813,1814,1815,1816,1817,1818,1819,1820,1821,1822,1823,1824,1825,1826,1827,1828,1829,1830,1831,1832,1833,1834,1835,1836,1837,1838,1839,1840,1841,1842,1843,1844,1845,1846,1847,1848,1850,1852,1853,1855,1856,1857,1858,1859,1860,1861,1862,1863,1864,1865,1849,1851,1854,1866,1867,1868,1869,1870,1871,1872,1873,1874,1875,1876,1877,1878,1879,1880,1881,1882,1883,1884,1885,1886,1887,1888,1889,1890,1891,1892,1893,1894,1895,1896,1897,1898,1899,1900,1901,1902,1903,1904,1905,1906,1907,1908,1909,1910,1911,1912,1913,1914,1915,1916,1917,1918,1919,1920,1921,1922,1923,1924,1925,1926,1927,1928,1929,1930,1931,1932,1933,1934,1935,1936,1937,1938,1939,1940,1941,1942,1943,1944,1945,1946,1947,1948,1949,1950,1951,1952,1953,1954,1955,1956,1957,1958,1959,1960,1961,1962,1963,1964,1965,1966,1967,1968,1969,1970,1971,1972,1973,1974,1975,1976,1977,1978,1979,1980,1981,1982,1983,1984,1985,1986,1987,1988,1989,1990,1991,1992,1993,1994,1995,1996,1997,1998,1999,2000,2001,2002,2003,2004,2005,2006,2007,2008,2009,2010,2011,2012,2013,2014,2015,2016,2017,2018,2019,2020,2021,2022,2023,2024,2025,2026,2027,2028,2029,2030,2031,2032,2033,2034,2035,2036,2037,2038,2039,2040,2041,2042,2043,2044,2045,2046,2047,2048,2049,2050,2051,2052,2053,2054,2055,2056,2057,2058,2059,2060,2061,2062,2063,2064,2065,2066,2067,2068,2069,2070,2071,2072,2073,2074,2075,2076,2077,2078,2079,2080,2081,2082,2083,2084,2085,2086,2126,2128,2087,2088,2089,2090,2091,2092,2093,2094,2095,2096,2097,2098,2099,2100,2101,2102,2103,2104,2105,2106,2107,2108,2109,2110,2111,2112,2113,2114,2115,2116,2117,2118,2119,2120,2121,2122,2123,2124,2125,2127,2129,2130,2131,2132,2133,2134,2135,2136,2137,2138,2139,2140,2141,2142,2143,2144,2145,2146,2147,2148,2149,2150,2151,2152,2153,2154,2155,2156,2157,2158,2159,2160,2161,2162,2163,2164,2165,2166,2167,2168,2169,2170,2171,2172,2173,2174,2175,2176,2177,2178,2179,2180,2181,2182,2183,2184,2185,2186,2187,2188,2189,2190,2191,2192,2193,2194,2195,2196,2197,2198,2199,2200,2201,2202,2203,2204,2205,2206,2207,2208,2209,2210,2211,2212,2213,2214,2215,2216,2217,2218,2219,2220,2221,2222,2223,2224,2225,2226,2227,2228,2229,2230,2231,2232,2233,2234,2235,2236,2237,2238,2239,2240,2241,2242,2243,2244,2245,2246,2247,2248,2249,2250,2251,2252,2253,2254,2255,2256,2257,2258,2259,2260,2261,2262,2263,2264,2265,2266,2267,2268,2269,2270,2271,2272,2273,2274,2275,2276,2277,2278,2279,2280,2281,2282,2283,2284,2285,2286,2287,2288,2289,2290,2291,2292,2293,2294,2295,2296,2297,2298,2299,2300,2301,2302,2303,2304,2305,2306,2307,2308,2309,2310,2311,2312,2313,2314,2315,2316,2317,2318,2319,2320,2321,2322,2323,2324,2325,2326,2327,2328,2329,2330,2331,2332,2333,2334,2335,2336,2337,2338,2339,2340,2341,2342,2343,2344,2345,2346,2347,2348,2349,2350,2351,2352,2353,2354,2355,2356,2357,2358,2359,2360,2361,2362,2363,2364,2365,2366,2367,2368,2369,2370,2371,2372,2373,2374,2375,2376,2377,2378,2379,2380,2381,2382,2383,2384,2385,2386,2387,2388,2389,2390,2391,2392,2393,2394,2395,2396,2397,2398,2399,2400,2401,2402,2403,2404,2405,2406,2407,2408,2409,2410,2411,2412,2413,2414,2415,2416,2417,2418,2419,2420,2421,2423,2424,2425,2426,2422,2427,2428,2429,2430,2431,2432,2433,2434,2435,2436,2437,2438,2439,2440,2441,2442,2443,2444,2445,2446,2447,2448,2449,2450,2451,2452,2453,2454,2455,2456,2457,2458,2459,2460,2461,2462,2463,2464,2465,2466,2467,2468,2469,2470,2471,2472,2473,2474,2475,2476,2477,2478,2479,2480,2481,2482,2483,2484,2485,2486,2487,2488,2489,2490,2491,2492,2493,2494,2495,2496,2497,2498,2499,2500,2501,2502,2503,2504,2505,2506,2507,2508,2509,2510,2511,2512,2513,2514,2515,2516,2517,2518,2519,2520,2521,2522,2523,2524,2525,2526,2527,2528,2529,2530,2531,2532,2533,2534,2535,2536,2537,2538,2539,2540,2541,2542,2543,2544,2545,2546,2547,2548,2549,2550,2551,2552,2553,2554,2555,2556,2557,2558,2559,2560,2561,2562,2563,2564,2565,2566,2567,2568,2569,2570,2571,2572,2573,2574,2575,2576,2577,2578,2579,2580,2581,2582,2583,2584,2585,2586,2587,2588,2589,2590,2591,2592,2593,2594,2595,2596,2597,2598,2599,2600,2601,2602,2603,2604,2605,2606,2607,2608,2609,2610,2611,2612,2613,2614,2615,2616,2617,2618,2619,2620,2621,2622,2623,2624,2625,2626,2627,2628,2629,2630,2631,2632,2633,2634,2635,2636,2637,2638,2639,2640,2641,2642,2643,2644,2645,2646,2647,2648,2649,2650,2651,2652,2653,2654,2655,2656,2657,2658,2659,2660,2661,2662,2663,2664,2665,2666,2667,2668,2669,2671,2670,2672,2673,2674,2675,2676,2677,2678,2679,2680,2681,2682,2683,2684,2685,2686,2687,2688,2689,2690,2691,2692,2693,2694,2695,2696,2697,2698,2699,2700,2701,2702,2703,2704,2705,2706,2707,2708,2709,2710,2711,2712,2713,2714,2715,2716,2717,2718,2719,2720,2721,2722,2723,2724,2725,2726,2727,2728,2729,2730,2731,2732,2733,2734,2735,2736,2737,2738,2739,2740,2741,2742,2743,2744,2745,2746,2747,2748,2749,2750,2751,2752,2753,2754,2755,2756,2757,2758,2759,2760,2761,2762,2763,2764,2765,2766,2767,2768,2769,2770,2771,2772,2773,2774,2775,2776,2777,2778,2779,2780,2781,2782,2783,2784,2785,2786,2787,2788,2789,2790,2791,2792,2793,2794,2795,2796,2797,2798,2799,2800,2801,2802,2803,2804,2805,2806,2807,2808,2809,2810,2811,2812,2813,2814,2815,2816,2817,2818,2819,2820,2821,2822,2823,2824,2825,2826,2827,2828,2829,2830,2831,2832,2833,2834,2835,2836,2837,2838,2839,2840,2841,2842,2843,2844,2845,2846,2847,2848,2849,2850,2851,2852,2853,2854,2855,2856,2857,2858,2859,2860,2861,2862,2863,2864,2865,2866,2867,2868,2869,2870,2871,2872,2873,2874,2875,2876,2877,2878,2879,2880,2881,2882,2883,2884,2885,2886,2887,2888,2889,2890,2891,2892,2893,2894,2895,2896,2897,2898,2899,2900,2901,2902,2903,2904,2905,2906,2907,2908,2909,2910,2911,2912,2913,2914,2915,2916,2917,2918,2919,2920,2921,2922,2923,2924,2925,2926,2927,2928,2929,2930,2931,2932,2933,2934,2935,2936,2937,2938,2939,2940,2941,2942,2943,2944,2945,2946,2947,2948,2949,2950,2951,2952,2953,2955,2956,2957,2958,2959,2962,2966,2969,2970,2972,2973,2961,2976,2977,2978,2979,2980,2981,2982,2983,2984,2985,2986,2987,2988,2989,2990,2991,2992,2993,2994,2995,2996,2997,2998,2999,3000,3001,3002,3003,3004,3005,3006,3007,3008,3009,3010,3011,3012,3013,3014,3015,3016,3017,3018,3019,3020,3021,3022,3023,3024,3025,3026,3027,3028,3029,3030,3033,3034,3035,3036,3037,3038,3039,3040,3041,3042,3043,3044,3045,3046,3047,3048,3049,3050,3051,3052,3053,3054,3055,3056,3057,3058,3059,3060,3061,3062,3063,3064,3065,3066,3067,3068,3069,3070,3071,3072,3073,3074,3075,3076,3077,3078,3079,3080,3081,3082,3083,3084,3085,3086,3087,3088,3089,3090,3091,3092,3093,3094,3095,3096,3097,3098,3099,3100,3101,3102,3103,3104,3105,3106,3107,3108,3109,3110,3111,3112,3113,3114,3115,3116,3117,3118,3119,3120,3121,3122,3123,3124,3125,3126,3127,3128,3129,3130,3131,3132,3133,3134,3135,3136,3137,3138,3139,3140,3141,3142,3143,3144,3145,3146,3147,3148,3149,3150,3151,3152,3153,3154,3155,3156,3157,3158,3159,3160,3161,3162,3163,3164,3165,3166,3167,3168,3169,3170,3171,3172,3173,3174,3175,3176,3177,3178,3179,3180,3181,3182,3183,3184,3185,3186,3187,3188,3189,561,572,573,575,569,585,587,655,2954,2967,2968,2971,2974,2975,2960,2963,2964,2965,3031,3032,3190,3191,3192,3193,3194,3195,3196,3197,3198,3199,3200,3201,3202,3203,3204,3205,3206,3207,3208,3209,3210,3211,3212,3213,3214,3215,3216,3217,3218]},"First Name":{"counts":[5,3,1,1,1,3,1,13,2,1,2,11,2,1,4,1,2,3,1,15,3,2,2,2,3,1,2,3,2,2,5,14,1,9,13,3,2,3,5,2,1,1,4,6,1,12,1,1,2,2,1,1,2,5,5,3,2,4,7,3,8,8,3,3,2,4,1,2,2,1,2,2,4,2,2,7,2,10,1,1,2,30,2,1,3,17,1,1,49,2,4,3,3,3,4,14,4,1,4,4,11,16,1,2,2,38,1,16,4,2,2,3,5,4,3,3,2,1,10,2,2,3,4,4,18,3,2,9,2,2,5,1,4,1,2,14,3,3,1,7,2,5,1,1,2,1,4,2,3,2,3,2,2,2,3,3,3,2,5,27,3,2,2,6,5,2,2,7,1,3,1,2,4,12,4,2,1,2,3,1,5,1,8,3,4,3,1,1,1,1,2,7,1,1,1,1,1,2,2,2,4,4,2,1,1,3,1,2,2,4,1,2,2,1,2,2,4,2,2,2,1,3,2,3,6,12,9,2,2,2,2,3,7,2,1,1,2,3,2,1,4,2,2,2,3,2,1,1,1,7,11,2,2,7,1,1,2,5,4,1,14,2,3,3,2,1,3,3,1,4,2,2,3,2,1,2,9,2,1,5,40,2,11,10,4,8,2,1,2,3,2,1,2,1,1,2,5,1,2,2,5,5,6,4,4,1,1,3,4,1,3,1,4,2,1,2,2,3,2,1,5,1,2,7,1,3,1,10,3,1,4,2,1,2,6,1,2,2,1,11,2,3,2,1,18,8,3,9,1,8,7,3,1,15,1,7,12,5,58,2,3,1,2,2,1,3,9,2,1,2,5,1,1,3,13,4,1,3,1,2,2,3,2,2,4,2,6,2,1,1,8,1,2,3,2,2,3,1,2,14,4,1,4,3,1,1,3,1,2,2,1,1,3,1,2,1,1,1,2,4,4,3,3,3,2,2,4,13,3,2,1,1,1,1,1,3,2,1,2,3,3,1,2,3,1,4,14,2,3,5,6,10,4,1,1,2,1,1,5,4,2,4,4,9,1,1,7,1,1,1,2,2,7,3,1,5,2,3,1,10,3,3,10,3,2,6,1,1,2,2,1,1,9,2,1,1,21,4,1,2,3,4,1,3,3,20,2,12,4,4,3,3,1,1,2,5,2,2,1,2,1,1,4,5,9,2,3,2,11,4,1,2,9,3,1,2,2,14,1,2,6,11,2,1,3,9,1,3,2,7,4,7,1,1,12,5,3,5,2,7,1,1,2,1,1,1,3,3,1,7,5,17,3,3,1,4,3,2,5,2,5,1,9,4,1,2,4,3,2,2,2,2,2,5,2,1,3,2,2,1,3,2,5,1,11,3,3,2,1,2,3,2,2,1,1,3,4,1,2,3,1,2,1,1,2,28,2,5,3,1,7,3,2,2,1,3,1,1,4,5,3,2,2,1,3,1,1,1,3,2,2,2,3,1,8,2,2,1,2,1,2,9,1,2,2,2,4,2,2,3,2,3,2,2,5,2,7,1,3,2,2,1,2,3,2,4,1,1,6,2,4,1,2,1,6,2,5,7,4,2,5,2,8,1,8,1,2,3,6,4,24,2,3,3,3,2,1,2,1,4,1,2,2,1,1,2,2,4,3,6,2,2,5,2,12,1,2,2,1,2,1,2,7,3,1,8,3,6,2,6,2,3,1,2,1,2,1,8,4,2,3,7,3,2,5,4,1,4,2,3,8,2,8,2,1,2,9,1,10,2,23,1,11,9,3,2,2,1,5,9,2,10,5,2,8,1,4,2,5,2,11,2,6,2,1,2,9,2,1,1,4,2,2,1,1,7,4,1,2,2,1,3,3,2,3,2,1,4,16,4,35,4,2,2,2,2,2,1,1,4,2,17,1,2,4,5,2,1,25,5,2,4,1,1,6,2,11,3,5,35,2,2,9,1,3,2,5,2,2,2,5,2,3,1,7,5,2,15,2,4,1,1,1,1,2,1,3,12,2,8,1,4,2,1,5,2,1,1,1,5,2,6,5,6,1,3,8,2,3,1,3,2,8,3,2,2,2,3,5,2,2,4,1,1,2,4,1,8,1,2,1,2,4,2,4,10,1,3,4,3,5,6,4,2,2,4,2,1,1,4,5,4,1,19,1,2,1,3,2,2,2,3,1,7,2,4,1,1,2,2,4,3,3,4,1,1,4,13,2,3,2,2,1,2,4,10,2,2,2,3,1,4,10,2,2,4,1,2,5,2,1,9,10,1,4,3,2,3,8,2,1,2,1,5,42,2,1,2,4,2,3,2,6,3,2,15,3,2,9,4,6,1,6,3,1,1,3,2,3,2,2,1,1,2,1,4,18,3,1,2,3,3,2,2,1,2,4,5,1,2,2,2,2,5,4,2,3,2,9,3,5,3,2,2,1,2,2,3,1,1,2,2,2,3,1,2,5,2,1,6,2,3,5,1,1,1,2,1,3,7,2,7,2,4,1,5,5,3,15,2,1,10,3,2,4,5,1,1,4,6,1,2,1,1,4,3,5,2,5,13,2,32,10,3,2,1,1,2,3,40,1,2,3,6,2,7,1,31,1,2,5,2,6,2,11,4,8,2,3,2,1,2,1,1,2,3,12,9,3,3,5,2,2,2,27,9,2,3,2,16,12,9,6,3,2,6,17,39,12,1,8,4,2,1,1,4,2,3,2,5,1,2,3,5,8,8,2,5,8,4,1,1,7,12,1,2,6,2,2,1,1,1,1,2,46,1,12,12,4,3,2,3,5,6,2,2,6,7,5,3,1,4,3,1,1,3,2,1,3,1,4,4,3,1,7,3,6,2,7,1,4,6,1,2,2,2,3,1,2,8,8,4,2,1,2,1,2,2,1,1,2,2,3,3,8,5,1,3,2,2,2,3,1,7,2,2,1,4,5,2,2,2,5,4,1,1,3,1,4,6,5,1,3,1,1,1,1,2,2,3,3,1,3,2,4,2,2,2,12,5,3,3,8,3,2,5,4,2,2,1,2,2,2,2,1,1,1,5,10,2,3,9,3,1,8,11,5,3,8,2,1,4,29,3,2,5,2,2,3,19,3,6,7,2,1,4,1,2,2,3,3,1,2,46,2,6,10,2,2,1,2,2,4,4,1,3,5,2,1,2,3,4,1,4,37,2,8,4,4,2,4,4,3,8,2,8,4,5,1,2,4,2,1,8,3,1,6,2,2,2,1,3,2,3,3,2,4,2,2,5,7,1,3,8,2,3,2,1,1,4,4,3,1,19,3,3,3,1,4,39,4,7,1,2,4,1,5,1,18,1,1,3,4,2,4,2,3,1,2,2,2,1,2,5,5,1,2,1,8,1,3,2,6,1,1,14,2,1,14,1,1,2,3,1,6,2,2,7,1,4,9,19,2,2,2,2,4,1,7,6,15,2,3,5,1,5,3,4,8,1,4,3,6,1,2,3,6,4,4,2,3,14,3,2,6,3,5,4,2,2,1,4,2,1,8,2,1,2,2,2,4,2,3,1,3,3,2,3,1,1,14,7,23,1,9,5,4,1,2,1,1,2,5,5,2,9,2,14,1,1,4,2,2,1,4,11,2,3,4,1,3,2,1,2,1,3,6,1,3,2,5,6,1,8,1,5,3,2,3,11,1,2,5,8,6,3,3,1,1,1,3,1,8,2,2,3,6,2,1,2,36,2,1,6,2,4,5,1,6,7,2,2,2,7,3,5,1,1,29,1,3,3,7,7,4,2,2,1,2,2,5,2,2,1,1,1,5,1,2,1,1,3,14,12,5,1,11,7,6,1,3,2,4,4,1,4,2,1,6,2,2,2,4,1,2,6,6,3,2,2,2,2,5,4,1,11,3,5,1,2,2,2,1,8,1,2,2,1,5,3,2,1,2,2,2,1,3,6,2,3,4,7,3,6,1,3,1,11,1,2,3,2,5,3,2,1,5,2,6,13,2,1,1,32,4,2,3,1,3,1,1,1,2,1,1,1,1,1,3,1,4,24,2,3,9,1,2,1,2,3,2,6,1,2,4,2,5,5,6,2,1,13,5,1,1,2,2,7,1],"rows":[[5913,1,1,1,1],[1099,3746,1],[1508],[3186],[5654],[6917,1,1],[6217],[1920,132,29,224,324,1,394,241,32,3,421,1471,1],[2871,1],[3496],[4992,1],[2713,1,605,450,522,1,1,891,1,514,1],[6066,1],[1780],[5985,1,1,1],[5740],[430,2473],[744,1,1],[6057],[647,1,202,1,607,1,679,1,705,258,312,1842,1,41,515],[5919,1,1],[6013,1],[1358,1],[4812,1],[3813,1,1],[1727],[6832,1],[5098,1,1],[4945,1],[5492,1],[4124,1,1,463,1],[646,103,1,3483,1,1,1,1,1,1,947,351,1,1],[1860],[3421,1,1,1,1849,1,1,785,1],[36,623,2156,1,1260,181,1,1,808,1,526,1090,1],[1123,1,1],[3033,1],[290,5721,1],[1723,1,2517,2267,1],[3586,1],[4276],[3454],[5312,1,1,1],[262,1,1,1226,888,2432],[1353],[47,1,330,1,132,1,1229,1,1481,1,1564,1],[4479],[3314],[1642,1],[4264,1],[4273],[1999],[1674,1],[37,2744,1,347,1],[208,4020,1,1,1],[2402,1,1],[613,1],[2187,517,1570,1],[580,1,1,714,1,4663,1],[4858,1,1],[545,1,1,1,3306,1,1,2841],[2468,1,1,1519,1,1,1,701],[6749,1,1],[2915,1,1],[6252,1],[258,1,2493,1],[2530],[3811,1],[5804,1],[1915],[4758,1],[4134,653],[4923,1,1,1],[8,2535],[2295,1],[4526,1,1,301,1,1455,1],[207,5528],[721,1354,2954,1,1,1,1,189,1548,1],[4118],[6097],[6419,1],[114,1,44,1,1,158,1,545,1,622,1,942,417,1,310,1,790,1,864,1,143,1,1,1,1,477,1,1,1034,1],[800,1],[3577],[1571,1302,1],[657,1,1421,1,50,1085,1,1619,1,704,136,1,1,14,1,196,1],[4081],[3495],[35,109,282,297,1,1,1,188,1,259,1,85,26,1,229,204,117,922,1,181,1,421,1,377,1,1,146,1,128,1,101,1,1,217,360,138,1,69,434,1,53,1,1,1,132,1,632,1,1],[162,1],[895,151,258,1],[3734,1,1314],[3626,1,1],[282,2838,977],[3161,1,1,3438],[518,1,522,1,1,596,1,1,1351,291,1,1122,1056,1],[5237,1,1,1],[3952],[663,1,1,1],[5878,1,1,1],[2069,1,1,1,1,1477,1,1,2404,1,1],[1483,1,1,1,205,1,2261,1,1,1,1,1925,1,1,1,1],[3050],[690,1],[1010,1],[126,1189,145,1,1,1,266,1,1,280,454,1,68,1,324,1,406,1,1,1,517,1,74,1,346,1,1,942,1,635,1,309,1,1,276,384,1,196],[6929],[252,1011,1,2023,1,1,1,2170,1,300,1,927,1,1,134,1],[3138,1,1,1],[3822,1],[5873,1],[5639,1,1],[1603,1,2304,1,1],[1245,1,1,496],[5061,1,1],[2315,1,1],[317,1],[4414],[1972,1,1567,1,1,1,3039,1,155,1],[5602,1],[3345,1],[6320,1,1],[4085,2736,1,1],[6264,1,1,451],[370,489,706,1,1687,1,238,1,1,322,1,1735,1,46,1,1,18,343],[2696,1,1],[2757,1],[4730,1,1,1,303,1488,1,1,1],[747,1],[2339,1],[5216,1,1,1,1],[6780],[934,1,1,1],[6552],[4412,1],[432,2290,313,1,346,1,590,1,592,704,1,1,569,1],[4686,1,1],[3150,1,1],[1541],[778,1329,1,250,1,252,71],[6891,1],[2272,1,2567,1,1],[4678],[5512],[6127,1],[4824],[5632,1,1,1],[5973,1],[6348,1,1],[4474,1],[277,1,1],[6483,1],[3167,1],[3612,1],[5828,1,1],[4135,1,1],[4088,1,1],[6883,1],[4407,1,1,1,1],[267,1,1,1,368,1,120,1,1026,1,1,629,1,650,1,1,1,1,754,696,1,359,1,346,103,1,781],[1616,1,1],[1219,1],[628,1],[1021,3327,1,1,1,1],[76,1,1,2263,1],[46,4613],[1121,1756],[842,1221,1497,1,1,1,2183],[1393],[107,1,1],[6858],[2884,1],[313,1,1,1],[1659,1112,1,1,1,729,1,1,1,1,3235,1],[358,437,802,1],[5731,1],[38],[2053,1],[100,1,1],[4310],[1654,1,1,4307,1],[1515],[5666,1,1,1,1,1,1,1],[3513,1,1],[1817,2714,1,1],[6546,1,1],[6107],[3093],[1346],[2243],[4917,1],[1711,1,3113,948,130,1,1],[3713],[5286],[5378],[5998],[5403],[3452,1],[373,1],[453,1],[2442,1,1,1],[1094,1,1,1],[1858,1],[2413],[2712],[2961,1,1],[6540],[1983,1],[3095,1],[4277,1,1807,1],[6150],[970,4862],[1339,1],[4779],[3501,1],[1054,1],[3308,1,1,1],[5532,1],[4213,1],[1426,1041],[4538],[2183,1,1],[4178,1],[386,1,1],[329,1,1,4802,1,1],[172,1,967,1,2390,1,1,101,1,1727,1126,1],[1580,1,1,164,1,1848,1,1,2526],[6474,1],[2241,1],[183,1],[5008,1],[4739,1,1],[504,1,2249,1,2302,1,1585],[810,1],[300],[5790],[4461,1],[6947,1,1],[1278,1],[5511],[6847,1,1,1],[44,1],[6733,1],[6975,1],[1275,1,1],[4487,1],[4819],[6537],[6190],[2946,1,3452,1,1,1,1],[1456,1,731,1,1,274,167,3110,554,1,1],[275,1],[3985,1],[286,1,1621,61,1,3613,1],[4460],[3603],[6984,1],[309,3244,1,1,1],[4467,1,1,1],[3963],[271,1,1966,1,1,268,1,602,1254,1,1004,1,1,1022],[1162,1],[653,1,961],[764,1,1],[2343,1],[3390],[2608,1847,1],[5408,1,1],[1722],[128,1,2373,1],[439,1],[6323,1],[2035,1,1],[4330,1],[2711],[5223,1],[3112,728,1130,1,1,1,1,1568,1],[404,1],[3156],[1820,1,2595,1,1],[285,163,1,1,89,1,44,1,1,69,842,22,1,1,1,1064,1,1,168,939,1,453,353,1,500,1,426,1,1,1,102,1,38,1,1,1,1,1384,1,1],[3384,1],[1221,1,62,1,672,309,1,1,1,1,404],[294,1,701,1,1,330,1,3469,1,601],[1261,1,2246,1],[893,1,1459,1,207,1,4388,1],[2720,1],[2898],[6406,1],[2544,1,1],[3055,1],[3460],[1543,1],[6725],[2738],[1179,1],[6168,1,156,1,1],[1777],[3714,1],[5352,1],[1142,1,1791,1,3753],[1037,1,1,1760,1],[4196,1,1169,1,1,990],[103,1,1706,1],[1360,1,1,1],[785],[4653],[2726,1,1],[164,1,6807,1],[6068],[4776,1,1],[3017],[4016,1,2041,1],[6726,1],[2114],[734,1],[383,1],[5072,1,1],[533,1],[1517],[869,1,858,3826,1],[5984],[4010,1],[369,1344,1142,1,3573,1,1],[4609],[420,1,1],[5519],[3425,1,2268,1,1,1,1,20,1,1],[1899,1,1],[2584],[601,1,2161,1],[339,1],[600],[2046,1],[1933,1894,1,1,1,1],[2209],[2136,1],[5820,1],[6309],[830,1,181,1,1,2785,1488,1,1229,1,1],[3083,1],[4162,2643,1],[5683,1],[807],[382,2079,1278,742,1,85,139,89,413,140,1,306,566,1,1,374,1,33],[362,2834,1,1,1,100,3330,1],[2887,1621,1],[896,1,1,1,1,1,1,1,1],[2609],[244,1,3199,1,77,1,1,1775],[4855,1,958,892,1,235,1],[6745,1,1],[6415],[1881,1,1,216,1,1,208,2370,1,1425,1,284,526,42,1],[6494],[2120,1,172,1,1468,1,1],[6329,1,1,1,1,1,1,1,1,1,1,1],[1678,1,4680,1,1],[468,1,1,343,1,1,96,1,1,170,1,1,1,14,1,1,657,55,1,1,32,472,1,1,74,1,1,1,20,56,356,1,1,350,1,1,113,25,423,650,1,328,1,1,136,1,1,8,1,240,1,544,1,73,3,1,290,1],[1325,1],[5510,726,1],[2870],[2462,1],[2473,1],[1680],[1372,1,1012],[1117,1,1,1,386,1499,1,1336,1],[6492,1],[1978],[1736,1],[134,1,5007,1,1],[4902],[5084],[791,1199,1],[1549,1,987,1,33,1,1,2693,1,1,56,1,837],[223,1,6257,1],[3740],[4220,1,1],[6952],[3255,1],[6673,1],[1437,2671,1],[6388,1],[4940,1],[5784,1,1,1],[3343,1],[2003,1,1766,1151,1,799],[1081,1],[567],[3491],[1135,443,1,2121,1,2064,1,1],[4074],[151,1],[1216,1,1],[887,1],[5289,1],[4549,1,1],[6121],[90,1],[707,637,1,481,1,982,1,1,762,1,1,478,1,1],[5494,1,1,1],[1227],[1611,1,1,1],[6261,1,1],[6029],[932],[6931,1,1],[6052],[2923,1],[4623,1],[1352],[1844],[406,1575,1],[3410],[6616,1],[2953],[1564],[3771],[219,1],[4982,1,1,1],[1768,1,1,3803],[5815,1,1],[2451,1,1],[1596,1452,1],[611,1],[605,1],[94,1,118,1],[1323,1,188,1,3395,1,1001,1,1,31,1,1,1],[5513,1,1],[2129,4845],[3500],[528],[2638],[5311],[2828],[4092,1,1],[3116,1],[4618],[2448,1821],[6176,1,1],[2030,1,1801],[6824],[6904,1],[3510,1,1],[1159],[5474,1,1,1],[84,1,1,1,1,1,599,1,1477,1,4106,1,1,1],[3387,1],[1006,1,1],[2391,1,1,1,1],[2168,1,1,1,1,1],[4483,1,1,1,633,1,1,1708,1,1],[2669,1,1,1],[2292],[3092],[5346,1],[3437],[2610],[1699,1,1,5093,1],[1416,1,1,1],[1551,2057],[1093,175,1,5381],[6300,1,584,1],[39,1,185,1,1,1,5945,1,1],[4211],[5233],[3190,1,1,735,2202,1,1],[6490],[1740],[5674],[2606,1],[3365,1],[215,1,1,1,564,1,5209],[2692,2634,1],[1572],[3447,1,1,1,2525],[1252,1],[593,5256,1],[3105],[568,1,1,1,1461,1,1,1986,2861,1],[4555,1,1],[853,1,1],[1552,1,1,1,1,1,1,1,3701,1],[761,1,1],[1627,2430],[1383,1,2497,1,2187,1],[2051],[4939],[6879,1],[1164,1],[6615],[5369],[360,1,1506,2816,1,1,966,1,1],[3820,1],[3133],[3075],[773,11,967,1,2273,1,1,117,1,352,1,1,716,486,1,1,1,153,1,1,1],[3730,1,1,1],[1749],[824,1],[621,1,1],[5545,1,1,456],[4996],[2422,1,1],[5938,646,170],[205,1,1822,1,1433,228,1,1,342,1,1,1,1,57,1,250,1,639,1,1504],[4879,1],[2439,1,1,2069,1,1,1,2114,1,47,1,1],[4175,1,1,951],[867,758,1,4807],[2601,1,861],[2784,6,236],[5106],[886],[6841,1],[307,1,6646,1,1],[5085,1],[3637,1],[4445],[3418,1],[5734],[2624],[1838,1,3225,1],[2150,1,1,1,1],[1133,1,526,1,228,1,2068,1,1],[5190,1],[2850,1,1],[5557,1],[1586,1,1513,1,940,1,1,1,1294,1,1],[3717,1,1,1],[2622],[3912,1],[927,1,2347,1,253,1,986,1,1225],[6577,1,1],[1809],[3987,1],[2899,1],[464,1,160,1,2750,360,1,263,1,630,1,1,1,1305],[1734],[2016,1],[535,1,276,1524,1,1],[2645,1,502,1,1830,1,1,762,1,1,118],[6893,1],[2113],[1599,4502,1],[983,1,1,723,1095,1,1,499,1],[4689],[3080,1,1],[3338,1],[2006,1,1,950,1,1374,1],[5038,1,1,1],[416,1,1,1,6059,1,1],[1172],[2368],[209,1,368,1,1880,1197,1,1979,1,1,801,1],[2454,1,1,1,1],[6816,1,1],[1397,1,1,1,1],[17,1],[3397,1,1,1,1,1,1],[6258],[5249],[513,1382],[2104],[2496],[2637],[2223,1,1],[2687,1,1],[4630],[56,1,1,3510,1,1656,1],[5799,1,1,1,1],[4660,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],[3791,1,1],[2310,1,1],[4775],[675,1,4886,1],[2513,1,1],[5330,1],[434,1,393,3812,1],[2133,1],[776,3827,1,1,349],[737],[2061,1,1169,1,1,1,1,1,1],[2252,3841,1,1],[2304],[5855,1],[2552,476,2659,1],[3869,1,1],[2853,1],[6062,1],[6404,1],[6007,1],[67,1],[1721,2202,1,189,1],[2118,1],[5900],[5436,1,1],[4763,1],[4903,1],[6473],[3042,1,1339],[4110,1],[3642,1,1,3283,1],[5685],[1592,933,1,169,244,286,1,114,787,1,1432],[4494,1,1],[4205,1,1],[4601,1],[1785],[5604,1],[2329,1,1],[1131,1],[5729,1],[2644],[3180],[3411,1,1],[1496,2439,1,1],[3053],[1774,1],[355,1,1],[2135],[1424,1],[6692],[2477],[6704,1],[573,1,631,1,1,60,2087,1,1,214,1,1,646,1,145,66,128,213,1,1,1,338,1,48,7,1,1241,1],[3405,1],[3331,1,1,1,1],[26,1,1],[3655],[30,1,1,5379,1385,1,1],[2978,1,1],[3547,1],[6471,1],[3665],[741,1,1],[1560],[2542],[2744,1,1,1],[5818,1,820,1,1],[6720,1,1],[2285,1],[157,1],[6284],[1320,1,1],[3681],[2350],[1415],[4552,1,1],[4489,1],[1027,4944],[6789,1],[2567,1,1],[1709],[729,1,2226,1,1023,1,1,1],[1044,1],[2236,1],[1514],[4294,1],[1144],[5321,1],[1201,1,1971,1,1773,1,1,789,1],[3999],[1849,1],[4390,1],[5246,1],[5976,1,1,1],[6702,1],[5713,1],[2891,1,1],[2742,1],[2410,1,1],[1028,1],[4443,1],[3430,1,1,1,1],[2012,1],[3928,1,1,1,84,2514,1],[4307],[2723,1,1],[2490,1],[3395,1],[260],[3622,1],[2425,145,1409],[4142,1],[509,1,3271,1],[145],[1408],[6834,1,1,1,1,1],[5450,1],[4154,1,1,1],[2632],[5791,1],[1932],[531,1,1091,1,2142,1],[4051,1],[522,2141,1,1,3551],[2278,1,1,1,2038,2098,1],[5568,1,1,1],[594,2422],[905,1,1,1,1],[2217,1],[121,1,1266,3903,1,1,1,1],[5831],[640,1,1,1,1,1,948,2720],[4988],[3800,1],[3783,1,1],[3794,1,2883,1,1,1],[5443,1,1,1],[73,457,313,1,740,575,1,1,1743,1,12,1,796,1,569,1,982,1,86,58,1,1,565,1],[1818,1],[4433,1,1],[6242,1,1],[3654,866,1],[6048,1],[5012],[5006,1],[525],[6033,1,1,822],[296],[6152,1],[4375,1],[5942],[5323],[4868,1],[2146,1243],[677,1,1,1],[856,1,1],[631,1,1,1877,1,1],[5648,1],[5922,1],[2995,1,1,1,1],[2482,3640],[2592,1,1,1,1,1,2208,1,1,122,1,1],[6202],[2405,1],[6025,1],[1880],[4181,1],[6386],[5969,1],[4766,1,569,1,965,1,1],[9,1,4639],[624],[4086,1,524,1,1,834,1,1],[5507,1,1],[5965,431,1,1,504,1],[1405,1],[310,1,3757,1,850,1],[4955,1],[3892,969,1],[852],[1988,1],[6953],[5334,1],[1319],[2732,1588,1,1,1,2250,1,1],[2408,1,218,1],[963,1],[650,1,1],[1647,1,1,158,1,1053,1],[4932,1,1],[4251,1],[999,1,1585,3355,1],[1412,1,1,365],[1040],[2064,1,1,1],[2857,1],[187,5356,1],[3369,1,1,308,1,2755,145,1],[3118,1],[832,1,321,1,1,1,1,4919],[4298,1],[3728],[3617,1],[284,1647,147,137,1,1085,455,1,2234],[3883],[4286,1,1,1,1,252,1,1,343,280],[6075,1],[261,684,158,611,1,1,1,81,1,1,374,872,1,134,1,454,12,41,559,563,543,1,394],[1631],[305,1,1803,3247,1,1,1,53,46,1,493],[1148,1,1,651,1,1,857,1,1],[4637,1,1],[5866,1],[3964,1],[4112],[6661,1,1,1,1],[341,1,1,1,1,905,1,3470,1],[5264,1],[3,1,1,1,1,1829,368,43,724,1],[14,5456,1,1,1],[771,1],[871,205,5286,1,178,153,1,1],[3942],[767,1,1,1],[1075,3782],[5498,1,1,1,1],[410,1],[1223,1,1,458,20,1,1,1,1,1253,2167],[988,1],[2471,1,1179,1,371,805],[5401,1],[2710],[3279,1],[1702,2103,1,1,953,1666,1,1,348],[6873,1],[910],[1925],[2706,1,1,1],[1047,1],[203,1],[5111],[3409],[5482,1,1,1,1,1,1],[2250,1,4038,1],[1226],[1865,1],[367,1],[6006],[6423,1,1],[2847,2513,1],[4968,1],[4266,1,1],[3489,1],[5280],[1487,3892,1,1],[69,1,1,1349,2044,1,1638,1,1,939,1,1,148,1,400,1],[1503,4608,148,1],[154,1,1464,466,1,1,68,200,297,1,40,1,789,1,176,1,1,112,1,1,1,1,1,879,1110,1,1,13,10,1,1,1,154,93,150],[2648,1,1,1],[3588,1],[796,1],[5876,1],[6653,1],[6312,1],[431],[1540],[3877,1,1,1],[1030,1],[380,1,1068,1,1,230,1,278,1,115,1,119,16,1,1,70,249],[3780],[1464,1],[1288,1,1,1],[375,1,1,3263,1],[4152,1],[2775],[712,106,173,1,346,601,413,350,1,165,1,517,829,69,1,1279,1,1,1,811,269,1,1,132,1],[1793,1,1,3022,1],[2821,1],[2904,1,1,1],[549],[1293],[4439,1,724,1,1,89],[4748,1],[971,1,1,937,1,1340,1,190,1,979,1],[718,1,1],[3195,1607,1,1049,1],[1067,1,494,1,458,1,1,152,1,529,426,1,125,1,501,1,1,112,199,1,207,1,1,309,500,1,62,44,1,1,1156,1,20,92,1],[6506,1],[2635,1],[443,1,1193,1,32,1864,1,1723,1],[3054],[3407,1,3561],[2949,1],[1394,1,1208,3990,1],[2360,1],[3624,1],[312,6133],[321,1,3918,969,1],[92,1],[6315,1,1],[281],[2131,16,1,1,1444,1,2934],[694,1721,1,943,1],[1949,1],[1719,183,417,2501,1,1,1,1198,517,1,228,1,1,5,1],[6787,1],[3210,1,1133,1],[2690],[5047],[5951],[1828],[5278,1],[3876],[1912,1,1],[1441,1,1,1,2440,1,1,147,1371,1,1,1],[965,1],[2140,1,1,1,3286,404,986,1],[2626],[2497,1,1,4292],[2633,1],[4123],[1796,1,4965,215,1],[2699,1],[4387],[2430],[4024],[5201,1,1,1,1],[6895,1],[590,1,1,1133,1,1009],[2230,1,1,1,1],[1452,1,1,1,4048,1],[1758],[3712,2810,1],[607,1,1,1,3186,2416,1,433],[6613,1],[4361,1,1],[1292],[237,1,1],[2909,1],[2654,1,1,2653,1,53,1,1],[881,1,1],[1812,1],[3014,1],[4436,1],[229,3749,1270],[681,1,1,3959,1],[5129,1],[2779,1],[1335,1,1,1729],[1934],[2227],[990,2359],[916,1,1,1],[1270],[2082,1,1,757,1,1,1273,1],[5491],[5763,1],[2407],[2326,1],[495,1,1,1],[5620,1],[2302,905,1,1],[1249,49,1714,1,755,35,833,844,1,1463],[4626],[2529,586,3496],[878,3255,1111,1],[4635,758,1],[2362,1,1,1,1],[1167,1,3081,1,1853,1],[4232,1317,1,1],[1676,1],[5642,1],[6186,1,1,1],[2356,1],[1735],[198],[1905,1,1,4052],[1235,3025,1,143,1],[4851,1,265,1],[2308],[346,1,287,1,794,828,342,1,115,1,407,1,1,2423,174,1,1,731,1],[4071],[1500,1],[2643],[323,1057,1],[2620,1],[4392,1],[6318,1],[5301,1,1],[3647],[3291,1,413,1,1,1,1],[4950,1],[5211,1,1,1],[2235],[3029],[4966,1],[1929,1],[3614,1,1,499],[6373,1,1],[4621,1,795],[3169,1,1,1],[1600],[4070],[1407,280,4363,1],[1271,156,1,82,1,2657,156,1,1,1906,423,1,1],[4781,1],[1146,1125,3657],[235,1],[974,1052],[1577],[6207,1],[1015,1,1,1],[668,1,2708,1,1,1,1,2510,1,1],[5753,1],[1958,1],[1935,1],[2191,1,1],[4579],[5585,1,1,1],[59,1857,995,1,1,1,532,1146,1,1],[3629,1],[4547,1],[3476,1,1,1],[1089],[3852,1],[4897,1,1,1,1],[2813,1],[299],[348,541,1,1178,485,1,2332,711,1],[2432,653,1,1,1,2062,1,605,1,1],[2829],[4370,1,1,1],[6735,1,1],[5180,1],[255,1,1],[587,1,1503,1,1,1,1063,1],[5227,1],[2973],[2181,1],[3128],[2493,1373,1,154,1],[197,650,1,1,861,536,82,1731,1,1,124,175,68,1,177,1,40,154,38,331,1,110,1,25,1,35,1,108,1,577,1,422,1,56,1,341,1,53,1,1,26,1],[884,1],[2039],[6298,1],[4875,1,1,1],[5250,1],[6147,1,1],[113,2898],[2897,2971,1,1,1,1],[802,1,1],[670,1],[359,277,1,1186,1,1,1592,249,1,1,667,1,1,963,426],[3375,2059,1],[2944,1],[1438,1,1,1611,1,2361,1,1,1],[3261,2878,1,1],[710,1,2893,1483,1,1],[1473],[199,1,1,1,4109,1],[6022,1,1],[4713],[1744],[6436,1,1],[2795,1],[1242,1,1],[6772,1],[954,1],[6730],[527],[4645,1],[1198],[3932,1,1,452],[146,395,1,237,1,1,568,1,1,528,2635,1,162,1133,1,1,1148,1],[1573,1,1],[1745],[6887,1],[138,1,1],[136,1,3711],[3677,1],[74,1],[1750],[3925,1],[3062,1,1,1],[1032,1,1,1,1],[4892],[4101,1455],[4619,1],[3697,1],[2414,3787],[2375,1,1,3701,1],[1071,1,1,1],[5843,1],[5013,1,1],[297,1],[4506,1,204,1,78,1,1,1,1],[4569,1,1],[6343,1,1,1,1],[3110,426,1],[3089,1],[471,1],[441],[4078,1],[5592,1],[4655,2290,1],[5116],[1757],[6240,1],[5954,1],[5101,1],[33,1,1293],[3699],[5350,1],[2261,1,1,1,1],[4353,1],[2002],[3350,1,1,1,1389,1],[5465,1],[929,1,1],[2677,649,1,1,955],[3229],[143],[6328],[673,1],[3729],[2483,1,1],[692,1,522,2220,1,1022,1],[3212,1],[1161,461,1190,2370,441,1,1],[3578,1],[860,1,1415,1],[6572],[1436,4370,1,1,1],[1583,3906,1,33,1],[5822,1,1],[110,1,403,1,583,1034,45,1,1,1,2652,550,1,138,1],[2449,1],[407],[1233,1,713,1,588,821,1,1267,694,1],[23,1,1],[5595,1],[3673,1,1,1],[253,1,3536,1372,1],[4834],[957],[5232,527,1,127],[6214,1,592,1,1,1],[5848],[3631,1],[3094],[3549],[4627,1,1,1455],[6370,1,1],[2274,1,246,1,1],[6758,1],[6381,1,1,1,1],[1763,1,1,442,1,74,1,335,1247,329,1,236,1],[4912,1],[182,218,80,472,1,161,1,126,379,1,75,1,225,1,1203,431,418,1,1,79,1010,513,68,249,1,1,1,54,171,1,1,387],[1891,1,1314,452,1,989,614,1,343,1],[5611,1,1],[2426,1],[5572],[325],[1022,3778],[5589,1,1],[234,99,141,1,1,585,421,402,1,1,1,1,990,1,1,571,298,144,1,1,1,554,1,1,1,10,1,1,462,1,244,1,1,961,1,1,1,771,1,1],[2492],[6792,1],[4225,1,1],[2675,1,331,1,1,1],[6364,1],[3020,1,1,1,521,1,1],[116],[423,1,1,332,1,1018,268,1,322,196,1,1,1,9,1,1,262,1,501,1,1013,1,1,1714,1,1,1,358,299,209,1],[5439],[5146,1],[3841,1,1,1,1],[3302,1],[273,1,5974,1,1,1],[4564,1],[2657,1,1,483,1,1,884,1,386,131,2233],[351,1,245,1],[1607,1,1,1,517,1,3177,1],[4884,1],[1385,1,1],[147,1],[2894],[1525,1],[6056],[2349],[1668,1],[1945,1,2662],[995,662,1,655,1,640,1,2065,705,294,1,614],[834,1,1,1703,1,3215,1226,1,1],[1698,3442,1],[1151,1,1],[6203,1,1,1,609],[6442,1],[1498,1],[2791,1],[11,857,974,1,121,1,257,584,1,1,112,1,1001,83,1,1,565,1,1,460,1,422,380,1,1,805,1],[3518,1,1,1,1062,1,1,1,1265],[3669,1],[1090,1,1],[816,1],[408,1,85,2407,1,116,1,1027,1,419,93,1,1,584,1318,1],[819,1,1,305,1,1,2660,1,149,1,1,1],[4441,1,372,161,1,1,1,252,1],[2531,1,4388,1,1,1],[786,1,1],[6752,1],[3202,1,1,1,2914,1],[808,1,439,1131,652,1,802,1,1,1,1,1909,1,645,265,1,1],[350,575,205,171,29,1,1,77,1,1,273,1,236,402,1,1,664,1,448,1,182,443,1,475,1,636,1,1,98,367,1,1,539,275,1,1,96,12,1],[520,1,472,1,1631,192,1,1,1,789,1,1],[1254],[141,1,836,1,5822,1,1,1],[1087,1,1428,1],[2504,521],[4303],[4102],[4398,1,1,1],[1940,1301],[1671,1,1],[4943,1],[1077,1,1257,818,1782],[6624],[5711,1],[2351,2945,1],[19,1004,1,1,1],[401,1,1,3065,1908,1,149,1],[3295,1,2168,1154,1,1,1,1],[3772,1],[2765,1,1,1,1],[1588,1,1,1865,1,1,1,1],[394,1,2853,1],[1605],[5622],[1147,287,1,813,1,1720,1],[105,1,24,1,1,1,1443,1454,577,1952,1226,1],[4058],[3481,1],[1789,1,1,1,4776,1],[3277,1],[3078,1],[1606],[3887],[2038],[5525],[1967,1],[43,123,1,1,1,1,1,225,1,146,1,55,600,1,72,1,1,652,653,1,1,1,1,564,657,42,1,67,1,1,150,1,94,29,1,1,1,866,1,161,246,1,756,1,290,1],[4446],[709,785,1,467,1,142,1,1266,22,753,975,1729],[288,1,1471,1,1,1941,1,497,1456,1,624,1],[52,1601,65,4136],[1547,1,1872],[6310,1],[1527,1,1],[3391,1,1,300,1],[695,1,1,1,1691,1],[3797,1],[2863,1],[124,1,4591,1,1,1],[891,1,588,1,3256,1,2118],[731,1,1,2068,1],[6218,1,1],[5931],[4244,1,1,1],[6170,1,1],[5090],[1561],[736,2725,2463],[1567,1],[5392],[1113,5857,1],[649],[1049,1,1,1],[265,1,3397,1],[6108,1,1],[6693],[188,1,1,1,1,1,1],[3619,1,2427],[3361,1110,1,1,2152,1],[5679,1],[1334,48,2737,2579,1,190,1],[2074],[429,2175,626,3502],[2009,1,2020,139,852,1],[5908],[6160,1],[805,1],[1688,2739],[1650,1,1],[3839],[5541,1],[1109,1,257,1,1,1,1117,1052],[1689,889,2112,1,1,297,1,279],[1176,1,1,2461],[3590,1],[1357],[3747,1],[4545],[2125,1],[3373,1],[4910],[3808],[20,1],[2845,1],[6670,1,1],[1773,2731,1],[389,1,1,3909,737,1106,1,1],[4082,1,1,2639,1],[5389],[3497,1,1],[392,1],[4964,1],[4317,1],[702,1,1],[2541],[559,1,2640,958,1,1,1715],[1258,1],[6054,1],[6986],[3598,1,2742,1],[3744,1,1324,1,1],[2318,4226],[4008,1],[6556,1],[1160,2658,1,628,1],[248,1,1,1],[2686],[6623],[49,1,1],[6112],[5418,1,1,1],[717,1902,98,1,1,229],[489,1020,2858,1,1],[1002],[60,6680,1],[2460],[6499],[156],[22],[1538,1],[4614,1],[3306,1,395],[2881,1,1],[6391],[1781,1,1],[3239,1],[938,3317,1,2674],[4031,1],[1738,1],[2823,1],[2908,129,1,1,1,1,1021,1,2017,1,675,1],[829,2262,2996,1,1],[6245,1,1],[1530,1,1],[1491,1,292,257,1,2492,1,1],[301,1,5616],[4704,1],[2984,1,1,1,1],[3863,1,2913,1],[3044,1],[6637,1],[526],[6421,1],[3753,1],[603,1],[4402,1],[1374],[3716],[4454],[337,1,4242,1,1],[554,1,1,1,1,546,1,1,1,1],[1111,1],[6531,1,1],[920,2323,654,1,1,1,1710,798,1],[4424,1,1],[1772],[751,2653,267,1,10,1,1,903],[4952,1,1046,1,1,665,1,1,1,269,1],[3528,622,1,37,1],[3565,1,1833],[958,2269,1,1112,1,139,1415,107],[537,1],[4148],[2518,3833,1,1],[61,1,439,1,1,69,403,1,1,88,1,452,868,1,1,290,1,424,226,1,97,1,1,1664,1443,192,1,70,1],[506,1,1],[1569,1],[3966,1,1,2750,1],[923,1],[6686,1],[1265,1,4706],[112,1096,1,1,1,1,1,1,2687,1,1,2212,1,1,1,595,1,1,1],[335,1,137],[583,719,1,392,157,577],[280,1227,1012,1,398,1,3436],[2202,1],[2993],[2748,1,1,1],[4911],[1069,1],[727,1],[2163,1,1],[2925,1,1],[1257],[326,72],[230,1,1,329,1,1,736,1,696,1,1,158,1,40,1,1,1,1,237,359,1,168,1,92,1,1,15,1,27,857,1,136,1,1,208,1,220,1,65,1,1457,126,1,89,1,1],[4848,1],[82,1,1338,1,1,5491],[2639,1,680,1,1,1669,1375,196,1,1],[3106,1],[6877,1],[3262],[4419,1],[4131,1],[2478,1,1,1],[233,2543,1681,1229],[4610],[4694,1,1],[1306,4084,1,624,1],[3164,1],[2890],[5861,1],[2589,1,1],[332,5945,1,1],[4881],[5194,1,1,1],[185,1,250,1,1,270,44,1,1,1,1,106,1,273,9,231,1,1,24,1,1,1491,1,26,359,199,173,679,192,1,240,816,1,123,1,1042,92],[2680,1],[477,1,1,1287,1,3249,1,1],[447,5708,1,1],[4700,1,575,1589],[6965,1],[4138,1,1,1],[1182,1,1,1],[1628,1,1],[1987,199,1129,1,2300,1,1,916],[1203,1],[455,1,1384,1,1087,1,1,835],[4180,577,1339,418],[550,1,2443,103,1791],[3317],[41,1],[6291,1,1,1],[2259,1],[3027],[211,1,141,1735,1,1,310,1],[5187,1,1],[6064],[72,4771,1,180,657,1],[5906,1],[6783,1],[2506,1],[617],[5131,1,1302],[3108,1],[2785,1,1],[3098,1,3513],[2253,1],[4012,1,1,1169],[4616,1],[921,1],[1056,1,1,1,1],[442,1290,1,1248,1,1,2911],[6744],[699,1,1],[1237,1,1,1,139,661,188,1],[2866,1],[3583,1,1],[6228,1],[3362],[5019],[4744,1,1,1],[6763,1,1,1],[4170,1,1],[4262],[195,1,760,645,1,42,1,1,263,591,1,846,1,67,1,885,1,834,1045],[2968,1,1],[872,1,1],[1389,1,1],[4598],[705,3609,1,1],[149,967,77,1,351,1,209,1,50,356,96,87,1,1,1,25,1,153,1,638,158,1,213,625,1,1,1,1,171,199,38,22,105,1,394,144,1,1,1149],[1928,1063,1397,957],[942,1,1,2169,1,1069,1],[2770],[516,1],[1822,2572,1,1670],[2783],[2446,1,4477,1,1],[3282],[433,748,921,1,194,1,1,1175,1,117,296,3,111,1,1,1836,196,1],[4279],[3993],[2739,1,1],[3285,1,753,1],[2000,1],[2684,1,2181,1],[3824,1],[575,1,1],[4263],[4129,1],[6875,1],[3943,1],[4568],[3246,1],[6196,1,1,1,1],[1342,1,2143,1,1],[6495],[1753,1],[2060],[980,1,1,3123,1,470,1,1],[926],[3187,1,1],[6632,1],[1467,1,1,1,5134,1],[529],[6602],[427,1,187,1,221,1497,349,317,1,1,2514,1,1328,1],[4223,1],[3318],[1186,1,1,1,443,1,1,1,1,2087,1,1,1,1],[5520],[2226],[445,1],[5750,1,1],[5023],[1951,1,1,1,1,1],[1062,5580],[6859,1],[178,1,1,1,1285,312,5088],[6683],[1375,2952,1,1],[1857,629,4014,1,19,1,55,322,1],[457,1,1,1,1,1,1,36,1,2812,1,1732,1,879,1,1,622,1,1],[2205,1],[3558,1],[5078,1],[174,1],[3685,1,1,1],[3214],[715,1,655,400,1356,1601,1],[4304,1174,1,900,1,223],[29,1144,3318,1,1,204,1,63,1,18,53,798,203,1,1],[2788,1],[4216,1,788],[1533,1,1,1,1],[3238],[0,1,1,3271,1],[875,1,1],[826,1,3359,1],[3336,1,2224,348,321,1,83,73],[5048],[466,1,2497,1],[3580,1,1],[792,1,1,1051,1,1],[1228],[4500,1],[1316,1,1],[1918,1,915,1,1,1],[327,1,4577,1],[684,1,1,1],[4937,1],[2524,1447,1],[3600,1,1,47,1,1031,1,466,1,477,1,1,1,1],[1169,1,1],[2210,1],[2244,1,1803,1,1944,1],[5050,1,1],[713,1,3135,1,1],[4783,1,1,1],[4477,1],[5175,1],[3802],[363,1,1,1],[3270,1],[4654],[1474,1,1,2157,3228,1,1,1],[6912,1],[4374],[3193,1],[6166,1],[3440,1],[4893,1,1,1],[1232,4302],[1311,1,1],[150],[2110,1,1],[738,1,1],[4103,1],[6565,1,1],[2943],[6444],[451,1,1489,1,1,1,41,1,661,1103,1,1,544,1],[3134,1,1,1,1597,1,1],[117,1,1,1,1928,1,1,509,1,1045,1,540,561,1,1,11,1209,1,279,1,1,274,1],[3121],[618,1,1,1502,1,1,3260,1,1],[303,1,2116,1,829],[1004,2069,1,2909],[4202],[2494,1],[4942],[864],[6900,1],[176,1,1678,1,1345],[2666,1,1,848,1],[5797,1],[845,1,207,1740,1,1564,1,945,371],[3003,1],[242,1,1012,1,2553,1,1313,1,1,1,296,1,735,1],[4075],[6459],[490,1,1,1],[3154,1],[5053,1],[4831],[349,5884,1,1],[1005,518,1,4191,1,1,650,1,1,282,1],[5771,1],[1446,1,1],[5107,1,1,1],[4644],[5075,1,1],[4599,1],[706],[6854,1],[1966],[960,1,1],[153,5885,1,1,1,1],[4077],[484,1,1],[4173,1],[2886,2139,922,1,1],[4588,1392,1,1,700,19],[2865],[240,1,597,1,475,376,208,2182],[6915],[1927,2612,2014,1,1],[2018,1,1],[2761,1],[1122,1354,1009],[777,63,1,852,1,139,1,1,3207,1,426],[656],[6446,1],[595,1,4293,1,1],[3469,1,1,1,1,965,1571,1],[6146,460,1,1,1,1],[4870,1,1],[1872,1,1],[4091],[1748],[2574],[5155,1,1],[6032],[1542,1194,1,1018,628,1,1,617],[2641,1],[1903,1],[2729,1,1],[789,1,2735,1,1,2745],[5936,1],[4389],[5528,1],[79,1,1,318,796,673,1,1,1,906,1,47,1,1,109,1,1,355,1,173,109,292,982,308,1,1,213,1,80,1,1,548,1,77,1,814],[5328,1],[1686],[1851,761,1,1,3569,1],[2332,1],[2369,1,1,1],[385,5604,1,461,1],[1502],[1310,1070,1,1,890,486],[5094,1,1,1369,1,1,1],[246,1],[2194,1],[6191,1],[2095,1,1,1,2859,1,1797],[3947,1,1],[879,1,5616,1,1],[589],[63],[1079,1,413,11,1,86,3,1,419,1,532,1,1,124,60,1,525,1,938,1,1,3,1,840,93,146,104,1,1099],[3833],[967,1,1],[2615,1,1],[3217,1,1,1,1,1,990],[4750,1,1,1,1,1,1],[1430,1,1,1],[6017,1],[2058,1],[3564],[2300,1],[4796,1],[5518,614,1,1,174],[6635,1],[3645,1],[3466],[5375],[5865],[1804,1,3194,1,1],[4045],[2255,1],[6142],[4449],[5825,1,1],[939,1,1,1033,1,1,1,1198,1,1,1,1,695,1],[774,1,887,1,1,1,1,1,767,1,1,1],[1294,1,732,2781,1],[2433],[4914,1,1,94,1,1430,267,1,1,1,1],[12,1,1904,304,1501,3105,1],[5026,1,1,938,1,1],[627],[3919,1,1],[2219,1],[6254,1,1,1],[283,4951,1,1],[933],[6811,1,1,1],[4997,1],[1166],[412,1,1,1,1481,1],[6599,1],[4518,1],[6967,1],[2024,1,3055,1],[4107],[1893,1],[1307,1,1,3459,1,1],[946,1,1,1,1,1],[96,4757,1],[2306,1],[1992,1],[6591,1],[1994,1],[123,1706,1,1,1],[6843,1,27,1],[4050],[2888,1,2427,1,1,290,1,323,1,1,1],[660,1,1],[15,1,3968,1010,1],[667],[986,1],[4562,1],[3244,1],[1445],[2055,1,1,644,444,1,3092,1],[3738],[3906,1],[2488,1],[5864],[4377,1,1,1,1],[1354,1,1],[1063,1],[5580],[1347,1],[4723,1],[798,1],[2623],[6559,1,1],[2830,2225,1,633,1,1],[3710,1],[2940,2565,1],[1861,1,1,1],[822,1,196,1,176,1,3607],[1137,1,1],[371,1,4880,1,1,741],[672],[1280,1,1],[2303],[97,1,1,2456,1,1,1,393,1,105,1],[2505],[5614,1],[291,1,1],[6287,1],[5661,1,1,1,1],[1229,1,1],[3945,1],[1236],[4650,1,1,1075,1],[2550,1],[1585,2409,1,1,1,1],[959,382,51,85,1,1,679,909,175,669,1990,1,643],[5996,1],[4476],[630],[53,1,1,509,1,1,905,1,643,1,1,27,1,453,376,1,1,1,880,1,1,1,12,1835,1,1,1,441,3,294,1,1],[1283,5022,1,1],[2383,1],[481,1,1],[1878],[4847,359,1],[5656],[1396],[5650],[6457,1],[3567],[2005],[6416],[722],[6395],[3122,1183,1],[4936],[487,1,1940,3685],[64,1,1064,235,1,1,509,1,1,47,55,1,2262,1,178,289,116,1,311,1,951,190,1,231],[5082,1],[334,5892,1],[1937,1,993,1,1,3934,1,1,1],[2838],[1853,1],[1971],[6091,1],[1190,1,1],[523,1],[127,5718,1,1,742,1],[6535],[4656,1],[354,649,1040,4139],[3367,1],[324,6261,1,1,1],[2605,658,1,3672,1],[1009,4415,1,1,1,1],[552,1],[1333],[5774,1,1,1,1,1,1,1,1,720,1,1,1],[2287,1,1,1,1],[6700],[66],[2875,1],[4253,1],[221,1,779,3269,1,1,1616],[2691]],"ranks":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,811,810,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1161,1160,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1211,1212,1213,1214,1215,1216,1217,1218,1219,1220,1221,1222,1223,1224,1225,1226,1227,1228,1229,1230,1231,1232,1233,1234,1235,1236,1237,1238,1239,1240,1241,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1278,1279,1280,1281,1282,1283,1284,1285,1286,1287,1288,1289,1290,1291,1292,1293,1294,1295,1296,1297,1298,1299,1300,1301,1302,1303,1304,1305,1306,1307,1308,1309,1310,1311,1312,1313,1314,1315,1316,1317,1318,1319,1320,1321,1322,1323,1324,1325,1326,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1357,1358,1359,1360,1361,1362,1363,1364,1365,1366,1367,1368,1369,1370,1371,1372,1373,1374,1375,1376,1377,1378,1379,1380,1381,1382,1383,1384,1385,1386,1387,1388,1389,1390,1391,1392,1393,1394,1395,1396,1397,1398,1399,1400,1401,1402,1403,1404,1405,1406,1407,1408,1409,1410,1411,1412,1413,1414,1415,1416,1417,1418,1419,1420,1421,1422,1423,1424,1425,1426,1427,1428,1429,1430,1431,1432,1433,1434,1435,1436,1437,1438,1439,1440,1441,1442,1443,1444,1445,1446,1447,1448,1449,1450,1451,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1466,1467,1468,1469,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1482,1483,1484,1485,1486,1487,1488,1489,1490,1491,1492,1493,1494,1495,1496,1497,1498,1499,1500,1501,1502,1503,1504,1505,1506,1507,1508,1509,1510,1511,1512,1513,1514,1515,1516,1517,1518,1519,1520,1521,1522,1523,1524,1525,1526,1527,1528,1529,1530,1531,1532,1533,1534,1535,1536,1537,1538,1539,1540,1541,1542,1543,1544,1545,1546,1547,1548,1549,1550,1551,1552,1553,1554,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1570,1571,1572,1573,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1590,1591,1592,1593,1594,1595,1596,1597,1598,1599,1600,1601,1602,1603,1604,1605,1606,1607,1608,1609,1610,1611,1612,1613,1614,1615,1616,1617,1618,1619,1620,1621,1622,1623,1624,1625,1626,1627,1628,1629,1630,1631,1632,1633,1634,1635,1636,1637,1638,1639,1640,1641,1642,1643,1644,1645,1646,1647,1648,1649,1650,1651,1652,1653,1654,1655,1656,1657,1658,1659,1660,1661,1662,1663,1664,1665,1666,1667,1668,1669,1670,1671,1672,1673,1674,1675,1676,1677,1678,1679,1680,1681,1682,1683,1684,1685,1686,1687,1688,1689,1690,1691,1692,1693,1694,1695,1696,1697,1698,1699,1700,1701,1702,1703,1704,1705,1706,1707,1708,1709,1710,1711,1712,1713,1714,1715,1716,1717,1718,1719,1720,1721,1722,1723,1724,1725,1726,1727,1728,1729,1730,1731,1732,1733,1734,1735,1736,1737,1738,1739,1740,1741,1742,1743,1744,1745,1746,1747,1748,1749,1750,1751,1752,1753,1754,1755,1756,1757,1758,1759,1760,1761,1762,1763,1764,1765,1766,1767,1768,1769,1770,1771,1772,1773,1774,1775,1776,1777,1778,1779,1780,1781,1782,1783,1784,1785,1786,1787,1788,1789,1790,1791,1792,1793,1794,1795,1796,1797,1798,1799,1800,1801,1802,1803,1804,1805,1806,1807,1808]},"Age Group":{"counts":[1,630,769,761,837,894,837,773,564,445,248,156,68,4],"rows":[[2429],[0,1,1,6,3,8,11,1,1,3,1,5,1,24,18,1,1,1,1,1,38,1,1,45,1,23,15,1,15,6,1,29,1,18,37,1,1,4,1,18,1,35,7,1,1,7,82,23,25,11,1,10,1,1,1,46,22,1,1,24,1,9,1,57,1,94,1,36,1,1,1,1,11,1,18,1,1,31,1,12,1,14,1,1,27,1,1,30,74,1,5,1,1,1,12,18,17,1,1,12,17,1,36,1,17,1,1,1,13,17,1,7,1,1,36,4,1,11,62,1,1,2,1,13,1,10,1,3,1,1,16,1,32,1,1,1,3,7,10,1,1,1,4,4,1,12,7,3,25,22,14,1,14,29,3,1,24,1,1,37,34,1,11,9,6,28,45,1,1,3,8,2,1,12,6,39,1,1,12,1,4,5,2,1,8,3,28,1,1,1,7,1,5,16,1,43,3,1,36,27,1,3,20,18,1,1,9,1,1,1,44,1,4,1,25,1,1,1,1,36,1,33,1,1,6,17,21,1,11,15,1,1,25,1,1,27,1,1,19,7,8,11,20,1,14,1,1,11,1,32,1,1,42,18,1,74,11,1,47,1,11,37,3,1,37,1,1,1,3,1,100,18,1,1,46,7,1,14,1,31,1,1,7,1,7,26,1,1,3,25,4,1,28,15,1,1,1,1,70,1,96,17,26,1,1,34,16,30,1,1,66,1,22,1,9,1,27,1,1,12,1,6,30,1,3,14,1,4,1,2,1,35,7,3,7,1,11,22,13,8,1,27,26,62,15,21,12,1,1,33,1,7,1,1,14,1,1,1,1,13,1,4,2,6,1,30,1,39,1,1,31,2,1,1,3,1,1,6,1,18,10,32,1,1,1,13,1,56,1,24,1,32,1,46,1,10,1,1,1,1,24,1,5,1,1,1,9,2,1,9,1,1,9,1,13,1,35,1,1,14,33,1,4,1,2,1,16,5,1,1,1,14,31,1,26,51,1,1,21,20,17,1,1,12,3,11,1,42,14,15,1,27,1,4,1,15,1,77,23,1,7,1,1,60,17,13,17,1,7,1,77,1,1,4,10,3,1,6,1,4,1,1,4,1,24,1,10,1,19,1,1,4,42,69,1,30,1,8,1,1,15,1,1,9,6,1,6,12,6,1,36,1,1,4,1,1,1,11,1,1,6,1,1,9,71,37,1,26,23,7,1,12,1,1,1,12,4,1,12,63,3,34,7,39,1,42,1,11,1,1,74,43,9,1,22,4,1,1,5,1,1,1,5,1,5,1,1,38,1,45,23,1,1,25,32,1,4,36,1,3,1,34,9,9,1,4,4,1,1,18,7,14,7,1,1,9,19,1,8,1,20,1,20,36,1,9,10,1,23,1,6,1,26,1,11,1,4,1,54,1,18,32,1,7,1,8,1,46,1,1],[33,1,5,1,6,6,9,1,85,1,1,8,1,24,5,16,1,36,1,11,25,1,1,21,19,1,5,7,2,3,1,10,3,1,3,1,1,2,14,1,33,23,21,1,1,1,45,1,14,1,22,1,46,1,1,3,6,1,9,1,21,7,1,1,1,22,43,1,1,2,2,15,1,1,1,1,1,43,1,24,1,29,1,3,1,21,8,1,6,1,23,1,4,1,1,1,1,1,1,1,1,29,58,1,17,142,1,1,19,1,9,1,1,1,14,1,15,8,1,1,16,7,24,1,1,4,1,14,8,3,1,10,12,17,1,12,15,1,47,1,1,1,6,9,1,1,6,1,1,4,1,1,1,32,1,1,56,1,15,1,1,28,8,1,57,1,1,21,10,30,20,9,11,1,1,19,1,1,18,1,1,14,1,1,10,1,1,1,12,8,15,13,13,1,31,62,5,1,18,15,1,26,1,21,20,1,1,1,16,11,1,5,1,3,15,1,1,1,1,20,3,1,1,1,24,5,6,1,6,26,1,9,34,3,1,7,49,1,1,6,1,14,1,1,2,34,6,3,1,1,24,1,1,11,58,1,7,1,2,6,1,1,15,1,1,1,1,1,1,1,29,1,1,8,1,3,6,3,1,1,11,18,53,1,1,14,42,1,1,14,14,1,1,1,3,35,1,1,2,39,1,8,117,60,1,1,27,1,8,18,1,7,1,1,97,1,1,1,1,1,16,27,12,1,3,31,1,1,1,1,7,59,1,3,19,1,80,1,1,1,1,6,5,1,1,1,1,1,1,1,1,16,1,1,22,18,9,1,26,4,38,1,2,1,1,3,59,2,1,13,1,18,1,17,4,3,1,26,21,1,3,1,23,21,1,1,12,18,1,1,3,1,18,1,24,1,1,60,1,1,31,23,1,3,1,2,5,2,1,1,2,1,15,6,1,25,13,2,12,1,36,1,1,20,1,1,19,16,1,1,10,25,1,5,11,1,43,1,1,13,1,1,1,31,1,33,8,9,1,18,1,2,1,2,20,1,9,1,1,1,21,1,1,3,8,1,18,42,3,1,1,1,1,4,1,16,14,1,1,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,18,1,1,1,1,2,1,3,1,5,20,1,1,1,15,1,16,18,1,1,1,1,8,29,2,1,6,14,1,1,1,36,57,1,10,3,1,6,1,21,1,16,1,4,1,3,4,1,1,41,1,20,1,12,5,1,1,17,1,4,6,12,1,1,1,1,17,21,26,1,1,17,1,20,8,1,12,18,1,58,1,26,1,5,1,1,3,1,1,1,1,1,35,1,1,1,1,19,1,1,5,1,1,11,1,23,19,16,1,5,1,26,1,54,1,32,10,1,17,1,1,1,5,1,50,13,1,5,1,43,1,39,1,1,36,3,1,1,1,6,1,8,1,1,1,7,1,1,10,20,42,1,1,21,3,19,1,30,15,1,1,1,17,1,13,1,7,11,1,1,29,1,1,3,1,1,14,1,1,1,1,1,9,48,1,20,1,17,1,1,21,1,1,1,1,14,1,10,1,1,1,1,1,1,1,1,1,1,1,19,1,1,16,10,6,1,22,17,13,1,10,1,2,1,1,7,1,3,14,8,41,44,1,3,34,1,1,1,1,1,4,1,6,3,1,1,1,1,34,1,1,9,1,11,1,26,56,1,74,9,2,1,1,1,1,1,25,15,1,16,15,13,29],[29,34,11,1,19,1,5,1,1,36,1,1,13,13,31,24,1,11,11,1,13,1,21,27,1,9,1,15,6,1,14,6,1,35,1,23,1,1,9,1,9,4,1,1,40,1,13,1,4,1,1,3,1,11,1,17,1,3,1,1,1,13,1,1,4,27,6,1,1,5,1,1,1,8,1,1,5,1,29,39,13,2,3,22,1,26,1,1,10,1,1,7,1,2,4,1,5,5,1,1,1,1,3,1,1,9,6,1,3,1,46,1,1,9,9,15,28,21,4,1,37,11,1,1,33,1,14,1,1,35,1,1,1,7,1,4,1,6,15,4,1,4,9,1,1,1,1,1,2,1,1,3,27,1,33,22,18,25,4,1,28,1,2,1,17,1,1,5,22,21,19,19,1,23,1,18,1,1,12,1,4,1,7,1,1,2,17,1,14,36,9,31,1,1,14,1,1,1,1,35,1,1,11,1,10,1,1,13,8,10,15,5,20,1,1,26,1,12,17,1,10,3,1,7,12,19,47,1,69,1,1,7,9,1,3,1,1,40,1,1,6,17,1,1,49,1,19,1,24,1,6,1,1,4,1,62,14,52,1,1,1,1,1,15,1,14,1,27,1,1,14,1,1,3,21,37,1,30,6,1,1,14,23,1,1,4,1,1,35,2,1,1,13,1,6,2,5,1,1,9,13,1,37,9,1,1,1,33,16,33,1,1,1,7,1,6,1,8,1,19,1,1,1,24,21,5,18,1,12,1,1,15,1,1,1,1,6,1,1,14,1,23,1,1,21,2,12,1,5,13,1,6,1,3,1,42,1,15,18,14,1,68,1,1,1,1,24,1,15,1,11,1,9,12,1,17,1,5,1,3,16,7,1,1,1,1,3,1,1,1,1,22,1,11,1,1,16,1,6,10,6,4,30,1,16,7,12,42,1,1,23,1,9,11,1,1,1,1,6,1,33,1,8,18,16,11,1,1,14,1,1,13,1,12,1,5,5,23,1,81,7,16,1,1,10,1,29,31,1,1,61,1,14,1,40,1,1,1,6,27,14,51,1,38,1,33,33,5,1,16,1,1,12,1,16,1,5,6,22,1,1,1,15,1,6,14,14,31,1,7,1,1,25,40,1,1,62,9,5,1,1,1,4,39,3,1,3,12,1,1,5,3,12,19,12,1,1,15,1,1,28,1,38,1,1,1,2,1,6,1,25,18,26,1,1,6,1,3,1,1,1,1,8,1,6,1,1,32,1,1,1,9,1,4,1,50,34,12,69,25,1,13,7,1,15,1,29,1,1,6,1,26,4,1,1,1,4,1,17,1,14,1,1,1,1,1,1,1,1,24,1,9,1,8,1,33,20,1,16,18,22,18,1,1,11,1,1,1,52,9,22,33,1,1,51,1,7,9,1,32,1,6,1,11,1,13,2,1,14,17,1,5,1,1,55,1,1,8,11,1,11,1,53,44,1,1,4,24,8,47,1,1,1,1,10,10,1,44,4,3,1,1,1,1,29,1,1,3,1,13,1,1,1,4,1,1,32,1,4,1,1,1,25,1,32,1,1,1,33,1,1,3,6,1,1,21,1,1,1,1,7,27,5,18,1,24,1,1,4,7,1,33,1,23,1,33,39,1,1,22,1,17,14,1,1,13,1,8,1,47,39,1,1,1,12,25,11,5,1,1,3,1,1,1,1,1,37,1,13,1,29,1,7,1,2,1,5,1,62,1,6],[14,6,1,16,6,1,1,2,1,21,1,1,36,1,1,1,1,45,22,1,1,1,2,1,21,1,1,8,1,1,1,16,12,1,14,10,1,10,1,18,1,22,5,1,1,27,11,11,1,11,1,6,1,12,1,1,1,40,1,18,1,1,5,1,1,6,1,1,1,1,11,1,26,1,17,19,1,1,1,9,1,1,21,1,113,42,1,56,1,28,1,18,5,1,14,1,8,1,38,20,1,5,9,1,1,9,1,11,9,1,4,18,8,1,6,1,1,2,1,1,11,1,6,4,1,1,1,11,1,1,1,11,24,1,1,1,2,8,12,1,3,28,1,20,3,34,1,1,2,1,1,1,1,17,14,28,1,7,1,1,25,4,14,15,1,1,1,1,3,33,5,1,1,60,1,1,6,20,1,7,1,12,1,14,1,44,3,1,5,2,1,20,5,1,7,1,1,14,1,1,1,1,1,42,1,35,9,1,1,1,2,1,11,1,20,1,9,28,1,32,1,1,8,1,39,7,22,8,7,6,1,1,1,1,1,7,3,1,5,33,17,1,11,1,6,1,1,6,1,1,36,18,1,1,6,1,30,1,47,26,1,1,12,1,8,9,1,1,6,30,1,4,1,1,1,1,2,1,6,1,1,17,20,1,9,51,1,19,1,10,33,7,1,20,13,3,1,7,1,14,1,39,1,1,12,42,1,17,1,44,1,4,6,31,1,1,10,1,1,1,46,1,1,1,10,1,1,20,43,1,23,1,43,4,6,1,64,1,3,1,1,1,1,1,6,37,1,6,1,21,1,4,1,1,1,1,18,7,1,17,9,27,1,1,5,1,1,14,1,1,1,5,29,5,1,4,1,5,1,2,17,1,13,1,42,1,38,15,1,1,1,14,1,10,1,1,17,1,1,1,1,5,1,1,1,1,4,6,4,1,4,1,1,1,1,18,45,1,1,20,1,14,1,1,34,1,1,11,1,11,1,21,1,16,1,1,1,26,11,23,1,16,1,16,27,1,6,28,14,1,29,11,5,1,1,1,1,16,1,22,1,1,27,1,1,1,1,1,1,1,1,6,1,5,3,1,17,1,1,8,1,1,6,23,1,1,1,22,7,1,22,4,1,17,40,1,1,1,1,11,1,6,1,1,14,2,1,4,1,1,1,2,1,2,1,15,51,44,1,1,17,1,17,23,73,3,1,1,6,1,1,35,1,11,1,3,1,1,1,1,1,1,1,1,1,29,1,25,9,26,1,25,7,1,36,9,1,25,1,32,1,1,1,38,1,9,1,15,12,1,1,1,1,17,1,6,1,58,1,14,13,1,23,1,1,24,1,1,13,25,1,3,17,6,1,1,11,1,17,1,1,22,9,47,11,1,1,1,101,14,1,1,1,23,1,1,16,1,1,1,1,1,14,1,1,1,23,1,11,1,1,1,2,1,1,1,41,1,11,1,1,1,1,1,13,1,10,1,14,12,1,4,1,4,9,1,1,13,1,1,1,14,1,3,1,1,1,7,1,1,1,8,1,19,1,1,1,1,1,74,1,16,1,1,9,13,4,1,1,21,15,1,17,1,1,1,9,1,22,1,7,1,14,12,1,47,16,1,11,78,1,1,4,1,7,1,1,1,11,1,16,1,1,1,1,18,22,1,19,1,1,17,1,11,1,1,11,1,7,1,10,85,1,35,1,17,1,13,15,1,1,16,1,19,1,30,1,13,1,9,1,1,1,1,1,6,1,31,1,22,1,19,1,1,5,1,20,1,1,20,1,12,38,8,1,1,6,1,1,1,1,1,1,21,7,23,1,4,1,3,3,1,1,11,6,8,8,1,12,1,5,1,17,1,1,1,42,1,6,1,25,1,16,1,17,1,1,1,7,15,1,4,1,11,1,1,5],[56,1,1,2,7,1,8,1,1,1,1,1,9,1,12,1,8,1,3,7,3,33,1,1,24,1,23,1,9,1,3,1,6,1,1,10,1,5,1,1,1,4,1,1,16,1,12,1,1,1,16,1,3,26,1,31,1,2,31,1,1,5,1,25,1,1,1,1,10,1,1,23,21,19,7,1,8,1,13,1,20,1,1,12,1,32,1,12,25,14,1,1,1,15,1,1,5,1,3,1,20,1,7,10,1,1,8,1,1,8,6,1,9,1,1,1,14,8,1,1,11,1,26,1,54,1,1,1,21,1,1,26,1,1,15,1,3,1,1,8,13,1,1,8,1,1,15,1,4,1,1,1,69,1,72,9,1,1,10,22,1,1,1,1,3,1,1,1,1,2,1,1,11,1,1,14,1,1,7,34,1,1,1,20,1,1,17,1,1,1,8,48,1,1,33,1,12,4,1,1,1,1,48,23,2,53,1,35,1,1,1,1,1,1,1,9,1,30,1,1,6,1,1,1,1,1,1,1,19,10,13,1,1,1,1,1,1,2,3,12,17,1,3,1,3,4,1,1,6,2,6,1,5,37,20,1,38,1,1,20,1,4,4,1,1,7,19,27,1,1,1,13,1,4,1,1,1,33,1,5,1,9,51,1,1,1,10,6,1,1,6,1,1,1,1,1,1,9,1,6,1,1,1,3,16,29,1,1,3,21,1,5,1,1,3,1,12,1,13,1,28,21,3,21,1,1,38,1,1,1,1,1,34,1,6,1,10,1,5,2,1,1,1,17,1,1,1,1,4,1,13,48,1,1,53,1,1,1,1,36,1,1,3,7,35,1,1,5,7,1,1,1,1,1,7,13,5,1,6,1,1,23,1,9,1,12,1,1,1,1,30,1,3,1,1,4,1,1,12,1,17,1,1,2,1,1,10,1,15,1,13,10,1,48,1,1,25,57,20,7,1,17,38,1,7,24,1,20,27,1,16,1,30,9,5,1,44,2,1,1,1,38,1,18,3,1,43,26,1,19,1,1,1,1,3,4,8,1,6,1,10,1,1,1,5,16,1,12,1,4,1,4,5,1,1,4,1,1,8,1,1,1,27,1,1,16,11,1,4,1,8,21,17,1,7,1,19,6,1,1,1,1,32,1,1,19,1,1,2,1,13,3,1,1,1,1,15,7,1,3,1,1,25,33,1,1,29,1,3,1,1,18,1,1,1,1,1,1,13,1,1,9,1,1,13,1,20,1,1,1,1,1,29,1,4,20,1,1,11,1,7,7,29,1,2,1,4,9,1,5,11,1,13,1,1,20,43,1,1,1,1,28,1,20,1,1,1,12,1,1,10,1,28,1,1,24,1,31,1,1,1,13,10,1,1,12,11,1,5,1,18,72,2,1,4,50,1,7,1,1,50,26,1,1,1,1,4,34,1,44,1,1,5,23,1,11,27,1,13,1,1,1,1,1,37,1,1,1,7,1,85,1,39,1,1,1,1,3,11,3,1,1,17,1,1,7,1,3,1,28,53,1,1,24,1,20,1,1,1,8,3,1,3,1,1,27,1,1,1,5,1,1,56,1,11,1,103,1,1,1,1,1,1,18,52,1,28,1,1,27,1,1,1,1,5,1,10,45,1,1,13,67,15,1,6,1,1,10,55,1,1,3,1,1,11,1,1,10,11,38,1,1,1,1,7,25,1,1,29,1,1,44,7,1,9,1,2,1,1,9,1,1,13,1,4,4,8,15,1,40,6,1,7,1,1,1,44,21,1,1,1,3,1,1,7,1,1,12,1,1,1,29,1,1,1,1,90,6,1,17,1,1,1,6,4,4,1,1,1,1,16,1,16,1,1,7,46,1,1,1,2,1,1,22,1,10,1,1,19,1,1,1,13,1,1,1,30,2,8,2,1,18,1,2,1,7,4,1,1,59,1,1,1,1,26,1,6,1,1,2,1,1,7,1,26,1,33,1,21,1,5,1,1,1,4,1,6,1,1,1,45,1,1,3,1,2,1,1,21,1,17,1,6,1],[12,1,9,27,1,1,21,20,1,12,1,8,1,15,1,1,1,1,1,8,8,1,2,1,12,1,1,1,1,24,1,79,1,5,4,5,60,35,25,1,18,4,6,1,3,1,20,1,3,1,1,14,1,1,40,28,1,1,1,1,1,1,12,1,1,9,30,1,17,1,1,20,1,13,1,1,36,31,1,12,1,2,1,1,1,1,20,1,1,8,1,1,54,78,54,14,1,7,1,1,7,16,6,19,67,10,1,1,1,1,1,3,1,44,1,1,1,1,6,1,1,1,19,1,17,2,42,5,1,1,3,1,1,28,32,1,40,1,1,1,1,1,5,63,1,23,1,19,1,29,1,1,15,1,1,1,1,26,7,13,1,3,1,1,1,15,34,17,29,1,1,20,4,1,19,31,13,1,1,1,1,1,1,11,85,1,13,1,1,22,1,72,53,1,1,1,1,4,16,1,8,1,1,37,1,27,8,1,1,18,1,1,12,1,1,1,1,6,1,11,1,1,29,1,21,1,12,1,18,9,1,6,1,1,19,1,3,1,1,1,7,104,14,1,4,1,1,1,6,1,1,1,1,2,7,1,60,1,1,1,1,1,8,24,6,2,1,31,3,1,10,1,16,1,1,1,2,1,1,17,1,5,1,2,1,10,1,47,1,14,7,18,1,19,1,26,1,12,1,1,1,17,1,1,1,1,5,25,1,1,19,1,1,18,1,1,1,2,1,1,3,1,25,24,11,10,1,1,1,1,1,1,1,1,1,1,4,1,1,6,1,1,7,1,1,1,1,26,1,6,28,5,1,1,1,18,1,1,1,1,10,1,1,1,1,1,1,1,50,1,1,1,1,1,1,1,35,11,1,1,1,1,1,1,1,9,9,1,1,1,7,11,1,10,1,1,8,1,1,1,8,12,1,10,1,45,1,1,1,1,29,65,36,16,1,1,11,1,6,1,1,3,1,11,1,13,1,5,1,20,1,1,1,1,1,1,25,34,1,1,1,1,3,1,1,1,7,18,13,20,1,1,3,70,1,30,1,1,1,11,34,1,15,1,68,9,1,17,2,1,1,1,1,13,22,1,1,3,1,12,1,7,1,1,22,21,4,1,31,1,1,11,1,14,1,1,1,1,1,1,1,2,1,20,10,25,1,11,30,1,45,8,1,1,1,10,1,1,1,1,1,1,1,17,1,13,12,32,1,14,1,17,1,14,12,1,1,4,1,1,2,1,1,55,1,18,5,1,1,1,10,33,1,1,25,8,1,22,1,1,1,13,6,1,29,1,4,3,1,1,1,8,1,19,1,56,27,1,1,1,7,1,1,1,1,1,3,1,1,20,1,1,1,1,7,1,1,1,1,18,1,26,4,1,60,6,4,1,1,1,19,3,1,1,8,1,8,1,9,1,9,1,1,12,1,1,12,55,1,1,56,1,16,1,1,48,1,1,22,1,9,12,10,1,6,31,1,4,1,62,1,12,1,15,1,14,32,1,46,1,1,13,1,1,1,1,1,1,1,1,5,1,1,1,3,22,1,1,1,5,1,1,1,1,1,9,1,11,20,1,9,1,12,1,1,1,27,17,14,1,1,14,1,4,1,6,1,21,8,1,1,45,1,11,1,1,25,1,2,4,1,1,17,1,53,1,12,1,7,11,1,1,1,8,11,6,1,1,1,1,1,9,1,1,6,3,47,44,1,1,11,3,1,1,17,1,3,1,1,9,1,1,69,13,1,10,16,1,5,1,1,34,1,1,21,1,50,1,12,3,1,1,1,21,1,1,18,1,6,1,3,1,30,49,1,4,1,1,1,16,7,1,12,13,37,1,1,5,1,36,1,1,1,1,25,5,1,20,7,1,19,1,30,1,1,5,1,1,3,1,15,20,1,2,1,8,1],[38,21,5,1,32,1,1,42,1,3,1,16,1,1,1,7,1,3,1,31,3,1,48,2,1,1,3,1,1,1,21,1,1,1,1,8,1,6,1,15,27,9,13,1,1,1,1,4,1,2,1,1,6,1,9,1,11,1,1,1,8,1,38,1,4,1,23,1,1,1,18,1,1,1,6,62,1,2,1,1,38,30,1,1,8,1,2,1,10,1,1,1,3,1,38,1,14,1,1,1,1,16,1,1,46,10,1,14,6,1,9,1,1,10,1,12,1,1,36,1,1,1,6,1,39,1,9,1,1,9,1,19,1,1,11,1,8,1,24,16,1,1,1,1,1,15,5,1,1,1,47,4,1,1,17,1,28,1,53,1,4,1,28,1,9,1,11,14,1,1,32,1,1,46,1,1,4,28,31,1,1,1,28,1,34,1,1,1,1,6,1,16,5,1,14,1,1,14,41,1,1,1,1,1,1,17,1,13,1,3,1,23,7,48,9,1,5,32,1,15,1,37,1,6,1,2,1,1,1,46,54,8,1,23,1,2,1,1,40,1,1,24,28,1,10,2,1,1,70,43,1,1,1,1,13,14,1,1,1,1,1,1,1,1,1,36,1,2,6,1,1,15,1,17,1,16,11,2,1,1,23,1,8,3,1,7,8,5,39,5,12,1,34,10,1,82,11,1,1,1,8,4,1,1,1,9,1,1,61,1,1,10,1,1,40,1,53,1,1,5,1,1,46,5,1,1,1,5,1,8,43,1,12,1,6,1,31,1,13,59,1,14,15,1,41,1,38,1,1,11,25,1,1,1,14,15,1,12,1,35,1,13,1,1,23,1,1,1,6,1,1,7,1,3,1,8,45,1,1,1,3,1,1,13,1,88,1,1,50,1,1,80,4,1,15,1,1,1,29,1,1,1,14,1,15,1,1,7,1,1,33,1,13,10,1,8,1,1,1,1,37,9,1,1,1,4,1,1,2,1,1,27,1,71,1,1,1,29,1,9,1,38,18,1,1,22,7,10,1,1,1,6,1,1,1,11,1,37,1,1,1,73,1,1,6,1,11,1,1,1,1,6,1,42,43,1,1,1,4,9,1,1,1,20,18,1,10,1,1,1,5,1,24,1,1,1,32,1,45,1,24,1,1,54,1,8,4,19,57,1,1,72,1,16,4,1,9,24,1,1,16,24,1,1,4,71,1,1,1,9,1,2,1,23,1,16,1,1,1,7,5,1,1,1,1,1,3,1,1,28,1,9,1,5,1,1,1,13,1,1,1,7,1,1,15,1,4,1,1,18,1,1,1,1,36,6,2,1,25,1,1,4,68,3,1,14,1,8,1,1,1,1,1,37,12,1,1,1,45,1,36,1,4,1,1,1,8,1,13,4,1,68,1,6,1,1,1,1,7,1,1,1,19,1,1,1,13,1,7,5,1,1,1,1,21,45,1,3,5,28,1,1,13,16,1,1,1,1,91,16,1,1,24,1,6,1,1,1,25,2,1,11,1,1,1,7,9,1,79,3,1,1,57,47,31,1,1,1,25,1,16,1,1,1,36,17,1,1,21,1,1,6,1,10,1,1,7,41,1,5,1,1,9,10,34,1,1,3,1,1,1,24,1,1,2,10,1,1,1,1,14,1,42,1,1,1,63,1,3,1,1,4,1,1,1,1,19,1,4,1,1,61,1,10,1,1,1,21,1,6,1,4,1,24,3,1,1,1,1,46,1,28,1,1,26,1,3,1,15,1,1,4,1],[23,1,1,48,48,1,14,1,13,87,1,1,58,1,14,1,1,1,1,33,57,20,96,13,1,57,4,1,19,33,1,1,4,16,66,1,1,51,28,1,1,13,1,1,2,1,17,1,1,1,12,63,1,1,1,65,101,8,1,17,8,1,1,119,1,4,1,19,3,1,48,1,1,2,1,9,1,1,9,1,1,1,19,10,24,1,1,1,7,23,1,1,13,1,6,1,37,18,1,1,38,1,5,1,1,30,1,21,59,7,1,14,24,1,13,1,39,1,1,10,1,1,7,1,2,1,3,1,1,37,1,21,1,1,22,1,1,15,17,25,1,87,1,29,1,89,1,35,1,56,1,37,1,1,35,2,1,1,58,1,1,1,43,1,1,1,38,1,1,12,1,1,34,11,1,1,6,23,1,1,41,5,9,5,17,1,1,64,1,5,1,1,1,1,1,48,1,11,1,83,1,2,1,1,24,1,1,1,4,1,1,1,26,13,21,1,1,1,4,1,1,12,1,1,1,1,8,1,1,1,52,1,1,1,43,1,7,1,14,1,10,1,1,23,1,13,1,30,1,2,1,13,15,1,21,1,1,1,13,37,30,62,1,1,39,1,60,1,1,38,1,1,1,39,1,1,32,1,21,1,70,66,1,63,1,1,1,1,16,9,1,61,1,9,1,1,1,1,23,1,1,1,19,1,1,4,1,15,61,7,1,1,3,10,39,4,1,3,1,1,1,31,1,5,1,1,1,54,1,10,43,1,8,1,1,3,5,1,1,51,1,1,1,1,34,28,1,5,57,1,62,1,1,5,1,1,2,1,1,5,112,15,1,1,1,1,1,165,1,23,1,3,1,1,1,1,36,1,15,1,27,6,8,1,2,1,1,19,1,7,1,71,1,31,1,23,1,9,1,35,1,1,1,1,12,20,1,1,10,1,8,1,1,29,1,1,24,1,39,1,1,21,1,1,1,1,1,36,1,78,1,1,28,1,18,1,150,1,77,1,76,1,1,1,1,10,1,1,1,1,15,1,20,1,9,1,1,1,7,18,1,14,18,1,13,1,5,1,7,6,1,1,21,1,34,1,10,2,1,1,22,41,1,1,83,1,1,1,38,1,1,1,1,1,4,1,6,1,1,8,1,1,56,1,1,21,1,1,23,1,10,9,40,1,6,1,13,1,1,1,54,1,1,41,4,1,1,1,1,6,1,77,1,1,10,1,6,1,1,1,2,1,1,1,1,9,25,1,19,45,1,1,2,1,63,1,26,26,1,34,1,3,1,1],[9,1,5,1,10,1,1,25,1,1,27,1,61,44,1,1,1,1,1,1,5,1,1,1,23,1,1,1,25,1,42,3,64,1,1,1,91,1,1,1,1,1,1,112,1,1,69,29,1,1,1,1,1,15,1,1,1,20,1,1,2,57,1,1,17,1,14,1,1,25,1,64,1,1,1,1,12,1,1,1,5,1,1,49,1,1,41,1,1,1,6,1,1,1,1,4,35,1,14,1,1,176,1,50,39,1,20,18,1,1,1,1,29,1,1,1,79,1,2,4,1,1,1,47,1,18,1,1,41,50,1,1,4,16,1,1,1,1,51,19,84,1,1,1,8,1,1,10,1,1,1,1,1,1,28,1,9,9,1,3,1,1,1,7,1,1,1,1,1,18,1,1,1,4,1,3,1,26,1,39,30,1,1,46,14,1,30,1,77,1,108,1,1,1,1,25,1,1,1,1,35,120,1,27,27,42,10,1,1,80,1,1,16,1,1,1,53,1,16,20,1,1,14,1,42,1,24,1,19,1,29,1,1,1,1,1,1,10,1,1,113,19,1,1,1,17,1,14,1,1,1,74,1,16,1,31,1,189,25,1,1,6,1,1,1,83,38,1,1,46,1,1,1,1,44,62,1,4,1,1,9,1,24,1,1,1,1,18,1,364,1,1,1,18,1,58,1,21,1,13,1,16,1,1,2,1,58,1,1,88,1,31,37,1,1,1,12,1,1,125,1,1,12,1,1,1,1,68,46,22,1,7,60,1,1,50,1,1,25,1,1,59,1,1,23,1,121,1,1,10,1,64,23,1,10,3,1,59,1,1,40,1,18,29,1,1,1,1,50,1,66,68,1,50,1,10,44,1,1,1,58,3,1,1,1,59,1,1,8,1,9,8,1,1,20,1,6,1,1,1,5,15,1,1,42,21,44,1,1,40,36,1,1,1,65,1,1,1,55,1,49,1,29,34,1,1,31,56,1,29,27,70,46,56,48,1,82,1,3,1,1,1,71,26,1],[17,1,78,28,1,246,1,51,1,1,17,35,1,1,30,1,23,1,81,1,12,1,9,1,1,1,1,1,1,1,227,1,1,71,1,1,1,1,1,1,93,1,4,1,1,1,138,1,1,73,1,275,188,1,1,118,1,59,26,1,64,1,20,1,1,16,12,13,1,1,1,101,1,1,1,1,1,70,208,1,1,15,1,1,40,1,1,1,1,1,163,1,69,1,1,1,172,1,1,1,1,4,1,1,8,1,151,266,1,17,1,1,1,1,14,1,1,1,1,1,1,1,1,22,1,50,1,1,1,4,1,102,1,49,119,19,1,1,1,1,1,43,1,91,1,1,22,1,1,1,52,122,165,1,1,66,1,1,1,1,15,1,1,33,1,73,11,1,9,1,1,43,1,1,48,1,1,33,1,1,91,190,78,76,1,97,1,24,1,1,132,1,81,27,1,1,1,175,1,11,1,135,1,1,16,1,1,1,1,1,1,1,1,22,1,20,1,1,139,1,1,92,1,32,1,1,101,1,1,1,1,16,375,1,187,37,1,1,16,1,1,1,1,1,88,1,42,1],[3,1,1,1,1,110,1,1,1,221,1,1,1,1,182,183,1,243,1,101,1,1,1,1,182,1,1,72,1,1,5,1,40,1,1,310,1,201,131,1,22,1,1,35,1,1,1,1,205,1,1,1,108,1,56,1,123,22,1,1,1,1,1,415,1,15,122,1,1,12,1,173,1,201,1,1,1,71,1,1,165,1,52,1,1,1,1,81,1,1,104,1,1,93,1,1,142,1,55,1,1,1,307,141,1,1,1,46,1,1,1,52,1,1,1,19,1,1,1,1,300,1,1,1,1,86,1,1,1,1,141,1,1,44,1,1,1,1,1,1,19,1,1,180,1,1,10,1,1,1,159,154,1,528,1,1],[699,1,1,403,1,1,1,1,444,1,1,1,1,1,1,1,274,1,1,439,1,388,1,1,41,1,1,1,125,1,1,1,1020,1,1,1,851,1,38,1,1,1,1,1,1,34,1,1,1,1,181,1,1,1,590,1,1,1,123,1,1,1,1,215,1,1,1,1],[3085,1,1,1]],"ranks":[0,1,2,3,4,5,6,7,8,9,10,11,12,13]},"Gender":{"counts":[2508,4478,1],"rows":[[20,1,2,1,1,1,1,1,5,1,5,1,1,1,2,1,15,9,1,1,3,1,9,1,1,1,1,1,8,1,1,6,1,1,1,1,7,7,3,1,3,1,1,1,3,1,1,1,1,1,1,5,1,8,1,1,20,1,1,1,7,1,1,1,1,1,1,4,1,1,1,1,3,1,17,1,1,1,1,1,1,19,1,1,1,1,1,1,1,1,1,1,1,8,1,1,1,1,1,1,1,3,1,1,2,1,4,1,4,1,1,1,1,1,9,1,3,1,1,6,1,5,1,3,1,6,5,1,1,1,1,1,1,1,1,2,2,1,7,1,1,1,1,1,1,1,3,6,1,1,6,1,2,1,1,1,1,1,1,1,11,1,2,5,1,1,1,8,1,1,5,9,1,3,1,13,1,1,1,1,1,1,21,1,1,1,1,2,1,1,1,6,1,9,1,8,1,1,1,2,1,2,1,2,16,1,1,1,27,1,1,3,1,1,5,1,6,3,1,3,1,16,1,1,1,1,1,1,4,1,2,1,1,1,1,1,1,1,1,8,1,12,1,1,1,1,1,1,2,1,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,11,1,1,2,1,5,1,1,15,1,4,1,9,1,1,11,1,1,1,1,1,1,1,1,1,5,1,1,1,1,9,5,1,2,1,1,2,1,11,1,7,1,1,14,1,1,1,1,6,8,1,2,1,1,1,1,1,14,1,1,1,1,1,1,9,1,17,1,1,1,1,20,1,1,2,13,1,1,1,1,1,9,1,1,1,1,1,1,4,4,4,1,12,1,1,1,2,1,1,1,1,5,1,1,1,1,1,1,4,1,1,1,10,1,3,1,1,1,1,1,1,1,2,1,1,1,1,4,1,1,1,11,1,7,1,1,1,1,12,1,2,1,1,17,1,7,1,1,1,3,1,1,19,4,1,1,1,1,1,1,1,1,1,1,1,1,2,1,3,1,1,1,1,1,5,1,1,4,1,1,1,1,1,1,1,1,1,1,27,1,1,1,10,1,1,3,1,1,1,5,1,1,1,2,1,3,9,1,1,1,9,1,1,7,1,8,1,1,1,1,10,1,1,6,12,1,1,4,5,6,1,1,1,1,6,1,1,1,10,1,1,1,9,1,1,4,1,1,2,1,1,2,3,11,1,4,1,1,2,1,1,1,1,9,9,1,1,6,1,1,4,1,1,1,3,1,1,1,1,1,3,1,1,1,1,13,1,1,1,1,11,1,1,1,5,17,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,2,5,1,1,1,1,1,1,1,1,1,1,1,1,13,1,1,1,1,4,1,1,4,1,16,1,2,1,1,1,1,22,1,1,1,1,1,1,1,1,1,21,1,1,1,1,1,1,1,1,17,2,2,1,7,1,1,1,9,1,1,10,1,5,1,1,12,2,1,1,2,1,1,1,5,16,1,1,1,1,1,1,6,1,1,1,1,1,1,1,1,1,1,6,1,1,14,1,1,4,1,1,1,1,2,1,1,1,13,1,1,4,6,10,26,1,2,1,2,1,1,7,21,1,2,1,6,6,1,1,1,3,1,1,1,1,1,1,12,1,13,1,10,1,16,1,1,5,1,1,4,1,1,1,1,1,1,1,9,4,1,1,1,4,2,1,7,1,1,6,1,1,1,1,1,17,1,1,1,10,5,1,1,1,10,1,1,3,1,1,7,1,1,1,7,4,1,1,1,1,12,1,1,1,1,1,1,1,21,1,10,1,3,10,1,6,2,1,6,3,1,1,1,1,15,4,1,1,1,1,1,1,1,1,1,17,1,1,1,1,9,1,2,5,2,1,1,3,1,1,9,1,5,1,6,1,3,1,5,3,4,1,3,1,6,8,1,1,2,12,1,1,1,1,10,1,1,1,1,1,1,1,5,1,7,3,2,3,1,1,1,1,2,1,1,7,1,1,4,1,1,1,1,4,1,2,1,7,1,3,9,1,1,1,4,11,4,1,1,1,1,4,1,1,6,6,4,1,1,1,1,1,1,4,1,1,9,1,1,1,5,1,1,1,4,1,1,1,1,1,1,1,1,6,1,7,1,1,1,1,1,2,1,1,1,4,1,1,1,1,2,1,1,6,1,4,2,1,7,1,1,2,1,1,1,1,17,1,1,7,1,1,1,2,1,1,4,1,5,5,8,1,2,1,8,1,3,1,10,1,1,8,1,15,1,10,1,21,1,1,4,1,3,1,3,1,9,1,1,6,1,1,1,8,11,1,4,3,8,1,3,1,5,1,1,1,1,2,1,22,5,1,3,1,1,1,1,37,1,6,1,4,1,4,1,1,10,19,3,1,1,1,1,6,1,1,1,1,1,6,1,3,1,1,1,2,4,1,1,1,18,1,1,1,2,1,1,1,4,1,1,1,3,1,1,1,1,20,8,1,1,3,5,1,5,1,3,1,1,1,1,1,3,5,5,1,1,1,15,1,1,9,1,27,1,1,1,1,3,1,1,1,26,1,1,1,1,1,1,2,1,4,1,1,1,14,1,4,1,1,1,1,1,6,1,5,1,3,1,1,1,1,1,7,3,1,3,1,5,1,7,1,1,19,1,8,1,1,1,4,1,3,4,1,1,1,9,1,1,1,1,3,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,11,3,1,1,1,10,1,1,1,1,20,8,1,1,1,4,1,1,1,1,24,1,1,11,1,1,6,1,1,1,4,1,1,7,1,1,1,2,5,1,1,3,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,7,1,1,2,3,1,1,6,1,1,1,4,1,1,3,1,1,1,4,1,1,1,1,1,1,6,1,2,1,3,1,1,11,1,1,4,1,1,2,1,16,1,1,1,1,7,1,3,9,1,1,1,1,5,3,3,1,1,1,1,1,1,1,1,1,1,8,1,1,1,1,1,2,1,1,1,11,1,10,26,1,4,1,3,12,3,1,1,11,1,1,1,1,1,3,1,1,1,1,1,1,2,1,1,1,1,3,1,1,1,1,3,6,1,1,5,1,4,1,10,1,1,1,7,5,14,1,1,1,1,2,1,12,1,2,1,1,1,1,1,1,18,1,1,1,1,1,6,3,1,1,3,1,6,1,1,1,1,1,4,1,20,1,3,1,1,1,6,1,3,1,1,7,1,1,1,1,3,1,1,1,6,1,1,1,1,1,13,1,2,11,1,1,2,1,4,4,1,1,4,1,1,1,3,5,6,11,1,3,1,1,1,1,1,1,1,1,1,1,1,1,3,14,11,1,4,1,17,1,5,6,1,1,1,4,5,1,1,1,1,8,9,3,1,1,1,2,1,13,6,7,3,5,1,9,1,5,3,2,1,5,1,5,1,17,1,1,5,1,3,1,6,1,1,1,1,8,1,4,1,1,1,1,9,1,1,1,3,3,1,5,1,1,1,5,1,1,1,1,1,22,1,1,1,1,1,5,1,2,1,1,7,1,4,7,1,1,1,1,1,1,1,1,2,1,5,1,1,1,8,1,1,1,1,1,1,1,3,1,5,1,1,1,5,1,3,1,8,1,1,5,9,1,1,1,1,1,1,1,10,1,14,4,1,1,1,2,10,1,1,8,3,1,1,3,1,1,1,1,5,1,16,1,1,1,1,7,3,1,24,1,1,1,1,5,1,1,12,1,16,1,20,1,17,3,1,2,1,1,1,1,13,1,1,1,1,9,1,1,1,3,1,2,1,1,1,1,3,1,4,1,1,6,26,1,3,1,1,1,1,1,1,1,17,1,2,1,1,1,7,1,1,1,1,6,3,1,8,1,1,1,1,1,1,3,1,1,1,3,1,1,5,1,1,2,1,9,1,1,1,2,1,8,1,1,1,1,1,13,1,1,1,1,1,2,1,1,11,6,1,1,1,2,1,1,14,1,1,1,1,4,1,1,1,1,4,1,4,1,1,9,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,4,1,8,1,1,7,1,1,2,1,1,1,7,1,1,1,1,25,1,1,1,3,1,9,1,12,1,4,1,2,11,1,1,1,14,1,1,1,1,12,1,1,3,5,1,1,1,4,1,3,8,1,1,1,1,1,3,1,1,1,1,1,11,18,2,1,1,1,2,1,5,1,1,1,1,4,1,1,1,1,1,1,7,1,3,1,1,1,1,12,1,3,1,1,1,1,1,5,1,1,1,1,1,1,3,4,1,1,3,1,1,13,1,1,1,1,9,6,1,1,1,3,1,1,1,1,11,4,1,1,1,1,1,1,9,1,1,1,1,1,7,1,1,1,1,1,1,1,17,1,1,1,6,1,3,1,1,3,22,7,1,3,1,1,1,1,1,1,5,1,1,1,3,1,1,1,1,1,16,1,1,1,1,1,1,1,1,4,1,18,1,11,1,1,1,1,9,1,1,1,1,8,1,1,26,1,21,1,1,1,11,1,1,5,1,1,2,3,1,10,6,1,1,2,1,1,3,4,1,1,1,9,1,1,15,1,1,7,1,1,1,1,1,1,10,1,1,1,1,5,1,1,4,1,1,1,1,11,1,1,1,1,4,1,1,4,1,1,1,4,2,1,6,1,4,1,1,1,1,1,1,1,1,1,4,1,1,10,1,1,14,1,1,1,1,2,1,1,11,2,1,11,2,1,1,1,1,2,1,4,4,1,2,8,1,1,17,1,1,2,6,1,15,1,3,4,1,1,9,1,1,1,3,1,3,1,1,1,9,1,1,3,1,1,1,3,1,1,12,1,5,1,1,1,3,1,3,5,1,1,5,1,1,2,16,1,1,2,1,1,15,1,1,4,1,1,1,4,1,1,1,1,1,5,1,2,1,1,1,5,1,7,1,1,1,1,8,1,11,1,6,1,1,10,1,1,1,1,1,1,13,1,1,6,1,1,1,1,15,1,1,1,6,1,1,1,1,5,9,1,1,1,1,3,1,1,2,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,4,1,1,5,8,1,1,1,1,1,1,4,2,3,1,1,1,1,8,1,2,1,1,6,1,11,3,1,1,1,1,1,1,4,1,1,1,4,1,1,3,1,1,3,1,8,1,1,1,7,1,1,1,5,1,1,6,1,1,1,6,1,1,1,6,1,1,7,1,11,1,1,1,6,1,1,1,1,4,9,1,1,1,1,1,1,10,1,1,1,1,1,1,1,3,4,1,1,1,5,1,1,1,1,1,1,1,1,3,1,8,1,8,1,1,1,1,8,1,1,1,1,1,5,1,11,1,1,2,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,5,1,3,1,1,1,1,1,2,4,4,1,1,1,1,1,1,1,1,1,1,1,5,1,1,4,1,7,2,1,6,1,4,1,1,7,6,1,2,1,1,1,14,1,1,3,1,6,1,1,1,6,1,1,1,1,1,1,1,1,1,5,9,1,1,3,1,1,3,1,1,1,1,1,4,1,3,1,1,1,7,1,8,5,1,3,1,9,1,1,1,10,1,3,1,1,1,7,1,16,11,1,1,1,4,1,1,8,10,1,6,7,1,1,1,1,1],[0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,7,1,1,1,3,1,1,1,5,3,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,4,1,3,1,1,1,1,1,1,1,7,1,1,1,1,1,1,4,1,1,1,1,6,1,1,1,1,1,2,1,1,1,1,1,2,1,3,1,5,1,8,1,1,1,3,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,8,1,1,6,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,13,1,1,1,1,1,1,9,1,4,3,1,1,3,1,1,7,1,1,1,1,1,1,1,3,1,4,1,1,1,1,3,1,1,1,3,1,3,1,1,1,1,2,1,1,1,10,2,3,1,1,1,1,1,9,1,2,1,1,1,1,4,1,1,1,1,3,9,1,1,1,1,1,1,1,1,1,3,2,1,1,1,5,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,3,1,3,1,1,1,1,1,1,1,1,1,1,1,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,5,1,1,1,1,3,1,1,1,1,1,1,1,3,1,1,1,1,1,1,5,3,3,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,4,1,1,1,3,1,1,1,1,2,1,3,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,3,10,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,8,3,1,2,1,18,1,1,1,1,1,1,1,1,1,4,3,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,3,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,11,1,1,1,6,1,1,1,1,1,1,1,2,1,1,1,3,4,3,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,2,1,1,1,1,1,1,3,7,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,2,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,1,1,1,8,1,1,2,1,1,2,1,1,3,1,1,1,1,1,1,1,1,1,1,5,6,1,1,1,8,1,1,5,1,1,1,1,1,1,1,1,3,1,9,6,1,1,5,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,6,1,1,1,1,1,1,1,1,1,1,3,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,5,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,14,3,1,7,1,1,1,4,1,1,12,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,1,4,1,5,1,1,1,5,3,1,2,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,4,1,1,1,1,1,3,1,1,1,1,1,1,6,1,1,1,1,1,1,1,1,4,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,4,1,1,2,1,1,1,2,1,1,1,1,6,1,1,1,1,5,1,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,4,1,1,4,4,2,1,2,1,1,1,1,1,1,1,1,1,3,1,1,4,6,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,4,1,1,1,1,4,1,1,5,1,7,1,6,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,1,1,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,16,1,2,2,1,1,1,14,1,1,1,1,1,1,1,1,1,1,1,6,1,1,4,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,11,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,10,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,3,1,1,1,1,1,5,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,3,1,1,1,4,1,1,1,1,1,1,1,1,1,1,2,4,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,1,1,12,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,6,5,1,1,1,1,1,1,1,1,1,1,1,4,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,3,4,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,3,1,1,1,1,2,1,1,1,1,5,1,8,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,4,1,1,9,1,1,1,1,1,1,1,2,1,1,5,1,1,2,3,1,1,1,1,1,4,1,1,1,1,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,1,2,1,1,1,5,1,1,1,1,1,1,1,1,4,1,4,1,1,1,1,1,5,1,1,1,1,1,2,1,1,6,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,1,3,1,1,1,1,2,3,1,1,1,1,2,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,11,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,3,2,1,1,1,2,4,1,4,1,1,1,1,1,1,1,3,1,1,1,3,1,1,1,1,3,1,3,1,1,1,2,1,2,1,1,3,1,3,1,1,1,1,2,1,1,1,1,1,1,4,2,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,1,9,1,1,1,3,1,1,1,1,1,2,1,2,2,1,6,4,1,1,1,1,1,4,1,1,6,1,1,3,3,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,5,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,6,1,1,4,1,1,1,1,2,1,1,1,1,2,1,1,8,1,1,4,1,1,1,1,1,1,1,5,1,1,1,5,1,1,10,1,1,1,1,3,1,1,1,1,1,7,5,1,1,6,4,1,1,1,1,3,1,1,2,3,1,1,1,1,1,4,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,5,4,1,1,3,1,1,1,2,1,1,1,2,1,1,1,1,1,1,3,3,1,1,1,1,1,1,3,1,3,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,3,1,3,1,3,1,1,1,1,1,1,1,4,1,1,1,1,5,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,1,1,2,1,2,1,1,1,1,1,1,3,1,3,1,1,1,6,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,3,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,3,1,1,3,1,1,4,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,6,1,1,1,1,7,1,1,1,1,3,1,5,2,1,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,5,1,1,5,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,4,1,2,1,1,1,3,1,1,1,3,1,7,1,2,1,1,1,2,1,1,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,3,1,1,5,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,7,1,1,1,1,3,1,1,1,3,1,7,1,1,1,1,1,2,1,3,1,3,1,1,1,3,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,5,1,1,3,1,2,1,1,5,1,1,1,1,1,1,1,6,1,11,1,1,8,1,1,1,1,1,1,1,1,1,2,1,5,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,5,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,4,1,1,1,1,5,1,1,4,1,1,1,1,1,5,2,1,1,1,4,1,9,7,3,1,1,1,1,1,4,2,1,4,1,1,1,1,5,1,1,4,1,5,1,1,8,1,1,1,1,3,3,1,4,1,1,1,1,1,1,1,1,1,4,1,1,4,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,6,1,1,1,2,1,2,1,12,1,1,1,1,1,1,7,5,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,3,1,2,1,1,1,1,1,1,1,1,1,1,2,1,4,1,1,1,1,1,1,1,1,1,7,1,8,6,1,6,1,2,1,1,1,1,4,1,1,1,3,1,1,3,1,1,1,1,1,1,1,1,5,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,6,3,1,1,1,1,1,1,1,1,1,1,3,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,1,2,1,4,1,3,1,1,1,1,7,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,5,1,1,1,1,3,1,4,1,1,1,1,1,6,1,5,1,1,1,1,7,1,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,4,3,1,1,2,1,1,4,1,1,5,1,2,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,1,14,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,2,1,1,1,1,5,1,1,2,1,1,1,6,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,5,3,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,2,1,2,1,1,1,3,1,1,1,1,1,1,1,3,1,1,1,2,1,2,3,1,1,1,3,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,3,1,3,1,1,1,1,6,1,1,1,1,1,1,3,1,1,6,1,1,1,1,1,1,1,5,1,2,1,3,1,1,1,5,1,1,1,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,1,3,4,1,1,1,1,1,3,1,1,2,1,1,1,1,1,10,3,1,1,1,5,1,1,1,1,1,1,9,1,3,1,1,1,5,1,1,1,3,1,3,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,9,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,5,2,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,2,1,4,1,6,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,2,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,4,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,3,6,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,5,1,3,6,1,3,1,1,4,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,5,1,1,1,1,1,6,1,1,1,1,2,1,3,1,1,1,1,1,1,8,1,5,1,4,1,1,1,4,3,1,1,1,1,1,1,1,5,3,1,1,1,1,1,1,7,1,1,1,1,1,1,1,1,1,1,1,7,4,1,1,1,1,1,1,1,1,1,2,1,1,1,1,5,4,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,6,1,1,3,1,1,4,1,1,1,1,1,1,1,4,1,1,1,1,14,1,1,3,1,1,1,1,1,1,4,1,1,1,1,1,4,5,1,1,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,3,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,3,1,1,3,2,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,1,1,1,4,1,2,1,1,1,5,1,1,3,1,2,1,1,1,1,1,1,7,1,7,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,5,3,1,1,1,6,1,1,8,1,1,1,1,1,3,1,6,1,1,1,1,1,1,1,1,1,1,3,1,7,1,1,1,8,1,2,1,1,4,1,4,1,1,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,2,1,1,1,1,5,1,6,1,1,1,1,1,1,1,1,1,2,1,1,8,1,1,1,1,1,1,1,7,1,1,1,1,1,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,3,1,4,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,3,1,8,1,1,1,5,1,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,10,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,6,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,4,1,1,1,4,2,1,3,1,2,1,1,1,1,1,2,1,1,1,1,4,4,1,2,1,1,5,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,8,1,1,1,1,1,1,1,1,6,1,1,1,4,1,1,6,1,1,1,1,1,1,1,1,1,6,1,1,4,1,1,5,1,1,2,3,1,1,1,1,3,1,1,11,1,1,4,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,6,4,1,1,1,1,1,1,1,1,1,2,3,1,1,1,1,1,1,1,1,1,2,6,3,1,1,2,1,1,3,2,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,2,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,2,1,1,4,1,1,1,1,1,1,1,5,1,3,1,5,1,1,1,1,1,1,1,4,1,5,1,4,1,1,1,1,1,1,1,1,1,1,3,1,1,1,5,1,3,1,2,1,1,1,4,1,1,1,4,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,4,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,5,1,1,7,1,1,1,3,5,1,1,1,3,1,1,1,1,1,6,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,3,1,1,1,1,4,1,1,1,1,1,1,1,1,8,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,6,1,1,1,2,1,1,1,1,1,1,1,6,1,4,13,1,6,1,1,4,1,1,1,2,1,1,1,1,1,1,8,1,1,2,2,1,6,1,1,1,1,1,1,3,4,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,8,1,1,5,1,1,4,1,4,1,3,1,1,1,1,1,1,5,1,1,1,1,1,5,1,1,1,4,1,1,1,1,5,1,1,1,1,5,1,1,1,1,4,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,5,1,1,1,1,6,1,1,2,1,1,1,1,1,1,1,8,1,1,1,1,1,1,1,1,9,1,2,1,1,5,1,1,1,10,1,3,1,1,1,1,1,1,3,1,1,1,1,1,1,6,1,1,1,1,1,1,7,1,1,1,3,1,1,1,1,1,1,1,1,1,4,3,1,1,1,1,16,1,4,1,1,1,3,1,7,2,1,1,2,1,1,13,1,1,1,4,1,1,3,1,1,1,1,1,2,3,1,1,1,1,3,1,1,4,1,1,1,1,1,2,1,1,1,1,3,5,1,1,1,1,1,1,1,1,1,1,1,1,4,1,3,1,1,1,1,5,1,1,1,1,11,1,1,1,2,1,1,1,1,1,1,1,4,1,4,1,7,1,1,3,1,5,1,1,1,1,1,3,1,1,1,1,1,1,2,1,1,1,3,1,3,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,1,3,1,5,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,5,1,1,4,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,3,1,1,1,1,2,1,1,1,1,1],[5733]],"ranks":[0,1,2]},"Event":{"counts":[319,694,296,164,388,507,202,701,256,402,286,215,290,235,336,250,296,166,341,219,28,396],"rows":[[1,12,3,38,24,11,74,8,13,26,9,17,7,66,21,8,57,8,6,5,39,9,40,22,8,47,47,11,36,24,17,18,8,10,16,38,36,8,64,16,30,15,5,9,11,28,9,16,4,11,47,28,16,11,16,4,47,21,56,19,42,86,17,70,41,10,12,52,5,3,6,17,20,14,10,4,12,12,5,6,24,10,65,48,22,2,27,18,45,44,26,13,9,4,10,7,59,26,41,24,6,46,7,18,30,39,3,5,4,24,38,79,11,17,6,47,13,3,14,34,12,7,24,26,4,16,81,53,10,30,3,9,16,14,36,28,48,12,10,26,46,2,18,2,16,7,54,4,17,16,16,7,45,14,22,36,19,18,7,51,18,16,4,17,28,18,13,7,10,4,9,4,5,52,14,12,5,3,35,6,8,28,73,3,20,7,5,18,58,11,15,15,5,66,17,13,4,22,2,59,34,7,11,30,6,10,5,31,2,9,18,4,14,25,73,40,15,20,27,2,45,37,22,54,27,3,21,3,24,8,24,46,69,5,5,2,90,7,24,49,5,18,42,2,12,28,6,5,22,19,15,4,6,5,65,28,59,3,6,28,10,3,18,40,41,6,92,21,16,7,27,7,11,3,8,69,40,60,21,1,63,21,11,38,28,22,20,88,7,5,4,13,6,2,4,6,16,13,9,37,11,30,22,23,5,10,8,8,23,4,16,3,4,12,11,36,10,116,27],[27,7,23,4,9,3,2,1,4,13,2,1,7,45,28,20,7,9,12,3,3,21,13,8,4,12,19,26,2,4,4,8,5,13,5,11,5,35,12,8,10,4,8,33,7,3,5,4,2,5,12,5,16,11,32,2,6,2,5,5,7,25,7,9,12,9,2,7,16,14,6,11,36,25,6,9,2,2,4,5,3,3,16,7,5,6,17,9,7,35,13,9,2,9,7,5,3,12,15,4,18,77,6,9,5,23,4,6,22,7,2,42,9,9,11,6,6,11,12,12,14,11,3,9,4,15,5,9,14,1,5,3,15,6,14,3,5,15,21,3,2,25,6,14,32,5,4,19,2,13,4,2,3,4,10,6,9,3,14,7,18,25,1,36,20,3,6,14,5,8,4,1,15,21,2,8,4,5,15,16,27,1,2,19,8,1,5,8,8,8,9,2,11,14,9,11,5,2,11,16,6,12,16,4,3,2,8,11,47,13,11,21,3,3,8,3,6,17,23,24,3,3,3,2,19,10,7,13,29,3,7,40,3,4,4,4,9,11,5,4,5,14,13,12,3,5,3,15,7,1,6,11,5,14,15,2,8,15,4,15,5,8,5,1,12,1,1,8,3,22,27,19,7,5,10,5,3,15,9,3,4,5,10,4,13,11,6,14,13,8,13,4,11,5,3,1,8,43,3,7,28,3,16,5,3,11,7,5,11,4,2,2,11,8,6,16,19,7,28,12,10,3,11,8,10,13,2,13,5,1,22,6,4,17,4,2,14,3,5,9,6,26,3,1,4,21,3,10,5,2,7,16,19,4,8,6,5,5,17,17,5,3,5,2,22,12,3,8,19,10,3,15,3,2,1,12,24,2,7,4,44,9,5,9,4,2,4,22,27,33,12,7,21,13,12,5,24,4,24,2,9,7,10,12,1,19,7,13,2,17,4,11,9,7,23,1,4,7,5,7,8,6,10,10,1,17,22,5,16,9,2,4,46,14,10,10,24,3,9,2,10,18,7,4,2,3,3,22,9,7,8,2,15,5,28,8,11,16,10,2,19,5,3,7,12,13,31,12,13,7,9,4,25,12,3,4,14,13,16,18,10,6,1,37,26,20,3,2,15,5,12,18,22,5,7,3,2,16,18,1,13,10,6,19,8,4,1,1,21,5,15,4,5,2,17,2,9,8,2,12,20,1,7,4,7,8,7,6,5,5,20,18,6,3,9,49,3,20,28,20,12,12,1,3,2,2,6,3,3,6,1,7,9,2,8,16,4,3,6,5,10,25,23,6,5,35,8,6,6,5,16,3,15,10,25,8,23,7,27,30,17,26,5,9,24,6,2,4,10,3,5,2,3,3,19,4,6,7,7,13,20,1,10,25,2,6,2,5,14,1,3,11,3,3,4,14,13,10,11,23,26,4,3,3,4,8,5,8,31,4,12,10,32,3,16,2,12,3,5,4,4,2,2,25,2,2,4,12,12,7,2,23,11,5,4,8,31,19,7,4,16,22,5,39,3,17,23,2,4,22,7,11,2,4,5,7,12,8,2,1,4,12,12,2,19,8,2,10,7,7,2,24,12,7],[2,30,13,6,4,90,11,42,22,46,57,8,28,2,37,2,15,35,4,9,42,37,50,28,54,24,10,25,22,40,46,8,10,27,27,28,38,29,3,3,17,5,3,13,50,5,9,12,30,20,7,4,3,3,71,47,19,88,6,53,17,9,58,35,12,42,15,3,18,40,9,28,5,2,28,13,23,16,5,26,40,36,9,16,14,3,30,3,3,50,56,15,24,22,10,69,55,10,11,18,11,39,14,9,8,57,3,2,26,3,62,6,30,84,10,46,2,44,44,37,5,26,18,4,10,14,19,9,7,23,114,46,2,114,3,28,2,8,77,16,14,99,3,4,49,16,4,16,6,39,18,25,2,3,4,9,9,52,14,17,5,33,10,6,46,42,34,56,6,4,11,11,41,5,66,30,4,54,3,9,14,74,11,16,43,40,1,20,4,2,19,26,26,40,18,4,5,2,6,27,2,69,35,49,5,6,24,48,13,15,2,19,29,59,10,5,9,116,3,49,5,12,48,39,3,6,5,28,28,4,6,35,51,9,12,59,38,21,2,14,20,4,6,12,10,56,3,54,19,16,7,68,28,12,33,24,6,14,6,8,23,56,4,49,13,4,5,25,6,44,2,20,22,21,31,21,9,54,93,13,28,4,15,16,25,2,9,11,72,13,38,6,15,46,10,24],[48,35,23,16,43,219,21,146,169,15,64,2,5,89,9,60,36,64,44,55,34,54,150,80,8,50,2,9,9,72,7,11,84,21,43,14,86,53,21,9,9,24,10,2,27,25,273,29,11,9,2,71,60,6,90,168,6,6,59,22,21,25,12,57,54,16,91,61,64,96,31,22,63,104,176,30,106,6,139,10,14,19,24,7,8,29,23,7,15,20,17,7,2,11,30,25,3,47,22,11,4,30,67,50,3,32,76,4,2,16,45,109,2,31,21,32,55,29,43,82,22,2,18,58,12,6,17,67,10,32,3,57,147,49,13,122,23,57,288,11,76,14,89,29,36,13,2,55,7,34,23,30,57,48,43,65,13,33,50,12,2,9,60,19],[58,4,9,16,17,65,3,5,27,9,18,26,1,12,16,3,21,26,4,4,8,39,55,10,4,4,44,5,31,18,9,52,35,4,9,12,18,5,16,26,16,8,43,36,15,7,21,75,16,11,24,4,18,7,13,43,14,15,5,35,20,9,14,7,44,6,23,7,2,15,5,16,4,16,15,29,5,3,21,22,15,3,25,29,46,43,6,17,12,3,8,9,16,1,19,15,3,7,11,63,8,5,38,13,4,31,20,15,23,5,16,8,32,31,3,24,52,25,1,31,39,20,49,2,10,9,9,24,5,5,3,5,51,55,9,11,41,101,36,4,13,6,7,7,11,43,6,8,2,70,15,21,9,18,21,10,7,28,48,5,28,7,5,12,21,5,11,2,17,8,1,5,12,4,54,8,4,24,46,6,28,4,12,11,4,7,3,3,5,9,13,75,2,14,31,6,44,1,14,5,40,29,5,13,51,31,10,7,4,12,45,9,7,50,10,9,9,58,20,6,4,9,45,63,7,24,11,5,21,38,22,2,8,11,40,8,47,7,31,35,12,10,5,3,13,9,6,2,18,2,28,35,31,8,19,13,2,29,12,13,23,22,12,4,17,30,64,35,7,2,9,20,3,2,18,12,34,13,16,32,21,20,11,60,9,43,11,7,21,44,10,7,6,48,7,16,1,5,22,20,32,2,4,13,46,14,42,27,35,15,5,5,10,6,18,11,32,23,81,35,12,5,14,6,4,14,9,22,1,13,3,7,10,3,11,2,8,10,27,8,5,15,3,17,1,30,21,49,4,3,20,43,12,5,2,10,19,13,14,12,3,17,10,10,33,8,16,23,64,10,4,9,1,42,30,13,7,13,38,20,4,75,29,3,4,42,3,7],[31,13,5,16,21,29,1,11,41,7,7,24,27,8,4,20,33,2,25,4,18,13,21,16,5,11,8,7,2,5,14,9,14,8,8,16,8,5,19,4,1,33,2,15,28,20,7,2,61,19,49,26,15,15,13,1,16,8,17,4,7,12,4,25,5,8,17,11,13,8,5,3,3,17,3,5,7,23,10,2,5,16,3,17,1,5,2,6,8,6,6,5,17,4,1,5,3,44,25,6,2,20,15,9,19,95,20,29,4,26,4,1,3,4,7,21,18,14,9,10,12,12,24,8,9,3,32,7,8,46,7,11,24,14,10,32,24,4,20,2,20,6,9,9,13,6,5,11,7,7,3,5,6,19,2,54,2,15,5,19,2,10,2,6,6,2,21,5,30,2,69,10,6,4,5,12,15,2,4,2,2,2,6,23,12,10,28,1,14,3,6,3,3,21,15,2,21,27,4,3,40,22,6,18,24,25,3,17,27,10,32,4,12,18,34,2,18,2,14,10,17,9,6,3,21,2,8,5,5,28,18,16,29,14,29,3,4,1,3,13,1,41,5,19,21,3,3,3,34,38,9,8,19,3,3,16,5,4,10,49,24,4,14,14,65,22,14,56,5,1,20,51,2,18,4,15,8,2,22,28,14,11,4,10,6,18,2,15,2,5,19,2,4,7,29,23,37,2,9,1,12,7,6,12,20,13,6,4,2,29,28,2,5,10,22,14,19,19,9,47,16,3,13,6,2,10,5,61,15,10,4,41,12,31,3,15,3,7,9,6,7,2,35,1,6,15,10,10,24,4,7,2,3,13,9,33,5,2,20,15,2,10,11,6,1,4,18,11,2,21,3,22,9,11,1,5,10,4,16,15,5,4,8,4,59,63,5,3,54,30,29,13,9,4,57,4,7,13,20,11,17,8,6,4,14,11,5,15,7,4,3,35,4,38,22,2,92,4,7,27,14,10,10,9,13,6,8,5,2,33,9,3,3,2,16,32,4,16,22,3,8,12,4,24,24,7,16,2,2,3,18,22,11,33,6,8,23,6,2,20,28,31,17,8,4,2,4,4,5,25,6,44,5,11,12,16,21,59,31,25,39,9,58,28,2,5,18,1,3,4,26,18,5,4,10,18,10,40,3,38,6,15,33,7,6,26,8],[47,12,23,23,16,43,198,21,21,18,103,25,157,12,15,19,45,2,5,95,63,36,64,73,26,29,5,54,150,7,73,8,19,6,2,23,11,47,41,11,11,73,21,43,14,86,53,30,9,24,10,2,51,1,37,96,48,121,11,9,2,19,9,43,60,6,31,57,2,64,99,5,6,6,58,1,4,18,21,25,12,57,54,16,18,2,4,67,61,37,27,9,165,5,33,104,84,33,18,15,16,10,30,106,6,29,109,1,10,14,43,6,9,2,2,25,23,7,15,17,20,9,40,1,25,3,47,9,13,15,30,29,38,50,34,1,69,13,16,45,28,55,26,2,6,25,21,32,55,29,43,82,22,2,18,58,12,6,17,64,3,10,32,3,46,11,147,62,76,69,57,2,24,13,58,13,152,37,76,14,88,30,36,13,2,55,7,34,23,3,27,105,58,50,13,33,50,12,2,69,8,11],[8,48,7,6,5,5,13,2,15,14,20,4,4,7,29,7,1,16,12,3,8,16,6,5,2,6,2,4,4,5,1,19,38,6,7,13,5,34,17,7,5,6,10,14,7,10,16,7,3,5,4,2,9,8,32,13,19,2,6,2,10,7,5,20,4,3,21,7,2,2,7,16,2,26,14,5,9,11,30,1,8,1,2,2,4,5,15,2,5,18,26,7,30,13,14,2,9,12,2,1,27,4,26,69,6,14,7,20,6,29,2,27,15,9,9,3,8,6,6,41,13,6,3,13,10,10,7,2,14,6,3,15,20,3,4,8,4,3,4,18,3,27,4,2,4,9,11,7,15,5,12,11,2,13,4,5,4,10,6,9,3,14,6,1,8,10,2,10,10,3,27,1,8,5,9,2,4,4,6,5,3,6,13,4,16,10,3,3,5,5,5,22,2,16,10,5,11,9,14,8,14,16,11,11,14,20,3,2,2,11,16,12,6,20,3,2,8,11,10,3,17,17,4,20,7,7,7,3,10,1,3,6,17,20,30,2,1,3,21,10,19,1,28,4,7,8,31,1,3,4,4,13,10,1,5,4,5,11,3,3,6,16,3,8,12,3,14,11,2,3,2,12,15,10,15,4,3,17,6,7,7,1,11,4,3,22,18,12,8,8,7,5,10,8,7,8,2,6,1,3,8,1,14,13,10,1,6,14,21,3,4,6,4,11,16,1,6,30,26,11,8,16,3,5,3,11,10,12,1,6,2,11,8,29,12,7,2,14,34,3,14,12,9,7,2,12,29,23,4,4,2,22,9,10,10,12,3,5,11,9,4,10,7,7,8,2,25,18,4,6,4,4,26,5,3,5,2,10,2,10,12,3,8,5,18,6,3,15,3,2,13,24,2,2,9,44,9,5,13,2,3,1,22,5,9,5,16,22,3,19,34,8,4,5,10,14,19,9,11,7,9,13,9,7,4,7,2,5,6,2,12,5,4,2,9,7,32,17,7,8,16,19,2,7,21,6,27,4,3,19,24,11,3,47,9,12,18,7,4,2,3,41,8,17,27,6,19,7,9,4,6,2,19,8,4,15,9,27,1,19,20,4,5,4,25,12,3,4,22,21,2,15,1,10,6,8,30,2,20,4,19,4,2,15,17,15,25,5,10,2,6,10,9,7,2,4,5,14,4,22,8,4,8,1,4,10,4,1,2,13,4,5,2,17,2,9,8,2,12,12,16,4,26,2,5,5,14,6,7,17,3,9,21,28,3,20,55,5,4,1,5,2,4,2,11,3,5,1,17,26,4,3,6,10,1,4,25,23,14,38,8,9,13,8,15,10,25,15,23,27,30,3,14,8,6,1,16,8,1,12,12,6,6,10,8,2,6,19,4,9,8,2,34,36,2,8,5,14,4,5,12,4,4,10,13,10,3,1,60,6,3,1,8,13,30,17,55,27,1,3,1,4,2,2,11,16,18,12,7,5,11,9,11,5,2,2,4,4,10,11,10,2,2,11,4,2,5,3,11,6,10,2,15,5,1,33,3,4,13,23,2,4,6,23,13,9,7,20,2,5,12,12,2,19,8,10,2,7,6,1,2],[28,8,4,28,13,21,38,6,6,3,26,47,32,33,15,4,45,1,41,39,84,36,2,26,7,6,36,52,2,15,52,2,5,46,19,49,26,17,17,84,22,39,4,39,93,7,6,9,42,27,24,18,12,28,4,45,15,8,7,56,6,16,13,21,98,70,33,20,36,32,17,44,24,94,23,57,73,3,85,21,13,36,5,6,37,3,25,27,59,12,23,2,9,61,32,6,21,30,9,19,17,5,11,20,5,15,7,71,9,23,3,55,27,57,7,15,143,32,9,25,8,51,19,22,5,26,65,8,5,21,13,2,8,33,22,2,49,59,64,22,64,11,49,18,16,3,41,56,36,22,38,16,16,14,24,16,5,47,24,40,6,4,28,4,22,144,15,89,2,8,39,23,9,19,11,23,56,36,9,10,43,108,13,12,6,3,52,9,31,78,25,15,27,36,14,54,42,14,4,23,38,11,29,18,5,5,3,17,10,8,51,17,40,22,16,8,54,5,63,65,67,11,53,33,37,89,35,18,4,42,11,17,9,28,59,6,28,3,15,43,21,9,20,16,36,19,63,4,36,18,35,15,9,28,13,7],[0,12,3,35,3,13,11,11,38,36,8,3,10,14,12,5,18,3,7,17,24,4,24,26,8,37,12,14,53,4,36,22,8,32,4,10,1,16,6,25,11,60,17,18,8,10,5,11,42,57,10,53,45,10,4,11,28,9,16,4,11,34,7,14,20,10,6,10,1,8,8,21,11,21,12,6,1,14,2,32,2,17,21,29,6,51,29,43,5,18,62,22,57,3,6,11,6,20,2,12,26,17,59,21,19,6,4,49,17,2,12,38,38,2,33,11,11,15,4,9,19,9,2,59,19,7,38,3,40,23,10,27,31,2,37,12,24,9,41,94,16,2,11,6,14,5,4,19,7,34,12,7,9,15,30,9,7,12,57,6,2,67,30,22,5,1,32,12,6,50,26,9,3,9,1,72,2,18,2,16,32,29,9,12,10,6,16,7,4,30,11,4,10,20,2,36,44,51,18,12,4,21,23,5,8,10,4,30,13,5,10,11,12,19,14,12,20,1,10,1,11,6,8,9,19,2,2,55,4,4,9,11,16,7,6,2,8,8,50,26,15,3,2,41,11,10,4,30,4,12,10,2,13,36,8,2,34,7,47,10,28,8,2,4,5,3,15,7,11,17,23,23,62,13,15,6,41,7,23,1,16,59,9,11,34,19,3,5,24,3,10,14,8,29,41,18,51,5,7,52,32,13,24,49,23,42,14,6,13,7,2,6,3,21,3,19,3,22,54,32,74,6,7,31,3,28,25,1,11,22,12,6,27,7,44,14,6,31,16,9,14,2,11,11,27,42,3,34,3,13,47,7,14,79,6,11,34,19,13,39,3,3,8,15,6,7,22,27,7,5,17,6,2,10,3,15,11,9,37,11,8,44,23,5,10,16,23,3,5,15,20,7,5,3,28,4,34,43,43,23,6,4],[9,5,9,67,7,10,3,7,24,18,29,11,16,22,11,5,9,19,13,2,17,4,4,6,36,23,46,11,34,13,5,57,2,41,2,43,23,14,46,21,23,12,12,5,33,24,7,19,2,40,8,31,67,1,28,15,16,3,4,20,16,21,28,26,3,2,9,69,26,21,23,6,52,5,9,53,35,15,19,54,5,21,12,55,4,11,27,3,2,20,40,17,6,32,38,11,8,88,12,46,27,4,68,5,9,11,9,22,36,23,107,6,11,15,29,21,49,8,5,34,15,1,13,13,7,36,21,67,12,45,57,13,97,35,5,12,8,17,18,83,7,9,21,8,4,14,1,15,6,23,85,90,4,22,5,15,9,32,10,7,35,57,65,3,32,105,12,43,16,60,36,5,144,50,20,4,11,2,17,18,14,12,53,38,51,2,33,20,37,4,7,60,1,14,21,33,56,5,9,41,19,53,39,15,11,21,3,78,16,3,98,15,20,10,39,5,21,54,14,55,40,24,34,12,78,37,4,37,28,2,38,7,4,2,26,32,41,4,58,28,7,10,30,16,10,4,34,15,16,33,6,31,7,14,64,3,5,8,15,9,15,57,3,12,5,4,14,30,23,46,60,93,2,9,17,27,11,52,7,43,14,8,56,6,20,85],[3,14,3,6,74,66,12,74,39,84,93,3,10,8,44,12,10,9,20,43,15,7,1,34,67,25,9,1,33,65,21,20,21,94,29,22,7,11,22,41,49,8,31,34,21,87,39,19,4,53,2,28,13,9,19,11,190,79,16,11,30,26,27,31,30,4,3,15,109,17,43,28,8,19,2,22,11,36,76,2,71,3,91,5,50,20,64,27,52,74,34,15,52,46,8,13,9,34,24,9,61,34,1,28,8,3,30,78,19,30,86,9,17,14,42,26,35,138,8,50,36,3,10,27,17,35,7,66,29,72,31,5,54,29,47,54,33,42,154,25,7,115,62,8,19,31,6,16,50,33,7,15,2,14,3,22,31,18,20,51,72,120,39,7,69,33,25,14,3,17,5,30,19,25,25,102,30,7,28,54,19,21,107,7,42,6,3,4,51,56,47,9,15,46,16,20,7,41,30,67,28,35,3,23,31,2,48,32,113,24,26,45,10,1,37],[41,57,32,6,21,28,4,11,16,22,8,8,19,28,13,5,45,7,16,5,24,62,6,7,5,145,23,4,10,46,21,14,9,24,24,27,11,24,2,43,3,4,31,13,41,57,3,20,57,28,18,13,9,21,34,14,10,55,11,18,14,20,5,9,53,50,19,80,48,2,21,11,14,13,62,20,6,12,20,31,5,14,7,88,9,3,25,14,11,27,8,62,3,9,20,19,6,38,18,113,26,146,6,10,13,22,22,7,5,21,5,58,16,10,50,42,80,27,38,25,23,7,83,5,17,28,4,5,10,15,48,52,14,6,3,31,5,18,23,4,4,22,29,6,2,31,3,42,19,34,5,32,20,15,14,18,12,32,71,2,43,16,38,22,36,5,121,23,77,71,57,11,28,7,2,66,2,4,20,48,20,64,21,3,5,4,12,49,7,55,4,3,12,84,28,6,18,3,22,44,34,12,33,3,2,58,5,41,8,25,21,22,32,36,2,65,6,24,44,2,18,5,16,76,41,5,7,48,8,7,6,7,14,70,8,45,5,9,3,4,24,7,10,5,25,8,18,15,54,33,35,2,3,4,81,6,23,8,51,36,9,14,4,26,23,39,33,34,46,3,32,23,18,2,2,33,44,8,4,3,28,15,28,42,14,20,7,4,14,2],[18,4,2,87,20,18,1,10,30,77,15,8,2,13,23,6,20,52,27,152,2,11,17,95,2,17,45,4,2,109,27,26,5,7,2,3,94,4,16,139,45,53,6,12,11,13,22,11,8,15,24,50,5,11,5,32,19,13,3,7,16,19,3,19,13,53,5,14,181,16,12,9,50,78,9,18,18,61,28,22,20,6,9,6,5,126,10,28,52,60,12,16,10,13,19,10,48,158,5,13,31,19,100,4,12,37,97,29,19,24,13,6,45,171,32,40,83,6,45,53,6,12,35,22,7,4,9,5,23,119,23,3,34,56,4,3,3,4,22,11,37,88,36,9,25,52,43,13,46,13,59,14,14,26,45,24,69,13,29,19,8,31,26,26,3,90,51,4,13,4,22,28,52,62,6,48,4,23,133,69,4,26,20,29,5,11,84,7,15,13,57,47,28,4,13,12,45,21,9,53,8,15,12,7,16,65,6,3,21,35,60,3,3,80,13,21,77,97,58,10,55,7,23,22,35,15,2,34,23,12,71,2,11,10,23],[4,35,62,23,4,6,4,41,12,30,4,43,9,90,43,7,22,12,18,5,8,21,43,22,12,27,6,18,20,4,30,17,39,46,23,10,14,22,13,16,21,11,17,14,27,41,60,27,7,1,58,68,8,18,17,69,4,14,48,22,5,4,3,3,9,4,2,23,40,25,10,7,17,2,1,21,15,48,17,65,2,20,4,6,3,52,4,20,11,5,6,61,22,36,31,21,16,36,1,20,15,6,3,13,11,45,10,10,20,20,5,17,5,3,39,5,18,40,15,25,34,15,1,11,6,45,3,14,6,5,55,8,3,30,14,5,2,49,31,28,10,20,24,2,42,3,45,13,76,15,5,5,31,2,30,109,3,19,23,4,13,1,78,30,2,14,22,21,16,7,30,10,4,11,3,15,25,21,20,17,7,17,167,16,29,67,6,7,3,3,30,36,22,7,37,36,35,37,49,19,18,3,4,14,35,12,16,11,24,38,20,13,6,32,41,18,3,10,5,17,27,16,32,12,25,3,63,7,8,32,10,88,66,14,8,12,2,11,16,11,9,4,5,42,5,13,24,30,1,16,19,42,29,14,2,9,48,19,13,49,8,7,6,36,9,6,11,18,19,19,19,12,37,23,42,20,10,7,14,63,5,64,36,54,13,16,13,56,8,30,3,18,13,14,9,8,23,30,9,33,19,35,1,12,10,2,11,7,18,7,5,37,28,6,22,10,10,4,24,18,18,21,9,22,10,24,7,77,5,25,14,47,12,17,9,26],[42,78,13,4,49,7,9,16,29,27,28,4,10,4,46,6,21,26,67,7,5,147,21,3,7,4,46,20,15,9,20,27,38,28,14,27,93,57,133,7,77,9,37,19,28,35,14,53,51,20,79,46,5,20,10,14,74,27,5,4,2,21,30,17,3,94,9,3,25,14,4,8,27,67,2,6,7,10,11,17,47,8,8,114,90,32,49,17,14,54,25,58,3,14,7,2,51,41,107,40,24,6,11,5,7,85,4,37,7,4,5,11,17,46,66,5,3,38,16,23,5,26,3,26,5,33,4,42,53,4,32,20,12,4,13,19,13,105,21,37,61,41,54,65,24,69,7,10,34,28,14,42,12,28,6,2,63,3,6,21,47,21,19,44,24,5,19,54,41,14,4,16,110,24,3,3,44,55,2,8,36,2,93,11,8,21,6,20,21,34,11,23,2,67,4,26,45,17,7,91,41,5,6,29,19,10,6,6,20,79,8,30,6,7,12,27,6,12,4,25,40,56,32,36,8,82,4,23,54,5,36,25,3,25,23,40,32,35,105,20,35,42,9,3,32,15,104,10,14,2],[7,14,17,5,17,12,40,13,10,18,1,7,19,146,24,20,7,2,10,52,29,6,18,34,2,18,1,8,9,40,46,4,11,36,34,135,26,20,18,14,111,9,19,57,1,69,6,8,9,8,23,11,11,1,2,12,12,21,10,19,2,4,13,6,50,67,70,3,30,13,67,45,28,71,8,40,6,25,65,90,40,48,25,17,68,20,4,1,9,4,3,6,4,2,47,44,22,46,22,29,9,15,29,33,10,10,49,39,5,12,9,3,22,1,2,37,8,48,6,3,10,12,23,41,10,7,28,27,1,28,22,13,14,78,9,29,8,18,19,5,28,86,5,27,64,2,3,4,7,4,17,32,33,44,16,84,43,20,10,26,10,3,16,60,8,9,17,16,29,12,4,6,34,50,33,11,22,12,54,44,8,21,3,46,32,13,6,47,36,7,38,11,11,10,28,3,79,119,5,10,9,4,36,28,7,54,57,6,62,8,10,41,49,4,12,23,16,6,19,25,36,110,21,39,55,6,11,28,12,4,1,15,4,23,6,7,5,39,4,30,17,1,23,34,34,1,15,5,9,54,120,21,4,29,6,16,64,3,12,16,18,14,66,19,39,7,22,27,39,4,4,28,62,12,2,19,3,22,5,17,32,42,13,41,9,4,5,28,21,11,37,8,2,35,7,23],[5,203,91,4,21,25,27,158,13,9,33,16,19,6,130,24,148,63,8,43,12,25,10,66,68,15,34,25,16,6,18,57,38,2,5,59,8,61,9,25,133,5,108,148,123,64,8,33,4,4,49,85,39,2,90,52,15,51,13,56,35,13,42,96,14,45,36,71,72,4,105,9,4,8,1,40,39,210,7,117,6,51,37,34,43,23,23,20,35,8,58,40,58,22,6,56,11,16,47,2,18,109,34,133,1,84,23,2,77,79,17,22,48,13,106,19,65,2,6,19,58,16,7,32,32,7,61,56,104,75,28,2,7,3,50,185,3,64,21,56,57,158,4,41,29,22,28,20,38,9,32,8,32,87,26,25,9,70,54,64,57,1,7,45,32,19],[10,1,14,4,8,54,17,5,5,14,10,2,48,9,6,10,22,10,6,40,20,3,4,31,12,64,15,3,32,6,7,5,30,26,28,7,8,20,27,22,7,3,4,26,6,14,44,12,8,4,4,40,24,21,8,32,9,24,7,47,20,18,12,29,4,4,19,38,53,3,4,13,6,17,28,13,34,5,7,19,4,7,16,10,4,22,5,16,46,35,16,20,12,67,66,5,10,14,17,29,2,8,45,2,7,23,38,7,5,22,3,28,15,59,2,39,12,4,2,12,53,15,10,11,20,4,18,2,19,6,3,8,6,108,10,29,5,9,12,18,7,8,64,9,9,8,14,18,36,22,54,24,7,37,16,54,129,1,4,4,20,34,13,67,4,6,9,22,13,14,17,3,20,3,25,12,17,32,46,15,29,26,29,31,18,17,14,4,19,11,4,7,1,14,18,3,1,43,4,71,5,4,22,48,21,21,16,38,23,10,18,7,5,55,28,61,49,20,15,2,19,30,25,56,10,1,12,5,26,5,14,26,30,40,47,22,11,13,11,10,25,35,14,5,4,11,19,25,3,13,51,33,56,44,34,1,16,4,2,3,12,27,14,7,54,12,10,40,6,20,55,18,11,38,14,9,28,15,32,5,8,24,15,57,19,4,29,47,30,6,3,10,26,7,18,41,8,26,4,13,12,3,10,14,18,4,54,18,16,33,23,9,44,14,68,3,14,9,22,6,27,27,19,20,3,88,67,46,8,33,5,3,10,55,114,1,7,16,36,11,20],[6,13,14,19,15,17,35,10,10,83,56,100,33,7,5,17,35,90,43,6,18,2,10,15,27,56,31,2,13,23,56,29,11,3,23,2,8,6,111,21,31,20,13,78,15,8,37,35,50,18,67,15,25,6,65,2,56,113,26,30,3,23,11,93,32,22,72,23,46,35,33,12,68,25,27,33,32,40,47,7,20,6,121,34,62,34,15,63,52,10,12,18,2,3,45,6,7,31,31,14,56,32,85,24,50,4,10,107,16,69,6,46,18,46,37,24,25,16,64,140,22,6,6,13,14,115,9,36,19,121,39,35,28,12,27,67,3,3,73,3,33,92,41,69,13,43,21,61,38,16,46,2,23,25,3,65,25,5,78,1,23,3,21,5,12,4,9,65,15,49,15,12,30,13,2,63,5,30,5,8,24,71,14,10,23,7,4,4,46,23,82,67,3,34,9,39,38,3,45,34,6,8,25,40,56,20,28,6,142,51,155,20,26,19,4,46,20,27,15],[99,289,406,50,253,728,400,20,1000,337,182,116,54,58,961,124,62,5,573,85,65,368,92,9,215,171,128,26],[30,5,11,18,21,29,53,7,31,24,11,4,36,17,35,9,5,34,16,5,11,8,6,1,7,14,9,30,24,5,19,4,22,11,1,2,8,7,28,20,9,47,1,23,3,6,11,14,50,30,6,7,17,6,19,4,23,5,20,13,19,9,3,10,8,4,1,6,20,5,7,23,10,2,5,16,26,16,6,6,19,3,10,47,25,28,12,29,52,20,25,53,37,29,2,49,6,42,8,12,22,36,35,30,41,27,26,2,22,6,20,12,6,11,2,36,25,6,58,17,5,24,7,2,12,23,35,2,34,51,9,33,2,2,2,22,19,10,33,10,3,9,3,36,23,23,8,3,40,46,10,9,5,45,4,23,10,32,52,16,2,18,2,14,36,9,21,10,5,5,28,18,4,19,65,3,8,55,5,3,43,3,72,17,13,9,3,6,5,5,4,1,4,22,33,2,44,14,65,36,6,1,1,48,5,38,34,2,9,9,19,8,15,3,6,6,10,26,11,12,2,43,5,8,11,6,24,5,7,11,12,29,8,2,9,4,9,7,18,33,6,65,15,55,75,16,3,5,8,6,2,10,2,56,8,15,6,1,48,12,34,15,7,18,9,20,22,25,10,24,4,6,28,29,4,5,2,19,1,17,5,5,11,11,18,3,8,2,20,1,25,9,17,10,7,13,9,15,12,117,10,54,3,72,7,2,12,15,21,13,4,7,13,20,11,17,14,4,14,11,5,15,7,4,34,4,18,76,32,2,92,14,18,6,40,8,12,3,11,7,36,19,19,3,8,16,10,10,4,22,2,7,16,7,51,5,15,19,8,23,8,20,59,17,8,6,4,99,6,11,33,59,27,2,23,9,30,4,9,58,28,29,4,44,35,2,10,30,105,10,1,2,10,1,9,14]],"ranks":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21]},"When":{"counts":[24,32,54,31,35,7,9,39,11,35,5,7,24,25,11,32,19,8,20,11,1,22,15,10,15,22,11,9,17,15,14,12,11,16,13,13,9,10,7,12,11,1,14,14,27,17,11,20,6,21,21,26,32,8,18,24,13,9,16,11,294,11,40,34,31,21,23,28,34,40,36,18,41,23,4,23,14,19,45,15,11,3,15,9,22,18,7,37,35,17,10,9,16,18,1,10,3,24,8,7,5,9,10,15,63,16,11,20,14,11,9,14,12,13,22,24,12,9,18,15,17,32,13,7,17,9,8,9,8,11,20,10,19,17,22,14,15,23,37,33,13,9,15,23,6,7,3,20,28,50,20,68,16,19,51,13,52,14,14,2,216,175,26,55,51,1,14,27,14,25,43,14,20,29,22,44,33,3,16,27,23,21,4,20,4,6,1,4,16,18,11,14,25,11,11,24,20,36,18,21,14,11,10,6,11,12,12,10,22,38,8,23,30,31,8,31,30,19,13,33,13,24,6,14,52,48,6,64,18,60,57,20,53,17,52,15,10,10,63,67,9,15,8,4,6,9,12,16,18,440,4,7,14,17,60,20,23,16,12,16,44,13,11,10,8,12,87,65,12,12,56,20,91,11,29,15,18,11,20,17,28,34,14,33,17,19,12,16,10,13,14,14,20,9,17,6,1,1,6,4,6,8],"rows":[[213,445,476,243,29,5,554,196,207,486,299,262,769,298,10,575,100,123,7,241,17,266,723,183],[62,142,1020,50,30,386,734,360,532,66,108,16,364,175,155,59,145,248,19,177,106,502,201,27,50,20,436,170,17,110,154,256],[291,36,48,93,87,129,92,10,162,183,88,2,73,166,23,72,268,75,274,94,19,35,36,154,85,9,434,8,13,143,28,40,102,26,302,245,299,29,362,347,56,69,51,26,8,273,42,41,252,551,234,10,216,26],[446,62,54,500,132,132,109,183,55,254,133,617,97,8,254,91,244,931,977,83,95,534,72,86,92,194,42,154,14,9,144],[319,137,115,153,170,75,205,67,181,53,252,369,82,74,966,157,301,121,209,277,245,2,131,49,310,116,7,367,26,361,275,217,19,61,399],[3,2006,2311,430,70,56,99],[796,355,678,783,443,470,1899,647,258],[58,46,87,34,6,58,47,177,31,362,79,218,14,407,32,78,218,210,31,138,42,395,180,166,230,148,18,180,119,139,212,131,292,500,357,304,280,56,140],[1547,242,885,318,76,163,1176,485,665,688,317],[169,295,878,115,196,254,150,256,9,33,124,215,20,176,27,21,236,136,483,604,289,115,517,401,278,18,55,13,71,143,82,71,476,7,42],[2834,1958,184,720,219],[17,516,109,1397,886,1703,1570],[172,5,494,77,118,154,286,15,388,112,38,373,493,351,152,120,684,58,63,901,102,445,927,127],[564,85,102,83,22,373,34,178,991,143,190,351,184,254,428,621,627,2,651,167,241,108,97,365,56],[317,1315,386,2864,355,221,12,119,731,23,99],[18,597,95,244,103,82,177,46,110,336,8,60,189,434,484,30,96,35,471,580,383,15,122,58,139,203,178,803,194,27,505,156],[722,93,209,244,604,70,44,98,281,590,215,94,599,864,13,207,289,503,238],[2434,1105,263,126,125,1016,759,530],[87,304,232,228,838,35,270,1131,33,430,59,34,355,306,93,35,348,1154,595,193],[1040,479,50,19,296,1251,1864,88,411,295,461],[2245],[352,354,66,1254,277,57,509,738,614,279,13,35,65,172,180,43,219,152,6,230,832,482],[268,417,782,801,47,991,14,1078,641,22,47,244,449,622,266],[107,383,2026,504,1188,323,829,225,41,451],[463,545,28,16,140,74,1280,464,660,161,14,1157,1098,731,152],[481,8,291,104,548,138,135,190,33,9,106,462,496,258,397,529,757,85,472,41,496,917],[1178,11,481,1293,764,140,237,703,314,247,285],[20,158,2109,221,594,885,825,1266,588],[1011,599,57,317,47,427,908,343,201,986,156,841,373,119,251,13,63],[248,415,297,127,1004,134,299,1036,204,459,806,182,1022,552,62],[650,169,645,1190,286,573,339,302,295,947,505,414,244,357],[45,111,259,564,60,2434,102,1846,56,275,368,783],[439,192,899,260,3,1637,979,95,1054,585,420],[150,256,933,228,349,567,140,255,910,297,70,1063,652,151,587,107],[361,259,538,1360,427,413,504,634,196,234,394,1524,44],[359,826,235,957,73,337,1821,379,462,299,255,316,358],[100,66,619,1953,388,396,99,270,979],[198,125,1534,584,1187,410,399,465,401,1646],[545,564,952,756,379,1178,2055],[1107,894,33,481,1264,137,199,237,1135,204,67,22],[281,162,1256,520,344,106,469,1583,208,471,503],[5139],[55,643,143,1806,94,903,782,984,633,270,50,65,31,423],[916,137,1194,1472,76,13,480,133,627,102,786,9,307,655],[471,454,144,333,158,308,319,43,79,582,536,367,94,302,649,158,353,173,69,19,50,423,3,182,255,382,48],[859,567,374,159,379,393,183,63,1027,90,232,256,672,460,221,554,207],[584,43,545,427,326,333,1643,1115,373,1229,80],[145,447,82,1098,1061,523,87,309,9,507,185,283,390,9,116,156,363,142,568,63],[252,1063,1284,1483,2009,240],[51,704,373,470,750,619,196,501,236,62,138,26,112,299,20,4,413,49,1111,273,274],[220,230,283,180,28,372,19,356,77,118,85,175,284,784,248,1652,483,771,374,20,200],[331,69,105,526,164,542,76,224,177,69,736,190,545,16,397,162,234,140,139,574,166,449,45,212,449,11],[542,253,91,128,88,377,17,9,223,42,228,89,95,177,29,161,68,172,130,72,334,3,244,7,693,66,371,29,153,821,16,485],[1098,162,257,461,3559,99,127,379],[454,254,855,289,352,316,357,771,888,138,22,5,303,835,267,20,31,122],[2,30,234,132,451,267,536,184,87,235,453,415,23,708,415,462,674,173,41,51,263,92,289,66],[1559,454,854,915,415,109,294,143,142,262,118,986,231],[384,21,846,387,2492,435,341,1463,426],[83,637,79,602,230,421,858,25,1396,184,732,102,102,699,366,464],[1108,433,482,367,775,1100,138,662,124,593,23],[25,17,78,13,4,5,44,6,1,8,1,16,29,27,21,7,4,10,4,45,1,6,21,26,67,7,5,90,57,21,3,3,3,1,3,1,46,20,15,9,20,27,38,28,14,27,7,86,12,45,18,115,7,77,9,37,18,1,28,34,1,14,53,50,1,20,79,46,5,20,10,14,16,39,19,27,5,4,2,21,30,7,10,3,94,9,3,25,14,4,8,27,67,2,6,7,10,11,17,45,2,4,4,8,113,1,38,44,8,32,49,17,14,54,25,50,8,3,14,7,2,51,41,107,39,1,24,6,11,5,7,85,4,37,7,4,5,11,17,22,3,21,66,5,3,38,16,23,5,26,3,26,5,33,4,42,33,20,4,32,20,12,4,13,19,13,105,21,20,17,60,1,41,54,65,23,1,69,7,10,34,28,14,42,12,9,18,1,6,2,63,3,6,20,1,47,21,19,44,24,5,19,54,41,14,4,16,110,24,3,3,44,33,22,2,8,36,2,93,11,8,21,6,20,21,34,11,17,6,2,67,4,26,45,17,6,1,91,41,5,6,29,19,10,6,6,20,3,76,8,30,6,6,1,12,12,15,6,12,3,1,25,40,56,32,36,8,82,4,23,54,5,36,4,21,3,25,23,40,32,35,105,20,34,1,42,9,3,32,15,104,10,14,2],[6,113,941,258,2803,591,41,69,56,21,304],[528,26,473,120,32,29,186,412,19,13,322,3,34,432,234,116,58,138,442,403,44,178,260,105,3,322,145,95,445,5,15,70,158,264,72,22,113,115,195,306],[527,79,292,540,118,174,121,444,115,186,160,70,285,8,260,125,208,125,32,278,55,67,749,145,47,350,117,26,536,95,139,118,30,217],[0,66,148,21,147,545,45,331,75,727,43,667,218,242,141,526,114,2,110,2,309,14,23,429,123,471,106,683,87,103,382],[337,878,90,67,1382,16,313,240,60,22,324,43,762,138,93,84,109,700,217,304,357],[262,233,384,215,672,240,523,119,539,234,264,32,272,285,12,53,252,1065,287,30,220,31,84],[197,304,62,4,33,25,182,292,41,545,83,80,78,142,203,1002,188,809,37,267,85,122,350,286,275,419,275,405],[183,100,248,333,190,11,110,61,35,764,666,552,193,45,307,78,131,9,149,222,210,96,147,140,434,644,100,183,68,97,50,56,124,47],[153,171,117,106,213,399,133,83,368,451,41,88,219,44,102,93,147,41,435,422,24,42,199,328,139,274,40,231,42,53,35,47,445,483,6,337,191,13,41,12],[77,132,23,10,166,170,153,473,914,256,250,49,9,60,82,19,412,202,36,36,95,30,25,131,65,29,95,67,8,218,149,1000,304,144,930,147],[237,76,478,544,2117,736,189,339,192,308,652,139,298,68,129,104,107,7],[12,38,120,295,284,5,589,382,354,11,117,107,33,133,173,108,266,132,21,193,285,240,226,112,158,95,198,234,51,748,175,56,38,27,242,122,91,122,86,293,4],[43,433,73,512,85,225,140,228,555,438,12,270,192,37,37,377,147,133,572,2091,100,221,42],[794,3140,2301,615],[162,11,221,592,269,67,352,559,598,77,169,682,127,380,185,283,390,282,1038,34,178,28,104],[9,770,142,437,72,273,158,57,687,245,150,154,1872,1082],[739,1138,460,107,531,206,231,532,59,147,763,339,539,151,223,529,62,20,47],[112,49,209,124,36,36,58,160,432,14,46,168,170,508,248,38,211,255,359,262,5,241,43,30,26,274,44,22,286,187,36,888,144,130,277,83,184,7,92,4,344,21,3,45,8],[15,38,643,286,43,244,604,70,716,512,471,1099,207,460,570],[2678,1099,163,342,69,136,1270,22,188,94,34],[3582,2135,150],[997,504,988,153,491,219,9,364,798,28,568,247,94,191,180],[477,163,1424,684,677,51,1116,35,1569],[126,161,426,541,354,57,3,43,2,38,395,310,1251,80,1107,156,274,602,338,119,138,189],[1120,404,62,105,254,12,269,1245,102,129,185,25,299,21,532,419,280,283],[942,651,3207,31,213,226,309],[117,142,264,71,462,100,10,198,94,48,321,310,141,129,39,194,365,7,20,259,752,7,303,418,19,70,37,394,108,295,130,89,362,34,191,241,116],[216,30,55,110,203,174,344,66,101,443,274,168,317,232,149,165,14,123,124,140,348,98,322,248,185,186,92,33,469,239,117,22,455,33,518],[636,547,65,181,438,663,255,930,507,72,207,508,219,152,6,411,597],[88,1907,114,1280,954,958,664,543,96,129],[349,27,1204,1741,928,860,1332,145,104],[149,436,1402,842,390,19,248,313,276,405,59,123,69,155,212,908],[185,583,443,78,426,127,70,305,6,357,613,323,155,91,233,395,513,1846],[3511],[2615,717,501,804,139,3,549,711,77,779],[342,1216,3951],[378,40,1148,550,265,114,127,270,80,177,109,171,155,713,701,180,173,4,278,30,425,182,638,47],[699,1135,830,172,250,774,894,815],[1243,434,1473,391,581,1082,813],[2727,178,692,411,1877],[935,177,171,1373,858,116,527,430,1315],[377,918,286,689,47,2083,408,1616,164,63],[644,1331,493,362,94,3,58,2128,221,461,30,159,272,672,42],[11,86,44,153,28,64,65,102,191,109,29,146,43,392,70,58,159,10,120,162,72,21,71,42,64,100,5,110,8,54,107,40,28,61,293,369,12,4,86,288,25,236,109,236,131,22,27,85,32,279,40,412,727,87,62,73,98,61,18,24,38,64,15],[40,595,69,736,15,348,558,197,720,1095,413,1095,211,86,126,35],[140,623,46,68,649,1294,793,2602,216,375,93],[181,862,197,69,623,359,1320,357,133,1004,92,118,252,63,94,744,111,93,52,86],[689,69,575,58,1018,28,363,503,243,385,754,386,375,1087],[1125,407,16,1524,165,197,1486,176,204,845,419],[293,394,783,112,1080,1739,408,994,849],[596,129,136,562,674,82,815,227,288,1155,69,279,886,971],[23,574,819,190,140,153,1096,958,1057,295,943,148],[1461,777,72,47,358,140,710,752,116,1633,128,158,103],[29,418,600,68,134,591,349,215,589,231,77,32,61,289,746,143,67,138,965,25,274,76],[188,11,54,43,67,314,252,161,956,345,187,668,21,251,35,42,385,1033,549,320,40,47,60,587],[3360,227,189,163,342,69,638,445,345,282,34,724],[41,1179,264,340,1379,1349,523,777,773],[39,238,425,744,6,698,450,1049,434,287,140,109,498,131,630,298,124,33],[258,82,957,49,790,895,209,148,357,899,1116,84,270,55,571],[71,971,77,295,887,1092,144,1226,193,506,42,285,257,1,94,231,95],[37,120,50,10,935,678,63,73,115,18,145,248,302,396,259,446,89,95,276,170,319,205,31,345,281,102,34,230,258,254,15,28],[257,29,397,981,306,711,1105,144,754,306,935,595,227],[1552,616,424,1230,12,1328,539],[996,504,245,743,153,59,371,165,149,217,920,28,247,745,562,593,288],[26,879,41,145,860,219,1208,19,3438],[270,40,352,102,877,899,359,2086],[138,408,564,952,1604,669,1838,257,468],[1529,46,1489,790,1518,588,334,127],[1897,482,159,848,31,670,50,2024,179,286,156],[131,1254,8,240,67,319,652,561,51,448,677,830,233,374,262,139,75,23,22,263],[735,229,36,64,99,1465,168,2563,1046,70],[91,22,656,121,316,7,77,426,197,311,358,564,446,171,4,229,230,379,859],[106,1444,475,1033,232,855,29,89,13,172,234,170,86,321,1161,149,148],[179,401,657,130,478,443,221,63,1416,483,390,211,266,211,15,158,357,498,81,9,56,84],[551,353,585,2013,310,261,495,108,4,18,949,590,655,9],[392,99,268,57,1228,977,135,262,1042,72,869,185,41,325,597],[305,496,94,902,295,18,131,606,42,161,874,194,161,752,39,99,43,54,16,263,115,373,88],[48,381,276,504,17,313,110,105,196,214,36,72,14,115,58,13,60,276,56,210,103,95,167,179,140,348,98,509,220,157,7,76,425,69,325,139,149],[806,210,153,76,236,91,417,239,207,367,145,355,248,56,2,446,9,156,20,17,78,80,4,436,139,274,124,52,372,47,669,8,135],[165,1032,774,9,370,654,222,692,1104,1396,410,50,83],[122,1611,78,266,322,1982,790,223,1496],[353,144,340,259,1342,212,773,264,304,284,876,823,251,28,96],[128,375,307,680,551,37,81,159,142,61,559,895,43,473,110,78,684,48,353,457,9,180,441],[2728,179,362,287,453,1877],[28,200,1728,1556,295,779,2102],[2073,1308,22],[239,76,1021,46,10,176,916,1305,400,190,36,284,19,316,185,652,137,299,197,105],[101,120,386,48,698,62,70,293,378,641,407,240,124,72,345,66,194,569,57,154,51,233,341,49,284,224,366,23],[8,276,373,58,449,37,51,9,148,18,46,21,84,47,290,5,11,31,274,40,107,123,16,182,71,205,101,8,362,147,97,170,111,43,356,47,39,141,104,52,87,773,5,308,297,3,221,240,140,51],[99,222,67,164,329,433,430,166,475,82,493,241,266,413,332,48,346,1196,525,450],[187,161,7,18,79,62,23,289,4,22,49,298,73,6,379,105,19,63,148,133,49,41,7,27,47,57,69,39,67,25,37,13,94,357,211,223,8,251,77,79,205,41,49,59,358,35,19,80,46,29,23,96,157,40,21,21,106,58,27,81,72,6,221,153,555,173,5,86],[797,212,144,286,392,725,58,442,471,76,697,56,99,929,43,646],[474,8,86,301,16,707,36,156,509,127,840,19,394,296,1523,139,406,351,574],[63,31,337,75,103,173,42,114,110,277,166,125,55,25,22,30,112,154,143,171,168,6,296,103,177,173,118,41,113,174,154,135,14,77,104,67,373,57,195,326,7,78,98,527,238,5,158,166,58,40,79],[1076,513,169,127,89,388,622,1244,860,24,388,294,153],[234,27,222,86,34,114,250,23,32,598,9,16,210,245,545,45,55,150,44,4,6,180,62,23,34,45,43,104,20,174,40,62,110,200,167,313,97,895,12,319,27,294,21,132,130,10,265,4,38,82,7,63],[595,128,137,561,674,82,1040,291,1152,70,412,754,727,244],[318,471,540,67,239,2004,979,419,202,220,13,119,755,456],[3245,1708],[31,25,23,96,7,51,8,4,20,35,25,4,39,13,16,24,15,37,7,24,8,28,1,70,81,17,19,15,60,43,1,16,29,7,16,38,60,17,38,10,2,5,16,20,1,13,8,124,35,172,4,26,4,54,23,10,56,3,41,3,12,61,41,90,22,16,21,11,25,8,81,22,12,13,14,34,10,20,2,69,10,10,17,10,58,28,110,16,7,40,28,51,17,21,67,16,15,3,39,12,61,3,103,43,29,7,1,82,21,90,27,3,108,3,36,7,76,14,82,51,49,50,80,39,29,8,52,12,5,20,32,25,5,17,37,37,52,25,50,36,90,112,9,20,37,15,20,28,7,5,22,33,27,38,6,1,33,2,21,45,68,4,59,16,55,28,60,38,9,4,68,33,11,25,55,11,42,60,94,52,84,24,3,18,32,20,45,59,7,11,2,16,17,10,50,12,19,56,6,14,11,17,18,4,5,230,37,16,11,22,29,103,27,10,18,64],[49,16,50,53,130,104,26,7,14,23,45,19,38,17,55,131,94,40,29,5,36,21,102,23,2,52,78,28,24,19,95,20,64,3,4,28,75,24,17,96,7,35,24,32,24,4,22,63,23,10,32,56,15,38,14,21,122,9,27,2,6,4,51,29,17,9,24,15,23,120,24,25,47,10,36,66,20,14,10,26,30,48,109,8,55,48,3,3,34,55,25,16,9,87,14,176,1,110,8,24,42,51,17,5,21,4,59,86,33,6,70,65,28,47,16,16,8,10,66,15,10,57,34,15,3,22,9,130,84,12,22,133,24,134,5,57,30,29,155,18,14,16,29,35,169,27,24,19,13,6,8,57,90,3,72,23,25,33,47,31,104,44,50,28,16,21,59,56,136,75,5,42,40,41,54],[367,374,696,5,171,167,886,44,7,49,309,391,407,404,327,119,324,117,67,344,560,265,97,56,48,309],[92,32,19,8,44,80,10,368,335,240,373,120,128,56,150,195,311,222,38,27,36,31,8,3,10,107,136,107,307,44,154,248,166,226,111,203,194,23,198,82,74,114,241,14,101,176,1,138,481,186,6,150,3,4,6],[211,52,41,50,112,346,10,137,17,427,275,187,138,45,334,21,140,180,115,126,236,163,222,149,354,43,182,254,71,16,209,192,2,34,88,44,103,193,5,1,74,3,46,83,35,171,50,53,470,88,340],[6876],[108,384,89,651,1790,536,408,243,1103,49,14,212,615,348],[813,708,69,297,2,87,106,62,109,110,187,263,174,308,443,62,429,132,364,162,113,89,145,318,67,926,97],[4,1672,334,653,172,250,455,317,263,201,390,40,70,380],[621,229,530,82,4,773,172,75,48,182,47,93,267,375,179,418,223,150,449,49,1101,128,158,103,109],[147,11,121,128,92,272,220,353,103,7,295,52,17,235,101,956,167,368,5,170,86,19,143,16,18,209,61,102,3,134,94,78,335,138,682,87,276,1,155,171,58,185,41],[111,1146,95,22,108,21,112,32,784,716,931,1763,1079,10],[134,276,59,144,174,493,611,292,698,179,1016,883,200,625,477,151,36,282,82,124],[74,527,161,113,472,178,15,655,131,139,136,7,236,354,414,56,42,432,142,53,815,92,710,212,9,440,165,23,101],[249,6,410,128,169,126,820,132,53,18,131,568,734,18,371,291,808,181,603,621,349,63],[69,40,162,311,535,221,32,42,435,181,545,255,43,229,22,269,29,44,95,51,12,345,4,501,330,60,183,28,122,119,26,211,44,128,321,95,231,95,64,49,81,10,2,214],[123,100,27,6,264,9,152,7,69,261,152,219,384,321,29,106,233,158,925,6,39,465,78,665,470,278,463,48,148,287,121,132,195],[844,253,2895],[160,729,67,256,400,107,537,325,316,869,47,268,1493,553,623,159],[269,249,142,30,275,179,140,185,170,118,575,303,25,234,123,290,60,451,700,465,57,23,112,178,387,685,266],[417,500,58,590,304,246,265,114,477,177,109,171,155,608,105,86,447,348,177,239,19,50,863],[132,312,41,792,424,75,444,345,9,98,397,71,144,297,829,312,690,304,130,28,373],[3152,391,377,1564],[22,268,143,345,532,267,622,22,955,484,583,501,930,7,28,289,132,21,389,227],[701,404,1602,381],[344,529,176,2353,624,471],[6722],[460,3234,2307,188],[651,169,114,169,8,238,100,16,228,962,224,440,310,527,158,1199],[10,134,637,141,437,161,186,157,75,43,776,245,134,19,449,1424,721,315],[440,192,754,405,3,1222,218,498,679,94,1266],[479,137,27,1292,815,728,158,731,227,35,991,579,17,563],[821,316,223,90,236,22,106,445,238,223,233,28,150,11,739,434,255,6,538,320,80,29,432,18,305],[442,1408,216,403,890,1184,888,177,168,50,990],[424,85,119,323,1100,460,889,423,1498,82,1189],[194,32,460,222,560,31,278,177,310,52,114,892,370,113,307,138,149,480,183,48,889,188,385,15],[835,22,407,263,46,214,789,215,271,493,542,346,525,47,165,190,553,369,325,208],[118,515,78,244,104,64,201,42,21,144,20,52,189,3,38,447,167,26,133,826,168,258,784,110,41,84,42,58,118,53,146,274,129,64,155,606],[423,484,42,1004,94,23,834,213,403,171,292,601,430,494,55,488,742,46],[299,176,606,317,1023,694,821,28,6,538,38,265,682,8,317,36,85,316,137,47,305],[67,498,177,751,428,275,522,49,1191,39,2139,255,54,417],[5,529,524,184,75,6,1609,1061,637,268,304],[462,573,16,1958,835,12,643,1462,138,449],[766,402,1238,1424,2654,346],[998,190,940,1171,54,373,1394,247,94,191,28],[637,547,1192,72,161,177,763,465,281,1086,417,184],[89,3948,99,300,383,483,67,1140,96,98,31,27],[2275,178,226,30,1069,163,547,998,204,278],[390,232,759,161,181,482,35,884,4,29,521,418,338,35,348,101,49,759,329,444,67,116],[34,114,203,149,492,353,12,91,354,17,235,658,156,778,175,86,19,143,151,21,71,163,3,34,100,172,180,293,357,412,87,190,113,30,12,229,185,41],[7,118,4197,46,455,77,721,472],[267,25,295,142,274,70,10,325,90,37,539,188,5,300,1182,178,248,969,351,121,1047,102,59],[75,264,263,206,68,420,52,979,139,118,18,217,206,174,40,148,324,33,399,142,868,92,514,84,112,212,1,213,423,101],[70,202,97,672,77,190,105,616,271,285,287,229,291,73,71,87,349,501,330,243,28,122,307,93,449,95,231,95,64,130,226],[1319,567,96,1004,2349,461,152,309],[224,27,270,161,489,219,389,190,155,339,158,59,31,88,174,489,90,39,108,984,116,190,558,463,196,285,2,39,82,132,195],[24,502,72,244,282,480,296,574,13,120,92,298,387,49,168,354,26,126,279,163,94,153,353,392,221,341,146,274,292,169],[652,4,280,404,10,277,67,508,331,246,101,635,338,171,295,250,705,848,480],[1180,203,675,140,760,86,274,798,524,498,570,577,608],[73,544,222,299,223,90,20,336,8,60,385,238,223,253,8,126,24,11,1051,122,261,137,590,131,80,29,450,19,276,10,17,505,156],[589,16,696,1919,1512,118,167,111,81,709,515,187,245],[814,209,499,368,87,8,98,62,109,110,187,263,140,309,33,505,429,132,364,13,262,234,318,185],[190,2203,1972,492,1001,328],[432,397,285,1074,214,821,108,351,746,1337,194,79,77,482],[176,36,52,203,203,77,76,42,112,42,301,84,275,141,38,8,4,134,45,68,607,241,262,120,17,301,70,296,39,19,43,20,506,172,34,17,172,3,2,34,63,69,103,273,3,46,83,256,158,288,77,428],[38,288,53,37,80,347,37,38,8,144,19,6,672,37,113,90,407,68,162,5,129,115,295,234,110,154,32,272,202,95,3,168,449,342,6,234,16,127,32,230,50,41,104,182,77,8,170,430],[947,607,617,423,1242,3000],[93,103,80,109,174,95,82,253,467,146,304,96,54,33,162,227,84,76,55,20,109,27,36,31,21,236,136,219,66,44,154,248,17,149,34,70,86,36,314,273,97,127,74,211,44,100,46,69,163,14,32,73,13,20,161,33,117,36,134,186,6,70,80,7],[14,96,105,915,514,97,1052,390,264,446,570,57,4,319,284,578,101,844],[72,63,19,84,76,36,120,87,110,70,490,43,11,107,196,308,293,119,17,366,35,161,85,73,1,243,279,87,4,194,97,84,268,115,304,119,73,52,35,28,18,175,82,31,65,71,139,65,12,187,183,302,20,129,104,17,90,7,93,60],[57,19,4,23,127,58,47,102,106,69,81,264,27,639,32,67,37,362,13,58,138,41,45,110,159,119,42,12,255,230,93,39,7,333,59,73,13,69,82,17,31,437,630,517,69,208,3,26,89,44,37,336,16,62,222,60,50],[90,69,608,438,5,78,230,93,103,541,324,566,849,231,205,1224,156,212,187,632],[455,115,34,266,23,75,36,330,249,38,9,16,210,245,545,100,150,54,116,64,62,57,45,43,70,30,4,194,40,62,110,158,42,140,27,313,2,95,907,4,315,27,47,247,21,132,31,99,10,265,42,82,7],[923,474,34,250,2,21,158,57,840,92,283,351,859,1125,218,422,770],[95,212,26,112,62,103,173,42,336,32,241,58,5,120,55,25,318,309,179,270,129,27,41,65,217,118,110,44,23,22,129,303,181,119,119,202,252,232,94,7,70,1,7,98,679,86,5,87,71,264,69,153],[932,161,409,8,228,261,187,41,1311,397,251,642,778,1344,19],[84,55,634,2,2791,101,669,1718,120,684],[1365,914,1059,276,1158,19,84,417,403,219],[61,142,153,15,3,104,37,23,103,186,4,71,298,73,6,379,124,211,133,90,138,59,10,131,5,32,107,51,182,350,33,1,80,31,51,6,6,16,243,77,284,90,59,393,19,274,149,29,19,206,27,81,72,6,145,5,224,290,162,103,33,145,216],[33,245,356,82,217,11,189,32,37,51,9,114,29,5,18,25,42,84,47,191,117,29,1,74,113,86,40,58,49,123,346,229,8,222,287,97,281,206,188,5,47,15,24,19,22,8,109,28,111,87,308,135,7,69,189,7,19,44,196,59,298,8,44,106,391,107,51],[311,454,385,17,1238,495,929,1386,1268],[1238,8,122,921,60,403,2333,228,26,105,106,15,63,201,268],[2906,159,103,687,1061,1182,324,521],[461,116,457,2809],[345,529,176,2977,471,2049],[1106,927,241,434,1213,1517,47,86,118],[27,200,232,450,1046,1738,113,779,295,431,689,188],[836,22,670,46,214,145,644,215,271,1381,525,212,190,922,139,394],[519,142,30,39,236,319,355,693,206,97,25,610,97,451,700,465,57,135],[44,3,12,23,4,19,11,5,6,37,42,91,44,6,13,2,21,21,9,9,4,4,27,1,30,37,10,15,25,1,43,19,1,9,47,12,11,1,15,4,15,45,2,5,13,15,5,50,12,63,7,10,14,5,8,3,22,1,5,6,1,18,73,13,6,5,2,15,5,5,3,1,5,38,16,8,7,21,93,20,1,7,73,8,19,6,2,8,15,11,27,20,11,30,11,11,4,39,30,21,21,22,14,43,43,13,21,9,2,7,1,9,21,4,5,23,1,9,1,2,6,45,1,37,14,2,10,14,22,34,48,40,43,4,8,23,3,11,7,2,2,19,6,3,1,11,2,7,2,4,16,22,20,18,6,7,1,23,42,15,2,30,29,5,12,3,23,10,51,5,6,6,33,20,5,1,4,5,13,15,6,2,23,7,3,2,6,5,5,27,14,4,1,45,4,16,18,2,4,23,1,43,3,2,43,3,10,37,26,1,9,51,2,14,46,3,49,5,2,31,34,70,22,62,17,16,2,4,12,15,16,3,7,30,5,12,4,9,1,6,18,43,5,3,6,15,5,9,50,11,9,3,10,7,19,1,10,14,6,11,26,5,1,9,2,2,14,11,6,17,7,12,3,17,20,9,40,1,3,16,6,3,14,1,32,9,13,15,7,23,29,19,11,8,24,26,16,8,10,1,26,1,31,11,13,10,6,7,38,25,2,1,36,19,26,2,3,3,25,9,12,9,1,9,12,1,4,10,4,31,5,1,29,43,82,22,2,17,1,58,12,6,17,52,4,8,3,9,1,32,3,26,17,3,9,2,25,84,24,14,62,20,56,12,27,14,2,14,19,9,29,2,24,5,8,29,3,9,16,1,8,5,5,5,46,8,50,34,4,37,2,1,21,52,14,22,2,44,20,29,1,10,26,13,2,7,48,7,34,23,3,5,22,22,58,25,3,7,18,1,3,4,22,50,13,33,16,34,10,2,2,11,40,6,12,8,6,5,2,1],[872,78,1122,1327],[3070,35,130,196,1663,678,372],[312,210,71,344,414,12,840,577,1102,370,319,704,739,547],[146,114,1611,179,1483,660,484,188,237,55,185,50,114,129,30,692,170],[222,51,9,326,56,128,118,51,34,20,130,196,102,128,533,180,85,202,60,178,64,14,35,319,204,9,107,48,10,94,3,67,149,46,37,18,38,42,279,153,110,375,6,42,182,50,266,63,61,503,7,24,167,35,116,59,59,23,155,70],[152,3,403,2,196,164,101,261,2029,351,545,92,448,216,121,445,144,68,673,432],[68,13,357,780,13,1141,296,51,50,36,93,464,423,164,775,51,391,412,503,322,240,221,50],[358,41,683,1382,283,268,393,557,158,1255,229,212,621,483,28,13],[102,206,520,1497,364,241,149,15,454,173,706,2316],[357,229,317,322,336,119,103,777,267,680,364,290,244,270,1686,261],[832,55,106,12,1,142,28,10,476,123,144,438,87,248,137,112,5,5,69,257,63,184,135,36,18,104,81,113,745,2,37,50,481,478,77,65,78,342,6,207,58,57,4,121],[36,563,487,309,444,684,46,61,1435,112,1448,13,17],[52,607,208,29,327,538,3299,148,79,389,962],[712,62,554,306,1561,1688,707,755,98,358],[1244,1784,123,391,377,1286,278,535],[96,1840,131,176,227,1116,694,264,888,177,168,1040],[85,45,75,24,117,66,72,3,131,29,21,306,63,117,79,42,52,499,121,80,111,14,187,4,96,97,28,79,27,5,184,192,88,202,128,108,3,46,88,16,60,222,22,7,137,168,100,48,122,40,34,97,71,65,7,10,10,319,29,21,13,24,62,29,27,38,22,108,73,14,21,72,44,7,31,36,40,132,71,90,120,144,39,99,272,10,10],[64,50,53,260,89,56,1,10,7,162,167,207,417,99,460,204,35,4,145,143,19,209,237,8,55,168,11,5,9,22,255,119,134,5,8,64,98,39,135,107,99,6,110,34,226,155,24,129,10,271,18,30,158,158,142,94,86,42,353,27,2,238,35,12,135],[328,6,1153,1068,58,913,941,86,873,387,243,276],[556,490,1454,539,622,751,774,55,363,62,618,589],[380,21,33,14,273,124,94,13,31,84,12,63,282,170,161,126,22,57,147,33,72,34,577,18,254,71,138,105,46,287,38,193,190,164,5,26,58,124,22,166,33,49,27,31,111,27,184,186,102,38,220,266,265,522,156,13],[98,289,358,109,24,194,282,180,727,157,1460,261,244,101,161,849,305,427,436,102],[30,5,11,128,66,4,36,52,64,24,91,28,22,133,33,75,60,6,23,23,57,30,11,65,7,16,73,125,179,37,31,55,50,34,36,159,117,89,46,79,176,161,40,184,149,91,306,9,9,235,6,2,125,62,3,71,111,60,350,249,22,35,28,6,57,31,38,40,22,1,68,305,9,12,60,44,80,177,190,3,11,7,156,94,19,31,87,17,18,303,364],[60,1187,865,196,128,317,1176,1516,196,114,75],[1,235,612,80,45,262,687,51,133,43,663,4,218,14,228,463,7,10,415,346,116,313,361,173,166,598,269,6,254],[208,95,327,806,795,504,42,465,289,588,792,190,240,272,382],[338,115,920,173,194,392,387,236,329,322,161,202,4,762,138,818,689,1],[136,1281,749,471,359,270,688,998,1445,309,12],[502,124,178,337,628,40,549,268,486,162,980,17,117,320,29,45,350,561,18,603],[21,159,1059,68,62,477,444,1689,834,273,18,90,372,207,91,804,141],[184,146,202,426,97,11,410,260,300,659,323,190,46,763,32,117,355,320,140,24,410,644,100,183,165,50,227,162],[78,132,9,24,160,6,170,153,180,400,19,433,227,128,23,163,387,51,513,202,36,36,95,55,225,162,226,149,780,220,448,474,374,82],[189,11,54,110,314,252,145,1317,1127,2338,62,51,822,83],[13,158,579,363,484,129,354,128,273,117,164,204,194,214,285,4,236,226,112,158,62,33,70,128,234,51,157,860,482,63,59,86,293],[548,155,590,1211,53,82,179,274,105,64,52,1234,32,1301,457,468,181],[163,232,278,314,269,405,14,559,117,481,928,507,185,283,390,786,568,178,28],[1605,947,66,611,53,590,379,127,895,124,909,254],[740,1059,500,146,187,281,63,206,231,738,1102,539,142,554,207,62],[1553,176,340,100,401,23,784,458,1867,1132],[16,38,643,143,186,848,70,1228,471,221,1085,460,570],[524,633,302,1547,286,65,504,183,310,571,631,87,633,225],[414,564,609,105,83,171,1444,82,102,339,1507,56,275,1003],[309,405,895,57,3,43,40,705,1251,698,489,156,178,96,259,343,338,119,251,76],[389,833,1089,1186,144,322,283,1822,422],[19,110,682,132,621,58,113,93,647,503,1198,1110,78,156,313,389,189],[425,85,119,1883,889,1921],[343],[3087],[700,1135,830,172,1918,815],[4323,433,145,587],[2933,1436,541,871,46,1144],[1888,242,236,622,1243,132,1139,447]],"ranks":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,293,294,295,296,297,298,299,300,301,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292]},"Team Name":{"counts":[2,8,1,12,112,142,14,4,3,18,3,211,89,85,277,363,1,991,107,81,9,291,21,348,2,1,136,48,13,9,2,5,169,126,1229,31,47,9,88,21,474,2,328,55,67,18,78,828,8],"rows":[[453,1],[1514,174,85,529,1194,931,407,900],[5741],[2744,1,1,1,1660,1,1,1,1,890,1,1],[43,4,1,163,1,84,108,1,37,169,1,106,1,1,260,1,1,45,234,1,135,1,1,1,1,185,1,170,29,1,1,128,90,1,1,258,1,1,1,1,8,1,1,1,110,1,1,1,1,5,1,151,46,46,204,1,104,442,1,1,1,1,1,1,1,1,126,1,70,1,1,121,1,1,1,1,427,1,1,1,71,1,1,1,102,1,258,1,1,552,1,87,1,1,277,1,1,258,24,1,138,1,58,159,32,1,1,1,116,1,1,437],[271,1,60,41,1,130,1,291,1,130,1,14,1,1,39,1,1,62,1,153,1,104,121,1,225,350,1,203,1,175,1,255,1,64,34,25,1,140,1,1,1,59,1,49,129,1,139,1,89,34,113,1,1,34,1,65,1,29,146,1,47,368,1,81,1,18,1,22,1,51,1,38,1,47,122,1,12,1,1,1,33,1,1,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,174,71,1,258,1,105,3,1,9,343,1,23,1,1,1,1,1,1,1,54,1,3,1,116,47,43,116,1,14,1,88,1,118,1,1,172,1,120,27,1,281,1],[1257,169,38,1,1002,999,244,1,420,1,80,61,231,1],[1597,1,5352,1],[759,1,3543],[2156,1,26,1,1,43,1,120,805,1,346,1,1187,125,129,1,658,1],[2114,4292,1],[82,1,29,71,1,121,1,28,46,1,29,1,60,1,2,1,1,173,18,35,1,1,156,1,188,1,1,1,9,52,17,73,1,4,1,1,1,1,1,1,74,1,1,1,36,3,1,1,2,5,1,42,34,1,1,1,2,1,1,22,4,1,1,230,1,1,36,26,157,58,1,6,1,19,15,72,2,1,28,1,68,12,10,16,1,1,1,1,60,1,7,35,146,1,9,54,4,90,2,2,1,1,1,13,114,1,37,1,164,51,1,1,102,200,1,22,1,22,11,66,1,170,1,1,169,121,1,1,161,1,13,1,26,1,1,144,1,27,15,1,151,101,1,20,72,1,138,41,1,1,1,34,18,1,1,1,148,1,1,54,1,44,150,28,1,48,1,110,1,150,1,1,222,112,14,1,1,140,1,1,5,1,1,1,67,41,1,311,1,19,27,1,1,1,23,102,1,1,1,58,1,2,1,73,20,1,17,1,10,1,13],[285,383,1,8,1,1,1,199,1,189,1,19,222,1,1,401,1,1,1,5,16,1,293,1,1,476,1,1,136,1,1,1,199,1,1,207,1,1,52,1,33,230,1,1,1,1,95,1,1,1,216,1,108,42,1,5,1,66,1,1,110,1,278,235,562,1,1,1,48,1,1,334,1,1,1,294,1,81,1,124,73,1,1,1,561,1,113,1,1],[327,1,149,1,1,171,1,1,126,29,77,1,196,1,69,1,1,221,56,1,1,1,5,1,1,132,194,1,84,127,429,341,1,1,1,744,49,1,1,379,1,299,1,1,80,63,1,1,1,189,1,16,58,1,1,358,1,18,1,1,80,1,1,101,1,1,1,1,6,1,1,1,2,1,1,1,1,10,1,239,1,1,1,891,1],[14,173,12,1,1,1,161,1,1,1,224,1,1,39,1,1,55,1,78,1,1,1,46,1,2,1,1,32,1,1,26,1,1,38,1,1,1,10,1,1,1,9,1,1,1,1,1,35,1,28,1,1,1,108,1,1,182,44,1,1,52,12,113,1,1,1,1,40,148,1,22,33,1,1,29,1,5,1,1,1,51,1,1,118,1,46,127,1,27,1,35,1,1,1,1,25,1,55,1,1,9,1,35,1,1,1,1,14,1,1,192,38,1,1,1,1,1,106,1,1,10,176,1,1,1,11,1,1,124,1,28,1,1,113,22,1,1,1,1,1,69,1,226,1,1,1,148,1,88,30,1,1,43,43,62,1,1,1,20,1,2,1,86,1,40,1,1,44,1,1,1,103,1,1,1,64,1,107,1,21,1,13,1,127,1,1,1,49,95,1,1,1,69,1,203,1,29,42,1,11,118,70,1,114,1,104,1,1,1,1,41,1,76,1,11,1,1,1,216,1,1,60,1,1,1,1,59,1,1,1,53,24,56,15,1,18,24,1,1,11,1,107,1,1,1,21,1,1,56,1,1,149,1,1,1,79,1,1,1,1,79,1,1,2,25,1,115,1,1,1,1,1,40,1,15,1,57],[30,1,1,6,14,9,1,38,1,1,45,1,5,4,1,37,1,7,1,97,1,7,30,1,18,9,1,71,1,41,1,1,6,104,8,1,5,1,1,1,141,44,29,1,42,26,1,16,55,1,5,1,1,110,1,1,1,56,1,4,25,23,41,27,1,93,28,1,1,47,1,126,27,1,1,35,1,33,59,41,106,1,30,1,13,1,4,10,2,7,38,1,45,1,1,4,1,108,1,93,21,1,1,1,34,1,128,116,31,1,22,5,1,1,10,1,64,1,1,28,1,1,8,1,1,1,17,1,1,93,1,46,1,25,40,1,9,1,147,2,62,34,1,1,35,1,103,1,1,1,1,82,46,47,1,1,16,109,1,44,1,1,9,1,5,13,85,1,20,1,73,14,1,20,42,1,80,8,66,1,1,16,1,5,2,1,22,1,9,1,4,1,5,1,1,1,16,1,18,32,1,40,1,83,33,1,13,1,37,1,41,1,22,30,1,1,16,2,1,9,1,53,95,1,32,1,37,42,1,11,1,10,1,83,1,36,56,1,1,17,1,6,1,1,4,18,95,1,16,1,5,35,1,83,1,17,1,1,5,1,16,1,8,12,23,1,47,1,1,1,1,1,1,40,1,3,1,2,1,13,1,1,5,94,33,1,51,7,19,1,87,1,11,1,2,12,1,41,54,34,9,1,22,1,1,1,1,5,21,25,1,1,6,1,27,1,1,12,1,1,7,1,48,11,1,25,1,50,1,19,49,34,34,1,1,5,57,63,1,1,7,1,1,79,3,37,5,4,41,1,38,1,3,20,1,1,43,1,31,1,9,1,68],[1198],[12,1,13,1,1,25,1,1,4,1,12,7,1,1,3,1,1,1,1,1,18,1,1,5,1,6,1,14,1,22,1,1,5,1,1,1,1,1,7,1,1,1,26,1,7,1,1,1,11,6,1,8,1,1,1,5,3,1,1,3,1,16,1,1,12,1,1,26,1,3,30,18,1,11,1,5,1,1,5,1,4,1,1,13,1,1,1,29,1,1,34,1,1,1,1,11,1,6,1,1,1,1,1,1,15,12,1,9,12,1,1,1,1,1,18,1,1,11,1,20,1,1,10,23,1,1,15,1,1,9,1,1,1,1,1,1,26,1,20,1,9,1,1,28,1,7,1,8,9,1,1,1,1,30,1,1,20,1,1,7,1,39,1,1,1,1,16,1,6,7,1,1,54,9,2,1,1,24,1,1,1,1,1,1,1,7,10,1,1,1,1,40,1,1,58,13,13,1,1,1,32,1,10,38,13,16,1,1,3,1,11,1,1,10,1,51,1,7,5,14,2,1,1,25,10,1,1,4,1,1,1,5,1,1,1,8,1,11,1,1,1,1,1,1,8,5,1,12,3,1,1,1,1,8,1,1,20,1,1,1,1,1,1,1,10,1,31,1,1,1,7,1,1,1,1,12,5,1,1,1,1,18,1,1,6,1,1,1,1,1,9,1,14,1,16,24,1,3,1,4,1,4,1,4,1,26,6,20,1,33,1,10,1,5,1,11,1,1,1,1,34,1,1,1,9,1,1,2,12,33,8,1,1,1,13,1,21,1,28,1,40,1,1,4,1,1,5,1,1,1,6,5,6,1,1,27,1,1,4,1,1,1,1,56,1,6,1,3,14,3,1,1,1,1,40,1,21,19,1,1,4,1,1,14,1,1,1,21,1,1,1,45,1,10,3,2,1,1,1,1,9,1,2,1,32,8,1,17,1,15,3,1,3,1,7,1,10,1,20,1,1,5,1,1,1,1,1,9,1,1,1,1,1,72,1,1,1,3,1,80,15,1,1,1,3,1,25,1,1,12,1,1,1,14,1,1,1,4,1,1,4,19,1,30,26,1,22,1,11,1,15,1,1,1,4,1,1,24,1,1,1,18,40,1,1,1,1,1,1,2,1,73,1,1,7,1,15,1,1,1,1,8,1,1,4,1,2,1,1,1,24,1,22,1,16,1,8,3,1,6,1,1,20,1,13,2,1,1,19,1,3,1,38,1,52,9,9,1,1,1,1,9,1,1,1,1,1,8,1,21,1,1,1,1,1,1,38,1,16,31,1,1,32,1,35,40,1,1,1,1,4,9,18,7,1,22,1,10,1,40,1,4,1,1,1,1,10,1,1,1,1,12,1,1,1,12,2,1,16,37,1,1,1,14,1,4,1,20,1,27,16,9,33,25,1,1,1,31,1,1,26,1,1,6,1,22,1,1,25,47,1,5,1,44,19,69,14,1,44,1,19,1,1,1,1,1,1,3,7,1,1,1,5,1,1,9,1,3,1,24,1,1,7,1,8,1,1,13,1,2,9,1,1,28,1,3,1,1,1,14,1,1,13,1,38,1,12,1,1,11,1,1,2,1,1,62,8,1,1,1,4,1,1,1,1,6,5,1,1,8,1,9,18,1,61,1,8,1,1,21,1,12,1,6,1,1,1,1,1,1,28,8,1,1,2,1,6,1,13,5,1,1,1,1,4,1,1,1,1,8,15,1,7,1,1,54,93,20,1,1,9,1,1,8,1,3,1,1,23,1,1,1,1,26,1,6,1,1,1,5,1,19,1,1,1,1,1,15,1,1,6,1,1,14,12,18,1,1,1,17,1,3,1,1,6,1,4,1,51,7,1,7,11,1,1,21,1,1,1,18,1,1,15,1,37,1,1,9,26,1,5,1,19,1,1,1,11,17,1,11,1,1,3,10,1,1,39,1,1,1,16,1,1,30,1,1,1,31,1,1,1,9,1,1,1,1,52,4,1,7,12,9,11,6,1,9,1,1,8,23,30,1,1,19,1,7,2,9,1,28,43,1,14,1,1,48,1,1,1,1,35,1,19,1,47,4,1,1,10,1,1,1,19,1,12,1,1,1,21,7,1,1,10,1,1,3,1,1,1,6,1,54,1,22,7,1,1,34,1,22,1,1,1,1,48,1,1,1,1,30,1,3,1,1,1,1,11,1,7,9,1,1,1,20,1,1,1,39,1,10,1,1,9,1,1,1,1,89,1,1,1,1,1,1,4,1,1,1,48,1,1],[8,15,1,1,71,621,19,21,1,18,52,276,1,1,1,1,3,1,235,1,89,261,13,1,37,60,71,77,7,1,65,1,4,1,1,88,1,306,111,76,72,26,1,1,109,70,50,25,112,1,1,1,226,29,1,96,1,59,332,271,1,4,1,1,1,70,1,148,1,272,1,1,219,29,1,88,12,58,73,1,54,1,9,1,82,17,1,65,1,1,422,16,1,1,408,1,156,1,62,2,1,2,339,24,26,97,1],[162,1,191,66,1,1,173,1,320,1,1,1,84,6,45,1,264,1,1,1,13,1,1,78,168,234,115,64,1,1,45,8,299,716,299,1,1,1,313,1170,1,37,1,1,26,1,199,1,109,1,21,85,1,40,14,3,32,1,1,1,1,61,1,2,1,30,1,150,181,1,86,31,1,123,85,102,332,1,298,52,1],[145,1564,745,1,1,1,1,2196,1177],[141,1,209,1,33,81,1,27,51,1,1,1,147,1,1,1,8,126,1,12,1,41,1,70,20,1,14,1,29,1,1,1,41,1,114,1,1,1,73,1,12,101,1,133,4,1,12,1,18,57,141,169,20,1,86,1,4,1,1,30,1,108,13,1,26,1,2,1,55,1,1,1,1,6,49,1,1,19,1,1,1,42,1,1,8,1,1,1,74,1,26,1,4,115,1,63,1,16,4,24,1,1,1,38,194,1,24,1,15,1,12,1,10,26,1,44,1,2,66,1,1,1,59,1,1,1,1,1,1,50,1,1,1,3,1,35,1,60,54,1,16,137,1,13,1,21,1,109,1,1,56,11,1,1,9,1,43,40,1,1,106,1,24,1,1,1,22,1,5,1,1,104,1,32,69,1,1,56,20,1,37,1,27,1,1,13,1,3,1,33,1,143,1,34,1,103,6,1,1,1,1,6,1,1,10,1,77,1,115,1,1,1,3,20,1,50,1,9,1,1,23,1,1,58,21,1,10,69,56,51,51,1,1,1,44,1,17,1,33,29,1,15,1,37,1,63,1,15,11,40,202,26,1,44,1,1,3,1,53,1,80,1,1,126,1,73,1,127,1,18,1,6,1,1,1,1,7,1,8,1,229,1,1,54,1,1,1,108,1,71,1],[299,230,193,1028,635,468,1,303,1,80,924,516,80,1,895,2,465,463,183,1,1],[63,4,1,35,1,19,20,13,106,1,1,33,1,5,1,3,1,54,7,25,1,69,1,51,1,9,99,1,34,1,1,37,1,1,20,143,11,1,1,9,10,1,1,1,1,1,1,1,1,16,13,21,1,8,1,3,1,1,93,31,38,1,34,102,1,84,137,37,1,1,11,7,1,3,41,4,9,11,1,1,39,1,10,1,2,1,1,7,33,8,13,46,30,1,80,1,36,12,135,38,5,1,107,17,70,1,37,27,30,1,11,1,5,1,21,39,9,29,1,60,1,1,89,18,47,1,38,1,2,4,1,1,1,1,23,1,54,14,1,2,3,9,1,39,15,1,71,5,1,10,1,5,1,44,15,1,55,1,41,8,11,1,3,12,2,5,1,1,5,1,43,3,1,23,1,1,12,22,14,44,119,44,1,1,23,9,1,24,1,1,5,1,5,3,1,58,1,1,1,16,1,1,17,17,1,53,23,1,1,46,1,1,1,23,1,63,1,5,7,1,75,37,1,15,1,132,7,14,30,22,1,1,40,1,1,1,1,1,56,7,49,1,1,12,1,13,1,75,32,1,1,1,1,14,7,155,60,1,1,9,139,30,1,1,5,1,43,1,14,106,74,1,3,12,1,1,1,30,175,32,1,7,12,38,1,1,1,6,7,1,1,1,1,55,40,46,1,32,1,95,39,45,33,1,39,21,1,35,196,1,17,53,18,1,1,1,1,5,1,12,1,7,1,1,42,19,1,38,1,1,101,8,8,8,1,1,110,1,53,80,1,22,1,17,1,8,1,1],[1958,1],[1352],[3,1,1,1,1,15,52,1,15,1,47,1,1,113,1,271,216,1,1,55,1,6,1,257,1,95,31,1,1,43,263,1,39,1,21,4,83,1,1,78,1,40,1,1,66,210,1,89,1,67,43,245,45,1,99,17,1,1,173,32,1,47,1,61,1,378,1,1,1,233,1,79,1,1,166,1,1,1,1,243,5,1,173,1,143,1,150,1,1,185,1,20,1,398,1,24,1,1,57,1,62,1,53,1,1,82,1,1,15,27,82,305,1,1,1,38,1,1,35,1,1,75,1,1,125,1,93,1,1,1,214,1,119,1,299,1],[528,85,1,42,19,1,85,1,1,1237,1,218,1,52,1,600,1,66,87,48,164,1,445,1,1,1,726,307,1,118,1,1,50,11,1,419,182,1,56,1,252,1,1,385,50,1,601,1],[3516,1,102,1,724,1,207,1,1,1378,1,1,1],[1628,1,1,1480,2765,445,1,1,93],[6007,1],[1508,497,287,894,697],[317,1,215,1,60,111,66,1,38,1,61,1,1,21,281,1,1,48,54,1,1,101,1,189,1,1,5,1,1,728,1,1,20,1,89,1,1,118,2,1,1,9,1,1,1,60,17,1,177,1,200,1,29,1,60,96,76,1,137,1,5,1,1,1,3,1,1,13,1,24,22,1,149,32,1,5,1,191,1,1,76,1,1,4,1,1,1,1,211,140,1,81,1,21,1,146,1,1,47,37,1,40,1,1,160,1,63,1,16,1,1,16,1,1,70,241,1,143,1,1,1,1,1,1,26,1,1,241,1,49,1,92,1,1,30,28,1,1,1,1,3,1,95,1,1,1,37,1,27,150,1,1,1,96,1,1,39,1,1,1,1,97,158,21,192,44,1,115,1],[248,1,1,1,30,214,1,1,1,129,7,1,55,1,36,1,282,1,33,1,26,1,1,1,90,1,224,1,1,150,90,167,1,1,22,81,1,154,1,109,1,1,1,1,1,18,1,1,43,1,240,17,1,280,100,1,5,1,1,78,1,1,32,1,1,1,1,21,1,1,1,31,62,1,21,1,1,1,183,1,105,1,1,1,1,357,1,1,232,1,1,226,1,195,448,1,1,1,1,31,1,1,2,3,653,1,275,1,1,1,1,50,1,224,1,1,293,1,218,1,1,1,1,70,1,1],[9,1,1,6,1,17,11,18,1,40,1,4,1,6,1,1,1,4,1,1,1,1,1,1,1,1,1,11,2,3,5,1,27,3,1,11,1,7,1,15,1,12,6,1,24,1,14,2,2,4,1,1,43,8,1,1,1,1,1,1,1,52,7,16,1,1,1,1,1,1,1,2,4,1,1,5,1,3,4,1,3,1,24,34,1,7,19,1,8,1,22,1,6,1,1,1,20,1,11,1,22,1,1,1,1,1,1,1,2,1,59,1,1,1,1,1,11,1,1,1,3,1,22,1,1,1,1,21,2,1,1,27,1,9,4,1,7,1,6,1,1,1,1,1,5,1,1,1,1,11,1,5,3,18,1,24,1,14,1,1,7,7,7,1,6,11,18,1,1,1,1,7,1,1,11,1,1,5,1,56,1,1,1,1,7,1,10,5,11,1,6,1,1,1,1,4,6,1,8,1,16,13,1,6,15,1,8,1,1,26,1,3,1,1,1,1,8,1,1,9,7,19,1,7,1,1,1,1,4,1,11,1,8,1,14,3,3,1,4,1,1,13,1,1,10,1,1,1,13,10,1,1,8,1,1,15,29,1,15,1,1,1,1,1,3,11,1,1,9,1,2,5,1,3,29,1,30,2,1,6,6,2,1,1,24,1,1,1,15,1,32,20,3,1,1,1,1,2,1,1,9,10,3,1,5,1,1,4,20,1,2,2,1,1,12,1,1,3,27,20,1,6,1,1,2,3,1,1,1,9,1,1,7,1,1,1,11,1,1,1,1,2,1,1,1,1,1,1,1,10,1,1,1,19,2,1,1,7,6,1,3,1,1,1,3,1,14,1,16,1,3,1,1,1,23,1,1,3,1,12,1,1,11,4,1,7,11,1,1,1,1,1,10,3,4,1,1,12,1,1,1,1,4,1,21,3,6,1,16,3,19,1,1,1,1,1,40,24,11,1,39,1,1,4,2,4,19,6,1,17,3,3,1,8,6,1,5,46,4,10,1,1,10,1,1,18,1,4,17,9,1,13,1,1,1,1,14,1,1,11,1,1,4,1,16,15,14,1,4,1,5,1,36,5,1,4,1,1,4,1,1,8,9,1,10,1,8,1,12,1,6,11,1,2,1,22,1,46,1,1,1,1,1,1,27,1,4,15,1,3,1,13,1,1,1,6,9,1,7,15,1,1,1,1,6,1,1,1,1,1,8,1,14,1,37,6,1,1,22,6,5,1,10,1,6,14,28,1,1,5,18,1,2,1,1,1,7,1,1,1,1,5,1,1,9,13,15,1,20,1,1,1,25,12,17,1,5,16,16,4,16,32,5,1,1,1,1,5,1,5,1,1,11,1,3,3,5,11,1,8,11,1,26,1,9,18,3,1,1,6,43,1,22,3,1,1,1,7,1,1,1,1,1,29,1,1,1,7,1,1,10,1,1,5,3,15,1,1,7,1,1,1,1,15,1,10,1,1,8,1,2,1,17,7,13,1,1,7,1,1,4,1,8,3,1,5,1,1,1,1,1,7,1,12,4,58,1,4,1,17,1,1,2,1,1,3,1,1,1,15,11,21,1,8,21,1,1,1,1,1,2,1,1,1,11,1,1,1,1,4,1,1,1,1,1,11,1,2,1,1,7,4,1,1,1,1,15,1,1,1,3,1,1,19,15,1,1,18,5,1,1,25,16,1,1,1,1,2,16,13,1,1,1,2,1,4,1,1,5,3,1,4,1,17,1,1,27,1,1,5,1,6,1,11,1,35,7,7,1,6,1,6,1,1,1,1,19,1,1,30,6,7,1,1,3,1,1,15,1,1,1,10,1,1,49,1,9,1,13,8,12,8,6,1,1,1,13,37,1,10,11,2,9,1,18,2,1,10,1,1,5,1,1,1,1,1,1,1,1,5,6,1,1,1,1,14,1,1,25,1,3,6,1,1,1,6,15,6,3,4,1,2,15,1,1,4,1,4,1,1,16,1,23,1,2,1,3,2,19,1,1,18,1,7,51,1,2,1,31,1,3,9,1,7,1,1,22,46,1,9,15,1,1,22,7,1,1,1,1,1,1,8,2,1,7,1,39,16,8,1,1,1,10,1,1,1,4,5,1,1,4,1,10,9,1,11,1,12,1,8,1,1,1,38,1,4,1,7,1,1,1,54,1,4,12,11,1,29,6,1,4,1,8,1,17,11,5,1,1,1,12,2,1,3,1,1,1,9,1,16,1,8,1,1,6,26,1,3,1,1,1,1,29,1,1,1,1,1,1,5,1,12,1,1,2,1,1,22,1,1,1,10,1,3,1,4,1,1,13,5,1,4,1,1,1,14,1,1,1,1,18,2,1,1,1,1,1,2,1,3,1,1,40,1,8,1,1,1,2,1,6,2,1,1,17,1,10,1,2,1,1,1,1,1,1,1,3,7,1,8,1,10,1,1,9,20,1,18,1,12,5,1,15,2,1,18,1,4,15,1,13,1,4,1,1,9,1,1,1,12,5,1,1,5,1,1,1,28,3,1,1,1,1,16,20,1,43,1,1,1,4,1,63,1,1,2,7,1,13,2,12,3,17,1,21,3,18,1,1,1,22,1,1,7,4,17,1,1,1,1,1,21,6,1,4,35,1,8,1,7,1,29,1,16,1,2,1,1,33,12,1,1,5,5,1,25,16,12,1,18,2,1,3,1,8,1,26,1,1,17,5,1,6,1,4,4,1,1,1,1,2,1,1,1,17,1,5,1,12,1,1,1,1,1,5,13,5,1,1,1,5,1,1,13,1,1,1,1,13],[747,1,385,1,860,1,759,1,343,1,393,1,1,83,16,1,217,1,4,1,353,1,1,615,153,1,1407,1,1,37,150],[29,121,38,1,1,1,1,1,1,406,746,171,26,1,98,1,142,325,1,1,301,128,171,153,6,1,390,57,1404,1,715,492,245,1,1,62,1,244,1,91,1,1,146,1,1,238,1],[826,1,3547,249,1,1911,382,1,1],[113,124,1,1,85,11,1,70,35,32,47,1,68,367,119,118,1,25,1,3,1,1,216,1,1,1,242,3,14,1,1,1,1,274,1,17,210,99,130,203,1,137,1,17,1,291,1,14,162,1,1,1,182,23,1,117,56,41,60,114,1,164,1,4,38,27,1,1,19,157,319,1,862,1,577,1,142,1,89,1,1,302,1,1,123,1,271,1],[1040,50,1,1,479,341,1,1,221,221,1,281,670,1,1,1,143,1521,1,1,1],[20,1,15,1,57,1,21,58,1,38,1,44,1,14,1,1,1,7,3,1,23,1,1,9,1,3,12,1,21,1,1,9,12,49,14,1,67,22,1,16,1,52,1,53,14,1,18,1,1,37,1,1,40,11,28,47,32,1,149,1,1,66,1,38,1,1,19,1,1,8,1,35,1,1,1,30,6,38,33,1,7,34,1,1,1,5,21,9,1,18,1,31,1,9,14,1,84,1,40,44,1,1,8,1,92,1,9,1,1,12,19,1,31,61,1,3,1,1,54,1,19,1,18,1,71,1,1,69,9,1,1,1,4,1,1,39,1,1,62,22,1,20,1,40,1,1,1,1,62,1,1,1,1,9,1,3,42,3,19,1,1,12,1,1,5,17,1,1,44,1,1,53,2,2,5,2,1,11,1,40,1,1,1,3,7,1,10,75,1,1,14,1,53,1,32,1,26,1,1,32,1,28,1,1,11,2,24,8,8,1,95,1,18,1,12,1,1,4,1,44,1,40,1,25,1,18,8,1,29,1,22,1,27,1,47,1,61,1,1,66,1,24,1,12,99,12,1,1,13,10,14,1,66,1,44,22,71,1,1,3,16,6,1,24,1,34,23,1,22,11,21,11,15,31,60,17,1,1,68,1,1,13,1,12,1,1,18,1,11,11,1,1,1,5,52,1,1,58,1,61,1,1,27,74,1,1,52,1,6,1,1,1,10,55,1,34,21,1,24,1,1,1,23,1,3,1,1,1,19,1,9,1,23,1,1,11,1,9,11,1,1,52,1,61,1,1,1,16,1,41,1,18,1,116,1,19,1,3,1,18,34,26,132,22,1,10,5,1,1,50,1,1,80,10,1,1,73,1,14,30,2,44,42,11,51,1,48,1,33,46,48,17,1,9,1,1,1,10,1,11,1,1,4,1,1,1,7,6,1,1,7,1,1,1,19,1,1,15,1,1,120,11,1,1,36,1,30,3,1,1,9,48,25,3,1,7,3,10,1,27,1,12,1,1,1,15,1,15,17,41,1,3,21,1,3,1,3,28,1,12,1,23,2,27,1,12,1,41,1,6,1,1,28,1],[3270,1],[44,1,24,1,1,21,1,116,1,57,1,1,1,43,1,1,1,174,1,1,1,38,1,5,1,16,1,1,1,1,10,1,1,1,7,1,8,1,33,1,1,5,1,34,1,1,1,336,20,95,1,1,1,47,1,74,1,1,1,1,1,28,1,1,7,1,22,1,1,85,1,114,16,1,23,1,57,1,1,1,13,1,50,1,12,56,86,1,1,1,26,1,76,1,9,1,102,1,1,19,1,1,1,1,18,1,1,1,33,1,35,1,1,32,1,1,1,1,159,1,7,74,1,1,1,14,27,20,1,56,1,1,1,9,1,1,31,66,4,1,32,50,1,3,1,1,1,1,76,1,97,41,1,1,1,1,74,1,1,1,108,1,9,1,1,22,1,1,42,1,43,1,27,84,1,56,1,48,1,1,61,46,1,33,1,16,1,1,1,21,1,32,1,1,1,33,1,16,1,1,9,1,117,1,107,81,85,1,3,1,1,1,174,1,1,25,1,21,1,1,69,1,9,1,1,27,1,1,1,1,299,1,1,80,85,107,1,1,47,1,62,22,1,1,1,334,1,1,1,1,58,1,1,1,1,1,7,1,52,1,1,1,49,1,20,1,1,1,1,1,1,1,1,220,42,1,1,4,1,163,1,6,1,1,5,1,56,1,14,1,93,42,1,1,1,1,19,17,1,23,1,1,1,1,1,15,1,23,12,1,67,54,1,1,1,5,1,68,52,1,1,1,33,1,118,1,1,5],[41,1,134,1,173,5,1,1,21,1,20,387,1,1,679,1,1,1,883,1,445,1,25,1,1,109,1,1,466,450,1,1,25,1,381,217,567,226,1,1,126,1,38,1,1,271,1,351,330,234,1,122,1,39,1],[0,1,1,64,234,952,1,25,1,79,1,612,67,149,68,1,31,1,1,1,1,547,19,1,33,1,1,380,1,99,1,44,1,28,1,1,1,685,1,1,83,1,1,52,1,179,35,1,412,8,113,171,1,1,1,246,1,1,1,79,265,38,1,1,145,814,1],[172,1,202,1,1,361,1,1,3546,1,1,1,1,843,1,1,90,1],[15,1,376,1,40,134,222,1,39,131,1,1,605,1,738,1,325,191,1,6,78,129,1,1,1,1,50,15,1,418,1,1,40,241,176,78,1,257,1,1,1,197,1,473,1,53,7,1,524,109,1,1,274,115,1,6,1,1,156,1,1,25,124,1,1,18,41,1,179,1,118,1,54,1,1,1,88,1],[19,14,1,5,1,9,1,1,5,1,1,15,3,1,1,19,1,1,35,1,16,1,12,1,54,1,3,1,1,1,1,1,2,1,1,1,9,1,51,1,31,3,1,1,18,37,1,1,10,10,1,3,1,1,1,19,1,22,1,1,1,1,1,1,5,1,1,31,1,1,15,1,4,1,6,13,1,15,1,12,3,1,1,22,18,7,12,1,9,11,1,57,1,21,12,1,14,1,1,19,7,1,1,19,1,1,28,1,8,17,1,8,33,1,1,44,17,1,1,1,19,1,1,7,16,7,1,1,1,22,12,1,28,1,1,1,2,17,21,1,1,1,1,5,8,1,1,1,1,4,1,36,1,27,1,1,1,1,24,1,9,1,6,1,1,19,49,1,17,1,1,1,8,102,18,1,4,4,1,61,1,21,16,39,1,1,3,1,1,32,1,5,1,17,42,27,1,17,1,1,1,1,1,1,6,1,1,4,1,6,1,1,7,1,1,19,1,1,1,1,9,3,66,13,12,1,1,1,1,1,70,29,1,1,22,1,40,1,1,1,1,6,29,1,1,62,1,1,19,1,8,1,39,1,6,1,17,57,1,1,12,1,20,1,1,18,30,2,1,5,1,1,8,1,1,1,7,1,24,1,1,44,1,43,3,1,53,1,1,18,1,9,23,1,6,1,18,1,1,11,1,23,7,10,1,37,1,1,68,1,49,1,16,1,1,22,11,1,46,7,1,20,1,4,1,27,1,6,1,3,5,1,3,1,48,20,10,1,4,1,28,1,12,1,3,39,12,1,34,1,43,1,1,17,1,1,1,47,26,1,1,43,1,1,3,1,1,2,1,1,1,6,1,1,1,1,1,1,1,12,1,9,1,1,1,1,6,1,32,10,1,8,1,4,1,1,87,1,24,1,1,1,1,1,32,9,1,1,2,1,30,33,4,1,1,1,24,1,9,1,1,1,1,14,1,1,1,1,1,5,24,1,1,21,1,1,1,16,1,3,1,1,25,1,6,1,1,1,21,5,2,11,1,1,22,15,1,5,25,1,1,1,44,1,1,26,1,1,1,1,1,1,9,18,1,1,23,1,1,8,1,2,10,1,1,8,1,1,22,1,1,1,1,13,1,20,71,4,1,4,15,1,18,1,9,1,1,1,21,1,1,1,5,1,1,47,6,21,1,1,24,49,13,8,1,10,1,1,1,1,10,1,1,9,1,1,1,1,1,1,40,1,1,1,18,1,17,1,9,1,12,1,1,3,1,1,22,65,1,11,1,1,1,3,1,1,1,1,71,1,7,1,21,1,1,7,7,1,5,17,1,4,1,1,2,1,1,1,10,6,1,1,1,10,1,1,7,1,1,1,10,1,1,4,15,1,1,44,1,35,4,1,19,20,1,13,1,1,12,1,17,1,1,7,1,1,36,1,1,1,1,1,1,51,1,1,1,26,1,3,1,1,2,7,19,1,1,1,14,1,49,1,3,1,13,25,29,1,1,14,1,18,1,3,1,1,19,1,47,1,1,1,12,1,1,1,1,17,1,22,1,22,1,57,1,1,1,62,1,3,1,2,1,25,1,1,3,1,32,1,14,1,1,21,1,1,7,25,1,1,34,1,4,1,1,6,10,1,32,1,7,1,1,1,73,17,1,1,2,1,1,1,1,1,1,1,1,1,1,1,14,2,1,2,1,1,6,1,1,8,2,1,32,1,1,9,1,1,38,1,17,1,12,28,1,13,6,1,3,1,1,1,1,1,14,1,1,1,1,1,1,11,1,10,1,9,10,1,17,1,1,18,1,3,1,1,18,1,1,20,5,1,17,1,1,6,1,9,1,60,1,25,1,21,1,1,1,16,9,1,21,41,1,33,1,6,1,6],[2609,1230,1267,985,1,547,1,1]],"ranks":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,48,45,47,46]},"QP":{"counts":[18,76,1,1,17,1,1,3,2,2,1,2,5,2,1,3,1,1,9,1,1,4,2,2,2,1,14,3,1,2,9,1,5,2,20,1,4,2,1,10,2,1,1,11,3,3,2,8,4,2,7,1,1,2,1,6,2,1,1,1,1,2,8,1,8,1,1,1,1,4,1,1,1,1,1,26,4,1,4,3,1,5,3,3,3,2,1,4,6,3,4,2,9,1,4,2,2,3,3,2,10,2,1,1,2,3,3,2,1,3,2,1,2,2,2,3,13,3,3,3,4,2,4,1,2,3,3,3,1,4,2,2,1,5,1,1,2,4,2,3,1,3,2,1,2,2,2,2,1,1,1,1,1,1,1,3,1,2,1,2,1,1,1,4,2,1,1,2,1,1,1,1,1,1,6,2,2,1,1,1,1,1,1,3,1,1,1,1,2,1,1,23,3,2,2,1,2,2,1,3,3,1,2,1,2,1,4,2,3,1,4,1,3,1,2,1,2,3,1,1,1,2,8,2,1,2,2,1,1,2,1,2,1,1,1,1,2,1,1,1,4,1,1,1,4,1,1,1,2,2,1,3,2,1,3,1,1,6,1,1,1,1,3,1,1,1,1,1,3,1,1,1,3,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,32,2,3,3,3,1,4,1,1,1,2,2,2,1,1,3,2,3,1,1,1,2,1,10,1,1,1,1,2,1,1,1,1,2,2,1,1,3,1,2,1,1,1,3,2,1,1,2,1,1,2,2,1,1,1,1,2,1,1,2,1,1,1,1,8,1,1,1,1,1,3,1,1,1,1,29,1,1,1,3,2,2,2,1,1,1,2,1,3,1,2,1,2,1,1,1,1,1,1,2,1,1,1,1,1,8,1,2,1,2,1,1,1,1,3,1,1,2,2,2,1,1,1,1,1,1,1,1,2,1,1,1,1,6,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,18,1,1,1,1,1,1,2,1,1,2,1,1,2,1,1,1,1,1,1,1,4,1,2,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,3,1,1,1,1,1,1,1,1,1,2,2,1,1,1,1,1,3,1,11,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,3,1,1,1,1,1,2,1,1,1,1,3,1,1,1,1,4,2,1,2,3,1,1,2,2,1,1,1,2,1,1,1,3,2,1,5,1,1,2,1,2,1,1,1,6,1,1,2,1,1,1,2,3,1,2,3,11,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,12,3,1,4,1,2,3,1,1,1,3,1,3,1,2,1,8,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,3,1,1,1,1,5,3,1,1,2,6,1,1,1,1,2,1,1,1,1,2,1,1,1,1,2,1,1,1,1,10,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,2,1,1,1,1,9,3,2,1,1,1,1,1,1,1,2,1,2,3,1,1,1,1,1,1,3,1,1,12,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,10,1,1,1,2,3,1,1,1,1,1,2,1,1,1,3,1,1,1,1,1,1,1,1,1,6,2,2,2,4,1,1,1,1,1,5,1,9,3,2,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,11,1,2,2,1,2,1,2,3,6,2,1,1,1,1,1,2,9,1,1,1,3,1,1,1,1,3,2,1,1,1,2,1,2,1,2,2,3,2,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,12,1,1,1,1,5,1,1,1,6,1,1,1,4,7,1,10,1,1,1,6,3,1,1,2,1,4,3,3,2,1,4,1,2,1,1,1,1,1,1,1,1,1,2,1,8,1,1,1,33,1,1,3,1,2,1,1,2,1,1,1,3,1,1,1,1,1,5,1,2,1,1,2,1,2,1,1,2,3,2,1,2,1,1,1,4,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,4,1,1,16,1,1,2,2,1,2,1,1,1,2,1,7,1,1,1,3,1,1,1,2,9,1,1,1,1,1,1,1,1,1,1,2,2,2,1,1,2,2,2,1,1,1,1,2,1,2,2,1,1,1,1,1,1,2,1,2,1,6,1,1,1,1,1,1,1,13,1,4,1,1,1,2,1,1,2,2,1,1,1,9,1,1,1,1,1,1,1,2,1,1,2,1,1,1,2,10,2,1,1,1,2,1,3,1,1,2,1,2,1,2,1,2,2,1,1,1,1,2,1,1,1,3,1,2,2,2,2,1,2,1,1,1,4,2,2,4,1,2,1,2,3,1,1,1,1,1,1,1,1,7,2,2,2,1,1,2,1,1,2,4,1,1,2,1,1,2,1,1,10,2,1,3,2,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,4,1,1,1,1,1,3,2,2,1,1,3,2,1,5,1,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,8,1,2,1,1,2,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,10,1,5,1,2,1,3,1,1,2,2,1,1,2,1,2,2,3,1,1,1,3,2,1,1,1,1,1,1,1,2,5,1,2,1,1,1,3,1,1,1,2,4,1,1,2,1,1,8,1,1,2,1,1,2,2,3,1,9,1,1,1,1,1,26,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,12,1,1,1,1,1,1,2,1,1,1,1,2,2,2,3,1,1,2,1,1,1,2,2,1,7,1,4,1,1,2,2,2,1,1,1,1,1,1,5,1,3,1,1,2,1,2,3,1,1,1,2,1,3,1,1,1,1,1,1,8,1,1,1,1,1,1,1,1,1,4,1,2,1,1,2,1,1,2,1,1,9,1,1,1,1,1,2,1,1,1,1,1,2,1,2,4,2,1,4,1,2,2,1,1,2,1,2,2,2,1,7,1,2,1,2,1,1,1,1,3,1,1,2,1,3,1,1,1,1,3,1,3,1,4,2,1,1,1,1,1,1,1,1,1,1,9,1,1,1,1,1,1,2,7,1,1,1,1,1,1,2,1,1,18,1,2,1,1,1,1,1,1,2,2,1,3,1,1,1,1,1,2,1,1,1,1,2,1,4,1,1,1,2,1,1,3,1,1,2,1,2,1,1,1,2,2,3,6,1,1,2,1,1,20,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,1,3,1,1,10,1,1,2,1,1,1,1,2,1,1,2,1,2,2,1,2,1,1,1,1,1,1,1,1,6,1,1,1,1,1,2,1,1,2,1,1,1,1,3,1,1,1,1,2,1,1,2,1,5,1,1,1,1,1,1,1,1,1,13,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,4,2,1,4,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,4,1,1,3,1,1,1,1,1,5,1,1,1,3,1,1,1,1,2,1,1,1,1,4,1,1,1,6,1,1,1,1,1,1,3,1,1,1,1,1,1,3,1,1,1,1,1,1,3,1,1,1,8,1,1,3,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,10,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,8,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,6,1,1,1,1,1,1,1,3,1,2,2,1,1,3,1,1,1,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,2,1,14,1,1,1,6,2,1,1,5,1,1,1,4,1,1,1,6,1,1,1,1,1,14,2,2,3,2,1,1,1,7,3,1,1,4,7,2,2,4,1,12,1,2,6,1,1,1,1,2,18,1,3,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,2,2,1,2,1,2,1,1,1,1,1,1,1,3,1,3,1,2,2,19,1,1,1,1,1,1,1,29,1,1,1,2,1,1,1,1,2,1,1,2,1,2,1,1,1,1,1,1,9,1,1,2,1,1,1,2,1,2,2,1,1,2,1,1,1,3,2,1,1,4,1,1,1,1,1,1,1,2,1,2,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,2,1,1,1,1,3,1,1,1,4,2,1,1,10,1,1,1,1,1,2,1,2,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,3,1,1,6,1,1,1,1,1,1,1,1,1,1,23,1,1,1,1,1,1,2,2,1,1,1,1,1,3,1,1,1,1,12,1,1,1,1,1,1,1,1,2,2,1,2,1,2,1,1,1,2,1,1,1,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,15,1,1,1,1,1,1,1,2,1,1,1,1,1,10,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,2,3,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,11,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,24,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,10,1,1,1,1,1,1,1,1,1,1,1,31,1,1,1,1,1,2,1,2,1,1,1,2,1,1,1,1,1,8,1,1,3,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,10,2,1,1,2,2,1,1,1,1,14,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,6,2,1,2,1,1,1,1,1,1,1,1,1,1,11,1,1,1,1,1,1,3,1,1,1,3,1,1,4,1,1,5,1,1,1,1,2,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,6,1,1,2,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,2,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,1,1,4,1,1,2,1,1,3,2,2,2,1,2,1,1,3,1,1,2,2,1,2,3,2,2,1,3,1,9,1,3,1,1,2,1,2,4,1,1,4,1,2,6,2,3,2,1,2,1,3,1,1,2,1,1,3,1,3,3,2,1,2,20,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,16,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,12,1,1,1,1,1,1,3,1,1,1,1,1,1,7,1,1,1,1,1,1,1,1,12,2,1,1,1,1,2,1,1,1,1,2,1,1,2,1,1,5,1,1,1,3,1,2,1,1,1,1,1,2,1,1,16,1,1,1,1,1,1,1,8,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,7,1,1,2,1,1,1,1,3,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,6,1,1,2,1,1,1,1,1,1,1,4,1,1,3,1,1,1,1,1,3,1,4,1,1,1,1,2,1,1,2,1,1,1,3,1,1,1,6,1,1,1,3,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,3,1,1,1,1,1,2,1,7,1,1,1,1,1,1,1,1,2,1,1,2,1,1,1,5,1,1,2,1,1,1,1,1,1,4,1,1,2,1,1,1,1,13,4,1,1,1,1,1,1,1,3,1,2,1,5,2,2,1,1,2,2,1,1,1,2,1,3,1,1,2,2,1,5,2,1,1,2,2,3,1,2,2,1,1,1,1,2,7,1,1,2,2,1,1,1,2,2,2,3,2,1,1,1,10,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,3,2,1,1,1,1,1,1,2,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,3,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,2,1,1,8,1,1,3,1,2,2,1,1,1,3,1,1,1,1,2,1,1,1,4,1,1,1,2,2,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,4,1,1,2,1,1,1,1,1,1,2,1,1,2,1,3,1,1,1,1,1,1,1,1,2,1,1,2,1,1,1,5,1,2,2,1,1,1,1,2,2,2,1,3,2,2,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,4,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,3,1,1,1,1,2,1,4,1,1,2,1,1,1,3,1,1,1,1,1,1,1,2,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,2,1,1,1,1,1,1,1,3,1,1,1,1,1,2,1,1,1,3,1,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,9,1,2,2,1,1,2,4,1,1,1,4,2,1,8,1,2,1,2,2,2,3,3,4,5,2,1,2,4,3,2,3,6,4,2,1,6,5,4,4,2,8,3,4,2,3,2,4,3,6,8,1,5,2,2,7,2,3,6,4,8,1,5,1,6,4,4,5,4,1,13,2,3,2,4,4,1,4,2,1,4,5,2,2,3,3,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,12,1,1,1,3,1,1,3,1,1,1,1,1,1,10,2,3,5,4,3,3,1,1,3,5,2,3,3,4,9,2,5,1,1,10,4,5,2,1,3,2,2,5,7,2,5,1,2,3,1,4,4,2,8,4,4,4,2,4,2,3,4,4,21,5,3,3,5,2,3,6,5,1,5,2,2,3,3,3,4,2,3,2,2,3,5,2,4,3,6,7,1,11,2,3,3,2,5,4,3,11,1,3,5,2,3,3,1,4,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,29,5,2,4,3,1,3,3,3,7,1,2,4,4,4,8,2,3,1,4,3,2,5,5,2,2,2,6,7,3,2,2,6,2,2,1,8,4,2,1,2,3,3,3,13,2,1,2,2,3,2,2,3,3,8,2,1,1,1,1,2,2,6,2,2,1,5,4,3,2,2,2,5,2,2,5,4,2,2,1,3,7,3,1,2,2,5,1,3,3,1,1,1,1,1,1,1,1,1,10,1,3,1,1,2,1,2,7,1,1,1,1,1,2,2,1,1,1,1,2,1,1,1,2,1,2,2,1,4,1,1,2,3,2,1,1],"rows":[[377,153,692,963,372,222,620,470,151,348,45,6,90,49,250,24,940,108],[40,100,85,1,1,1,78,494,1,12,1,1,52,258,20,173,189,39,31,123,50,189,231,26,223,96,40,1,2,272,415,145,215,1,39,1,43,116,1,1,157,1,110,24,268,2,139,13,288,54,1,1,277,1,1,369,1,1,52,262,52,77,134,55,2,26,416,1,5,1,182,14,1,62,34,1],[946],[3595],[1087,1,222,183,516,595,1011,587,322,1,225,70,155,175,1,878,664],[3378],[5562],[1091,860,2925],[26,6809],[17,4611],[5013],[642,263],[3,530,2864,2801,418],[2046,2953],[1519],[3267,286,767],[2039],[5800],[375,309,885,697,166,493,1055,1577,325],[6585],[291],[2654,2238,215,686],[1588,1086],[20,1769],[3852,76],[5922],[191,459,390,254,936,829,994,101,915,327,69,58,722,314],[1547,2860,1185],[3102],[5350,1008],[468,457,2210,96,196,655,900,105,1475],[4603],[1555,313,16,4194,176],[1109,952],[178,608,345,271,62,1353,123,52,204,34,29,543,471,101,465,199,790,73,528,477],[6269],[1069,1218,4028,351],[5498,1418],[2434],[545,676,296,1082,1195,94,99,825,185,1354],[3539,2552],[4190],[819],[471,280,709,1278,775,736,200,1091,547,437,287],[252,4906,878],[2508,383,2770],[2187,881],[555,94,235,557,868,729,8,3285],[1560,760,2315,1861],[6399,555],[5,476,761,73,2207,1708,1687],[1229],[3300],[2765,1180],[1172],[1895,390,71,149,621,1059],[564,5047],[6084],[376],[4244],[6698],[4942,1919],[166,418,192,282,985,215,2758,521],[3656],[534,251,2147,969,92,877,519,1197],[6618],[3891],[1599],[1925],[100,1160,3638,1408],[627],[489],[5763],[1098],[2595],[239,396,30,300,562,51,262,509,135,263,3,77,202,43,373,33,206,523,96,42,840,402,154,76,264,266],[249,1087,185,685],[689],[2892,80,2026,1439],[1324,3873,71],[1455],[5000,97,5,505,838],[2381,185,48],[1333,3460,1],[1392,4000,947],[1757,75],[3630],[1396,768,2192,1628],[666,2592,1396,1070,840,160],[1223,3029,1595],[1240,1051,2220,1162],[3303,3440],[269,995,2302,316,1564,477,208,682,33],[758],[442,926,897,1928],[479,5946],[1787,875],[3796,821,929],[3895,804,1563],[2066,1772],[25,88,445,1396,523,1749,837,1184,110,258],[2594,2956],[2764],[4605],[3611,2691],[139,2908,260],[1009,2524,1783],[2286,151],[5472],[908,1902,2365],[1246,4941],[274],[3541,600],[3237,1868],[1123,3497],[4594,748,860],[669,6,67,587,53,943,1202,156,1345,191,410,459,564],[118,3301,127],[493,1691,4459],[522,1887,2268],[628,516,901,2318],[486,1220],[1470,1041,923,1881],[4774],[809,2332],[5204,171,1175],[1238,398,3866],[366,1915,3407],[4835],[614,1798,2043,508],[937,5662],[181,5250],[3544],[492,343,1660,2190,1848],[6955],[3639],[1081,4613],[1590,1777,195,435],[1351,4520],[1635,2589,861],[2800],[4646,1634,188],[1225,1580],[2447],[565,5211],[4299,1846],[5275,360],[1537,5321],[2988],[1573],[6825],[687],[6451],[898],[737],[6106,182,471],[4537],[2549,1099],[2833],[1014,2149],[6844],[5582],[2789],[2158,269,93,2467],[1505,378],[1813],[6681],[1185,3741],[1128],[1332],[4561],[2787],[4891],[592],[2377,141,359,1023,1848,659],[3862,575],[2441,3395],[45],[3761],[6677],[4608],[359],[5111],[2967,803,2261],[4842],[1770],[5421],[4896],[979,447],[450],[51],[429,164,87,263,497,13,435,597,233,93,366,272,314,334,92,254,1021,33,416,2,34,449,219],[1932,740,549],[1485,4523],[2576,3478],[3308],[6527,424],[67,6783],[3052],[5312,318,574],[4385,290,1204],[5663],[5818,517],[4401],[1871,3945],[1582],[155,1088,4185,425],[1074,4602],[1729,1875,657],[3957],[2433,2005,991,1010],[6097],[2404,732,1960],[3958],[5808,191],[5071],[293,6317],[2583,503,1834],[3931],[1423],[4300],[634,4606],[922,497,748,755,1800,11,1241,668],[42,5800],[4101],[2459,423],[643,4667],[933],[207],[4571,1651],[5081],[781,2777],[5015],[2189],[5620],[1908],[3687,1060],[1096],[4297],[1337],[1894,1529,159,775],[2224],[4778],[857],[217,2543,3042,1060],[509],[6672],[6504],[4245,1954],[3996,1671],[4275],[1761,492,4513],[1817,1329],[4250],[1568,526,3399],[2190],[4823],[1158,530,1755,136,178,153],[4100],[5410],[1610],[2458],[1968,2300,1852],[4902],[6319],[6266],[2945],[5477],[2283,3124,1481],[6548],[1011],[2977],[5303,467,773],[145],[4674],[5935],[5052],[4496],[3473],[1420],[361],[2031,4458],[1667],[3752],[4038],[5254],[3727],[5653],[674],[6649],[156],[3356],[400,3467],[505],[3644],[4582],[1800],[1797],[133,57,3,119,296,148,13,193,153,984,121,710,92,133,50,63,288,523,152,341,182,6,252,22,3,77,900,104,117,87,27,42],[1777,990],[2366,976,1051],[278,1500,4358],[2650,913,2773],[1309],[52,1811,1438,3110],[5833],[2116],[2894],[837,5759],[5696,1090],[2165,1100],[3936],[1921],[699,2479,3049],[2050,786],[2978,1437,2250],[3069],[6249],[3222],[890,4982],[910],[844,778,215,655,658,122,66,2548,291,511],[1153],[761],[2203],[5321],[218,4336],[5173],[5060],[4371],[3789],[1966,3398],[5717,221],[3394],[4618],[144,1953,1780],[1232],[498,3678],[2008],[1391],[2780],[2582,420,2359],[2430,2973],[5139],[3767],[659,6312],[1548],[5300],[2200,464],[415,3294],[551],[5714],[5320],[5126],[1857,4036],[6903],[1189],[1039,2625],[5121],[6385],[463],[6636],[755,1593,269,114,2718,685,325,253],[2450],[2741],[4094],[5368],[6696],[2963,2172,134],[6480],[55],[4736],[4426],[188,488,49,1,135,429,143,283,19,106,179,159,1,64,1,506,518,432,421,451,936,79,179,36,238,1,75,434,227],[1363],[1956],[3512],[2081,2637,1854],[797,1624],[1356,2316],[3970,2746],[424],[475],[924],[3453,280],[5412],[260,3738,1702],[2651],[419,6332],[4009],[1206,4002],[353],[2475],[2517],[4391],[811],[5986],[951,5768],[1828],[5511],[3758],[2017],[5331],[129,1922,47,1236,258,2077,37,855],[2393],[5591,713],[222],[2864,1102],[5520],[3400],[4586],[1553],[746,3114,131],[6438],[5287],[3224,2105],[2063,1653],[4456,1371],[3333],[5473],[553],[1913],[596],[302],[19],[6286],[386,517],[5569],[91],[6225],[2533],[698,3306,1247,752,879,67],[6100],[4204,1548],[841],[3812],[4453],[5002],[4104],[2859],[941],[1489],[895],[3439],[6428],[3010],[2914],[1772],[4557],[5487],[1754],[4106],[3575],[6363],[3366],[2546],[189,5,59,956,4,1424,557,285,38,101,811,415,89,157,130,854,207,588],[6638],[1564],[5402],[2592],[1682],[3640],[5490,150],[645],[2907],[2999,3249],[3823],[5079],[185,2087],[1017],[1249],[5742],[186],[4931],[29],[3984],[1850,1173,1690,2157],[4780],[1805,3896],[1226],[4465],[342],[6558],[5077],[6073],[5702],[6186],[5286,914],[5634],[789],[28],[529,3794],[11],[1707],[1959,930,1918],[3074],[4238],[2802],[4568],[3358],[1178],[1481],[5023],[5780],[1562,1855],[620,6363],[6313],[3779],[31],[5660],[265],[2001,337,2944],[6278],[770,113,408,839,664,58,507,261,1415,675,400],[705],[882],[5781],[4533],[3509],[5860],[2059],[2201],[1384],[855,4121],[5398],[447,2565],[2168],[2092],[3189],[37],[3013,979,1496],[1486],[322],[2262],[393],[4486],[790,6046],[2959],[3981],[320],[6880],[2928,669,517],[4900],[4290],[6831],[1950],[245,1739,1587,847],[4063,10],[1078],[4698,1539],[863,145,4904],[4448],[6161],[3324,2067],[175,4614],[5169],[847],[325],[5468,1007],[6828],[891],[3753],[5388,687,50],[2387,3856],[1030],[964,575,2385,708,371],[5263],[2538],[4834,1004],[892],[1651,2763],[6961],[3831],[3670],[2213,1114,2086,475,268,616],[806],[4011],[2401,3197],[6053],[859],[1311],[2212,2129],[3703,259,1873],[6282],[3186,3331],[182,3471,298],[296,1538,842,52,1036,444,9,711,265,799,478],[3822],[3424],[817],[2993],[5946],[6894],[4901],[2171],[4288],[6505],[3185],[1097],[4459],[5867],[950],[241,155,144,1130,209,507,261,213,58,1246,528,652],[1101,2947,779],[3845],[953,1019,1585,1295],[6212],[5647,922],[397,1500,3624],[846],[480],[329],[48,185,2086],[4695],[2292,1961,2505],[4328],[1763,262],[541],[174,2773,969,418,373,286,1050,692],[3210],[3250],[4938],[3883],[4869],[1478],[2147,956],[2628],[1036],[4986],[4256],[1163,4512],[5758],[2796],[3502],[1649,356,4835],[4105],[6980],[5022],[6418],[381,1523,57,1265,2501],[2921,2050,220],[2472],[5953],[2181,1861],[1207,2039,135,271,36,1246],[363],[4719],[6896],[3137],[3040,2769],[97],[2091],[954],[5458],[2225,1653],[1864],[5049],[6375],[5043],[2734,2961],[3518],[2727],[2781],[2504],[427,325,1796,510,569,239,249,1917,255,252],[2610],[4702],[2086],[3297,1465],[2541],[3803],[1085],[5359],[1508],[911],[1267],[4855],[4950,1],[1064],[1013],[512,1183],[3456],[5276],[3096],[1756],[1122,303,716,647,374,168,1807,128,1316],[735,860,5306],[4559,2331],[4676],[165],[1924],[4667],[4885],[5259],[1302],[1121,61],[2683],[2375,3899],[2155,147,42],[3104],[818],[6378],[1197],[402],[6676],[1504,3122,1111],[3004],[1251],[247,196,267,504,485,18,197,359,930,914,758,1475],[5730],[2994,842],[136],[294],[4641],[4287],[1364],[947],[4904],[5029],[1090],[5174],[6722],[6625],[125,5964],[5445],[2414,68],[44,1024,929,479,112,45,1,2743,1029,437],[1474],[6005],[1000],[1812,3935],[2339,1,100],[648],[1733],[6717],[6390],[591],[4359,479],[6369],[6782],[709],[1330,3560,1788],[952],[1127],[4087],[2426],[6150],[4590],[6702],[5419],[2532],[1424,458,98,2667,277,932],[3207,110],[5474,1],[6318,164],[300,842,1,1956],[5691],[6516],[799],[1811],[5981],[803,1596,1071,1025,956],[6405],[115,965,1909,922,630,400,745,222,578],[2686,1577,191],[2455,1454],[6576],[597,1621,351,2187],[5858],[2069],[3396],[4365],[1533],[1535],[199],[1534],[3045],[107],[2391],[5740],[1558],[117,3085],[387],[1300],[5291],[3978],[1365],[5198],[728,1701,876,137,426,106,205,168,986,1007,607],[4867],[1550,3304],[1107,1032],[721],[1155,452],[5933],[550,1088],[347,2005,2305],[1967,3438,112,317,1044,9],[4364,1217],[5129],[1192],[5862],[2342],[3633],[49,6652],[127,925,471,500,54,867,494,2331,773],[2808],[2350],[2103],[4174,1279,379],[4682],[1010],[3848],[5349],[1516,194,1676],[360,5759],[6030],[2030],[2282],[777,2029],[3724],[1234,818],[1774],[2088,3364],[4565,2061],[1948,42,2286],[3469,1424],[4352],[2060,2282,666],[2951],[6114],[1042],[6447],[71],[3158],[4686],[623],[5744],[258],[1306],[3607],[6528],[2499],[4522],[3031],[6740],[2890],[172],[851],[177],[4259],[5227],[4985],[6096],[701],[2725],[1321],[4763],[3492,1309,1575],[1970],[2232],[6046],[4912],[2355,789],[5925,822],[4036,911],[4956],[1119],[3170],[2700],[5372],[3064],[662],[722],[5977],[2540],[5484],[3854],[6818],[6294],[3939],[1641],[2641],[6060],[1986],[1745,1154],[310],[352],[873],[3776],[6001],[3920],[3088],[3587],[3152,1345],[4516],[5960],[4058],[6736],[3033],[235],[337],[6536],[1215],[927],[3772],[382],[4479],[5068],[4170],[4350],[972],[5131],[5658],[5417],[5692],[625],[1049,5279],[4534],[3275],[3942],[299,1099,207,1665,344,7,470,178,361,121,1809,306],[6690],[1978],[5636],[1323],[1276,3535,391,305,635],[1317],[1743],[3857],[2663,566,1149,275,456,1283],[6210],[6441],[4821],[349,198,2071,1928],[2235,173,990,451,271,1221,56],[6837],[324,436,399,963,963,148,9,289,582,1160],[2777],[948],[2575],[784,1388,328,615,206,2533],[4,5935,805],[4412],[2835],[2010,3093],[6050],[2552,183,2506,610],[1580,614,2517],[2968,2608,679],[1046,4234],[5232],[141,164,2431,197],[3484],[313,743],[6706],[3834],[1900],[4857],[2563],[5266],[1644],[729],[254],[1385,4534],[5914],[1061,308,939,898,2567,121,199,401],[2112],[6646],[43],[30,210,92,81,15,460,27,79,83,189,664,41,336,1048,100,386,56,25,138,77,189,1,89,579,484,311,222,74,69,113,519,158,3],[106],[168],[2379,2627,1],[6251],[1576,5359],[421],[5394],[3632,699],[1822],[833],[4134],[430,5605,727],[6674],[6260],[449],[384],[2886],[488,86,2198,1995,1881],[3751],[2129,828],[4306],[4856],[6789,1],[4804],[1619,2962],[504],[1643],[1259,2821],[1663,2777,1987],[83,900],[5559],[435,3578],[4381],[5065],[2920],[615,1652,404,3174],[5970],[2110],[3731],[930,1134],[2593],[4139,1287],[4790],[4286],[5031],[4771],[5561],[5293],[490],[6112],[98],[6953],[371],[379,971,2613,1603],[5194],[4298],[1287,840,808,172,811,279,366,253,119,236,76,176,25,231,89,55],[6420],[206],[2740,3152],[1038,4675],[6902],[1187,2848],[3706],[4130],[940],[458,2384],[4979],[720,1078,548,270,1274,535,1708],[2449],[4093],[1660],[1631,3073,1237],[122],[1796],[6164],[65,4473],[24,574,972,212,635,161,472,1358,2384],[5969],[2698],[1658],[5211],[5554],[1843],[1397],[4897],[587],[3955],[929,1463],[2335,1363],[3314,868],[6834],[1746],[2278,719],[4627,24],[1934,3646],[4462],[5683],[2413],[4773],[1405,4502],[2237],[853,4494],[1964,3190],[6726],[6856],[2065],[3569],[1823],[6663],[4138,621],[5624],[4301,226],[6305],[918,1064,604,1155,1514,427],[2732],[3285],[3853],[2202],[1292],[3511],[4466],[405,67,1739,665,34,187,1632,40,481,22,64,1,1637],[6162],[536,1318,1266,2668],[3885],[4580],[4833],[4234,322],[2867],[1149],[2962,3838],[1160,2130],[4103],[1108],[5782],[1445,731,554,998,15,2097,865,47,1],[1488],[1181],[3811],[4450],[4023],[970],[4515],[2034,3771],[1541],[2776],[3365,850],[4691],[2990],[1544],[1186,3805],[677,488,1253,1958,634,810,372,133,71,488],[1200,4089],[6629],[1028],[445],[6661,110],[4648],[1057,2542,2554],[6801],[5278],[2853,3589],[1492],[1497,4036],[4952],[4846,247],[1393],[4183,2176],[2277,1471],[716],[5924],[3403],[744],[515,5030],[6240],[3505],[3337],[825,847,1410],[6185],[1626,3480],[1963,871],[5030,1465],[314,5589],[1697],[374,1482],[5162],[203],[4199],[282,1134,1865,2093],[1262,5192],[2950,2346],[95,3858,669,1689],[5383],[3547,2915],[2121],[103,2451],[1270,1508,1072],[6700],[2756],[6223],[549],[3497],[548],[3313],[5677],[86,2304,1872,232,653,1037,178],[1135,3068],[5357,1352],[3067,2067],[4743],[3161],[2911,1],[3351],[3008],[1401,996],[346,171,102,1134],[4265],[5583],[298,5184],[4162],[5783],[5189,92],[6982],[2545],[131,202,509,788,853,894,319,23,1776,455],[2559,3291],[4503],[61,3954,2428],[1073,1497],[3441],[2384],[1202,296],[6860],[5305],[3436],[307,4834],[5212],[2354],[2423],[1434],[612],[6824],[4874],[6925],[1410],[6763],[3524,3116],[5897],[4529],[267,2149,878,3503],[4128],[2169],[507],[4944],[1993],[1655,4365,855],[1133,3081],[3130,1304],[1621],[4420],[2261,585,3987],[1279,4399],[3138],[2126,377,23,3576,813],[5877],[3489],[1617],[4377],[5455],[3947,1926],[317],[5527],[6077],[93,5114],[6847],[1829],[335,2256],[5535],[1273],[893],[1767],[3119],[6211],[1307],[4180],[5641],[2102,738,506,963,357,102,138,160],[2013],[2334,4033],[4936],[3817],[1177,5096],[116],[3073],[35,2766,155,1653],[4239],[2075],[4697],[3775],[2298],[1480],[738],[971],[5775],[2011],[5659],[6160],[23,87,682,369,1058,1090,1035,137,164,581],[18],[831,113,3335,1013,846],[640],[1722,4853],[538],[288,669,5507],[3675],[3315],[437,2492],[5200,1408],[6682],[6566],[2074,1333],[4310],[1899,3632],[4089,503],[356,2896,1341],[876],[3528],[4383],[5277,295,1061],[3113,3219],[3482],[2134],[2015],[6366],[4423],[2324],[1928],[3678,1289],[2056,914,96,1045,818],[2073],[2330,3777],[6069],[3519],[3835],[2885,2480,1206],[262],[1071],[4670],[2038,1017],[604,754,921,3967],[570],[6583],[4624,1931],[2868],[4432],[610,807,206,1123,691,388,222,431],[6644],[6687],[3128,804],[4784],[4710],[1345,3316],[2902,1058],[2849,2963,370],[6939],[1319,573,982,95,845,793,3,950,1351],[3840],[5086],[326],[3979],[494],[244,346,1236,327,183,155,167,113,117,15,108,731,48,272,139,246,60,59,9,50,55,235,40,266,616,1044],[3288],[3121,951],[2514],[862],[1007,3015],[4145],[5168],[3832],[5390],[2000],[3212],[4169],[6236],[1585],[5597],[4417],[237,737,605,1169,677,55,497,24,158,1389,685,532],[2713],[5614],[3737],[1253],[6171],[989],[3623,1037],[6729],[276],[369],[6324],[1583,2657],[1428,4720],[1456,1366],[1193,2199,1224],[2937],[1824],[5070,926],[2872],[2712],[2896],[654,3815],[2498,658],[6062],[455,529,1863,1262,1650,409,245],[2995],[385,5641,87,116],[5019],[3475],[4040,56],[870,1637],[3249,3518],[3847],[5843],[5116],[663],[5053],[1723],[559,1633,1151,1429,1898],[6913],[196,3596,1126],[80],[3635],[230,5273],[4057],[1820,4596],[3954,1201,1777],[2685],[500],[2615],[3907,3070],[212],[154,513,1656],[6128],[5830],[153],[21],[6239],[4158],[695,307,284,3302,12,732,753,78],[2790],[6827],[4219],[3782],[1983],[1989],[6474],[6968],[576],[1258,280,364,2021],[5418],[1298,214],[805],[1136],[3468,3492],[1949],[868],[963,687],[6124],[6242],[2101,150,49,927,1590,711,98,682,35],[5122],[4187],[390],[2693],[292],[6355,490],[70],[3594],[467],[3711],[2371],[3035,1679],[2646],[2804,3415],[3347,138,1800,1587],[3173,701],[4577],[200,2782,2618,423],[3025],[2327,342],[2564,3085],[5245],[6082],[1819,1320],[6530],[4792,1701],[977,1625],[2205,1767],[622],[57,766,145,1248,983,695,2605],[2004],[3821,862],[1542],[747,4345],[6055],[4241],[543],[2638],[2562,2050,269],[2089],[6296],[1802,1585],[1448],[3926,1132,1241],[2916],[1606],[6965],[783],[1354,2010,1879],[3465],[1815,1004,3169],[5955],[1171,210,2354,2528],[1388,3947],[3042],[1146],[1340],[389],[5233],[4008],[1070],[4024],[2979],[1627],[1659,2504,643,82,104,524,761,264,49],[5343],[3298],[4851],[6312],[2946],[3669],[2870,297],[2024,376,765,750,1022,819,131],[1896],[4010],[4403],[2703],[5467],[1596],[3501,2925],[1033],[561],[272,1223,507,757,373,25,213,56,318,149,112,416,461,27,118,191,6,1234],[6446],[5799,1054],[4473],[3717],[6049],[3552],[6607],[339],[827,3656],[1858,4906],[6289],[3192,47,1817],[6511],[2054],[6905],[5743],[1041],[4143,142],[2117],[1404],[6886],[2931],[1906,4104],[364],[2584,3088,54,61],[3090],[1683],[3232],[6660,115],[491],[6466],[4312,487,4],[4596],[176],[4029,1524],[6045],[477,6327],[5196],[148],[5074],[2858,1933],[4512,1628],[670,5944,132],[60,2235,141,3285,881,140],[5796],[2753],[2905,2113],[872],[1375],[646,863,599,67,318,833,23,186,35,134,246,142,608,88,38,42,519,461,82,342],[3216],[2739],[2942],[2823,4135],[3414],[6538],[1477,3544],[1600],[4034],[2452],[3024],[2425,4143],[3053],[5900],[6417],[5358],[2209],[1648],[6028],[47],[2627,598,1536],[4694],[2471],[238,430,1269,229,1370,163,116,408,173,157],[992],[4069],[3638,2375],[6449],[5994],[6718],[3418],[1471,1503],[1138],[4258],[2721,2109],[6381],[75,2403],[2799,1927],[1602],[4152,594],[2487],[1335],[3819],[902],[3101],[2965],[736],[5964],[1357,94,308,2311,136,1961],[5687],[3580],[5541],[1807],[1632],[808,3223],[5235],[5327],[1320,2398],[664],[4989],[224],[406],[1334,4982,668],[3801],[484],[1004],[5596],[4984,619],[2083],[4132],[2240,4283],[2724],[703,991,1503,1764,1565],[112],[656],[2639],[3105],[135],[1511],[4836],[6668],[6356],[639,206,74,148,106,730,936,36,702,366,417,271,339],[4255],[583],[4424],[2865],[4957],[798],[647,4021],[4148],[1162],[5644],[734],[6889],[5258],[4884,5],[2795],[2140],[3098],[3003],[899,1,4,4360],[2754,499],[6900],[1236,142,1705,1085],[3863],[5645],[1099,3066,1710,643],[4945],[4672],[563],[4849],[5889],[4387],[3402],[3323],[4980],[501],[2815],[4693],[183,624,1464,2510,1277,357],[1305],[1054],[600,505,267,5419],[2742],[1175],[283,1785,1730],[6612],[2105],[6179],[1848],[4958],[408,2865,783,1358,972],[1065],[5539],[3810],[214,317,2874],[4597],[731],[2079],[2035],[567,3725],[2624],[4840],[209],[3383],[1303,845,1918,427],[6819],[4441],[1204],[0,1140,1621,1313,2530,179],[6111],[3876],[3786],[3999],[3457],[2109],[2770,691,3039],[5951],[3624],[6556],[2673],[6158],[4270],[2374,1669,966],[5441],[3654],[1725],[3077],[3180],[2207],[197,268,4194],[578],[2530],[1995],[1271,2258,595,183,458,1576,167,458],[4687],[6593],[523,2178,790],[636],[6733],[3005],[3291,3215],[749],[2118],[1248],[6972],[3729],[4972,1408],[2314],[3679],[3027],[1343],[1926],[5895],[232,951,1499,1216,118,327,1673,242,151,567],[3159],[6679],[394],[259],[2831,827,2331],[66],[3032],[2640],[6471],[2480],[4394],[3255],[4266],[5745],[1166],[88],[5399],[1586,2289],[3702,799],[3759],[77,3930],[2090],[1867],[2785],[6275],[6444],[2653],[3904],[864],[4294],[5460],[2489],[3416],[2843],[5380],[3373,1810],[3912],[1156],[5797,168],[1255,496,1157,585,1081,286,441,1355],[4921],[1768],[5228],[2975],[594,2877,3317],[4764],[162],[6394],[4232],[170],[3389],[287],[5408],[2137],[5050],[1873],[4489,1437,383],[713],[50],[5252],[6776],[12],[986,472,5226,72],[1827],[2233],[1429],[3715],[6264],[1608],[4523],[4894],[4353],[6383],[2407],[2456],[3642],[1322],[1957,3874,690],[1665],[1685],[242,1282,189,513,1996,726],[5824],[2405],[1945],[4551],[1167],[5406],[5791],[1674,2376,1601],[997],[1506,2705],[2146,3240],[5119],[4913],[754,4570,1417],[5720],[5463],[3707],[173],[6694],[5124],[3725],[4150],[1691],[2824,3341],[4003],[3787],[1254,2633],[53],[1877],[3352],[5746],[3446],[1501],[6478],[3886],[1668],[126],[3181],[1120],[1150],[696],[739,26,2596],[461],[3944],[1943],[1025,4953],[5485],[580,415,443,632,853,116,181,396,96,114,66,1019,190,400],[6401],[4251],[856],[624,819,509,279,880,1544],[2510,2920],[3510],[6611],[1465,2196,660,411,934],[3982],[630],[3282],[556,2984,332,2412],[5995],[4583],[3116],[1436,74,61,697,1918,2168],[6808],[834],[906],[3783],[5352],[1093,248,508,718,306,275,406,381,98,86,423,519,67,478],[268,6155],[5108,1819],[303,1548,3950],[3690,2524],[3306],[1076],[6291],[1083,1103,536,2295,169,418,9],[1999,3795,89],[2410],[1676],[2227,57,1643,1340],[1738,577,54,1286,1903,1315,45],[1263,3938],[5593,1096],[124,1378,2106,896],[6334],[208,338,43,712,1330,429,1115,937,504,199,658,477],[932],[417,3811],[605,1757,325,1630,228,664],[6143],[1589],[4156],[6658],[651,3747],[9,121,548,46,351,221,1228,584,158,210,712,591,370,67,1104,24,1,52],[34],[2680,463,2589],[6606],[3591],[4519],[3339],[5435],[1361],[1679,187],[2585],[5304],[6329],[2124],[76],[2260],[5153],[4658],[602,4897],[6371],[6662],[2954,711],[865,2660],[2621],[2029,4503],[4467],[2973,3173],[1870],[2364],[6491],[1275],[682],[780],[1977],[2241,1192,2285],[1875],[1308,338,961],[5257],[264,5640],[1072,3724],[7,434,1719,110,41,231,202,74,8,54,624,1706,395,12,248,83,652,196,125],[3564],[6424],[1584],[6588],[6122],[5299],[5466],[297,430,26,331,243,526,88,55,551,78,18,86,278,23,738,3,68,99,123,272,113,60,304,380,72,670,79,172,397],[2107],[6368],[5478],[1012,1285],[164],[3057],[1196],[1063],[2398,304],[3576],[5271],[1755,673],[3095],[3091,3302],[999],[6781],[1250],[4340],[1129],[2378],[73,453,2770,417,358,291,521,163,1775],[2466],[3609],[1969,1226],[4549],[1339],[150],[1604,798],[661],[617,2094],[3051,2819],[1890],[4475],[2571,2393],[3341],[2007],[3730],[1328,1935,1380],[745,668],[6817],[3283],[1421,1240,1613,1952],[5360],[2773],[2814],[6941],[2470],[5469],[6815],[273,5271],[5371],[327,6442],[5400],[4316],[1705],[4319,250,705],[5864],[4547],[1293],[6498],[2321],[3937],[936],[1295],[1371],[6755],[1089],[4502],[1230],[46,489,172,1103,2098,1015,589,1003],[3329],[2652],[1559,3880],[3169],[1032],[3842],[6481],[4041,1814,149],[5437],[1549],[6979],[1079,2087,460,1064],[5971,712],[6404],[2531],[351,672,407,2,1588,104,30,1066,386,302],[5896],[6206],[2699],[5762],[5041],[6196,652],[3000],[216,5817],[248,1496],[1352],[1118],[6715],[521],[3175],[5715],[2006],[6103],[1408],[3560],[3995,1265],[2018],[3063],[4930],[4081],[693,1770],[641],[3454,2831,45],[1285],[1633],[350,207,590,1223,2319,2125],[180],[4064],[2290],[5249],[4030],[606],[1739],[6963],[2883],[5621],[114,115,197,113,263,179,12,8,99,26,468,287,146,104,308,1326,9,199,373,243,1501,177,218],[1732],[887],[5735],[4173],[1265],[6957],[2952,3925],[1702,4973],[420],[5348],[4866],[5450],[6537],[401,2186,2266],[59],[3740],[2113],[2536],[921,510,97,238,983,43,656,234,598,937,53,982],[1640],[3561],[2446],[251],[2474],[4637],[5330],[595],[1179,455],[3462,2147],[157],[4969,212],[6293],[774,1742],[2539],[5738],[2049],[4230,200],[2551],[1483],[1788],[923],[2636],[691],[72,456,2101,2465,1308,440],[1838],[3804],[5725],[6919],[6271],[4579],[6144],[3784],[1917],[5145],[6068],[1154,984,108,60,37,225,273,463,1054,412,224,382,266,180,39],[2022],[6673],[362],[3884],[4389],[2021],[1104],[1637,4113],[4540],[2657],[2076],[457],[2454],[878,928,527,272,1208,631,100,2005,46,246],[2145],[5985],[4107],[5237],[1390],[3217],[5589],[4386],[1647],[2996],[3601],[4744],[478,1225,1681],[2649],[5868],[2255,921],[519,1096,215],[496],[1151],[4776],[1348],[5470],[1216,1825,454,2175],[6337],[2688],[2317],[3404],[2619],[5622],[652],[1581],[4246],[3515],[434,1475,432,1013,1302,131,50,103,306,683,51],[4681],[4330],[4146],[3722],[4564],[3917],[6512],[383,128],[1407],[4305],[105],[4757],[4086],[5393],[82],[5976],[3723],[871],[3215],[843,123,148,590,1146,28,569,246,301,526,201,9,266,30,398,70,524,97,1,13,499,86,35,106],[4464],[6552],[1316],[5483],[5425,1288],[6540],[5205],[909],[2581],[1522],[1804,4252],[4118],[4225],[1985],[839],[416],[2198],[5176],[4085],[3001],[215],[1124],[4662,1360],[2580],[6303],[3671],[854],[2579],[5945],[476,1818,720,417,515,201,760,1350,548,181],[566],[1239],[4322],[1886],[4872],[370],[1394],[5024],[4813],[2304],[5577],[380,24,169,941,446,19,278,185,1,466,25,401,579,221,43,18,108,4,17,7,388,46,39,54,55,431,59,18,518,165,829],[5298],[575],[4235],[5774],[6123],[280,5970],[6647],[2396,3138],[1513],[422],[4349],[1515,2961],[719],[4012],[832],[5447],[3750],[2809,668,717,807,1107,1,125,718],[6197],[1567],[2960,1520,1067],[459],[3542],[2256],[1681],[4390],[5238,883],[328,1835],[5632],[1955],[281],[1918],[3833],[6188],[6007],[334],[3187],[1130],[4392],[1574],[5777],[5806],[6785],[1846,4549,561],[2893],[3280],[3243],[1614],[2986],[6490],[6624],[6651],[5104],[487,746,451,245,29,983,165,305,1759,796],[1662,1029],[6034],[167],[2513,776],[4825,1434],[6419],[2537],[1642],[121],[111,190,528,87,304,875,756,521,1367,846,1,41,346,934],[3452],[5317],[1861],[5138],[1919],[779],[22,2601],[4585],[2403,3806],[5869],[1180],[5681],[4638],[6436],[629],[836],[2067],[2648],[6203],[2044],[1422,4067],[5432],[3929],[6208],[1444,2956],[3532],[6863],[412,502,123,2225,1466,1404],[2961,1168],[3705],[448,4107],[5123],[6799],[2862],[4380],[2807],[5957],[6731],[2866],[5891],[4144],[759,201,1,258,69,88,111,1183,3039,56,1144],[2197],[2512],[4355],[3526],[4155],[4463],[860,1753,2104],[5639],[796],[2221],[2188,995,2753],[730],[5810],[161,1120,2219,3374],[5637],[3261],[2451,1127,443,1112,777],[6002],[1400],[2389],[5064],[5146,590],[1947],[5283],[3093],[2675,657,36,148,169,2445],[6432],[4212],[5395],[3218],[1933],[3467],[6826],[6000],[4539],[1244],[2612],[3795],[3808],[942],[5042],[5590,64],[3145],[6621],[3657],[4192],[5755,1054],[638,2712,113,1135,307,1051],[3287],[5804],[2345,1369],[5814],[4439],[6967],[4514],[2012],[205],[2347,3019],[344],[2659],[1711],[4451,1647],[3065],[6483],[4026],[3171],[4282,2428],[6823],[3855],[3940],[3133,440,1161,7],[4487],[2642],[3412],[4236],[2900],[5779],[2678],[15],[6061],[2906],[2337],[1269],[2444,2472,299],[311],[2274],[577],[5757],[3777],[3829],[4517],[3921],[3168,2927],[874],[3048],[5967],[5942],[1922],[338],[1235],[3276],[4171],[236],[973],[3843],[1034],[928],[4535],[439,1028,1188,883,211,305,699,75],[1845],[5039],[685,2202,1101,1048],[4314],[1885],[1790,184],[1758],[3430],[1693,1548,425],[787,1082],[5784,741],[1227,4691],[2926],[4409,1538],[5500],[2380],[1556,1323,3741],[6079],[5564],[1572,4959],[1016,3834],[4083],[917,2340],[1111,2209,2732],[2150,4023],[2572,3876],[5443],[3550,1054,573],[2984],[423,279,647,100,81,263,1856,1510,195],[3629],[138,972,1490],[934],[6723],[2435,1085],[2183],[1367,4355],[410,4419,32,1569],[2238],[1237],[3583,799,2051,234],[179],[631,2688],[1003,100,938,2294,2530,104],[1565,1695],[1891,2580,39],[469,2959],[5631],[6807,91],[2971],[1245,3714,129],[5338],[1169],[5117,1819],[6577],[5072],[975,2904,2421],[613],[3565,626,2070],[134,2721,3875],[3302,1317],[3075],[367,1413],[723,518,133,237,108,191,267,66,286,664,424,1114,155,162,79,578,333,186,97,546],[1893],[6373],[3422],[5857],[2577],[552],[3147],[2016],[4260],[6750],[1053],[791],[5674],[712],[3586],[881,3579],[4484],[5505],[1247],[85,440,520,1165,1130,36,513,170,386,370,43,752,772,132,315,152],[4264],[4742],[6027],[2032],[6942],[3780],[3816],[1191],[1482,5295],[5852],[3188],[3990],[433],[3421],[1094],[6503],[495],[3919],[6623],[3641],[5664],[3235],[1148],[1006],[5188],[1545],[4002],[618],[718],[4402],[425,342,443,79,452,363,74,1473,777,499,780,1],[2199],[3766],[6879],[6193],[1015],[1095],[96,1109,2018],[889],[2019],[2247],[6502],[321],[5959],[1720,1625,482,271,1338,1268,4],[1785],[5356],[2706],[945],[5863],[4233],[3631],[1543],[778,740,578,1038,197,288,933,1446,23,51,648,1],[41,3619],[4339],[2058],[926],[1383],[27,3192],[5080],[3788],[160],[5841],[1314,584],[4531],[3508],[3989,2385],[572],[939],[768,444,2474,113,3069],[4458],[90],[554],[2644,2072,1227],[290],[2254,3612],[2897],[6071],[1862],[5322],[470],[64,2088],[4218],[3213],[432,78,1102,102,1079,445,1694,143,3,432,256,186,87,1,161,147],[3401],[5471],[5184],[5579],[956],[4242],[3070],[516,489,1485,919,552,363,995,1270],[4599],[5187],[3781],[2467],[159],[880],[1927],[3151],[4532],[2837,2896],[6650],[3037],[700],[2958],[2544],[3164],[1878],[816,2205,3872],[5944],[858],[1484],[5729],[5656],[3184],[2431],[354],[6544],[6127],[694],[3952],[1912,1571,3,214,62,354,763],[6487],[4243],[1208,3964],[5807],[5044],[6727],[392],[1399,968,1167],[3755],[1027,4547],[3028],[5328,227],[1062],[5821],[5570],[879],[1406],[1690],[5401],[2863],[4652],[838],[4498],[5693],[2755],[848],[5132],[3746],[626],[6244],[453,2631,1653,1444,332],[3018,236,515,2290,255,108],[3739],[3773],[2626,3893],[5480],[4946],[5890],[1055],[330],[5711],[3112],[184,4449,782,76],[5646],[502],[409,4596,1768],[2358],[5438],[4981],[3034],[6738],[1373,2881,528],[2036],[532,1208,2426,2198],[2743],[1764],[1973],[2080],[1312,3396],[732],[4271],[3406,643],[210],[1066],[2816],[912,1220,4652],[2812],[1141],[3567],[1736,1472,66,184,609,2879],[2149],[4442],[2692],[1,6506,98],[3625],[4351],[6820],[4293],[2142,4038],[6159],[6557],[2695],[4044,929],[5689],[3861],[958,1490],[750],[2208],[6734],[219,3906,2376],[4688],[3006],[2708],[637],[2762],[1597,2062],[6761],[524,280,1715,773,238,150,219],[6594],[2832],[395],[1184],[6680],[6276],[4673],[2119],[4436,2537],[579],[1726],[4925,1417],[3256],[5442],[4841],[1476,630,860,1853,488],[2786],[6472],[1106,4884],[1113],[1331],[3760],[4295],[6509],[4267],[2609,1779,981,92],[403],[3756],[1050,3407],[4560],[982],[2305],[4395],[39,2189,266,15,935,1047,145,43,73,797,517,322,405],[820,4002,1741,347],[1461],[2062],[3466],[6455],[6412],[1446],[1730],[741,1547,4551],[6400],[2589,3023],[1452],[1613,635,2185,798,277],[5878,455],[1731,4822],[1442],[6497],[568,2147],[4076,1172],[4663],[6194],[1557],[1415,2862],[1437],[2666,1455,1541],[5025],[2115],[1880,279],[5575,663],[6352],[3975,626,122,176,1913],[2357,3819],[1784],[277],[1280,3016],[2717,1156],[885,1425,2304],[6037],[607,4440],[2881,2578],[6410],[4370],[4712],[949],[6,476],[2293,433,99,454,208,109,1218],[5309],[869],[6051,409],[1353,4782],[5059],[5492],[3902],[1760,3890],[1591,4392],[4584,2378],[2797,2566,1210],[6221,380],[3118],[6699],[1592],[1211,382,122,27,1576,760,138,539,1251,463],[6360],[3087],[959],[4045],[4528],[5067],[2368],[4649],[4302],[4184],[6377],[1257],[6920],[2161,1234],[4404],[5885],[1044,1817,1164],[4348,2596],[5167],[4591],[6151],[6584],[3044],[5290],[2854,2425],[4640],[1673],[585],[5684],[5311],[980],[1936,281,326,3448],[3153],[14],[4800],[6190],[446],[1965],[1326],[6631],[2784],[3506],[4567],[2665],[5657],[62],[5098],[1134,18],[6241],[658,2171,2074],[6897],[1411],[2733],[1198,4536],[6895],[204],[5362],[562],[5754],[4843,1634],[104],[4435],[2768],[3870],[5297],[5136],[3490],[4200],[1176],[341],[2223,4575],[3948],[4848],[2424,2106],[289],[5525],[1435],[5536],[6926],[508],[246,4425],[4482],[5538],[3588],[1988],[1190],[1379],[894,3389,909,1738],[3797],[1174],[1656],[4831],[1304],[1618],[3316],[1274],[6070],[4492],[464],[6641],[1503],[3828],[213,1521],[336],[3809],[3201],[2385],[2162],[3114],[2252,3204],[5457],[1203],[3310],[149],[5440],[5997],[2057],[6546],[1377,1330],[3676],[2360],[343],[2373],[3375],[1194],[2331],[6389],[6645],[1217],[513],[2869],[6172],[1835,4245,574],[2948],[4090],[6567],[6063],[4954],[231],[456],[1624],[2694],[985,2363],[4470],[1994,1421],[5615],[3127],[2782,589,276,359,285,589,1528,525],[2313],[2026],[1299,1737,3118],[4785],[4160,484],[4313,770],[3681],[2938],[1346],[571,5273,591],[1821],[6015],[1457],[1342],[3076,2948],[6220],[1587],[3160],[78,2298,1641,1626],[2481],[3905],[6703],[978,4442],[1752,3378],[5381],[1769],[5302],[5982],[3472],[5476],[714],[5222],[1157,99,4655],[3913],[163],[2457],[309],[2976],[4895],[243,1748,1503,3263],[1609],[5409],[5798],[4490],[6535],[171],[6265],[89],[5927,730],[4922],[4354],[13],[5051],[1459],[414],[4027],[3374],[1675],[1666],[2234],[3726],[1809,137],[1775],[673],[5253],[5571,81,836,197],[345],[5934],[1168,2869],[6547],[987],[6384],[5120],[3299],[2033],[2406,2719],[3643],[5792],[4949,731],[998],[1799,329,3197],[3708],[5556],[3353],[6695],[1874],[1669],[4151],[1661],[2598,2769],[3663],[4014],[740,5739],[462],[1188],[1692],[192,3481,345,192,889],[2710],[119,408],[474,586],[655],[810],[2156],[5563],[3503,1245],[3568,1596],[2527,1458],[2766],[1628,3249,1],[2521,3047],[101,1977],[4871],[451,1663,306,1549,1730],[5703],[6207],[221],[2596],[5764],[5014],[6619],[1940],[5697],[128],[5916],[6928],[6637],[3080],[2264],[2135],[6230],[2318,606],[388],[6970],[3410],[1490],[2696],[6387],[852],[1473,480,951,592],[2047,413],[4977,897],[503,3194],[6692],[1657],[4678],[6851],[3228],[1475],[5601],[1724],[3174],[391],[6975],[2193],[2322],[6297],[6379],[87],[3388,1666],[6929],[3793],[4562],[58],[4684],[772],[2301,1092,1763],[3382],[4548],[6083],[1709],[748,2596],[4500],[3125,115,1578,1154],[1859],[6760],[2714,3046],[4715],[6450],[544],[2677,240,3252],[2983],[4613],[706],[1653],[1816],[969],[4032],[4578,1712],[340],[1842],[4153,1351],[286,1011,2924],[1224],[2488],[3071],[1907],[319],[5020],[169],[2136],[5379],[3745],[6978],[6655],[2479],[1472],[1872],[6338],[4397],[2681],[4990],[671],[6467],[1808,1729,3448],[1139],[5385],[5236,1081],[1362],[6372],[4513],[6047],[6141],[4550],[1689],[697,1247,407],[840],[6635],[54],[4452],[1712],[3182,2047],[2632],[5751],[5486],[3856,2243,385],[4735],[3172],[766],[5979],[3574],[3009],[3357],[2913,3798],[3864],[4406],[2445,1691],[3778],[4237],[3549],[4488],[16],[2679],[5584],[3413],[2275],[84,1749,1290,81,43,962,802,1205,414],[644],[1554,1563],[2757,2457],[4375],[2697],[4149,1757],[8,899,937,392],[2775],[4461],[5346],[1718,63,715,3208],[2461,1137],[5532],[284,160,2314,578,522,219,573,195],[4706],[1199,4212],[6191],[2174,2650],[715,2866],[3081,1862],[2522,1659,1442],[2704,3749,430],[1164,1439,2155,1394],[537,1425,314,135,4427],[6725,45],[897],[94,3786],[514,2020,544,1717],[2949,105,2644],[1992,101],[1920,1324,1282],[452,205,3038,1593,1022,166],[373,1542,775,4169],[431,2718],[295],[1261,364,758,757,239,2852],[137,181,1218,93,3753],[1698,2515,1636,379],[355,469,2923,2162],[5140,478],[1696,159,539,21,290,1314,1354,544],[63,2057,2078],[672,1015,244,1504],[315,5203],[3293,2939,220],[588,690],[187,2166,2812,1296],[2486,67,3466],[506,985,257,38,285,4463],[603,1925,1375,519,199,561,21,1436],[3736],[1201,208,2718,1804,643],[2525,2700],[2042,1087],[436,1184,240,265,155,436,3916],[2222,4610],[1132,522,4222],[2157,1575,2021,348,362,459],[2845,595,20,2225],[201,164,3123,498,122,32,462,67],[2133],[1935,79,488,382,367],[4847],[92,1233,1003,94,1856,471],[261,350,641,1546],[2296,1395,292,1543],[483,3040,151,2960,290],[2752,191,1057,2137],[5199],[569,40,885,177,30,966,78,1503,257,949,76,535,538],[4873,333],[285,3761,1765],[1499,2178],[2249,80,2781,1472],[2821,1003,959,1771],[4978],[1272,1576,53,1075],[1721,4844],[4431],[99,856,2910,223],[275,600,2105,670,284],[830,5740],[1427,3188],[2895,1200,528],[3959,413,728],[866,3931],[3236],[996],[683],[3930],[6520],[1414],[1876],[2365],[2774],[3109],[1664],[4965],[3264],[1942],[1024,3257,2541],[5719],[4727],[6104],[5542],[3602],[5462],[6697],[2084],[1500],[38,3054],[146,873,1,707,52,137,1822,2075,204,417,193,227],[257],[3385],[2303],[764,765,1426],[5739],[4988],[1026,1273,4531],[6754],[3941],[3830],[5594],[5968],[1035],[368,213,213,1469,798,187,1691,886,242,586],[1616,2750],[4705,1320,913],[195,3196,1575,91,1629],[717,2757,565,71],[1771,819,3733],[151,2317,1144],[2506],[4477],[211,1133,3900],[2783,698,2481,208,742],[1818,3264],[743,2850,2327],[1366,396,883],[988,1015,1903,196],[782,598,1491,751,198,648,755,61,780],[2250,2667],[234,232,556,1033,801],[2601],[3634],[418,293,111,1369,24,864,631,700,552,1812],[1048,1278,1520,2349],[1386,80,1099,2526,1637],[2497,3959],[499],[2953,169,3749],[255,1646],[348,5300],[771,399,2621,785,1953],[679,312,1853,287,840,1091,1525],[1825,1595],[69,74,620,684,5045],[6664],[1277,1704],[976,71,4812],[762],[653,2624,1034,2199],[147,3043,544,331],[4611,555],[826,975,2124,873,1250,9,521,353],[1680,111,806,2645],[2927,271,1207,1114],[2040,568,856,1591],[621,3447],[79,1735,239,3934],[2936,2663],[1029,1886,3989],[901,561,1729,966],[1601,1083,405,3264],[56,322,443,582,47,75,1105,26,107,1088,116,317,127,61,851,302,46,115,836,157,73],[1839,684,197,83,2913],[4595,1060,299],[271,1407,2464],[158,146,3533,1195,81],[3094,2790],[990,405,4823],[74,1380,295,116,2247,2547],[473,1465,1647,1594,115],[6298],[967,1349,258,2544,1819],[3589,1076],[1520,1337],[2964,1197,641],[3363,135,2641],[3043,2118,391],[1468,2169,2372,292],[2229,1491],[850,1055,1646],[102,1438],[757,6166],[1783,2474,903],[1708,853,3077,85,72],[788,4285],[686,1414,3528,698],[3881,242,2342],[33,90,476,2170,2782,1334],[2464,1492,72,1167,61,1105,384],[4775],[36,792,49,541,2218,495,614,344,955,569,94],[5619,344],[279,780,2041],[688,2422,611],[3818,234],[1283,1277,988,851,2058],[2259,554,777,3213],[3800,925,581],[407,33,498,199,891,167,44,2188,618,948,739],[5340],[1975,490,4411],[358,2480,341,2796,634],[896,2318],[485,3386,2798],[1338,1235,1763],[1645],[399,622,349,2240],[4983],[3694,501,545,170,205],[270],[5789],[460],[3360],[1575],[1987],[6094],[5318],[4499],[2453],[2204],[3844],[3049],[5573],[5928],[4172],[1563],[32],[1923],[6279],[6217],[4536],[6943],[3754],[266],[3572],[5004],[6157],[6283],[454,577,2294],[1652],[5481],[5839],[2359],[4696],[5690],[601,15,157,2,18,225,74,347,337,19,116,70,101,655,278,271,83,81,1,162,283,309,156,787,348,289,468,93,199],[1360,1696,2509,184,1019],[632,899],[223,1888,2204,1011],[3142,290,701],[5595],[3234,2080,901],[1552,690,1317],[308,325,2306],[1228,545,588,1184,123,265,1301],[586],[4384,1782],[1551,1465,1161,2079],[1831,1464,1567,489],[5846,332,344,284],[2382,605,421,195,346,135,1155,1068],[2606,1912],[4379,773,1812],[5731],[1889,1625,345,1028],[2998,2297,89],[1282,3360],[263,1713,644,1627,539],[142,1419,802,1926,48],[2438,3195],[560,2457],[2123,2250],[1112,300,3541,142,283,224],[438,254,239,1604,293,534,2303],[2501,121,758],[1359,4165],[681,401],[1469,1731,111,1729,897,865],[2151,3754],[5261,1109],[5434],[316,1287,200,466,551,1665,728,548],[812,3417,435,1234],[2723,2855],[1355],[5334,1245],[5084,94,1671],[1284,3879,736],[1792,3635,868],[10,122,450,504,708,601,265,1007,560,497,646,957,581],[372,859],[5313],[1887,3721],[2312,673],[2154,4116,546],[108,5435],[68,4250],[256,1133,2666],[1117,730,4824],[109,2559,644,1258,463,473,265,150],[1043,3431],[4587],[2469],[2173],[2144],[660,260],[6810,89],[1686,1105,1752,533,368,1496],[935,1538],[2550,2789],[2289],[1387,252,3000,1180,386],[2048,1230,3136,26],[250,3334,3330],[4919,261],[3785,2906],[2689,1362],[411,2051,860,185,2924],[520,1227],[518,5774],[152,538,1642,1636,2896],[704,514,3939,1246],[1463,2058],[120,5782],[5668],[1677,1985,1115],[357,990,1025,263,263,2062,569],[3555,45,1755],[3284],[202,5151],[497,2932],[81,1451,1187,973,1276],[3062],[3499,2327,348],[1526,40,3063],[1268],[5778],[3543],[5433],[6189],[2072],[3271],[6421],[2085],[331,518,202,144,1724,1248,467,1078,249,165],[1836],[1102,2226,1410],[2991],[6739],[1496,1523],[1116],[1313,3016],[198,2016,174,638,1312,1078,312],[6737],[6076],[1765],[4709],[2037],[1998,3524],[733,153],[4272],[2],[6213],[913],[3209,3156],[398],[1728],[323],[708,1144],[542],[1479,258],[2611,2090],[2709],[795,1387,4566,211],[2143],[3211],[4703,271],[220,1867,3221],[3628,498],[3459],[1598]],"ranks":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1091,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1211,1212,1213,1214,1215,1216,1217,1218,1219,1220,1221,1222,1223,1224,1225,1226,1227,1228,1229,1230,1231,1232,1233,1234,1235,1236,1237,1238,1239,1240,1241,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1278,1279,1280,1281,1282,1283,1284,1285,1286,1287,1288,1289,1290,1291,1292,1293,1294,1295,1296,1297,1298,1299,1300,1301,1302,1303,1304,1305,1306,1307,1308,1309,1310,1311,1312,1313,1314,1315,1316,1317,1318,1319,1320,1321,1322,1323,1324,1325,1326,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1357,1358,1359,1360,1361,1362,1363,1364,1365,1366,1367,1368,1369,1370,1371,1372,1373,1374,1375,1376,1377,1378,1379,1380,1381,1382,1383,1384,1385,1386,1387,1388,1389,1390,1391,1392,1393,1394,1395,1396,1397,1398,1399,1400,1401,1402,1403,1404,1405,1406,1407,1408,1409,1410,1411,1412,1413,1414,1415,1416,1417,1418,1419,1420,1421,1422,1423,1424,1425,1426,1427,1428,1429,1430,1431,1432,1433,1434,1435,1436,1437,1438,1439,1440,1441,1442,1443,1444,1445,1446,1447,1448,1449,1450,1451,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1466,1467,1468,1469,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1482,1483,1484,1485,1486,1487,1488,1489,1490,1491,1492,1493,1494,1495,1496,1497,1498,1499,1500,1501,1502,1503,1504,1505,1506,1507,1508,1509,1510,1511,1512,1513,1514,1515,1516,1517,1518,1519,1520,1521,1522,1523,1524,1525,1526,1527,1528,1529,1530,1531,1532,1533,1534,1535,1536,1537,1538,1539,1540,1541,1542,1543,1544,1545,1546,1547,1548,1549,1550,1551,1552,1553,1554,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1570,1571,1572,1573,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1590,1591,1592,1593,1594,1595,1596,1597,1598,1599,1600,1601,1602,1603,1604,1605,1606,1607,1608,1609,1610,1611,1612,1613,1614,1615,1616,1617,1618,1619,1620,1621,1622,1623,1624,1625,1626,1627,1628,1629,1630,1631,1632,1633,1634,1635,1636,1637,1638,1639,1640,1641,1642,1643,1644,1645,1646,1647,1648,1649,1650,1651,1652,1653,1654,1655,1656,1657,1658,1659,1660,1661,1662,1663,1664,1665,1666,1667,1668,1669,1670,1671,1672,1673,1674,1675,1676,1677,1678,1679,1680,1681,1682,1683,1684,1685,1686,1687,1688,1689,1690,1691,1692,1693,1694,1695,1696,1697,1698,1699,1700,1701,1702,1703,1704,1705,1706,1707,1708,1709,1710,1711,1712,1713,1714,1715,1716,1717,1718,1719,1720,1721,1722,1723,1724,1725,1726,1727,1728,1729,1730,1731,1732,1733,1734,1735,1736,1737,1738,1739,1740,1741,1742,1743,1744,1745,1746,1747,1748,1749,1750,1751,1752,1753,1754,1755,1756,1757,1758,1759,1760,1761,1762,1763,1764,1765,1766,1767,1768,1769,1770,1771,1772,1773,1774,1775,1776,1777,1778,1779,1780,1781,1782,1783,1784,1785,1786,1787,1788,1789,1790,1791,1792,1793,1794,1795,1796,1797,1798,1799,1800,1801,1802,1803,1804,1805,1806,1807,1808,1809,1810,1811,1812,1813,1814,1815,1816,1817,1818,1819,1820,1821,1822,1823,1824,1825,1826,1827,1828,1829,1830,1831,1832,1833,1834,1835,1836,1837,1838,1839,1840,1841,1842,1843,1844,1845,1846,1847,1848,1849,1850,1851,1852,1853,1854,1855,1856,1857,1858,1859,1860,1861,1862,1863,1864,1865,1866,1867,1868,1869,1870,1871,1872,1873,1874,1875,1876,1877,1878,1879,1880,1881,1882,1883,1884,1885,1886,1887,1888,1889,1890,1891,1892,1893,1894,1895,1896,1897,1898,1899,1900,1901,1902,1903,1904,1905,1906,1907,1908,1909,1910,1911,1912,1913,1914,1915,1916,1917,1918,1919,1920,1921,1922,1923,1924,1925,1926,1927,1928,1929,1930,1931,1932,1933,1934,1935,1936,1937,1938,1939,1940,1941,1942,1943,1944,1945,1946,1947,1948,1949,1950,1951,1952,1953,1954,1955,1956,1957,1958,1959,1960,1961,1962,1963,1964,1965,1966,1967,1968,1969,1970,1971,1972,1973,1974,1975,1976,1977,1978,1979,1980,1981,1982,1983,1984,1985,1986,1987,1988,1989,1990,1991,1992,1993,1994,1995,1996,1997,1998,1999,2000,2001,2002,2003,2004,2005,2006,2007,2008,2009,2010,2011,2012,2013,2014,2015,2016,2017,2018,2019,2020,2021,2022,2023,2024,2025,2026,2027,2028,2029,2030,2031,2032,2033,2034,2035,2036,2037,2038,2039,2040,2041,2042,2043,2044,2045,2046,2047,2048,2049,2050,2051,2052,2053,2054,2055,2056,2057,2058,2059,2060,2061,2062,2063,2064,2065,2066,2067,2068,2069,2070,2071,2072,2073,2074,2075,2076,2077,2078,2079,2080,2081,2082,2083,2084,2085,2086,2087,2088,2089,2090,2091,2092,2093,2094,2095,2096,2097,2098,2099,2100,2101,2102,2103,2104,2105,2106,2107,2108,2109,2110,2111,2112,2113,2114,2115,2116,2117,2118,2119,2120,2121,2122,2123,2124,2125,2126,2127,2128,2129,2130,2131,2132,2133,2134,2135,2136,2137,2138,2139,2140,2141,2142,2143,2144,2145,2146,2147,2148,2149,2150,2151,2152,2153,2154,2155,2156,2157,2158,2159,2160,2161,2162,2163,2164,2165,2166,2167,2168,2169,2170,2171,2172,2173,2174,2175,2176,2177,2178,2179,2180,2181,2182,2183,2184,2185,2186,2187,2188,2189,2190,2191,2192,2193,2194,2195,2196,2197,2198,2199,2200,2201,2202,2203,2204,2205,2206,2207,2208,2209,2210,2211,2212,2213,2214,2215,2216,2217,2218,2219,2220,2221,2222,2223,2224,2225,2226,2227,2228,2229,2230,2231,2232,2233,2234,2235,2236,2237,2238,2239,2240,2241,2242,2243,2244,2245,2246,2247,2248,2249,2250,2251,2252,2253,2254,2255,2256,2257,2258,2259,2260,2261,2262,2263,2264,2265,2266,2267,2268,2269,2270,2271,2272,2273,2274,2275,2276,2277,2278,2279,2280,2281,2282,2283,2284,2285,2286,2287,2288,2289,2290,2291,2292,2293,2294,2295,2296,2297,2298,2299,2300,2301,2302,2303,2304,2305,2306,2307,2308,2309,2310,2311,2312,2313,2314,2315,2316,2317,2318,2319,2320,2321,2322,2323,2324,2325,2326,2327,2328,2329,2330,2331,2332,2333,2334,2335,2336,2337,2338,2339,2340,2341,2342,2343,2344,2345,2346,2347,2348,2349,2350,2351,2352,2353,2354,2355,2356,2357,2358,2359,2360,2361,2362,2363,2364,2365,2366,2367,2368,2369,2370,2371,2372,2373,2374,2375,2376,2377,2378,2379,2380,2381,2382,2383,2384,2385,2386,2387,2388,2389,2390,2391,2392,2393,2394,2395,2396,2397,2398,2399,2400,2401,2402,2403,2404,2405,2406,2407,2408,2409,2410,2411,2412,2413,2414,2415,2416,2417,2418,2419,2420,2421,2422,2423,2424,2425,2426,2427,2428,2429,2430,2431,2432,2433,2434,2435,2436,2437,2438,2439,2440,2441,2442,2443,2444,2445,2446,2447,2448,2449,2450,2451,2452,2453,2454,2455,2456,2457,2458,2459,2460,2461,2462,2463,2464,2465,2466,2467,2468,2469,2470,2471,2472,2473,2474,2475,2476,2477,2478,2479,2480,2481,2482,2483,2484,2485,2486,2487,2488,2489,2490,2491,2492,2493,2494,2495,2496,2497,2498,2499,2500,2501,2502,2503,2504,2505,2506,2507,2508,2509,2510,2511,2512,2513,2514,2515,2516,2517,2518,2519,2520,2521,2522,2523,2524,2525,2526,2527,2528,2529,2530,2531,2532,2533,2534,2535,2536,2537,2538,2539,2540,2541,2542,2543,2544,2545,2546,2547,2548,2549,2550,2551,2552,2553,2554,2555,2556,2557,2558,2559,2560,2561,2562,2563,2564,2565,2566,2567,2568,2569,2570,2571,2572,2573,2574,2575,2576,2577,2578,2579,2580,2581,2582,2583,2584,2585,2586,2587,2588,2589,2590,2591,2592,2593,2594,2595,2596,2597,2598,2599,2600,2601,2602,2603,2604,2605,2606,2607,2608,2609,2610,2611,2612,2613,2614,2615,2616,2617,2618,2619,2620,2621,2622,2623,2624,2625,2626,2627,2628,2629,2630,2631,2632,2633,2634,2635,2636,2637,2638,2639,2640,2641,2642,2643,2644,2645,2646,2647,2648,2649,2650,2651,2652,2653,2654,2655,2656,2657,2658,2659,2660,2661,2662,2663,2664,2665,2666,2667,2668,2669,2670,2671,2672,2673,2674,2675,2676,2677,2678,2679,2680,2681,2682,2683,2684,2685,2686,2687,2688,2689,2690,2691,2692,2693,2694,2695,2696,2697,2698,2699,2700,2701,2702,2703,2704,2705,2706,2707,2708,2709,2710,2711,2712,2713,2714,2715,2716,2717,2718,2719,2720,2721,2722,2723,2724,2725,2726,2727,2728,2729,2730,2731,2732,2733,2734,2735,2736,2737,2738,2739,2740,2741,2742,2743,2744,2745,2746,2747,2748,2749,2750,2751,2752,2753,2754,2755,2756,2757,2758,2759,2760,2761,2762,2763,2764,2765,2766,2767,2768,2769,2770,2771,2772,2773,2774,2775,2776,2777,2778,2779,2780,2781,2782,2783,2784,2785,2786,2787,2788,2789,2790,2791,2792,2793,2794,2795,2796,2797,2798,2799,2800,2801,2802,2803,2804,2805,2806,2807,2808,2809,2810,2811,2812,2813,2814,2815,2816,2817,2818,2819,2820,2821,2822,2823,2824,2825,2826,2827,2828,2829,2830,2831,2832,2833,2834,2835,2836,2837,2838,2839,2840,2841,2842,2843,2844,2845,2846,2847,2848,2849,2850,2851,2852,2853,2854,2855,2856,2857,2858,2859,2860,2861,2862,2863,2864,2865,2866,2867,2868,2869,2870,2871,2872,2873,2874,2875,2876,2877,2878,2879,2880,2881,2882,2883,2884,2885,2886,2887,2888,2889,2890,2891,2892,2893,2894,2895,2896,2897,2898,2899,2900,2901,2902,2903,2904,2905,2906,2907,2908,2909,2910,2911,2912,2913,2914,2915,2916,2917,2918,2919,2920,2921,2922,2923,2924,2925,2926,2927,2928,2929,2930,2931,2932,2933,2934,2935,2936,2937,2938,2939,2940,2941,2942,2943,2944,2945,2946,2947,2948,2949,2950,2951,2952,2953,2954,2955,2956,2957,2958,2959,2960,2961,2962,2963,2964,2965,2966,2967,2968,2969,2970,2971,2972,2973,2974,2975,2976,2977,2978,2979,2980,2981,2982,2983,2984,2985,2986,2987,2988,2989,2990,2991,2992,2993,2994,2995,2996,2997,2998,2999,3000,3001,3002,3003,3004,3005,3006,3007,3008,3009,3010,3011,3012,3013,3014,3015,3016,3017,3018,3019,3020,3021,3022,3023,3024,3025,3026,3027,3028,3029,3030,3031,3032,3033,3034,3035,3036,3037,3038,3039,3040,3041,3042,3043,3044,3045,3046,3047,3048,3049,3050,3051,3052,3053,3054,3055,3056,3057,3058,3059,3060,3061,3062,3063,3064,3065,3066,3067,3068,3069,3070,3071,3072,3073,3074,3075,3076,3077,3078,3079,3080,3081,3082,3083,3084,3085,3086,3087,3088,3089,3090,3091,3092,3093,3094,3095,3096,3097,3098,3099,3100,3101,3102,3103,3104,3105,3106,3107,3108,3109,3110,3111,3112,3113,3114,3115,3116,3117,3118,3119,3120,3121,3122,3123,3124,3125,3126,3127,3128,3129,3130,3131,3132,3133,3134,3135,3136,3137,3138,3139,3140,3141,3142,3143,3144,3145,3146,3147,3148,3149,3150,3151,3152,3153,3154,3155,3156,3157,3158,3159,3160,3161,3162,3163,3164,3165,3166,3167,3168,3169,3170,3171,3172,3173,3174,3175,3176,3177,3178,3179,3180,3181,3182,3183,3184,3185,3186,3187,3188,3189,3190,3191,3192,3193,3194,3195,3196,3197,3198,3199,3200,3201,3202,3203,3204,3205,3206,3207,3208,3209,3210,3211,3212,3213,3214,3215,3216,3217,3218,3219,3220,3221,3222,3223,3224,3225,3226,3227,3228,3229,3230,3231,3232,3233,3234,3235,3236,3237,3238,3239,3240,3241,3242,3243,3244,3245,3246,3247,3248,3249,3250,3251,3252,3253,3254,3255,3256,3257,3258,3259,3260,3261,3262,3263,3264,3265,3266,3267,3268,3269,3270,3271,3272,3273,3274,3275,3276,3277,3278,3279,3280,3281,3282,3283,3284,3285,3286,3287,3288,3289,3290,3291,3292,3293,3294,3295,3296,3297,3298,3299,3300,3301,3302,3303,3304,3305,3306,3307,3308,3309,3310,3311,3312,3313,3314,3315,3316,3317,3318,3319,3320,3321,3322,3323,3324,3325,3326,3327,3328,3329,3330,3331,3332,3333,3334,3335,3336,3337,3338,3339,3340,3341,3342,3343,3344,3345,3346,3347,3348,3349,3350,3351,3352,3353,3354,3355,3356,3357,3358,3359,3360,3361,3362,3363,3364,3365,3366,3367,3368,3369,3370,3371,3372,3373,3374,3375,3376,3377,3378,3379,3380,3381,3382,3383,3384,3385,3386,3387,3388,3389,3390,3391,3392,3393,3394,3395,3396,3397,3398,3399,3400,3401,3402,3403,3404,3405,3406,3407,3408,3409,3410,3411,3412,3413,3414,3415,3416,3417,3418,3419,3420,3421,3422,3423,3424,3425,3426,3427,3428,3429,3430,3431,3432,3433,3434,3435,3436,3437,3438,3439,3440,3441,3442,3443,3444,3445,3446,3447,3448,3449,3450,3451,3452,3453,3454,3455,3456,3457,3458,3459,3460,3461,3462,3463,3464,3465,3466,3467,3468,3469,3470,3471,3472,3473,3474,3475,3476,3477,3478,3479,3480,3481,3482,3483,3484,3485,3486,3487,3488,3489,3490,3491,3492,3493,3494,3495,3496,3497,3498,3499,3500,3501,3502,3503,3504,3505,3506,3507,3508,3509,3510,3511,3512,3513,3514,3515,3516,3517,3518,3519,3520,3521,3522,3523,3524,3525,3526,3527,3528,3529,3530,3531,3532,3533,3534,3535,3536,3537,3538,3539,3540,3541,3542,3543,3544,3545,3546,3547,3548,3549,3550,3551,3552,3553,3554,3555,3556,3557,3558,3559,3560,3561,3562,3563,3564,3565,3566,3567,3568,3569,3570,3571,3572,3573,3574,3575,3576,3577,3578,3579,3580,3581,3582,3583,3584,3585,3586,3587,3588,3589,3590,3591,3592,3593,3594,3595,3596,3597,3598,3599,3600,3601,3602,3603,3604,3605,3606,3607,3608,3609,3610,3611,3612,3613,3614,3615,3616,3617,3618,3619,3620,3621,3622,3623,3624,3625,3626,3627,3628,3629,3630,3631,3632,3633,3634,3635,3636,3637,3638,3639,3640,3641,3642,3643,3644,3645,3646,3647,3648,3649,3650,3651,3652,3653,3654,3655,3656,3657,3658,3659,3660,3661,3662,3663,3664,3665,3666,3667,3668,3669,3670,3671,3672,3673,3674,3675,3676,3677,3678,3679,3680,3681,3682,3683,3684,3685,3686,3687,3688,3689,3690,3691,3692,3693,3694,3695,3696,3697,3698,3699,3700,3701,3702,3703,3704,3705,3706]},"RESULT":{"counts":[6987],"rows":[[0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]],"ranks":[0]}}};
@@ -1,6362 +1 @@
-const emacs2026Schedule = [
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 1,
-    "time": "08:30",
-    "desc": "400 m 400 m Heats M35"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 1,
-    "time": "08:54",
-    "desc": "400 m 400 m Heats M40"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 1,
-    "time": "09:00",
-    "desc": "Long Jump W80+ Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 1,
-    "time": "09:00",
-    "desc": "Long Jump W80+ Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 1,
-    "time": "09:00",
-    "desc": "Long Jump W80+ Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 1,
-    "time": "09:00",
-    "desc": "Long Jump W80+ Final"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 1,
-    "time": "09:00",
-    "desc": "Hammer M35 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 1,
-    "time": "09:30",
-    "desc": "400 m 400 m Heats M45"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 1,
-    "time": "10:20",
-    "desc": "Long Jump W75 Final"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 1,
-    "time": "10:00",
-    "desc": "Hammer M40 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 1,
-    "time": "10:00",
-    "desc": "400 m 400 m Heats M50"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 1,
-    "time": "11:30",
-    "desc": "Long Jump W70 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 1,
-    "time": "10:20",
-    "desc": "400 m 400 m Heats M55"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 1,
-    "time": "13:00",
-    "desc": "Long Jump W65 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 1,
-    "time": "10:50",
-    "desc": "400 m 400 m Heats M60"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 1,
-    "time": "14:40",
-    "desc": "Long Jump W60 Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 1,
-    "time": "11:30",
-    "desc": "Weight Throw M45 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 1,
-    "time": "11:26",
-    "desc": "400 m 400 m Heats M65"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 1,
-    "time": "12:50",
-    "desc": "Weight Throw M50 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 1,
-    "time": "11:50",
-    "desc": "400 m 400 m Heats M70"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 1,
-    "time": "14:20",
-    "desc": "Weight Throw M55 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 1,
-    "time": "12:10",
-    "desc": "400 m 400 m Heats M75"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 1,
-    "time": "16:00",
-    "desc": "Weight Throw M60 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 1,
-    "time": "12:34",
-    "desc": "400 m 400 m Heats W35"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 1,
-    "time": "12:58",
-    "desc": "400 m 400 m Heats W40"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 1,
-    "time": "09:00",
-    "desc": "High Jump W65 Final"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 1,
-    "time": "10:45",
-    "desc": "High Jump W60 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 1,
-    "time": "13:22",
-    "desc": "3000 m 3000 m Final W65+"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 1,
-    "time": "13:22",
-    "desc": "3000 m 3000 m Final W65+"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 1,
-    "time": "13:22",
-    "desc": "3000 m 3000 m Final W65+"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 1,
-    "time": "13:22",
-    "desc": "3000 m 3000 m Final W65+"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 1,
-    "time": "13:22",
-    "desc": "3000 m 3000 m Final W65+"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 1,
-    "time": "13:22",
-    "desc": "3000 m 3000 m Final W65+"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 1,
-    "time": "13:22",
-    "desc": "3000 m 3000 m Final W65+"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 1,
-    "time": "12:30",
-    "desc": "High Jump W55 Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 1,
-    "time": "09:00",
-    "desc": "Discus W35 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 1,
-    "time": "13:50",
-    "desc": "3000 m 3000 m Final W60"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 1,
-    "time": "14:00",
-    "desc": "High Jump W50 Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 1,
-    "time": "10:10",
-    "desc": "Discus W40 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 1,
-    "time": "14:13",
-    "desc": "3000 m 3000 m Final W55"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 1,
-    "time": "15:30",
-    "desc": "High Jump W45 Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 1,
-    "time": "11:45",
-    "desc": "Discus W45 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 1,
-    "time": "14:35",
-    "desc": "3000 m 3000 m Final W50"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 1,
-    "time": "17:00",
-    "desc": "High Jump W40 Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 1,
-    "time": "13:05",
-    "desc": "Discus W50 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 1,
-    "time": "14:55",
-    "desc": "3000 m 3000 m Final W45"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 1,
-    "time": "14:20",
-    "desc": "Discus W55 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 1,
-    "time": "15:10",
-    "desc": "3000 m 3000 m Final W40"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 1,
-    "time": "15:50",
-    "desc": "Discus W60 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 1,
-    "time": "15:25",
-    "desc": "3000 m 3000 m Final W35"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 1,
-    "time": "15:40",
-    "desc": "3000 m 3000 m Final M80+"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 1,
-    "time": "15:40",
-    "desc": "3000 m 3000 m Final M80+"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 1,
-    "time": "15:40",
-    "desc": "3000 m 3000 m Final M80+"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 1,
-    "time": "15:40",
-    "desc": "3000 m 3000 m Final M80+"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 1,
-    "time": "16:07",
-    "desc": "3000 m 3000 m Final M75"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 1,
-    "time": "09:00",
-    "desc": "High Jump M60 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 1,
-    "time": "16:32",
-    "desc": "3000 m 3000 m Final M70"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 1,
-    "time": "11:30",
-    "desc": "High Jump M55 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 1,
-    "time": "11:00",
-    "desc": "Javelin M90 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 1,
-    "time": "16:56",
-    "desc": "3000 m 3000 m Final M65"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 1,
-    "time": "13:30",
-    "desc": "High Jump M50 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 1,
-    "time": "11:50",
-    "desc": "Javelin M80-85 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 1,
-    "time": "11:50",
-    "desc": "Javelin M80-85 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 1,
-    "time": "17:18",
-    "desc": "3000 m 3000 m Final M60"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 1,
-    "time": "15:15",
-    "desc": "High Jump M45 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 1,
-    "time": "13:30",
-    "desc": "Javelin M75 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 1,
-    "time": "17:37",
-    "desc": "3000 m 3000 m Final M55"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 1,
-    "time": "16:45",
-    "desc": "High Jump M40 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 1,
-    "time": "14:45",
-    "desc": "Javelin M70 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 1,
-    "time": "17:54",
-    "desc": "3000 m 3000 m Final A M50"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 1,
-    "time": "18:30",
-    "desc": "High Jump M35 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 1,
-    "time": "16:20",
-    "desc": "Javelin M65 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 1,
-    "time": "18:11",
-    "desc": "3000 m 3000 m Final B M50"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 1,
-    "time": "18:27",
-    "desc": "3000 m 3000 m Final A M45"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 1,
-    "time": "18:43",
-    "desc": "3000 m 3000 m Final B M45"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 1,
-    "time": "18:59",
-    "desc": "3000 m 3000 m Final M40"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 1,
-    "time": "09:00",
-    "desc": "High Jump W35 Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 1,
-    "time": "19:14",
-    "desc": "3000 m 3000 m Final A M35"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 1,
-    "time": "10:05",
-    "desc": "High Jump M85+ Final"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 1,
-    "time": "10:05",
-    "desc": "High Jump M85+ Final"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 1,
-    "time": "10:05",
-    "desc": "High Jump M85+ Final"
-  },
-  {
-    "eventCode": "3000",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 1,
-    "time": "19:30",
-    "desc": "3000 m 3000 m Final B M35"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 1,
-    "time": "11:25",
-    "desc": "High Jump M80 Final"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 1,
-    "time": "12:40",
-    "desc": "High Jump M75 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 1,
-    "time": "19:45",
-    "desc": "RW 3000m RW Final W70+"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 1,
-    "time": "19:45",
-    "desc": "RW 3000m RW Final W70+"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 1,
-    "time": "19:45",
-    "desc": "RW 3000m RW Final W70+"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 1,
-    "time": "19:45",
-    "desc": "RW 3000m RW Final W70+"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 1,
-    "time": "19:45",
-    "desc": "RW 3000m RW Final W70+"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 1,
-    "time": "19:45",
-    "desc": "RW 3000m RW Final W70+"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 1,
-    "time": "14:25",
-    "desc": "High Jump M70 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 1,
-    "time": "20:25",
-    "desc": "RW 3000m RW Final W65"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 1,
-    "time": "16:30",
-    "desc": "High Jump M65 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 1,
-    "time": "20:55",
-    "desc": "RW 3000m RW Final M75"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 1,
-    "time": "21:28",
-    "desc": "RW 3000m RW Final M80+"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 1,
-    "time": "21:28",
-    "desc": "RW 3000m RW Final M80+"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 1,
-    "time": "21:28",
-    "desc": "RW 3000m RW Final M80+"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 1,
-    "time": "21:28",
-    "desc": "RW 3000m RW Final M80+"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 2,
-    "time": "09:00",
-    "desc": "60m 60m hurdles Heats W35"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 2,
-    "time": "09:11",
-    "desc": "60m 60m hurdles Heats W40"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 2,
-    "time": "09:00",
-    "desc": "Long Jump M40 Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 2,
-    "time": "09:00",
-    "desc": "Weight Throw M75 Final"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 2,
-    "time": "09:21",
-    "desc": "60m 60m hurdles Heats W45"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 2,
-    "time": "11:00",
-    "desc": "Long Jump W35 Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 2,
-    "time": "10:25",
-    "desc": "Weight Throw M80+ Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 2,
-    "time": "10:25",
-    "desc": "Weight Throw M80+ Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 2,
-    "time": "10:25",
-    "desc": "Weight Throw M80+ Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 2,
-    "time": "10:25",
-    "desc": "Weight Throw M80+ Final"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 2,
-    "time": "09:32",
-    "desc": "60m 60m hurdles Heats W50"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 2,
-    "time": "12:25",
-    "desc": "Long Jump W40 Final"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 2,
-    "time": "09:47",
-    "desc": "60m 60m hurdles Heats W55"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 2,
-    "time": "14:05",
-    "desc": "Long Jump W45 Final"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 2,
-    "time": "09:58",
-    "desc": "60m 60m hurdles Heats W60"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 2,
-    "time": "15:20",
-    "desc": "Long Jump W50 Final"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 2,
-    "time": "12:10",
-    "desc": "Hammer W35 Final"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 2,
-    "time": "10:08",
-    "desc": "60m 60m hurdles Heats W65"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 2,
-    "time": "17:05",
-    "desc": "Long Jump W55 Final"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 2,
-    "time": "13:25",
-    "desc": "Hammer W40 Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 2,
-    "time": "18:40",
-    "desc": "Long Jump M35 Final"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 2,
-    "time": "14:45",
-    "desc": "Hammer W45 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 2,
-    "time": "10:20",
-    "desc": "400 m 400 m SF M35"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 2,
-    "time": "16:00",
-    "desc": "Hammer W50 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 2,
-    "time": "10:32",
-    "desc": "400 m 400 m SF M40"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 2,
-    "time": "10:44",
-    "desc": "400 m 400 m SF M45"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 2,
-    "time": "12:00",
-    "desc": "High Jump W70 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 2,
-    "time": "10:56",
-    "desc": "400 m 400 m SF M50"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 2,
-    "time": "13:45",
-    "desc": "High Jump W75+ Final"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 2,
-    "time": "13:45",
-    "desc": "High Jump W75+ Final"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 2,
-    "time": "13:45",
-    "desc": "High Jump W75+ Final"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 2,
-    "time": "13:45",
-    "desc": "High Jump W75+ Final"
-  },
-  {
-    "eventCode": "HJ",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 2,
-    "time": "13:45",
-    "desc": "High Jump W75+ Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 2,
-    "time": "09:00",
-    "desc": "Discus W65 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 2,
-    "time": "11:08",
-    "desc": "400 m 400 m SF M55"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 2,
-    "time": "10:35",
-    "desc": "Discus W70 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 2,
-    "time": "11:20",
-    "desc": "400 m 400 m SF M60"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 2,
-    "time": "12:00",
-    "desc": "Discus W75 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 2,
-    "time": "11:32",
-    "desc": "400 m 400 m SF M65"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 2,
-    "time": "09:00",
-    "desc": "Shot Put M35 Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 2,
-    "time": "13:30",
-    "desc": "Discus W80+ Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 2,
-    "time": "13:30",
-    "desc": "Discus W80+ Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 2,
-    "time": "13:30",
-    "desc": "Discus W80+ Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 2,
-    "time": "13:30",
-    "desc": "Discus W80+ Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 2,
-    "time": "11:44",
-    "desc": "400 m 400 m SF M70"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 2,
-    "time": "10:15",
-    "desc": "Shot Put M40 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 2,
-    "time": "11:56",
-    "desc": "400 m 400 m SF M75"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 2,
-    "time": "11:45",
-    "desc": "Shot Put M45 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 2,
-    "time": "12:08",
-    "desc": "400 m 400 m SF M80"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 2,
-    "time": "13:25",
-    "desc": "Shot Put M50 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 2,
-    "time": "14:45",
-    "desc": "Javelin W60 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 2,
-    "time": "12:20",
-    "desc": "400 m 400 m SF W35"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 2,
-    "time": "15:00",
-    "desc": "Shot Put M55 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 2,
-    "time": "16:10",
-    "desc": "Javelin W55 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 2,
-    "time": "12:32",
-    "desc": "400 m 400 m SF W40"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 2,
-    "time": "16:35",
-    "desc": "Shot Put M60 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 2,
-    "time": "12:50",
-    "desc": "400 m 400 m SF W45"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 2,
-    "time": "18:30",
-    "desc": "Shot Put M65 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 2,
-    "time": "13:08",
-    "desc": "400 m 400 m SF W50"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 2,
-    "time": "20:00",
-    "desc": "Shot Put M70 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 2,
-    "time": "13:26",
-    "desc": "400 m 400 m SF W55"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 2,
-    "time": "13:44",
-    "desc": "400 m 400 m SF W60"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 2,
-    "time": "13:58",
-    "desc": "400 m 400 m SF W65"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 2,
-    "time": "14:10",
-    "desc": "400 m 400 m SF W70"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 2,
-    "time": "14:25",
-    "desc": "RW 3000m RW Final W35-40"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 2,
-    "time": "14:25",
-    "desc": "RW 3000m RW Final W35-40"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 2,
-    "time": "14:50",
-    "desc": "RW 3000m RW Final W45-50"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 2,
-    "time": "14:50",
-    "desc": "RW 3000m RW Final W45-50"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 2,
-    "time": "15:15",
-    "desc": "RW 3000m RW Final W55-60"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 2,
-    "time": "15:15",
-    "desc": "RW 3000m RW Final W55-60"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 2,
-    "time": "15:45",
-    "desc": "RW 3000m RW Final M35-40"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 2,
-    "time": "15:45",
-    "desc": "RW 3000m RW Final M35-40"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 2,
-    "time": "16:10",
-    "desc": "RW 3000m RW Final M45"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 2,
-    "time": "16:35",
-    "desc": "RW 3000m RW Final M50"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 2,
-    "time": "17:05",
-    "desc": "RW 3000m RW Final M55-60"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 2,
-    "time": "17:05",
-    "desc": "RW 3000m RW Final M55-60"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 2,
-    "time": "17:35",
-    "desc": "RW 3000m RW Final M65"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 2,
-    "time": "18:05",
-    "desc": "RW 3000m RW Final M70"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 2,
-    "time": "18:35",
-    "desc": "60 m 60 m hurdles Final W35"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 2,
-    "time": "18:40",
-    "desc": "60 m 60 m hurdles Final W40"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 2,
-    "time": "18:45",
-    "desc": "60 m 60 m hurdles Final W45"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 2,
-    "time": "18:50",
-    "desc": "60 m 60 m hurdles Final W50"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 2,
-    "time": "18:55",
-    "desc": "60 m 60 m hurdles Final W55"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 2,
-    "time": "19:00",
-    "desc": "60 m 60 m hurdles Final W60"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 2,
-    "time": "19:05",
-    "desc": "60 m 60 m hurdles Final W65"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 2,
-    "time": "19:10",
-    "desc": "60 m 60 m hurdles Final W70"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 2,
-    "time": "19:16",
-    "desc": "60 m 60 m hurdles Final W75"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 2,
-    "time": "19:22",
-    "desc": "60 m 60 m hurdles Final W80+"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 2,
-    "time": "19:22",
-    "desc": "60 m 60 m hurdles Final W80+"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 2,
-    "time": "19:22",
-    "desc": "60 m 60 m hurdles Final W80+"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 2,
-    "time": "19:22",
-    "desc": "60 m 60 m hurdles Final W80+"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 3,
-    "time": "08:30",
-    "desc": "60 m 60 m M35 Heats"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 3,
-    "time": "09:05",
-    "desc": "60 m 60 m M40 Heats"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 3,
-    "time": "08:00",
-    "desc": "Shot Put W35 Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 3,
-    "time": "09:00",
-    "desc": "Weight Throw W65 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 3,
-    "time": "09:50",
-    "desc": "60 m 60 m M45 Heats"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 3,
-    "time": "09:10",
-    "desc": "Shot Put W40 Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 3,
-    "time": "10:45",
-    "desc": "Weight Throw W70 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 3,
-    "time": "10:25",
-    "desc": "60 m 60 m M50 Heats"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 3,
-    "time": "10:40",
-    "desc": "Shot Put W45 Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 3,
-    "time": "12:05",
-    "desc": "Weight Throw W75 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 3,
-    "time": "11:00",
-    "desc": "60 m 60 m M55 Heats"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 3,
-    "time": "12:20",
-    "desc": "Shot Put W50 Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 3,
-    "time": "13:30",
-    "desc": "Weight Throw W80+ Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 3,
-    "time": "13:30",
-    "desc": "Weight Throw W80+ Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 3,
-    "time": "13:30",
-    "desc": "Weight Throw W80+ Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 3,
-    "time": "13:30",
-    "desc": "Weight Throw W80+ Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 3,
-    "time": "11:30",
-    "desc": "60 m 60 m M60 Heats"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 3,
-    "time": "13:40",
-    "desc": "Shot Put W55 Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 3,
-    "time": "14:40",
-    "desc": "Weight Throw M65 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 3,
-    "time": "12:00",
-    "desc": "60 m 60 m M65 Heats"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 3,
-    "time": "15:30",
-    "desc": "Shot Put W60 Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 3,
-    "time": "16:25",
-    "desc": "Weight Throw M70 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 3,
-    "time": "12:25",
-    "desc": "60 m 60 m M75 Heats"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 3,
-    "time": "17:10",
-    "desc": "Shot Put M75 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 3,
-    "time": "12:45",
-    "desc": "60 m 60 m W35 Heats"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 3,
-    "time": "18:50",
-    "desc": "Shot Put M80 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 3,
-    "time": "13:05",
-    "desc": "60 m 60 m W40 Heats"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 3,
-    "time": "20:15",
-    "desc": "Shot Put M85+ Final"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 3,
-    "time": "20:15",
-    "desc": "Shot Put M85+ Final"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 3,
-    "time": "20:15",
-    "desc": "Shot Put M85+ Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 3,
-    "time": "09:00",
-    "desc": "Discus M35 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 3,
-    "time": "13:35",
-    "desc": "60 m 60 m W45 Heats"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 3,
-    "time": "10:30",
-    "desc": "Discus M40 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 3,
-    "time": "13:55",
-    "desc": "60 m 60 m W50 Heats"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 3,
-    "time": "14:25",
-    "desc": "60 m 60 m W55 Heats"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 3,
-    "time": "08:00",
-    "desc": "Long Jump M45 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 3,
-    "time": "14:50",
-    "desc": "60 m 60 m W65 Heats"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 3,
-    "time": "09:45",
-    "desc": "Long Jump M50 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 3,
-    "time": "12:00",
-    "desc": "Javelin M45 Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 3,
-    "time": "11:25",
-    "desc": "Long Jump M55 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 3,
-    "time": "13:20",
-    "desc": "Javelin M50 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 3,
-    "time": "15:10",
-    "desc": "400 m 400 m M35 Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 3,
-    "time": "13:25",
-    "desc": "Long Jump M60 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 3,
-    "time": "14:45",
-    "desc": "Javelin M55 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 3,
-    "time": "15:16",
-    "desc": "400 m 400 m M40 Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 3,
-    "time": "15:00",
-    "desc": "Long Jump M65 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 3,
-    "time": "16:15",
-    "desc": "Javelin M60 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 3,
-    "time": "15:22",
-    "desc": "400 m 400 m M45 Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 3,
-    "time": "16:50",
-    "desc": "Long Jump M70 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 3,
-    "time": "15:28",
-    "desc": "400 m 400 m M50 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 3,
-    "time": "15:34",
-    "desc": "400 m 400 m M55 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 3,
-    "time": "15:40",
-    "desc": "400 m 400 m M60 Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 3,
-    "time": "18:20",
-    "desc": "Triple Jump W60 Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 3,
-    "time": "11:00",
-    "desc": "Road Race M35-50 Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 3,
-    "time": "11:00",
-    "desc": "Road Race M35-50 Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 3,
-    "time": "11:00",
-    "desc": "Road Race M35-50 Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 3,
-    "time": "11:00",
-    "desc": "Road Race M35-50 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 3,
-    "time": "15:46",
-    "desc": "400 m 400 m M65 Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 3,
-    "time": "19:40",
-    "desc": "Triple Jump W65 Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 3,
-    "time": "11:05",
-    "desc": "Road Race M55+ Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 3,
-    "time": "11:05",
-    "desc": "Road Race M55+ Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 3,
-    "time": "11:05",
-    "desc": "Road Race M55+ Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 3,
-    "time": "11:05",
-    "desc": "Road Race M55+ Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 3,
-    "time": "11:05",
-    "desc": "Road Race M55+ Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 3,
-    "time": "11:05",
-    "desc": "Road Race M55+ Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 3,
-    "time": "11:05",
-    "desc": "Road Race M55+ Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 3,
-    "time": "11:05",
-    "desc": "Road Race M55+ Final"
-  },
-  {
-    "eventCode": "5K",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 3,
-    "time": "11:05",
-    "desc": "Road Race M55+ Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 3,
-    "time": "15:52",
-    "desc": "400 m 400 m M70 Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 3,
-    "time": "21:00",
-    "desc": "Triple Jump W70+ Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 3,
-    "time": "21:00",
-    "desc": "Triple Jump W70+ Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 3,
-    "time": "21:00",
-    "desc": "Triple Jump W70+ Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 3,
-    "time": "21:00",
-    "desc": "Triple Jump W70+ Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 3,
-    "time": "21:00",
-    "desc": "Triple Jump W70+ Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 3,
-    "time": "21:00",
-    "desc": "Triple Jump W70+ Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 3,
-    "time": "15:58",
-    "desc": "400 m 400 m M75 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 3,
-    "time": "16:04",
-    "desc": "400 m 400 m M80 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 3,
-    "time": "16:10",
-    "desc": "400 m 400 m M85 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 3,
-    "time": "16:16",
-    "desc": "400 m 400 m M90+ Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 3,
-    "time": "16:16",
-    "desc": "400 m 400 m M90+ Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 3,
-    "time": "10:00",
-    "desc": "Long Jump M75 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 3,
-    "time": "16:22",
-    "desc": "400 m 400 m W80+ Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 3,
-    "time": "16:22",
-    "desc": "400 m 400 m W80+ Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 3,
-    "time": "16:22",
-    "desc": "400 m 400 m W80+ Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 3,
-    "time": "16:22",
-    "desc": "400 m 400 m W80+ Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 3,
-    "time": "11:30",
-    "desc": "Long Jump M80 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 3,
-    "time": "16:28",
-    "desc": "400 m 400 m W75 Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 3,
-    "time": "12:40",
-    "desc": "Long Jump M85+ Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 3,
-    "time": "12:40",
-    "desc": "Long Jump M85+ Final"
-  },
-  {
-    "eventCode": "LJ",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 3,
-    "time": "12:40",
-    "desc": "Long Jump M85+ Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 3,
-    "time": "16:34",
-    "desc": "400 m 400 m W70 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 3,
-    "time": "16:40",
-    "desc": "400 m 400 m W65 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 3,
-    "time": "16:46",
-    "desc": "400 m 400 m W60 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 3,
-    "time": "16:52",
-    "desc": "400 m 400 m W55 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 3,
-    "time": "16:58",
-    "desc": "400 m 400 m W50 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 3,
-    "time": "17:04",
-    "desc": "400 m 400 m W45 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 3,
-    "time": "17:10",
-    "desc": "400 m 400 m W40 Final"
-  },
-  {
-    "eventCode": "400",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 3,
-    "time": "17:16",
-    "desc": "400 m 400 m W35 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 3,
-    "time": "17:25",
-    "desc": "60 m 60 m M35 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 3,
-    "time": "17:40",
-    "desc": "60 m 60 m M40 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 3,
-    "time": "17:55",
-    "desc": "60 m 60 m M45 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 3,
-    "time": "18:10",
-    "desc": "60 m 60 m M50 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 3,
-    "time": "18:25",
-    "desc": "60 m 60 m M55 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 3,
-    "time": "18:35",
-    "desc": "60 m 60 m M60 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 3,
-    "time": "18:45",
-    "desc": "60 m 60 m M65 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 3,
-    "time": "18:55",
-    "desc": "60 m 60 m M70 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 3,
-    "time": "19:10",
-    "desc": "60 m 60 m M75 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 3,
-    "time": "19:20",
-    "desc": "60 m 60 m M80 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 3,
-    "time": "19:30",
-    "desc": "60 m 60 m W80 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 3,
-    "time": "19:40",
-    "desc": "60 m 60 m W75 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 3,
-    "time": "19:50",
-    "desc": "60 m 60 m W70 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 3,
-    "time": "20:05",
-    "desc": "60 m 60 m W65 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 3,
-    "time": "20:15",
-    "desc": "60 m 60 m W60 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 3,
-    "time": "20:30",
-    "desc": "60 m 60 m W55 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 3,
-    "time": "20:40",
-    "desc": "60 m 60 m W50 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 3,
-    "time": "20:50",
-    "desc": "60 m 60 m W45 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 3,
-    "time": "21:00",
-    "desc": "60 m 60 m W40 SF"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 3,
-    "time": "21:10",
-    "desc": "60 m 60 m W35 SF"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "08:30",
-    "desc": "Pentathlon 60m hurdles Pentathlon M35"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "09:00",
-    "desc": "Pentathlon 60m hurdles Pentathlon M40"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "09:10",
-    "desc": "Pentathlon M35 Pentathlon"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 4,
-    "time": "08:30",
-    "desc": "Discus M60 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "10:25",
-    "desc": "Pentathlon M40 Pentathlon"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 4,
-    "time": "10:10",
-    "desc": "Discus M65 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "09:15",
-    "desc": "800 m 800 m Heats M35"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "11:30",
-    "desc": "Pentathlon M45 Pentathlon"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 4,
-    "time": "12:00",
-    "desc": "Discus M70 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "09:47",
-    "desc": "800 m 800 m Heats M40"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "12:30",
-    "desc": "Pentathlon M50 Pentathlon"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 4,
-    "time": "13:35",
-    "desc": "Discus M75 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "10:11",
-    "desc": "800 m 800 m Heats M45"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "14:00",
-    "desc": "Pentathlon M55-gr.1 Pentathlon"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 4,
-    "time": "15:00",
-    "desc": "Discus M80 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "15:15",
-    "desc": "Pentathlon M55-gr.2 Pentathlon"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 4,
-    "time": "16:10",
-    "desc": "Discus M85+ Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 4,
-    "time": "16:10",
-    "desc": "Discus M85+ Final"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 4,
-    "time": "16:10",
-    "desc": "Discus M85+ Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "10:43",
-    "desc": "Pentathlon 60m hurdles Pentathlon M45"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "11:00",
-    "desc": "800 m 800 m Heats M50"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 4,
-    "time": "08:00",
-    "desc": "Triple Jump M85+ Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 4,
-    "time": "08:00",
-    "desc": "Triple Jump M85+ Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 4,
-    "time": "08:00",
-    "desc": "Triple Jump M85+ Final"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "17:40",
-    "desc": "Hammer M55 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "11:32",
-    "desc": "800 m 800 m Heats M55"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 4,
-    "time": "16:20",
-    "desc": "Triple Jump M60 Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 4,
-    "time": "18:00",
-    "desc": "Triple Jump M65 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "12:02",
-    "desc": "Pentathlon 60m hurdles Pentathlon M50"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 4,
-    "time": "19:55",
-    "desc": "Triple Jump M70 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "16:00",
-    "desc": "Javelin M35 Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 4,
-    "time": "21:05",
-    "desc": "Triple Jump M75-80 Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 4,
-    "time": "21:05",
-    "desc": "Triple Jump M75-80 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "17:05",
-    "desc": "Javelin M40 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 4,
-    "time": "12:20",
-    "desc": "800 m 800 m Heats M60"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "13:00",
-    "desc": "Pentathlon 60m hurdles Pentathlon M55"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "08:30",
-    "desc": "Weight Throw W35-40 Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "08:30",
-    "desc": "Weight Throw W35-40 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "11:30",
-    "desc": "Pentathlon M35"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "10:20",
-    "desc": "Weight Throw W45 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 4,
-    "time": "13:25",
-    "desc": "800 m 800 m Heats M65"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "14:30",
-    "desc": "Pentathlon M45"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "11:30",
-    "desc": "Weight Throw W50 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 4,
-    "time": "13:49",
-    "desc": "800 m 800 m Heats M70"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "18:30",
-    "desc": "Pentathlon M55-gr.1"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "12:55",
-    "desc": "Weight Throw W55 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 4,
-    "time": "14:13",
-    "desc": "800 m 800 m Heats M75"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 4,
-    "time": "14:40",
-    "desc": "Weight Throw W60 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 4,
-    "time": "14:29",
-    "desc": "800 m 800 m Heats M80"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 4,
-    "time": "14:45",
-    "desc": "800 m 800 m Heats W60"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "12:45",
-    "desc": "Pentathlon M40 Pentathlon"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "16:20",
-    "desc": "Hammer M50 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "15:00",
-    "desc": "Pentathlon 1000 m Pentathlon M35"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "15:40",
-    "desc": "Pentathlon M50 Pentathlon"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "17:50",
-    "desc": "Hammer M45 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "15:15",
-    "desc": "Pentathlon 1000 m Pentathlon M40"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "17:45",
-    "desc": "Pentathlon M55-gr.2 Pentathlon"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "15:30",
-    "desc": "800 m 800 m Heats W55"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "15:54",
-    "desc": "800 m 800 m Heats W50"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "09:00",
-    "desc": "Pole Vault W35-40 Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "09:00",
-    "desc": "Pole Vault W35-40 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "16:10",
-    "desc": "800 m 800 m Heats W45"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "11:30",
-    "desc": "Pole Vault W45-50 Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "11:30",
-    "desc": "Pole Vault W45-50 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "16:34",
-    "desc": "800 m 800 m Heats W40"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "14:00",
-    "desc": "Pole Vault W55-60 Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 4,
-    "time": "14:00",
-    "desc": "Pole Vault W55-60 Final"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "16:50",
-    "desc": "800 m 800 m Heats W35"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 4,
-    "time": "17:00",
-    "desc": "Pole Vault W65+ Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 4,
-    "time": "17:00",
-    "desc": "Pole Vault W65+ Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 4,
-    "time": "17:00",
-    "desc": "Pole Vault W65+ Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 4,
-    "time": "17:00",
-    "desc": "Pole Vault W65+ Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 4,
-    "time": "17:00",
-    "desc": "Pole Vault W65+ Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 4,
-    "time": "17:00",
-    "desc": "Pole Vault W65+ Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 4,
-    "time": "17:00",
-    "desc": "Pole Vault W65+ Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "17:05",
-    "desc": "60 m 60 m Final W35"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "17:10",
-    "desc": "60 m 60 m Final W40"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 4,
-    "time": "09:00",
-    "desc": "Shot Put W80+ Final"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 4,
-    "time": "09:00",
-    "desc": "Shot Put W80+ Final"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 4,
-    "time": "09:00",
-    "desc": "Shot Put W80+ Final"
-  },
-  {
-    "eventCode": "SP",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 4,
-    "time": "09:00",
-    "desc": "Shot Put W80+ Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "17:15",
-    "desc": "60 m 60 m Final W45"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "10:15",
-    "desc": "Pentathlon M35 Pentathlon"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "17:20",
-    "desc": "60 m 60 m Final W50"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "11:30",
-    "desc": "Pentathlon M40 Pentathlon"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "17:25",
-    "desc": "60 m 60 m Final W55"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "13:05",
-    "desc": "Pentathlon M45 Pentathlon"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 4,
-    "time": "17:30",
-    "desc": "60 m 60 m Final W60"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "14:05",
-    "desc": "Pentathlon M50 Pentathlon"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 4,
-    "time": "17:35",
-    "desc": "60 m 60 m Final W65"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "15:15",
-    "desc": "Pentathlon M55-gr.1 Pentathlon"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 4,
-    "time": "17:40",
-    "desc": "60 m 60 m Final W70"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "16:30",
-    "desc": "Pentathlon M55-gr.2 Pentathlon"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 4,
-    "time": "17:45",
-    "desc": "60 m 60 m Final W75"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 4,
-    "time": "17:45",
-    "desc": "Pentathlon W75 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 4,
-    "time": "17:50",
-    "desc": "60 m 60 m Final W80"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 4,
-    "time": "19:10",
-    "desc": "Pentathlon W70 Final"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 4,
-    "time": "17:55",
-    "desc": "60 m 60 m Final W85+"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 4,
-    "time": "17:55",
-    "desc": "60 m 60 m Final W85+"
-  },
-  {
-    "eventCode": "60",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 4,
-    "time": "17:55",
-    "desc": "60 m 60 m Final W85+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 4,
-    "time": "20:30",
-    "desc": "Pentathlon W65 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "18:00",
-    "desc": "Pentathlon 1000 m Pentathlon M45"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "18:20",
-    "desc": "Pentathlon 1000 m Pentathlon M50"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 4,
-    "time": "18:40",
-    "desc": "60 m 60 m Final M90+"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 4,
-    "time": "18:40",
-    "desc": "60 m 60 m Final M90+"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 4,
-    "time": "18:45",
-    "desc": "60 m 60 m Final M85"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 4,
-    "time": "18:50",
-    "desc": "60 m 60 m Final M80"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 4,
-    "time": "18:55",
-    "desc": "60 m 60 m Final M75"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 4,
-    "time": "19:00",
-    "desc": "60 m 60 m Final M70"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 4,
-    "time": "19:05",
-    "desc": "60 m 60 m Final M65"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 4,
-    "time": "19:10",
-    "desc": "60 m 60 m Final M60"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "19:15",
-    "desc": "60 m 60 m Final M55"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 4,
-    "time": "19:20",
-    "desc": "60 m 60 m Final M50"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 4,
-    "time": "19:25",
-    "desc": "60 m 60 m Final M45"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 4,
-    "time": "19:30",
-    "desc": "60 m 60 m Final M40"
-  },
-  {
-    "eventCode": "60",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 4,
-    "time": "19:35",
-    "desc": "60 m 60 m Final M35"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 4,
-    "time": "19:45",
-    "desc": "Pentathlon 1000 m Pentathlon M55"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 5,
-    "time": "08:00",
-    "desc": "200 m 200 m Heats W35"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 5,
-    "time": "08:50",
-    "desc": "Pentathlon M80-85 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 5,
-    "time": "08:50",
-    "desc": "Pentathlon M80-85 Pentathlon"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "09:00",
-    "desc": "Javelin W65 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 5,
-    "time": "08:20",
-    "desc": "Pentathlon 60m Hurdles Pentathlon M80-85"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 5,
-    "time": "08:20",
-    "desc": "Pentathlon 60m Hurdles Pentathlon M80-85"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "09:40",
-    "desc": "Pentathlon M75 Pentathlon"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "10:30",
-    "desc": "Javelin W70 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "10:40",
-    "desc": "Pentathlon M70 Pentathlon"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "11:45",
-    "desc": "Javelin W75 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 5,
-    "time": "08:25",
-    "desc": "200 m 200 m Heats W40"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "12:10",
-    "desc": "Pentathlon M65 gr.1 Pentathlon"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 5,
-    "time": "12:45",
-    "desc": "Javelin W80+ Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 5,
-    "time": "12:45",
-    "desc": "Javelin W80+ Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 5,
-    "time": "12:45",
-    "desc": "Javelin W80+ Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 5,
-    "time": "12:45",
-    "desc": "Javelin W80+ Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "13:15",
-    "desc": "Pentathlon M65 gr.2 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "09:00",
-    "desc": "Pentathlon 60m Hurdles Pentathlon M75"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "14:00",
-    "desc": "Pentathlon M60 gr.1 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "15:15",
-    "desc": "Pentathlon M60 gr.2 Pentathlon"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 5,
-    "time": "12:00",
-    "desc": "Discus M45 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 5,
-    "time": "09:05",
-    "desc": "200 m 200 m Heats W45"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 5,
-    "time": "13:25",
-    "desc": "Discus M50 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 5,
-    "time": "09:30",
-    "desc": "200 m 200 m Heats W50"
-  },
-  {
-    "eventCode": "DT",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 5,
-    "time": "15:00",
-    "desc": "Discus M55 Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 5,
-    "time": "16:30",
-    "desc": "Triple Jump W35,W45 Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 5,
-    "time": "16:30",
-    "desc": "Triple Jump W35,W45 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "10:00",
-    "desc": "Pentathlon 60m Hurdles Pentathlon M70"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 5,
-    "time": "18:00",
-    "desc": "Triple Jump W40 Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 5,
-    "time": "19:30",
-    "desc": "Triple Jump W50-55 Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 5,
-    "time": "19:30",
-    "desc": "Triple Jump W50-55 Final"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 5,
-    "time": "16:45",
-    "desc": "Hammer M85+ Final"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 5,
-    "time": "16:45",
-    "desc": "Hammer M85+ Final"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 5,
-    "time": "16:45",
-    "desc": "Hammer M85+ Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 5,
-    "time": "10:15",
-    "desc": "200 m 200 m Heats W55"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "10:30",
-    "desc": "200 m 200 m Heats W60"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "10:50",
-    "desc": "200 m 200 m Heats M70"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 5,
-    "time": "09:00",
-    "desc": "Weight Throw M35-40 Final"
-  },
-  {
-    "eventCode": "WT",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 5,
-    "time": "09:00",
-    "desc": "Weight Throw M35-40 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "11:20",
-    "desc": "200 m 200 m Heats M75"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 5,
-    "time": "10:40",
-    "desc": "Pentathlon M80-85 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 5,
-    "time": "10:40",
-    "desc": "Pentathlon M80-85 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "13:25",
-    "desc": "Pentathlon M70 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "11:40",
-    "desc": "Pentathlon 60m Hurdles Pentathlon M65"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "15:25",
-    "desc": "Pentathlon M65 gr.2 Pentathlon"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "10:45",
-    "desc": "Hammer M60 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "17:45",
-    "desc": "Pentathlon M60 gr.2 Pentathlon"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "12:10",
-    "desc": "Hammer M65 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "12:05",
-    "desc": "200 m 200 m Heats M65"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "14:00",
-    "desc": "Hammer M70 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "12:50",
-    "desc": "200 m 200 m Heats M60"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "15:30",
-    "desc": "Hammer M75 Final"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 5,
-    "time": "17:00",
-    "desc": "Hammer M80 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "13:45",
-    "desc": "Pentathlon 60m Hurdles Pentathlon M60"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "11:30",
-    "desc": "Pentathlon M75 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 5,
-    "time": "14:10",
-    "desc": "Pentathlon 1000m Pentathlon M80-85"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 5,
-    "time": "14:10",
-    "desc": "Pentathlon 1000m Pentathlon M80-85"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "14:20",
-    "desc": "Pentathlon M65 gr.1 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "14:20",
-    "desc": "Pentathlon 1000 m Pentathlon M75"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "16:40",
-    "desc": "Pentathlon M60 gr.1 Pentathlon"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 5,
-    "time": "14:30",
-    "desc": "200 m 200 m Heats M55"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 5,
-    "time": "15:20",
-    "desc": "200 m 200 m Heats M50"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 5,
-    "time": "09:00",
-    "desc": "Pole Vault M35 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 5,
-    "time": "16:05",
-    "desc": "200 m 200 m Heats M45"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 5,
-    "time": "11:00",
-    "desc": "Pole Vault M40 Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 5,
-    "time": "14:00",
-    "desc": "Pole Vault M45 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 5,
-    "time": "10:00",
-    "desc": "RW W35-50 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 5,
-    "time": "10:00",
-    "desc": "RW W35-50 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 5,
-    "time": "10:00",
-    "desc": "RW W35-50 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 5,
-    "time": "10:00",
-    "desc": "RW W35-50 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "16:50",
-    "desc": "Pentathlon 1000 m Pentathlon M70"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 5,
-    "time": "16:15",
-    "desc": "Pole Vault M50 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 5,
-    "time": "10:40",
-    "desc": "RW W55+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "10:40",
-    "desc": "RW W55+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "10:40",
-    "desc": "RW W55+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "10:40",
-    "desc": "RW W55+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "10:40",
-    "desc": "RW W55+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 5,
-    "time": "10:40",
-    "desc": "RW W55+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 5,
-    "time": "10:40",
-    "desc": "RW W55+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 5,
-    "time": "10:40",
-    "desc": "RW W55+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 5,
-    "time": "10:40",
-    "desc": "RW W55+ Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 5,
-    "time": "17:00",
-    "desc": "200 m 200 m Heats M40"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 5,
-    "time": "11:40",
-    "desc": "RW M35-50 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 5,
-    "time": "11:40",
-    "desc": "RW M35-50 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 5,
-    "time": "11:40",
-    "desc": "RW M35-50 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 5,
-    "time": "11:40",
-    "desc": "RW M35-50 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 5,
-    "time": "09:45",
-    "desc": "Pentathlon M80-85 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 5,
-    "time": "09:45",
-    "desc": "Pentathlon M80-85 Pentathlon"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 5,
-    "time": "12:15",
-    "desc": "RW M55-65 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "12:15",
-    "desc": "RW M55-65 Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "12:15",
-    "desc": "RW M55-65 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "17:45",
-    "desc": "Pentathlon 1000 m Pentathlon M65"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "10:35",
-    "desc": "Pentathlon M75 Pentathlon"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "13:00",
-    "desc": "RW M70+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "13:00",
-    "desc": "RW M70+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 5,
-    "time": "13:00",
-    "desc": "RW M70+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 5,
-    "time": "13:00",
-    "desc": "RW M70+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 5,
-    "time": "13:00",
-    "desc": "RW M70+ Final"
-  },
-  {
-    "eventCode": "3000W",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 5,
-    "time": "13:00",
-    "desc": "RW M70+ Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "12:00",
-    "desc": "Pentathlon M70 Pentathlon"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 5,
-    "time": "18:00",
-    "desc": "200 m 200 m Heats M35"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "13:15",
-    "desc": "Pentathlon M65 gr.1 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "14:20",
-    "desc": "Pentathlon M65 gr.2 Pentathlon"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 5,
-    "time": "18:45",
-    "desc": "800 m 800 m Final W35"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "15:20",
-    "desc": "Pentathlon M60 gr.1 Pentathlon"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 5,
-    "time": "18:52",
-    "desc": "800 m 800 m Final W40"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "16:30",
-    "desc": "Pentathlon M60 gr.2 Pentathlon"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 5,
-    "time": "18:59",
-    "desc": "800 m 800 m Final W45"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 5,
-    "time": "19:06",
-    "desc": "800 m 800 m Final W50"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 5,
-    "time": "19:13",
-    "desc": "800 m 800 m Final W55"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "19:20",
-    "desc": "800 m 800 m Final W60"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "19:27",
-    "desc": "800 m 800 m Final W65"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "19:34",
-    "desc": "Pentathlon 1000 m Pentathlon M60"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "19:49",
-    "desc": "800 m 800 m Final W70"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "19:57",
-    "desc": "800 m 800 m Final W75"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 5,
-    "time": "20:05",
-    "desc": "800 m 800 m Final W80+"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 5,
-    "time": "20:05",
-    "desc": "800 m 800 m Final W80+"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 5,
-    "time": "20:05",
-    "desc": "800 m 800 m Final W80+"
-  },
-  {
-    "eventCode": "800",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 5,
-    "time": "20:05",
-    "desc": "800 m 800 m Final W80+"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 5,
-    "time": "20:13",
-    "desc": "800 m 800 m Final M35"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 5,
-    "time": "20:20",
-    "desc": "800 m 800 m Final M40"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 5,
-    "time": "20:27",
-    "desc": "800 m 800 m Final M45"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 5,
-    "time": "20:34",
-    "desc": "800 m 800 m Final M50"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 5,
-    "time": "20:41",
-    "desc": "800 m 800 m Final M55"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "20:48",
-    "desc": "800 m 800 m Final M60"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "20:55",
-    "desc": "800 m 800 m Final M65"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "21:02",
-    "desc": "800 m 800 m Final M70"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "21:10",
-    "desc": "800 m 800 m Final M75"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 5,
-    "time": "21:18",
-    "desc": "800 m 800 m Final M80"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 5,
-    "time": "21:26",
-    "desc": "800 m 800 m Final M85+"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 5,
-    "time": "21:26",
-    "desc": "800 m 800 m Final M85+"
-  },
-  {
-    "eventCode": "800",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 5,
-    "time": "21:26",
-    "desc": "800 m 800 m Final M85+"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 5,
-    "time": "21:34",
-    "desc": "200m 200m SF W75"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 5,
-    "time": "21:44",
-    "desc": "200m 200m SF W70"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 5,
-    "time": "21:59",
-    "desc": "200m 200m SF W65"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 5,
-    "time": "22:14",
-    "desc": "200m 200m SF W60"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 5,
-    "time": "22:24",
-    "desc": "200m 200m SF W55"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 5,
-    "time": "22:34",
-    "desc": "200m 200m SF W50"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 5,
-    "time": "22:44",
-    "desc": "200m 200m SF W45"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 5,
-    "time": "22:54",
-    "desc": "200m 200m SF W40"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 5,
-    "time": "23:09",
-    "desc": "200m 200m SF W35"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "08:15",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 6,
-    "time": "08:15",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 6,
-    "time": "08:15",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 6,
-    "time": "08:15",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 6,
-    "time": "08:15",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 6,
-    "time": "08:15",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "08:25",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W60-65"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "08:25",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W60-65"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "11:40",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 6,
-    "time": "11:40",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 6,
-    "time": "11:40",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 6,
-    "time": "11:40",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 6,
-    "time": "11:40",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 6,
-    "time": "11:40",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "09:00",
-    "desc": "Hammer W55"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "12:35",
-    "desc": "Pentathlon W60-65 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "12:35",
-    "desc": "Pentathlon W60-65 Pentathlon"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "10:45",
-    "desc": "Hammer W60"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "08:36",
-    "desc": "60 m 60 m hurdles Heats M70"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "13:30",
-    "desc": "Pentathlon W55 Pentathlon"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "12:30",
-    "desc": "Hammer W65"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "08:47",
-    "desc": "60 m 60 m hurdles Heats M65"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "15:05",
-    "desc": "Pentathlon W50 Pentathlon"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "14:15",
-    "desc": "Hammer W70"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "09:02",
-    "desc": "60 m 60 m hurdles Heats M60"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "16:25",
-    "desc": "Pentathlon W40-45 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "16:25",
-    "desc": "Pentathlon W40-45 Pentathlon"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 6,
-    "time": "15:45",
-    "desc": "Hammer W75"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "09:18",
-    "desc": "60 m 60 m hurdles Heats M55"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "18:15",
-    "desc": "Pentathlon W35 Pentathlon"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 6,
-    "time": "17:10",
-    "desc": "Hammer W80+"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 6,
-    "time": "17:10",
-    "desc": "Hammer W80+"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 6,
-    "time": "17:10",
-    "desc": "Hammer W80+"
-  },
-  {
-    "eventCode": "HT",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 6,
-    "time": "17:10",
-    "desc": "Hammer W80+"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "09:33",
-    "desc": "60 m 60 m hurdles Heats M50"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "09:43",
-    "desc": "60 m 60 m hurdles Heats M45"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "09:53",
-    "desc": "60 m 60 m hurdles Heats M40"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "09:00",
-    "desc": "Javelin W50 Final"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "10:03",
-    "desc": "60 m 60 m hurdles Heats M35"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "09:00",
-    "desc": "TripleJump M45 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "10:20",
-    "desc": "Javelin W45 Final"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "10:15",
-    "desc": "TripleJump M40 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "11:40",
-    "desc": "Javelin W35-40 Final"
-  },
-  {
-    "eventCode": "JT",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "11:40",
-    "desc": "Javelin W35-40 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "10:14",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W55"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "19:15",
-    "desc": "TripleJump M35 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 6,
-    "time": "10:24",
-    "desc": "200 m 200 m SF M85"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 6,
-    "time": "10:34",
-    "desc": "200 m 200 m SF M80"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "08:50",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 6,
-    "time": "08:50",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 6,
-    "time": "08:50",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 6,
-    "time": "08:50",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 6,
-    "time": "08:50",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 6,
-    "time": "08:50",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "10:44",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W50"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "10:45",
-    "desc": "Pentathlon W55 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "12:30",
-    "desc": "Pentathlon W40-45 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "12:30",
-    "desc": "Pentathlon W40-45 Pentathlon"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 6,
-    "time": "10:59",
-    "desc": "200 m 200 m SF M75"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "11:14",
-    "desc": "200 m 200 m SF M70"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "11:29",
-    "desc": "200 m 200 m SF M65"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "09:00",
-    "desc": "Pentathlon W60-65 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "09:00",
-    "desc": "Pentathlon W60-65 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "11:44",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W40-45"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "11:44",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W40-45"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "11:20",
-    "desc": "Pentathlon W50 Pentathlon"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "10:00",
-    "desc": "Cross Country W55-65 Final"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "10:00",
-    "desc": "Cross Country W55-65 Final"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "10:00",
-    "desc": "Cross Country W55-65 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "15:00",
-    "desc": "Pentathlon W35 Pentathlon"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "10:45",
-    "desc": "Cross Country W35-50 Final"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "10:45",
-    "desc": "Cross Country W35-50 Final"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "10:45",
-    "desc": "Cross Country W35-50 Final"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "10:45",
-    "desc": "Cross Country W35-50 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "12:00",
-    "desc": "200 m 200 m SF M60"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "11:30",
-    "desc": "Cross Country M60-65 Final"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "11:30",
-    "desc": "Cross Country M60-65 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "12:15",
-    "desc": "200 m 200 m SF M55"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "12:15",
-    "desc": "Cross Country M50-55 Final"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "12:15",
-    "desc": "Cross Country M50-55 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "12:30",
-    "desc": "200 m 200 m SF M50"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "09:00",
-    "desc": "Pole Vault M55 Final"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "13:00",
-    "desc": "Cross Country M35-45 Final"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "13:00",
-    "desc": "Cross Country M35-45 Final"
-  },
-  {
-    "eventCode": "XC",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "13:00",
-    "desc": "Cross Country M35-45 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "12:45",
-    "desc": "200 m 200 m SF M45"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "12:00",
-    "desc": "Pole Vault M60 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "13:00",
-    "desc": "200 m 200 m SF M40"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "14:00",
-    "desc": "Pole Vault M65 Final"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "13:15",
-    "desc": "200 m 200 m SF M35"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "16:30",
-    "desc": "Pole Vault M70 Final"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "13:30",
-    "desc": "Pentathlon 800 m Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 6,
-    "time": "13:30",
-    "desc": "Pentathlon 800 m Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 6,
-    "time": "13:30",
-    "desc": "Pentathlon 800 m Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 6,
-    "time": "13:30",
-    "desc": "Pentathlon 800 m Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 6,
-    "time": "13:30",
-    "desc": "Pentathlon 800 m Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 6,
-    "time": "13:30",
-    "desc": "Pentathlon 800 m Pentathlon W70+"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "13:38",
-    "desc": "Pentathlon 800 m Pentathlon W60-65"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "13:38",
-    "desc": "Pentathlon 800 m Pentathlon W60-65"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "10:30",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 6,
-    "time": "10:30",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 6,
-    "time": "10:30",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 6,
-    "time": "10:30",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 6,
-    "time": "10:30",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 6,
-    "time": "10:30",
-    "desc": "Pentathlon W70+ Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "11:20",
-    "desc": "Pentathlon W60-65 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "11:20",
-    "desc": "Pentathlon W60-65 Pentathlon"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "13:46",
-    "desc": "1500m 1500m Heats M35"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "12:20",
-    "desc": "Pentathlon W55 Pentathlon"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "14:10",
-    "desc": "1500m 1500m Heats M40"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "13:40",
-    "desc": "Pentathlon W50 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "15:00",
-    "desc": "Pentathlon W40-45 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "15:00",
-    "desc": "Pentathlon W40-45 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "14:26",
-    "desc": "Pentathlon 60 m hurdles Pentathlon W35"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "16:30",
-    "desc": "Pentathlon W35 Pentathlon"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "14:36",
-    "desc": "Pentathlon 800 m Pentathlon W55"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "14:52",
-    "desc": "1500m 1500m Heats M45"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "15:08",
-    "desc": "1500m 1500m Heats M50"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "15:32",
-    "desc": "1500m 1500m Heats M55"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "15:59",
-    "desc": "1500m 1500m Heats M60"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "16:26",
-    "desc": "1500m 1500m Heats M65"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "16:53",
-    "desc": "1500m 1500m Heats M70"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 6,
-    "time": "17:11",
-    "desc": "1500m 1500m Heats M75"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "17:29",
-    "desc": "Pentathlon 800 m Pentathlon W50"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "17:37",
-    "desc": "1500m 1500m Heats W45"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "17:53",
-    "desc": "1500m 1500m Heats W50"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "18:09",
-    "desc": "1500m 1500m Heats W55"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "18:27",
-    "desc": "Pentathlon 800 m Pentathlon W40-45"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "18:27",
-    "desc": "Pentathlon 800 m Pentathlon W40-45"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "18:43",
-    "desc": "200 m 200 m Final W35"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "18:48",
-    "desc": "200 m 200 m Final W40"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "18:53",
-    "desc": "200 m 200 m Final W45"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "18:58",
-    "desc": "200 m 200 m Final W50"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "19:03",
-    "desc": "200 m 200 m Final W55"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "19:08",
-    "desc": "200 m 200 m Final W60"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "19:13",
-    "desc": "200 m 200 m Final W65"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "19:18",
-    "desc": "200 m 200 m Final W70"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 6,
-    "time": "19:23",
-    "desc": "200 m 200 m Final W75"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 6,
-    "time": "19:28",
-    "desc": "200 m 200 m Final W80"
-  },
-  {
-    "eventCode": "200",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 6,
-    "time": "19:33",
-    "desc": "200 m 200 m Final W85"
-  },
-  {
-    "eventCode": "PEN",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "19:38",
-    "desc": "Pentathlon 800 m Pentathlon W35"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 6,
-    "time": "19:46",
-    "desc": "200 m 200 m Final M95"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 6,
-    "time": "19:51",
-    "desc": "200 m 200 m Final M90"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 6,
-    "time": "19:56",
-    "desc": "200 m 200 m Final M85"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 6,
-    "time": "20:01",
-    "desc": "200 m 200 m Final M80"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 6,
-    "time": "20:06",
-    "desc": "200 m 200 m Final M75"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "20:11",
-    "desc": "200 m 200 m Final M70"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "20:16",
-    "desc": "200 m 200 m Final M65"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "20:21",
-    "desc": "200 m 200 m Final M60"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "20:26",
-    "desc": "200 m 200 m Final M55"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "20:31",
-    "desc": "200 m 200 m Final M50"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "20:36",
-    "desc": "200 m 200 m Final M45"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "20:41",
-    "desc": "200 m 200 m Final M40"
-  },
-  {
-    "eventCode": "200",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "20:46",
-    "desc": "200 m 200 m Final M35"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 6,
-    "time": "20:51",
-    "desc": "60 m 60 m hurdles Final M85+"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 6,
-    "time": "20:51",
-    "desc": "60 m 60 m hurdles Final M85+"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 6,
-    "time": "20:51",
-    "desc": "60 m 60 m hurdles Final M85+"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 6,
-    "time": "20:56",
-    "desc": "60 m 60 m hurdles Final M80"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 6,
-    "time": "21:01",
-    "desc": "60 m 60 m hurdles Final M75"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 6,
-    "time": "21:06",
-    "desc": "60 m 60 m hurdles Final M70"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 6,
-    "time": "21:11",
-    "desc": "60 m 60 m hurdles Final M65"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 6,
-    "time": "21:16",
-    "desc": "60 m 60 m hurdles Final M60"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 6,
-    "time": "21:21",
-    "desc": "60 m 60 m hurdles Final M55"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 6,
-    "time": "21:26",
-    "desc": "60 m 60 m hurdles Final M50"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 6,
-    "time": "21:31",
-    "desc": "60 m 60 m hurdles Final M45"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 6,
-    "time": "21:36",
-    "desc": "60 m 60 m hurdles Final M40"
-  },
-  {
-    "eventCode": "60H",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 6,
-    "time": "21:41",
-    "desc": "60 m 60 m hurdles Final M35"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 7,
-    "time": "09:00",
-    "desc": "4x200 4x200 m Final M80"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 7,
-    "time": "09:10",
-    "desc": "4x200 4x200 m Final W80"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 7,
-    "time": "09:00",
-    "desc": "Triple Jump M50 Final"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 7,
-    "time": "09:20",
-    "desc": "4x200 4x200 m Final M75"
-  },
-  {
-    "eventCode": "TJ",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 7,
-    "time": "10:30",
-    "desc": "Triple Jump M55 Final"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 7,
-    "time": "09:30",
-    "desc": "4x200 4x200 m Final W75"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 7,
-    "time": "09:40",
-    "desc": "4x200 4x200 m Final M70"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 7,
-    "time": "09:50",
-    "desc": "4x200 4x200 m Final W70"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 7,
-    "time": "10:00",
-    "desc": "4x200 4x200 m Final M65"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 7,
-    "time": "09:00",
-    "desc": "Pole Vault M75 Final"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 7,
-    "time": "10:10",
-    "desc": "4x200 4x200 m Final W65"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 7,
-    "time": "11:00",
-    "desc": "Pole Vault M80+ Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 7,
-    "time": "11:00",
-    "desc": "Pole Vault M80+ Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 7,
-    "time": "11:00",
-    "desc": "Pole Vault M80+ Final"
-  },
-  {
-    "eventCode": "PV",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 7,
-    "time": "11:00",
-    "desc": "Pole Vault M80+ Final"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 7,
-    "time": "10:20",
-    "desc": "4x200 4x200 m Final M60"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 7,
-    "time": "10:30",
-    "desc": "4x200 4x200 m Final W60"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 7,
-    "time": "10:40",
-    "desc": "4x200 4x200 m Final M55"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 7,
-    "time": "10:50",
-    "desc": "4x200 4x200 m Final W55"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 7,
-    "time": "11:00",
-    "desc": "4x200 4x200 m Final M50"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 7,
-    "time": "11:10",
-    "desc": "4x200 4x200 m Final W50"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 7,
-    "time": "11:20",
-    "desc": "4x200 4x200 m Final M45"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 7,
-    "time": "11:30",
-    "desc": "4x200 4x200 m Final W45"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 7,
-    "time": "11:40",
-    "desc": "4x200 4x200 m Final M40"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 7,
-    "time": "11:50",
-    "desc": "4x200 4x200 m Final W40"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 7,
-    "time": "12:00",
-    "desc": "4x200 4x200 m Final M35"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 7,
-    "time": "12:10",
-    "desc": "4x200 4x200 m Final W35"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V70",
-    "day": 7,
-    "time": "12:20",
-    "desc": "1500 m 1500 m Final W70+"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V75",
-    "day": 7,
-    "time": "12:20",
-    "desc": "1500 m 1500 m Final W70+"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V80",
-    "day": 7,
-    "time": "12:20",
-    "desc": "1500 m 1500 m Final W70+"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V85",
-    "day": 7,
-    "time": "12:20",
-    "desc": "1500 m 1500 m Final W70+"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V90",
-    "day": 7,
-    "time": "12:20",
-    "desc": "1500 m 1500 m Final W70+"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V95",
-    "day": 7,
-    "time": "12:20",
-    "desc": "1500 m 1500 m Final W70+"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V65",
-    "day": 7,
-    "time": "12:30",
-    "desc": "1500 m 1500 m Final W65"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V60",
-    "day": 7,
-    "time": "12:40",
-    "desc": "1500 m 1500 m Final W60"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V55",
-    "day": 7,
-    "time": "12:50",
-    "desc": "1500 m 1500 m Final W55"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V50",
-    "day": 7,
-    "time": "13:00",
-    "desc": "1500 m 1500 m Final W50"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V45",
-    "day": 7,
-    "time": "13:10",
-    "desc": "1500 m 1500 m Final W45"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V40",
-    "day": 7,
-    "time": "13:19",
-    "desc": "1500 m 1500 m Final W40"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "F",
-    "ageGroup": "V35",
-    "day": 7,
-    "time": "13:28",
-    "desc": "1500 m 1500 m Final W35"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V80",
-    "day": 7,
-    "time": "13:37",
-    "desc": "1500 m 1500 m Final M80+"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V85",
-    "day": 7,
-    "time": "13:37",
-    "desc": "1500 m 1500 m Final M80+"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V90",
-    "day": 7,
-    "time": "13:37",
-    "desc": "1500 m 1500 m Final M80+"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V95",
-    "day": 7,
-    "time": "13:37",
-    "desc": "1500 m 1500 m Final M80+"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V75",
-    "day": 7,
-    "time": "13:47",
-    "desc": "1500 m 1500 m Final M75"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V70",
-    "day": 7,
-    "time": "13:57",
-    "desc": "1500 m 1500 m Final M70"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V65",
-    "day": 7,
-    "time": "14:07",
-    "desc": "1500 m 1500 m Final M65"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V60",
-    "day": 7,
-    "time": "14:16",
-    "desc": "1500 m 1500 m Final M60"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V55",
-    "day": 7,
-    "time": "14:25",
-    "desc": "1500 m 1500 m Final M55"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V50",
-    "day": 7,
-    "time": "14:34",
-    "desc": "1500 m 1500 m Final M50"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V45",
-    "day": 7,
-    "time": "14:42",
-    "desc": "1500 m 1500 m Final M45"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V40",
-    "day": 7,
-    "time": "14:50",
-    "desc": "1500 m 1500 m Final M40"
-  },
-  {
-    "eventCode": "1500",
-    "gender": "M",
-    "ageGroup": "V35",
-    "day": 7,
-    "time": "14:58",
-    "desc": "1500 m 1500 m Final M35"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "X",
-    "ageGroup": "V80",
-    "day": 7,
-    "time": "15:30",
-    "desc": "4x200 4x200 MIX Final 80"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "X",
-    "ageGroup": "V75",
-    "day": 7,
-    "time": "15:40",
-    "desc": "4x200 4x200 MIX Final 75"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "X",
-    "ageGroup": "V70",
-    "day": 7,
-    "time": "15:50",
-    "desc": "4x200 4x200 MIX Final 70"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "X",
-    "ageGroup": "V65",
-    "day": 7,
-    "time": "16:00",
-    "desc": "4x200 4x200 MIX Final 65"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "X",
-    "ageGroup": "V60",
-    "day": 7,
-    "time": "16:10",
-    "desc": "4x200 4x200 MIX Final 60"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "X",
-    "ageGroup": "V55",
-    "day": 7,
-    "time": "16:20",
-    "desc": "4x200 4x200 MIX Final 55"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "X",
-    "ageGroup": "V50",
-    "day": 7,
-    "time": "16:30",
-    "desc": "4x200 4x200 MIX Final 50"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "X",
-    "ageGroup": "V45",
-    "day": 7,
-    "time": "16:40",
-    "desc": "4x200 4x200 MIX Final 45"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "X",
-    "ageGroup": "V40",
-    "day": 7,
-    "time": "16:49",
-    "desc": "4x200 4x200 MIX Final 40"
-  },
-  {
-    "eventCode": "4x200",
-    "gender": "X",
-    "ageGroup": "V35",
-    "day": 7,
-    "time": "16:58",
-    "desc": "4x200 4x200 MIX Final 35"
-  }
-];
+const emacs2026Schedule = {"version":1,"columns":["eventCode","genders","ageMin","ageMax","day","time","desc"],"strings":["400","08:30","400 m 400 m Heats M35","08:54","400 m 400 m Heats M40","LJ","09:00","Long Jump W80+ Final","HT","Hammer M35 Final","09:30","400 m 400 m Heats M45","10:20","Long Jump W75 Final","10:00","Hammer M40 Final","400 m 400 m Heats M50","11:30","Long Jump W70 Final","400 m 400 m Heats M55","13:00","Long Jump W65 Final","10:50","400 m 400 m Heats M60","14:40","Long Jump W60 Final","WT","Weight Throw M45 Final","11:26","400 m 400 m Heats M65","12:50","Weight Throw M50 Final","11:50","400 m 400 m Heats M70","14:20","Weight Throw M55 Final","12:10","400 m 400 m Heats M75","16:00","Weight Throw M60 Final","12:34","400 m 400 m Heats W35","12:58","400 m 400 m Heats W40","HJ","High Jump W65 Final","10:45","High Jump W60 Final","3000","13:22","3000 m 3000 m Final W65+","12:30","High Jump W55 Final","DT","Discus W35 Final","13:50","3000 m 3000 m Final W60","14:00","High Jump W50 Final","10:10","Discus W40 Final","14:13","3000 m 3000 m Final W55","15:30","High Jump W45 Final","11:45","Discus W45 Final","14:35","3000 m 3000 m Final W50","17:00","High Jump W40 Final","13:05","Discus W50 Final","14:55","3000 m 3000 m Final W45","Discus W55 Final","15:10","3000 m 3000 m Final W40","15:50","Discus W60 Final","15:25","3000 m 3000 m Final W35","15:40","3000 m 3000 m Final M80+","16:07","3000 m 3000 m Final M75","High Jump M60 Final","16:32","3000 m 3000 m Final M70","High Jump M55 Final","JT","11:00","Javelin M90 Final","16:56","3000 m 3000 m Final M65","13:30","High Jump M50 Final","Javelin M80-85 Final","17:18","3000 m 3000 m Final M60","15:15","High Jump M45 Final","Javelin M75 Final","17:37","3000 m 3000 m Final M55","16:45","High Jump M40 Final","14:45","Javelin M70 Final","17:54","3000 m 3000 m Final A M50","18:30","High Jump M35 Final","16:20","Javelin M65 Final","18:11","3000 m 3000 m Final B M50","18:27","3000 m 3000 m Final A M45","18:43","3000 m 3000 m Final B M45","18:59","3000 m 3000 m Final M40","High Jump W35 Final","19:14","3000 m 3000 m Final A M35","10:05","High Jump M85+ Final","19:30","3000 m 3000 m Final B M35","11:25","High Jump M80 Final","12:40","High Jump M75 Final","3000W","19:45","RW 3000m RW Final W70+","14:25","High Jump M70 Final","20:25","RW 3000m RW Final W65","16:30","High Jump M65 Final","20:55","RW 3000m RW Final M75","21:28","RW 3000m RW Final M80+","60H","60m 60m hurdles Heats W35","09:11","60m 60m hurdles Heats W40","Long Jump M40 Final","Weight Throw M75 Final","09:21","60m 60m hurdles Heats W45","Long Jump W35 Final","10:25","Weight Throw M80+ Final","09:32","60m 60m hurdles Heats W50","12:25","Long Jump W40 Final","09:47","60m 60m hurdles Heats W55","14:05","Long Jump W45 Final","09:58","60m 60m hurdles Heats W60","15:20","Long Jump W50 Final","Hammer W35 Final","10:08","60m 60m hurdles Heats W65","17:05","Long Jump W55 Final","13:25","Hammer W40 Final","18:40","Long Jump M35 Final","Hammer W45 Final","400 m 400 m SF M35","Hammer W50 Final","10:32","400 m 400 m SF M40","10:44","400 m 400 m SF M45","12:00","High Jump W70 Final","10:56","400 m 400 m SF M50","13:45","High Jump W75+ Final","Discus W65 Final","11:08","400 m 400 m SF M55","10:35","Discus W70 Final","11:20","400 m 400 m SF M60","Discus W75 Final","11:32","400 m 400 m SF M65","SP","Shot Put M35 Final","Discus W80+ Final","11:44","400 m 400 m SF M70","10:15","Shot Put M40 Final","11:56","400 m 400 m SF M75","Shot Put M45 Final","12:08","400 m 400 m SF M80","Shot Put M50 Final","Javelin W60 Final","12:20","400 m 400 m SF W35","15:00","Shot Put M55 Final","16:10","Javelin W55 Final","12:32","400 m 400 m SF W40","16:35","Shot Put M60 Final","400 m 400 m SF W45","Shot Put M65 Final","13:08","400 m 400 m SF W50","20:00","Shot Put M70 Final","13:26","400 m 400 m SF W55","13:44","400 m 400 m SF W60","13:58","400 m 400 m SF W65","14:10","400 m 400 m SF W70","RW 3000m RW Final W35-40","14:50","RW 3000m RW Final W45-50","RW 3000m RW Final W55-60","15:45","RW 3000m RW Final M35-40","RW 3000m RW Final M45","RW 3000m RW Final M50","RW 3000m RW Final M55-60","17:35","RW 3000m RW Final M65","18:05","RW 3000m RW Final M70","18:35","60 m 60 m hurdles Final W35","60 m 60 m hurdles Final W40","18:45","60 m 60 m hurdles Final W45","18:50","60 m 60 m hurdles Final W50","18:55","60 m 60 m hurdles Final W55","19:00","60 m 60 m hurdles Final W60","19:05","60 m 60 m hurdles Final W65","19:10","60 m 60 m hurdles Final W70","19:16","60 m 60 m hurdles Final W75","19:22","60 m 60 m hurdles Final W80+","60","60 m 60 m M35 Heats","09:05","60 m 60 m M40 Heats","08:00","Shot Put W35 Final","Weight Throw W65 Final","09:50","60 m 60 m M45 Heats","09:10","Shot Put W40 Final","Weight Throw W70 Final","60 m 60 m M50 Heats","10:40","Shot Put W45 Final","12:05","Weight Throw W75 Final","60 m 60 m M55 Heats","Shot Put W50 Final","Weight Throw W80+ Final","60 m 60 m M60 Heats","13:40","Shot Put W55 Final","Weight Throw M65 Final","60 m 60 m M65 Heats","Shot Put W60 Final","16:25","Weight Throw M70 Final","60 m 60 m M75 Heats","17:10","Shot Put M75 Final","12:45","60 m 60 m W35 Heats","Shot Put M80 Final","60 m 60 m W40 Heats","20:15","Shot Put M85+ Final","Discus M35 Final","13:35","60 m 60 m W45 Heats","10:30","Discus M40 Final","13:55","60 m 60 m W50 Heats","60 m 60 m W55 Heats","Long Jump M45 Final","60 m 60 m W65 Heats","09:45","Long Jump M50 Final","Javelin M45 Final","Long Jump M55 Final","13:20","Javelin M50 Final","400 m 400 m M35 Final","Long Jump M60 Final","Javelin M55 Final","15:16","400 m 400 m M40 Final","Long Jump M65 Final","16:15","Javelin M60 Final","15:22","400 m 400 m M45 Final","16:50","Long Jump M70 Final","15:28","400 m 400 m M50 Final","15:34","400 m 400 m M55 Final","400 m 400 m M60 Final","TJ","18:20","Triple Jump W60 Final","5K","Road Race M35-50 Final","15:46","400 m 400 m M65 Final","19:40","Triple Jump W65 Final","11:05","Road Race M55+ Final","15:52","400 m 400 m M70 Final","21:00","Triple Jump W70+ Final","15:58","400 m 400 m M75 Final","16:04","400 m 400 m M80 Final","400 m 400 m M85 Final","16:16","400 m 400 m M90+ Final","Long Jump M75 Final","16:22","400 m 400 m W80+ Final","Long Jump M80 Final","16:28","400 m 400 m W75 Final","Long Jump M85+ Final","16:34","400 m 400 m W70 Final","16:40","400 m 400 m W65 Final","16:46","400 m 400 m W60 Final","16:52","400 m 400 m W55 Final","16:58","400 m 400 m W50 Final","17:04","400 m 400 m W45 Final","400 m 400 m W40 Final","17:16","400 m 400 m W35 Final","17:25","60 m 60 m M35 SF","17:40","60 m 60 m M40 SF","17:55","60 m 60 m M45 SF","18:10","60 m 60 m M50 SF","18:25","60 m 60 m M55 SF","60 m 60 m M60 SF","60 m 60 m M65 SF","60 m 60 m M70 SF","60 m 60 m M75 SF","19:20","60 m 60 m M80 SF","60 m 60 m W80 SF","60 m 60 m W75 SF","19:50","60 m 60 m W70 SF","20:05","60 m 60 m W65 SF","60 m 60 m W60 SF","20:30","60 m 60 m W55 SF","20:40","60 m 60 m W50 SF","20:50","60 m 60 m W45 SF","60 m 60 m W40 SF","21:10","60 m 60 m W35 SF","PEN","Pentathlon 60m hurdles Pentathlon M35","Pentathlon 60m hurdles Pentathlon M40","Pentathlon M35 Pentathlon","Discus M60 Final","Pentathlon M40 Pentathlon","Discus M65 Final","800","09:15","800 m 800 m Heats M35","Pentathlon M45 Pentathlon","Discus M70 Final","800 m 800 m Heats M40","Pentathlon M50 Pentathlon","Discus M75 Final","10:11","800 m 800 m Heats M45","Pentathlon M55-gr.1 Pentathlon","Discus M80 Final","Pentathlon M55-gr.2 Pentathlon","Discus M85+ Final","10:43","Pentathlon 60m hurdles Pentathlon M45","800 m 800 m Heats M50","Triple Jump M85+ Final","Hammer M55 Final","800 m 800 m Heats M55","Triple Jump M60 Final","18:00","Triple Jump M65 Final","12:02","Pentathlon 60m hurdles Pentathlon M50","19:55","Triple Jump M70 Final","Javelin M35 Final","21:05","Triple Jump M75-80 Final","Javelin M40 Final","800 m 800 m Heats M60","Pentathlon 60m hurdles Pentathlon M55","Weight Throw W35-40 Final","Pentathlon M35","Weight Throw W45 Final","800 m 800 m Heats M65","14:30","Pentathlon M45","Weight Throw W50 Final","13:49","800 m 800 m Heats M70","Pentathlon M55-gr.1","12:55","Weight Throw W55 Final","800 m 800 m Heats M75","Weight Throw W60 Final","14:29","800 m 800 m Heats M80","800 m 800 m Heats W60","Hammer M50 Final","Pentathlon 1000 m Pentathlon M35","17:50","Hammer M45 Final","Pentathlon 1000 m Pentathlon M40","17:45","800 m 800 m Heats W55","15:54","800 m 800 m Heats W50","PV","Pole Vault W35-40 Final","800 m 800 m Heats W45","Pole Vault W45-50 Final","800 m 800 m Heats W40","Pole Vault W55-60 Final","800 m 800 m Heats W35","Pole Vault W65+ Final","60 m 60 m Final W35","60 m 60 m Final W40","Shot Put W80+ Final","17:15","60 m 60 m Final W45","17:20","60 m 60 m Final W50","60 m 60 m Final W55","17:30","60 m 60 m Final W60","60 m 60 m Final W65","60 m 60 m Final W70","60 m 60 m Final W75","Pentathlon W75 Final","60 m 60 m Final W80","Pentathlon W70 Final","60 m 60 m Final W85+","Pentathlon W65 Final","Pentathlon 1000 m Pentathlon M45","Pentathlon 1000 m Pentathlon M50","60 m 60 m Final M90+","60 m 60 m Final M85","60 m 60 m Final M80","60 m 60 m Final M75","60 m 60 m Final M70","60 m 60 m Final M65","60 m 60 m Final M60","19:15","60 m 60 m Final M55","60 m 60 m Final M50","19:25","60 m 60 m Final M45","60 m 60 m Final M40","19:35","60 m 60 m Final M35","Pentathlon 1000 m Pentathlon M55","200","200 m 200 m Heats W35","08:50","Pentathlon M80-85 Pentathlon","Javelin W65 Final","08:20","Pentathlon 60m Hurdles Pentathlon M80-85","09:40","Pentathlon M75 Pentathlon","Javelin W70 Final","Pentathlon M70 Pentathlon","Javelin W75 Final","08:25","200 m 200 m Heats W40","Pentathlon M65 gr.1 Pentathlon","Javelin W80+ Final","13:15","Pentathlon M65 gr.2 Pentathlon","Pentathlon 60m Hurdles Pentathlon M75","Pentathlon M60 gr.1 Pentathlon","Pentathlon M60 gr.2 Pentathlon","Discus M45 Final","200 m 200 m Heats W45","Discus M50 Final","200 m 200 m Heats W50","Discus M55 Final","Triple Jump W35,W45 Final","Pentathlon 60m Hurdles Pentathlon M70","Triple Jump W40 Final","Triple Jump W50-55 Final","Hammer M85+ Final","200 m 200 m Heats W55","200 m 200 m Heats W60","200 m 200 m Heats M70","Weight Throw M35-40 Final","200 m 200 m Heats M75","11:40","Pentathlon 60m Hurdles Pentathlon M65","Hammer M60 Final","Hammer M65 Final","200 m 200 m Heats M65","Hammer M70 Final","200 m 200 m Heats M60","Hammer M75 Final","Hammer M80 Final","Pentathlon 60m Hurdles Pentathlon M60","Pentathlon 1000m Pentathlon M80-85","Pentathlon 1000 m Pentathlon M75","200 m 200 m Heats M55","200 m 200 m Heats M50","Pole Vault M35 Final","16:05","200 m 200 m Heats M45","Pole Vault M40 Final","Pole Vault M45 Final","RW W35-50 Final","Pentathlon 1000 m Pentathlon M70","Pole Vault M50 Final","RW W55+ Final","200 m 200 m Heats M40","RW M35-50 Final","12:15","RW M55-65 Final","Pentathlon 1000 m Pentathlon M65","RW M70+ Final","200 m 200 m Heats M35","800 m 800 m Final W35","18:52","800 m 800 m Final W40","800 m 800 m Final W45","19:06","800 m 800 m Final W50","19:13","800 m 800 m Final W55","800 m 800 m Final W60","19:27","800 m 800 m Final W65","19:34","Pentathlon 1000 m Pentathlon M60","19:49","800 m 800 m Final W70","19:57","800 m 800 m Final W75","800 m 800 m Final W80+","20:13","800 m 800 m Final M35","20:20","800 m 800 m Final M40","20:27","800 m 800 m Final M45","20:34","800 m 800 m Final M50","20:41","800 m 800 m Final M55","20:48","800 m 800 m Final M60","800 m 800 m Final M65","21:02","800 m 800 m Final M70","800 m 800 m Final M75","21:18","800 m 800 m Final M80","21:26","800 m 800 m Final M85+","21:34","200m 200m SF W75","21:44","200m 200m SF W70","21:59","200m 200m SF W65","22:14","200m 200m SF W60","22:24","200m 200m SF W55","22:34","200m 200m SF W50","22:44","200m 200m SF W45","22:54","200m 200m SF W40","23:09","200m 200m SF W35","08:15","Pentathlon 60 m hurdles Pentathlon W70+","Pentathlon 60 m hurdles Pentathlon W60-65","Pentathlon W70+ Pentathlon","Hammer W55","12:35","Pentathlon W60-65 Pentathlon","Hammer W60","08:36","60 m 60 m hurdles Heats M70","Pentathlon W55 Pentathlon","Hammer W65","08:47","60 m 60 m hurdles Heats M65","15:05","Pentathlon W50 Pentathlon","14:15","Hammer W70","09:02","60 m 60 m hurdles Heats M60","Pentathlon W40-45 Pentathlon","Hammer W75","09:18","60 m 60 m hurdles Heats M55","18:15","Pentathlon W35 Pentathlon","Hammer W80+","09:33","60 m 60 m hurdles Heats M50","09:43","60 m 60 m hurdles Heats M45","09:53","60 m 60 m hurdles Heats M40","Javelin W50 Final","10:03","60 m 60 m hurdles Heats M35","TripleJump M45 Final","Javelin W45 Final","TripleJump M40 Final","Javelin W35-40 Final","10:14","Pentathlon 60 m hurdles Pentathlon W55","TripleJump M35 Final","10:24","200 m 200 m SF M85","10:34","200 m 200 m SF M80","Pentathlon 60 m hurdles Pentathlon W50","10:59","200 m 200 m SF M75","11:14","200 m 200 m SF M70","11:29","200 m 200 m SF M65","Pentathlon 60 m hurdles Pentathlon W40-45","XC","Cross Country W55-65 Final","Cross Country W35-50 Final","200 m 200 m SF M60","Cross Country M60-65 Final","200 m 200 m SF M55","Cross Country M50-55 Final","200 m 200 m SF M50","Pole Vault M55 Final","Cross Country M35-45 Final","200 m 200 m SF M45","Pole Vault M60 Final","200 m 200 m SF M40","Pole Vault M65 Final","200 m 200 m SF M35","Pole Vault M70 Final","Pentathlon 800 m Pentathlon W70+","13:38","Pentathlon 800 m Pentathlon W60-65","1500","13:46","1500m 1500m Heats M35","1500m 1500m Heats M40","14:26","Pentathlon 60 m hurdles Pentathlon W35","14:36","Pentathlon 800 m Pentathlon W55","14:52","1500m 1500m Heats M45","15:08","1500m 1500m Heats M50","15:32","1500m 1500m Heats M55","15:59","1500m 1500m Heats M60","16:26","1500m 1500m Heats M65","16:53","1500m 1500m Heats M70","17:11","1500m 1500m Heats M75","17:29","Pentathlon 800 m Pentathlon W50","1500m 1500m Heats W45","17:53","1500m 1500m Heats W50","18:09","1500m 1500m Heats W55","Pentathlon 800 m Pentathlon W40-45","200 m 200 m Final W35","18:48","200 m 200 m Final W40","18:53","200 m 200 m Final W45","18:58","200 m 200 m Final W50","19:03","200 m 200 m Final W55","19:08","200 m 200 m Final W60","200 m 200 m Final W65","19:18","200 m 200 m Final W70","19:23","200 m 200 m Final W75","19:28","200 m 200 m Final W80","19:33","200 m 200 m Final W85","19:38","Pentathlon 800 m Pentathlon W35","19:46","200 m 200 m Final M95","19:51","200 m 200 m Final M90","19:56","200 m 200 m Final M85","20:01","200 m 200 m Final M80","20:06","200 m 200 m Final M75","20:11","200 m 200 m Final M70","20:16","200 m 200 m Final M65","20:21","200 m 200 m Final M60","20:26","200 m 200 m Final M55","20:31","200 m 200 m Final M50","20:36","200 m 200 m Final M45","200 m 200 m Final M40","20:46","200 m 200 m Final M35","20:51","60 m 60 m hurdles Final M85+","20:56","60 m 60 m hurdles Final M80","21:01","60 m 60 m hurdles Final M75","21:06","60 m 60 m hurdles Final M70","21:11","60 m 60 m hurdles Final M65","21:16","60 m 60 m hurdles Final M60","21:21","60 m 60 m hurdles Final M55","60 m 60 m hurdles Final M50","21:31","60 m 60 m hurdles Final M45","21:36","60 m 60 m hurdles Final M40","21:41","60 m 60 m hurdles Final M35","4x200","4x200 4x200 m Final M80","4x200 4x200 m Final W80","Triple Jump M50 Final","09:20","4x200 4x200 m Final M75","Triple Jump M55 Final","4x200 4x200 m Final W75","4x200 4x200 m Final M70","4x200 4x200 m Final W70","4x200 4x200 m Final M65","Pole Vault M75 Final","4x200 4x200 m Final W65","Pole Vault M80+ Final","4x200 4x200 m Final M60","4x200 4x200 m Final W60","4x200 4x200 m Final M55","4x200 4x200 m Final W55","4x200 4x200 m Final M50","11:10","4x200 4x200 m Final W50","4x200 4x200 m Final M45","4x200 4x200 m Final W45","4x200 4x200 m Final M40","4x200 4x200 m Final W40","4x200 4x200 m Final M35","4x200 4x200 m Final W35","1500 m 1500 m Final W70+","1500 m 1500 m Final W65","1500 m 1500 m Final W60","1500 m 1500 m Final W55","1500 m 1500 m Final W50","13:10","1500 m 1500 m Final W45","13:19","1500 m 1500 m Final W40","13:28","1500 m 1500 m Final W35","13:37","1500 m 1500 m Final M80+","13:47","1500 m 1500 m Final M75","13:57","1500 m 1500 m Final M70","14:07","1500 m 1500 m Final M65","14:16","1500 m 1500 m Final M60","1500 m 1500 m Final M55","14:34","1500 m 1500 m Final M50","14:42","1500 m 1500 m Final M45","1500 m 1500 m Final M40","14:58","1500 m 1500 m Final M35","4x200 4x200 MIX Final 80","4x200 4x200 MIX Final 75","4x200 4x200 MIX Final 70","4x200 4x200 MIX Final 65","4x200 4x200 MIX Final 60","4x200 4x200 MIX Final 55","4x200 4x200 MIX Final 50","4x200 4x200 MIX Final 45","16:49","4x200 4x200 MIX Final 40","4x200 4x200 MIX Final 35"],"slots":[[0,"M",35,35,1,1,2],[0,"M",40,40,1,3,4],[5,"F",80,null,1,6,7],[8,"M",35,35,1,6,9],[0,"M",45,45,1,10,11],[5,"F",75,75,1,12,13],[8,"M",40,40,1,14,15],[0,"M",50,50,1,14,16],[5,"F",70,70,1,17,18],[0,"M",55,55,1,12,19],[5,"F",65,65,1,20,21],[0,"M",60,60,1,22,23],[5,"F",60,60,1,24,25],[26,"M",45,45,1,17,27],[0,"M",65,65,1,28,29],[26,"M",50,50,1,30,31],[0,"M",70,70,1,32,33],[26,"M",55,55,1,34,35],[0,"M",75,75,1,36,37],[26,"M",60,60,1,38,39],[0,"F",35,35,1,40,41],[0,"F",40,40,1,42,43],[44,"F",65,65,1,6,45],[44,"F",60,60,1,46,47],[48,"F",65,null,1,49,50],[44,"F",55,55,1,51,52],[53,"F",35,35,1,6,54],[48,"F",60,60,1,55,56],[44,"F",50,50,1,57,58],[53,"F",40,40,1,59,60],[48,"F",55,55,1,61,62],[44,"F",45,45,1,63,64],[53,"F",45,45,1,65,66],[48,"F",50,50,1,67,68],[44,"F",40,40,1,69,70],[53,"F",50,50,1,71,72],[48,"F",45,45,1,73,74],[53,"F",55,55,1,34,75],[48,"F",40,40,1,76,77],[53,"F",60,60,1,78,79],[48,"F",35,35,1,80,81],[48,"M",80,null,1,82,83],[48,"M",75,75,1,84,85],[44,"M",60,60,1,6,86],[48,"M",70,70,1,87,88],[44,"M",55,55,1,17,89],[90,"M",90,90,1,91,92],[48,"M",65,65,1,93,94],[44,"M",50,50,1,95,96],[90,"M",80,85,1,32,97],[48,"M",60,60,1,98,99],[44,"M",45,45,1,100,101],[90,"M",75,75,1,95,102],[48,"M",55,55,1,103,104],[44,"M",40,40,1,105,106],[90,"M",70,70,1,107,108],[48,"M",50,50,1,109,110],[44,"M",35,35,1,111,112],[90,"M",65,65,1,113,114],[48,"M",50,50,1,115,116],[48,"M",45,45,1,117,118],[48,"M",45,45,1,119,120],[48,"M",40,40,1,121,122],[44,"F",35,35,1,6,123],[48,"M",35,35,1,124,125],[44,"M",85,null,1,126,127],[48,"M",35,35,1,128,129],[44,"M",80,80,1,130,131],[44,"M",75,75,1,132,133],[134,"F",70,null,1,135,136],[44,"M",70,70,1,137,138],[134,"F",65,65,1,139,140],[44,"M",65,65,1,141,142],[134,"M",75,75,1,143,144],[134,"M",80,null,1,145,146],[147,"F",35,35,2,6,148],[147,"F",40,40,2,149,150],[5,"M",40,40,2,6,151],[26,"M",75,75,2,6,152],[147,"F",45,45,2,153,154],[5,"F",35,35,2,91,155],[26,"M",80,null,2,156,157],[147,"F",50,50,2,158,159],[5,"F",40,40,2,160,161],[147,"F",55,55,2,162,163],[5,"F",45,45,2,164,165],[147,"F",60,60,2,166,167],[5,"F",50,50,2,168,169],[8,"F",35,35,2,36,170],[147,"F",65,65,2,171,172],[5,"F",55,55,2,173,174],[8,"F",40,40,2,175,176],[5,"M",35,35,2,177,178],[8,"F",45,45,2,107,179],[0,"M",35,35,2,12,180],[8,"F",50,50,2,38,181],[0,"M",40,40,2,182,183],[0,"M",45,45,2,184,185],[44,"F",70,70,2,186,187],[0,"M",50,50,2,188,189],[44,"F",75,null,2,190,191],[53,"F",65,65,2,6,192],[0,"M",55,55,2,193,194],[53,"F",70,70,2,195,196],[0,"M",60,60,2,197,198],[53,"F",75,75,2,186,199],[0,"M",65,65,2,200,201],[202,"M",35,35,2,6,203],[53,"F",80,null,2,95,204],[0,"M",70,70,2,205,206],[202,"M",40,40,2,207,208],[0,"M",75,75,2,209,210],[202,"M",45,45,2,65,211],[0,"M",80,80,2,212,213],[202,"M",50,50,2,175,214],[90,"F",60,60,2,107,215],[0,"F",35,35,2,216,217],[202,"M",55,55,2,218,219],[90,"F",55,55,2,220,221],[0,"F",40,40,2,222,223],[202,"M",60,60,2,224,225],[0,"F",45,45,2,30,226],[202,"M",65,65,2,111,227],[0,"F",50,50,2,228,229],[202,"M",70,70,2,230,231],[0,"F",55,55,2,232,233],[0,"F",60,60,2,234,235],[0,"F",65,65,2,236,237],[0,"F",70,70,2,238,239],[134,"F",35,40,2,137,240],[134,"F",45,50,2,241,242],[134,"F",55,60,2,100,243],[134,"M",35,40,2,244,245],[134,"M",45,45,2,220,246],[134,"M",50,50,2,224,247],[134,"M",55,60,2,173,248],[134,"M",65,65,2,249,250],[134,"M",70,70,2,251,252],[147,"F",35,35,2,253,254],[147,"F",40,40,2,177,255],[147,"F",45,45,2,256,257],[147,"F",50,50,2,258,259],[147,"F",55,55,2,260,261],[147,"F",60,60,2,262,263],[147,"F",65,65,2,264,265],[147,"F",70,70,2,266,267],[147,"F",75,75,2,268,269],[147,"F",80,null,2,270,271],[272,"M",35,35,3,1,273],[272,"M",40,40,3,274,275],[202,"F",35,35,3,276,277],[26,"F",65,65,3,6,278],[272,"M",45,45,3,279,280],[202,"F",40,40,3,281,282],[26,"F",70,70,3,46,283],[272,"M",50,50,3,156,284],[202,"F",45,45,3,285,286],[26,"F",75,75,3,287,288],[272,"M",55,55,3,91,289],[202,"F",50,50,3,216,290],[26,"F",80,null,3,95,291],[272,"M",60,60,3,17,292],[202,"F",55,55,3,293,294],[26,"M",65,65,3,24,295],[272,"M",65,65,3,186,296],[202,"F",60,60,3,63,297],[26,"M",70,70,3,298,299],[272,"M",75,75,3,160,300],[202,"M",75,75,3,301,302],[272,"F",35,35,3,303,304],[202,"M",80,80,3,258,305],[272,"F",40,40,3,71,306],[202,"M",85,null,3,307,308],[53,"M",35,35,3,6,309],[272,"F",45,45,3,310,311],[53,"M",40,40,3,312,313],[272,"F",50,50,3,314,315],[272,"F",55,55,3,137,316],[5,"M",45,45,3,276,317],[272,"F",65,65,3,241,318],[5,"M",50,50,3,319,320],[90,"M",45,45,3,186,321],[5,"M",55,55,3,130,322],[90,"M",50,50,3,323,324],[0,"M",35,35,3,76,325],[5,"M",60,60,3,175,326],[90,"M",55,55,3,107,327],[0,"M",40,40,3,328,329],[5,"M",65,65,3,218,330],[90,"M",60,60,3,331,332],[0,"M",45,45,3,333,334],[5,"M",70,70,3,335,336],[0,"M",50,50,3,337,338],[0,"M",55,55,3,339,340],[0,"M",60,60,3,82,341],[342,"F",60,60,3,343,344],[345,"M",35,50,3,91,346],[0,"M",65,65,3,347,348],[342,"F",65,65,3,349,350],[345,"M",55,null,3,351,352],[0,"M",70,70,3,353,354],[342,"F",70,null,3,355,356],[0,"M",75,75,3,357,358],[0,"M",80,80,3,359,360],[0,"M",85,85,3,220,361],[0,"M",90,null,3,362,363],[5,"M",75,75,3,14,364],[0,"F",80,null,3,365,366],[5,"M",80,80,3,17,367],[0,"F",75,75,3,368,369],[5,"M",85,null,3,132,370],[0,"F",70,70,3,371,372],[0,"F",65,65,3,373,374],[0,"F",60,60,3,375,376],[0,"F",55,55,3,377,378],[0,"F",50,50,3,379,380],[0,"F",45,45,3,381,382],[0,"F",40,40,3,301,383],[0,"F",35,35,3,384,385],[272,"M",35,35,3,386,387],[272,"M",40,40,3,388,389],[272,"M",45,45,3,390,391],[272,"M",50,50,3,392,393],[272,"M",55,55,3,394,395],[272,"M",60,60,3,253,396],[272,"M",65,65,3,256,397],[272,"M",70,70,3,260,398],[272,"M",75,75,3,266,399],[272,"M",80,80,3,400,401],[272,"F",80,80,3,128,402],[272,"F",75,75,3,349,403],[272,"F",70,70,3,404,405],[272,"F",65,65,3,406,407],[272,"F",60,60,3,307,408],[272,"F",55,55,3,409,410],[272,"F",50,50,3,411,412],[272,"F",45,45,3,413,414],[272,"F",40,40,3,355,415],[272,"F",35,35,3,416,417],[418,"M",35,35,4,1,419],[418,"M",40,40,4,6,420],[418,"M",35,35,4,281,421],[53,"M",60,60,4,1,422],[418,"M",40,40,4,156,423],[53,"M",65,65,4,59,424],[425,"M",35,35,4,426,427],[418,"M",45,45,4,17,428],[53,"M",70,70,4,186,429],[425,"M",40,40,4,162,430],[418,"M",50,50,4,51,431],[53,"M",75,75,4,310,432],[425,"M",45,45,4,433,434],[418,"M",55,55,4,57,435],[53,"M",80,80,4,218,436],[418,"M",55,55,4,100,437],[53,"M",85,null,4,220,438],[418,"M",45,45,4,439,440],[425,"M",50,50,4,91,441],[342,"M",85,null,4,276,442],[8,"M",55,55,4,388,443],[425,"M",55,55,4,200,444],[342,"M",60,60,4,113,445],[342,"M",65,65,4,446,447],[418,"M",50,50,4,448,449],[342,"M",70,70,4,450,451],[90,"M",35,35,4,38,452],[342,"M",75,80,4,453,454],[90,"M",40,40,4,173,455],[425,"M",60,60,4,216,456],[418,"M",55,55,4,20,457],[26,"F",35,40,4,1,458],[418,"M",35,35,4,17,459],[26,"F",45,45,4,12,460],[425,"M",65,65,4,175,461],[418,"M",45,45,4,462,463],[26,"F",50,50,4,17,464],[425,"M",70,70,4,465,466],[418,"M",55,55,4,111,467],[26,"F",55,55,4,468,469],[425,"M",75,75,4,61,470],[26,"F",60,60,4,24,471],[425,"M",80,80,4,472,473],[425,"F",60,60,4,107,474],[418,"M",40,40,4,303,423],[8,"M",50,50,4,113,475],[418,"M",35,35,4,218,476],[418,"M",50,50,4,82,431],[8,"M",45,45,4,477,478],[418,"M",40,40,4,100,479],[418,"M",55,55,4,480,437],[425,"F",55,55,4,63,481],[425,"F",50,50,4,482,483],[484,"F",35,40,4,6,485],[425,"F",45,45,4,220,486],[484,"F",45,50,4,17,487],[425,"F",40,40,4,371,488],[484,"F",55,60,4,57,489],[425,"F",35,35,4,335,490],[484,"F",65,null,4,69,491],[272,"F",35,35,4,173,492],[272,"F",40,40,4,301,493],[202,"F",80,null,4,6,494],[272,"F",45,45,4,495,496],[418,"M",35,35,4,207,421],[272,"F",50,50,4,497,498],[418,"M",40,40,4,17,423],[272,"F",55,55,4,386,499],[418,"M",45,45,4,71,428],[272,"F",60,60,4,500,501],[418,"M",50,50,4,164,431],[272,"F",65,65,4,249,502],[418,"M",55,55,4,100,435],[272,"F",70,70,4,388,503],[418,"M",55,55,4,141,437],[272,"F",75,75,4,480,504],[418,"F",75,75,4,480,505],[272,"F",80,80,4,477,506],[418,"F",70,70,4,266,507],[272,"F",85,null,4,390,508],[418,"F",65,65,4,409,509],[418,"M",45,45,4,446,510],[418,"M",50,50,4,343,511],[272,"M",90,null,4,177,512],[272,"M",85,85,4,256,513],[272,"M",80,80,4,258,514],[272,"M",75,75,4,260,515],[272,"M",70,70,4,262,516],[272,"M",65,65,4,264,517],[272,"M",60,60,4,266,518],[272,"M",55,55,4,519,520],[272,"M",50,50,4,400,521],[272,"M",45,45,4,522,523],[272,"M",40,40,4,128,524],[272,"M",35,35,4,525,526],[418,"M",55,55,4,135,527],[528,"F",35,35,5,276,529],[418,"M",80,85,5,530,531],[90,"F",65,65,5,6,532],[418,"M",80,85,5,533,534],[418,"M",75,75,5,535,536],[90,"F",70,70,5,312,537],[418,"M",70,70,5,285,538],[90,"F",75,75,5,65,539],[528,"F",40,40,5,540,541],[418,"M",65,65,5,36,542],[90,"F",80,null,5,303,543],[418,"M",65,65,5,544,545],[418,"M",75,75,5,6,546],[418,"M",60,60,5,57,547],[418,"M",60,60,5,100,548],[53,"M",45,45,5,186,549],[528,"F",45,45,5,274,550],[53,"M",50,50,5,175,551],[528,"F",50,50,5,10,552],[53,"M",55,55,5,218,553],[342,"F",35,35,5,141,554],[342,"F",45,45,5,141,554],[418,"M",70,70,5,14,555],[342,"F",40,40,5,446,556],[342,"F",50,55,5,128,557],[8,"M",85,null,5,105,558],[528,"F",55,55,5,207,559],[528,"F",60,60,5,312,560],[528,"M",70,70,5,22,561],[26,"M",35,40,5,6,562],[528,"M",75,75,5,197,563],[418,"M",80,85,5,285,531],[418,"M",70,70,5,175,538],[418,"M",65,65,5,564,565],[418,"M",65,65,5,80,545],[8,"M",60,60,5,46,566],[418,"M",60,60,5,480,548],[8,"M",65,65,5,36,567],[528,"M",65,65,5,287,568],[8,"M",70,70,5,57,569],[528,"M",60,60,5,30,570],[8,"M",75,75,5,63,571],[8,"M",80,80,5,69,572],[418,"M",60,60,5,190,573],[418,"M",75,75,5,17,536],[418,"M",80,85,5,238,574],[418,"M",65,65,5,34,542],[418,"M",75,75,5,34,575],[418,"M",60,60,5,373,547],[528,"M",55,55,5,462,576],[528,"M",50,50,5,168,577],[484,"M",35,35,5,6,578],[528,"M",45,45,5,579,580],[484,"M",40,40,5,91,581],[484,"M",45,45,5,57,582],[134,"F",35,50,5,14,583],[418,"M",70,70,5,335,584],[484,"M",50,50,5,331,585],[134,"F",55,null,5,285,586],[528,"M",40,40,5,69,587],[134,"M",35,50,5,564,588],[418,"M",80,85,5,319,531],[134,"M",55,65,5,589,590],[418,"M",65,65,5,480,591],[418,"M",75,75,5,195,536],[134,"M",70,null,5,20,592],[418,"M",70,70,5,186,538],[528,"M",35,35,5,446,593],[418,"M",65,65,5,544,542],[418,"M",65,65,5,34,545],[425,"F",35,35,5,256,594],[418,"M",60,60,5,168,547],[425,"F",40,40,5,595,596],[418,"M",60,60,5,141,548],[425,"F",45,45,5,121,597],[425,"F",50,50,5,598,599],[425,"F",55,55,5,600,601],[425,"F",60,60,5,400,602],[425,"F",65,65,5,603,604],[418,"M",60,60,5,605,606],[425,"F",70,70,5,607,608],[425,"F",75,75,5,609,610],[425,"F",80,null,5,406,611],[425,"M",35,35,5,612,613],[425,"M",40,40,5,614,615],[425,"M",45,45,5,616,617],[425,"M",50,50,5,618,619],[425,"M",55,55,5,620,621],[425,"M",60,60,5,622,623],[425,"M",65,65,5,143,624],[425,"M",70,70,5,625,626],[425,"M",75,75,5,416,627],[425,"M",80,80,5,628,629],[425,"M",85,null,5,630,631],[528,"F",75,75,5,632,633],[528,"F",70,70,5,634,635],[528,"F",65,65,5,636,637],[528,"F",60,60,5,638,639],[528,"F",55,55,5,640,641],[528,"F",50,50,5,642,643],[528,"F",45,45,5,644,645],[528,"F",40,40,5,646,647],[528,"F",35,35,5,648,649],[418,"F",70,null,6,650,651],[418,"F",60,65,6,540,652],[418,"F",70,null,6,564,653],[8,"F",55,55,6,6,654],[418,"F",60,65,6,655,656],[8,"F",60,60,6,46,657],[147,"M",70,70,6,658,659],[418,"F",55,55,6,95,660],[8,"F",65,65,6,51,661],[147,"M",65,65,6,662,663],[418,"F",50,50,6,664,665],[8,"F",70,70,6,666,667],[147,"M",60,60,6,668,669],[418,"F",40,45,6,298,670],[8,"F",75,75,6,244,671],[147,"M",55,55,6,672,673],[418,"F",35,35,6,674,675],[8,"F",80,null,6,301,676],[147,"M",50,50,6,677,678],[147,"M",45,45,6,679,680],[147,"M",40,40,6,681,682],[90,"F",50,50,6,6,683],[147,"M",35,35,6,684,685],[342,"M",45,45,6,6,686],[90,"F",45,45,6,12,687],[342,"M",40,40,6,207,688],[90,"F",35,40,6,564,689],[418,"F",55,55,6,690,691],[342,"M",35,35,6,519,692],[528,"M",85,85,6,693,694],[528,"M",80,80,6,695,696],[418,"F",70,null,6,530,653],[418,"F",50,50,6,184,697],[418,"F",55,55,6,46,660],[418,"F",40,45,6,51,670],[528,"M",75,75,6,698,699],[528,"M",70,70,6,700,701],[528,"M",65,65,6,702,703],[418,"F",60,65,6,6,656],[418,"F",40,45,6,205,704],[418,"F",50,50,6,197,665],[705,"F",55,65,6,14,706],[418,"F",35,35,6,218,675],[705,"F",35,50,6,46,707],[528,"M",60,60,6,186,708],[705,"M",60,65,6,17,709],[528,"M",55,55,6,589,710],[705,"M",50,55,6,589,711],[528,"M",50,50,6,51,712],[484,"M",55,55,6,6,713],[705,"M",35,45,6,20,714],[528,"M",45,45,6,303,715],[484,"M",60,60,6,186,716],[528,"M",40,40,6,20,717],[484,"M",65,65,6,57,718],[528,"M",35,35,6,544,719],[484,"M",70,70,6,141,720],[418,"F",70,null,6,95,721],[418,"F",60,65,6,722,723],[418,"F",70,null,6,312,653],[418,"F",60,65,6,197,656],[724,"M",35,35,6,725,726],[418,"F",55,55,6,216,660],[724,"M",40,40,6,238,727],[418,"F",50,50,6,293,665],[418,"F",40,45,6,218,670],[418,"F",35,35,6,728,729],[418,"F",35,35,6,141,675],[418,"F",55,55,6,730,731],[724,"M",45,45,6,732,733],[724,"M",50,50,6,734,735],[724,"M",55,55,6,736,737],[724,"M",60,60,6,738,739],[724,"M",65,65,6,740,741],[724,"M",70,70,6,742,743],[724,"M",75,75,6,744,745],[418,"F",50,50,6,746,747],[724,"F",45,45,6,103,748],[724,"F",50,50,6,749,750],[724,"F",55,55,6,751,752],[418,"F",40,45,6,117,753],[528,"F",35,35,6,119,754],[528,"F",40,40,6,755,756],[528,"F",45,45,6,757,758],[528,"F",50,50,6,759,760],[528,"F",55,55,6,761,762],[528,"F",60,60,6,763,764],[528,"F",65,65,6,600,765],[528,"F",70,70,6,766,767],[528,"F",75,75,6,768,769],[528,"F",80,80,6,770,771],[528,"F",85,85,6,772,773],[418,"F",35,35,6,774,775],[528,"M",95,95,6,776,777],[528,"M",90,90,6,778,779],[528,"M",85,85,6,780,781],[528,"M",80,80,6,782,783],[528,"M",75,75,6,784,785],[528,"M",70,70,6,786,787],[528,"M",65,65,6,788,789],[528,"M",60,60,6,790,791],[528,"M",55,55,6,792,793],[528,"M",50,50,6,794,795],[528,"M",45,45,6,796,797],[528,"M",40,40,6,620,798],[528,"M",35,35,6,799,800],[147,"M",85,null,6,801,802],[147,"M",80,80,6,803,804],[147,"M",75,75,6,805,806],[147,"M",70,70,6,807,808],[147,"M",65,65,6,809,810],[147,"M",60,60,6,811,812],[147,"M",55,55,6,813,814],[147,"M",50,50,6,630,815],[147,"M",45,45,6,816,817],[147,"M",40,40,6,818,819],[147,"M",35,35,6,820,821],[822,"M",80,80,7,6,823],[822,"F",80,80,7,281,824],[342,"M",50,50,7,6,825],[822,"M",75,75,7,826,827],[342,"M",55,55,7,312,828],[822,"F",75,75,7,10,829],[822,"M",70,70,7,535,830],[822,"F",70,70,7,279,831],[822,"M",65,65,7,14,832],[484,"M",75,75,7,6,833],[822,"F",65,65,7,59,834],[484,"M",80,null,7,91,835],[822,"M",60,60,7,12,836],[822,"F",60,60,7,312,837],[822,"M",55,55,7,285,838],[822,"F",55,55,7,22,839],[822,"M",50,50,7,91,840],[822,"F",50,50,7,841,842],[822,"M",45,45,7,197,843],[822,"F",45,45,7,17,844],[822,"M",40,40,7,564,845],[822,"F",40,40,7,32,846],[822,"M",35,35,7,186,847],[822,"F",35,35,7,36,848],[724,"F",70,null,7,216,849],[724,"F",65,65,7,51,850],[724,"F",60,60,7,132,851],[724,"F",55,55,7,30,852],[724,"F",50,50,7,20,853],[724,"F",45,45,7,854,855],[724,"F",40,40,7,856,857],[724,"F",35,35,7,858,859],[724,"M",80,null,7,860,861],[724,"M",75,75,7,862,863],[724,"M",70,70,7,864,865],[724,"M",65,65,7,866,867],[724,"M",60,60,7,868,869],[724,"M",55,55,7,137,870],[724,"M",50,50,7,871,872],[724,"M",45,45,7,873,874],[724,"M",40,40,7,241,875],[724,"M",35,35,7,876,877],[822,"X",80,80,7,63,878],[822,"X",75,75,7,82,879],[822,"X",70,70,7,78,880],[822,"X",65,65,7,38,881],[822,"X",60,60,7,220,882],[822,"X",55,55,7,113,883],[822,"X",50,50,7,141,884],[822,"X",45,45,7,373,885],[822,"X",40,40,7,886,887],[822,"X",35,35,7,379,888]]};
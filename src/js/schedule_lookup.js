@@ -0,0 +1 @@
+const emacs2026When = {"1500|F|V35":[7,"13:28"],"1500|F|V40":[7,"13:19"],"1500|F|V45":[6,"17:37"],"1500|F|V50":[6,"17:53"],"1500|F|V55":[6,"18:09"],"1500|F|V60":[7,"12:40"],"1500|F|V65":[7,"12:30"],"1500|F|V70":[7,"12:20"],"1500|F|V75":[7,"12:20"],"1500|F|V80":[7,"12:20"],"1500|F|V85":[7,"12:20"],"1500|M|V35":[6,"13:46"],"1500|M|V40":[6,"14:10"],"1500|M|V45":[6,"14:52"],"1500|M|V50":[6,"15:08"],"1500|M|V55":[6,"15:32"],"1500|M|V60":[6,"15:59"],"1500|M|V65":[6,"16:26"],"1500|M|V70":[6,"16:53"],"1500|M|V75":[6,"17:11"],"1500|M|V80":[7,"13:37"],"1500|M|V85":[7,"13:37"],"1500|M|V90":[7,"13:37"],"200|F|V35":[5,"08:00"],"200|F|V40":[5,"08:25"],"200|F|V45":[5,"09:05"],"200|F|V50":[5,"09:30"],"200|F|V55":[5,"10:15"],"200|F|V60":[5,"10:30"],"200|F|V65":[5,"21:59"],"200|F|V70":[5,"21:44"],"200|F|V75":[5,"21:34"],"200|F|V80":[6,"19:28"],"200|F|V85":[6,"19:33"],"200|M|V35":[5,"18:00"],"200|M|V40":[5,"17:00"],"200|M|V45":[5,"16:05"],"200|M|V50":[5,"15:20"],"200|M|V55":[5,"14:30"],"200|M|V60":[5,"12:50"],"200|M|V65":[5,"12:05"],"200|M|V70":[5,"10:50"],"200|M|V75":[5,"11:20"],"200|M|V80":[6,"10:34"],"200|M|V85":[6,"10:24"],"200|M|V90":[6,"19:51"],"200|M|V95":[6,"19:46"],"3000|F|V35":[1,"15:25"],"3000|F|V40":[1,"15:10"],"3000|F|V45":[1,"14:55"],"3000|F|V50":[1,"14:35"],"3000|F|V55":[1,"14:13"],"3000|F|V60":[1,"13:50"],"3000|F|V65":[1,"13:22"],"3000|F|V70":[1,"13:22"],"3000|F|V75":[1,"13:22"],"3000|F|V80":[1,"13:22"],"3000|M|V35":[1,"19:14"],"3000|M|V40":[1,"18:59"],"3000|M|V45":[1,"18:27"],"3000|M|V50":[1,"17:54"],"3000|M|V55":[1,"17:37"],"3000|M|V60":[1,"17:18"],"3000|M|V65":[1,"16:56"],"3000|M|V70":[1,"16:32"],"3000|M|V75":[1,"16:07"],"3000|M|V80":[1,"15:40"],"3000|M|V85":[1,"15:40"],"3000|M|V90":[1,"15:40"],"3000W|F|V35":[2,"14:25"],"3000W|F|V40":[2,"14:25"],"3000W|F|V45":[2,"14:50"],"3000W|F|V50":[2,"14:50"],"3000W|F|V55":[2,"15:15"],"3000W|F|V60":[2,"15:15"],"3000W|F|V65":[1,"20:25"],"3000W|F|V70":[1,"19:45"],"3000W|F|V75":[1,"19:45"],"3000W|F|V85":[1,"19:45"],"3000W|F|V90":[1,"19:45"],"3000W|M|V35":[2,"15:45"],"3000W|M|V40":[2,"15:45"],"3000W|M|V45":[2,"16:10"],"3000W|M|V50":[2,"16:35"],"3000W|M|V55":[2,"17:05"],"3000W|M|V60":[2,"17:05"],"3000W|M|V65":[2,"17:35"],"3000W|M|V70":[2,"18:05"],"3000W|M|V75":[1,"20:55"],"3000W|M|V80":[1,"21:28"],"3000W|M|V85":[1,"21:28"],"3000W|M|V90":[1,"21:28"],"400|F|V35":[1,"12:34"],"400|F|V40":[1,"12:58"],"400|F|V45":[2,"12:50"],"400|F|V50":[2,"13:08"],"400|F|V55":[2,"13:26"],"400|F|V60":[2,"13:44"],"400|F|V65":[2,"13:58"],"400|F|V70":[2,"14:10"],"400|F|V75":[3,"16:28"],"400|F|V80":[3,"16:22"],"400|F|V85":[3,"16:22"],"400|M|V35":[1,"08:30"],"400|M|V40":[1,"08:54"],"400|M|V45":[1,"09:30"],"400|M|V50":[1,"10:00"],"400|M|V55":[1,"10:20"],"400|M|V60":[1,"10:50"],"400|M|V65":[1,"11:26"],"400|M|V70":[1,"11:50"],"400|M|V75":[1,"12:10"],"400|M|V80":[2,"12:08"],"400|M|V85":[3,"16:10"],"400|M|V90":[3,"16:16"],"400|M|V95":[3,"16:16"],"5K|F|V35":null,"5K|F|V40":null,"5K|F|V45":null,"5K|F|V50":null,"5K|F|V55":null,"5K|F|V60":null,"5K|F|V65":null,"5K|F|V70":null,"5K|F|V75":null,"5K|F|V80":null,"5K|M|V35":[3,"11:00"],"5K|M|V40":[3,"11:00"],"5K|M|V45":[3,"11:00"],"5K|M|V50":[3,"11:00"],"5K|M|V55":[3,"11:05"],"5K|M|V60":[3,"11:05"],"5K|M|V65":[3,"11:05"],"5K|M|V70":[3,"11:05"],"5K|M|V75":[3,"11:05"],"5K|M|V80":[3,"11:05"],"5K|M|V85":[3,"11:05"],"5K|M|V90":[3,"11:05"],"5KW|F|V35":null,"5KW|F|V40":null,"5KW|F|V45":null,"5KW|F|V50":null,"5KW|F|V55":null,"5KW|F|V60":null,"5KW|F|V65":null,"5KW|F|V70":null,"5KW|F|V75":null,"5KW|F|V80":null,"5KW|F|V85":null,"5KW|M|V35":null,"5KW|M|V40":null,"5KW|M|V45":null,"5KW|M|V50":null,"5KW|M|V55":null,"5KW|M|V60":null,"5KW|M|V65":null,"5KW|M|V70":null,"5KW|M|V75":null,"5KW|M|V80":null,"5KW|M|V85":null,"60|F|V35":[3,"12:45"],"60|F|V40":[3,"13:05"],"60|F|V45":[3,"13:35"],"60|F|V50":[3,"13:55"],"60|F|V55":[3,"14:25"],"60|F|V60":[3,"20:15"],"60|F|V65":[3,"14:50"],"60|F|V70":[3,"19:50"],"60|F|V75":[3,"19:40"],"60|F|V80":[3,"19:30"],"60|F|V85":[4,"17:55"],"60|F|V90":[4,"17:55"],"60|M|V35":[3,"08:30"],"60|M|V40":[3,"09:05"],"60|M|V45":[3,"09:50"],"60|M|V50":[3,"10:25"],"60|M|V55":[3,"11:00"],"60|M|V60":[3,"11:30"],"60|M|V65":[3,"12:00"],"60|M|V70":[3,"18:55"],"60|M|V75":[3,"12:25"],"60|M|V80":[3,"19:20"],"60|M|V85":[4,"18:45"],"60|M|V90":[4,"18:40"],"60|M|V95":[4,"18:40"],"60H|F|V35":[2,"09:00"],"60H|F|V40":[2,"09:11"],"60H|F|V45":[2,"09:21"],"60H|F|V50":[2,"09:32"],"60H|F|V55":[2,"09:47"],"60H|F|V60":[2,"09:58"],"60H|F|V65":[2,"10:08"],"60H|F|V70":[2,"19:10"],"60H|F|V75":[2,"19:16"],"60H|F|V80":[2,"19:22"],"60H|F|V85":[2,"19:22"],"60H|M|V35":[6,"10:03"],"60H|M|V40":[6,"09:53"],"60H|M|V45":[6,"09:43"],"60H|M|V50":[6,"09:33"],"60H|M|V55":[6,"09:18"],"60H|M|V60":[6,"09:02"],"60H|M|V65":[6,"08:47"],"60H|M|V70":[6,"08:36"],"60H|M|V75":[6,"21:01"],"60H|M|V80":[6,"20:56"],"60H|M|V85":[6,"20:51"],"60H|M|V90":[6,"20:51"],"800|F|V35":[4,"16:50"],"800|F|V40":[4,"16:34"],"800|F|V45":[4,"16:10"],"800|F|V50":[4,"15:54"],"800|F|V55":[4,"15:30"],"800|F|V60":[4,"14:45"],"800|F|V65":[5,"19:27"],"800|F|V70":[5,"19:49"],"800|F|V75":[5,"19:57"],"800|F|V80":[5,"20:05"],"800|F|V85":[5,"20:05"],"800|M|V35":[4,"09:15"],"800|M|V40":[4,"09:47"],"800|M|V45":[4,"10:11"],"800|M|V50":[4,"11:00"],"800|M|V55":[4,"11:32"],"800|M|V60":[4,"12:20"],"800|M|V65":[4,"13:25"],"800|M|V70":[4,"13:49"],"800|M|V75":[4,"14:13"],"800|M|V80":[4,"14:29"],"800|M|V85":[5,"21:26"],"800|M|V90":[5,"21:26"],"DT|F|V35":[1,"09:00"],"DT|F|V40":[1,"10:10"],"DT|F|V45":[1,"11:45"],"DT|F|V50":[1,"13:05"],"DT|F|V55":[1,"14:20"],"DT|F|V60":[1,"15:50"],"DT|F|V65":[2,"09:00"],"DT|F|V70":[2,"10:35"],"DT|F|V75":[2,"12:00"],"DT|F|V80":[2,"13:30"],"DT|F|V85":[2,"13:30"],"DT|F|V90":[2,"13:30"],"DT|M|V35":[3,"09:00"],"DT|M|V40":[3,"10:30"],"DT|M|V45":[5,"12:00"],"DT|M|V50":[5,"13:25"],"DT|M|V55":[5,"15:00"],"DT|M|V60":[4,"08:30"],"DT|M|V65":[4,"10:10"],"DT|M|V70":[4,"12:00"],"DT|M|V75":[4,"13:35"],"DT|M|V80":[4,"15:00"],"DT|M|V85":[4,"16:10"],"DT|M|V90":[4,"16:10"],"DT|X|V50":null,"HJ|F|V35":[1,"09:00"],"HJ|F|V40":[1,"17:00"],"HJ|F|V45":[1,"15:30"],"HJ|F|V50":[1,"14:00"],"HJ|F|V55":[1,"12:30"],"HJ|F|V60":[1,"10:45"],"HJ|F|V65":[1,"09:00"],"HJ|F|V70":[2,"12:00"],"HJ|F|V75":[2,"13:45"],"HJ|F|V80":[2,"13:45"],"HJ|M|V35":[1,"18:30"],"HJ|M|V40":[1,"16:45"],"HJ|M|V45":[1,"15:15"],"HJ|M|V50":[1,"13:30"],"HJ|M|V55":[1,"11:30"],"HJ|M|V60":[1,"09:00"],"HJ|M|V65":[1,"16:30"],"HJ|M|V70":[1,"14:25"],"HJ|M|V75":[1,"12:40"],"HJ|M|V80":[1,"11:25"],"HJ|M|V85":[1,"10:05"],"HJ|M|V90":[1,"10:05"],"HT|F|V35":[2,"12:10"],"HT|F|V40":[2,"13:25"],"HT|F|V45":[2,"14:45"],"HT|F|V50":[2,"16:00"],"HT|F|V55":[6,"09:00"],"HT|F|V60":[6,"10:45"],"HT|F|V65":[6,"12:30"],"HT|F|V70":[6,"14:15"],"HT|F|V75":[6,"15:45"],"HT|F|V80":[6,"17:10"],"HT|F|V85":[6,"17:10"],"HT|F|V90":[6,"17:10"],"HT|M|V35":[1,"09:00"],"HT|M|V40":[1,"10:00"],"HT|M|V45":[4,"17:50"],"HT|M|V50":[4,"16:20"],"HT|M|V55":[4,"17:40"],"HT|M|V60":[5,"10:45"],"HT|M|V65":[5,"12:10"],"HT|M|V70":[5,"14:00"],"HT|M|V75":[5,"15:30"],"HT|M|V80":[5,"17:00"],"HT|M|V85":[5,"16:45"],"HT|M|V90":[5,"16:45"],"JT|F|V35":[6,"11:40"],"JT|F|V40":[6,"11:40"],"JT|F|V45":[6,"10:20"],"JT|F|V50":[6,"09:00"],"JT|F|V55":[2,"16:10"],"JT|F|V60":[2,"14:45"],"JT|F|V65":[5,"09:00"],"JT|F|V70":[5,"10:30"],"JT|F|V75":[5,"11:45"],"JT|F|V80":[5,"12:45"],"JT|F|V85":[5,"12:45"],"JT|F|V90":[5,"12:45"],"JT|M|V35":[4,"16:00"],"JT|M|V40":[4,"17:05"],"JT|M|V45":[3,"12:00"],"JT|M|V50":[3,"13:20"],"JT|M|V55":[3,"14:45"],"JT|M|V60":[3,"16:15"],"JT|M|V65":[1,"16:20"],"JT|M|V70":[1,"14:45"],"JT|M|V75":[1,"13:30"],"JT|M|V80":[1,"11:50"],"JT|M|V85":[1,"11:50"],"JT|M|V90":[1,"11:00"],"LJ|F|V35":[2,"11:00"],"LJ|F|V40":[2,"12:25"],"LJ|F|V45":[2,"14:05"],"LJ|F|V50":[2,"15:20"],"LJ|F|V55":[2,"17:05"],"LJ|F|V60":[1,"14:40"],"LJ|F|V65":[1,"13:00"],"LJ|F|V70":[1,"11:30"],"LJ|F|V75":[1,"10:20"],"LJ|F|V80":[1,"09:00"],"LJ|F|V85":[1,"09:00"],"LJ|F|V90":[1,"09:00"],"LJ|M|V35":[2,"18:40"],"LJ|M|V40":[2,"09:00"],"LJ|M|V45":[3,"08:00"],"LJ|M|V50":[3,"09:45"],"LJ|M|V55":[3,"11:25"],"LJ|M|V60":[3,"13:25"],"LJ|M|V65":[3,"15:00"],"LJ|M|V70":[3,"16:50"],"LJ|M|V75":[3,"10:00"],"LJ|M|V80":[3,"11:30"],"LJ|M|V85":[3,"12:40"],"LJ|M|V90":[3,"12:40"],"LJ|M|V95":[3,"12:40"],"OT|F|V35":null,"OT|F|V40":null,"OT|F|V45":null,"OT|F|V50":null,"OT|F|V55":null,"OT|F|V60":null,"OT|F|V65":null,"OT|F|V70":null,"OT|F|V75":null,"OT|F|V80":null,"OT|F|V85":null,"OT|F|V90":null,"OT|M|V35":null,"OT|M|V40":null,"OT|M|V45":null,"OT|M|V50":null,"OT|M|V55":null,"OT|M|V60":null,"OT|M|V65":null,"OT|M|V70":null,"OT|M|V75":null,"OT|M|V80":null,"OT|M|V85":null,"OT|M|V90":null,"PEN|F|V35":[6,"18:15"],"PEN|F|V40":[6,"16:25"],"PEN|F|V45":[6,"16:25"],"PEN|F|V50":[6,"15:05"],"PEN|F|V55":[6,"13:30"],"PEN|F|V60":[6,"08:25"],"PEN|F|V65":[4,"20:30"],"PEN|F|V70":[4,"19:10"],"PEN|F|V75":[4,"17:45"],"PEN|F|V80":[6,"08:15"],"PEN|F|V85":[6,"08:15"],"PEN|M|V35":[4,"08:30"],"PEN|M|V40":[4,"09:00"],"PEN|M|V45":[4,"11:30"],"PEN|M|V50":[4,"12:30"],"PEN|M|V55":[4,"14:00"],"PEN|M|V60":[5,"14:00"],"PEN|M|V65":[5,"12:10"],"PEN|M|V70":[5,"10:40"],"PEN|M|V75":[5,"09:40"],"PEN|M|V80":[5,"08:50"],"PEN|M|V85":[5,"08:50"],"PV|F|V35":[4,"09:00"],"PV|F|V40":[4,"09:00"],"PV|F|V45":[4,"11:30"],"PV|F|V50":[4,"11:30"],"PV|F|V55":[4,"14:00"],"PV|F|V60":[4,"14:00"],"PV|F|V65":[4,"17:00"],"PV|F|V70":[4,"17:00"],"PV|F|V75":[4,"17:00"],"PV|M|V35":[5,"09:00"],"PV|M|V40":[5,"11:00"],"PV|M|V45":[5,"14:00"],"PV|M|V50":[5,"16:15"],"PV|M|V55":[6,"09:00"],"PV|M|V60":[6,"12:00"],"PV|M|V65":[6,"14:00"],"PV|M|V70":[6,"16:30"],"PV|M|V75":[7,"09:00"],"PV|M|V80":[7,"11:00"],"PV|M|V85":[7,"11:00"],"SP|F|V35":[3,"08:00"],"SP|F|V40":[3,"09:10"],"SP|F|V45":[3,"10:40"],"SP|F|V50":[3,"12:20"],"SP|F|V55":[3,"13:40"],"SP|F|V60":[3,"15:30"],"SP|F|V65":null,"SP|F|V70":null,"SP|F|V75":null,"SP|F|V80":[4,"09:00"],"SP|F|V85":[4,"09:00"],"SP|F|V90":[4,"09:00"],"SP|M|V35":[2,"09:00"],"SP|M|V40":[2,"10:15"],"SP|M|V45":[2,"11:45"],"SP|M|V50":[2,"13:25"],"SP|M|V55":[2,"15:00"],"SP|M|V60":[2,"16:35"],"SP|M|V65":[2,"18:30"],"SP|M|V70":[2,"20:00"],"SP|M|V75":[3,"17:10"],"SP|M|V80":[3,"18:50"],"SP|M|V85":[3,"20:15"],"SP|M|V90":[3,"20:15"],"TJ|F|V35":[5,"16:30"],"TJ|F|V40":[5,"18:00"],"TJ|F|V45":[5,"16:30"],"TJ|F|V50":[5,"19:30"],"TJ|F|V55":[5,"19:30"],"TJ|F|V60":[3,"18:20"],"TJ|F|V65":[3,"19:40"],"TJ|F|V70":[3,"21:00"],"TJ|F|V75":[3,"21:00"],"TJ|F|V80":[3,"21:00"],"TJ|F|V85":[3,"21:00"],"TJ|M|V35":[6,"19:15"],"TJ|M|V40":[6,"10:15"],"TJ|M|V45":[6,"09:00"],"TJ|M|V50":[7,"09:00"],"TJ|M|V55":[7,"10:30"],"TJ|M|V60":[4,"16:20"],"TJ|M|V65":[4,"18:00"],"TJ|M|V70":[4,"19:55"],"TJ|M|V75":[4,"21:05"],"TJ|M|V80":[4,"21:05"],"TJ|M|V85":[4,"08:00"],"TJ|M|V90":[4,"08:00"],"WT|F|V35":[4,"08:30"],"WT|F|V40":[4,"08:30"],"WT|F|V50":[4,"11:30"],"WT|F|V55":[4,"12:55"],"WT|F|V60":[4,"14:40"],"WT|F|V65":[3,"09:00"],"WT|F|V70":[3,"10:45"],"WT|F|V75":[3,"12:05"],"WT|M|V40":[5,"09:00"],"WT|M|V50":[1,"12:50"],"WT|M|V55":[1,"14:20"],"WT|M|V60":[1,"16:00"],"WT|M|V65":[3,"14:40"],"WT|M|V70":[3,"16:25"],"XC|F|V35":[6,"10:45"],"XC|F|V40":[6,"10:45"],"XC|F|V45":[6,"10:45"],"XC|F|V50":[6,"10:45"],"XC|F|V55":[6,"10:00"],"XC|F|V60":[6,"10:00"],"XC|F|V65":[6,"10:00"],"XC|F|V70":null,"XC|F|V75":null,"XC|F|V80":null,"XC|F|V85":null,"XC|M|V1040":null,"XC|M|V35":[6,"13:00"],"XC|M|V40":[6,"13:00"],"XC|M|V45":[6,"13:00"],"XC|M|V50":[6,"12:15"],"XC|M|V55":[6,"12:15"],"XC|M|V60":[6,"11:30"],"XC|M|V65":[6,"11:30"],"XC|M|V70":null,"XC|M|V75":null,"XC|M|V80":null,"XC|M|V85":null,"XC|M|V90":null};
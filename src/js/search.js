@@ -0,0 +1 @@
+const emacs2026Search = {"version":1,"fold":{"ł":"l","ø":"o","đ":"d","ð":"d","ħ":"h","ı":"i","ß":"ss","æ":"ae","œ":"oe","þ":"th"},"teams":{"ALB":"Albania","ALG":"Algeria","ARG":"Argentina","AUS":"Australia","AUT":"Austria","BAR":"Barbados","BEL":"Belgium","BLR":"Belarus","BUL":"Bulgaria","CAN":"Canada","CHI":"Chile","CMR":"Cameroon","CRO":"Croatia","CYP":"Cyprus","CZE":"Czech Republic","DEN":"Denmark","DMA":"Dominica","ESP":"Spain","EST":"Estonia","FIN":"Finland","FRA":"France","GBR":"United Kingdom","GER":"Germany","GRE":"Greece","HKG":"Hong Kong","HUN":"Hungary","IND":"India","IRI":"Iran, Islamic Republic of","IRL":"Ireland","ISL":"Iceland","ISR":"Israel","ITA":"Italy","JPN":"Japan","KAZ":"Kazakhstan","KOS":"Kosovo","LAT":"Latvia","LTU":"Lithuania","LUX":"Luxembourg","MAR":"Morocco","MAS":"Malaysia","MDA":"Moldova, Republic of","MLT":"Malta","NED":"Netherlands","NOR":"Norway","PAN":"Panama","PER":"Peru","POL":"Poland","POR":"Portugal","ROU":"Romania","RUS":"Russia","SLO":"Slovenia","SMR":"San Marino","SRB":"Serbia","SRI":"Sri Lanka","SUI":"Switzerland","SVK":"Slovakia","SWE":"Sweden","TUN":"Tunisia","TUR":"Turkey","UKR":"Ukraine","USA":"USA","VIN":"Saint Vincent and the Grenadines"},"bib":["_00TR","_013U","_0274","_02PZ","_030C","_035M","_0501","_0581","_0665","_06VB","_06Z8","_070J","_07DZ","_07M8","_07NA","_087U","_08HD","_08QJ","_09ST","_09TY","_09VH","_0A3R","_0A6L","_0AEP","_0AIB","_0BTW","_0CGY","_0COX","_0CY2","_0DAZ","_0DEP","_0DNH","_0E2A","_0E8J","_0ENG","_0EZ1","_0FBG","_0FM0","_0FXA","_0FZ3","_0G22","_0GS7","_0GWW","_0H0E","_0I8G","_0JFI","_0JIC","_0JMT","_0JNY","_0JTH","_0KDH","_0KHX","_0KNL","_0L5D","_0MQG","_0MRC","_0MRU","_0MZA","_0N54","_0NJS","_0NPY","_0Q8P","_0QIH","_0QK9","_0R58","_0RIM","_0RJ5","_0RWG","_0SCN","_0SDZ","_0STD","_0T1R","_0T2W","_0TDL","_0TGT","_0TUO","_0V94","_0VAK","_0VAM","_0VBG","_0VTF","_0W7L","_0W9E","_0WP6","_0WUW","_0WWU","_0WY7","_0XTP","_0XU3","_0XZQ","_0Y26","_0Y5K","_0YFK","_0YGJ","_0YM7","_0YO1","_0Z30","_0Z77","_0ZKB","_0ZRA","_0ZU4","_10F4","_11YL","_121G","_1237","_1273","_12B0","_12XB","_1302","_1391","_13MD","_13SI","_15Z1","_165A","_16TO","_16YK","_179T","_17ZF","_17ZX","_18A9","_191N","_1992","_19AH","_19HW","_19OH","_19TW","_19VV","_1AKU","_1AQM","_1AS8","_1AUC","_1AVG","_1B4U","_1B5F","_1B98","_1BTO","_1C0C","_1C7V","_1CNF","_1DP0","_1EEI","_1EP2","_1ER8","_1F6J","_1FEW","_1FY3","_1GC0","_1GHA","_1GWZ","_1HLU","_1HNG","_1HYR","_1I90","_1IUW","_1JJD","_1JZN","_1K42","_1K8N","_1KKA","_1KLI","_1KVR","_1LAJ","_1MGQ","_1MSC","_1NIQ","_1NTL","_1O83","_1O8I","_1O9C","_1OCJ","_1ORX","_1OV5","_1P1B","_1P7S","_1PHF","_1PHU","_1Q6X","_1QT4","_1R85","_1RIH","_1RWR","_1S9R","_1SAX","_1SDT","_1SXA","_1TNO","_1TOS","_1U0G","_1U44","_1U7B","_1UG6","_1VHP","_1VK3","_1VSB","_1VZD","_1W50","_1X62","_1XF3","_1XFP","_1XNL","_1XRO","_1XT2","_1YTE","_1YZ4","_1ZEI","_1ZLT","_1ZT6","_20E5","_20OT","_2165","_218Y","_21OH","_22P1","_236C","_24FO","_24QA","_24SM","_25HS","_25L1","_25R1","_25XM","_25XT","_26WN","_26WX","_27KK","_27UW","_28JY","_28Y1","_298A","_29HH","_29LY","_29O4","_29OC","_29WA","_29YJ","_2A1V","_2ALV","_2BBH","_2BBW","_2BE9","_2C0C","_2C2C","_2C3U","_2CER","_2D0R","_2D23","_2D3F","_2DB6","_2EA9","_2EH4","_2FHK","_2FWR","_2FXJ","_2G7Z","_2GME","_2GOR","_2H1X","_2H4R","_2H4U","_2H9R","_2HWJ","_2I1L","_2I7D","_2INF","_2IUQ","_2JB5","_2K3Y","_2K8X","_2K9G","_2KPE","_2L9W","_2LFK","_2MRT","_2NTW","_2NZ7","_2O72","_2OBU","_2OCO","_2OGR","_2OJ9","_2OW2","_2PI2","_2PTH","_2PU1","_2QJE","_2QM4","_2QUW","_2QWU","_2R2Q","_2RJ2","_2S4Q","_2T81","_2UFK","_2UHK","_2ULT","_2V3M","_2V5H","_2VBA","_2VJA","_2VYR","_2W4V","_2WB5","_2WE3","_2YCT","_2YKO","_2YOF","_2YP8","_2ZIS","_300F","_3077","_310Z","_31T4","_322U","_326N","_3277","_33B2","_33GJ","_33I6","_34CC","_34PL","_35EI","_35IF","_362U","_364W","_36C5","_3789","_37IS","_37ND","_37PR","_3865","_38Q1","_39BV","_39IS","_3ADG","_3AFY","_3ARR","_3BHZ","_3BRX","_3BWT","_3C2N","_3C47","_3D93","_3DKQ","_3DTB","_3E04","_3E3W","_3ELJ","_3FQF","_3FU4","_3GI5","_3GJC","_3GQL","_3GX9","_3H5C","_3HI5","_3HYT","_3IZP","_3JU1","_3KWU","_3L9V","_3LTQ","_3MES","_3MUA","_3MWL","_3NB0","_3NC4","_3NOU","_3NSN","_3NWM","_3OA3","_3OBY","_3OO0","_3PHX","_3PKH","_3PL4","_3PMF","_3PQ4","_3QB1","_3QH6","_3R3D","_3RR8","_3RT1","_3S3T","_3SB8","_3ST8","_3STK","_3SV6","_3SXW","_3SZU","_3T68","_3TDP","_3TF5","_3UFK","_3UFQ","_3UUY","_3V4G","_3VN5","_3VUP","_3WCN","_3WGL","_3WGZ","_3WY7","_3XP8","_3XSL","_3XX5","_3YNO","_3ZDA","_3ZYG","_41EW","_424G","_42X0","_43GS","_4454","_44UM","_44Z1","_451W","_4542","_45DP","_45H6","_45MW","_45P3","_45VH","_45Y7","_45Z7","_4608","_46NX","_46TM","_46V2","_46VN","_4828","_48I5","_48YV","_491V","_497E","_497S","_49I4","_49NG","_49R7","_4AI4","_4AQO","_4AZC","_4BE8","_4BLV","_4C2J","_4CBD","_4CGB","_4CJJ","_4EDX","_4EM8","_4ESH","_4EW8","_4F9M","_4G1Z","_4GM0","_4GML","_4GU5","_4H78","_4I3F","_4I6D","_4IQS","_4ITU","_4J88","_4JJ3","_4JL0","_4LO5","_4MXP","_4N1P","_4NHH","_4NX9","_4O6U","_4OBQ","_4PYA","_4Q0J","_4R0F","_4R7C","_4RS0","_4RUC","_4SNU","_4SOA","_4SX4","_4TG0","_4TKF","_4U2C","_4UTR","_4VCB","_4VJ9","_4VKD","_4VLF","_4W54","_4WK4","_4WLK","_4XA6","_4XRF","_4XRQ","_4Y0Y","_4Y1T","_4YDZ","_4YER","_4YP0","_4Z0Z","_4Z1M","_50M2","_50OV","_51QG","_51U6","_51V7","_5319","_53RP","_53ZY","_5461","_54FJ","_54XP","_54ZO","_55HK","_55N2","_56BO","_56IE","_56X6","_5725","_57HB","_57I7","_58AF","_58JN","_5920","_59A8","_59B8","_59PP","_59S2","_59YC","_5AEL","_5B1V","_5BAO","_5BMM","_5CAG","_5CAN","_5E2Q","_5E4S","_5E8O","_5EL6","_5EPU","_5EXH","_5F52","_5FIF","_5FXN","_5GBW","_5GLC","_5GUG","_5H7P","_5I29","_5IE4","_5IKF","_5IMT","_5IRQ","_5J4F","_5J7V","_5JPX","_5KFO","_5KT6","_5KTY","_5L3A","_5LGI","_5LH1","_5LLN","_5LQS","_5M2N","_5M3F","_5MJ0","_5MO0","_5MOS","_5MRO","_5MTQ","_5MUS","_5MXP","_5MYE","_5MYK","_5N1M","_5NZG","_5ODV","_5ORG","_5P4M","_5PI1","_5QK1","_5QMS","_5QRI","_5R8F","_5S0N","_5SFW","_5SG4","_5T83","_5TDF","_5TR4","_5TX8","_5UP3","_5UT7","_5V4V","_5V5W","_5VGC","_5VTN","_5VUS","_5WNF","_5X04","_5Y2F","_5YL3","_5YVV","_5ZDK","_5ZWJ","_609I","_60HL","_60QD","_60VL","_61IK","_61WC","_63YP","_6440","_646P","_64PG","_64XO","_650K","_651D","_659H","_6607","_665C","_678B","_67B0","_67E1","_67T8","_67Z3","_6838","_68AL","_68ZZ","_691R","_6924","_69ZY","_6A90","_6AQ4","_6BA7","_6BAJ","_6BKB","_6BW7","_6CH6","_6CSV","_6DCM","_6DM5","_6E70","_6E8Y","_6ED9","_6EGH","_6EH3","_6EHE","_6FEJ","_6G1Z","_6G4E","_6G6Y","_6H3E","_6HBZ","_6I0H","_6IAB","_6IDM","_6IQQ","_6IU3","_6J4T","_6JPO","_6JTI","_6JXC","_6KKJ","_6KWN","_6KZT","_6LCM","_6LGK","_6LRR","_6M5H","_6M5T","_6MUS","_6NB2","_6O2G","_6O33","_6OC0","_6OF0","_6P5M","_6PAR","_6PUC","_6Q5G","_6QSW","_6QV1","_6SQZ","_6SX2","_6SYA","_6TJY","_6TRG","_6TVF","_6V1W","_6VS6","_6VTG","_6VUH","_6WFP","_6WZ5","_6X1F","_6X8C","_6XTT","_6XXP","_6YBY","_6YVL","_6YWH","_6Z58","_6ZDF","_6ZH5","_70JS","_70SX","_716X","_71AS","_71B8","_71ZY","_72KO","_72MU","_74JY","_74OS","_74PW","_7512","_7541","_7543","_757O","_75CV","_75MC","_75YT","_76LE","_7857","_78FU","_78I2","_78P9","_79BA","_7APD","_7AZP","_7B3P","_7BFW","_7BVH","_7CZ5","_7DN7","_7DSY","_7DYW","_7EMY","_7EN9","_7ET0","_7F2M","_7F7I","_7FEC","_7G33","_7GBQ","_7GCV","_7GEK","_7GOW","_7H8V","_7HNK","_7HOZ","_7I3Q","_7IFU","_7IKO","_7INS","_7J4H","_7J7S","_7J99","_7JNB","_7JNP","_7JU2","_7JVT","_7JYS","_7KEI","_7KKD","_7LAY","_7LPZ","_7LVL","_7M4B","_7NCL","_7NTW","_7OFQ","_7OG0","_7OOF","_7P9T","_7PLZ","_7PTN","_7QB5","_7QPH","_7QTL","_7RCJ","_7RHT","_7SPW","_7TC1","_7TGM","_7TYC","_7U44","_7UCM","_7UDR","_7UI7","_7UMO","_7USD","_7VN0","_7VNX","_7VS3","_7VWI","_7WFR","_7WQU","_7X41","_7X7M","_7XG7","_7XOO","_7XUM","_7Y2L","_7Y45","_7Y65","_7YB9","_7YOD","_7Z8E","_7Z9G","_7ZI5","_80D5","_80N6","_80SF","_81Q0","_81Q2","_82C1","_8350","_838E","_83Q8","_83VV","_840X","_8436","_84C6","_84X8","_85C0","_86IF","_86MV","_86TR","_86V6","_879Q","_87LN","_87TZ","_8851","_887X","_88GR","_88YG","_894E","_894T","_8A68","_8A8D","_8ACP","_8AJD","_8AUM","_8AW6","_8B2K","_8B9Y","_8BOO","_8C6E","_8C7G","_8CF5","_8CJN","_8CTO","_8D8C","_8DCC","_8DDN","_8ECH","_8EJV","_8F36","_8F7Y","_8FMN","_8GGR","_8GMP","_8HDD","_8HPR","_8K7I","_8KD9","_8LPO","_8M07","_8M7E","_8MMY","_8NY5","_8O6V","_8OUQ","_8OVS","_8OWE","_8P7G","_8PAY","_8QHI","_8QST","_8QTF","_8QXQ","_8R18","_8R5B","_8RCA","_8RMC","_8RRI","_8RUG","_8SGF","_8SVG","_8T6B","_8TPP","_8U3W","_8UB7","_8UBD","_8UBR","_8UFN","_8UG6","_8V88","_8VIZ","_8VO9","_8XGV","_8XRN","_8XUS","_8Y1S","_8Y5Q","_8YN1","_8YSV","_8ZCF","_8ZJ4","_90GA","_91NO","_91VM","_92D4","_92OR","_93YP","_95Z0","_96I1","_96YE","_9702","_97DJ","_97EQ","_97RO","_97U1","_980P","_98GE","_98GK","_98X4","_99YK","_9ACE","_9AXD","_9B41","_9BLL","_9BM1","_9BQI","_9CD1","_9CSQ","_9DCI","_9DDM","_9DGK","_9FJP","_9FOV","_9FU5","_9G72","_9GJ4","_9GW6","_9GX4","_9HGZ","_9HN9","_9I5P","_9I9B","_9IHQ","_9JF1","_9JIV","_9K87","_9KNB","_9LHB","_9LMT","_9LNF","_9M7G","_9NWQ","_9P8A","_9PP7","_9PPP","_9PRS","_9QRJ","_9QWJ","_9RX7","_9S9X","_9SJM","_9SLG","_9TSE","_9UMO","_9V5M","_9V6A","_9VAW","_9VDO","_9VL8","_9W9O","_9WF0","_9X16","_9XQE","_9Y6V","_9YGT","_9YIK","_9YSY","_9YWL","_9YX0","_9ZF0","_A0I0","_A25Q","_A3F4","_A3MB","_A3NY","_A475","_A4CH","_A4PW","_A4SN","_A57Y","_A5L2","_A721","_A7H3","_A7S3","_A85O","_A895","_A8HV","_A8J5","_A8K5","_A8SW","_A95T","_A97C","_A9OP","_A9TP","_A9VL","_AAB3","_AAMN","_AB5H","_ABG8","_ABL8","_ABTR","_AC0B","_AC57","_AC5L","_ADFZ","_AF8W","_AFBO","_AFR4","_AFRD","_AFWM","_AHK4","_AHY4","_AI0K","_AJ86","_AJQC","_AJVQ","_AKC2","_AKDY","_AKJB","_ALOL","_AM19","_AM4N","_AMAL","_AME6","_AMKX","_AMT0","_AN2L","_ANRU","_ANY2","_AOOV","_AOZN","_AP4Q","_APNE","_APV8","_APZE","_AQF5","_AQT0","_AQZA","_AR0E","_AR9L","_ARD4","_ARQO","_ARWU","_AS5H","_AS7N","_ATKJ","_AUH6","_AUIO","_AURR","_AUVW","_AV1P","_AWIY","_AWIZ","_AWQO","_AX7P","_AXFP","_AY5D","_AYEY","_AYMM","_AZ1R","_AZ3W","_AZIJ","_AZN3","_AZXO","_B0VC","_B0VM","_B1BN","_B1X6","_B27F","_B2F6","_B2JE","_B3T5","_B449","_B4BB","_B560","_B6GD","_B6TZ","_B762","_B785","_B81P","_B8FJ","_B8OT","_B8XM","_B9ON","_BANT","_BBMU","_BBUF","_BBZ5","_BCI7","_BCL5","_BCS3","_BCWC","_BEDL","_BEEA","_BEU5","_BEXG","_BGBM","_BH8F","_BHVB","_BIEH","_BITK","_BJ25","_BJI2","_BJT1","_BK0F","_BK2P","_BK6Y","_BKIS","_BLK3","_BLM9","_BM2S","_BMBC","_BMHG","_BMVI","_BNZY","_BO9B","_BO9X","_BONP","_BP95","_BPIT","_BPJH","_BQ0E","_BQ5F","_BQZO","_BREZ","_BRJY","_BRPM","_BSHM","_BSVI","_BSYF","_BTDB","_BTNM","_BU3A","_BU92","_BUHR","_BVJG","_BVMB","_BWNU","_BWQU","_BWSA","_BX7Q","_BXCE","_BXI5","_BXJ2","_BY3Y","_BYH2","_BZ6O","_BZ9B","_C0Q4","_C14K","_C14Z","_C19N","_C1JH","_C1KA","_C203","_C2HQ","_C2OW","_C367","_C3QL","_C419","_C43U","_C4AV","_C4BG","_C57W","_C5UI","_C653","_C6UO","_C71D","_C73S","_C7IC","_C7KO","_C7NE","_C7W9","_C8QW","_C8X6","_C8ZS","_C97T","_C9GM","_C9N6","_CA1U","_CA6L","_CAMV","_CAYW","_CB0U","_CB7M","_CBGY","_CBHF","_CBJR","_CBSX","_CBX8","_CBYD","_CC50","_CCT7","_CD86","_CDS9","_CE1U","_CEC6","_CEEH","_CEUN","_CF9B","_CFUL","_CG2E","_CG3J","_CGE0","_CGPD","_CGW8","_CH8O","_CH98","_CHES","_CI64","_CII3","_CIY8","_CJ23","_CJBZ","_CJJA","_CKDH","_CLKC","_CLOO","_CM6Y","_CMBW","_CMQS","_CMR5","_CN3A","_CNDG","_CNG3","_COI1","_COO7","_COQU","_COWP","_CP5A","_CPDC","_CPE5","_CQ8W","_CQJA","_CQQ2","_CQRC","_CQSU","_CQWO","_CR6L","_CRBZ","_CRP8","_CRPK","_CRVX","_CS23","_CS76","_CT78","_CTCH","_CTK3","_CTKB","_CTZG","_CV78","_CVAA","_CVG6","_CVTN","_CW3J","_CW7H","_CW8Q","_CWPG","_CWRB","_CX56","_CXAV","_CXNK","_CXXU","_CY2W","_CYL9","_CYR6","_CYTY","_CZEL","_CZOV","_CZSZ","_D05E","_D0X9","_D15H","_D18S","_D2GU","_D2SE","_D2YE","_D330","_D48D","_D4C5","_D4CO","_D4HO","_D4RG","_D537","_D55E","_D5ZR","_D6AM","_D8AG","_D8EM","_D8F6","_D8H1","_D97M","_D9FG","_D9P3","_D9ZR","_DA2T","_DAQF","_DAWE","_DB3A","_DBER","_DBGX","_DC1L","_DCGS","_DCTL","_DCXR","_DD3M","_DD7O","_DDYS","_DEK4","_DEOF","_DFBD","_DFNN","_DGBT","_DH4U","_DH6M","_DHM8","_DHN1","_DHYO","_DI2U","_DISY","_DJCV","_DJVP","_DK6L","_DK7X","_DKFC","_DKFQ","_DLJV","_DLOJ","_DM4P","_DMFT","_DMHB","_DMJ4","_DNEC","_DNXK","_DO3G","_DOP5","_DQGL","_DQTK","_DREW","_DRUZ","_DSPT","_DTU1","_DTYT","_DTZM","_DU6W","_DUHT","_DVD7","_DVEQ","_DVN6","_DVSX","_DW4X","_DW8G","_DWLU","_DWVD","_DWYB","_DWYH","_DX38","_DX4H","_DXPF","_DYVQ","_DZ26","_E0OV","_E0RQ","_E0U5","_E2DB","_E2GS","_E2NM","_E35R","_E3NW","_E3XV","_E4BP","_E4K6","_E57Q","_E591","_E59N","_E61T","_E72E","_E7GA","_E8CM","_E9NI","_E9TY","_E9V2","_EA1Y","_EA9Z","_ECJJ","_ECJS","_ECL1","_ECPP","_EDN8","_EDRR","_EE9T","_EEIP","_EEL6","_EF27","_EF2C","_EFEO","_EGGM","_EGJC","_EGK3","_EGKB","_EHRY","_EHVF","_EHZI","_EI2B","_EI3E","_EILM","_EIOD","_EITP","_EJV2","_EK0N","_EKA6","_EKO5","_EKOJ","_EKSH","_ELC3","_ELDX","_EMVR","_EMY6","_EN1S","_EN5T","_ENJW","_ENMF","_ENNL","_EO2S","_EO4O","_EOFP","_EOJ8","_EOWN","_EP0U","_EP75","_EPOK","_ERFA","_ERWU","_ESG5","_ESH8","_ETDD","_ETG8","_EUC9","_EV5Q","_EV5Z","_EVEV","_EVKD","_EVLF","_EW4J","_EWLZ","_EWST","_EWUO","_EX7W","_EXER","_EXVH","_EYHJ","_EZY5","_EZZ3","_F058","_F0JI","_F0TK","_F0UG","_F1DQ","_F1FS","_F1RV","_F2B4","_F2H4","_F2R6","_F2ZD","_F3ST","_F3V9","_F3VH","_F4IH","_F6AE","_F6DM","_F6LL","_F6LX","_F6ZB","_F7K5","_F7TB","_F84K","_F9A3","_F9F8","_FA9P","_FAS3","_FATN","_FB8D","_FB8H","_FBJX","_FCZK","_FDC2","_FDV4","_FDYA","_FE3C","_FECR","_FEJZ","_FEOZ","_FETB","_FFF0","_FFQW","_FGDP","_FH1Y","_FH27","_FH5B","_FHNB","_FHW3","_FHYY","_FHZ7","_FID7","_FILU","_FIRQ","_FJ8B","_FJAH","_FJFI","_FKMY","_FLHE","_FLIM","_FLWH","_FMKK","_FMOU","_FMPC","_FNB3","_FNJZ","_FNO8","_FNY6","_FO2W","_FO6E","_FPYV","_FQIQ","_FQNF","_FQOL","_FQXN","_FSCQ","_FSE7","_FSVJ","_FTFN","_FTRB","_FUGA","_FVAA","_FVEY","_FVMF","_FVPH","_FW4M","_FW6O","_FWC8","_FWG6","_FWP7","_FWTN","_FXAV","_FXOS","_FXXD","_FY7R","_FZ7P","_FZ97","_FZAF","_FZTK","_G058","_G0U4","_G1GU","_G1RJ","_G1RM","_G1X8","_G2FH","_G2U7","_G330","_G3R2","_G4X6","_G54S","_G5F0","_G6L0","_G6NJ","_G7DN","_G7E7","_G8BQ","_G949","_G9KG","_G9LK","_GA0Y","_GA6E","_GBC5","_GBEP","_GBR7","_GCBL","_GCO1","_GCPB","_GCZO","_GDH8","_GDZB","_GE20","_GEHO","_GEIE","_GERX","_GGE4","_GHAG","_GHFM","_GHXL","_GIGC","_GJFM","_GJNQ","_GK6W","_GKGM","_GKLQ","_GKMM","_GL5D","_GL7N","_GLJC","_GLY1","_GM29","_GMUJ","_GNEB","_GNK4","_GNYV","_GOMR","_GP89","_GQ7N","_GQA7","_GQQ1","_GQSD","_GR1X","_GS0H","_GS3Z","_GS7D","_GS7M","_GS9X","_GTC5","_GTE1","_GU7H","_GUF3","_GUO4","_GUOC","_GVS5","_GVT8","_GWPO","_GY8S","_GYB6","_GZ5V","_GZVF","_GZYY","_H01W","_H1TE","_H1XZ","_H2FF","_H3MC","_H3P5","_H3VT","_H46E","_H46K","_H52N","_H576","_H5IX","_H65T","_H67U","_H6OQ","_H6TO","_H7G9","_H80D","_H8F8","_H978","_H99D","_H9P7","_HA3U","_HAUT","_HCDT","_HCQW","_HDK3","_HDTG","_HE8D","_HEAD","_HEHD","_HEJ3","_HEL2","_HEMA","_HEUA","_HF56","_HFMJ","_HFNK","_HFUF","_HG5V","_HGL1","_HH02","_HH0T","_HH6I","_HHPC","_HHW0","_HI3Y","_HI74","_HI76","_HIRK","_HIS6","_HK4G","_HKNZ","_HL09","_HL8Z","_HLOA","_HMF8","_HMKM","_HMXK","_HN2T","_HN55","_HNAK","_HNJR","_HOFG","_HPLN","_HQ0E","_HQBH","_HQFS","_HQGY","_HQTK","_HQZ1","_HR79","_HS3P","_HS6X","_HSBK","_HSMY","_HSNB","_HT8K","_HTHT","_HU10","_HUPM","_HURU","_HUXT","_HW2X","_HWBS","_HWT5","_HXTW","_HY57","_HZI0","_HZVD","_I06T","_I0F8","_I0Q0","_I0Z6","_I12E","_I193","_I1EP","_I1JB","_I1ZO","_I251","_I26T","_I2IU","_I2IZ","_I2M4","_I3CD","_I3VR","_I3VZ","_I4F3","_I4WB","_I4YZ","_I559","_I6GI","_I6IM","_I7HL","_I89L","_I927","_I9U9","_IA9S","_IC0X","_ICT9","_ICZA","_IDKE","_IDP7","_IDVD","_IDZ1","_IEQC","_IEZG","_IF0X","_IF3B","_IF73","_IFL0","_IFQC","_IFR9","_IFSK","_IGDU","_IGUS","_IHS9","_II2C","_II4E","_II8O","_IIFP","_IIIW","_IISH","_IIV3","_IJ5Z","_IJ97","_IJ99","_IJIO","_IJOO","_IK7H","_IKMO","_IKPG","_IL4X","_ILJC","_ILRM","_IM95","_IMF0","_IMSE","_IMUF","_IMZL","_IN0G","_INA5","_INBC","_INS6","_IPR4","_IPUD","_IQC2","_IQCF","_IQOW","_IS29","_IT2R","_ITS6","_ITV1","_IURX","_IV3W","_IV6K","_IVHO","_IVI3","_IVM5","_IVPP","_IWHA","_IWX1","_IX1S","_IX9S","_IXJ5","_IXV6","_IXZ1","_IY3Q","_IY5D","_IY6G","_IYSZ","_IZ9E","_IZF0","_IZQP","_J075","_J0XJ","_J10F","_J1BU","_J1MT","_J27U","_J29U","_J2OK","_J2P6","_J3G0","_J3G9","_J3P2","_J3PM","_J44X","_J46B","_J4BT","_J4C4","_J4UM","_J52M","_J54P","_J6HB","_J7AP","_J7KL","_J7N3","_J7P0","_J7QI","_J7RG","_J7Z6","_J83P","_J8KU","_J9IU","_JA9P","_JAC4","_JACB","_JB2M","_JB50","_JBGU","_JCVA","_JDCU","_JDO2","_JDXF","_JE4T","_JE5A","_JECM","_JEJX","_JENN","_JETG","_JHM5","_JHZN","_JI3C","_JI7T","_JILH","_JIP0","_JIPA","_JJYP","_JKMT","_JKR2","_JLBQ","_JLFL","_JM32","_JM7D","_JMJ4","_JMNT","_JMPO","_JN3G","_JN4F","_JN9P","_JNSS","_JOMY","_JOTW","_JP22","_JP7I","_JPLL","_JQ6F","_JQPG","_JR9S","_JRA7","_JRAY","_JRRA","_JRYI","_JRYZ","_JRZS","_JS3Q","_JS8S","_JTEN","_JTLJ","_JUKT","_JV68","_JVFK","_JVX0","_JW26","_JWAP","_JWCV","_JXFZ","_JXXR","_JY0Z","_JY4R","_JY8D","_JYCS","_JYL2","_JYTR","_JZAI","_JZHE","_K0LJ","_K0N4","_K0Y9","_K17H","_K1AB","_K1HD","_K1Z7","_K27T","_K2AC","_K2CC","_K2VR","_K34D","_K378","_K3E0","_K3K4","_K3LJ","_K3QC","_K48R","_K4ES","_K4LD","_K4R3","_K69S","_K73E","_K7VE","_K8JC","_K90Z","_K9HL","_K9XH","_KAYM","_KB1T","_KB88","_KBGK","_KBOB","_KC3G","_KC7C","_KCLO","_KCV4","_KD3B","_KDDQ","_KEG8","_KERI","_KFA0","_KG1R","_KGDN","_KGGY","_KGT9","_KH28","_KH82","_KHAG","_KHIK","_KIAF","_KJ0K","_KKGI","_KKKZ","_KKTP","_KL3T","_KMEF","_KMHJ","_KMI2","_KNG0","_KO11","_KO71","_KP0L","_KP16","_KQH4","_KQNJ","_KQQV","_KRM2","_KT92","_KTR3","_KTRW","_KTTZ","_KU12","_KU2R","_KU35","_KUHZ","_KUOK","_KUSK","_KVIY","_KVJK","_KVQ3","_KWFP","_KX13","_KXTR","_KYRI","_KZH1","_KZJB","_KZME","_L07M","_L0V2","_L10G","_L1AN","_L1FR","_L1NW","_L1VK","_L239","_L2A7","_L3MG","_L3NX","_L3RA","_L3UU","_L5BY","_L5GY","_L5I8","_L5ZH","_L6ME","_L6QH","_L7J8","_L863","_L88O","_L8ND","_L8TF","_L8TX","_L9L9","_LA4E","_LABK","_LAKK","_LAY5","_LB2C","_LB2G","_LB6Q","_LBC7","_LBNE","_LCLD","_LCOS","_LD2L","_LD8I","_LDFU","_LDI9","_LDJT","_LDXK","_LE5H","_LE7L","_LE7Y","_LEC2","_LEL7","_LFC4","_LG6H","_LGCI","_LGI1","_LGOP","_LGTL","_LHBN","_LHZ3","_LIG5","_LIRA","_LJ1Z","_LJCU","_LJIN","_LJQB","_LJX1","_LKCS","_LKHN","_LKVK","_LKZH","_LL44","_LLP6","_LMF2","_LMWP","_LMYS","_LNAI","_LNBC","_LNCO","_LNNC","_LOO4","_LOY1","_LPQO","_LPXU","_LQHL","_LQIR","_LQLU","_LQO7","_LQVA","_LRUD","_LRXP","_LS6L","_LT0W","_LT3X","_LTO7","_LU01","_LVNN","_LWEB","_LWQI","_LX66","_LXE0","_LXNP","_LY1D","_LY2H","_LY8S","_LYAS","_LYZH","_LZ7W","_LZ9G","_LZA5","_LZP0","_M05O","_M0Q8","_M120","_M1JN","_M27Q","_M2Z6","_M35Q","_M3AC","_M3FS","_M4AX","_M4ER","_M5YW","_M6AR","_M6I4","_M6K3","_M6XJ","_M6ZP","_M73K","_M7XA","_M81W","_M86N","_M8FQ","_M8KZ","_M8XZ","_M91R","_M9BQ","_M9J1","_M9V0","_MANE","_MAYA","_MB28","_MBK3","_MD2A","_MD3A","_MDTS","_ME7V","_MEL7","_MEUU","_MEXO","_MFIE","_MFXS","_MG97","_MHA1","_MHA4","_MHFM","_MHLD","_MHQF","_MI16","_MI18","_MI5U","_MJK9","_MJMH","_MJZY","_MK8X","_MKD0","_MKG6","_MKKG","_MKZ1","_MLC5","_MLI7","_MM6O","_MMA1","_MMCT","_MMLM","_MMNP","_MN20","_MNW5","_MNZL","_MO64","_MOB8","_MOEM","_MOND","_MOOD","_MP7D","_MPF3","_MPGT","_MPH0","_MPHU","_MPJC","_MQDW","_MQFA","_MQIW","_MR8H","_MR9A","_MRGZ","_MRVQ","_MS7J","_MSU8","_MTCV","_MTTE","_MTTM","_MTXO","_MTYF","_MU02","_MU5J","_MV5B","_MV6A","_MV8P","_MV8W","_MV9F","_MVRZ","_MVSS","_MW1X","_MW3H","_MW5W","_MWCQ","_MWPY","_MWW3","_MX1G","_MX2E","_MXIX","_MYVT","_MYY0","_MZ0E","_MZ71","_MZE3","_N07E","_N0RZ","_N19C","_N1CV","_N1UI","_N2CM","_N2CX","_N2R5","_N31E","_N366","_N3LO","_N3RM","_N4EN","_N4JL","_N5CG","_N5WF","_N5XM","_N5YC","_N693","_N6W8","_N75C","_N772","_N7AD","_N7MS","_N7W4","_N7Y0","_N8LE","_N8UT","_N9O7","_NB2A","_NCK2","_NCY5","_NDAJ","_NDBL","_NDI5","_NE1Q","_NE27","_NE34","_NE5M","_NF7K","_NFAI","_NFXO","_NG2D","_NGBM","_NGFK","_NGTF","_NH0D","_NHYQ","_NIP7","_NIR6","_NIS8","_NIW0","_NJI0","_NJI5","_NJTZ","_NK90","_NLIH","_NLSW","_NLYK","_NM43","_NM8P","_NM95","_NMAP","_NMFZ","_NO1M","_NO1T","_NOSA","_NP38","_NP5R","_NP9T","_NPBY","_NPJO","_NPMH","_NQ3C","_NQBW","_NQKH","_NQV6","_NQW2","_NSVN","_NTB7","_NTIB","_NTS1","_NTUD","_NUE9","_NUF9","_NUNH","_NUS5","_NV4A","_NV4D","_NV78","_NVCA","_NVQI","_NW0J","_NWE1","_NWRC","_NWXV","_NX0I","_NXUF","_NXUV","_NYJG","_NYSI","_NZ5D","_O0E2","_O0Z8","_O10L","_O125","_O14I","_O160","_O1DT","_O1YY","_O2I5","_O2TG","_O31N","_O388","_O3EO","_O3J5","_O3NO","_O3UD","_O46O","_O4BS","_O4ZT","_O56L","_O5XY","_O6IX","_O6N4","_O7MU","_O7VO","_O8D7","_O8O6","_O93V","_O9DY","_O9RO","_O9XZ","_OAEV","_OC0U","_OCDQ","_OCMI","_OCNK","_OD5I","_OD5Z","_ODL3","_ODPF","_ODRD","_OEAU","_OEO1","_OERJ","_OEU3","_OF8E","_OFF2","_OFN0","_OG49","_OGBO","_OGHL","_OGWO","_OHWD","_OIJZ","_OIMD","_OITD","_OJ8M","_OJBK","_OJGS","_OJXO","_OK84","_OKIZ","_OKOY","_OKRD","_OLED","_OLXA","_OM2N","_OM94","_OMWI","_ONI1","_ONI4","_ONRL","_OOJ6","_OQ27","_OR4G","_OSD9","_OSI2","_OSKY","_OSPW","_OSR0","_OSRA","_OSWP","_OSX8","_OTVO","_OTX5","_OU46","_OVN7","_OVWY","_OWQY","_OWW5","_OXR4","_OZ4Z","_OZND","_OZO9","_OZUQ","_P008","_P0P8","_P1AC","_P1AU","_P1G1","_P251","_P2TX","_P2V6","_P32Z","_P3DX","_P3FX","_P3JW","_P4LD","_P54B","_P5YC","_P6Q1","_P74H","_P7GR","_P8II","_P974","_P9BY","_P9DE","_P9G9","_P9J9","_PA98","_PAC4","_PB8Y","_PBJI","_PBT6","_PBVC","_PBZ9","_PCLH","_PCOK","_PCSM","_PCZ6","_PD2L","_PD46","_PDRB","_PE72","_PE8I","_PEN7","_PEOX","_PESO","_PEX4","_PFBY","_PFFR","_PG4I","_PG6G","_PG8T","_PGBS","_PH0I","_PH7Y","_PHVP","_PI8P","_PINT","_PIVW","_PJXM","_PK12","_PKHJ","_PKWO","_PLM3","_PMQQ","_PN8R","_PNEN","_PNOQ","_PO4A","_PO9S","_POKQ","_POO0","_POVP","_PP98","_PQ3L","_PQBV","_PQC2","_PR2G","_PSP1","_PT7W","_PU99","_PUT5","_PV0P","_PVCD","_PVOG","_PVU2","_PVWQ","_PVWW","_PWBT","_PWX4","_PX9W","_PXAI","_PY9Q","_Q0JG","_Q0KK","_Q0V3","_Q1SS","_Q25J","_Q2MO","_Q39Y","_Q3HJ","_Q3XV","_Q3ZF","_Q40O","_Q4EV","_Q4SU","_Q559","_Q566","_Q632","_Q66O","_Q6BT","_Q6SU","_Q74O","_Q81C","_Q84Y","_Q8D0","_Q8P4","_Q8RV","_Q8Z9","_Q915","_Q94K","_QAMK","_QBUK","_QBVX","_QCIB","_QCIX","_QCUA","_QCYF","_QD0T","_QDRX","_QDZG","_QE44","_QE48","_QEKJ","_QEWI","_QFEC","_QFF6","_QFQZ","_QFZQ","_QG6X","_QH51","_QH80","_QH8S","_QHJB","_QI5E","_QKMW","_QKP0","_QKX2","_QLK4","_QM4S","_QMMU","_QN0L","_QO5I","_QOJU","_QOOM","_QPCK","_QQ26","_QQFC","_QQZG","_QRSB","_QS0H","_QS41","_QS60","_QTNJ","_QTP9","_QUJR","_QUQ4","_QW9T","_QWFM","_QX5F","_QXJM","_QXKR","_QY0Y","_QZ1N","_QZRL","_QZYG","_R047","_R0UN","_R0V5","_R0V7","_R287","_R329","_R3YD","_R4HP","_R4T8","_R4TF","_R4U5","_R528","_R5EE","_R5GQ","_R5LB","_R5QG","_R5TD","_R64T","_R67I","_R7AI","_R7AM","_R7NZ","_R84U","_R8F2","_R8VG","_R95K","_R9EB","_R9PR","_RA4H","_RABL","_RAKN","_RB07","_RB3Y","_RB6N","_RBFR","_RBII","_RBWB","_RD6N","_RDR3","_RDXY","_RDXZ","_RF2L","_RFA1","_RFRO","_RGK4","_RH2N","_RHVI","_RHYW","_RIMP","_RINZ","_RIW3","_RIXC","_RJ2S","_RKGG","_RKJC","_RKY1","_RLHV","_RLM6","_RLW8","_RLZB","_RM49","_RMGZ","_RMID","_RML4","_RMPM","_RNXU","_RNZJ","_ROM2","_RP3B","_RPMA","_RPYG","_RQMM","_RQQ2","_RQXF","_RR3V","_RRBS","_RRVS","_RTHD","_RU9R","_RV3X","_RV79","_RVCX","_RVHH","_RVI0","_RVO5","_RW03","_RWHX","_RWKE","_RWLQ","_RXFB","_RYKL","_RYSC","_RZ39","_S0CR","_S0NO","_S25N","_S2AA","_S2U7","_S3CJ","_S4EY","_S55D","_S571","_S5MP","_S63X","_S6YI","_S75D","_S78J","_S7E7","_S7LT","_S7NX","_S7UQ","_S8AA","_S8Q7","_S8QE","_S95S","_S9S5","_SAHR","_SAOQ","_SB5D","_SBAC","_SC7P","_SCBS","_SCI4","_SCM8","_SDMY","_SDQR","_SDZC","_SEU2","_SF1R","_SFBG","_SFJ2","_SFL2","_SFX1","_SG3I","_SG41","_SGQP","_SH6S","_SHJG","_SI00","_SI4D","_SIOQ","_SJ7T","_SJBI","_SKAD","_SKQD","_SKR7","_SLT7","_SLTD","_SMQA","_SN4J","_SNH0","_SNH1","_SNWU","_SNYQ","_SODV","_SOI8","_SPLB","_SPNB","_SPRG","_SPRN","_SPUZ","_SQ71","_SQA0","_SRX6","_SS2X","_SSJ7","_SST1","_SSV7","_ST1K","_STSQ","_STVF","_SU98","_SUG4","_SUW1","_SV57","_SVDM","_SVRX","_SW7Z","_SW9A","_SWQE","_SWRO","_SX2V","_SX3U","_SXRJ","_SY3D","_SY5E","_SYGV","_SZ0V","_SZDP","_SZVE","_T174","_T18S","_T1N8","_T26D","_T2E4","_T2HH","_T2IX","_T2LJ","_T31J","_T34E","_T3JU","_T43D","_T46A","_T69I","_T6RC","_T6TT","_T7F1","_T7FO","_T7H0","_T7RL","_T7S8","_T87T","_T888","_T8WM","_T8XV","_T91S","_T9CB","_T9JD","_TAPY","_TAUL","_TAYW","_TBBC","_TBFC","_TBXW","_TC1Z","_TC5U","_TC95","_TCCU","_TCKJ","_TDTB","_TETI","_TF9L","_TFTU","_TFWN","_TFXD","_TG78","_TGP0","_TGQN","_THRF","_TIHX","_TJ5Y","_TJ83","_TJIV","_TJQG","_TK1A","_TKD6","_TKSC","_TKXE","_TKYZ","_TLDA","_TLFG","_TMEI","_TMHU","_TN8R","_TNPX","_TNTY","_TOIE","_TP25","_TPBE","_TPRC","_TPWS","_TPX2","_TQ41","_TQKS","_TQOS","_TQSP","_TRBK","_TS63","_TSWG","_TT5J","_TT5T","_TTPS","_TTPY","_TTZC","_TUBD","_TUY7","_TV4R","_TVL2","_TVMH","_TVVE","_TWF3","_TXQ8","_TY0V","_TY2H","_TY3B","_TYQE","_TZ8Z","_TZD8","_TZSW","_U0DZ","_U0O9","_U0SN","_U0WX","_U1NA","_U1U3","_U2A2","_U2TL","_U2Y6","_U3XT","_U44X","_U4DM","_U4RL","_U50M","_U77B","_U7F3","_U7GP","_U8UA","_U8UO","_U8UR","_U98Z","_U9BU","_U9CR","_U9NB","_U9Q7","_U9R4","_UBDD","_UCEN","_UCEX","_UCZ0","_UCZY","_UD5C","_UDD5","_UE8Z","_UEU1","_UG7C","_UGEY","_UGIB","_UGJB","_UGJR","_UGM7","_UGTI","_UH0K","_UHRJ","_UHXT","_UI50","_UIUT","_UIY5","_UJA9","_UJF3","_UJFK","_UJMF","_UJNL","_UK1B","_UK74","_UK8U","_UKHQ","_UKQK","_UMQ1","_UMTD","_UNLZ","_UNWQ","_UO1Y","_UO80","_UOF7","_UONO","_UP1L","_UPI8","_UQ2Y","_UQ4C","_UQZ2","_URDN","_URL9","_USIA","_USLV","_UST1","_USWK","_UTOC","_UUBS","_UUVU","_UVDB","_UVDN","_UVP9","_UWBP","_UWE8","_UXJZ","_UXR1","_UZBZ","_UZGG","_UZK7","_UZKG","_UZVJ","_UZYS","_V0DJ","_V0V6","_V0ZL","_V15L","_V18K","_V1BN","_V1I8","_V1WF","_V1XI","_V27B","_V2RE","_V2YW","_V33Z","_V37Z","_V3AN","_V3BQ","_V3Z3","_V41U","_V49M","_V4AN","_V4CX","_V4Y7","_V506","_V510","_V5FS","_V5TW","_V6YK","_V7HY","_V7S4","_V7ZS","_V81H","_V8G6","_V8T9","_V98Y","_V9EB","_V9UH","_VA9B","_VAJO","_VAKN","_VB4K","_VB67","_VB6W","_VCQE","_VD3N","_VDJQ","_VE55","_VECK","_VF6T","_VF9Y","_VFBZ","_VFHY","_VFLG","_VGX3","_VH9F","_VI0F","_VI0O","_VJTF","_VJZ7","_VK82","_VKEK","_VKGH","_VKLE","_VLHQ","_VMQE","_VNS4","_VNSH","_VNY3","_VO5T","_VO94","_VOS0","_VP0W","_VP6Q","_VPJQ","_VQ7Q","_VS2V","_VSME","_VSQC","_VT8T","_VTCC","_VTCO","_VTQH","_VU32","_VU8K","_VUAM","_VUKD","_VUKN","_VV14","_VWD8","_VWVH","_VXIH","_VXT9","_VYFA","_VZBC","_VZVP","_W0IZ","_W11T","_W1BN","_W22B","_W2GD","_W2WO","_W30O","_W3W9","_W4OF","_W4T7","_W55R","_W5GT","_W5M5","_W66E","_W74F","_W8BN","_W8PT","_W8WM","_WB0P","_WBDI","_WBJ8","_WBLD","_WBMP","_WCDE","_WCP2","_WCXT","_WDC0","_WDER","_WE7O","_WE83","_WE8J","_WFFC","_WFFF","_WG3T","_WGZY","_WHP9","_WIOF","_WJNC","_WJNV","_WJW6","_WK0E","_WKA2","_WLLF","_WMFF","_WMXV","_WN9E","_WNCA","_WNTS","_WP41","_WPEI","_WPGR","_WPJJ","_WQ2T","_WRF0","_WRZV","_WSEZ","_WTEE","_WTO9","_WTZT","_WU3P","_WU9T","_WUAI","_WUJQ","_WUSX","_WVXZ","_WWWQ","_WX9R","_WXF9","_WYC8","_WYCE","_WYK6","_WZDT","_X0XK","_X13C","_X16D","_X1JV","_X1P5","_X1WJ","_X27L","_X281","_X2O0","_X39K","_X3D2","_X3YL","_X47S","_X50F","_X59E","_X5HZ","_X5XC","_X66K","_X6F4","_X71J","_X74L","_X7FY","_X7JI","_X7VX","_X7YL","_X8L7","_X8OR","_X8Q4","_X8R0","_X8T4","_X9K4","_X9PA","_X9UM","_XA1A","_XAJN","_XARU","_XATY","_XB65","_XCGZ","_XCNA","_XCZ3","_XD0E","_XD3S","_XDF1","_XDF4","_XDKP","_XF32","_XFWC","_XGHN","_XGYJ","_XHBV","_XHJB","_XHOU","_XHYG","_XIBN","_XJJM","_XKHL","_XKHZ","_XL29","_XLNP","_XLO2","_XMEO","_XMNC","_XMTD","_XMU1","_XNNX","_XNO0","_XNOL","_XQFS","_XQNW","_XR04","_XS3I","_XT0M","_XTBS","_XTXM","_XU0N","_XU7P","_XUCA","_XUJ7","_XVBS","_XVCI","_XVUA","_XWJN","_XWVZ","_XXDJ","_XXFC","_XXHY","_XXVQ","_XY43","_XYG9","_XZ4N","_XZ4S","_XZ6P","_XZBH","_XZQ9","_XZWB","_Y1OP","_Y1XL","_Y2HN","_Y30R","_Y3BD","_Y3L0","_Y3RR","_Y3UI","_Y4T0","_Y4X3","_Y56K","_Y586","_Y59I","_Y5FN","_Y5GP","_Y6H5","_Y6M8","_Y6TP","_Y7GU","_Y7RX","_Y862","_Y8EH","_Y8RY","_Y8V3","_Y965","_Y97W","_Y9DJ","_Y9OG","_Y9X8","_YA18","_YA38","_YAP0","_YAV0","_YBD3","_YBIY","_YC0C","_YC0R","_YCDW","_YD52","_YD54","_YD7W","_YD9U","_YDE7","_YDSB","_YDV5","_YE7D","_YEFA","_YEQK","_YF25","_YF3N","_YFF5","_YG5A","_YG8X","_YGO9","_YGTO","_YH5S","_YHA4","_YHF9","_YHML","_YHSI","_YI5S","_YIBB","_YIEF","_YIGQ","_YIO1","_YISK","_YK56","_YLBK","_YMII","_YMQY","_YMS5","_YMSL","_YNE4","_YO5N","_YOBT","_YOFF","_YPOW","_YPYJ","_YQ31","_YQ82","_YQCZ","_YQD9","_YQVO","_YR64","_YRWZ","_YSC4","_YSK6","_YSYC","_YTCM","_YTE6","_YTGC","_YTS6","_YU0D","_YUA0","_YUCB","_YUK2","_YVIG","_YVIQ","_YVTA","_YWXM","_YXXI","_YY0Y","_YY5G","_YYGQ","_YYRS","_YYX4","_YYXH","_YZ48","_YZKT","_YZS1","_YZS5","_Z056","_Z0B0","_Z0BJ","_Z0RG","_Z0XT","_Z11N","_Z186","_Z1HN","_Z1Q9","_Z1YO","_Z2EH","_Z2MV","_Z2WQ","_Z32F","_Z3WF","_Z429","_Z473","_Z4CJ","_Z4GN","_Z4JN","_Z52E","_Z552","_Z5F4","_Z5HV","_Z6II","_Z6XQ","_Z72X","_Z73N","_Z77Y","_Z88O","_Z8DW","_Z8JR","_Z8MG","_Z8N7","_Z8V6","_Z90J","_Z94L","_ZAC4","_ZB22","_ZB5E","_ZCBD","_ZDGV","_ZE6I","_ZE77","_ZEB1","_ZEG9","_ZERG","_ZF6F","_ZFB7","_ZFED","_ZFEX","_ZFVJ","_ZG6N","_ZGE1","_ZGSU","_ZGV7","_ZHI8","_ZHOM","_ZI1J","_ZIB1","_ZIRC","_ZIVS","_ZJM9","_ZK0I","_ZL0I","_ZL0W","_ZL8G","_ZLD1","_ZLLC","_ZLTQ","_ZM46","_ZNDN","_ZNJK","_ZNWA","_ZNXT","_ZOOY","_ZPDB","_ZPIW","_ZRL4","_ZRPZ","_ZS62","_ZSA4","_ZSAS","_ZT54","_ZTP6","_ZUOA","_ZUVD","_ZV65","_ZVGV","_ZX8X","_ZXAC","_ZXJ9","_ZXY1","_ZY5T","_ZY80","_ZYQO","_ZZJM"],"grams":{" a ":[464]," aa":[469,78,1900,505,222]," ab":[47,709,169,702,542,472,193,630]," ac":[105,304,734,428,1539,339]," ad":[44,90,114,182,131,347,71,73,15,106,109,61,47,76,74,126,16,3,11,87,108,26,34,223,342,98,4,117,118,137,2,43,10,355]," af":[2873]," ag":[108,114,17,89,48,53,77,223,366,356,33,98,160,202,703,21,62,173,51,52,23]," ah":[290,338,55,811]," ai":[873,1068,486,70,74,836]," ak":[38,1410,297,1012,134,46,307]," al":[10,8,1,7,79,26,15,50,64,21,3,8,3,17,15,8,43,73,55,53,5,21,61,2,32,9,54,20,9,32,23,13,31,11,9,38,20,74,92,43,5,47,10,36,128,5,32,17,51,41,17,1,54,18,23,41,8,22,33,14,61,121,9,7,62,44,29,51,2,2,8,4,4,1,1,8,93,52,51,1,35,7,11,30,60,41,22,37,40,22,103,27,95,74,29,26,59,35,5,66,50,16,20,18,2,32,7,27,5,66,32]," am":[128,156,22,201,468,222,93,117,533,459,501,18]," an":[2,15,41,6,9,11,1,19,21,15,21,1,30,27,45,70,3,5,6,15,2,2,3,7,26,30,4,16,5,40,9,13,2,65,33,9,2,12,10,6,9,62,10,2,20,6,12,5,3,21,17,26,16,5,2,8,52,21,54,20,31,2,3,23,68,10,12,58,17,39,6,42,15,24,30,1,21,22,5,8,34,24,30,40,11,10,1,1,23,18,8,9,2,30,9,64,1,3,17,4,12,11,14,26,28,5,23,17,3,16,16,8,18,1,1,28,7,29,2,6,13,2,7,8,22,6,45,19,31,3,56,85,16,23,16,8,5,1,34,9,9,9,6,27,2,8,6,42,3,31,7,2,27,25,27,19,8,1,31,5,6,23,1,8,8,16,8,17,2,15,9,39,3,1,3,30,4,3,74,1,33,26,19,9,16,20,18,7,15,14,26,30,9,19,7,17,13,5,7,11,1,4,21,3,2,49,15]," ap":[1607,115,197,685]," ar":[224,29,138,78,303,1,50,94,130,30,80,34,11,129,4,14,21,24,54,101,62,27,88,25,131,62,69,193,26,76,60,21,56,182,27,102,161,122,142,71,15,4,23,34,15,41,35,16]," as":[24,595,550,344,462,389,102,299,258,45,66,68,37,32,55,17,131]," at":[1518,737,178,392,159]," au":[137,1483,289,115,108,133,897,70]," av":[285,1551,958]," aw":[3168]," ay":[1337,763,810]," az":[166,1238]," b ":[2073,1240]," ba":[25,17,20,9,62,14,59,16,10,38,27,23,5,29,16,9,3,26,59,44,4,19,23,1,5,39,4,28,6,17,4,71,15,68,68,22,7,36,166,33,8,18,19,24,12,41,3,32,3,72,26,33,21,10,13,83,36,60,7,14,7,35,13,13,126,23,33,7,8,45,99,37,24,14,38,8,19,13,17,9,17,53,20,1,84,20,5,23,140,53,49,121,24,41,42,18,13,60,7,34,12,169,83,27,45,32]," be":[0,20,31,2,1,61,45,25,56,40,64,8,24,23,25,15,260,31,30,7,1,19,7,10,25,2,2,68,23,24,62,42,3,2,110,58,33,64,93,38,18,315,3,20,20,5,55,6,106,27,31,78,21,20,6,45,13,9,39,126,31,38,48,46,14,45,11,38,21,131,27,10,76,25,78,79,77,4,53,95,12,27,16,9,17,2,1,22,5]," bi":[175,318,121,62,134,53,94,82,103,152,282,212,99,135,50,30,130,202,49,272,135,57,15,350,73]," bj":[277,603,381,52,1350,45,289]," bl":[42,111,6,35,42,612,432,71,232,96,81,277,6,375,303,65,46,25,70]," bo":[24,22,31,20,36,61,23,7,96,26,46,58,35,1,40,19,127,43,10,54,107,53,9,67,19,2,1,4,184,9,9,2,10,60,58,16,40,84,9,14,30,12,49,38,25,12,36,6,2,40,63,110,14,4,122,39,30,126,103,12,42,6,87,1,16,26,20,13,23,27,30,14,18,2,43,25,35,7,6,62,17,20,35,61,8,24,124,8,55,59,70,21]," br":[8,71,10,5,75,28,4,48,8,104,47,137,2,21,4,27,1,15,128,32,19,32,7,53,55,108,27,29,8,28,101,43,3,7,29,26,57,1,195,105,2,13,74,2,28,20,107,40,83,43,36,34,13,42,51,87,10,26,28,45,33,26,37,65,23,24,151,35,4,44,20,70,32,10,58,104,3,4,6,48,28,45]," bu":[56,7,45,44,79,125,283,25,55,92,92,3,166,90,79,9,309,104,37,101,32,195,462,125,2,23,14,147,70,24,114,128,26,63,59,5,24,104]," by":[758,229,1025,248]," ca":[24,13,11,11,75,2,8,13,17,24,30,29,49,25,19,5,29,59,100,37,58,63,4,23,86,63,38,46,10,24,13,108,24,53,59,1,20,6,65,30,29,29,42,1,29,22,63,13,129,62,2,12,23,70,4,43,61,11,19,26,124,23,15,33,4,9,46,53,27,33,41,25,31,3,102,71,60,6,17,16,25,46,2,9,21,65,43,27,56,46,14,5,17,9,3,47,24,98,6,22,2,23,65,4]," ce":[66,89,20,11,75,38,8,563,209,36,49,111,41,12,85,45,212,13,431,124,18,467,403,254]," ch":[120,23,5,25,37,18,6,44,19,35,62,58,14,32,54,19,26,10,23,12,24,30,52,17,57,3,31,71,1,73,13,28,58,55,34,10,108,11,47,23,5,16,36,36,3,88,18,24,36,77,13,38,10,90,75,73,79,2,58,11,18,33,8,43,42,23,75,73,17,2,12,69,6,33,89,13,47,20,145,96,115,1,37,43,30,175,23,7]," ci":[570,19,186,389,129,7,102,157,94,110,126,86,196,83,979,97,24]," cl":[52,50,293,123,51,115,197,24,17,258,251,15,51,90,301,15,226,60,122,45,22,26,189,103,6,114,83,130,58,70,10,169,142]," co":[14,72,4,26,83,76,30,31,6,29,55,11,20,90,141,75,102,191,25,52,60,14,173,5,11,120,21,135,15,14,26,111,127,16,51,16,10,24,45,18,77,45,100,41,9,31,110,38,26,74,92,20,57,5,86,62,12,6,155,26,6,28,90,14,121]," cr":[10,181,249,116,120,107,2,79,10,583,572,302,338,119,162,39,128,87,175]," cs":[217,86]," cu":[309,407,434,655,771,12,145,297]," cz":[279,430,258,26,377,378,912,109,83,8,241,28,120,173]," d ":[239,630,630]," da":[122,66,10,43,165,4,9,35,3,22,12,17,13,19,8,41,75,9,111,28,30,53,29,17,18,31,59,24,11,10,31,41,10,6,36,11,4,18,8,70,88,29,28,83,14,35,20,6,5,46,1,14,58,37,107,4,2,7,19,16,71,92,2,87,26,44,11,21,7,15,41,13,10,11,1,16,37,4,4,117,45,41,5,20,4,1,69,72,3,8,22,3,33,3,106,42,57,7,30,10,9,16,13,32,10,13,10,30,11,6,1,37,19,25,5,6,46,12,2,7]," de":[68,67,35,71,43,58,56,3,122,33,24,8,67,33,44,22,40,21,28,3,17,16,29,7,47,50,7,61,108,26,38,6,6,2,99,99,1,50,16,103,21,45,14,17,13,3,199,10,25,37,33,49,23,17,6,24,19,4,8,23,101,3,144,2,9,80,30,24,46,14,22,79,66,23,1,47,2,26,47,36,9,81,99,23,34,45,26]," di":[112,209,96,115,66,23,100,57,248,259,5,5,16,209,140,47,127,2,20,42,3,17,166,12,11,35,50,67,7,195,24,3,6,53,105,15,15,179,32,189,2,99,48,98,14,9,113]," dl":[1059,2225]," dm":[289,250,806,122]," do":[46,33,49,30,109,65,24,17,76,101,15,40,5,1,64,60,39,19,37,49,14,7,30,10,145,38,43,173,96,72,1,272,36,40,25,60,110,12,27,211,40,67,32,113,30,26,56,93,90,21,18,43,29,105,33,22,158,69,10]," dr":[109,99,9,250,212,48,26,3,57,75,37,438,26,104,318,112,91,325,199,476,11,104,277,49]," du":[50,161,165,24,27,124,124,145,14,105,47,28,283,213,381,47,156,83,192,680,50,327,39]," dv":[1922]," dw":[1740,1026,459]," dz":[424,520,1,339,559,245,84,953]," e ":[1558]," ea":[1819,840]," ec":[294,1625,388,118,294]," ed":[48,60,2,199,2,352,96,45,95,189,159,307,924,33,255,32,107,46,16,510]," ef":[1785]," eg":[271,262,559,257,713,80,989]," ei":[1443,319,914,684]," ek":[840,1235,197,43,311,255,258,128]," el":[45,103,199,69,89,72,280,67,23,93,14,53,1,57,52,28,85,33,41,165,6,18,136,23,37,97,63,214,108,65,179,66,112,58,13,267,59,44,258,11,3,1,35]," em":[21,92,431,90,77,53,15,850,205,160,142,440,60,433,20,56,91,85,111]," en":[109,284,232,256,146,28,20,252,50,341,177,421,367,98,60,152,122]," ep":[789]," er":[11,279,11,67,15,38,10,111,82,71,85,41,220,10,534,105,68,3,184,27,62,12,7,250,276,70,125,147,64,52,294,99]," es":[187,152,235,7,109,262,12,116,83,101,566,114,149,28,106,140,126,139,71,51,79,89,380,127]," et":[576]," eu":[1567,37]," ev":[160,156,71,7,21,34,439,2,341,424,80,85,76,142,65,173,242,56,52,158,70,72,37,19,18,286,7,77]," ew":[103,936,203,523,111,167,33,127,79,181,49,725,71,22,123]," ex":[2459,1020]," ez":[2285]," fa":[52,37,21,46,182,6,45,49,10,372,503,100,3,116,203,21,81,2,88,182,44,28,59,314,8,2,11,284,337,144,60,57]," fc":[1339]," fe":[18,546,271,101,25,12,127,9,20,94,200,216,34,135,16,71,13,71,27,191,18,49,52,16,187,35,63,190,243,293]," fi":[765,33,209,448,126,11,48,7,1,159,45,193,336,308,48,53,218,136,101,222]," fl":[54,411,11,53,83,725,17,83,19,41,174,125,94,97,297,103,25,312,151,206,202,43,108]," fo":[754,24,143,196,37,44,33,29,67,390,282,140,14,955]," fr":[8,13,85,64,46,23,37,11,7,16,8,30,61,82,6,70,18,118,103,30,24,17,7,124,20,5,35,12,8,50,52,16,42,1,78,19,8,62,17,49,9,20,24,35,40,49,29,16,20,15,48,74,37,80,42,5,11,99,61,148,25,141,31,87,18,138,42,38,12,44,8,36,11,47,31,51,106,20,92,47,31,36]," fu":[751,320,664,458,409,124,681]," ga":[4,26,3,154,31,43,190,75,56,22,104,2,22,6,69,35,22,49,51,54,39,18,58,76,63,76,5,19,2,146,45,45,95,60,49,7,257,24,18,127,2,34,53,7,19,8,95,51,12,41,62,12,48,11,90,15,8,59,10,15,13,140,70,5,78,185]," ge":[214,12,117,30,16,28,640,35,56,24,5,104,22,153,9,79,80,24,220,60,35,3,58,21,39,19,199,26,20,59,94,184,109,55,76,107,17,18,125]," gh":[1466,975,562,118]," gi":[37,63,42,17,280,150,20,68,5,119,19,49,94,120,59,145,54,38,2,62,56,52,25,42,26,2,59,147,78,62,93,2,8,120,2,6,43,9,76,51,73,259,5,5,48,5,50,98,256,13,13,216,9,16]," gl":[68,16,175,244,408,122,1101,193,485]," gn":[660,1241,387]," go":[19,116,176,60,130,26,36,73,123,427,123,20,24,140,39,47,59,40,16,25,336,19,113,282,3,12,103,62,19,27,171,26,36,11,72,25,44,4,123,58,152]," gr":[41,28,68,9,17,21,6,26,76,24,59,37,26,61,38,7,29,28,9,23,18,20,21,22,10,23,35,121,75,37,17,61,108,39,11,10,1,132,76,12,75,67,78,10,25,4,23,51,1,26,2,38,115,25,104,15,69,23,9,62,87,15,14,71,13,66,7,25,4,12,164,29,121,19,21,85,12,7,119,110,33,8,64,28,13,20]," gu":[13,2,55,305,113,26,154,60,53,32,40,106,10,194,27,30,78,107,112,3,9,97,19,84,75,56,1,4,227,66,100,15,12,72,322,45,182,5,71,120,116,8,89,37,41]," gw":[83]," gy":[662,534,676,1266]," ha":[43,43,17,221,45,35,59,38,14,2,4,10,39,29,28,52,81,89,12,40,41,55,110,28,2,2,31,54,54,31,79,9,7,73,33,60,52,7,69,65,41,125,88,7,46,104,1,48,17,9,33,116,14,6,3,55,22,7,41,35,51,9,21,18,56,11,36,38,21,1,15,14,114,1,106,20,67,111,40,14,19,25,17]," he":[27,47,9,21,25,97,33,7,8,74,157,89,51,29,33,13,50,49,93,11,3,5,58,17,25,129,23,13,23,13,12,19,5,28,6,8,4,31,16,34,157,45,74,6,20,37,16,34,57,9,65,8,72,21,15,19,9,30,12,1,8,73,7,31,50,56,66,34,46,102,77,19,60,8,57,33,67,108,2,94,9,25,13,52,58,18,29,32,29,43]," hi":[129,1,172,15,138,9,507,29,9,409,118,85,60,18,689,112,594,48,11,18,83,56]," hj":[1513]," ho":[61,75,3,53,63,34,129,56,3,78,56,61,25,64,44,75,109,115,21,4,107,53,19,52,410,3,120,73,253,104,128,215,75,21,6,174,178,102,26,115]," hr":[1343,754,814]," hu":[161,87,78,73,269,37,97,382,15,214,215,269,3,24,9,111,123,20,15,178,32,3,98,214,10,23,98,115,454]," hy":[194,2295,329]," ia":[40,233,153,370,308,540,339,6,394,279,469,33,32,284]," ib":[1703,883,877]," id":[926,1049,1135,39]," ie":[2644,330]," ig":[1264,595,385,42,836]," ih":[3023]," il":[149,119,310,554,321,1071,3,290,84,116,34,209,158]," im":[1425,790,751,113]," in":[322,22,88,666,36,87,42,17,40,208,202,693,36,27,2,193,150,124,110,38,240]," io":[958,1164,890,169,173]," ir":[3,172,142,1746,9,261,21,50,284,50,24,217,2,165,44,76,175]," is":[158,272,154,77,44,313,178,783,80,397,28,18,185,279,500]," iu":[827,470,2057]," iv":[330,152,289,58,91,303,119,56,62,694,37,298,792]," iw":[499,818,1648]," iz":[519,190,90,108,152,399]," j ":[2693]," ja":[1,5,90,34,12,13,9,8,4,38,44,17,110,1,34,21,32,20,7,28,7,1,13,25,2,3,27,2,15,47,8,15,49,81,22,5,9,6,51,1,17,18,36,38,38,1,12,1,13,18,13,6,17,42,35,9,26,68,14,15,6,27,3,9,21,24,48,20,5,36,10,31,16,15,48,13,34,13,43,1,21,11,29,10,7,2,14,2,2,19,16,42,21,26,10,27,50,66,21,4,64,56,50,7,32,40,10,13,5,14,42,2,2,68,2,16,3,2,46,46,1,18,4,5,18,6,1,6,3,24,12,81,3,29,15,5,3,40,21,23,18,6,1,33,18,20,32,26,39,57,16,3,42,14,46]," je":[38,43,21,88,21,12,178,28,16,11,67,86,103,29,11,64,42,93,25,7,8,50,28,32,34,12,53,156,1,21,8,67,132,154,28,9,3,44,40,58,16,21,42,162,198,40,11,96,66,3,81,2,40,10,45,134,4,4,1,38,34,33,18,1,37,41,1,28,13,10,51,1,88,32,58,13,32]," ji":[197,319,68,60,82,5,41,72,155,4,61,55,8,35,130,630,49,334,743,254,71]," jo":[47,1,10,50,27,4,20,4,32,36,51,68,10,4,48,30,2,15,24,3,8,1,37,56,47,11,25,30,22,60,4,38,13,29,31,16,17,37,5,1,20,5,9,27,55,9,7,4,71,17,5,24,97,23,28,8,2,32,23,24,21,21,20,32,32,13,28,7,20,3,24,6,15,4,1,3,14,10,17,43,28,16,9,29,32,17,29,10,2,4,14,54,20,11,7,13,16,30,9,13,9,2,30,36,9,74,26,49,25,9,2,113,22,32,5,16,4,22,2,10,37,1,26,73,4,60,32,32,47,40,102,12,5,24,13,10,1,37,11,20,8,3,7,27,30,57,3,5,3,86]," ju":[114,5,181,10,12,23,101,199,17,28,37,145,22,21,8,8,11,126,28,1,40,99,37,68,5,12,23,19,50,37,48,79,105,148,19,44,68,17,22,29,23,4,116,11,25,104,209,63,21,16,17,26,30,29,29,124,194,147,47,18,34,16,6,15,11,36,3,39]," jw":[2586]," k ":[3368]," ka":[39,61,27,11,26,13,25,51,7,22,18,23,20,40,2,3,15,41,116,5,18,24,8,7,7,20,44,24,1,32,34,10,14,33,31,6,92,17,41,2,8,100,13,19,5,9,17,3,18,67,33,14,16,39,15,5,66,57,11,15,32,6,39,42,64,24,70,17,12,12,6,32,12,7,10,64,4,48,24,3,10,24,24,7,5,37,8,21,5,5,85,22,4,1,15,12,62,16,12,15,1,20,2,5,34,40,45,15,2,29,45,21,5,11,32,1,34,8,34,11,13,4,13,62,10,37,2,40,11,31,58,23,10,32,26,54,48,88,26]," ke":[207,57,372,55,15,10,42,49,41,56,247,51,73,175,73,50,8,40,290,2,14,58,75,55,77,6,140,120,27,22,131,44,16,29,69,162,40,26,10,83,57,2,64,84,158]," kh":[94,1071,1246]," ki":[61,41,16,221,72,76,5,17,39,24,52,23,145,68,129,13,35,119,62,104,390,13,75,118,72,272,42,295,239,43,14,46,17,3,34,5,105,65,188,34]," kj":[992,125,422,1036]," kl":[31,42,903,124,117,54,95,76,44,2,56,88,81,44,87,70,34,57,295,15,7,132,195,118,37,201,194,270]," km":[1605]," kn":[242,300,111,429,531,160,111,74,515]," ko":[57,94,27,43,92,46,8,83,25,20,95,45,28,2,64,80,12,54,3,59,18,69,18,18,14,79,85,17,49,133,26,6,11,7,18,22,37,8,47,73,15,30,76,9,17,82,94,199,17,43,36,4,19,83,18,33,7,55,10,41,12,5,30,29,19,12,23,99,4,64,6,65,69,137,9,32,13,22,25,19,25,43,42,47,29,1]," kr":[24,75,28,72,31,68,31,99,79,163,27,13,42,110,5,83,73,44,4,41,32,41,15,49,5,14,2,140,34,74,1,59,23,14,146,13,89,72,29,59,12,20,14,10,45,54,18,12,5,28,55,33,23,68,6,18,91,72,4,21,28,14,11,6,49,122,42,111,203,29,17,97,26,28,28,13]," ks":[1598]," kt":[1481]," ku":[95,85,148,119,184,19,54,13,13,73,3,62,176,164,149,26,8,29,13,100,17,59,65,141,68,11,109,127,42,37,175,416,72,38,9,136,7,82,48,148,85]," kv":[434,1383,645,56]," kw":[114,209,690,536]," ky":[123,669,808,154,544,346,432]," la":[57,19,80,30,110,28,16,7,57,48,73,67,89,29,22,54,9,34,1,2,44,53,53,16,52,81,74,38,56,30,4,51,8,3,45,38,2,9,14,5,25,136,54,18,3,28,14,79,1,41,8,56,22,82,33,85,4,156,33,42,21,23,10,55,34,99,63,15,7,17,25,28,39,4,64,8,43,5,59,27,32,12,321,13]," le":[5,24,46,13,13,103,15,32,19,9,80,33,49,35,13,23,34,51,22,59,6,31,7,13,32,85,32,5,68,88,81,23,10,87,112,1,70,36,91,61,46,76,88,4,33,3,29,2,86,12,25,83,82,33,26,32,6,12,18,22,16,5,7,19,3,71,104,5,45,6,102,8,108,53,15,109,61,137,88,60,22,51,40]," li":[13,11,17,28,1,335,112,17,203,36,17,55,39,1,4,31,101,185,3,17,90,14,78,94,46,14,1,307,9,23,15,39,37,60,26,54,18,186,37,94,3,49,59,180,21,9,129,37,86,42,19,141,155,35]," lj":[1790]," ll":[1840,688,385,57,324,40]," lo":[15,33,24,78,48,64,1,86,60,1,18,32,24,36,15,232,22,257,66,11,133,23,178,131,35,176,13,227,35,38,153,15,9,22,15,55,11,23,12,37,42,36,56,156,18,106,90,193,22,6,26,171,72]," lu":[16,21,35,39,67,51,13,100,7,1,84,32,34,79,25,19,32,10,15,40,35,63,6,35,34,39,93,122,7,5,18,50,37,103,69,137,66,3,4,20,34,11,3,37,68,61,15,21,151,97,7,34,53,10,90,10,26,138,40,7,33,83,27,25,59,16,75,4,13,25,21,13,148,20,17,122,53,93,36]," ly":[2549,15,671,137]," m ":[2545]," ma":[1,3,5,1,2,13,1,9,14,4,2,4,8,4,5,6,11,24,7,2,9,5,26,5,9,1,5,18,4,1,1,2,1,5,25,1,2,6,9,1,3,39,42,6,26,3,9,6,11,4,2,8,18,15,1,1,6,1,10,2,3,4,7,7,1,14,1,1,1,14,9,4,2,3,8,6,2,11,2,21,13,5,4,3,4,18,1,7,3,10,3,29,11,1,5,6,20,10,18,9,15,8,11,2,5,11,5,2,2,2,7,9,1,40,1,7,4,7,23,15,7,2,2,16,1,2,12,2,1,1,2,2,2,43,10,29,4,17,3,5,7,1,8,7,7,12,3,17,5,6,3,3,2,8,6,22,5,8,7,16,7,6,3,6,3,2,12,5,13,8,2,1,3,15,4,7,8,3,23,14,13,7,5,10,3,3,7,8,2,3,3,5,8,7,11,14,5,4,6,1,2,5,1,6,5,19,22,8,5,23,1,10,5,5,11,14,6,16,3,7,22,18,6,3,8,22,11,2,3,18,4,3,2,5,5,8,6,3,5,2,10,9,18,14,4,1,1,1,24,3,9,17,11,7,3,7,3,3,5,8,4,8,8,5,5,4,19,7,23,3,3,8,4,16,16,10,10,13,6,7,5,16,7,8,1,5,2,4,5,2,1,25,9,3,6,2,5,5,13,10,2,2,9,11,15,24,16,9,8,3,2,12,13,11,4,6,3,6,6,7,2,5,7,7,1,7,16,1,1,36,2,1,8,5,2,24,1,15,7,10,6,6,16,12,1,2,25,7,4,12,5,8,3,17,6,3,5,3,5,3,5,8,1,27,4,2,11,4,4,2,4,20,7,5,2,6,5,5,6,26,2,5,12,8,9,3,19,10,6,17,2,4,4,15,6,3,9,4,16,3,11,3,10,15,4,3,6,1,6,1,10,3,5,7,2,1,7,1,26,8,5,12,5,4,17,3,1,2,6,4,2,7,26,6,1,11,4,2,8,4,3,1,4,2,2,38,5,2,6,9,20,2]," mb":[28]," mc":[113,160,147,58,18,539,86,35,226,46,555,49,15,134,169,163,12,27,5,195,518]," me":[28,113,42,53,179,142,12,145,46,51,102,70,24,36,266,39,73,10,8,85,17,13,15,5,32,19,47,64,11,9,19,6,191,3,79,94,72,73,10,14,179,159,60,58,32,1,291,181]," mi":[23,5,35,1,23,1,9,27,8,13,60,16,59,21,4,24,20,2,7,4,8,2,35,28,16,16,23,34,29,6,39,6,33,11,13,8,25,39,5,8,22,9,5,4,45,35,30,64,24,20,14,11,33,3,11,51,40,49,8,16,27,48,2,8,107,29,39,21,16,72,38,68,6,11,1,13,5,9,4,75,25,13,6,27,21,5,19,33,18,24,10,1,17,33,4,10,7,4,11,4,20,86,14,7,6,15,63,42,3,3,2,14,4,65,57,20,14,16,46,53,2,32,6,27,89,7,22,34,24,25,7,4,60,2,35,31,8,15,2,24,13,101,56,32,3,17,53,2,1,1,1,17,41]," ml":[1596]," mo":[59,69,30,38,6,166,13,24,28,35,54,29,37,76,18,4,144,19,1,47,18,1,170,44,10,14,36,39,37,48,79,33,80,100,74,7,8,35,45,26,23,8,18,12,43,31,16,59,196,33,58,23,49,26,28,22,20,48,133,1,5,50,43,11,25,8,13,3,3,14,24,180,5,51,69,23,84,48,31,135]," mr":[1093,1158]," mu":[144,1,29,7,97,57,5,251,148,27,168,38,138,38,356,84,28,25,27,8,46,35,25,46,27,79,34,354,137,20,238,122,229,21,72,89,157,56]," my":[1586,352,370,4]," na":[202,1,31,84,35,44,124,165,20,141,55,389,492,1,270,16,99,9,11,90,208,18,35,173,351,10,254,25,103]," ne":[286,342,129,274,93,157,16,31,12,194,99,63,57,2,198,158,406,155,262,93,132,79,123,43]," ni":[20,7,5,92,122,4,113,32,99,7,69,5,3,120,25,34,222,37,155,9,155,38,19,113,323,75,40,11,71,3,97,87,40,305,171,331,101,107,6,32,58,5,20,45,26,24]," no":[3,8,71,192,63,119,3,47,265,136,59,11,159,114,317,181,123,137,59,267,480,112,162,100,54,169,46]," nu":[683,574,418,14,193,298,4,64,276,813]," ny":[106,216]," o ":[572,621,204,544,24,302,141,268,132,40,393,1,9,111]," ob":[423,814,331]," oc":[761,1354]," od":[1471,1525,189]," of":[366]," og":[256,595,82]," oh":[666,2705]," oi":[461,2164]," oj":[1312,1438]," ok":[909,741]," ol":[153,123,142,52,92,182,25,31,80,30,136,41,30,87,73,41,123,8,2,4,31,36,28,24,84,56,320,7,15,100,136,85,36,24,57,148,182,29,100,89,4,77,87,96,66,72,10]," om":[637]," on":[36,1316,200,173,237,84,1336]," op":[425,2186,229]," or":[269,133,12,116,339,475,88,28,39,7,114,711,532,264,74,113,21]," os":[280,28,344,209,677,256,114,142,206,668,174,86]," ot":[642,47,89,1450,719]," ou":[975]," ov":[1889,1332]," ow":[1635]," oy":[1468,687]," oz":[1401,156,423,275,518,212]," pa":[33,23,16,26,40,12,1,7,15,1,69,2,10,1,2,19,8,6,5,76,7,69,12,2,17,9,43,19,2,49,1,1,29,20,24,26,53,9,23,67,8,39,29,14,7,30,2,11,2,33,19,30,3,134,20,48,1,62,21,1,110,7,5,21,32,40,6,56,8,48,17,18,13,46,17,56,5,12,96,1,28,23,32,36,5,2,9,9,68,6,17,13,9,30,47,2,13,169,66,2,37,9,15,38,46,5,13,7,53,24,5,59,4,10,45,5,7,33,15,1,2,61,1,70,30,1,1,7,22,10,54,3,66,8,14,2,5,38,25,13,18,8]," pe":[44,34,37,29,10,12,1,39,81,25,7,16,14,19,165,9,61,24,23,46,6,11,19,4,2,116,28,12,28,1,99,77,3,4,14,1,16,96,8,23,86,56,6,12,6,64,21,11,35,7,12,4,2,78,29,4,180,130,42,29,19,87,21,31,50,4,33,35,86,5,31,35,47,68,81,122,83,20,90,47,18,14,27,19,20,61,20,21,3,2,2,27,25,91,5,18]," pf":[31,694,217,1359]," ph":[116,79,328,131,297,311,12,144,839,75,40,342,134,159]," pi":[95,75,20,37,130,12,11,55,19,56,56,5,16,104,13,167,20,28,55,345,67,90,3,11,2,64,62,38,18,100,15,14,43,12,106,231,13,10,28,29,13,64,10,41,61,149,6,42,31,110,1,28,24,72,80,128,30,202,15,26,1,68]," pl":[171,49,13,147,100,179,443,76,359,183,262,447,423,262,92]," po":[247,3,52,170,64,133,75,4,42,80,276,223,151,25,49,5,37,13,8,5,2,179,119,7,88,2,235,44,3,4,352,7,163,63,8,152,56,14,86,4,6,122,31]," pr":[51,182,12,80,26,107,96,191,73,80,160,4,34,85,140,339,356,70,97,182,10,67,25,62,19,108,113,7,36,201,68,97,218,7,19]," ps":[1974]," pt":[2143]," pu":[34,25,599,352,1139,1138,185]," py":[2952,41,331]," qu":[307,913,207,593,339,699,317]," ra":[22,17,68,75,21,22,12,46,31,16,203,58,2,7,5,40,88,80,9,9,106,80,53,44,8,27,4,66,59,88,58,71,32,16,36,1,7,52,54,1,130,71,19,12,24,5,166,213,21,43,4,44,23,65,53,29,124,18,60,27,103,16,69,17,20,9,43,20,65,43,9,33,8,15,71,80]," re":[30,62,138,122,109,66,90,75,184,55,32,22,34,26,53,38,226,57,44,58,37,158,64,41,10,199,88,16,23,68,110,195,83,32,290,7,60,113,127,123]," ri":[80,18,90,35,104,15,89,11,35,27,73,55,66,110,3,17,144,94,17,191,37,21,115,69,9,23,43,118,34,177,11,11,25,29,121,42,20,102,26,18,70,96,98,12,424,67,119,165,5,99]," ro":[12,7,48,10,99,49,13,25,13,17,28,20,13,20,96,2,11,41,31,35,4,1,18,61,102,47,20,31,18,26,1,9,37,21,4,9,25,39,11,31,15,21,11,16,26,14,36,9,20,3,12,22,9,27,8,18,26,5,12,7,102,67,28,36,20,2,22,17,56,6,22,25,26,36,1,58,15,15,2,22,22,4,18,49,3,18,9,24,13,9,17,2,10,6,17,4,2,33,20,13,17,3,11,52,19,55,8,26,86,3,66,38,15,61,40,17,9,56,38,3,86,16,11,5,67,68,17,158,4,2,25,52,24]," ru":[201,71,78,20,94,26,126,6,3,108,158,8,157,43,122,27,28,97,23,232,23,35,9,34,353,232,25,163,558,70,68,42,4,53,14,90,82]," ry":[200,20,93,106,3,289,477,183,7,151,238,376,287,125,210,2,528,117]," rz":[816,766,795,213,629]," sa":[90,2,49,21,29,41,6,16,14,27,92,4,22,3,113,53,10,28,62,8,32,6,4,45,47,33,49,41,53,8,105,10,11,6,35,4,25,25,36,33,66,58,54,27,39,51,29,18,51,51,9,20,35,3,9,56,19,15,62,36,23,51,19,94,212,128,11,7,9,8,6,50,119,27,40,16,54,77,71,47,41,96,31,10,17,12,14,20,17,1,1,85,3,16,8,34]," sc":[45,56,6,11,4,71,12,49,34,16,27,31,31,5,289,16,37,1,5,4,48,19,24,54,5,10,7,29,138,19,125,75,17,95,185,11,259,135,14,182,90,18,28,52,92,22,23,63,6,125,5,20,82,18,53,112,33,115,66,4,167,10,49]," se":[0,14,85,22,44,231,20,27,28,47,35,33,97,87,23,192,49,56,70,265,5,65,82,72,21,3,30,11,392,19,15,41,47,46,21,78,28,9,30,62,21,23,206,41,31,52,38,27,9,127,33,6,36,26,4,86,4,24,33,72]," sh":[240,159,212,329,574,306,730,286,287,254]," si":[74,94,21,40,54,25,7,31,15,3,202,18,76,131,6,181,95,45,8,2,15,52,91,82,37,4,38,184,37,53,89,19,27,78,23,55,36,134,85,10,1,88,26,17,3,64,16,56,48,13,15,60,10,110,19,12,90,20,32,9,8,188,80,9,30,14,3,1]," sj":[1488,1135]," sk":[227,1225,200,677,28,116,278,434,35,17,187]," sl":[314,128,11,60,45,136,42,232,292,517,20,49,145,26,492,346,183,94,213,76]," sm":[334,785,96,85,545,452,201,86,347,6,326,32]," sn":[2214,1231]," so":[7,71,33,142,80,61,87,132,44,331,91,37,131,23,132,10,97,15,69,19,18,13,111,94,128,28,77,135,43,87,55,71,64,49,34,16,43,25,75,213,8,87,50,4,94,74,7,138,26]," sp":[374,135,544,1015,13,291,574,141,126,242]," sr":[1338,745]," st":[17,15,28,7,8,12,4,28,2,33,13,68,2,14,18,46,112,9,12,55,5,17,43,40,18,73,31,85,10,22,80,19,21,29,20,24,10,20,15,97,29,19,41,15,20,49,7,66,6,68,28,21,15,30,9,8,21,23,58,13,63,23,18,75,32,48,10,10,57,34,6,15,13,22,22,31,46,10,86,14,15,1,6,6,64,5,35,54,18,16,25,64,24,15,12,5,1,1,8,104,40,2,12,2,61,1,28,58,36,24,22,85,8,12,36,8,32,82,29,20,9]," su":[125,54,176,2,147,191,14,16,41,145,24,176,41,262,10,171,22,22,198,43,419,27,24,88,121,16,115,108,61,30,66,25,138,54,28,122]," sv":[481,525,555,313,361,1181]," sw":[81,2158,718]," sy":[80,133,35,1220,5,593,52,201,216,433,19,29,3,23,290,12]," sz":[55,5,60,92,54,92,65,79,115,41,193,115,469,26,1,11,6,61,64,254,14,9,44,127,16,96,275,346,56,210,34,259]," ta":[139,154,10,30,49,8,16,18,12,11,179,13,214,34,46,21,48,23,205,5,136,237,163,52,357,30,36,102,112,10,72,37,170,22,6,227,55,16,92,48,83,131]," te":[36,49,312,142,91,144,45,18,50,82,74,143,5,30,18,73,32,7,46,4,40,317,36,115,31,134,144,231,72,79,21,43,129,61,35,89,38,117,256,66]," th":[43,142,22,225,33,130,43,96,124,95,38,257,171,23,56,156,26,52,37,48,95,48,5,106,151,201,27,151,30,53,21,2,34,34,74,113,39,24,12,6,160,210,25]," ti":[90,33,40,5,32,204,252,95,96,96,175,69,16,4,5,120,337,242,471,187,137,285,103,123,7]," tj":[3098]," tk":[838]," tl":[2150]," to":[34,32,30,35,1,167,27,39,80,39,32,22,11,169,27,8,47,3,94,87,21,27,23,17,18,181,30,32,14,17,35,115,17,111,20,57,72,20,81,58,36,3,13,128,3,4,132,106,19,3,106,40,47,6,21,20,24,45,6,296,226,7,130]," tr":[143,67,88,135,369,88,46,44,89,37,63,222,47,192,172,51,104,460,351,302,78,46,119,123]," ts":[12,1000,756,181,503]," tu":[152,134,160,63,335,110,23,1185,91,898]," ty":[64,1031,236,1491,157]," tz":[921,2449]," ub":[2930]," ud":[918,1128,474]," uf":[1150]," ug":[3073]," ul":[388,83,110,233,22,175,229,383,346,284,20,27,180,154,275]," um":[2046]," up":[2508]," ur":[265,382,79,312,63,1074,83,166,679]," ut":[1227,12,1243,44,685,137]," uu":[2236]," uw":[5,972,154,761,1513]," va":[6,4,39,79,8,5,48,26,26,16,62,134,15,4,2,45,63,2,71,61,65,13,69,100,2,71,15,79,44,38,1,1,11,109,149,58,34,129,43,46,197,12,40,41,65,52,84,1,66,54,47,33,3,31,8,9,25,76,191,12,65,19,56,10,36,6,50,44,26,128,13,46,59,74,1]," ve":[16,46,64,146,660,88,1,40,19,207,225,267,154,116,88,7,162,215,159,13,86,247,189,74,32,28,62,14,21]," vi":[7,16,134,179,2,48,10,96,38,21,126,4,43,25,52,38,27,104,74,10,113,28,72,38,77,5,84,4,53,27,53,46,80,91,74,85,34,198,90,211,24,110,27,27,96,13,115,32,159,107,71,29]," vl":[402,483,449,4,1049]," vo":[244,211,85,127,33,258,216,36,82,153,460,51,75,182,117,102,118,300,425]," vr":[1342]," vu":[712,197,111]," vy":[1500,385,577,299]," wa":[65,28,100,148,73,96,57,16,13,44,1,121,176,12,158,63,87,43,726,104,5,154,76,48,8,121,102,267,57,26,153]," we":[50,127,5,305,198,13,89,9,40,186,67,83,105,28,58,23,107,14,53,128,64,14,343,329,61,45,273,43,34,15,110,53,73,252]," wh":[384,303,1022,145,1425,32]," wi":[40,107,2,60,276,89,38,4,181,66,51,78,273,37,4,55,201,439,9,13,118,14,89,32,16,63,76,91,37,4,103,8,12,153,7,19,42,83,81,69,148,88,100]," wl":[956,48,279,213,1480]," wo":[22,7,186,37,36,33,159,161,8,24,26,35,3,345,15,6,110,108,48,6,144,45,88,205,103,7,19,187,51,42,177,83,39,147,17,101,26,90,50,82,2,67,69,52]," wr":[112,426,647,888,539,649]," ws":[1232]," wy":[247,294,960]," xa":[2448,174,766]," ya":[702,756,210,1164,4]," ye":[179,1634,1407]," yl":[1107]," yo":[1027,606,52,572]," yu":[366,1249,1583]," yv":[249,985,363,585,309,569,129]," za":[2,221,48,333,288,252,1,291,323,10,91,15,201,14,332,11,38,290,14,511,135]," zb":[35,526,124,270,27,31,533,604,87,143,55,156,456,89,112]," zd":[172,821,503,1066,552,133,177]," ze":[945,72,431,348,372,835,18,45,317]," zg":[422,895]," zh":[2056]," zi":[360,233,40,376,167,550,23,627,297,28,343,4,30,31,258,7]," zn":[235]," zo":[65,202,2092,560,271,70,28]," zr":[2577]," zs":[183,319,545,672,1247,127]," zu":[91,74,1208,1777,137,155]," zw":[184,2783]," zy":[1326,339,370,1422]," αθ":[1376]," μα":[1376],"aa ":[689,331,1696,623],"aac":[705],"aaf":[733,162],"aag":[1278],"aai":[2908],"aak":[96,2687],"aal":[245,450,2479],"aan":[408,53,1532],"aap":[722],"aar":[391,78,78,13,303,17,68,1045,322,132,505,38],"aas":[1928,1550],"aat":[883,2443],"ab ":[1303],"aba":[174,43,1888,666,712],"abd":[756,871,222],"abe":[47,111,180,167,79,125,198,175,284,363,250,80,205,192,28,18,181,53,98],"abi":[438,10,144,228,4,101,398,100,3,116,224,17,110,206,20,455,11,185,357,79,183],"abk":[2963],"abl":[16,158,1602,1,27,512,198],"abo":[293,233,145,39,315,69,830,245,41,138,293,2,643],"abr":[156,105,703,111,59,83,1553,271,309,60,54,3],"abs":[692,570],"aby":[968],"ac ":[705,14,394,1057,200,504,312],"aca":[1862,617,298,315,357],"acc":[1587],"acd":[378],"ace":[593,309,80,67,120,551,151,196,69,278,794,61,8,7],"ach":[48,57,127,64,8,24,263,8,67,121,35,3,7,53,113,145,27,134,80,108,79,171,60,63,181,63,334,44,249,298,76,267],"aci":[55,81,58,68,284,97,133,102,149,64,20,67,86,790,385,271,61,351,32],"ack":[32,10,23,28,13,14,200,657,215,190,212,139,15,9,29,245,104,77,29,143,1001],"acl":[950,1586,444],"aco":[409,617,161,1323],"acp":[2886],"acq":[420,156,1601,863],"acu":[1221],"acy":[2283,134],"acz":[35,803,192,786,220,283,72,223,28,98,31,132,84,176],"ad ":[178,138,134,93,131,147,2,237,244,254,283,313,113,200,6,336,270],"ada":[44,90,52,62,70,243,418,73,15,54,49,3,48,61,61,197,126,16,3,74,84,48,60,471,65,131,119,146,109,53,283,68,25,14],"adb":[545],"add":[9,819],"ade":[333,57,34,6,381,42,80,84,36,61,132,447,694,123,32,207,69,314,16,4,27,80,86,57],"adh":[1407,976,25],"adi":[57,145,1,21,95,83,500,436,7,49,72,67,16,59,118,287,165,101,29,219,13,114,263,157],"adj":[627],"adl":[706,585,492,16],"ado":[90,73,74,363,68,37,232,301,101,156,82,337,602,113,487,89,195],"adr":[908,314,87,20,61,306,221,103,154,262,178,121,118,137,45,396],"adt":[886],"adu":[945],"adw":[1405],"ady":[956],"adz":[1144,1321,2,302,523],"aeg":[1933],"ael":[23,64,1,117,52,23,25,57,105,131,39,145,202,34,297,294,322,5,19,33,70,54,9,6,73,51,147,154,76,120,302,63,137,1],"aem":[1624],"aer":[2231,104,493,169,396],"aes":[2355],"aet":[33,1239,231,599,260],"af ":[470,1686,208,624,122,344],"afa":[283,460,422,362,52,25,90,358,69,277,71,581,200],"afe":[1320,989],"aff":[741,761,618,797,93],"afi":[553,1175],"afl":[733],"afr":[2873],"afs":[861,34,731,235],"ag ":[92,345,841,449,90,456,464],"aga":[150,72,666,560,36,733,651,213,123],"agd":[12,200,402,384,296,419,146,481,339],"age":[275,69,177,701,446,93,27,135,652],"agg":[324,1064,182,532,706],"agh":[496,1711,40,322],"agi":[212,73,265,451,575,356,212,195,15,158,471],"agl":[420,1537],"agm":[990,135,823],"agn":[328,48,53,77,57,166,366,356,107,24,160,127,121,541,116,21,62,173,126],"ago":[239,451,455,749,299,840,83,187,153],"agr":[1050,1904],"agu":[108,262,721,298,307,248,434,133,434,61],"agy":[847],"ah ":[238,16,176,693,446,122,162,559,132,60,202,151,313,58],"aha":[610,602,86,443],"ahd":[347,1048,1430],"ahe":[22,606],"ahl":[290,231,62,225,548,209,41,401,1328,56],"ahm":[592,91,1651],"ahn":[162,293,1635,451],"aho":[113,1002,379,381,1204],"ahr":[234,2933,45],"aht":[189,1144],"ahu":[786],"ai ":[2399,561,138],"aia":[430,152,497,565],"aic":[2191,48],"aid":[593,1034,314,486,453,360],"aie":[26,13,2515,154,492],"aig":[330,110,343,90,1,220,1694],"aij":[126,1801,676,539],"aik":[225,2196,487],"ail":[273,205,269,39,375,712,64],"aim":[708,445,390,295,331,364,874],"ain":[6,70,4,27,75,310,578,93,16,40,521,52,75,7,53,39,18,110,80,146,33,218,352,96,56,13,251,4],"aio":[908],"air":[949,1622,147,369,70],"ais":[164,239,194,587,217,166,1639],"ait":[343,1732,422,119,178,279],"aiv":[781,1320],"aix":[2117],"aj ":[119,134,137,1205],"aja":[279,314,676,112,51,1573,403],"ajd":[2078],"aje":[117,356,539,1113,560,219,372],"ajk":[103,40],"ajm":[3033],"ajn":[2091],"ajt":[2428],"aju":[3416],"ak ":[3,5,52,5,1,7,139,7,18,170,18,34,47,4,39,80,108,66,15,41,3,76,77,50,23,3,82,12,13,3,158,61,10,19,12,30,66,70,8,124,124,11,28,16,79,10,13,11,84,8,48,43,3,24,79,61,82,52,30,89,14,98,56,40,17,5,11,2,5,23,34,25,36,3,78,9,26,51,60,12,55,45,21,42,55],"aka":[1002,47,263,43,313,261,917,485],"ake":[38,72,352,1408,858,163,204,61,88,107,86],"akg":[1448],"akh":[2441],"aki":[372,301,4,363,377,77,455,157,60,470,8,424,85,30,201,69],"akk":[96,258,907,484,748,290,154],"ako":[2,153,170,31,61,107,4,109,40,16,28,81,952,117,116,325,121,102,68,41,113,79],"aks":[389,937,466,437,1206],"aku":[142,464,382,77,63,84,474,224,450,632,228],"akx":[640],"al ":[57,88,12,35,36,55,46,29,8,13,116,174,26,51,26,50,45,29,55,53,72,94,2,107,126,27,95,1,51,58,57,5,19,3,12,3,132,5,10,51,39,90,42,26,173,14,13,25,106,7,28,85,97,26,132,2,1,29,64,37,7,160,18,10,71,83,8,84,3],"ala":[4,104,33,154,32,42,1,8,29,175,210,157,5,3,38,47,23,98,174,220,157,28,97,7,79,169,11,3,39,173,195,87,13,135,20,10,113,70,24,29,4,117,15,4,146,42,34],"alb":[18,317,311,792,309,135,183,92,3,396,99,152,95,129,303,137],"alc":[478,460,379,138,131,128,313,104,209,105,837,134],"ald":[79,265,29,5,36,96,49,37,428,33,73,518,29,262,105,179,79,64,56,103,5,596],"ale":[26,105,5,5,5,50,19,45,173,35,51,63,14,18,66,9,54,9,11,64,12,3,29,11,10,23,49,1,33,25,13,22,50,102,84,15,165,74,90,5,49,13,8,48,61,37,84,131,75,12,4,2,101,72,32,31,11,11,32,2,60,42,26,50,40,2,16,90,35,87,21,77,27,120,10,84,16,31,50,55,75],"alf":[19,20,66,187,512,36,380,201,181,543,30,118,153,88,311,528],"alg":[53,14,245,479,755,287,802,156,93,1,53,449],"ali":[12,191,40,38,14,11,47,16,196,83,31,28,189,219,7,92,134,36,5,11,76,34,8,166,20,39,41,29,131,8,7,58,149,23,10,4,30,202,16,4,62,49,14,113,108,87,17,71,114,18,41,192,56,6,69],"alk":[297,126,637,1053,11,240,978],"all":[38,136,32,26,50,4,147,18,70,46,17,1,279,2,39,24,68,3,107,27,5,8,18,91,150,77,47,45,47,199,7,19,174,26,46,43,12,98,1,2,41,81,34,2,7,58,97,9,199,44,272,36,31,36,172],"alm":[448,116,261,128,125,892,110,525,62,64,297,378],"aln":[784],"alo":[245,369,47,21,476,206,183,54,325,310,332,224,225,94,66,262],"alp":[2948],"als":[313,46,370,529,3,351,225,218,176,715,51],"alt":[39,154,148,47,67,51,135,1478,367,159,275,75,179],"alu":[318,1957,489],"alv":[10,177,97,245,362,598,131,225,440,751,89,5,170,16,113],"aly":[661,111,1213,415],"alz":[634],"am ":[44,294,102,134,36,6,25,207,131,73,15,106,170,197,126,16,3,30,26,150,169,204,303,51,226,303,160,131],"ama":[37,11,80,175,425,15,370,57,120,39,63,15,90,80,60,271,32,33,380,117,63,367,253,32,30],"amb":[799,58,310,538,35,1,37,193,99,823,263,296],"amc":[561,491,230,1710,53],"ame":[849,169,250,41,81,239,544,67,57,74,97,132,5,552],"amh":[1903,654],"ami":[24,114,131,11,5,134,89,97,17,27,53,132,15,126,441,118,253,129,16,3,406,5,53,79,37,149,89,286,104,109,63,45,4,22,27,48],"amj":[901],"aml":[2758],"amm":[107,98,242,383,46,402,390,284,1107,47],"amo":[284,11,902,442,185,71,345,41,306,10,321,204,85,213],"amp":[260,534,167,81,858,631,597],"amr":[2283],"ams":[248,66,1637,59,282,181,1003],"amu":[306,44,157,915,976],"amz":[760],"an ":[14,5,18,3,20,27,2,2,6,5,16,12,13,8,1,21,17,10,11,14,9,6,1,16,1,15,5,19,2,28,5,2,3,41,18,12,4,7,7,1,26,3,9,7,1,13,15,3,4,15,26,2,2,15,4,14,4,19,31,5,2,14,27,2,11,9,4,1,1,10,22,17,1,4,24,2,27,35,5,2,29,21,1,10,5,15,5,22,10,25,6,22,2,12,24,22,8,5,3,6,29,9,12,28,25,10,24,1,17,1,23,9,7,5,4,2,10,7,5,4,9,13,14,4,8,6,5,6,5,2,26,4,4,21,25,4,8,34,5,18,2,8,9,17,18,9,14,10,7,6,9,10,6,43,8,8,3,5,5,4,8,13,3,1,3,25,7,15,1,7,20,3,39,12,3,5,4,21,13,1,2,5,6,13,19,5,3,10,23,20,11,11,3,12,2,26,5,22,7,10,9,7,27,4,6,30,3,1,6,15,52,11,9,2,6,4,2,12,3,1,9,16,2,2,10,9,9,27,3,3,31,54,9,24,5,1,2,4,8,33,2,1,22,9,1,3,31,1,2,10,8,2,11,14,1,19,11,14,4,12,13,6,16,4,17,14,3,1,2,8,13,19,2,1,1,6,19,5,12,16,8,4,2,44,6,20,3,1,15,10,10,20,3,8,6,11,7,7,10,14,4,2,2,4,3,10,8,4,16,1,9,5,1,26,9,23,7,7,3,4,6,2,4,3,11,6,19,14,18,13,4,4,1],"ana":[2,153,10,93,27,112,84,69,228,224,76,41,54,47,3,72,4,5,7,31,39,45,92,19,113,18,126,305,14,48,8,6,39,19,180,20,53,9,79,78,30,16,27,10,8,103,47,78,41,72,49,154,13,96,41,5,3],"anc":[108,51,80,37,42,91,267,130,4,40,19,8,131,25,47,21,41,48,1,38,117,8,128,9,44,75,49,65,15,12,21,58,68,9,85,14,14,2,3,4,41,17,233,24,73,38,55,23,91,97,89,22,44,52,36,58,31,38,191,30,22,19,83],"and":[17,1,8,32,15,11,1,3,4,12,24,3,15,16,34,19,4,30,11,45,29,29,2,2,36,1,33,16,5,64,42,23,33,9,9,5,2,8,79,10,1,19,1,25,47,33,3,11,24,7,18,4,26,8,2,74,18,3,17,6,16,26,26,4,6,4,39,3,24,7,27,19,66,51,4,43,13,19,15,12,35,2,43,23,2,21,2,2,25,5,19,18,7,65,3,20,13,6,14,5,8,18,28,5,6,69,26,3,27,23,3,10,14,7,2,2,13,42,41,9,16,53,14,7,32,51,2,11,29,11,4,8,5,1,34,3,24,6,27,10,63,19,36,12,13,27,19,40,5,26,36,8,19,6,64,48,17,1,6,19,11,9,23,11,49,5,2,47,12,29,17,16,4,1,46,7,13,22,17,6,19,2,11,13,24,4],"ane":[112,28,100,166,124,44,81,27,56,11,11,6,6,145,44,2,33,57,10,141,14,101,41,2,40,112,46,1,22,12,132,29,27,6,2,69,51,39,34,9,84,61,60,87,62,58,36,145,149,196,21,250,2,27,40,169,23],"anf":[2342,702,281],"ang":[20,9,110,125,24,54,28,150,5,143,66,92,50,12,68,27,99,15,108,107,9,96,15,46,41,6,92,59,189,95,7,42,171,50,307,37,62,2,107,3,78,30,12,180,30,2,117,16,2,1,78],"anh":[2783],"ani":[1,59,90,6,20,12,10,37,36,44,22,99,18,90,45,34,57,76,19,138,21,62,20,24,21,24,28,9,23,30,58,18,78,6,20,80,39,43,12,67,9,27,52,33,81,8,94,7,97,5,10,67,36,54,41,53,11,28,69,8,5,25,55,30,63,15,44,28,43,9,8,45,5,74,63,38,38,138,166,14,10,7,1,16,77],"anj":[740,112,919,234,241,691,67,169],"ank":[1,490,46,30,175,118,90,392,57,34,11,15,229,147,71,76,193,142,166,60,195,57,309,177,168],"anl":[1415,1980],"anm":[430,1790],"ann":[5,1,58,58,3,56,123,44,12,4,22,7,19,40,43,12,63,22,28,11,28,12,10,39,5,5,38,41,23,20,8,15,8,31,44,36,7,29,7,89,51,2,19,9,10,37,39,90,60,10,6,5,91,21,30,22,3,32,4,2,9,19,9,13,9,28,14,23,27,32,73,20,16,24,104,14,1,31,4,33,154,56,39,9,77,46,6,16,20,3,71,11,19,42,3,6,45,1,1,30,5,53,4,5,29,10,12,28,62,17,20,101,2,2,15,8,22,16,37,29,16,17,16,11,10,11,19,48,1,1,14],"ano":[128,26,4,3,5,6,26,67,183,13,21,139,49,145,93,55,32,69,47,119,42,38,111,4,76,62,9,79,6,59,169,14,123,138,55,12,109,33,159,3,41,64,94,19,232,265,10],"ans":[179,208,21,41,150,172,102,28,27,14,10,97,157,92,175,97,52,46,71,70,11,204,388,79,7,58,316,36,12,306,249],"ant":[134,58,36,3,77,28,36,3,2,56,65,54,138,22,16,19,30,3,5,3,37,1,12,71,101,32,39,157,103,39,30,87,75,87,45,4,73,17,4,16,90,34,8,47,43,31,122,13,27,157,62,1,86,1,11,23,23,51,139,23,1,8,64,87,7,134,5,14,25,30,8,13,9,40,30,65,5,7,11,29,36],"anu":[67,124,37,213,95,8,90,145,136,84,11,69,79,127,344,205,160,324,135,123,328,165,100,10,1,56,29,56,19,7,26,2,85,19],"anx":[2129],"any":[2580],"anz":[371,250,407,483,176,142,53,314,1104,69],"ao ":[2117,469],"aol":[460,417,776,328,834,379,64],"aor":[3064],"aos":[363,972,57,113,1676],"aou":[830,469,1868],"ap ":[1477,1067],"apa":[722,865,81,54,343,129,689],"apc":[1794],"ape":[72,4,166,511,1166,28],"apf":[2890],"aph":[2775],"api":[382,52,395,1351,206,52,637,223],"apk":[2971],"apl":[993,2448],"apo":[303,391,742,38,133,515,317,274],"app":[202,685,936,781,109,251],"aps":[709,735],"apt":[1411,1936],"apu":[3133],"aqu":[98,1326,2026],"ar ":[0,108,109,19,72,14,8,61,23,33,63,86,31,95,148,120,131,253,10,87,199,134,104,36,4,15,30,85,135,15,52,30,71,34,7,39,18,68,72,24,134,54,192,227,24,1,7,47,48,96],"ara":[49,84,105,16,71,57,1,60,458,4,7,35,54,41,81,2,22,44,37,7,30,294,6,103,23,72,104,15,3,3,59,28,51,197,16,48,13,61,8,70,21,5,36,43,89,53,51,203,17,24,80,48,34,13,59,28,9,1,17,12,84,73,24,18],"arb":[133,187,5,57,224,95,114,97,316,151,186,382,340,178,168,53,5,370,402],"arc":[93,73,42,38,106,99,5,19,37,42,50,14,46,68,6,79,38,42,65,19,23,53,67,37,50,22,50,51,15,25,64,58,24,76,3,5,6,26,172,54,101,51,38,76,78,37,101,9,66,50,12,35,7,32,53,42,113,34,3,7,6,3,14,82,32,28,4,13,78,55,16,3,73,1,34,53,84,4,52],"ard":[48,3,47,10,96,16,10,25,54,2,2,9,100,38,16,1,7,179,72,24,40,5,3,1,20,48,1,3,92,1,56,18,28,60,13,40,60,26,29,68,127,23,8,15,10,91,64,34,155,98,121,26,9,7,20,6,106,47,57,83,97,14,24,89,58,7,64,18,93,9,16,23,59,43,201,68,15,36,6,62],"are":[10,107,54,73,200,84,120,91,152,69,43,130,136,20,57,51,27,46,122,25,3,19,120,1,11,135,38,36,19,62,15,20,2,48,84,24,7,58,12,63,83,10,121,19,13,9,47,109,98,13,155,59,137,32,1,144,34],"arg":[1051,315,166,150,411,51,870,156,214,7],"ari":[4,55,17,2,46,11,29,11,6,29,8,86,42,35,34,1,5,18,15,15,13,15,78,8,26,25,4,55,3,32,15,6,18,45,21,4,19,48,13,21,21,38,8,43,25,14,21,24,43,1,2,17,9,1,25,46,20,12,5,46,33,34,1,7,15,13,16,13,18,19,11,2,66,80,19,29,37,31,27,8,11,39,11,9,46,9,16,12,36,12,22,19,16,50,7,27,14,12,21,7,16,9,40,8,5,3,15,13,2,20,46,55,36,14,15,7,54,3,46,32,43,19,7,16,28,77,19,33,18,76,19,10,16,1,6,43,20,27,33,10,3,8,7,59,12,29,6,25,15,25,8,8,20,29,11,10,12,2],"arj":[411,132,1249,75,365,85,605],"ark":[213,11,28,39,94,11,17,102,45,321,335,75,45,58,52,37,55,11,4,36,137,200,72,15,34,201,14,43,3,120,81,57,27,1,40,20,188,57,18,247,59,146,81],"arl":[86,50,471,121,113,28,44,203,137,20,71,27,17,116,131,89,43,225,27,19,49,124,61,159,199,3,195,46,95,94,34,46,48,54,17,128],"arm":[2,57,85,245,142,4,170,13,54,182,17,37,193,247,190,192,376,53,130,44,21,288,17,44,211,82,85],"arn":[222,31,1358,184,22,2,266,67,205,11,90,12,495,74,13,430],"aro":[82,18,34,23,57,70,115,94,54,33,28,237,14,19,62,200,117,15,7,186,17,7,23,38,39,218,50,83,68,28,49,2,76,48,52,173,11,137,120,39,49,93,67,162,74,50,201,43],"arp":[474,1899],"arq":[835,868,123],"arr":[42,29,18,46,23,353,175,398,82,24,2,115,182,172,28,62,153,9,215,76,22,44,148,244,181,15,10,6,112,8,245,106,21],"ars":[224,44,63,54,19,107,104,94,72,33,15,32,12,26,21,28,22,273,26,86,105,20,194,204,37,243,60,11,123,5,399,42,121,13,43,220,31,102,120],"art":[6,19,37,118,4,2,75,4,59,67,16,56,4,2,27,21,40,1,2,2,23,1,16,17,2,4,26,16,41,65,72,1,17,117,97,37,2,23,16,27,1,19,9,42,43,35,6,3,30,69,13,17,54,24,99,69,22,13,3,82,5,24,12,3,40,32,22,19,9,7,49,7,16,101,12,51,17,26,9,65,17,53,45,29,25,19,3,4,54,47,38,125,9,44,5,2,48,5,73,89,12,20,53,7,35,35,5,12,5,15,31,39,26,45,29],"aru":[1157,1288,105],"arv":[168,655,512,97,331,122,831],"ary":[66,5,418,634,152,628,1492,32],"arz":[17,101,59,46,100,75,143,63,113,24,410,131,40,69,43,164,37,525,303,322,77,148,176,33],"as ":[0,43,6,9,26,1,56,21,1,44,2,13,36,13,27,1,4,9,14,9,28,37,34,3,28,130,16,102,5,14,10,20,49,47,95,71,48,34,51,2,8,70,70,5,102,5,23,12,44,2,26,11,4,2,73,4,18,42,52,6,31,1,47,45,24,9,70,38,16,40,34,33,68,39,95,39,56,4,2,16,5,6,4,10,5,26,2,1,17,6,1,18,46,9,26,78,2,24,5,5,20,13,138,89,24,18,82,60,18,26,44,84,14,17,28,3,9,5,5,28,8],"asa":[608,375,244,250,449,240,198,58,75,31,495,156,209,93],"asc":[37,342,434,138,539,246,132,5,135,310,254,699],"asd":[639],"ase":[147,387,111,815,468,504,96,164,248,194,157],"asg":[68],"ash":[1169,1336,260,394,43],"asi":[2,47,451,79,498,148,10,64,68,675,42,277,72,19,11,64,94,126,167,402,27],"ask":[383,1130,30,266,1259,171],"asl":[812,1304],"asm":[533,1422,765],"asn":[2009,233],"aso":[34,184,179,87,181,822,31,737,532,97],"asp":[615,4,10,745,601,38,145,37,34,1245],"ass":[287,214,338,156,142,115,101,51,68,70,109,18,733,93,84,87,765,31,2,14],"ast":[2,12,10,7,212,153,12,178,329,34,36,43,271,126,50,51,76,538,134,21,48,30,6,22,9,30,26,29,28,136,100,57,8,52,30,8,36,65,71,186,54,140],"asy":[1174],"asz":[111,21,208,160,38,41,131,35,8,42,5,3,15,214,6,135,128,24,39,35,37,72,154,4,244,15,61,57,87,3,31,379,39,8,22,49,51,43,17,50,117,295],"at ":[159,815,320,294,236,305,350,21,151,347,278,51,23,108],"ata":[53,14,110,26,19,84,17,30,72,192,75,25,74,204,29,21,13,78,15,24,147,69,93,22,40,52,186,26,23,228,194,196,12,42,75,55,150,6,71,15,7,54,281,115,53],"ate":[537,163,34,16,231,13,195,163,20,2,3,68,18,12,10,127,91,787,6],"ath":[164,220,309,8,182,106,167,37,131,12,182,335,92,87,157,5,30,99,110,18,116,104,483,116,20,36,31],"ati":[381,1473,165,1359],"atj":[1679,205],"atk":[114,175,1121,117,22,317,633],"atl":[1952],"atm":[1745],"atn":[81,1587,656],"ato":[365,164,17,59,210,134,120,400,352,1062,17,416],"atr":[54,223,202,234,55,370,145,262,100,86,64,17,294,2,18,74,39,30,67,289,93,225,56,164,256],"ats":[569,2737],"att":[9,200,304,10,256,207,154,57,154,52,11,247,20,89,150,747,40,2,37,28,41,10,32,127,57,263],"atu":[25,619,1023,893],"aty":[2506],"atz":[127,132,1313,538,1046],"au ":[452,799,145,59,353,245,55,20,152,16,418,323,422],"aub":[254,479],"auc":[654,1247,581],"aud":[52,50,239,38,139,51,353,63,6,440,66,47,43,542,573,102,12,213,138,169],"aue":[214,321,760,58,179,202,290,1030],"auf":[91,1818],"aug":[1797,1365],"auh":[2923],"auj":[3252],"auk":[872,1669],"aul":[33,57,165,1,2,10,23,171,26,43,101,132,23,196,232,153,60,50,33,69,3,118,48,125,136,558,186,229,109,169,39,35,16,5,38],"aum":[15,255,432,453,232,857,480,132,537],"aun":[361,315,764,366,350,140,769,164,203],"aup":[300,163],"aur":[76,61,19,30,18,120,82,108,285,11,119,574,117,36,67,21,18,104,331,68,405,63,131,209,159,13],"aus":[31,21,219,40,32,488,145,181,285,46,269,375,190,93,56,110,180,352,86,177],"aut":[486,1014,426,358,27,164,286],"auw":[1793,1035],"auz":[1863,1184],"av ":[57,37,135,100,279,61,25,81,70,14,258,395,21,558,219,99,53,74,48,396,362,92],"ava":[436,56,32,162,376,895,206,634,365],"ave":[49,7,95,204,88,159,1,239,798,342,467,613,55,51,52,129],"avi":[30,211,71,98,28,19,83,8,116,120,111,29,17,241,22,14,11,30,80,15,92,164,16,11,36,10,15,116,76,14,207,115,76,86,60,9,4,49,68,44,9,58,105,44,30,3,5,52,85,290,83,2],"avo":[173,70,170,66,700,1727,169,240],"avr":[285,1551,710],"aw ":[63,158,12,2,2,220,36,444,13,6,37,3,20,13,228,68,30,106,34,1,109,42,101,21,50,38,50,7,122,4,76,52,8,199,9,7,45,96,124,113,70,13,8,185,32,4,20,39,219,63,2],"awa":[485,482,177,67,1088,501,112,509],"awc":[2426,222,161],"awd":[3168],"awe":[138,158,305,51,103,99,90,291,49,206,1675],"awg":[171],"awi":[358,1594,811,356],"awk":[1765],"awl":[862,68,118,985,846,184],"awn":[43],"awo":[558,120,58,524,517,69,1575],"awr":[65,3053],"aws":[536,847,196,236,249,124,987,90],"awt":[1209],"awu":[1067,1788],"awy":[491],"axi":[573,146,427,865,810,40],"axo":[3296],"ay ":[314,343,26,304,162,492,293,315,6,213,164,298,157,2,3],"aya":[1337,331],"ayc":[2869,41],"ayd":[1722],"aye":[2899],"ayl":[626,598],"ayn":[939,2062,69,102],"ayo":[732,792,1446,7,46,143],"ayr":[2702],"ays":[2100],"az ":[603,682,88,886,139,1021],"aza":[110,572,945,127,878,604,46,157],"azc":[166],"azd":[2791,147],"aze":[515,1245,469,20],"azg":[1122],"azi":[888,155,38,377,24,355,185,66,833],"azk":[4,663,514,1357],"azl":[343],"azm":[2234,953],"azq":[128,1413],"azu":[140,1835],"azy":[903,654,688],"azz":[922,482,1393],"ba ":[217,576,929,160,164,28,86,1189,97],"baa":[883,65],"bac":[106,214,279,1158,108,347,172,387,6,257],"bad":[1405,2026],"bae":[2231],"bag":[563,1369],"bah":[2541],"bai":[747],"baj":[1012,257,112,710,1185],"bak":[354,286,621,1099,133,466,136,264],"bal":[174,32,26,65,73,53,211,27,244,696,338,5,161,126,100,9,105,72,376,70,356],"ban":[265,461,310,65,72,131,155,209,507,52,359,149,728],"bar":[25,17,20,9,62,89,98,5,57,78,7,17,27,4,42,1,44,4,193,16,97,202,33,45,24,12,44,35,72,59,31,13,83,96,21,7,35,13,13,126,23,48,45,136,24,52,57,9,17,74,50,54,5,163,53,74,120,101,13,67,46,279,77,20],"bas":[14,133,249,12,126,52,399,440,715,26,108,21,78,28,9,30,16,67,301,90,358],"bat":[289,234,292],"bau":[214,56,109,612,164,198,381,510,612,181,17],"bay":[657,75,2198],"baz":[2921],"bb ":[1089],"bba":[2760],"bbi":[948],"bch":[1938],"bco":[606],"bcz":[2401,176],"bde":[756,871,222],"be ":[701,381],"bea":[54,371,275,68,181,109,752,369,530,168,542],"bec":[253,28,96,392,242,157,251,583,28,583,832],"bed":[1226,132,2090],"bee":[440,1783,371,45],"beg":[3403],"beh":[53,3417],"bei":[1942,1131],"bek":[0,2824],"bel":[158,380,46,67,58,102,6,85,5,260,305,158,349,80,79,93,225,28,2,16,5,181,51,95,641],"ben":[115,45,25,215,395,10,25,4,57,123,42,203,157,371,242,31,125,79,386,217,268,229],"ber":[18,2,27,4,26,19,63,79,3,16,69,9,3,7,8,121,43,38,39,56,10,71,30,15,11,1,14,30,41,19,27,8,19,7,17,16,42,25,3,15,34,47,8,4,4,15,11,13,1,5,24,2,49,35,43,72,16,48,22,15,29,51,69,11,6,20,15,7,31,12,3,7,35,55,6,109,60,5,39,5,33,10,10,18,2,3,8,6,17,9,63,20,11,52,72,2,36,18,30,22,14,10,8,51,16,16,6,15,44,38,33,19,14,18,95,25,24,29,38,30,36,10,41,13,13,1,3,118,1,25,16,52,19],"bes":[2048,195,9],"bet":[48,21,436,420,126,678,101,126,203,132,392,586],"bev":[3056],"bez":[2417],"bha":[2609],"bhe":[1934],"bi ":[430,98,1255],"bia":[326,288,23,39,127,7,250,9,3,70,43,304,87,306,12,128,80,17,364,20,82,727,59],"bib":[3389],"bic":[704,149,2096,475],"bid":[791],"bie":[438,321,61,37,91,9,31,51,255,29,7,134,46,256,125,25,1290,179,7],"big":[35,526,124,270,27,31,1137,87,143,55,156,456,89,112],"bij":[1347,885],"bik":[1546],"bil":[1208],"bin":[472,21,99,41,191,767,302,206,24,137,510,132,60,165,344],"bio":[370,78,975,3,116,1032],"bir":[175,688,516,508,185,362,321,135,57],"bis":[1703,85,370,1165],"biw":[925],"bja":[2357],"bje":[880],"bjo":[277,984,52,280,1070,45,289],"bke":[147,677],"bki":[2963],"bko":[1188],"bl ":[210,420,1174],"bla":[42,117,1192,232,177,283,337,341,111],"ble":[16,178,22,20,2715],"bli":[848,2079],"blk":[2514],"blo":[153,21,1314,82,206,1,103,414,22,25,77,368,623],"blu":[1280,399,358,820],"bne":[248],"bo ":[983,260],"boa":[28,2429],"bob":[77,243,72,153,403,88,189,164,1934],"boc":[725],"bod":[1513,938,192],"boe":[1936,908],"bog":[97,120,268,530,563,87,503,502,242,133,32,187,125],"boh":[672,369,1368],"boi":[834,830,74,1311,416],"boj":[224],"bok":[2850],"bol":[186,75,518,315,176,887,141,343,188,457,107],"bom":[242,1331,1376],"bon":[133,61,256,436,348,510,180,52,569,169,215,124,148],"boo":[2544],"bop":[1037],"bor":[24,22,65,182,139,94,44,36,104,137,10,168,70,150,128,41,15,93,44,180,40,174,17,233,138,239,20,36,159,35,372,205],"bos":[229,117,879,164,301,377,373,294,250,172],"bot":[1315,221,166],"bou":[486,548,593,222,110,14,126,39,31,392,216],"bov":[939,1144],"bow":[671,1726,223,71,224],"boy":[715,540,1445,32],"boz":[2294],"bra":[249,112,319,63,32,194,2,78,56,8,139,43,181,234,89,357,34,55,51,1168],"bre":[169,32,263,136,1017,91,412,468,182,580],"bri":[89,67,105,284,23,4,43,179,39,53,78,111,59,7,144,512,30,20,107,465,257,24,234,107,25,58,104,3,4,6,121,48,42,15],"bro":[79,15,75,151,225,2,99,295,135,248,83,196,120,271,83,264,42,64,45,33,326,205,63],"brt":[1217],"bru":[257,848,183,62,58,985,158,339,64,70,265,28],"bry":[8,189,211,191,227,1377,683],"brz":[392,850,1411],"bs ":[1026,161],"bsk":[692,570,814,939],"bso":[2603],"bst":[980],"bu ":[1128],"buc":[1241,787,981,42,112],"bue":[664],"buh":[1072],"bui":[1801],"buj":[108,1725,1304],"buk":[231],"bul":[56,300,283,264,1587,824],"bum":[152,3074],"buo":[1700],"bur":[63,656,443,15,154,228,151,875,30,2,23,231,24,390,5,128],"bus":[885,200],"but":[906,344,1551,302],"bux":[811,852],"buz":[2654],"by ":[40,81,793,54,281,830,520,723],"byl":[818],"byn":[2012],"byr":[758,229,1273],"bys":[580,478],"ca ":[37,25,75,172,28,40,17,157,69,35,21,10,141,56,49,334,172,44,103,216,22,43,154,10,150,47,131,221,34,25,83,296,133,282,17,13,10],"cab":[174],"cad":[543,2573],"cae":[257],"cal":[379,572,763,22,132,5,174,228,18,25,154,292,6,99,16,151],"cam":[24,13,11,302,611,939,471,27,133,626,203,53],"can":[166,32,30,521,666,343,560,592,75,410],"cap":[1474,473,1024],"car":[59,19,56,1,1,8,13,174,112,137,58,63,4,23,86,55,8,83,11,37,108,24,113,20,6,65,30,58,72,85,171,12,23,12,23,74,4,84,16,11,19,49,30,42,22,30,15,33,4,9,123,36,48,73,81,71,73,26,71,140,83,46,45,3,47,24,104,10,14,88,4],"cas":[915,337,223,51,76,260,635,31,259,89,30,273,209],"cat":[306,78,611,198,210,185,143,1310],"cau":[1428,365,1035,264],"cav":[355,2807],"caw":[2064,124],"caz":[3282],"cca":[1428,602,129,22,94,277,61,537],"cch":[1287,884,254,833],"cci":[188,1239,160,405,499,570],"cco":[1382],"cde":[2752],"cdo":[378,118,2029],"ce ":[70,38,415,245,31,163,87,56,606,51,33,32,104,155,22,18,10,257,19,2,3,155,128,112,306,60,67,44,37,84],"cea":[2387],"ceb":[186,75],"cec":[1062,266,928],"ced":[811,1164],"cee":[2723],"cek":[299,683,722,16,151,196,1141,76],"cel":[128,30,149,796,213,58,39,27,45,629,124,82,161,645,316],"cem":[902,262,294],"cen":[551,42,461,328,226,291,1090,131],"cep":[1537],"cer":[1079,36,175,243,150,657,146,722,217],"ces":[155,20,64,79,24,528,7,605,242,174,122,5,71,46,202,242,378,416],"cet":[1670],"cey":[1169,2100,8],"cez":[66,1209],"cgi":[1121],"cgr":[1156,876,1238],"cgu":[2557],"ch ":[54,13,62,30,94,9,59,6,1,31,112,9,9,8,102,33,41,26,4,34,76,12,6,105,52,23,74,18,9,26,5,161,10,102,29,41,78,2,25,32,29,68,22,45,44,34,104,17,53,164,110,130,119,3,80,264,15,22,29,59,137,64,33,3,127,14],"cha":[23,64,1,10,47,4,56,23,4,48,25,53,4,7,38,33,27,10,121,39,32,40,5,27,5,62,20,67,1,76,12,20,38,23,11,35,70,10,83,41,2,3,68,67,117,37,36,29,35,12,12,7,3,35,68,37,53,2,17,33,8,62,47,7,15,4,48,12,3,12,45,29,11,17,1,11,36,52,102,42,30,7,8,31,2,36,82,89,82,27,34,30,10,72,21,24,4,15,9,50,21,15,126,37,4,23,39],"chc":[95],"che":[28,9,64,181,6,16,15,147,125,177,9,54,35,148,156,59,11,27,178,76,50,52,9,100,14,5,51,9,66,129,23,142,56,117,37,44,199,102,10,96,92,65,51,83,21,6,8,124,52,26],"chi":[352,47,198,180,10,23,12,264,56,145,238,521,63,56,7,37,36,98,183,201,83,90,143,190,25,13,41],"chk":[503,473,408,106],"chl":[22,70,398,67,61,128,482,93,467,519,456,317,16],"chm":[193,195,410,34,9,1335,549,20,100,99],"chn":[122,2079,436],"cho":[45,3,72,53,5,42,76,99,157,97,173,124,52,88,66,141,68,289,220,135,21,142,313,6,104,39,90,107,328],"chr":[107,36,5,57,5,24,20,24,19,35,120,46,54,19,36,23,12,24,30,7,45,17,91,71,1,73,99,55,44,108,11,47,28,16,72,3,106,21,3,113,61,90,75,154,128,43,140,73,17,14,73,124,13,47,20,99,212,83,35,18,20,139,59,7],"chs":[1160,1322],"cht":[105,92,267,202,396,249,136,968,589,5,436],"chu":[304,27,62,1,87,90,169,131,39,233,443,193,15,252,409,48,721,230],"chw":[118,280,905,632],"chy":[825,60,304,303,762],"ci ":[1164,828,174,367,528],"cia":[451,153,128,6,64,91,164,243,127,93,39,51,136,17,49,87,338,279,56,146,89,153,13,148,1,264,4,13],"cib":[570],"cic":[519,774,642,236,43,40,900,106],"cid":[1178],"cie":[16,39,207,218,66,103,16,8,26,38,39,144,59,112,12,8,373,80,88,334,453,271,61,175,322,62],"cig":[1164,811],"cik":[594,749,262,270,837],"cil":[1328,552,376],"cin":[93,2,99,14,38,229,5,74,64,199,38,126,618,209,206,38,503,101,144,30,114,28,95,182,187],"cio":[136,507,132,489,73,121,79,50,681,191,32,204,427,111,55],"cip":[3354],"cir":[1027,1027],"cis":[57,219,133,624,157,156,8,48,208,900,366,52,508],"cit":[589,1064],"ciu":[188,124,505,61,33,632,346,556,30,941],"cja":[295,353,635,1693,187],"ck ":[32,52,22,24,151,39,31,105,23,285,64,149,13,114,76,36,103,63,37,96,1,61,17,51,112,144,38,261,12,27,30,178,496,56,268],"cka":[67,474,366,386,47,470,109,12,146,217,2,45,272,22,330,198,145,77],"cke":[249,45,178,126,127,36,8,242,35,146,226,560,137,12,365,66,105,56,341,194],"ckh":[574,1428],"cki":[81,39,26,74,138,64,72,96,6,257,126,2,12,175,396,122,8,54,159,9,98,370,19,541,5,106,354,15],"ckl":[1675],"ckn":[1100,188,14,1588],"cko":[65,28,618,718,304,53,349,106],"ckr":[2031],"cks":[1306],"ckt":[115],"ckw":[42,1986],"cky":[1159,869],"cla":[52,50,416,51,312,24,17,28,481,15,51,90,301,241,182,67,158,57,103,6,114,83,81,49,58,70,10,106,63,142],"cle":[654,30,496,335,388,286,215],"cli":[395],"clo":[2350,6],"cma":[113],"cmo":[420],"cmu":[1035],"cna":[524],"cny":[3299],"co ":[109,114,16,37,42,75,16,428,125,46,72,3,107,43,106,7,8,152,104,26,23,65,132,6,36,110,14,3,319,9,157,140,147,16,3,60,52,36,29,201,20],"coa":[1984],"cob":[1026,161],"coc":[1306,821],"cof":[342],"cog":[2082],"coi":[806,729,204,1314],"col":[14,72,38,354,100,629,189,547,38,271,115,41,9,279,340,187,118,118,17],"com":[1838,1180],"con":[336,35,66,364,280,112,156,188,135,55,238,67,235,243,298,222,161,60,51,53],"coo":[116,310,121,586,915,908,261],"cop":[305,572],"cor":[90,109,76,590,191,326,3,131,314,392,226,110,38,26,243,5],"cos":[166,243,255,99,924,458],"cot":[362,325,63,150,17,167,516,419,6,312,52,200],"cou":[688,692,678],"cov":[606,169,75,275,387,1579],"cow":[457,1244],"cox":[2788],"cpe":[2886],"cph":[273,205,1505],"cq ":[2189,931],"cqu":[420,156,1601,863],"cra":[440,343,91,1914,329],"cre":[785,1884,320],"cri":[10,181,485,188,593,572,198,104,873],"cro":[3379],"cru":[556,2394],"cs ":[11,1811],"csa":[217,86],"csi":[989],"csw":[2513],"cte":[1722],"cto":[336,1139,1203,136,147],"cu ":[36,1114,147,1090,508,195],"cuc":[1150,757],"cue":[309],"cug":[2733],"cul":[75,1146,1142],"cum":[2069],"cur":[1805,771,454],"cus":[512,1072,835,169],"cut":[716],"cy ":[20,1134,916,213,134,936],"cyn":[2205],"cz ":[103,43,312,160,55,584,137,75,84,164,9,90,164,20,43,81,26,227,14,49,4,99,118,88,14,67,84,73,64,112,83,121,7,9,70,8],"cza":[66,7,139,67,216,54,99,61,229,55,456,42,144,84,164,144,207,167,263,233,204,86],"cze":[60,425,94,125,263,403,65,277,36,166,217,529,109,83,8,241,28,120,143,30],"czi":[2772,366],"czk":[35,1528,1051,373],"czm":[2319,584],"czn":[475,961],"czo":[1030,449,146,349,668,704],"czu":[699,139,294,169,663,69,393,156,235],"czy":[25,38,372,58,68,53,390,48,49,110,71,1,34,40,94,10,35,100,8,277,155,16,332,85,108,31,40,92,31,38,103,64,16,43,10],"da ":[125,3,19,39,15,11,34,204,114,29,198,42,4,44,45,90,1,59,54,32,9,50,27,159,243,175,18,51,185,4,37,23,29,250,5,362,91,58,74,62,29,159,66,48,20,25],"dab":[1094],"dac":[1049,121,1317],"dad":[3402],"dae":[2200],"dag":[344,646,135,823,325,464],"dah":[521,835,250,1785],"dai":[1094,1305],"dak":[372,301,367,719,1676],"dal":[12,145,161,296,225,159,263,33,234,29,142,14,146,481,60,59,3,217,14,12,202,26,216,178,84],"dam":[44,204,171,89,53,418,73,15,106,109,61,197,126,16,3,206,41,19,667,46,328,53,207],"dan":[97,25,12,54,10,42,166,48,135,644,18,78,88,57,55,42,19,42,33,19,72,37,107,6,35,78,94,9,39,109,11,28,69,38,25,12,170,46,25,141,11,58,208,144,8,28,17,1,37,49,64],"dar":[0,236,211,512,45,69,11,37,45,10,72,35,213,172,2,168,75,113,52,287,611,79,129,13,42,127,82,21],"das":[312,51,449,212,519,77,1007,498,34,198,105],"dat":[2324,559],"dau":[3229],"dav":[241,169,47,22,61,8,116,120,58,53,29,17,241,36,11,30,187,180,11,46,15,206,207,115,76,86,69,4,117,111,149,30,3,142,155,135],"daw":[491,2272,356],"dbe":[1071,431],"dbj":[1593,764],"dbo":[2298],"dbr":[545],"dd ":[2838],"dde":[9,1305,727],"ddi":[2134],"ddl":[3278],"ddo":[828],"dds":[373,2983],"ddu":[2551],"ddv":[1471],"de ":[10,92,68,100,32,267,19,67,77,62,21,48,45,209,147,63,138,32,39,208,212,25,8,52,148,4,31,132,10,106,38,107,46,14,30,137,23,1,280,20,47,121,7,2],"dea":[14,2469,92],"deb":[523,448,281],"dec":[249,713,553,1148],"dee":[1258,1180],"def":[2882,435],"deg":[1080],"dei":[2778,401],"dej":[1007,2055],"dek":[430,587,8,89,281,239,59,60,1065,7,307,127],"del":[284,31,27,77,337,159,77,37,2,104,105,6,51,68,58,277,14,135,145,47,82,153,49,186,81,404,75,6,39,152,134],"dem":[414,96,86,43,204,321,24,912,40,2,111,75,94,197,296],"den":[9,163,69,106,111,53,45,43,89,66,53,72,133,201,1,317,62,86,31,57,251,155,28,361,58,79,158,133,36,68,20,28,96],"deo":[2051],"dep":[2943],"der":[8,18,4,38,54,15,9,47,3,30,34,81,33,168,38,5,53,173,35,14,8,14,42,237,6,133,14,46,104,34,46,83,16,12,92,59,63,136,165,119,43,40,42,23,10,27,6,113,54,105,10,2,27,85,129,21,9,104,128,46,86,21,52],"des":[133,2,266,410,26,429,80,242,193,18,176,171,241,133,43,589],"det":[398,621,34,1864],"deu":[333,57,34,429,80,1609,207],"dev":[1731,215,1326],"dey":[1047],"dez":[645,286,593,115,34,151,84,151,89,67,592,199,128],"dga":[899,1676,223],"dge":[252,293,10],"dgr":[932,2056],"dgs":[2768],"dha":[2408],"dhe":[2955,445],"dho":[24,2127,295],"dhr":[3240],"dhu":[1407,976],"di ":[159,45,256,24,365,901,106,42,156,231,382,547],"dia":[112,406,260,99,25,383,10,16,62,58,828,20,373,30,122,225,55,147,202],"dic":[115,483,1303,195],"did":[2142,1323],"die":[169,152,300,25,874,55,85,447,159,513,303,247,14,122],"dig":[1628,67],"dii":[418,927],"dij":[271,2217],"dik":[1299,1752],"dil":[532,981,323,356],"dim":[319,83,15,304,617,746,1099],"din":[202,422,288,73,12,60,121,112,176,142,40,74,407,5,44,42,82,192,46,162,309,63,32,41,20,198,106],"dio":[52,151,719,665,120,754,355,77,308],"dir":[1026,808,84,567,376,288,203],"dis":[57,228,236,335,186,491,919,75,70,529,30,201],"dit":[1719,828,242,84,32],"diu":[224,641,529,155,177,163,124,295,346,263],"diy":[1668],"dji":[627],"dju":[2519],"dke":[404],"dla":[215,1568],"dle":[504,202,360,225,301,207,32,1108,127,212,145],"dlo":[616,42],"dlu":[1059,2225],"dmi":[539,928,244,683],"dmu":[1247,1664],"dmy":[289,1056],"dna":[2643,805],"dne":[3240,61,2],"dni":[3198],"do ":[18,30,42,18,27,28,146,167,87,1,104,37,99,9,22,8,75,13,30,259,119,215,344,108,111,42,26,335,10,225,361],"doa":[804,750,1075],"dob":[2341,99,519,160],"doc":[828,1111],"dod":[373,506,287,2190],"dog":[2273],"doh":[830,2018],"dok":[1358],"dol":[263,201,26,245,417,930,232,202],"dom":[565,35,193,100,190,425,272,76,25,165,841,318],"don":[46,33,49,30,174,46,71,47,29,34,46,326,1010,122,345,117,405,425],"doo":[940],"dor":[46,18,33,190,69,319,225,30,129,26,254,96,381,235,39,211,150,102,112,93,204,102,282,54,47],"dos":[237,700,558,419,1052],"dot":[1226,22,1663],"dou":[12,369,169,60,1,627,339,1292,217],"dow":[88,957,1340,892],"dox":[1507,1076],"doy":[267,507,349,852,106,528],"doz":[3097],"dr ":[217,250,346,112,438,123,7,57,506,958,11,17,87,243,34,25,24],"dra":[85,7,575,65,21,118,7,10,18,118,365,80,454,226,190,171,28,139,406,163,16,161],"dre":[58,26,20,5,53,172,31,38,34,16,69,131,74,15,46,275,3,23,148,217,13,149,2,23,144,26,7,144,41,87,17,161,161,13,62,33,92,36,71,45,60,2,8,19,70,111,149,29,132,17,4],"dri":[70,36,170,18,111,92,182,24,53,128,24,91,139,19,49,16,27,4,20,3,33,20,61,306,165,27,29,103,49,105,23,196,91,130,121,58,17,16,27,122,60,75,100,165],"dro":[131,77,155,380,467,214,102,22,144,733,408],"dru":[13,750,268,321,430],"dry":[379,2057,8,546],"drz":[17,56,146,148,91,129,42,14,119,106,67,476,68,22,216,185,75,37,19,59,107,175,69,34,213,27,59,309,235],"ds ":[11,362,398,10,385,1222,968,124],"dsa":[2468],"dsd":[2911],"dse":[339,168,462,1210],"dsi":[1990],"dsk":[1131],"dso":[1996,693],"dss":[74],"dst":[620,228,993,986],"dsu":[1637],"dt ":[388,103,92,296,7,85,104,510,446,241,19,191,170,73,42,142,34],"dtk":[13],"du ":[2273,278],"dua":[48,60,201,2,628],"dub":[834,676,381,47,1111,50,366],"duc":[3412],"due":[3426],"duf":[820],"dug":[427,559,1707],"duk":[1195],"dul":[376],"dum":[400,897],"dun":[50,3197],"duq":[2177],"dur":[551,394,1149],"dus":[211,803,182,1173],"dut":[675],"dva":[1471],"dvi":[1753,994],"dvo":[1922],"dwa":[663,96,646,335,738,473,16],"dwe":[1516],"dwi":[466,2300],"dwo":[745,2021],"dwy":[3225],"dy ":[50,365,821,69,202,53,245,92,650,135,651],"dyb":[2517],"dym":[1445,1105,300],"dys":[956,2229],"dyt":[1088,2389],"dze":[1843,1282],"dzi":[424,198,282,40,1,48,291,212,347,245,84,293,153,415,259,132,19],"dzk":[1144,1323],"dzw":[494],"dzy":[63,2706],"ea ":[14,351,357,341,475,18,534,168,129,150,11,81,77,20,9,316,149,7,171],"eac":[1802],"ead":[674,447,1146],"eag":[1696,879],"eak":[2483],"eal":[1934,51],"ean":[102,88,266,67,86,249,93,32,27,137,239,67,210,76,17,181,244,17,138,64,107,69,123,53,2,248,70,69,37,24,1,93,85,45],"ear":[1819,84,276,279,1024],"eas":[58,26,78,275,305,495,217,162,387,426,75,155,77,449,44],"eat":[54,371,275,68,181,109,752,899,168,399,143],"eau":[452,944,732,586],"eba":[14,200,182,127,63,399,6,434,297,352,66,134,21,78,28,9,1,29,16,67,18,283,90,358,77,97],"ebb":[1089],"ebe":[253,398,136,227,37,117,190,272,400,79,395,3,106,126,330],"ebi":[759,310,116],"ebk":[147],"ebl":[210,6],"ebo":[186,75,171,982,743],"ebr":[464,507,281,365],"ebs":[980,1096,939],"ec ":[937,592,601,3,704],"eca":[377,17,1833],"ecc":[1287,743,395,188],"ece":[70,272,620,100],"ech":[253,66,40,81,24,16,9,68,92,24,26,38,134,117,74,41,57,404,59,29,68,111,155,60,122,77,62,6,43,206,3,381,58,161,103,177],"eci":[802,177,349,277,330,321,203,829],"eck":[249,32,13,200,102,173,210,2,30,89,68,134,117,145,13,117,116,106,3,83,401,89,171,56,225,111],"ecl":[1515],"ecn":[3299],"eco":[1125,859],"ecs":[1822],"ecu":[75,1509,779],"ecz":[63,412,986,453,50,420,280],"ed ":[105,5,106,56,558,19,129,324,7,44,94,505,47,146,17,78,102,259,443,186,146,79],"eda":[147,89,1884,813,323],"edd":[1314,820,417,727],"ede":[30,428,84,43,226,26,460,49,77,101,451,66,470,64,132,175],"edg":[899,1899],"edh":[3400],"edi":[115,1513,592,685],"edj":[2519],"edl":[1592,239,1592],"edm":[1247],"edn":[3240,208],"edo":[563,241,127,289,6,132,196],"edr":[106,188,203,206,435,68,43,175,102,335,336,247,382,7,142,235,151],"edt":[13,570,1689,210,170],"edu":[48,60,201,2,885],"edv":[1753],"edw":[663,82,14,1719,288,185,16],"edy":[1088,1429,165,795],"edz":[494,410],"ee ":[539,196,523,489,1206,497],"eec":[440,49],"eed":[30],"eef":[1124],"eek":[2223],"eel":[384,134,1788,1023,101],"eem":[887,632,220],"een":[101,1766,223,96,38,15,274,163],"eep":[2438],"eer":[101,1451,1042,45,372],"ees":[1033,548,1142],"eet":[1405,1,1092],"ef ":[398,61,35,189,40,144,101,51,162,529,264,68,390,290,288,14,239,114,3],"efa":[60,94,161,133,367,225,10,35,145,76,290,61,175,272,275,6,318,8,19,229,147,127,69],"efe":[548,288,2046],"eff":[288,215,1063,566,764,92,321],"efo":[773],"efr":[3317],"efs":[1124,805,870],"eft":[715,1070],"eg ":[184,513,744,837],"ega":[135,745,77,475,216,414,266,110,83,581,29,111,108,11,42],"egb":[660],"ege":[22,342,78,304,450,120,617,249,237,275,141],"egf":[978,469],"egg":[533,661,2154,46,5],"egi":[271,646,367,559,492],"egl":[1080,1814,150,390],"egn":[819,1299],"ego":[292,309,32,81,68,310,1,256,311,13,29,10,2,23,78,326,69,32,62,102,171,25,4,589,143],"egr":[2142,788,313],"egs":[809],"egu":[1780,1293],"eh ":[1796,1262],"eha":[569,740,508],"ehd":[2054],"ehe":[1109],"ehl":[1070,410,328,79,413],"ehm":[5,847,274,978],"eho":[53,349,757,2311],"ehr":[321,162],"eht":[512,2048],"ei ":[183,220,2776],"eia":[1818,709],"eic":[2069,1291],"eid":[122,59,383,348,119,296,423,1316,11,70,121,97],"eie":[129,1302,541,683],"eif":[725,159,58,1440,550],"eih":[2023],"eij":[251,519,542,538,1324],"eik":[923,345,127,600,36,152,622,452],"eil":[286,342,99,517,389,206,272,541,24,258,85,3,375],"eim":[461,1273,1221,201,56],"ein":[69,49,1,10,101,297,334,15,102,2,239,27,17,8,95,53,49,53,187,67,173,277,107,248,187,175,423,104],"eio":[49,2403],"eip":[1019,79,923],"eir":[487,612,40,304,485,12,2,259,212,81,299,369],"eis":[1022,417,249,74,4,1012],"eit":[490,1848,389,346,23],"eix":[1940,853],"ej ":[17,38,18,146,43,105,49,42,88,11,30,42,14,119,26,80,67,72,84,20,300,56,2,32,216,43,142,60,15,56,59,33,74,175,65,4,34,213,20,7,54,5,286,23,297],"eja":[1177,371,682,101],"ejc":[594,2441],"ejd":[1017],"eje":[622,154,415,2129],"ejk":[1730,1588],"ejn":[1449],"ejo":[584,942,704],"ejs":[1822],"ek ":[36,17,15,7,10,32,54,71,2,35,88,25,36,57,43,51,69,4,26,26,35,13,88,117,3,22,14,7,14,8,14,19,6,10,40,118,57,181,196,27,11,9,7,33,6,1,111,35,4,4,11,41,14,87,25,131,31,7,22,36,28,16,46,23,45,10,75,31,15,18,31,29,132,6,78,1,13,151,4,13,48,7,69,51,25,130,22,4,4,12,14],"eka":[299,131,2486,213],"eke":[386,116,960,889,916],"eki":[1448,47,580],"ekk":[923,214,497],"ekl":[2804,77],"eko":[28,137,259,559,412,1430,545],"ekr":[882,2551],"eks":[146,272,453,63,335,217,64,24,248,234,93,123,43,327,363,37,4,200,126],"ekt":[0],"el ":[22,1,4,1,23,5,31,1,19,21,10,13,7,27,13,7,56,19,4,12,9,10,27,7,13,8,36,13,32,16,48,3,20,46,5,2,7,4,1,1,33,14,1,48,38,2,6,2,7,27,35,14,23,12,49,29,12,8,20,15,19,13,25,79,1,10,2,10,64,4,9,5,10,1,33,1,4,20,6,29,60,18,2,8,58,102,17,8,12,1,70,14,23,14,7,85,48,9,19,12,5,18,1,27,6,6,30,34,1,53,9,6,104,27,7,5,36,3,11,58,14,4,2,18,32,33,3,18,5,4,4,37,6,18,47,5,66,54,86,1,33,56,37,89,12,7,2,6,25,9,1,1,52,85,1,17,4,20,2,5,11,19,4,16,24,2,32,10,61,1],"ela":[188,76,41,17,140,58,127,62,68,2,47,81,6,116,9,115,121,6,182,48,3,12,107,36,8,8,62,88,136,260,21,37,33,315,2,23,49,35,83,203,95,53,1,35,40,11,12,31,42,51,35,5],"elb":[121,849,990],"elc":[648,51,155,106,337,215,9,191,48,1632],"eld":[341,583,669,169,656,157,189,118,144],"ele":[36,49,41,131,91,16,20,45,6,19,90,65,25,34,100,272,35,157,1,12,1,38,26,84,29,51,10,89,268,108,67,86,21,40,5,8,24,38,43,55,150,253,110,51,44,52,7,24,63,60,65,106,28,21,33,27,16],"elg":[74,185,497,1167,215,536],"elh":[1075,966],"eli":[45,4,56,49,121,32,9,31,25,24,24,85,47,24,1,130,181,48,84,34,49,4,1,109,25,74,97,259,54,3,60,54,43,228,66,85,17,129,14,70,59,20,64,19,85,9,76,46,49,118,76,18,174,22,13,31,34,34,33],"elj":[1761],"elk":[501,393,8,130,144,961,134,32,107,171,825],"ell":[37,5,47,59,40,13,6,57,37,142,28,12,38,232,17,26,15,115,13,8,45,71,20,34,50,66,34,20,42,34,11,91,48,3,21,5,12,15,33,12,10,52,7,49,47,70,3,20,5,69,1,32,15,22,12,151,8,100,49,18,102,136,96,10,6,110,33,16,26,52,17,40,74,24,12,2,45,21,25,3,32,6,48,17,4,10,14],"elm":[1165,39,656,103,38,109,629,661],"eln":[1625],"elo":[223,193,646,410,103,295,245,261,304,13],"elp":[195,1226,904],"elr":[1365],"els":[601,747,280,473,148,263,43,117,208,425,25,38,36],"elt":[761,2519,9],"elu":[992,1027,257,991],"elv":[436,1316],"ely":[1372,68,22,23,1099,200,216,220],"elz":[857,473,2062],"em ":[175,509,32,8,32,408,294,684,111,601,141],"ema":[414,96,34,52,38,55,22,68,571,223,166,95,36,176,183,193,274,22,113,361,129,106],"emb":[633,158,373,24,1727,404],"emc":[764],"emd":[2441],"eme":[250,930,444,134,69,17,104,230,150,76],"emi":[21,92,526,204,59,89,658,360,91,360,159,470,36,20,287],"emk":[1519,461,160],"emm":[1572,52,5,365,142,440,60,23,137,273,167,100],"emo":[352,102,1609],"emp":[691,1236,1126,348],"emr":[1430],"ems":[731,292,237,879],"emu":[887,2502],"emy":[233,938,581,623,281,346,79,341],"en ":[6,3,38,12,62,18,5,65,32,41,20,8,21,8,9,79,2,9,6,1,8,2,24,13,11,4,4,14,8,1,8,18,12,9,28,17,31,41,80,29,7,6,10,61,32,5,1,3,10,5,5,17,1,1,14,21,2,6,27,9,5,1,12,16,53,2,27,13,5,17,30,65,67,6,43,1,5,10,22,2,16,53,9,22,10,4,2,25,13,8,7,9,25,22,2,11,35,36,31,19,2,17,11,26,1,10,33,2,14,1,2,3,6,6,5,5,3,44,1,34,1,51,1,8,17,19,6,33,34,17,8,13,3,5,6,36,3,7,22,2,22,39,17,8,6,28,32,4,1,3,2,2,30,1,1,35,13,5,5,28,7,2,20,9,9,14,4,8,45,3,5,46,20,25,14,15,39,12,12,2,1,17,1,11,23,13,2,24,7,5,1,48,7,6,6,10,3,10,18,7,32,22,10,35,2,11,18,37,4,6,43,6,8,53,49],"ena":[16,85,234,108,98,52,10,11,3,75,293,13,47,91,96,13,37,12,16,153,117,55,78,108,43,3,29,120,147,4,19,108,41,5,339,302,82,27,33,28,58,58],"enb":[257,260,82,429,149,36,140,357,83,72,358,362,3,625,147],"enc":[309,132,78,818,119,371,585,174,532],"end":[50,14,137,25,189,466,424,202,53,221,367,116,129,448,68,188],"ene":[3,67,45,228,2,38,201,415,131,129,265,578,46,91,89,26,2,30,18,3,64,42,49,24,95,7,106,111,197,1,12,31,68,88,71],"enf":[341,1841,512],"eng":[99,61,410,486,19,1110,263,333],"eni":[422,134,132,66,258,27,1,43,131,113,204,36,37,15,99,138,3,57,33,80,172,185,295,65,10,207,275,48,84],"enj":[834,266,316,371,1577],"enk":[172,246,40,337,379,80,175,38,294,257,1096,9,35,209,5,11],"enl":[1120],"enm":[39,981],"enn":[38,66,66,335,114,93,29,66,72,127,21,296,22,105,15,301,1,534,26,246,27,21,59,2,27,187,125,79,191,26],"eno":[83,102,158,57,189,75,141,92,25,23,19,91,451,1288,73,165,83],"enp":[2716],"enr":[109,157,8,119,232,194,170,372,16,220,298,20,135,423,210,310,116],"ens":[118,12,217,98,153,154,817,5,193,42,5,30,34,52,28,226,51,434,137,90,162,70,6,82],"ent":[141,28,299,54,29,88,150,265,26,100,99,103,59,167,115,89,175,73,133,23,100,88,183,1,49,8,88,143,94,33,106,11,201,77],"eny":[2018],"enz":[29,43,1644,183,417,183,151,49,117,152,21],"eo ":[1197,278,1192,712],"eod":[2962],"eof":[1281],"eog":[1785],"eoi":[1959],"eom":[179],"eon":[166,38,66,206,208,1214,153,300,362,584,60,46],"eor":[226,163,28,675,374,862,20,153,184,318],"eot":[1618],"ep ":[2438,950],"epa":[60,1375,1020,985],"epc":[1537],"epe":[61,3297],"eph":[87,4,336,98,421,416,66,206,4,153,23,388,5,46,419,170,56],"epi":[405,141,605,124,848,960],"epn":[167,70,730,1917],"epp":[789,12,486,75,17,120,145,2,59,390,180,517,224,185],"epu":[2943],"er ":[18,8,4,1,8,4,26,8,21,1,2,3,3,2,6,1,2,1,3,2,5,8,9,7,9,2,6,7,3,2,5,3,3,3,6,5,7,33,1,1,1,2,8,22,5,1,16,3,25,6,2,1,3,1,9,12,2,6,10,2,17,68,6,37,1,2,10,4,2,7,7,1,14,6,27,30,13,3,9,52,1,3,19,5,11,1,2,17,8,11,7,25,7,1,4,44,8,6,5,19,4,2,15,1,14,10,26,28,5,11,1,5,18,24,2,28,2,4,3,11,7,2,11,15,5,1,6,27,9,10,3,3,9,9,2,2,3,6,18,9,11,2,1,11,3,6,9,8,11,12,2,1,2,4,3,3,8,4,15,37,1,8,3,5,6,1,9,1,9,7,3,2,8,5,6,11,13,3,1,12,1,3,13,7,16,8,18,6,2,5,5,6,9,30,3,12,7,7,32,1,12,26,2,13,7,2,5,5,4,18,2,13,21,5,23,4,8,18,1,24,10,2,12,33,2,5,9,23,3,16,3,2,2,8,13,18,1,8,1,34,2,7,5,11,6,3,15,9,10,4,10,12,19,3,5,16,2,17,13,1,3,7,34,5,9,24,7,2,5,10,19,1,8,23,9,10,11,25,19,15,6,6,13,1,10,17,10,7,6,2,8,8,29,6,10,1,6,4,5,2,2,8,3,12,11,2,10,5,1,16,37,3,8,14,2,7,9,10,4,8,30,6,7,1,11,2,13,10,4,1,8,4,2,8,4,10,7,8,10,3,3,2,2,12,3,1,8,7,6,8,14,19,3,9,3,13,40,25,3,39,69,12,12,5,21,2,3,14,15,31,4,10,14,4],"era":[136,53,119,65,180,19,78,161,35,45,130,22,14,77,14,8,65,125,187,115,41,16,130,60,16,173,22,158,21,17,38,87,40,264,227,91],"erb":[580,213,367,304,224,502,41,440,103,55,306,64],"erc":[20,192,502,97,353,351,243,217,214,45,751,202],"erd":[0,10,614,548,89,409,1023,86,327],"ere":[31,37,33,43,41,87,77,94,59,181,19,29,1,42,217,65,43,69,96,23,8,28,28,50,40,165,24,279,37,100,172,4,64,162,59,14,72,283,159,38,32,127,20,55,66,26,2,27,19],"erf":[924],"erg":[47,49,145,16,88,71,58,43,181,90,85,54,15,4,7,17,58,43,112,24,6,83,158,48,37,54,110,22,68,103,109,32,33,55,121,258,289,33,99,25,71,95,13,16,7,30,30,1,122,25],"erh":[1303,241,41,348,613,303],"eri":[141,74,25,50,11,67,80,94,34,6,3,12,141,66,161,10,59,2,5,152,121,22,16,75,158,55,13,134,158,53,36,15,187,67,144,72,42,360,410,99,42,1],"erj":[431,538],"erk":[182,1473,81,749,723],"erl":[110,575,22,29,740,76,16,167,315,206,278,522,276],"erm":[11,118,205,526,377,149,70,64,250,14,57,125,94,43,67,60,152,67,167,120,16,44,141,95,129],"ern":[51,25,83,18,206,176,5,64,17,116,19,41,11,3,96,30,51,41,26,123,75,17,151,48,33,113,34,151,84,98,47,6,126,30,54,217,16,77,1,69,158,53,118,28,28,100,115,127,9,30,7],"ero":[62,112,58,201,102,110,70,190,27,86,117,56,163,263,260,32,140,31,126,89,76,259,14,173,194,21,125,218,36,14],"err":[18,9,56,107,163,315,52,8,152,210,25,105,3,96,67,11,126,104,44,26,32,95,71,18,66,45,65,196,332,158,152,26,87,10,166,59,29],"ers":[226,49,19,25,123,100,164,55,75,12,146,47,259,109,3,56,272,38,1,27,177,30,276,46,102,26,197,41,90,74,159,115,134,40],"ert":[18,43,16,83,78,88,9,86,134,39,19,47,116,26,12,78,27,67,33,24,55,7,47,8,34,14,23,57,74,76,12,44,30,95,80,35,4,9,28,15,10,90,175,49,33,10,30,3,8,6,17,72,20,11,8,44,74,36,32,38,14,69,16,16,6,15,19,96,21,12,8,134,20,29,29,126,13,135,24,35,14],"eru":[1344,1014],"erv":[38,1645,186,447],"erw":[695,675,602,1065],"ery":[8,505,61,1601,278,21,114,705],"erz":[81,288,447,235,18,32,82,17,157,4,17,312,71,15,61,9,17,58,79,88,183,89,528,4,5,72,51,79],"es ":[16,74,123,129,34,57,11,58,4,49,34,79,143,73,31,46,46,16,4,63,2,6,161,87,8,36,198,87,31,24,51,18,27,118,31,73,59,4,62,1,3,120,58,113,52,43,33,4,5,12,16,7,83,7,73,15,41,114,63,59,2,55,63,85,107,40],"esa":[155,20,577,22,96,93,139,299,508,84,103,122,303,593,78,188],"esb":[69,1887],"esc":[54,24,57,104,79,519,40,99,345,161,242,87,87,122,5,202,117,43,577,25,101],"ese":[126,328,1416,271,81,44,90,166,147,360],"esh":[1581],"esi":[219,17,460,549,296,1789],"esk":[339,1643,162,349,429,507],"esl":[967,781,248,223,367,183,70,13,8,241,39],"esm":[401,1745,789],"esn":[1359,818,577],"eso":[1033,538,883],"esp":[581,204,179,77,39,276,474,128,135,28],"esq":[1264],"ess":[109,22,2,268,173,81,25,63,420,47,24,32,42,20,240,255,130,42,248,162,20,41,211,165,12,81,26,82,57],"est":[187,45,119,32,105,202,67,148,47,109,111,301,85,27,359,122,55,25,92,14,115,168,9,35,124,12,118,135,177,157,12],"esu":[223,1919,631,378,172],"esy":[2286],"esz":[75,204,49,64,37,249,39,12,87,141,58,80,356,131,160,541,80,14,213,42,15,21,234,1,567],"et ":[401,41,212,29,183,34,151,268,4,11,32,7,32,1,52,74,197,60,195,238,306,155,38,111,38,57,2,2,151,212,7,37,7,34],"eta":[33,107,16,387,82,2,230,60,202,153,58,165,100,108,65,62,247,25,260,791,67,123,49,36],"etc":[2293],"ete":[115,52,3,36,81,363,2,370,80,18,121,20,87,82,85,46,7,16,423,39,32,106,82,24,33,126,577,41,24,41,3],"eth":[69,436,71,557,473,350,81],"eti":[397,523,583,167,124,1339],"etk":[1768,437],"etl":[398,621],"etm":[3329],"eto":[48,959,89,244,1122],"etr":[44,268,9,189,203,520,117,236,78,29,4,511,256,51,421,235,105,152,18,31],"ets":[2317,181],"ett":[71,1,20,177,499,41,116,64,64,76,267,57,79,65,39,88,110,26,13,112,60,16,34,64,12,11,54,55,53,18,129,208,71,130,17,72,5,27,181,67,4,118,76],"etx":[3207],"ety":[2097],"etz":[1186,585,1034],"eu ":[1374,3],"eub":[630,609,1739],"eue":[2221],"eug":[1567,37],"eui":[973],"eul":[2228],"eum":[3238],"eur":[353,1515,807],"eus":[3,330,57,34,113,316,80,256,423,742,136,52,207],"eut":[1186,1538],"euw":[2449],"euz":[1534],"ev ":[627,385,429,684],"eva":[387,7,21,31,3,2,437,2,765,80,85,76,142,65,173,118,180,52,228,72,272],"evc":[3123],"eve":[51,70,39,156,310,64,344,197,178,121,225,184,7,572,65,146,55,198,18,56,26,288],"evg":[2963,323,84],"evh":[1813],"evi":[636,71,9,42,785,50,138,135,249,77,283,345,154,143,207],"evo":[2768,302,12,66,124],"evr":[3293],"evs":[1460,57],"evy":[767,122,556,1389],"ew ":[9,26,299,179,48,124,270,27,31,53,23,552,509,87,143,55,7,128,21,190,62,8,89,107,89,103,9],"ewa":[88,15,936,6,137,533,50,111,167,21,12,127,175,7,78,49,725,216],"ewc":[435,1446],"ewe":[1242,37,1003,1026,22],"ewi":[146,312,8,152,55,476,97,11,137,159,164,9,254,34,29,81,153,163,103,92,26,102,124,27,73,172,208,7,9,70],"ewk":[1662],"ews":[117,15,341,149,1,122,10,4,17,116,75,92,211,14,200,228,86,188,145,45,23,333,153,100,67,1,24,11,6,10,35,12,268,30,43,28,20,52,52],"ewt":[1281],"exa":[26,170,64,503,119,761,49,576,104,42,848],"exe":[827],"exi":[1943,218],"exp":[2459,1020],"exy":[2165],"ey ":[110,57,259,78,436,107,8,11,103,23,32,92,20,92,12,67,76,95,78,7,36,197,102,22,99,20,274,70,63,83,36,99,312,64,29,8,24,122,59],"eye":[1773,175,316],"eyf":[586],"eyl":[1677,933],"eym":[1068,334],"eyn":[2327,203],"eys":[3430],"ez ":[10,118,16,42,1,11,63,15,73,60,111,64,21,16,24,57,26,4,6,153,40,68,117,104,9,24,11,9,3,33,20,8,87,33,67,17,72,4,3,9,9,1,34,56,22,73,55,9,20,98,23,30,15,6,27,41,32,35,177,35,45,12,102,1,37,71,98,14,3,118,78,67,32,22,3,4,80,18,20,30,18,2,5,27,9,30,2,11,31,9,37],"eza":[66,1209,742,197,203,1028],"eze":[183],"ezg":[246,770],"ezi":[268,332,160,482,109],"ezj":[2586],"ezn":[211],"ezq":[2285],"ezu":[2496],"ezy":[1598],"fa ":[1165,1246],"fab":[156,182,100,10,372,503,100,3,116,224,353,455,11,621,144,60,57],"fae":[2121,277,652,200],"fai":[1937,254],"fal":[283,61,1183,52,115,153,622,323],"fan":[60,94,161,133,367,225,10,35,145,76,196,94,61,175,272,275,6,179,139,8,19,166,63,147,127,69],"far":[89,300,197,155,2,861,245,203,198,760],"fas":[2572],"fat":[1745],"fau":[52,434],"fav":[2163],"fay":[2869],"faz":[110],"fco":[1339],"fe ":[1380],"fed":[1423,774,322],"feh":[1109,699],"fei":[490,235,217,1390,764],"fel":[341,595,826,792,328,461],"fen":[503,597,466,735,687,321],"fer":[18,348,182,16,161,16,73,21,1,106,19,262,97,319,34,151,69,2,13,71,27,169,40,94,7,301,92,98,243,323],"fet":[1129],"feu":[973],"fey":[2264],"ff ":[161,455,570,95,982,654,15],"ffa":[486,255,761,1394,114],"ffe":[503,439,438,186,1422,321],"ffi":[1764,368,84,797],"ffl":[288],"ffn":[2120],"ffr":[563],"fga":[29,259,446,348,15,224,198,441,7,889,222,2,136],"fi ":[1728,404],"fia":[65,2854,167,202],"fie":[804,120,668,317,307,202],"fig":[2737],"fik":[1007],"fil":[1807,1201],"fin":[553,902,193,116,88,938,100,577],"fio":[798,783,59,405,644],"fis":[2381,763],"fit":[765,2248,232],"fiu":[1647],"fla":[31,702,764,393,1191,245],"fle":[54,234,2436],"fli":[476,2958],"flo":[465,64,83,725,17,83,19,215,125,191,297,103,25,463,408],"fne":[2120,822],"fo ":[263,2253],"fok":[1754],"fon":[19,1308,94,181],"fop":[1231],"for":[50,562,166,78,261,81,62,457,282,140,14,955],"fos":[773],"fot":[921],"fou":[820],"fox":[754,400],"fr ":[884],"fra":[239,37,11,31,91,82,76,74,165,54,17,131,20,5,47,8,102,156,8,79,49,9,20,24,35,40,49,29,16,20,15,159,122,5,11,99,61,148,25,141,31,335,44,8,36,58,31,51,43,222,67],"fre":[105,1,64,46,78,48,221,22,483,138,14,29,78,460,74,284,197,304,180,38,180,166,20,87],"fri":[348,149,206,133,48,94,160,110,54,51,63,31,531,650,156,191,347,3,75],"fro":[2873],"fru":[310],"fry":[8,13],"fs ":[895,229,1452],"fss":[1626,235,68,870],"fst":[861],"ft ":[2368,589],"fte":[715],"fth":[1785],"fue":[1735,458,1214],"fuh":[2182,512],"fuk":[1150],"ful":[2726],"fun":[751,320],"fur":[2602],"fut":[292],"fvu":[251],"ga ":[41,94,124,318,192,197,17,68,43,338,491,321,31,234,359,173,40,308,53,15],"gaa":[863,17,2110],"gab":[261,265,184,254,111,1568,484],"gac":[2370],"gad":[2465,740],"gae":[33,1239,830,260],"gaf":[2120],"gah":[1565],"gai":[582,126,2365],"gaj":[2078],"gal":[4,183,655,22,93,165,12,214,473,412,13,1,2,320,33],"gam":[1018,687,578],"gan":[29,121,1,137,139,255,52,54,294,15,224,127,53,18,129,312,7,95,20,135,639,100,122,2,22,29,73,12,26,161,55],"gap":[2438],"gar":[184,138,2,127,153,128,6,69,66,26,14,144,76,22,141,224,90,365,269,272,59,116,101,6,9,24,43,11,27,140,70,239,29,1],"gas":[218,1094,41,21,635,84,235,15,178,7,356],"gat":[222,764,386,112,852,479,535],"gau":[535],"gav":[30,1784,817],"gaw":[1209,556],"gay":[2702,197],"gaz":[888],"gbe":[660,2166],"gbl":[1570],"gda":[12,85,115,402,384,296,234,137,48,146,481,339,585],"gde":[1164],"gdo":[525],"gdu":[2273],"ge ":[163,63,118,73,116,12,119,34,507,463,480,200,189,87],"geb":[214,218],"ged":[1196],"gei":[1139,789],"gej":[416,761,948],"gel":[22,5,237,58,20,22,6,150,1,147,32,46,80,62,187,147,58,152,93,92,59,85,202,217,50,344,62,2,107,90,33,347,79],"gem":[1350,274,1207],"gen":[47,83,9,204,2,597,126,382,15,102,37,261,68,25,79,52,93,225,287,43,57,169,250,73,84],"geo":[226,163,28,675,189,678,369,20,153,184],"ger":[99,5,15,133,23,32,37,29,69,75,108,287,16,78,22,29,72,19,24,22,109,151,2,72,16,84,20,40,7,40,53,41,94,37,6,39,19,39,5,2,14,19,52,70,77,117,156,274,41,35,30,77,2,15,98,201,12,5,86],"ges":[555,537,2100],"get":[1373,672,1022],"geu":[1868],"gey":[1316],"gfr":[978,469],"gg ":[2289,309,801],"gga":[324,103],"ggb":[1570],"gge":[533,661,156,1998],"ggi":[34,1617,451,398,170,138],"ggo":[3394],"ggs":[1388,233],"gh ":[241,255,140,25,552,192,388,720],"gha":[756,120,1331],"ghb":[40,874],"ghe":[1245,221,781,194,128,404,30,209],"ghi":[1466,1655],"ghl":[688,1662],"gho":[2138],"ght":[112,1685,276,1188],"ghu":[1941],"gi ":[72,2,394,430,469,109,170,54,444,27],"gia":[37,640,192,132,82,360,133,416,95,583,275,282],"gib":[1381],"gic":[2811],"gid":[271,562,2610],"gie":[212,328,69,1,307,39,328,94,465,423,88,158,43,184,69,175],"gij":[2223],"gil":[963,378,874,519,10],"gim":[159,430,93,2532],"gin":[333,788,146,665,284,119,16,51,73,25,429],"gio":[34,251,104,161,592,409,25,42,33,52,149,233,17,115,111,173,292,4,153,166,36,30,15,30,225],"gir":[312,508],"gis":[936,1403],"git":[794,69,23,941,103,24,480,456,57,119],"giu":[82,719,486,92,120,145,2,26,33,390,180,517,55,354],"giz":[100,42,297,3029],"gkv":[1896],"gl ":[3434],"gla":[68,191,352,660,1510],"gle":[420,2,611,1101,193,115,452,150],"gli":[269,811,237,365,178,97,507],"glo":[911,874],"glu":[84,419,612,343],"gly":[2812],"gma":[990,135,327,348,148,1405],"gmu":[1326,339,1792],"gn ":[1990],"gna":[217,1047,157,480,630,120,471],"gne":[376,130,313,215,169,1085,442,299],"gni":[35,293,101,132,124,44,226,27,31,82,356,131,160,376,32,87,143,55,123,33,56,21,235,144,89,112],"gno":[563,97,986],"gnu":[1558,311],"gny":[2733],"go ":[28,143,519,563,10,292,105,273,211,49,500,232,140,51,187,40,51],"goc":[1719],"god":[246,770,878,1045,94],"goe":[1186,346,655],"gof":[563],"gog":[1034],"goi":[782,2425],"gol":[371,199,189,334,486,1089,224,119,73,181],"gom":[1329,1143,12,933],"gon":[311,540,82,376,40,289,436,395,118,108,171,62,108],"goo":[2649],"gor":[53,14,68,73,84,209,26,74,32,81,77,302,52,401,132,16,8,10,25,78,18,26,196,86,69,32,44,18,102,171,25,4,29,156,93,54,257,143,49,69],"gos":[239,2092,286,57,406,204],"got":[19,1334,140],"gou":[636,456],"gov":[1673,41],"gow":[68],"goz":[470],"gqv":[1790],"gra":[163,212,63,106,66,61,21,55,156,253,95,11,220,75,67,117,256,25,10,94,365,463,34,282,140,28],"gre":[69,115,530,64,4,150,46,115,168,105,28,138,170,868,360,2,89,48,174,95],"grg":[2811],"gri":[41,105,22,48,52,48,30,66,87,74,78,669,444,80,38,260,91,190,53,12,118,497,243],"grn":[1201],"gro":[190,860,1370,84,278,169,125,229,146,20],"gru":[137,587,516,1378,354],"gry":[1842,1215],"grz":[292,245,64,32,382,17,438,242,25,78,1,325,69,32,62,87,15,171,25,4,589],"gs ":[399,474,652,96,424,1027],"gso":[2768],"gst":[809,579,874,339,51],"gt ":[160],"gto":[576,1558,528,497],"gts":[2185],"gu ":[1696],"gud":[13,57,1459,828,554],"gue":[276,73,21,81,37,116,64,70,67,194,57,217,3,156,105,214,137,118,252,120,14,56,36,309,17,292,9,264,42],"gug":[1860],"gui":[15,93,705,377,330,125,299,314,253,46,167,349,320],"gul":[853,116,479,332,378],"gum":[1015,563],"gun":[256,119,139,267,820,203,61,408,709,244],"gur":[74,1224,107,880],"gus":[485,606,298,128,109,235,307,738,6,33,61,39,32,85,8,145],"gut":[728,492,509,763,187],"guy":[1163,2189],"guz":[959,1133,1126],"gwe":[83],"gy ":[847,349],"gyi":[1872],"gyo":[1196,676,1266],"gyr":[3384],"gyu":[662],"ha ":[149,83,959,464,653,100,97,270,205,411],"haa":[895,383],"hab":[1804,932,653],"hac":[2510,867],"had":[627,682,1099],"hae":[23,64,1,117,75,25,57,105,131,39,347,331,294,324,3,19,33,70,54,15,124,301,76,120,365,138],"haf":[741,120,459,989,701],"hag":[324,1064,182,247],"hai":[273,205,308,1388,247,539],"haj":[103],"hak":[1212,717,9,253,1140],"hal":[145,213,11,38,114,140,8,10,67,46,30,74,101,7,61,11,31,32,26,7,107,38,193,76,135,12,113,37,134,88,26,58,167,226,239,16,109,41,33,73,44,18,10,241,8],"ham":[440,134,36,150,70,19,27,294,139,320,111,1,37,174,108,10,170,327,30,841],"han":[87,4,61,76,12,124,40,82,84,29,102,13,42,16,129,41,4,27,138,187,26,38,60,92,4,63,41,9,3,24,48,49,36,29,204,151,31,1,31,44,38,92,9,12,65,111,12,59,103,89,26,25,218,74,75,147],"hap":[3441],"har":[86,12,66,66,169,78,40,14,162,16,99,20,17,31,64,32,70,33,60,139,29,85,9,124,23,101,29,35,34,20,210,23,183,15,29,57,11,90,34,3,58,29,84,41,11,21,180,1,6,9,61,23,44,37,69,64,24,165,19,13,41,62],"has":[501,636,267,73,1189,81,544],"hat":[569,165,838,1584],"hau":[463,992,825,135,166,532,263],"hav":[1698,848],"haw":[43,414,1362],"hay":[1224],"haz":[515,666,1068,149,234,604],"hby":[40,874],"hch":[1486],"hci":[95],"hde":[347,1048,1430],"hdi":[2054],"he ":[194,258,431,287,29,108,299,26,221,1150,323,138],"hea":[674,864,396],"heb":[1014],"hec":[1302,925,777],"hed":[1314,727,534,358],"hee":[101,283,1168],"hef":[288],"heg":[1196],"hei":[129,783,11,108,188,25,19,5,127,339,16,100,145,36,152,469,303,192,65,45,108],"hej":[594],"hel":[22,6,9,37,121,64,89,243,116,61,2,7,54,35,60,220,86,8,27,7,36,211,211,14,95,36,46,78,15,85,1,8,301,14,314,141,44,226,250,8],"hem":[756,1685,895],"hen":[104,122,40,8,8,145,78,20,294,170,17,339,16,67,93,76,216,1,101,135,157,46,140,80,115,84,170,54,213,14,35,202],"heo":[1466,1496,41],"her":[27,56,104,53,64,15,15,234,8,52,13,4,62,13,211,21,157,51,23,10,103,40,57,52,178,48,26,87,18,9,30,142,76,30,101,32,25,24,96,14,46,142,102,55,5,5,60,33,4,15,158,34,94,10,55,76,29],"hes":[1245,326,424,978,127],"het":[2171,173,488,157],"heu":[2221],"hev":[3123],"hew":[9,457,47],"hey":[1677,650],"hez":[1229,522,255,23,595,658,52],"hff":[2263],"hge":[2037],"hho":[830],"hi ":[777,33,79,113,140,904,823,389,54],"hia":[209,1561,573,364,67,149],"hib":[3037],"hic":[1009,409,1836],"hid":[822,1988],"hie":[991,296,414,259,285,462,68,74,51,143,110],"hig":[1621,879],"hii":[2546],"hil":[116,14,172,15,138,9,59,131,297,20,291,156,118,629,7,37,48,75,40,342,134,159,87,48,168],"him":[787,1322],"hin":[129,270,123,478,525,863,131,208,17,39,450,208],"hio":[352,3005],"hir":[580,1101,845,645],"his":[1086,613],"hit":[597,90,1022,145,1267,150,8,32],"hiu":[1466],"hje":[1513],"hjo":[2345],"hka":[1384,1166],"hke":[503,473,514,397],"hki":[2390],"hl ":[521,800,35,531,82,38,919,154],"hla":[92,596,1100,20,1600],"hlb":[1757,1578],"hle":[22,596,128,324,393,17,126,397,221,83,26,430,2,626],"hlf":[490,2606],"hli":[290,267,251,757,785],"hlo":[1228,1072,141],"hls":[583],"hm ":[1280],"hma":[5,587,240,20,274,978,109,1009,149],"hme":[683],"hmi":[193,195,410,43,1335,549,20,100,99],"hmo":[2334],"hn ":[455,77,251,252,6,69,275,218,58,251,56,94,11,17,80,151,220,26,32,21,76,176,294,10,49,20],"hna":[1550],"hne":[122,40,910,1129],"hni":[1009,1628],"hnm":[666],"hns":[990,695,6,297,1265],"ho ":[48],"hoc":[220,939,134,1827],"hod":[555,597,498,376,742],"hoe":[761,1012,97,96],"hof":[161,1732,829,220],"hog":[805,310],"hoh":[3222],"hoj":[120,2471],"hol":[24,115,171,85,79,25,112,269,245,4,179,462,381,74,256,125,135,21,65,538],"hom":[43,142,22,225,33,130,16,247,95,466,23,52,4,156,26,52,37,48,95,53,106,123,229,27,151,104,36,260,24,18,160,235],"hon":[45,68,364,21,448,64,792,73,130,625,220,435,77],"hop":[2219],"hor":[61,75,56,97,129,220,59,292,115,105,39,112,778,185,123,5,180,35,18,36,528],"hos":[552,534,150,53,1904,161],"hou":[53,769,8,755,1494,76,315],"hov":[173,229,270,1330,277,206],"how":[178,77,41,353,349,363,807,319,876],"hr ":[321,162,1699,512,518],"hra":[107,98,49,317,2539,57,79],"hre":[1194,2154],"hri":[143,5,62,24,44,19,35,120,46,109,23,12,24,30,52,17,91,71,1,73,99,41,14,44,108,11,47,28,16,72,109,24,81,32,61,90,67,8,144,10,128,43,6,134,73,17,14,197,13,47,20,355,86,26,198,7],"hro":[703,640,141,127,984,303,13,317,177],"hru":[3413],"hrw":[234],"hry":[552,2119,522],"hs ":[2023],"hse":[1160],"hst":[2482],"ht ":[112,352,202,1407,931,257],"hta":[197],"hte":[105,84,873,249,136,350,1212],"hth":[2415],"hti":[1333,2112],"hto":[512,2048,642],"hua":[1375],"hub":[248,78,476,1365,20,573,98],"huc":[571,1844],"hue":[394,1234,313],"huf":[251],"hug":[1933,479,101,460],"huh":[331],"huk":[481,1105,208,262,399,591],"hul":[161,749,990,603,234,487],"hum":[304,89,279,1530,178,1074],"hun":[786,1111,27,120],"hup":[740],"hur":[668,37,68,370,56,208,639,337],"hus":[209,2200,427],"hut":[399,472,313,1543,700],"huu":[1779],"huy":[1413],"hvi":[597],"hwa":[118,280,905],"hwo":[1169,766],"hy ":[591,519,718,353,73,298],"hya":[194,1659],"hyk":[1574,1244],"hyl":[825,364],"hym":[1492,293],"hyn":[885,460],"hyr":[94],"hyt":[2489],"ia ":[65,70,59,9,7,8,30,88,10,35,1,69,67,64,2,20,33,90,1,4,6,52,87,11,5,9,2,7,137,9,148,62,9,24,8,5,3,12,23,22,54,4,18,33,7,14,15,2,21,55,8,6,34,29,14,2,9,8,8,21,11,38,25,3,6,11,1,26,26,6,20,12,34,3,47,76,16,10,45,29,26,21,29,2,1,20,28,12,47,11,95,30,14,79,1,74,33,15,17,23,2,44,3,16,50,46,44,24,42,9,35,13,36,2,6,15,6,39,8,7,22,59,2,14,14,16,12,6,8,12,16,4,42,1,26,14],"iaa":[408],"iab":[3483],"iad":[945,1582],"iag":[690,886,526,91,923],"iah":[430,2174],"iai":[6,1638,1279,165,255],"iak":[8,52,5,154,18,440,125,1,212,76,94,13,161,61,474,146,11,84,102,24,51,223,30,79,10,208,22,18,234,111,175],"ial":[145,469,252,194,768,1011,321,243],"iam":[338,278,1099,188,107,254,28,265,750,169],"ian":[14,6,17,3,49,23,6,10,15,15,23,53,39,5,19,7,28,64,1,22,7,39,43,60,18,59,31,34,28,10,12,5,13,18,14,59,25,14,20,67,6,78,4,21,8,30,153,2,14,7,41,31,19,16,18,133,31,44,20,25,31,62,5,2,1,50,31,21,18,15,51,6,3,30,7,10,48,20,12,19,36,60,40,3,1,6,15,74,10,18,9,30,43,8,31,50,13,29,38,10,2,1,17,18,32,3,44,20,11,14,29,22,39,31,15,13,62,13,36,21,16,10,2,31,32,31,4,4,17,19,41,42,7,22,59,29,4,5],"iar":[108,1451,204,580,88,763,1],"ias":[49,160,117,746,342,112,15,229,116,24,109,484,24,165,15,67,597,48],"iat":[81,33,432,523,480],"iau":[271,2200,290],"iaz":[1285,88,381,221,284],"ib ":[3389],"iba":[1381,563,283,4,355,451,426],"ibe":[811,1131,1131],"ibi":[1703,1721],"ibo":[570,277],"ibr":[1476],"ibu":[885],"ic ":[301,115,103,66,424,186,11,566,14,73,58,70,227,25,257,315,110,170,63,106,189],"ica":[62,75,200,214,69,66,141,56,49,334,319,216,22,43,251,63,215,243,379,99,260,56,40],"icc":[188,1971,12,104,216,767],"ice":[523,28,217,31,905,58,33,291,10,12,18,16,670,366,67,81,84],"ich":[23,5,59,1,10,31,16,4,56,75,25,16,6,31,4,33,12,60,4,6,13,7,101,34,5,32,34,43,22,9,31,20,3,35,30,76,12,20,7,54,11,62,102,34,19,18,3,1,2,130,74,4,66,18,14,9,13,64,12,11,1,10,3,41,90,6,52,1,19,14,19,8,62,47,7,15,4,48,12,60,3,298,30,7,39,120,89,63,9,15,51,45,72,4,17,24,13,101,109,38,16,66],"ici":[312,608,538,85,269,425,238,243],"icj":[295,353,2328],"ick":[67,14,34,31,205,7,64,57,95,16,8,255,54,86,187,36,103,21,78,11,87,129,41,215,30,47,36,14,49,123,39,30,27,151,111,55,22,308,6,16,34,255,13,157],"icl":[3273],"ico":[109,15,99,170,185,272,233,773,87,82,227,741,201,265],"ics":[11,978],"ict":[336,1139,1203,136,147],"icu":[2069],"icz":[103,43,312,121,39,55,31,553,137,55,20,84,164,9,254,20,43,81,253,63,103,118,88,14,67,84,73,259,121,7,9,70,8],"id ":[168,13,60,105,64,47,83,8,116,134,24,1,18,54,29,17,241,36,11,30,61,9,117,180,1,56,15,151,55,322,162,35,34,4,5,10,12,90,167,18,75,7,23,3,142,106,207],"ida":[157,83,123,9,192,29,198,42,4,2,87,114,208,577,116,486,278,175,223,224,30],"idd":[2041,797],"ide":[122,71,77,104,494,124,39,296,426,389,134,795,6,191],"idg":[545],"idh":[3240],"idi":[271,14,564,7,56,130,136,195,377,139,396,167,695,2,7,209,68,32],"idl":[504,562,2000],"idn":[3301,2],"ido":[12,34,335,432,1162,106,1005],"idr":[884,147,1779,300],"ids":[848,789,1052],"idt":[388,2337,42],"idu":[1195,2217],"idz":[3443],"ie ":[16,60,48,45,46,100,2,36,2,46,110,98,1,36,19,31,51,20,45,101,35,17,26,45,18,31,2,21,261,109,42,8,47,126,153,32,232,71,15,61,85,1,42,73,87,8,112,36,2,97,19,19,52,31,4,106,215,23,1,184],"ieb":[147,63,6,435,329,11,639,911,198],"iec":[63,7,405,5,14,155,24,26,38,134,66,42,9,115,358,68,35,41,47,158,106,48,22,144,3,251,453,109,219,103,20],"ied":[13,481,3,206,275,160,164,51,94,145,1115,268,401,24],"ief":[548],"ieg":[364,296,37,260,21,306,32,131,213,183,339,96,141,275,141,209,390],"iej":[55,207,284,11,65,154,315,20,358,970,271,61,547],"iek":[424,510,105,1765,629],"iel":[188,10,63,40,95,39,19,135,20,38,1,276,32,4,4,111,8,65,28,57,18,33,25,20,145,10,26,92,30,52,28,14,34,83,9,8,31,9,60,59,157,94,11,28,45,22,2,32,6,2,94,43,68,38,13,20,141,14,51,44,168,180,13,4,1,20,38,6,18],"iem":[454,179,158,380,401,408,29,986,324],"ien":[70,240,33,40,35,20,134,248,165,54,91,193,229,62,152,150,14,210,76,29,50,34,57,85,52,88,7,58,5,113,34,77,198,4,2,97,35,31,47,43,5],"iep":[61,344,2678,275],"ier":[26,13,59,31,24,37,22,96,61,79,92,19,13,130,26,76,16,336,64,57,10,7,25,20,15,7,17,8,45,33,12,7,127,8,55,29,27,5,61,42,9,63,63,116,30,116,12,159,24,19,15,47,44,68,22,11,53,67,4,97,51,1,25,5,25,69,135,13,185,1,2,27,50],"ies":[69,259,23,78,300,366,226,130,117,14,93,67,128,86,155,30,125,256,125,21,171,64,58,82,97,190],"iet":[170,99,52,121,68,347,60,3,69,107,234,4,161,713,58,96,102,671,18,148,28,16,47,85],"iev":[627,782,32,1533,108,116],"iew":[35,111,312,103,62,50,12,70,4,196,12,15,31,46,198,296,164,9,254,63,81,26,87,143,55,5,92,11,48,44,26,253,73,60,89,112,1,91,27,7,9,70],"iez":[246,22,353,395,582,509,1236],"if ":[2382],"ifa":[2411],"ife":[725,16,1968],"iff":[942,822,1168],"ifr":[884],"ift":[2957],"ig ":[58,272,110,293,50,91,267,849,281,30,13,162,161,151,433],"iga":[41,832,221,881,258,11,797,401],"igd":[1164],"ige":[27,77,15,188,699,622,67,460,582],"igg":[1621,879],"igh":[112,1961,1188],"igi":[72,396,326,39,53,481,109,170,54,127,127,217,895],"igl":[269],"ign":[35,526,124,270,27,31,251,157,225,504,87,143,55,156,60,396,75,14,112],"igo":[1253,606,427,45,1012],"igr":[168,178,2130],"igs":[2652],"igu":[74,202,73,21,81,153,134,261,274,3,156,319,137,118,252,134,92,8,301,17,301,264,42],"iha":[661,111,2188,63],"ihe":[756],"ihi":[889],"ihk":[2390],"ihl":[3408],"ihn":[1009],"iho":[2279],"ihs":[2023],"ii ":[319,99,927,229,972,255,245,309],"iia":[203,1948,1047],"iie":[418],"iih":[2390],"iik":[168,2920],"iin":[943,389,1727,35],"iio":[3156],"iir":[1044,759],"iis":[1993],"iit":[245,330,323,1631],"ija":[126,644,387,33,122,570,45,676,333,206],"ijd":[3420],"ije":[1738,446],"ijg":[863],"ijk":[2488,235],"ijl":[2232],"ijn":[1347,503,1140],"ijo":[251,2923],"ijp":[1749],"ijs":[1487,1154],"ijt":[2223],"iju":[271,1296],"ik ":[105,1,168,3,13,4,74,174,17,6,29,147,52,13,13,84,138,208,94,9,81,2,78,80,12,77,179,14,1,5,34,119,162,277,239,35,79,40,21,123,118,82,38,16,151,15],"ika":[466,316,68,329,135,529,207,265,55,131,13,52,87,164,211,60,323,5,9],"ike":[41,134,197,16,448,171,233,524,231,36,774,103,48,301],"ikh":[786],"iki":[2183,269],"ikj":[168],"ikk":[656,42,225,20,452,1333],"ikl":[1195,1520],"iko":[225,58,80,360,13,61,471,31,36,57,113,41,172,407,40,256,335,213,82,156,125],"iks":[581,303,1061,358,71,957],"ikt":[7,16,1995,499],"iku":[2681],"il ":[273,13,148,44,144,27,23,291,299,79,172,21,38,6,55,157,46,80,19,2,174,104,131,290,61,56,181,527],"ila":[300,85,150,18,154,308,92,54,226,13,156,86,69,163,15,55,131,266,11,42,60,530,165,248,78],"ilc":[485,264,383,174,1511],"ild":[302,37,632,565,454,366,137,558,43,48],"ile":[49,653,22,403,98,19,563,73,572,75,149,343],"ilf":[612],"ilg":[130,1073,1628],"ilh":[2001],"ili":[12,52,52,2,220,185,74,27,30,73,110,114,44,200,133,90,82,151,514,91,1,75,40,155,125,62,134,159,1,40,97,115,172],"ilj":[492,830,1921],"ilk":[612,674,726,512,39,423],"ill":[15,9,16,277,121,17,9,68,46,38,131,26,141,1,58,80,65,69,37,203,11,15,67,6,36,94,180,3,34,98,39,20,142,20,17,83,13,1,86,164,147,21,10,112,30,25,5,1,115,121,167,50,33,20,63],"ilm":[268,939,447,967],"ilo":[132,197,75,113,7,262,1078,1085,58,10,40,361],"ils":[149,60,41,251,197,59,1455,532],"ilu":[628,580],"ilv":[584,542,703,27,510,230,105,122,359,80,53],"ily":[21,92,2976],"ilz":[2342],"im ":[200,119,168,29,192,79,250,380,692,60,186,178,288,44,90,36,221,5],"ima":[412,49,221,339,387,384,352,71,710,154,328],"imb":[159,2801],"imc":[73],"ime":[573,11,5,130,280,147,567,125,173,398,45,132,120,508,88,71],"imi":[402,15,304,274,118,225,313,186,247,4,1068,27],"imm":[751,41,633,123,834,552,144],"imo":[361,295,183,304,10,59,156,104,71,126,65,177,46,91,36,464,76,60,177,116,17,277],"imr":[2966],"ims":[316],"in ":[30,48,2,6,7,34,14,12,27,28,13,25,44,1,15,27,3,127,9,3,32,15,31,1,8,11,10,35,7,11,2,13,16,28,1,10,2,8,42,5,54,17,12,2,7,125,1,4,12,38,103,25,20,16,15,22,10,25,95,23,21,6,52,35,20,12,1,55,8,71,52,18,4,9,11,23,21,6,9,17,5,10,14,76,18,3,6,29,7,3,3,38,5,37,5,16,8,30,39,1,70,21,2,4,6,6,18,30,37,64,15,50,3,15,21,1,15,9,30,21,6,20,63,46,20,14,29,1,48,9,34,7,16,28,34,13,5,13,11,6,13,28,13,9,37,68,27,8,17,5,4,41,1,18,9,3,9,24,9,72,2,5],"ina":[10,14,8,27,41,64,12,15,60,14,33,18,53,92,7,14,14,81,16,7,7,16,19,34,17,50,92,29,61,18,54,4,55,15,8,24,31,21,12,8,15,16,36,90,8,8,4,13,24,50,18,9,44,38,67,45,12,163,152,21,9,25,4,15,11,49,27,72,30,25,7,9,13,26,3,2,18,33,26,36,7,16,23,36,23,16,50,13,49,57,6,124,95,11,85,24,7,4,107,3,20,9,50,25,22,5,28,45,33,4],"inb":[1419],"inc":[493,131,430,236,92,226,291,32,235,320,634,140,143],"ind":[24,291,545,642,577,72,4,177,56,71,9,155,166],"ine":[6,63,7,31,11,16,14,27,7,4,16,59,46,60,53,72,6,29,33,16,16,40,34,30,128,60,7,32,52,3,11,11,34,23,13,28,2,16,18,3,3,39,14,26,27,7,26,11,46,1,59,17,49,127,59,82,1,44,17,30,45,12,14,34,21,36,18,78,15,28,6,17,28,4,33,34,3,19,20,15,88,28,89,17,16,40,71,6,38,7,2,15,64,3,136,1,4,56,53,4,34,1,13,39,40,21,50,75,116,38],"inf":[1302],"ing":[182,140,22,55,33,144,1,108,42,81,104,209,13,129,17,40,85,120,3,9,28,130,40,65,29,168,48,23,66,128,161,19,46,113,61,169,59,6,5,54,56,54,7,31,3,41,12,152,54,106],"inh":[152,78,269,346,31,645,704,381,336,423],"ini":[12,50,8,49,12,132,302,69,39,120,37,212,136,89,100,76,249,118,42,22,7,66,212,57,1,29,97,544,2,13,27,410,4,35],"ink":[124,731,871,1648],"inm":[1221],"inn":[431,302,128,594,896,8,199,193,211,377],"ino":[97,26,18,98,326,214,117,68,117,157,334,36,41,181,291,82,232,144,18,154,19,20,33,60,244],"inr":[129],"ins":[64,31,43,38,199,30,61,4,10,20,57,9,67,151,41,4,70,36,37,12,89,4,62,12,96,28,42,261,11,119,66,158,59,123,2,103,41,77,24,12,44,48,13,22,63,78,15,71,26,14,37,175,54,131,59,39,79,95,7],"int":[129,65,201,825,1105,77,73,309,19,572],"inu":[2611,450],"inz":[970,249,44],"io ":[52,84,20,36,12,65,73,28,7,56,3,12,6,43,11,36,136,34,71,48,75,14,204,16,36,45,41,73,4,82,3,83,33,9,25,11,31,13,9,11,2,3,3,44,78,109,52,78,129,67,1,33,209,72,43,121,92,6,17,6,3,28,16,87,20,7,12,20,66,36,5,6,12,18,30,15,101,14,61,94],"ioa":[958,2054,144,198],"iob":[1934,675],"ioc":[775,2458],"iog":[1458],"iol":[360,283,232,1109],"iom":[2461],"ion":[34,169,149,69,377,428,70,241,8,36,6,62,58,24,148,166,57,27,139,421,193,11,209,23,72,4,138,142],"ior":[904,170,68,409,67,22,445,37,95,1010,61],"ios":[2,47,340,332,135,65,378,408,78,299,1,243,105,19,43,6,91,589],"iot":[95,53,79,58,72,23,55,115,16,5,16,104,13,215,560,11,2,77,105,100,84,337,93,115,88,311,53,512,42],"iou":[80,3101,12,164,24],"iov":[7,1845,945,655],"iow":[1619],"ip ":[116,1302,839,591],"ipa":[2281,478],"ipe":[1019,79,923],"ipi":[2133,1265],"ipo":[1613],"ipp":[523,131,297,1381,40,148,194,293,1],"ipr":[3354],"iqu":[588,37,752,307,166,45,154,634],"ir ":[214,28,1,244,71,42,39,97,213,164,26,109,12,78,235,204,26,43,82,172,101,198,220,292,238,272],"ira":[90,73,936,68,773,473,81,189,99,11,152,486],"irb":[1128,1471,452],"irc":[2387],"ird":[312],"ire":[3,577,25,177,1007,45,5,224,291,50,107,46,131,30,3,260,41,65,59,11,109],"irg":[863,404,288,661,218,456,39,18],"iri":[175,22,120,94,233,82,94,24,145,14,24,37,55,8,35,130,151,272,339,18,192,69,405,17,7,343,202],"irj":[492,1580,772],"irk":[1026,892,4,484,79,376,491],"irl":[1997],"irn":[974],"iro":[175,46,448,25,324,11,33,202,61,54,268,74,221,98,51,25,416,39,591,153,27,17,27,48],"irp":[189],"irs":[339,63,107,1216,1216,230],"irt":[1556,331,1283,128],"iru":[1044,1482],"irv":[681,950,50],"iry":[2979,211,251],"is ":[1,1,55,93,118,7,10,57,7,1,22,3,30,116,8,21,2,23,29,84,96,22,28,9,13,23,41,1,13,24,75,9,39,5,30,6,23,4,65,13,37,71,23,34,52,16,57,18,55,49,53,15,7,25,4,8,1,2,32,19,69,21,48,10,6,5,29,56,20,53,36,3,33,64,19,24,10,122,19,34,22,19,12,58,19,20,8,31,2,24,2,31,20,2,6,36,109,6,136,4,73,30,2,25,83,57,34,108],"isa":[45,113,189,83,75,79,121,402,77,25,8,350,136,26,250,80,280,117,28,18,26,513,93,72],"isb":[3322],"isc":[276,133,392,135,254,156,8,256,178,111,482,129,366,52,216],"isd":[1699],"ise":[164,239,153,14,184,13,341,15,408,173,408,89,64,210,84,247,149,206,77],"isf":[1762],"isg":[1688],"ish":[457,140,889,367],"isi":[476,1434,787],"isk":[229,386,2489,295],"isl":[57,37,141,338,202,218,3,20,339,141,37,72,302,269,134,81,1033],"ism":[1018,2448],"iso":[281,1049,629,459,425,308,190],"isp":[2625],"iss":[46,340,626,206,47,40,97,37,327,78,461,473,332],"ist":[10,14,103,16,5,43,19,24,44,19,1,34,83,37,46,3,6,100,23,12,19,5,4,6,5,15,52,17,91,8,63,1,73,70,29,55,41,3,108,11,47,28,8,8,35,13,24,133,1,41,71,61,2,88,18,6,127,18,50,10,79,27,22,43,53,87,73,27,4,52,37,76,32,13,47,20,167,33,205,81,76,103,7],"isz":[710,312,541,235,401,433,256,404,144],"it ":[185,60,78,77,90,85,230,58,35,3,818,305,410,95,338,14,9,57,117,32,116,16,118],"ita":[530,67,416,48,745,247,183,8,63,18,417,59,104,69],"itc":[1267],"ite":[343,31,375,960,320,765,485],"ith":[334,881,440,190,452,41,389,62,142,460],"iti":[679,242,414,168,154,418,363,178,257,200,238],"itl":[481],"itn":[2673],"ito":[102,487,90,118,488,738,436,38,189,435,358],"itr":[417,122,182,454,122,170,617,1099,199],"its":[12,1188,1437,29,64,207,334,24],"itt":[687,93,14,92,232,23,512,15,159,27,76,24,13,93,487,233,233,12,41,145],"itw":[1917],"itz":[765,71,580,489,723,233,87,45,80,172,210],"iu ":[78,4,829,555,198,8,217],"iub":[817],"iuc":[1427],"iuh":[3354],"iuk":[878,357,412,166,704],"iul":[827,387,83,174,1376,58],"iun":[2233,212],"iur":[1889,199,84],"ius":[4,220,88,127,362,64,73,21,46,68,59,44,111,92,15,40,57,8,1,43,6,95,2,59,21,148,117,22,14,68,114,66,33,4,53,110,63,116,88,4,46,123,2,138,129,17,117,98,32,21],"iut":[188,1144],"iva":[330,152,347,91,303,119,56,62,731,1090],"ive":[534,210,166,136,1246,121,76,5],"ivi":[153,154,370,600,824,852],"ivk":[731],"ivo":[348,433,1373],"ivr":[2895],"ivz":[771],"iwi":[566,507,918,386],"iwk":[800],"iwo":[499,445,373,901,747,343],"iwr":[1668],"iwu":[925,993,1082],"ix ":[54,882,1618,789],"ixa":[2117],"ixe":[1940,853],"iy ":[1615],"iya":[1668,770],"iyo":[1002],"iz ":[350,749,122,55,68,600,516,42,416,12,194,3,3,271,18],"iza":[100,609,28,62,108,2436],"izd":[2755],"ize":[1562],"izi":[156,48,1452,395,55,1361],"izo":[2794],"izt":[519,398],"izy":[142,297,620,2409],"izz":[1458,333,10,119,277],"ja ":[126,153,16,136,30,132,20,35,92,30,82,248,183,29,69,298,92,21,75,17,43,78,225,16,71,14,272,175,144,14,1,39,28,1,137,21,10,235],"jaa":[96,2687],"jab":[1776,1,737],"jac":[328,92,156,450,161,305,102,126,13,138,306,64,799,168,76],"jag":[275,816,131,672,460,158,521],"jai":[164,1674,35],"jak":[142,386,78,87,295,77,63,73,111,374,224,77,616,389],"jal":[108,1324,450,868,266,1,94,26],"jam":[834,556,26,371,186,200,124,171,132,5,239,195,325],"jan":[1,5,124,25,17,4,82,128,55,32,63,13,25,49,47,72,81,27,15,51,1,17,18,112,14,31,13,23,32,54,91,38,39,21,24,73,31,5,10,62,65,108,11,39,7,20,134,77,66,195,39,40,23,202,46,1,27,18,6,1,6,39,84,29,23,40,120,78,96,16,45,14],"jar":[168,46,10,161,108,42,73,237,14,331,67,12,243,345,142,37,321,79,18,130,132,43,384],"jas":[500,79,498,248,1257,138,295],"jat":[1952],"jau":[1157,230,1536,150],"jav":[492,847,15,256,63,837,366,52,458],"jaw":[678,1137,985],"jci":[480,114,55,24,26,38,366,461,88,334,726,234,322],"jcz":[3035],"jda":[1017,1061],"jde":[3420],"je ":[969],"jea":[102,88,266,67,86,249,93,32,164,239,67,286,198,463,107,69,123,55,248,139,61,1,73,105,45],"jeb":[2411],"jed":[2162],"jeg":[3243,151],"jel":[429,563,125,396,266,796,82],"jem":[2659],"jen":[38,407,267,29,11,1015,417,48,341,136,187,125,37,42,28,163],"jer":[81,735,64,111,78,32,34,56,9,157,21,360,38,87,58,79,360,528,4,5,72,51,79],"jes":[223,178,575,65,315,229,238,135,977,216,172],"jet":[543],"jev":[1012,1113],"jew":[117,356,149,123,31,1909,219,416],"jez":[211],"jga":[863],"jia":[3048],"jie":[627],"jih":[772],"jil":[1971,334],"jim":[516,68,415,1587,716,71],"jir":[197,447,82,118,159,61,55,8,35,130,630],"jit":[901],"jiv":[731],"jk ":[2488,235],"jka":[2004,1314],"jko":[103,40,1587,616],"jls":[2232],"jmu":[3033],"jn ":[1347],"jna":[120,2323],"jne":[2091],"jng":[2990],"jni":[1449],"jno":[1833,758],"jns":[1850],"jo ":[195,297,92,942,241,84,379,944,78],"joa":[360,52,83,176,116,127,80,204,185,34,47,264,381,30,33,258,365,382,143,65],"job":[1488],"joc":[282,1158,45,226],"jod":[646],"joe":[483,778,332,654,100,49,208,42,483],"jog":[898],"joh":[364,122,46,251,190,62,75,275,218,28,27,3,24,6,15,49,157,56,20,74,11,97,68,83,100,146,32,21,76,227,243,10,49,20,8],"jok":[1347],"jol":[231,594,13,701,259,547,278,25],"jon":[251,191,2,144,113,405,97,121,182,52,180,1121,32,221,178,184],"joo":[1842],"jor":[47,92,20,4,114,358,678,277,368,190,13,463,39,45,289,156,61],"jos":[48,10,50,27,215,517,64,37,31,9,82,9,82,46,148,151,112,76,112,54,49,151,13,109,230,113,150,104,171,40,114,132,7,114,3,8],"jou":[1970,688],"joz":[459,35,229,251,736,264,68,680],"jp ":[1749],"js ":[1487,335,819],"jsa":[3259],"jte":[2223],"jtm":[2428],"jto":[2830],"ju ":[411],"jua":[690,225,16,165,177,68,5,35,712,127,511,182,462,15,11,78],"jud":[1236,483,1070,580],"jue":[942,1095],"juh":[2621,816],"juk":[300,572,265,263,467,205],"jul":[310,335,82,167,720,272,44,279,551,347,147,47,18],"jun":[322,775,693,768,100,695,63],"juo":[1998],"jur":[119,543,406,290,92,37,602,586,26,739],"jus":[114,157,175,477,612,32,448,230,274,123],"jut":[345,2004],"juw":[2066],"jwe":[2586],"ka ":[4,31,29,3,47,58,4,42,11,2,64,5,25,3,28,4,63,6,37,71,4,29,45,2,6,33,3,8,4,1,3,17,17,20,96,25,22,13,9,13,16,7,37,31,4,28,2,13,3,1,11,35,42,14,20,8,2,14,75,23,17,4,3,13,10,8,35,17,29,22,8,25,56,6,36,80,6,74,19,4,33,12,23,10,79,39,13,8,22,11,20,15,26,1,36,26,64,2,13,76,21,26,8,15,6,6,48,39,2,18,7,9,13,2,10,2,40,69,7,5,1,5,15,70,47,6,4,9,13,29,31,7,10,9,1,8,7,17,2,27,14,2,47,35,25,16,10,49,12,30,3,11,18,51,20,10,2,10,2,10,5,16,22,7,7,12,14,35,8],"kaa":[560,1368],"kac":[838,64,128,1289,160,163,244,17],"kad":[224,998,172,155,177,287,295,346,263,518],"kae":[782,1149,1066],"kah":[808],"kai":[403,781],"kaj":[253],"kak":[3220],"kal":[39,243,106,177,219,622,206,131,460,232,131,254,309,48,239],"kam":[138,122,362,27,145,376,364,103,279,19,406,5,132,275,432,276],"kan":[299,131,619,263,248,369,53,27,531,412,33,27,319],"kap":[202,1209,711,768,457],"kar":[100,208,75,2,59,139,24,111,123,20,17,92,231,3,85,66,29,208,175,100,11,41,166,13,48,7,192,16,12,21,107,49,63,27,76,21,5,44,42,45,43,49,10,39,40,42,149,54],"kas":[111,160,163,66,79,36,14,189,210,10,119,2,277,41,189,347,145,6,31,34,234,38,111,149,61,92,25],"kat":[127,37,13,146,370,24,33,388,13,24,147,14,16,39,154,53,81,175,12,18,61,116,163,227,12,36,7,74,45,46,114,77,292,65],"kau":[300,572,1424,769],"kaw":[1383],"kay":[987],"kaz":[343,1494,251,141,5,953],"kbo":[1936],"ke ":[13,28,106,150,75,14,2,16,68,31,132,63,53,44,41,45,95,70,83,47,64,21,25,61,99,44,29,8,237,55,159,17,17,19,96,144,139,82,49,40,12,22,190,86,8,9,48,288,13,149],"kea":[1985,213,260,1024],"ked":[904,2336],"kee":[1581],"keh":[1887],"kei":[2338,389,429,18],"kel":[207,57,198,691,309,51,60,542,443,80,60,224,36,40,178,79,12,84,86],"kem":[175,516,1236,869],"ken":[522,76,209,611,32,171,730,142,189,422,150],"kep":[1151,124],"ker":[38,72,14,125,45,60,88,60,13,191,19,17,19,8,55,24,163,191,14,307,111,236,35,6,2,147,425,22,156,56,9,209,87,10,26],"kes":[1007,1811,277],"kev":[446,190,80,42,785,323,249,77,925,207],"kew":[3239],"key":[1192,144],"kgu":[1448],"kh ":[1298,515],"kha":[574,212,379,421,387],"khe":[2411],"khi":[2869],"khl":[2441],"kho":[2002,483,365],"khy":[94],"ki ":[17,64,7,7,22,3,12,6,4,1,35,42,4,3,6,26,37,17,45,1,21,34,8,2,15,31,3,7,14,6,36,21,1,7,1,21,3,6,5,21,11,16,9,19,1,53,5,3,6,10,4,17,21,3,2,49,2,2,37,4,13,10,14,2,15,9,20,2,12,12,35,19,8,2,4,4,1,33,33,8,16,20,59,13,15,9,41,6,24,6,3,6,1,24,4,12,37,25,6,13,2,7,48,14,1,14,1,20,13,7,55,12,8,18,36,23,3,2,1,3,35,17,5,34,31,5,9,16,17,37,5,22,1,41,20,31,8,2,15,37,8,7,16,32,81,34,6,9,4,8,2,9,1,18,3,10,4,15,32,11,9,45,6,17,22,14,16,7,42,4,25,6,26,11,12,13,16,2,5,33,43,1,35,4,23,24,5,2,3,2,16,2,46,18,22,13,72,13,31,11,23,31,16,27,48,44,25,15,12,7,1,4],"kia":[1809],"kib":[3424],"kic":[67],"kid":[2452,386],"kie":[61,85,197,40,75,90,24,75,509,101,238,58,159,14,254,63,81,347,72,118,297,3,26,8,363,9,7,9,9,61],"kii":[319],"kil":[118,221,285,698,668,503],"kim":[487,305,245,380,727],"kin":[182,109,382,187,63,61,252,353,103,108,366,53,43,24,18,86,173,188,212,201,188],"kir":[339,72,81,17,480,736,874,342,164,65],"kis":[1,371,773,73,226,16,1176,8,154,385],"kit":[102,2779],"kiv":[2895],"kiw":[1918,1082],"kiy":[1002,613],"kja":[168],"kje":[992,125,1458],"kjo":[1539],"kk ":[943],"kka":[300,356,216,51,214,263,1124,42,386],"kke":[354,344,563,373,859,444],"kki":[923,472,297,1036],"kko":[96,289,1120,1278],"kku":[413,147,1185,181,72],"kla":[31,577,368,415,51,46,56,213,543,15,7,327,155,201,194,185],"kle":[1100,266,478,70,34,819,702],"kli":[73,1360,53,146,43,38,41,700,350],"klo":[1217,1498,166],"klu":[1195,76,734],"kly":[567],"kma":[1313,1962],"kmi":[1605],"kna":[242,840],"kne":[1100,188,14,311,1229,48],"kno":[653,1231],"knu":[542,1231,185,515],"ko ":[65,28,3,129,64,96,33,245,60,8,443,94,169,30,251,12,176,112,122,108,180,81,125,24,125,268,17,55,158,91,57],"kob":[528,109,56,367,1543],"koc":[57,2157,442,552],"koe":[809,671,1727],"kog":[151,1301],"koh":[1463,870],"koi":[2539],"koj":[3017],"kok":[1505,187,1046],"kol":[363,302,207,463,57,113,433,187,185,853,111],"kom":[367,616,1451],"kon":[28,150,202,44,26,25,20,326,57,59,87,18,18,178,66,165,95,8,135,607,107,46,130,30,182,74,416,162],"koo":[2529],"kop":[221,196,218,86,766,434,659,233],"kor":[283,380,134,598,224,33,405,174,43,318,95,138,517],"kos":[955,119,79,102,44,100,106,232,17,85,577,35,23,170,66,47,229,244,25],"kot":[2015],"kou":[2,675,1756,131,806,14,47],"kov":[1,56,86,12,10,7,352,187,543,88,87,15,130,194,18,27,22,152,69,16,65,28,10,76,505,80,135,183,295],"kow":[103,11,117,82,12,31,3,1,198,117,54,7,64,2,53,95,55,10,173,271,68,19,3,50,134,32,106,90,74,5,95,106,20,51,34,29,2,29,14,94,21,3,76,181,153,21,319,44],"koz":[590,285,947,853,202,318,265],"kra":[329,538,83,117,201,142,351,102,563,47,62,150,219,529],"kre":[752,271,231,265,416,88,46,109],"kri":[24,103,171,209,163,27,13,361,373,171,598,83,315,21,729],"kro":[230,901,118,782,48,117,1068],"kru":[199,683,318,378,196],"kry":[1112,158,248,83,363,71,827],"krz":[99,128,201,434,282,41,870,69,84,33,88,23,68,24,163,53,14,17,49,275,203,19,10,140,28,28,13],"ks ":[389,223,322,335,57,32,871,74,1132],"ksa":[146,725,615,64,100,406,93,856,37,204,126],"kse":[581,474,600,167,123],"ksi":[418,1156,24,194,523,731],"kso":[1306],"kss":[884,2447],"kst":[2272],"ksy":[2642],"ksz":[2374],"kta":[0],"kte":[115],"kti":[1481],"kto":[7,16,1995,499],"ku ":[413,147,1366,72],"kub":[142,464,44,54,99,185,77,63,80,478,208,16,474,608],"kuc":[95,1438,141,1245,506],"kud":[3062],"kuh":[2003,869],"kuj":[328,1487,985],"kuk":[1383,8,42],"kul":[447,170,14,86,89,551,1000,3,321],"kun":[1044,86,753,1172,137,28],"kuo":[1212],"kup":[2130,199],"kur":[1609,136,558,607,234,196],"kus":[180,216,472,423,259,622,37,1160,81],"kut":[730],"kuz":[1420],"kva":[434,1383],"kve":[2462],"kvi":[501,1395,622],"kwe":[42,1986],"kwi":[114,209,690,536],"kx ":[640],"ky ":[1025,134,47,56,148,102,516,320,1127],"kyd":[2462],"kyh":[792],"kyi":[2850],"kyl":[2317],"kyn":[2298],"kyr":[123,1631,890,432],"kys":[1600],"la ":[12,12,13,38,8,105,73,3,36,22,47,16,28,3,46,7,51,15,47,49,16,15,45,2,44,24,2,13,34,46,35,47,3,58,14,9,56,13,46,10,26,44,47,49,8,50,4,9,62,48,15,12,5,14,46,30,10,34,8,27,3,32,88,5,7,43,36,13,32,40,65,6,20,4,88,37,21,37,29,24,4,15,3,17,12,2,30,7,23,18,84,46,32,4,72,28,7,5,40,194,32,80,30,3,8,12,6,24,1,21,14,40,3,4,1,31,15,35,7,51,11,24,5],"laa":[1993,322,1011,152],"lab":[968,1137,665,193],"lac":[42,254,536,53,97,16,180,206,358,44,350,278,573,176],"lad":[57,129,216,554,265,117,195,310,544,745,20,193],"lae":[1503,1325,565],"laf":[470,1686,761,537],"lag":[92,278,680,618,120,459,131,191,414,98],"lah":[347,245,194,547,62,1430],"lai":[1163,16,448,247,110,91,19,226,251,504,12,70,49],"laj":[2125,303,577,403],"lak":[356,51,411,44,203,492,1079,32,154,57,141,90,204,70,69],"lal":[2108],"lam":[295,747,287,63,105,244,230,382,162,591,50,296],"lan":[108,51,56,16,74,22,51,74,29,44,28,94,34,7,137,13,38,37,82,43,15,78,30,44,39,12,15,3,141,63,35,1,23,46,189,11,15,53,14,42,114,126,174,50,109,57,73,5,33,73,27,32,1,51,61,95,43,43,192,12,90,29,54,24],"lao":[363,467,469,36,57,113,1081],"lap":[76,618,135,1557],"lar":[404,181,150,146,24,68,270,191,12,34,9,399,27,29,149,207,10,28,14,241,15,41,47,172,31,33,8,334,28],"las":[31,37,73,199,268,3,99,22,63,154,559,161,339,35,324,225,69,94,17,501],"lat":[259,254,266,572,1983,44],"lau":[15,16,21,24,15,11,54,30,138,19,175,51,164,189,7,47,455,9,2,46,9,47,43,136,21,13,40,11,58,242,21,68,114,11,160,188,32,22,9,71,12,48,165,18,120,32,137,57,66],"lav":[57,37,135,100,195,84,61,25,81,70,14,203,55,87,308,21,357,201,219,99,40,13,74,48,213,183,362,92],"law":[63,108,50,12,2,2,248,8,43,22,178,201,13,6,11,26,3,20,13,228,3,65,30,106,34,1,83,26,42,101,29,69,11,50,7,38,84,4,76,52,8,123,76,9,7,45,96,124,113,70,13,3,5,52,133,32,4,20,17,22,125,94,62,1,2],"lay":[3092],"laz":[4,918,838,1679],"lba":[1757,125,278],"lbe":[18,317,635,237,231,101,208,318,92,399,99,152,224,303,1],"lbi":[853,1305,744,569],"lbo":[1960],"lbr":[646,323],"lby":[121],"lc ":[55,444,71,284,1752],"lca":[749,211,754,46,1522],"lce":[2340],"lch":[1455,66,65,1140],"lci":[2445,971],"lco":[478,828,206],"lcu":[1297],"lcz":[485,163,51,239,194,185,40,94,261,315,104,686,575],"ld ":[79,155,114,25,5,419,127,687,66,85,261,21,179,2,193,75,32,304,53,157,326],"lda":[344,103,577,106],"ldb":[1593],"lde":[14,288,39,73,96,86,328,47,329,236,820,10,56,98,242,2,262,68,48],"ldg":[2575],"ldi":[521,476,60,591,654,709,40,75],"ldo":[559,284,1096,591,436],"lds":[339,1651,837],"le ":[86,38,2,13,18,37,22,51,34,63,7,49,34,29,33,28,34,56,53,15,72,65,3,38,190,5,18,15,15,24,78,8,170,20,51,4,44,53,26,104,27,47,28,32,15,23,3,12,51,36,62,159,52,7,22,26,135,14,16,137,240,58,89,26,5,123,86,6,36,43,39,70],"lea":[722,834,107,240,433,390,346],"leb":[464,295,599,259,839,893,97],"lec":[359,237,504,25,595,111,83,70,184,77,68,90,56,106,379],"led":[236],"lee":[101,388,246,298,706,128,319,38,452,335],"lef":[398,317,58,246],"leg":[22,420,304,695,1489],"leh":[5,507,340,274,33,945,196,260],"lei":[49,202,633,362,120,582,73,361,70,75,240,395,307],"lej":[584,865,77,22],"lek":[36,49,61,272,334,119,187,174,254,64,24,248,234,93,493,363,37,4,38,162,124,2],"lel":[1465],"lem":[684,5,35,456,393,254,17,560,292,22],"len":[29,112,116,45,46,74,7,12,14,13,51,90,5,5,20,290,18,17,34,42,192,13,49,16,53,66,101,76,29,42,36,48,80,18,5,32,53,54,13,86,32,29,4,160,8,5,67,79,92,59,42,2,65,257,60,27,33,73,13,189],"leo":[204,66,206,208,1214,453,362,584,60,22,24],"lep":[546,1577],"ler":[109,27,38,28,5,8,67,6,52,44,49,149,15,109,106,153,71,91,13,97,7,6,41,72,11,53,36,17,24,11,5,72,24,60,99,32,24,356,2,22,84,27,11,79,45,42,20,42,20,35,82,41,41,16,223,13,12,22,19,28,180,98,82,6],"les":[16,38,21,56,88,13,47,113,41,235,10,2,37,26,68,94,10,42,66,79,108,149,623,14,223,19,45,73,7,62,208,7,37,225,195,17,38,63,255],"let":[654,114,98,530,240,88,149,1027,443],"leu":[2724],"lev":[707,60,122,1931,14],"lew":[88,347,183,274,153,104,97,24,14,110,90,178,514,101,108,378,22,92,10,7,45,12],"lex":[26,170,64,503,64,55,761,49,251,218,4,103,104,42,848],"ley":[110,316,78,436,126,158,178,26,250,121,197,223,391,119,36,411,247,7],"lez":[1309,329,379,57,513,108,233],"lf ":[39,205,77,143,26,350,835,407,142,29,13,27,21,132,80,8,311],"lfe":[490,324,1361,921,277],"lfg":[29,259,446,348,15,224,198,441,7,889,222,2,136],"lfi":[804],"lfo":[19,244,349,809,181,914],"lfr":[105,536,579,925,1002],"lfu":[292],"lg ":[578],"lga":[259,510,1154,908,54],"lge":[130,999,10],"lgh":[756,1382],"lgi":[74,238],"lgn":[1203],"lgo":[53,14,724,755,287,802,39,117,93,54,449],"lgr":[268],"lha":[1075],"lhe":[2001,40],"li ":[154,34,3,203,2,47,19,101,34,110,157,156,43,17,3,24,8,172,97,398,67,3,100,214,121,70,68,39,102,127,154,16,244,97,117,82,69],"lia":[49,69,220,278,29,82,63,98,6,101,302,19,12,190,133,133,5,97,71,53,246,36,235,233,113,272,45,242,10,33,1],"lib":[885,591],"lic":[295,353,179,93,73,202,145,292,72,476,316,142,338,140,142],"lid":[12,360,465,11,2585],"lie":[13,56,1,120,120,43,52,342,307,262,18,149,69,16,46,61,185,10,16,44,26,233,76,140,24,398,1,18,59,178,24,147,47,18,115],"lif":[2411],"lig":[41,2611],"lih":[889],"lii":[203,1790,808,397],"lik":[105,631,70,97,530,249,161,322,209,595,295,68],"lil":[517,190,66,334,293,162,1587,94],"lim":[73,948,387,305,741],"lin":[12,12,35,3,2,22,14,34,87,42,27,16,1,9,53,26,25,137,8,8,3,1,47,8,53,42,81,17,20,39,12,39,37,63,68,31,6,50,9,7,8,28,37,38,31,41,24,89,8,38,17,24,60,23,54,9,212,50,11,9,62,35,2,32,3,52,8,35,17,19,8,47,13,67,18,16,4,13,3,63,45,1,31,12,18,16,47,47,38,15,19,66,12,21,5,56,53,4,8,24,18,18,80,35,15,22,48,22,5,6,33,23,11,68],"lio":[148,121,957,343,310,616,352,255,79],"lip":[116,407,131,297,467,715,124,75,40,148,194,45,89,159,1,390],"liq":[1684],"lir":[243],"lis":[45,230,6,66,110,19,29,47,555,1,8,6,87,8,113,156,77,166,14,11,148,57,5,83,152,106,269,129,31,154,19,48,86,93,207],"lit":[679,978,260,136,689,38],"liu":[1214,286,313,61,335,24,284,388],"liv":[153,381,210,166,136,231,1015,121,81,459],"liw":[800,1191,386,931],"lix":[936,1618,789],"liz":[737,1207,974],"lj ":[1761],"lja":[1322],"lje":[3243],"ljo":[492],"lju":[1790],"lka":[423,471,8,130,28,914,139,251,126,852],"lke":[297,225,654,110,619,107,259,139,171,825],"lki":[2124,439],"lkk":[2524,428],"lkm":[3275],"lko":[360,303,936,436,102,377,472],"lks":[612],"lku":[2303],"lkv":[501],"ll ":[38,4,47,112,5,24,56,31,59,145,418,53,125,50,100,139,110,98,8,2,204,44,28,4,42,25,45,12,144,7,30,17,110,98,254,16,73,37,7,55,232,52,130,17,3,1,24],"lla":[15,9,13,149,75,324,150,18,220,80,180,23,73,208,5,60,419,72,43,111,91,33,21,22,142,13,23,42,90,372,14,19,26,46,73,60,34,25,20],"lld":[521,476],"lle":[174,28,5,25,50,19,39,31,62,22,9,19,101,189,38,55,39,24,18,193,7,90,126,11,53,77,16,2,4,4,45,41,60,56,43,4,60,34,4,15,87,208,135,85,49,16,106,120,324,154,20,40,6,118],"llg":[578,561],"lli":[148,40,3,72,180,173,131,117,108,63,28,20,24,27,153,196,86,280,3,95,63,37,101,98,41,3,2,13,100,12,317,112,1,16,26,12,6,165,132,19,98,20,135],"llm":[471,299,156,192,335,1488],"llo":[40,398,94,382,1,250,273,27,89,102,27,138,15,4,7,147,105,58,35,57,105,349,203,7,57,123,50,151],"llr":[2909],"lls":[22,276,97,401,310,118,806],"llu":[451,1855,222],"llv":[1513],"lly":[247,17,303,433,187,375,1396,40],"lm ":[24,454,1523,150,257,213,779,6],"lma":[268,397,105,55,101,192,86,3,166,281,309,704,64],"lmb":[474,479],"lme":[471,93,744,145,517,110,525,336],"lmi":[448,2580],"lmo":[1078,87,153,396,146],"lmu":[2110,629],"lna":[3473],"lni":[784],"lny":[1292,333,232],"lo ":[174,49,22,95,64,56,57,193,76,9,74,8,38,464,59,27,39,4,12,27,106,3,27,138,105,55,11,2,93,70,79,80,38,349,52,17,20,23,91,237,48,3],"lob":[48],"loc":[220,42,784,58,1190,47,1068],"lod":[1004,279,162,51,79,975,300,126],"loe":[1279,344,492,909],"lof":[616,504,66,1695],"log":[661,940,688,175,134,860],"loi":[2265],"lok":[3038],"lol":[263,153],"lom":[460,24,73,125,682,105,19,82,998,110],"lon":[438,94,3,124,499,98,298,222,1,59,11,33,219,93,184,641,94,284,23,21],"loo":[453,1965],"lop":[198,151,60,111,937,582,35,318,35,486,473],"lor":[15,57,78,315,64,85,12,163,122,201,225,17,83,19,215,125,16,175,297,103,25,94,174,136,59,93,2,313,11],"los":[132,4,97,81,15,51,37,107,197,7,388,112,25,20,71,137,383,155,476,220,57,102,4,71,108,36,50,72,175],"lot":[153,275,789,171,84,398,410,76,25,34,127,244,221,35,135,109],"lou":[40,727,147,209,42,353,70,197,14,313,199,39,91,313,407,22],"lov":[7,1055,1238,458,259,116,56,98],"low":[410,4,244,272,118,323,629,249,814,397],"loy":[612,1228,486,367],"lph":[2948],"lpi":[1210,211,904],"lps":[195],"lre":[181],"lri":[388,83,110,255,175,229,383,346,940],"lry":[1365],"ls ":[250,145,106,256,39,428,806,182,37,631,337,88],"lsa":[298,808],"lsb":[1261],"lsc":[22],"lse":[149,413,136,1340,1330],"lsh":[161,48,1049,1486],"lsk":[313,46,242,16,112,338,85,196,264,168,52,5,218,176,110,24,59,88,43,391,21,30,333],"lsm":[1628,604],"lso":[2672,538,194],"lsr":[1471],"lss":[1087,571,109,267,403,869],"lst":[583,240,57,1221],"lsz":[2853,591],"lt ":[183,319,545,239,1468,339,128,59],"lta":[3289],"lte":[39,154,54,514,1009,349,362,5,159,275,75],"lth":[641],"ltn":[506],"lto":[611,2563],"ltr":[276,65],"lts":[388],"ltz":[310,145],"lu ":[1115,343,848],"lub":[229,13,438,144,749,343,151,757],"luc":[16,21,47,94,302,175,10,228,254,7,726,153,172,63,90,214,7,116,111,91,63,13,148,20,285,36],"lud":[466,559,170,516,562,121,353],"lue":[451,1586],"luf":[1455,913],"lug":[2275,234,775],"luh":[1280],"lui":[72,270,7,1,254,623,37,103,109,163,7,54,14,37,144,276,87,270,630],"luk":[111,323,66,79,239,341,277,230,153,200,145,448,210,92,25],"lum":[2764],"lun":[619,4,132,177,60,69,210,408,326,45,206,20,256,325,35,375,207],"lup":[859],"lur":[3333],"lus":[503,125,549,31,434,508,572,130],"lut":[318,402,2181,379],"luz":[1059],"lva":[10,46,24,204,245,362,598,131,665,734,111,52,80,38,15,1],"lve":[10,177,1879,635,335],"lvi":[248,188,148,542,387,239,77,16,11,262,248,230,227,606],"lvy":[3125],"lwe":[1473,1062,433],"lwi":[2319,404,264,345,12],"ly ":[21,92,134,17,303,94,111,228,187,185,90,49,51,423,415,184,46,328,40,58,33],"lya":[2737],"lyh":[3441],"lyk":[2564],"lyn":[567,13,860,45,111,953,235,28,188,235],"lys":[3372],"lyz":[3220],"lz ":[2342,161,721],"lza":[634],"lzb":[857,473,2062],"lze":[910],"lzm":[2741],"ma ":[10,422,29,250,133,177,183,169,35,246,14,77,326,10,55,84,12,427,8,64,287,135],"maa":[689,331,1888],"mab":[1924],"mac":[35,13,7,207,42,74,168,97,23,110,49,266,20,2,79,29,161,649,15,124,269,271,26,35,103,218],"mad":[9,819,342,68,8,83,248,859,643],"mae":[1018],"maf":[743],"mag":[12,200,402,384,296,154,110,155,146,10,275,196,171,168,129,495],"mah":[113],"mai":[26,13,87,782,253,631,135,39,387,201,49,105,10,482],"maj":[117,273,83],"mak":[2,323,64,73,175,40,649,29,139,298,78,359,204,8,203,281,143,85,198,86],"mal":[53,14,388,23,118,111,65,19,105,57,11,94,112,230,55,91,91,196,6,6,80,48,140,11,75,165,39,232,156,93,4,32,18,59,111,279,10],"mam":[1577],"man":[1,4,14,109,51,46,109,3,56,19,118,14,46,2,29,13,86,50,9,53,20,8,55,11,35,38,64,11,44,8,32,10,39,10,68,5,20,3,6,31,52,5,45,4,17,24,75,1,55,1,40,28,19,1,22,31,2,8,20,5,20,9,4,124,14,2,16,28,4,63,14,1,65,46,127,40,15,31,21,4,80,23,20,60,60,38,7,55,120,21,81,14,12,25,92,12,6,1,5,7,5,25,4,10,2,37,25,4,17,4,28,11,7,2,2,32,47,25],"mao":[3181],"mar":[4,45,10,12,5,6,11,24,7,11,31,5,9,1,5,22,2,3,5,26,2,6,9,4,3,36,42,6,29,15,11,4,2,1,7,18,15,2,7,12,7,7,7,1,13,1,1,16,13,2,11,6,2,13,21,13,9,3,4,26,13,3,29,12,20,11,10,18,45,5,16,2,2,9,9,1,41,7,34,22,2,18,1,9,7,4,2,2,43,39,21,8,7,1,1,7,7,22,17,5,12,10,6,22,20,16,7,6,9,5,12,5,21,2,1,3,19,7,26,35,7,5,10,3,10,8,8,5,8,7,11,14,5,4,6,1,2,6,6,46,8,28,1,10,41,16,3,29,18,6,33,11,5,18,4,5,5,22,5,12,9,18,2,18,14,8,3,3,9,17,11,7,3,7,6,13,12,8,5,5,4,19,7,41,16,2,14,20,13,13,5,2,14,1,6,9,5,2,4,5,2,1,25,9,3,6,2,5,5,2,11,14,9,66,3,6,33,5,11,4,6,15,7,7,7,7,1,7,9,8,1,36,2,1,13,2,24,16,7,16,22,40,7,16,5,34,3,5,8,3,13,1,1,32,15,4,21,12,7,6,5,11,28,17,17,3,19,10,23,2,4,4,24,9,20,3,11,3,10,19,16,1,18,7,2,1,7,1,26,8,5,12,1,4,4,29,6,7,4,29,11,14,7,1,4,4,28,15,2,6,9,22],"mas":[34,3,6,89,75,36,56,4,97,65,19,54,57,70,53,27,8,47,3,36,19,95,30,12,37,269,63,35,20,23,30,26,140,13,11,18,52,37,48,108,40,21,130,14,3,61,48,137,44,27,20,73,47,11,60,44,7,29,75,185,24,18,43,117,31,82,122],"mat":[9,16,184,304,24,107,69,476,8,177,3,37,61,137,55,14,89,83,67,99,91,380,6,171,40,39,28,83,43,404,2,51],"mau":[204,310,140,145,11,846,106,1483],"max":[573,146,427,865,810,40],"may":[1524,1446,7,189],"maz":[140,542],"mb ":[1741,230,989],"mba":[460,24,315,2094,426],"mbe":[159,315,453,26,211,3,538,35,38,270,22],"mbi":[430,203,158,2158],"mbk":[1188],"mbl":[2380],"mbo":[28,829,126,681,1251,241],"mbr":[3452],"mca":[2047],"mcc":[1382,46,753,371],"mcd":[496,2029,227],"mcg":[1121,35,876,525,713],"mci":[1343],"mck":[764],"mcl":[2350],"mcm":[113,307,615],"mcp":[273,205,1505],"mcs":[2513],"mcz":[66,7,476,12,491,230,1710,53],"mda":[2441],"me ":[15,160,398,38,108,416,11,132,109,38,199,214,173,605,108,58,611],"mea":[1756,950],"mec":[557,1489],"med":[830,19,460,643,268,20],"mee":[1747,751],"meh":[569,740,745],"mei":[129,435,867,8,336,197,683],"mej":[2230],"mek":[28,955,730,696],"mel":[107,806,508,133,70,1,47,86,212,333,281,158,354,182],"men":[59,5,80,271,169,5,382,28,9,75,97,21,323,45,5,207,46,3,14,12,292,111,69,76,182,217,3,208,13,70,117,88,71],"mer":[141,44,65,221,60,82,101,97,65,142,25,225,78,8,99,95,58,37,93,108,131,105,98,24,4,165,11,223,329,7,137,28,51,179],"mes":[213,23,1072,82,151,632,124,157,12,2,132,5,110,58],"met":[401,282,324,112,229,945,24,488],"mey":[1948],"mez":[183,577,569,300,843,12,12,921],"mfi":[2418],"mga":[1155,1089],"mh ":[1903,654],"mho":[310],"mi ":[280,229,393,1048,59,506,513,31,278],"mia":[419,89,912,512,732,588],"mic":[11,12,5,59,1,57,60,75,25,46,7,4,45,60,23,108,39,109,22,9,54,35,30,88,20,61,11,140,24,75,2,204,88,112,11,1,13,131,6,48,5,19,33,70,47,7,15,4,106,14,301,30,46,120,89,63,24,96,76,17,24,13,101,163],"mid":[46,147,92,78,25,410,43,8,19,1173,684,20,22,78,311,256],"mie":[63,238,134,13,109,2,89,54,258,31,470,8,136,155,77,251,88,58,150,26,534,95,148,228],"mig":[269,80,21,81,153,134,694,319,255,252,134,719,306],"mih":[661,1618,681],"mii":[2151,239,698],"mik":[372,410,4,978,802,115,34,151,90,460],"mil":[21,3,40,49,19,197,195,11,18,69,27,23,30,293,20,112,97,276,34,44,73,60,153,52,19,95,311,1,4,48,60,299,196,108,32,54,2,215,53,19,29,14],"min":[97,27,14,14,215,198,168,30,30,41,141,441,121,250,94,130,84,153,230,46,196,167,92,360,25],"mio":[1649,136,1340],"mir":[214,7,21,160,156,42,5,34,30,25,42,282,11,33,51,54,93,65,13,235,74,68,62,62,7,194,51,9,16,148,123,12,7,126,87,64,38,123,178,285,8,27,17,27,35,13],"mis":[843,1067,565],"mit":[334,83,122,182,494,52,30,170,378,215,24,213,634,6,246,112],"miz":[2460],"mji":[901],"mke":[1519],"mki":[984,996],"mko":[2140,235],"ml ":[724],"mle":[1678,1118],"mlo":[2758],"mly":[1596],"mm ":[205,242,304],"mma":[484,1088,57,39,326,142,440,60,23,410,167],"mme":[107,78,428,217,46,402,147,123,76,19,309,250,180,552,93,51,28,230],"mmi":[3059],"mml":[2796],"mmo":[792],"mmy":[1333],"mo ":[284,68,304,136,47,115,199,59,106,154,48,149,45,20,126,51,848,707],"mod":[405,2242,436],"moe":[1606],"moh":[830,19,846,257,288],"moi":[2782,24],"moj":[3259],"mol":[59,143,320,618,50,585,57,592,10,312,77,219,221,210],"mom":[3027],"mon":[120,76,99,66,7,52,3,31,97,37,70,6,18,4,19,145,1,65,50,177,86,37,48,50,4,25,33,117,96,162,23,18,8,107,91,15,5,139,74,89,26,70,48,34,20,19,37,29,25,6,73,46,132,42,17,128,85,64],"moo":[1154,1636],"mor":[128,30,275,35,214,215,18,215,67,309,174,7,175,43,31,75,287,23,125,202,55,106,38,185,120,23,132,31,82],"mos":[893,193,79,343,276,40,71,1023],"mot":[2170,582,363],"mou":[381,1703,156,94,263],"mow":[1078,504,1279],"moz":[1730],"mp ":[794],"mpa":[691,1840],"mpe":[3401],"mpf":[260,470],"mpn":[3128],"mpo":[961,81,858],"mpp":[1927],"mpr":[3287],"mps":[1654,1399],"mra":[1430,853],"mre":[2966],"mrg":[1093],"mrv":[2251],"ms ":[248,1762,59,223,1184],"msa":[314],"mse":[1023],"msi":[2046],"msk":[731,529,232,647,659,407],"mso":[1912,39],"mst":[316,2073,84],"mu ":[887],"muc":[1722],"mud":[1668],"mue":[1422,254],"muh":[1757],"muk":[1298],"mul":[181,159,632,63,202,63,204,112,706],"mun":[11,133,30,161,172,264,476,79,339,176,127,491,452,122,128,89,207,6],"mur":[266,325,175,168,176,38,493,187,27,79,545,589,21,300],"mus":[145,205,183,206,849,367,443,319,122,568],"mut":[278,790,318,396,328,629],"muz":[306],"my ":[1333,1669],"myk":[1586,352],"myr":[1445,863,242,300],"mys":[233,938,581,560,63,281,425,341],"myt":[289,1056],"mza":[760],"na ":[10,14,8,27,5,36,1,13,41,9,1,11,1,14,60,14,33,18,7,37,9,28,15,31,6,19,13,1,13,1,3,42,18,11,7,23,7,7,9,19,17,12,5,17,12,12,13,13,25,10,2,18,37,29,11,28,22,18,51,3,1,3,29,7,19,15,7,1,24,16,15,17,4,20,15,8,5,17,3,9,10,3,9,16,12,11,1,1,15,1,6,5,10,8,2,6,4,13,16,2,6,2,48,18,2,5,2,44,35,12,23,1,17,17,16,4,15,10,7,1,4,41,6,9,3,63,41,32,29,29,36,3,23,21,7,1,1,18,7,3,16,11,27,14,22,4,9,13,2,4,2,3,3,11,19,9,6,30,25,7,9,3,36,3,2,5,13,33,27,8,27,7,8,7,1,15,8,8,28,6,12,5,5,1,10,5,21,3,14,20,10,7,3,21,6,2,1,7,9,27,10,3,5,42,10,67,27,4,1,29,39,1,2,6,3,5,2,31,5,18,17,7,4,20,1,6,4,29,10,18,24,2,13,11,3,5,10,5,9,50,4,21,12,10,5,4,24,11,11,11,12,10,19,4,1,3,8,15],"naa":[461],"nab":[16,1066,701],"nac":[120,907,237,40,742,8,389,679,263],"nad":[202,116,388,180,16,151,238,54,809,24,101,208,53,534,254],"nae":[2335],"nag":[285,135,76,25,29,297,1360,661,588],"nah":[234,2178],"nai":[593,486,1090],"naj":[593],"nak":[524,478,947,897,177],"nal":[79,299,646,653,367,19,241,182,39,5],"nam":[2893],"nan":[564,74,7,121,69,96,30,245,166,49,127,91,34,151,84,98,53,11,51,94,243,73,213,63,199,128,133,86],"nao":[3064],"nap":[242,2471],"nar":[51,153,13,259,143,162,645,39,85,46,208,60,34,187,67,33,172,262,24,607,50,148,25],"nas":[2,220,36,77,62,335,374,51,10,6,126,219,19,201,495,199,1,12,50,126,504,291,58],"nat":[159,44,150,252,12,75,9,273,71,91,158,30,139,43,21,257,37,308,60,316,146,639],"nau":[311,674,547,369,853],"nav":[686],"nay":[1668],"naz":[603],"nba":[599,754,512,1169],"nbe":[96,161,260,429,82,185,206,374,212,218,365,625,147],"nbu":[1085,92,533,875],"nby":[1249,830],"nc ":[152,289,183,832,1566],"nca":[309,367,193,903,220,95,634,315],"nce":[108,20,30,81,79,559,177,236,92,100,55,71,116,103,71,1,32,89,5,295,24,68,5,69,100,378,154,2],"nch":[159,651,332,49,38,522,255,23,379,47,169,186,22,403,47,30,22],"nci":[276,133,110,514,157,147,9,8,256,265,291,344,23,343,52,332,143,33],"nco":[806,44,158,72,455,124,80,91,192,1031,38],"ncu":[36,1871],"ncy":[2070,1283],"ncz":[493,2,606,390,392,889],"nd ":[215,90,314,142,71,81,79,69,44,139,3,24,242,338,199,44,61,35,66,8,12,6,39,289,13,158,154,43,53,2,108,47,78,1,130,13,41,23],"nda":[128,73,249,431,290,185,51,136,125,170,241,4,376,168,162,223,62],"ndb":[1071,431,796],"nde":[26,107,4,9,50,30,23,11,55,323,7,215,22,49,230,6,46,27,353,46,4,30,6,31,71,25,18,45,39,86,11,54,89,67,74,43,40,42,23,43,327,50,19,129,1,128,5,128,46,86],"ndg":[932,2056],"ndh":[24,2127,804],"ndi":[1290,1911,270],"ndk":[404],"ndo":[18,46,24,476,271,96,30,84,38,923,267,112,712,258,92],"ndr":[17,41,15,11,1,7,12,27,31,57,115,29,2,2,36,34,16,5,64,65,42,14,10,79,10,1,19,1,25,80,3,7,28,29,89,39,3,23,68,53,27,115,59,43,13,2,17,15,47,2,66,2,23,51,25,65,3,33,84,60,15,26,30,23,13,21,2,15,42,50,69,106,19,32,4,13,1,34,27,6,27,92,36,12,13,27,19,40,5,60,2,8,19,70,102,9,34,115,29,17,16,58,52,6,4,41],"nds":[11,496,113,151,198,162,710,547,80,443],"ndt":[491,480,1938],"ndy":[50,365,890,202,53,245,92,650,786],"ndz":[1843],"ne ":[6,39,25,6,36,13,9,14,22,5,6,21,38,9,4,51,3,36,18,22,37,11,67,8,24,44,2,16,36,3,1,34,16,14,29,24,9,2,6,6,52,90,3,22,36,12,2,11,34,19,4,43,30,10,37,16,16,9,16,12,26,7,11,33,1,12,24,2,40,11,30,39,3,29,46,1,15,13,14,3,42,15,15,41,8,4,35,17,6,2,102,52,6,6,27,15,3,100,21,6,9,8,31,1,20,13,34,51,6,24,17,43,18,3,11,12,11,30,36,33,28,7,5,23,28,20,30,7,14,2,15,25,6,36,8,91,20,28,21,19,10,18,35,4,20,12,2,29,12,31,21,5,16,12,31,7,33,32,10,4,20,67],"nea":[452,944,300,571,281,166,21],"neb":[1414,1090],"nec":[1564,258,534,136,563,244],"ned":[115,1182,227,229,764,165,679],"nee":[1124],"neg":[1648,680,774],"neh":[1817],"nei":[122,164,342,403,602,478,90,379,354],"nek":[53,314,19,610,1351,4,211,95,783,30],"nel":[275,131,657,141,22,236,554,271,1,384,8,147,200,75,53,46,3,200],"nem":[1948,1244],"nen":[6,486,68,363,214,37,5,5,229,111,268,75,44,16,23,198,100,79,63,31,103,36,25,73,125,139,1,29,123,13,86,255],"ner":[43,26,38,11,44,15,5,66,84,13,132,50,292,72,15,72,92,2,28,34,21,48,16,58,11,14,49,88,11,43,38,244,237,79,19,52,107,5,11,466,109,30,52,128],"nes":[376,7,61,62,149,102,127,77,2,64,71,136,25,69,378,24,223,40,181,231,174,151,112,17,170],"net":[140,669,510,21,113,142,265,124,1,92,18,127,477,171,57,2,2,271,136,129],"neu":[3,1531,820,884],"nev":[1755],"new":[1281,1878],"ney":[167,1273,143,173,364,119,274,727,61,181],"nez":[186,75,323,154,261,117,137,84,276,266,201,100,34,372,109,432,87,88,71,72,18],"nfe":[341],"nfr":[1302,1040,702,281],"nfu":[2182,512],"ng ":[20,9,153,106,300,97,42,7,74,274,15,24,135,65,96,61,41,46,68,52,10,265,7,30,392,359,108,40,5,110,37,30,2,26,74,36,95,160],"nga":[322,213,42,406,151,178,697,981],"ngb":[2826],"ngd":[525,1003],"nge":[99,40,125,58,20,2,26,62,88,144,4,158,62,24,163,130,75,152,93,3,89,59,59,94,36,198,5,112,50,307,37,62,2,107,86,37,22,65,192,66,2,79,71],"ngh":[876,529],"ngi":[82,251,623,716,1525],"ngl":[1271,1171,339],"ngm":[1800,1553],"ngn":[2558],"ngo":[28,542,693,1802],"ngq":[1790],"ngr":[1320,1103,65,615],"ngs":[399,1126,520,217,339,471],"ngt":[160,416,1558,51,477,497],"ngu":[1056,481,911],"ngy":[1872],"nha":[152,78,615,31,645,1421],"nhi":[2783],"nho":[499,1726,381,759],"nhu":[251],"ni ":[12,22,28,69,19,6,107,89,84,198,46,76,74,171,8,31,138,149,40,76,111,33,55,45,165,25,70,2,21,39,62,31,35,22,57,1,29,97,221,15,218,92,56,256,85,92,24,1,49],"nia":[8,12,40,5,172,34,927,69,92,167,70,8,224,75,101,467,1,85,8,89,49,58,123,18,61,167,6,24,87,39,16,48,20,52,61],"nic":[62,19,43,213,58,27,129,27,42,66,197,49,151,97,86,183,237,115,55,3,84,82,3,58,166,306,407,302,6,53,106,27],"nid":[270,770,2,331,1984],"nie":[35,35,118,10,48,69,13,101,25,21,19,67,28,34,50,12,44,26,65,93,21,3,18,12,12,3,31,3,23,20,26,10,35,41,62,18,78,122,23,55,53,50,52,33,25,53,15,42,48,16,93,10,99,32,87,33,11,28,42,27,2,6,30,19,97,21,38,32,12,12,21,13,13,17,83,41,63,5,26,118,5,60,24,62,50,1,28,1,14,13,4,1,58,65],"nif":[741,1968],"nig":[27,77,15,614,273,1295,13,323,706,99],"nii":[575,2484,296],"nij":[1567,1369],"nik":[363,196,6,158,70,57,329,135,21,57,43,70,213,163,244,245,131,13,139,75,28,61,70,241,120,163,4,10],"nil":[250,251,197,59,1455],"nim":[1113],"nin":[32,144,447,161,626,807,113,56,121,144,245,467,25],"nio":[192,185,56,111,241,556,278,40,122,161,274,571,23,9,151,7,134,82,146,34],"niq":[588,1262,199],"nis":[1,93,141,321,14,111,7,66,21,104,55,24,38,16,4,106,23,69,141,162,14,74,87,15,91,76,33,215,54,25,190,365,482,47],"nit":[1061,114,160,471,148,75,945],"niu":[2746],"niz":[1791,260,879],"nja":[613,127,94,18,248,101,215,355,16,218,241,532,159,67,169,191],"nk ":[491,369,533,40,255,1470],"nka":[172,365,122,770,111,221,221,394,107,631],"nke":[124,318,300,9,44,2309],"nki":[458,1268,817,824,7,9],"nkl":[567],"nko":[1,417,437,95,224,80,88,57,45,15,8,368,71,112,157,563,57,328,158,91,77],"nky":[2317],"nla":[1415],"nlo":[1120,1904,371],"nma":[39,627,354,201,999],"nmb":[430],"nme":[2466],"nn ":[5,134,57,152,16,29,112,2,85,128,112,20,8,1,265,81,10,238,100,73,41,28,73,319,14,1,223,32,23,167,131,61,55,36,79,262,19,30,16,37,29,49,11,90],"nna":[64,296,52,37,46,75,49,40,12,59,38,107,119,33,3,7,161,5,51,39,52,38,76,5,1,166,36,52,9,76,121,36,168,6,4,33,249,137,1,36,3,23,174,94,5,29,39,73,17,123,2,143,19,35,11,68,15],"nnc":[2408],"nne":[6,119,45,11,68,55,28,54,45,21,25,154,94,84,105,263,57,89,91,29,7,3,153,57,15,28,13,47,179,40,341,25,79,62,83,10,95,2,17,15,30,6,1,76,58,44,4,40,87,12,120,8,117,20,67],"nni":[104,516,61,52,8,138,4,75,43,5,173,673,449,206,46,156,88,99,49,507],"nno":[1193,359,24,244,145,302,541,443],"nny":[38,84,590,95,949,11,26,780,27,69,197,155,79,191],"no ":[123,5,13,13,4,8,32,41,18,191,141,32,43,115,36,82,11,55,1,31,235,42,136,13,4,81,46,56,43,6,43,16,114,69,123,99,39,67,141,1,162,20,21,7,141,50,53,209,95,129,61],"noa":[977],"nob":[1012],"nod":[97],"noe":[1250,1992],"nog":[966,975,1516],"noh":[2926],"noi":[185,215,405,2062],"noj":[461],"nok":[1055],"nol":[83,480,359,689,397,207,575,249],"nom":[3115],"non":[945,631,70,174],"nop":[653],"nor":[11,71,192,63,375,59,138,284,374,398,67,235,69,415,57,222,158,63,152,8],"nos":[670,294,117,157,325,9,312,713,160,126],"not":[660],"nou":[161,11,284,608,508,762,302,452],"nov":[46,157,62,78,54,62,23,24,280,350,513,236,182,461,202,64,20],"now":[3,562,286,45,11,26,178,199,54,137,247,85,38,206,126,121,111,156,158,232,159,106],"noz":[144,30,161,2124,1004],"npa":[2716,623],"npo":[1842],"nra":[178,272,371,239,244,1163,342],"nri":[109,20,145,119,232,194,170,388,518,20,135,423,210,310],"nro":[1968],"nry":[266,1095,236,1512],"ns ":[179,196,12,18,44,149,1,153,19,13,45,70,2,41,30,12,314,272,52,86,31,70,5,6,24,6,80,94,160,35,198,41,40,2,141,28,203,186,70,88,7,3,24,12,79],"nsa":[280,1289,1237],"nsb":[873,852],"nse":[408,37,483,24,187,529,210,80,100,433,405],"nsf":[50],"nsh":[1574,245,1557],"nsi":[2337,219,578],"nsj":[1767],"nsk":[17,47,31,43,4,34,51,68,85,44,15,27,4,10,20,57,9,67,106,86,60,50,114,24,4,74,55,41,28,42,53,103,6,99,196,2,1,155,59,24,99,2,245,12,92,13,99,71,8,61,23,13,16,2,5,28,5,41,42,20,67,54,204,199,7,25,7],"nso":[19,1139,263,168,13,83,6,297,272,303,164,164,273,275],"nsr":[368,548],"nss":[1368,441,426,177,496,12,192,141],"nst":[118,12,156,50,35,450,169,52,39,157,334,481,544,286,278,194],"nsu":[347],"nsz":[2767],"nt ":[134,35,139,87,244,108,41,38,228,272,1,55,115,111,57,58,274,543,48,145,51,336,86,251],"nta":[228,3,206,275,16,97,13,71,172,139,206,301,71,110,42,283,169,67,6,99,74,461,117],"nte":[129,243,82,60,37,1,1260,53,32,27,120,149,13,110,137,98,36,216,167,12,71,162,160],"nth":[194,304,24,488,269,523,258,1133,92,77,76],"nti":[141,53,142,39,93,222,111,241,39,157,203,131,132,40,243,206,23,65,171,145,40,239,7,233,75,164],"ntk":[2040],"nto":[192,185,56,344,8,259,185,112,39,30,249,48,1,73,37,124,129,254,71,391,16,7,1,8,151,7,26,108,19,25,38,157,23,29,59],"ntr":[780],"nts":[789,391,644,580,241],"ntt":[2390,149,716],"ntu":[1080,1578,663],"nty":[3398],"ntz":[3185],"nu ":[228,851,1239],"nuc":[67,1608,1386],"nud":[542,1231,185],"nue":[544,90,145,136,84,159,127,344,205,160,582,493,110,1,56,85,52,2,104],"nui":[2184],"nul":[191],"nun":[2180],"nur":[683,574,432,193,366,276,813],"nus":[441,95,474,548,311,742,558,96,75],"nut":[2453,20,431,443,113],"nwe":[2525],"nxi":[2129],"ny ":[38,84,89,264,23,214,95,203,282,88,56,320,11,26,9,55,200,185,155,176,7,89,64,133,155,79,185,6,8,63],"nya":[1445],"nyb":[106],"nyc":[1625],"nye":[2046],"nyg":[322],"nyk":[235],"nym":[2644],"nys":[1707,311,582],"nz ":[29,999,483,685,454,49,269,401],"nza":[621,688,329,49,387,242,271,108,233,372],"nze":[371,599,293],"nzi":[1829,987,173],"nzl":[1219,1280],"nzo":[72,1427,217,183],"nzu":[1882],"oa ":[28],"oac":[787,190,1132],"oad":[545,862,976],"oak":[1417,1739],"oal":[2457],"oan":[360,52,83,176,243,44,36,204,185,81,264,256,155,33,258,199,166,217,165,143,34,31],"oar":[804,750],"ob ":[208,146,191,148,1495],"oba":[320,103,589,24,1295,628],"obb":[948],"obc":[2401,176],"obe":[48,29,161,300,17,39,182,116,27,67,119,47,42,14,29,51,236,44,51,80,101,314,33,51,6,17,72,20,11,52,74,120,69,38,15,310,184],"obh":[1934,675],"obi":[326,146,56,109,351,72,12,519,532,137,243,820,48],"obl":[1488,806,47,610,458],"obo":[111,1114,45,119,587,464],"obr":[392,1949,778],"obs":[1026,161,1416],"oc ":[3121],"occ":[1992],"oce":[1440,45,226,1497],"och":[220,42,20,199,71,225,404,1099,350,603,13],"oci":[57,2157,442],"ock":[130,90,321,184,36,67,162,56,58,55,134,13,633,176,12,167,47,967,101],"ocn":[524],"oco":[775],"ocq":[3120],"ocz":[1436,127,156],"od ":[1375,40,56,1188],"oda":[246,758,12,60,207,213,154,244,132,950],"odd":[373,1098,1885],"ode":[1007,982,458,200,349],"odg":[252,303,2213],"odi":[169,477,867,62,1298],"odl":[215,2724],"odn":[2643],"odo":[97,166,889,1299,511],"odr":[276,129,262,332,254,20,3,203,409,596,309,17,273,292],"ods":[781,385],"odt":[879,1152],"ody":[1445,1105,300,335],"odz":[3033],"oe ":[267,1339,330,32,279,100,12,245,42],"oec":[1623],"oef":[3024],"oeg":[809],"oeh":[321,162,997],"oek":[1966],"oel":[483,278,489,937,209,846],"oem":[1870],"oen":[2115],"oer":[1261,332,37,639,575,285],"oet":[1186,346,1550,125],"oev":[1593],"oew":[1279],"oey":[1773],"of ":[99,329,81,353,258,24,41,870,69,84,33,88,23,43,25,24,163,53,14,17,31,18,141,134,203,29,168,28,13],"ofa":[2792],"ofe":[366,1527],"off":[161,402,53,570,95,935,797],"ofi":[65,2854,167,202],"ofn":[2942],"ofo":[856,898],"ofr":[342],"og ":[1557],"oga":[151,815,1116,874,433,68,1],"ogd":[97,1568,608,991],"oge":[700,228,1297,809,417],"ogg":[2289,309,72],"ogh":[661,1280],"ogi":[540,358,38],"ogl":[1115,343,327,679],"ogm":[1452],"ogn":[217,817],"ogo":[208,262,381,82],"ogu":[256,229,320,210,563,23,567,744,133,32],"oha":[364,122,344,19,124,449,209,27,48,49,197,286,2,181,502],"ohe":[2848],"ohh":[830],"ohj":[2345],"ohl":[1463,506,364,593],"ohm":[2213,1009,149],"ohn":[532,134,117,207,45,6,69,275,218,58,24,6,221,56,20,74,11,97,151,246,32,21,76,470,10,49,20,8],"ohr":[1141,53,501,1653],"ohu":[672,1737],"oij":[1738],"oik":[3207],"oil":[12],"oin":[461,1541],"oir":[782,2000],"ois":[806,28,701,204,220,306,274,86,181,243,4,412],"oit":[185,215,405,116,1946],"oiu":[1664],"oja":[224,237,851,675,763,267],"ojc":[480,169,24,26,38,366,461,88,334,726,234,322],"oje":[745],"ojk":[2004,342],"ojn":[120,2323,148],"ojs":[3259],"ojt":[2830],"ok ":[519,614,492,1413,306,2],"oka":[1612,782,344],"oke":[1347],"okh":[2850],"oki":[67,842],"okk":[1505,187],"okl":[608,1146],"oko":[2057],"oks":[1055,303,292],"ol ":[173,70,400,101,46,85,3,729,374,234,83,848,336],"ola":[83,148,132,50,3,53,1,309,46,13,34,50,172,23,62,25,40,91,57,42,71,9,65,219,140,46,24,93,24,31,154,35,22,241,40,20,122,285,88,95,5,2,29,157,2,1,5],"olb":[1207,332],"olc":[499,71,881,1155],"old":[14,220,114,449,46,768,412,202,295,242,65,2,137,45,28,326],"ole":[124,15,18,145,116,8,90,62,181,121,60,153,32,107,38,126,45,8,37,64,24,62,26,145,136,98,15,196,7,383,54,17,33,184,66,46,4,38,39,249,107],"olf":[29,215,19,25,33,143,26,151,93,348,15,224,198,156,285,7,115,142,42,48,202,10,330,222,2,67,69],"olg":[769,360],"oli":[59,3,24,14,34,19,37,373,181,56,110,136,70,24,50,87,2,61,249,60,8,351,203,52,29,85,36,81,129,18,62,1,119,130,83,71,81,50,20,6,44,168],"olk":[360,162,141,936,306,69,1301],"oll":[22,164,16,28,31,2,35,73,24,340,371,34,382,253,117,12,253,69,112,79,17,789,51,67,52],"olm":[24,450,4,187,643,10,396,437,257],"oln":[1292,565,1616],"olo":[7,453,417,502,66,75,133,328,569,128,137,1,34,192,152,92],"olp":[1210],"ols":[562,261,57,207,65,506,174,202,307,83,13,416,114,243,7,89,138],"olt":[183,64,29,34,192,109,436,239,484,711,612,128],"olu":[1455,1369,68],"olw":[2723],"oly":[580],"olz":[2741],"om ":[294,151,175,768,100,82,1257,414],"oma":[19,15,9,89,47,28,18,74,133,33,73,52,5,42,81,27,8,47,3,55,95,8,71,31,11,94,133,9,54,35,20,23,52,4,26,138,18,36,16,37,3,8,37,8,13,127,11,2,8,36,4,45,59,3,36,25,229,27,11,82,47,11,60,44,7,29,175,85,17,7,18,25,135,31,204],"omb":[460,24,443,56,1065,901],"omc":[66,483,794],"ome":[611,472,52,194,17,8,502,616,12,298,635],"omf":[2418],"omi":[214,28,121,4,142,48,1,7,35,136,57,467,209,104,204,69,35,69,937,534],"omk":[984,1391],"omm":[185,299,129,720,310,1384],"omo":[682,211,471,144,926,134,110,437],"omp":[1654],"oms":[1912,134,1159],"on ":[15,12,47,39,7,13,27,6,60,55,76,42,22,2,15,17,70,7,15,29,66,16,12,9,5,94,73,10,23,56,5,4,16,1,28,24,15,54,44,12,100,9,29,15,10,2,41,19,35,9,125,21,13,18,5,6,26,13,7,3,5,4,5,22,6,17,59,53,16,6,5,14,18,1,32,3,9,5,30,17,7,5,8,35,3,14,16,4,12,19,35,51,3,4,43,8,17,2,6,89,14,47,19,10,61,2,34,1,16,2,24,13,24,6,32,10,6,6,5,24,14,41,31,44,39,9,2,84,17,117,1,10,35,2,5,33,5,5,3,43,20,12,11,1,5,4,25,10,54,9,23,54],"ona":[79,125,107,67,42,56,20,3,60,46,96,4,27,66,88,138,82,211,7,48,134,39,36,96,54,7,160,146,1,18,144,225,26,67,23,64,77,276,52,6,102,165,128,56],"onb":[946,303,756,74],"onc":[36,92,30,337,1042,338,897,264],"ond":[133,317,428,53,93,328,117,74,419,32,633,308,266,181,89],"one":[45,316,83,238,544,46,210,49,33,12,375,6,386,78,83,56,8,35,256,243,53,19,97,28],"ong":[28,54,251,202,53,76,592,416,200,191,326],"onh":[251],"oni":[34,28,32,98,78,82,25,56,42,76,37,98,99,65,82,5,329,48,27,69,144,33,55,17,28,20,74,10,10,49,27,65,107,2,20,31,35,177,16,21,19,102,42,121,18,134,7,16,7,2,111,40,7,134,19,63,8,149,5,2,16,29,9,14],"onj":[613,2165],"onk":[442,217,734,147,836],"onm":[2466],"onn":[196,53,83,117,28,716,10,31,318,413,164,138,141,84,93,129,94,58,45,18,131,191],"ono":[46,157,194,315,139,58,24,431,336,241,91,45,680,273,373],"onp":[1842,1497],"onr":[178,272,371,239,244,1163,342],"ons":[19,276,41,32,3,9,44,492,126,39,77,80,130,2,51,151,30,123,51,1,820,253,33,8,221,138,105,84],"ont":[194,243,17,347,428,98,99,281,20,17,80,457,115,73,334,250,138,270],"onw":[2525],"ony":[498,512,370,327,95,244,351,247,641,77],"onz":[1309,190,139,436,513,108,233],"ood":[215,37,1123,1284],"oof":[509],"oog":[2956],"ook":[1133],"ool":[302,124,318,196,574,1703],"oom":[718,1330,370,364],"oon":[2544],"oop":[116,431],"oor":[1154,1375,261],"oos":[1842,807],"oot":[453,916,1936],"op ":[1391],"opa":[425,452,160,450,677,1070],"ope":[116,82,107,44,60,111,27,910,617,318,35,663,296],"oph":[452,116,62,569,108,86,395,475,1201],"opi":[2196,441,276],"opk":[635,1584,130],"opl":[221,315,2075],"opo":[417,304,760,37,977],"opp":[653,578,767,582,233],"ops":[1369,1471],"opt":[1921],"opu":[1212,827],"or ":[7,286,233,100,84,47,90,10,202,34,100,282,49,306,29,106,53,14,178,57,19,50,161,20,126,35,73,17,40,6,136,11,1,68,34,6,78,18,85,196],"ora":[23,59,15,14,25,63,84,150,68,105,106,192,5,6,424,121,14,146,32,28,182,60,133,593,161,161,7,175,23,57,28,82,61,17],"orb":[289,1058],"orc":[614,2732],"ord":[50,85,24,115,144,194,253,252,131,112,156,74,30,502,39,12,273,60,86,622,197],"ore":[72,330,77,50,60,68,132,108,123,54,80,106,11,66,17,58,44,50,134,54,118,113,62,103,8,41,182,91,175,93,110,26,31,53,68,2,62,262,13,7,2,19,79,42],"orf":[64,223,3113],"org":[24,23,116,63,163,28,15,203,47,410,50,54,49,128,93,56,29,67,340,2,125,63,69,111,20,153,123,61,318,206,18],"orh":[1146],"ori":[46,32,50,22,8,111,67,129,3,61,185,142,55,168,592,115,10,109,326,53,17,86,166,5,107,38,54,118,189,22,197],"ork":[277,395,333,125,183,623,321,194,837,75],"orl":[394,20,690],"orm":[11,35,291,193,241,611,296,39,294,1142],"orn":[96,179,363,447,124,205,563,80,165,52,357,32,45,12,150,127,204,47,90],"oro":[208,148,125,45,44,93,12,194,61,100,65,102,232,6,64,7,181,129,173,62,279,277,15,20,45,150,209],"orp":[1395,1430],"orq":[2999],"orr":[1055,35,295,674,537,21,224,167,180],"ors":[61,617,19,81,19,103,125,120,421,180,65,342,195,98,220,18,45,209,170],"ort":[15,75,102,58,3,274,370,159,113,29,146,88,119,448,299,33,117,81,67,162,105,264,251],"oru":[139,1298,72,155],"orv":[989,578,756,128,414],"ory":[1112,590,244,856,536],"orz":[53,14,225,309,32,158,755,73,93,25,78,18,305,3,69,32,62,102,171,25,4,29,131,25,93,54,257,192],"os ":[2,47,87,30,66,61,70,26,28,135,112,6,51,7,128,37,12,16,37,84,39,5,30,109,13,15,20,26,36,9,45,3,89,24,3,55,9,120,15,47,31,33,6,71,5,56,63,48,17,1,243,105,18,1,43,6,70,21,5,20,27,71,42,117,9,35,48,91,62,24,13,25,12,22,139,36,38],"osa":[365,599,460,672,64,67,104,502,151],"osc":[1086,398,424,1016,156],"ose":[48,60,27,206,5,4,302,215,7,44,13,37,31,9,42,40,9,21,16,45,46,62,237,112,76,23,89,103,151,13,109,230,42,99,122,104,171,40,114,132,7,114,3,8,39],"osh":[1002,373,163],"osi":[131,45,898,802,564,19,228,175,16,601],"osk":[233,75,72,481,292,83,163,1856],"osl":[221,8,8,92,164,31,84,61,25,151,14,78,92,33,195,68,170,17,135,196,14,57,86,36,4,51,25,320,26,70,52,758,17,75],"osm":[763,1076,895],"osn":[2536,600,4],"oso":[1197,587,988],"osp":[669,1215,813],"osq":[2186],"oss":[314,60,152,116,131,5,92,358,170,1018,233,94,76,210,69,86,88],"ost":[239,119,51,481,65,125,85,90,352,80,3,104,48,38,55,26,89,95,111,54,447],"osu":[280,2265,441],"osw":[58,1597],"osy":[3093],"osz":[25,107,812,793,127,497,313,12,24,239,152,129,54],"ot ":[1226,1396,385,298],"ota":[19,337,319,19,236,505,381,235,1025,101],"ote":[428,25,2775,177],"oth":[660,951,108,168,393,101,34,291],"oti":[285,265,371,1435],"otk":[2420],"otm":[2228],"otn":[3286],"oto":[1436,88,1518,73],"otr":[95,132,130,23,55,131,5,16,104,13,215,560,11,2,182,100,84,167,170,93,115,399,53,512,42],"ott":[148,5,209,280,45,2,14,47,28,122,17,167,164,67,38,16,19,84,64,33,31,18,84,168,149,68,83,167,35,17,102,98,6,157,34,81,31,13,36],"oty":[2015],"otz":[1217,276,1049],"ou ":[12,68,22,279,449,688,59,208,299,85,71,324,522,107,177,11],"oua":[1092,71,686],"oub":[2777],"ouc":[456,16],"oud":[1299,286,1012,760],"ouf":[486,679,215,1061],"oug":[40,570,1,25,52,226,1436],"ouh":[822,2333],"oui":[767,63,293,449,540,199,325,118,325,82,6,264],"ouk":[161,1812,685,211,515],"oul":[12,405,304,681,79,37,109,472,396,686],"oum":[175,502,642,762],"oun":[53,974,606,52,264,21,88,276,1136],"oup":[2,2431],"our":[381,439,138,76,204,350,211,150,10,352,23,263,586,2],"ous":[172,378,415,99,1058,966],"out":[1213,1183,165],"ouy":[595],"ouz":[975,429,718,16,1177],"ov ":[7,708,60,11,469,295,24,75,119,288,41,40,28,174,419,78,167,39],"ova":[57,98,10,7,1,30,62,78,54,62,23,24,18,11,71,59,46,139,212,63,50,79,88,87,238,48,98,22,17,33,176,6,5,11,92,76,28,21,154,74,215,51,3,174,143,19,21,133,138,27],"ove":[748,191,1063,483,329,407,35],"ovi":[7,843,579,244,41,72,103,98,743,287,74,312,46],"ovo":[672,464,2053],"ovs":[1,45,97,259,1042,43,25,103,1060,81,180],"ovy":[1721],"ow ":[68,578,1087,508,83,13],"owa":[3,252,58,46,195,175,1019,100,23,347,31],"owc":[1635],"owd":[2620],"owe":[410,1135,1159,456,219],"owh":[1701],"owi":[103,804,108,232,222,531,40,37,58,126,116,158,214,4,77,7,24,87,298,215],"owl":[457,1394],"owm":[2397],"own":[79,468,394,383,203,76,1248,205,221],"owo":[2341,1022],"ows":[88,26,64,40,13,65,29,31,4,54,144,7,5,17,62,9,13,4,61,64,2,49,4,41,23,11,3,17,9,39,7,25,15,3,21,9,17,16,77,122,15,5,31,3,7,88,42,45,3,10,23,17,20,146,68,38,31,59,74,133,35,109,34,29,10,21,10,4,15,52,27,24,53,16,7,28,11,38,104,76,13,31,54,12,82,77,44,34,70,44,128],"owt":[2991],"ox ":[754,400,1634],"oxe":[1507,1076],"oxo":[1594],"oy ":[674,1104,477,40,398,182,136],"oya":[715,514,26,720],"oyc":[2700],"oyd":[612,1228,779],"oye":[2326],"oyl":[267,507,349,958,528],"oyo":[1751,342,820,437],"oys":[1468,1264],"oyv":[2155],"oz ":[144,30,161,929,1195,638,366],"oza":[1401,854,842],"ozc":[1506],"oze":[494,229,251,736,13,7,244,68,252,381,47],"ozh":[3046],"ozi":[470,120,285,947,158,1215],"ozk":[2985],"ozl":[2877,583],"ozm":[1962],"ozn":[1174,1391],"ozo":[1557,1096,285,200],"ozs":[459],"ozt":[2773],"ozu":[3169,21],"pa ":[189,502,977,397,99,386,684],"paa":[245,2471,623],"pab":[174,2142],"pac":[1587,1027],"pad":[2629,254],"pag":[150,2067,314,673],"pai":[1927,174,16],"pak":[425,434,602],"pal":[448,506,124,640,375,512,62,64,613],"pam":[2281],"pan":[60,225,87,178,2,444,41,44,354,1020,125,158,155,320,227],"pao":[460,417,776,328,834,379,64],"pap":[72,1993,129,519,170,250],"paq":[98,3352],"par":[158,133,324,107,179,128,317,28,215,296,273,71,1,9,92,38,197,254,344],"pas":[379,572,416,120,56,193,132,5,445,441,191],"pat":[277,202,502,13,289,202,160,150,17,294,2,18,68,6,39,30,231,218,225,55,1,164,164,131],"pau":[33,222,1,2,33,171,26,43,101,44,26,62,23,196,232,153,110,33,72,118,48,261,558,415,278,74,16,5,38,38],"pav":[56,95,22,70,359,1,1379,1080,287],"paw":[138,158,305,51,103,99,8,68,14,104,187,49,206,543,846,184,102],"pay":[1722,1279,171],"paz":[2791,147,481],"pch":[1794],"pci":[1537],"pe ":[523,131,147,150,336,92,120,145,2,59,179,211,619,78,215],"pea":[1121],"pec":[319,1265,978],"ped":[542,882,102,918,389,445,145],"pee":[1406],"pek":[242,640,41,214,1779],"pel":[154,151,435,13,101,40,1025,28,1333],"pen":[335,246,22,319,309,349,1571],"peo":[166],"per":[61,15,40,28,205,19,165,14,155,30,4,2,149,132,22,57,1,7,158,92,6,50,82,32,351,81,40,15,8,28,237,72,122,150,81,175,187,32,127,20,55,25,26,43],"pes":[78,618,2394],"pet":[44,28,43,52,39,81,25,315,23,63,309,80,18,113,8,109,80,85,46,7,16,2,78,29,4,310,71,19,87,21,31,54,33,126,66,421,90,65,41,39,102,3,152,18],"pez":[198,151,60,111,937,617,318,35,959],"pf ":[260,470],"pfe":[725,217,1359],"pfi":[2890],"pfl":[31],"ph ":[630,1008,150,414,746],"pha":[87,4,182,205,468,226,190,272,157,984,123],"phe":[195,232,25,73,43,631,75,33,86,35,386,169,224,46,419,170,622],"phf":[2263],"phi":[116,407,131,297,311,156,839,75,40,342,134,159],"phy":[591,519,718],"pi ":[1210,185,1430],"pia":[382,164,1429,205,424,88],"pic":[669,1606,338,785],"pid":[374],"pie":[170,20,179,85,56,361,448,67,90,142,228,118,166,3,75,38,83,33,24,78,197,266,208,30,175,137],"pig":[1421],"pih":[3408],"pii":[1803],"pik":[2196],"pil":[300,134,619,1299,479,176],"pin":[405,424,62,73,187,124,303,196,49,7,291,2,152,50,48,246,184,280,118],"pio":[95,132,130,23,55,131,5,16,104,13,215,560,11,2,182,100,84,337,93,115,399,53,220,223,69,42],"pir":[974,582,233],"pis":[2,1654,777,264,216],"pit":[1200,1238,199,745,73],"piw":[2218],"pka":[2349],"pke":[635],"pki":[2219,67],"pko":[2971],"pla":[171,365,642,359,1669],"ple":[202,900,618,262,1132],"pli":[221,772,1436,182],"plo":[220,13,147,279],"plu":[480,139,2233,622],"ply":[3441],"pne":[167],"pni":[237,730,1917,244],"po ":[303,482,828,826,525,44,8],"pob":[2294,47,1068],"poc":[3246],"poh":[1969,376],"pok":[2057],"pol":[247,543,730,79,37,13,8,5,676,182,193,217,216],"pom":[961],"pon":[1540,302,1408],"poo":[302,207,235],"pop":[536,833,1721],"por":[250,896,328,190,395,1319],"pos":[669,201,172,38,527,236,57,559,238,782],"pot":[694,742,1431],"pou":[417,55,249,760,37,604,373],"pov":[748,2508],"pow":[1545,1159,456],"pox":[1594],"poz":[1962,976],"pp ":[653,136,1543,40,341,100],"ppa":[1927,653],"ppe":[523,131,86,61,86,64,280,56,75,17,120,145,2,59,293,97,619,78,215],"ppi":[300,1523,452,329,597],"ppl":[202],"ppo":[2520,444,44,8],"pra":[2769,627],"pre":[51,407,604,343],"pri":[245,106,547,198,225,339,408,374,87,283,366,176],"prl":[3287],"pro":[357,824,1191,641,390],"pru":[2016,167,365,228],"pry":[325,1761],"prz":[233,321,75,116,73,240,1137,170,10,92,189,425,341],"ps ":[195,1249,1609],"psi":[1369],"psk":[709],"pso":[1654,854],"pst":[2840],"psz":[1974],"pt ":[463],"pta":[1921,222],"ptu":[1411,1936],"pu ":[474],"puc":[2039],"pud":[658],"pug":[34],"pul":[3133],"pum":[3287],"pur":[3087],"pus":[1212],"put":[1010],"puu":[2625],"puy":[59,2884],"puz":[2149,1323],"pyc":[2946],"pye":[3324],"pyl":[2952],"pyr":[2081,912],"qua":[2020],"que":[128,292,156,12,37,752,47,117,162,123,24,45,154,128,108,398,357,18,392],"qui":[98,209,528,385,44,163,932,640,376],"quo":[1684],"qvi":[1790,396],"ra ":[23,59,10,5,14,22,3,22,28,3,10,67,10,7,41,1,57,189,35,38,6,18,64,114,25,20,13,1,1,6,17,16,2,8,66,69,9,26,9,94,24,13,81,4,126,57,26,6,55,32,37,8,47,122,19,3,52,7,78,1,123,48,88,2,13,69,44,52,29,21,118,37,7,9,96,11,71,90,107,22,26,62,44,17,11,3,7,9,14,6,84,37,17,3,16,24],"raa":[733],"rab":[671,21,570,104,898,419],"rac":[32,104,455,2,126,103,56,291,693,174,99,148,134,323,529],"rad":[90,73,15,25,34,213,150,221,116,80,43,54,190,35,156,198,106,115,553,43,227,32,40,9,441,33,104],"rae":[1624,731],"raf":[283,270,974,52,115,427,277,71,519,62,60,140],"rag":[888,113,388,372,162,416,606],"rah":[22,216,16,356,505,8,568,50,593,210,413,122,191],"rai":[76,31,75,43,105,110,343,91,196,83,66,324,324,372,377,172,354],"raj":[119,24,2542,219,129],"rak":[417,304,328,39,342,492,184,234,195,360,288],"ral":[39,290,44,60,434,48,127,15,90,327,174,57,350,168,79,144,88,145,166,103,22,7,175,4,186],"ram":[107,98,64,16,29,291,36,102,158,266,101,10,361,185,71,578,114,171,364,21,4,60,108,71],"ran":[18,221,10,27,32,10,57,34,82,10,43,7,16,5,108,32,35,28,31,54,17,32,41,19,2,37,20,5,47,25,8,43,34,1,30,121,4,8,79,49,9,20,24,35,40,49,9,12,8,16,6,14,15,24,72,47,16,13,39,25,22,23,5,69,96,6,148,25,122,10,9,107,259,44,8,30,6,17,41,8,23,51,135,7,14,109,41,26,2,2],"rao":[3167],"rap":[753,834,852,105,420],"raq":[1424],"rar":[1148,831,723,347,244],"ras":[85,78,124,96,150,112,68,98,2,422,72,153,30,405,60,104,25,42,235,41,25,33,86,185,209,245,246,2,31,2,15],"rat":[381,643,132,254,59,192,7,156,208,447,791],"rau":[254,87,20,470,420,44,285,283,63,230,140,245,711,48],"rav":[49,263,126,5,1514,1160],"raw":[1067,1359,222,161,366],"ray":[683,466,492,293,1136,19],"raz":[667,236,140,79,360,75,70,395,223,293],"rb ":[1338],"rba":[133,132,24,36,57,344,67,22,97,189,127,337,382,228,112,178,168,53,375,402],"rbe":[701,459,528,502,41,440,103,361,64],"rbi":[1347,32,85],"rbo":[606,1477,608,138,560],"rbr":[320],"rbu":[1128,1923,52],"rby":[580,2019],"rc ":[456,441,227,37,173,629,165,115,280],"rca":[1438,320,1227],"rce":[811,563,601,412,94,961],"rch":[352,266,96,429,1063,102,36,419,226,152,74,203],"rci":[93,115,38,205,24,79,50,14,114,6,79,38,126,76,107,356,79,11,198,206,38,464,39,245,7,23,114,28,95,55,127,137,4],"rck":[1515],"rco":[166,498,298,271,116,287,226,491,297,147,16,3,398,88],"rcq":[2189],"rcu":[512,1907,476],"rcy":[20],"rcz":[212,402,390,207,72,213,100,8,448,182,235,139,304,64,162,49,159],"rd ":[50,1,47,122,10,25,19,37,2,9,100,55,135,51,72,24,40,9,20,48,4,92,1,175,24,16,86,29,68,150,8,15,101,64,34,409,27,159,57,83,28,69,14,24,89,58,7,64,18,93,9,16,23,59,43,201,68,51,6],"rda":[0,312,850,86,13,329,30,50,452,21,18,11,1204,35],"rde":[10,797,222,18,70,18,225,138,90,211,374,419],"rdh":[2446],"rdi":[159,45,214,42,24,140,241,12,1902,327,108],"rdo":[48,60,27,174,167,328,444,306,344,219,42,26],"rds":[74,1922,183,1301],"rdt":[1075,1216],"rdu":[2693],"rdw":[1516],"rdz":[63],"re ":[104,19,67,263,69,7,51,73,129,372,117,24,91,11,212,31,456,172,243,46,70,38,15,16,22,72,51,29,30,27,3,36,42,68,11,70,159,85],"rea":[58,26,78,203,72,305,321,174,217,162,186,201,87,38,130,171,75,33,92,107,315,149,29,149],"reb":[1168,17,845,46,81,350,106,456],"rec":[342,122,598,632,241],"red":[105,1,110,56,22,164,105,22,346,275,14,29,97,485,30,138,121,14,11,197,484,218,166,20],"ree":[30,1375,114,571,863],"ref":[683],"reg":[135,49,530,68,98,213,101,508,78,338,217,738,169,96,10,2,11,38],"reh":[402,668],"rei":[69,112,49,173,58,66,200,149,102,41,79,1,228,92,102,187,110,21,184,46,156,580,127,10,80,343],"rej":[788,679,495,268,101,704,347],"rek":[68,49,54,73,284,120,91,221,43,71,195,201,289,1,146,19,55,274,7,58,158,10,106,15,295,13,155,343,30,12],"rel":[89,96,514,534,54,2,105,198,354,319,56,15,511,419,24,9,8,14,12,2,143],"rem":[352,379,260,32,237,803,76,39,282,542],"ren":[3,69,97,1,31,242,1,35,138,40,35,86,11,108,35,53,35,25,11,28,52,30,88,83,75,29,15,7,4,39,124,86,7,89,9,92,74,111,256,50,8,36,139,1,52,5,4,39,45,83,60,92,2,11,40,11,83,3,28,70,27,24,50],"reo":[1618,167],"rep":[1362],"rer":[18,13,70,413,1103,72,98,108,1155],"res":[109,393,87,163,22,11,178,127,264,47,157,253,98,35,163,39,72,4,64,235,75,21,52,266,54,311,14,133],"ret":[71,21,64,977,128,62,43,166,74,165,18,45,212,15,660,49,224,300,134],"reu":[353],"rev":[51,2343,374,302,78],"rew":[334,732,23,552,801,128,211,62,8,89],"rey":[1055,13,1030,432,116,218],"rez":[10,134,205,251,5,97,26,4,159,329,44,87,73,193,3,19,90,1344,32,25,102,20,48,7,66],"rf ":[64,223,3113],"rfi":[924],"rfs":[2576],"rg ":[24,23,49,161,175,42,161,292,19,7,17,101,106,6,24,295,20,17,54,117,15,779,81,100,141,188,115,16,64,4,122],"rga":[682,106,263,245,797,153,356,789],"rge":[47,116,63,119,71,1,100,181,244,86,40,24,281,77,4,504,1,1,45,32,33,19,36,23,200,276,736],"rgh":[241,972,32,221,327,1210,209],"rgi":[389,474,279,125,284,67,85,382,131,1,111,106,67,292,18,79,39,18,3,166,36,30,45],"rgk":[1896],"rgl":[1682],"rgo":[1034,59,462,589,473,308],"rgr":[1366,166,1489],"rgs":[873],"rgu":[3170],"rgy":[1196,2188],"rha":[1303,241,389,916],"rhe":[1146],"rhi":[2546],"rho":[1585],"ri ":[59,138,214,37,21,70,58,47,82,78,40,131,28,24,37,16,39,8,35,42,18,8,62,134,1,112,264,35,141,19,56,182,109,66,108,106,91,41,229,254,212,31],"ria":[89,39,7,23,23,29,8,86,32,10,35,84,103,14,146,10,166,4,3,137,157,71,32,5,46,31,59,92,66,64,16,2,7,10,9,20,19,42,1,33,17,35,6,20,9,37,85,41,16,78,6,26,21,7,25,5,20,15,8,195,93,19,30,21,35,35,23,52,43,22,160,3,67,19,27,43,11,26,4,36,36,47,4,25,36,40,14],"rib":[811,1131,285,4],"ric":[98,11,20,8,9,42,35,78,20,6,66,23,55,6,2,18,88,47,71,65,31,9,20,144,17,22,127,68,68,37,3,5,128,69,9,60,6,32,22,64,34,19,10,15,8,17,157,9,18,112,9,9,16,17,20,21,39,30,27,99,52,44,98,129,94,97,12,22,32,18,6,93,86,16,51,131,34,62,8],"rid":[168,72,106,158,41,311,28,182,182,72,9,520,232,204,138,43,10,12,598,17,223],"rie":[76,48,86,5,1,45,7,1,48,34,91,55,14,61,37,42,45,1,6,64,45,8,144,1,13,2,9,47,39,8,4,9,12,30,10,154,7,12,32,94,31,50,102,574,189,26,47,95,112,3,257,42,266,104,17,38],"rif":[1764],"rig":[112,164,192,326,39,53,113,142,112,20,3,551,61,66,119,160,251,309,17,231,25,195,114],"rih":[756],"rii":[245,653,1631],"rij":[1157,330,395,759,779],"rik":[41,65,69,99,3,13,4,74,20,154,39,117,121,17,48,157,154,45,9,612,54,30,89,16,253,12,158,353,202,182,121,99],"ril":[837,601,398,53,814,203],"rim":[316,96,1136,1386,26],"rin":[70,8,63,23,11,256,51,17,77,1,6,51,4,55,50,254,37,45,55,4,37,18,143,16,91,19,41,157,35,160,76,14,18,98,7,4,74,7,97,34,46,3,10,44,55,74,37,5,43,5,56,76,46,2,82,186,7,93,129,30,12],"rio":[80,262,79,33,43,217,7,112,23,322,45,73,213,36,95,13,78,289,64,166,281,61,271,19,127,188,115,69,100],"rip":[2281],"riq":[625,752,518,788],"ris":[10,14,22,81,16,5,2,41,19,24,44,19,1,34,73,10,37,46,9,22,44,2,32,8,15,12,24,4,6,20,14,38,17,91,8,63,1,73,70,29,55,44,108,11,40,7,27,1,16,35,13,24,109,24,1,112,59,2,56,9,25,21,54,76,20,20,28,10,87,19,22,43,23,30,87,73,17,14,89,21,43,26,18,13,30,17,20,44,261,6,41,32,21,62,56,39,38,65,7],"rit":[679,70,31,56,305,144,131,489,62,57,283,18,303,365,32,39,147,1,16,118,45],"riu":[4,74,361,499,21,46,68,59,44,156,95,7,57,500,36,285,53,173,204,173,140,129,134,130,21],"riv":[348],"rix":[54],"riz":[156,48,713,739,264,186,91,558,369,219,76,48],"rja":[431,61,1300,75,450,527,78,94],"rje":[543,426,1263],"rju":[411,1661],"rk ":[213,39,25,700,49,457,55,198,182,129,210,5,43,180,109,179,88,362],"rka":[224,448,722,155,177,196,91,295,346,263,291,155],"rkb":[1936],"rke":[515,366,335,120,110,1147,22,284],"rkh":[2485],"rki":[182,109,966,296,36,1575,188],"rkk":[385,28,147,1366,72,568],"rkm":[1313],"rkn":[2842],"rko":[1005,1243,158,22,23,58,125,654],"rks":[1655],"rku":[396,734,161,2078,81],"rl ":[607,234,1431,973],"rla":[913,1518,831],"rle":[86,24,597,928,89,487,422,7,423,34],"rli":[394,291,51,816,16,167,262,537,294,141,363],"rlo":[136,278,314,141,235,12,137,20,71,27,17,116,488,27,68,787,269,48,96,103],"rls":[1767,271],"rlu":[1476,574,206],"rly":[2630,426],"rm ":[718],"rma":[2,332,3,52,141,190,52,88,522,66,8,182,59,20,53,196,123,14,279,51,16,287,60,141,95,121,8,20,94,29],"rme":[59,70,15,387,440,37,193,629,376,24,29,357,126,61,211,82],"rmi":[11,35,489,1476,49,188,206,70,813],"rml":[1678],"rmo":[705,249,566,264,386,582,7,283],"rms":[2389],"rmu":[11,760,466,61,88,455],"rn ":[1202,212,563,686,45,289],"rna":[51,108,63,342,74,7,121,14,55,96,30,13,79,26,215,345,34,151,84,98,53,26,67,2,31,30,142,113,16,16,147,158,199,128,251],"rnb":[96,989,1949],"rnd":[761,71,2146],"rne":[76,101,76,22,108,245,130,229,222,68,216,324,345,60,47,5,305,1,51,229,10,331,137,144],"rni":[559,261,114,592,269,1170,87,196,1,36,130,7],"rnj":[1201],"rno":[1012,599,757,352,319],"rns":[821,998,234,405,918],"rny":[1445,612],"ro ":[131,43,110,5,31,113,212,41,57,67,59,149,172,1,19,144,111,10,14,37,22,38,31,292,31,2,221,43,79,140,39,421,67,80,130,153,60,9,2,53],"roa":[545,862,976],"rob":[77,131,30,116,118,66,17,39,182,116,27,67,119,47,42,14,80,236,67,28,80,101,314,9,24,41,10,6,17,39,33,20,11,52,74,120,7,62,38,15,259,51,184],"roc":[481,43,657,1099,350],"rod":[169,94,13,723,77,177,20,3,139,56,417,101,42,416,37,309,17,63,502],"roe":[321,162,1485],"rof":[2395,397,221],"rog":[208,262,458,8,1289,809,417],"roh":[990,151,53,228,1926],"roi":[12],"rok":[67,3277],"rol":[100,34,23,33,40,68,282,83,160,20,35,228,34,104,35,100,210,86,132,97,104,203,15,37,441,112,372,50,26,187,31],"rom":[19,195,11,69,69,227,23,7,307,136,11,61,33,142,33,3,8,34,328,56,53,151,2,44,4,143,658,89,102],"ron":[27,35,20,12,263,42,148,385,8,78,6,107,118,23,100,31,79,17,178,10,190,117,50,5,28,2,1,180,70,41,18,58,11,34,12,21,87,32,173,94,246,254,14,46],"roo":[2782,523],"rop":[2196,67],"ror":[1620,326,1286],"ros":[176,45,11,61,48,33,119,33,82,61,25,151,14,15,16,15,13,40,71,21,12,58,77,41,19,68,73,26,60,28,135,8,37,165,104,39,36,4,45,6,5,20,44,26,41,83,126,96,39,2,11,103,56,76,14,196,72,18,223,17,68,1,6],"rot":[356,319,28,227,505,176,205,71,164,36,285,48,175,27,276,178,152,177],"rou":[175,420,370,354,630,648],"rov":[535,180,460,254,121,65,106,954,261,178,289,22],"row":[79,468,23,17,59,273,22,89,65,229,235,44,248,490,266,35,111,84,14,20,185,323],"roy":[674,1077,27,315,202,580,38,98,339],"roz":[1264,242,217,1323,123],"rpa":[189],"rph":[591,519,718],"rpi":[1395,978,452,515],"rpr":[1405],"rpu":[474],"rqu":[835,868,123,1173],"rr ":[1385,138,148,242,1453],"rra":[18,140,510,422,25,192,320,14,20,163,110,45,80,558,413,59,150],"rre":[18,53,18,46,55,163,375,152,175,29,6,76,54,166,303,40,166,18,215,130,338,21,224,86,26,41,14,42,26,140,74],"rri":[511,712,96,705,180,214,244,181,25,118,359],"rrm":[720,977,392,1186,29],"rro":[27,659,504,369,192,153,322,59,586],"rrs":[3188],"rru":[1489],"rry":[42,41,1109,205,873,505,83,16,166],"rs ":[268,7,127,2,38,173,146,20,48,7,37,26,21,28,321,31,109,51,20,260,38,28,352,71,60,46,102,264,97,67,67,207,87,209],"rsa":[3188],"rsc":[1566,180,33,1392],"rsd":[511],"rse":[542,358,141,427,400,888,352,205],"rsg":[778],"rsi":[509],"rsk":[224,95,359,31,88,228,120,186,24,56,263,339,205,130,4,111,197,131,128,19,257,152,101],"rsl":[2729],"rso":[226,768,989,374],"rss":[861,382,169,503,1358],"rst":[61,233,37,8,46,312,9,108,34,122,437,318,86,67,275,230,63,220,18,257,34,49,304],"rsz":[647,391,1386],"rt ":[61,16,107,142,229,30,9,19,6,41,116,26,43,18,29,5,22,100,24,55,7,47,8,22,12,14,23,57,74,88,169,80,46,2,28,25,64,55,145,50,73,3,8,46,49,20,11,8,44,2,53,19,55,13,11,20,21,69,16,16,157,12,162,29,29,84,26,16,13,159,35,71],"rta":[192,215,214,47,37,506,336,404,22,905,309,111,27,53],"rtb":[1734],"rtc":[2910],"rte":[90,160,3,264,779,136,20,435,411,298,162,105,10,534],"rth":[586,76,111,396,48,533,431,371,328,53],"rti":[6,174,6,75,4,198,33,64,2,63,26,16,41,138,134,76,60,23,44,70,84,3,4,95,84,28,95,107,37,15,30,5,39,122,7,49,23,113,94,9,35,117,38,44,26,54,47,20,18,134,99,78,89,32,95,35,5,12,5],"rtk":[558,1703],"rtl":[421,46,90,45,512,85,270],"rtm":[3364],"rtn":[1155],"rto":[15,3,7,37,273,134,517,452,86,191,22,139,116,73,92,64,140,195,136,115,261,39,187,40,56],"rts":[160,78,576,1333,57,99],"rtt":[1494,62,1264],"rtu":[391,686,121,4,129,39,520,109,1181,255],"rtw":[2476],"rty":[324,2524],"rtz":[527,1211,973,271],"ru ":[763,281,253,212],"rua":[3240],"rub":[370,521,165,433,557],"ruc":[1105,183,1105,497,170,229],"rud":[368,96,26,126,6,294,779,387,232,304,580],"rue":[1344,284],"rug":[625,725,301],"rui":[350,749,122,55,97,23,1106,628,271],"rul":[882],"rum":[310,414,940],"run":[13,124,2,118,774,126,83,8,160,608,72,357,103,3,403,70,293],"rup":[1200,378,196,776],"rus":[199,2,1151,85,345,557,187,250,535,102],"rut":[272,461,166,765,22,1611,186],"ruu":[2183,1061],"ruz":[556,1173,629,592,22],"rv ":[168],"rva":[38,951,346,97,135,318,438,128],"rve":[681,1002,80,553,400,149],"rvi":[823,808,50,188],"rvk":[2251],"rwa":[3087],"rwi":[695,1277,1065],"rwo":[234,1136],"ry ":[21,21,24,5,12,296,110,24,61,549,69,83,122,200,105,201,43,229,95,166,152,187,83,16,116,50,253,45,57,32],"rya":[200,208,418,1604,44,291,530],"ryc":[197,514,401,171,803,117,241,613,106],"ryd":[8,411,180,766,402],"ryg":[1378,1177],"ryk":[8,258,1095,1748],"ryl":[2886],"rym":[325,1517,959],"ryn":[8,2663,308,211,251],"rys":[220,93,109,130,560,76,82,75,26,147,11,72,363,71,108,310,314,35,60,331,219],"rz ":[292,106,203,32,801,278,25,78,22,251,53,69,32,62,102,171,25,4,589],"rza":[53,14,443,27,67,25,162,755,89,198,327,475,93,38,25,93,54,248,201,90],"rzb":[1183],"rzc":[369,992,485,1590],"rze":[17,56,45,101,14,59,75,91,83,46,14,28,4,10,102,17,40,14,52,67,80,17,37,173,40,129,90,118,71,22,5,20,24,54,87,75,37,19,59,49,58,11,32,62,70,1,2,29,37,24,10,100,13,12,4,50,34,27,59,239,66,4,110,24,101,102],"rzi":[741,1397,133,739],"rzo":[1391,1262],"rzs":[1051],"rzu":[223],"rzy":[17,48,16,18,78,50,96,69,36,126,163,99,2,44,196,11,32,43,7,34,15,122,35,21,13,79,9,103,16,178,40,47,58,79,55,69,71,13,33,88,23,8,5,26,29,24,19,144,53,14,17,49,45,77,26,4,5,72,46,5,79,119,1,18,10,140,28,28,13],"sa ":[45,302,261,47,119,189,1,138,5,77,16,9,18,174,23,143,342,309,9,104,8,63,3,116,7,305,112,96,93,58,215,74],"saa":[391,314,17,1271],"sab":[158,59,288,79,8,232,310,83,512,164,86,80,40,357,28,18,268],"sac":[232],"sad":[2422,757],"saf":[2364],"sah":[162,1136,271,1237,406,123],"sai":[430,2103,347,218],"sak":[155,2011,818,275,121],"sal":[141,154,234,53,100,70,248,364,112,146,120,184,44,110,80,245,92,71,460,288],"sam":[280,577,256,309,1111,887],"san":[92,39,15,45,20,176,117,116,70,35,3,4,11,23,11,94,35,57,20,25,6,161,29,6,8,11,175,73,9,64,43,57,69,32,67,90,98,23,27,93,44,124,108,27,76,23,23,1,4,45,53,133,16,33,30,116,37,74,56,16,5,7,6,40,36,40,11,1,38,51,24],"sap":[303,1174],"sar":[175,63,16,162,454,77,176,142,426,80,325,448,199,214,157,129,10,17,12,157,25,17],"sas":[298,808,436,267,1579],"sat":[365,775,563,857],"sau":[90,178,1235,303,68],"sav":[413,766,461,1435],"sax":[3296],"say":[314,2154,555],"sba":[1261],"sbe":[69,804,852,231],"sby":[3322],"sca":[78,57,244,572,464,67,106,148,132,5,35,112,298,1077],"sce":[1103,1469,417],"sch":[22,15,8,9,38,9,6,11,4,71,12,49,34,16,27,57,5,5,105,200,37,1,5,52,15,18,10,54,15,26,10,30,109,1,142,75,17,1,95,74,76,45,168,9,23,59,135,167,29,8,82,18,72,100,22,23,69,42,8,21,54,5,20,82,18,53,26,86,33,37,64,14,13,53,4,43,134,49],"sci":[817,667,262,153],"sco":[239,37,42,44,47,278,63,51,36,40,23,17,167,106,156,8,246,10,114,174,110,11,6,312,7,45,121,79,287,52,36],"scr":[2227],"scu":[2387,703],"sda":[1699],"sde":[511,128],"sdo":[287,2624],"se ":[48,60,27,14,50,147,4,58,46,102,198,13,6,97,4,11,33,13,68,9,82,9,9,15,104,175,35,89,5,183,112,169,85,13,7,12,29,60,21,44,208,48,37,136,111,149,15,59,71,24,37,77,18,35],"sea":[2181,571,426,7,111],"seb":[14,382,190,399,66,374,715,134,21,78,28,9,30,83,301,90,358],"sec":[1160,417],"sed":[147],"see":[518,2811,101],"sef":[459,408,101,213,748,503,367,211,253,114,3],"seg":[1673,41],"sei":[770,2307,191],"sej":[1822],"sek":[165,899,225,206,209,728],"sel":[121,5,75,270,30,635,406,126,69,133,188,121,86,676,20,147,2,162,39],"sem":[716,714,219,1205,547,26],"sen":[99,110,130,2,104,62,26,1,8,28,11,117,230,24,17,72,9,5,65,19,38,176,115,100,87,154,59,10,50,17,10,3,60,20,267,51,59,76,82,76,20,63,24,140,12,12,20,194,179,55,4,4,102],"sep":[801,486,92,120,139,6,2,59,390,107,73,517,409,187],"ser":[0,164,222,17,13,27,110,9,12,71,38,110,219,11,67,70,68,77,23,114,228,33,121,282,19,377,44,146,101,83,74,166,36,30],"set":[652,248,1628],"seu":[2228],"sev":[1034,426,57,958],"sey":[586],"sfe":[1762],"sfo":[50],"sge":[1688],"sgo":[68],"sgr":[778],"sh ":[1258,1901,254],"sha":[240,159,58,483,574,67,238,1,685,871,1],"shc":[1486],"she":[240,1298,1050,535],"shi":[580,422,1517,225],"shk":[2550],"shl":[2765],"shn":[1550],"sho":[161,450],"sht":[3202],"shu":[209,1166,1461],"shv":[597],"shw":[1169],"shy":[1345,229,279],"si ":[236,210,30,33,414,322,21,1049,22,350,132,210,81],"sia":[145,74,872,450,369,367,35,527,23,226,228,27],"sic":[579,1244],"sid":[3301],"sie":[308,56,37,259,131,187,391,40,38,151,584,96,72,90,23,231,110,31,79,404,1,11,132],"sig":[74,94,178,1644,486,16],"sii":[418,1156,1472],"sik":[283,514,555,524,871],"sil":[49,535,534,8,69,30,61,543,27,156,354,26,60,75,29,40,25,76,126,163,196,80,53],"sim":[361,478,156,148,225,104,179,141,165,91,36,325,139,76,60,241,52,17,277],"sin":[131,45,139,185,196,293,88,60,230,22,16,405,232,4,221,94,51,54,412],"sio":[2,506,172,394,225,408,227,499,176,525],"sir":[189,939,503,90,1224],"sis":[229,321],"sit":[12,362,1294,568,223,1020],"siu":[1235],"siw":[566,507,595],"sjo":[1488,279,856],"ska":[64,50,62,42,11,2,40,24,13,17,31,4,106,104,45,2,6,48,4,17,17,20,96,36,24,45,37,31,32,15,3,1,46,56,6,14,99,40,7,13,18,35,76,25,62,36,183,33,35,128,21,33,20,41,63,64,15,123,83,39,2,47,2,12,116,6,5,108,24,6,4,9,73,7,10,10,8,7,17,2,41,2,16,66,41,71,10,20,14,1,17,51,32,10,2,15,45,7,61,8],"ske":[1153,360,30,1379,317,16],"ski":[1,16,71,7,22,15,6,4,1,35,46,3,6,63,17,6,20,4,16,21,3,31,10,15,31,3,7,20,36,21,1,7,1,21,14,21,11,16,9,20,53,5,3,6,10,4,17,21,3,2,49,4,37,4,23,14,2,15,9,46,54,8,2,4,4,1,33,34,7,36,48,11,13,15,9,41,6,24,6,3,6,1,28,12,33,16,13,6,13,9,48,29,1,20,13,3,4,55,38,62,2,1,3,29,6,17,5,34,31,30,54,5,22,42,59,2,15,13,24,8,23,32,81,34,6,9,4,8,2,10,21,10,4,15,36,7,9,6,39,6,17,22,14,16,7,42,4,25,6,26,23,11,2,16,2,5,22,11,43,1,35,4,23,24,7,5,16,2,46,18,107,44,11,23,31,16,27,48,84,12,7,1,4],"sko":[172,208,1072,200,1416,361],"skr":[227,904,1342,764],"sku":[2329,28],"sky":[1025,181,56,250,836,502,625],"sl ":[3043],"sla":[57,6,31,127,8,4,2,2,92,156,8,20,11,34,50,61,25,42,39,70,14,78,19,11,1,25,3,20,13,33,195,3,65,30,106,34,1,16,21,72,42,101,29,20,46,3,11,50,7,122,4,51,25,52,8,134,65,9,7,18,27,26,70,52,2,70,113,70,13,3,5,52,133,32,4,20,31,8,202,3,14,62,1,2,10],"sle":[109,333,370,1184,21,202,193,169,148,356,28],"sli":[573,1418,125],"slo":[314,139,1547,1038],"slu":[2509],"sma":[1018,610,41,170,307,86,502],"sme":[401,718,725,654,86],"smi":[334,429,105,347,630,452,423,211,6,358],"smo":[2935,328,203],"smu":[533,767,655],"sna":[2536,218],"sne":[1439,738,37,1231],"sni":[1359,650,1127],"sno":[3140],"sny":[2242],"so ":[19,15,450,674,39,224,181,182,1003,364,288],"sob":[111,877,282,706,425],"soc":[541,11],"soe":[1593,37],"sof":[1754,462,870],"soj":[2004,342],"sok":[1612],"sol":[7,176,319,545,69,1143,419,25,263,127,215,145,26],"som":[1643],"son":[74,59,27,66,55,52,64,216,29,136,83,23,81,29,39,54,156,9,54,2,60,44,159,18,11,26,28,4,27,6,76,94,51,3,14,22,8,24,5,8,38,30,121,3,47,8,17,97,61,19,35,36,55,22,15,3,32,37,17,38,41,4,6,21,44,48,221,52,46,43,20,33,25,10,63],"sop":[1518,977,739],"sor":[78,175,141,87,176,422,333,97,1490],"sos":[2536,600,4],"sot":[1524],"sou":[12,1151,239,547,132,41,1193],"sov":[665,822,180,672,115],"sow":[218,336,693,83,518,568,468,107,193],"soy":[2255,364],"spa":[615,759,719,65,71,140,844],"spe":[581,460,315,528,74,55],"spi":[374,295,295,89,777,145,146,576,758],"spl":[619,2855],"spo":[509,276,295],"spr":[629,1439,127,177],"spu":[2625,462],"spy":[2081,865],"squ":[1264],"sqv":[2186],"srb":[1338,745],"sro":[1471],"sru":[368,548],"ss ":[46,268,212,486,222,31,133,354,14,187,713,112,64,589],"ssa":[131,524,88,467,8,186,998,3,20,154,98,421,366],"ssd":[287],"sse":[201,185,115,32,41,199,97,307,51,77,23,25,49,35,105,26,241,146,40,310,344,205,54,12,41,139,85,87,39,167],"ssi":[374,27,45,234,159,84,72,142,129,206,179,172,643,353,210,81,352],"ssl":[109,2303,631],"ssm":[1669,175],"ssn":[1439],"sso":[74,59,27,482,136,83,23,81,122,76,80,9,56,60,44,214,32,109,94,54,14,105,151,50,8,173,21,58,304,313,72,69,20,33,25],"ssu":[2132],"ssy":[2743,192],"st ":[61,290,137,13,196,112,12,26,33,10,511,6,383,52,38,16,39,118,93,40,66,127,4,63,72,148,30,303,315],"sta":[2,15,7,43,143,25,8,43,30,20,22,13,12,26,414,2,23,101,47,20,26,39,84,46,27,61,56,89,58,16,40,14,33,21,61,41,66,47,20,46,100,112,26,31,215,82,22,72,7,23,243,36,7,23,222,85,64,38,13,27,94,17],"stb":[3145],"ste":[31,29,15,12,4,27,1,2,33,13,13,52,5,78,16,8,76,12,9,12,55,22,58,43,64,124,1,46,44,22,19,21,3,10,48,12,10,35,97,48,41,35,56,66,40,5,57,36,19,11,18,20,23,58,10,66,20,3,18,46,61,108,3,14,2,38,28,21,54,28,3,15,3,16,91,15,1,6,70,27,13,40,48,18,51,20,12,19,8,4,14,1,106,6,40,2,12,2,43,18,9,7,13,94,24,55,72,69,7,82,49],"sth":[187,765,1415,355,111],"sti":[10,4,10,28,75,16,5,43,43,5,12,27,19,1,34,53,11,12,90,9,79,21,35,24,10,20,10,42,17,83,16,51,13,57,16,70,9,20,12,43,163,47,44,16,32,69,9,67,11,2,27,14,71,151,66,53,32,78,33,73,32,29,4,17,15,63,28,9,8,22,51,31,1,88,108,13,27,20,20,25,90,92,18,180,17,51,89,110],"stj":[1690],"stk":[1961],"stl":[1061,540],"sto":[130,322,116,40,22,40,11,76,99,134,209,56,31,21,86,41,47,70,56,181,114,85,110,1,3,161,69,12,6,230,29,115,34,193,96,40,76,59,64,179],"stp":[1172],"str":[32,237,25,326,79,228,28,115,318,87,679,109,126,71,6,78,272,11,79,54,55,254,57,94],"stu":[508,222,1391,428,179,10],"stv":[661,535,1491,279],"stw":[2659],"sty":[114,1156,694,51,20,607],"su ":[2142],"sua":[1424,193,22],"sub":[1880],"suc":[709,202,200,41,1828],"sud":[125,2313],"sue":[179,2366,573],"sul":[935,1364],"sum":[2132,666],"sun":[280,1134,223,1318],"suo":[347,2639],"sup":[357],"sus":[223,281,221,41,1584,225,284,30,262,21,28,122,1],"sut":[2690,83],"suv":[695],"suw":[1595,242],"suz":[355,1364,607,233],"sva":[1561,1855],"sve":[1006,762,467],"svi":[481,1393],"swe":[2239,274],"swi":[58,23,1574,1302],"sy ":[2642,293,158],"syl":[80,168,926,299,593,52,201,216,433,19,32,313,12],"sym":[213],"syo":[2743],"syp":[2286],"syr":[3016,26],"syv":[1468],"sz ":[3,1,21,86,21,92,166,34,15,2,59,36,1,1,41,166,8,47,3,15,35,80,5,6,15,46,17,10,26,15,59,44,13,112,63,30,5,35,2,55,58,63,50,64,11,127,127,22,14,103,3,31,45,99,4,42,7,4,125,48,4,1,47,22,42,7,13,38,30,7,73,93,2,22,10,106,114,15,50,31,19,34,22,108,21],"sza":[220,93,109,295,456,15,183,158,75,448,91,231,65,328,18,627],"szc":[25,35,1241,134,44,495,176,432,270,249],"sze":[75,57,147,113,110,176,279,505,204,132,74,9,29,76,213,84,80,323,24,143,35,14,390,144,8,26],"szi":[3051],"szk":[328,101,300,286,80,356,131,160,301,334,270,14,7,235],"szl":[340,370,85,713,1247,17],"szm":[2767],"szo":[358,874,93,600,239,677],"szp":[1461,79,1804],"szt":[99,329,282,152,176,106,41,378,295,197,69,84,33,88,23,68,24,163,25,28,14,17,49,122,153,203,29,168,28,13],"szu":[55,592,169,222,1386,166],"szw":[212],"szy":[120,146,157,194,41,81,112,115,507,452,143,649,59,309,145],"ta ":[19,5,9,20,14,73,57,13,12,9,38,76,11,27,24,2,16,105,13,74,4,4,50,17,2,18,79,34,13,19,14,38,8,13,59,24,32,13,3,27,30,18,5,70,28,91,2,56,47,49,11,51,1,48,69,39,21,74,8,4,6,17,88,30,22,78,26,10,15,43,162,18,24,53,51,121,61,13,94,49,64,22,1,6,20,1,33,36,203,10,33,69,9,27,9,9,4,40,5,68,17],"tab":[293,732,1185,138,423,270],"tac":[3277],"tad":[316,17,57,34,244,37,118,30,80,625,50,233,632,69,207],"taf":[1165,337,124,102,133],"tag":[437,1290],"tah":[2007,1160,161],"tai":[597,352],"tak":[2143],"tal":[192,11,25,15,43,20,47,472,170,523,266,335,117,215,129,197,24,39,538,51],"tam":[303,144,281,120,820,240,562,589,69,25,62],"tan":[67,72,17,79,101,35,625,6,14,26,39,38,101,18,34,83,71,80,66,33,82,81,3,59,77,43,226,57,11,2,116,29,183,23,279,7,121,72,137,142,94],"tap":[382,505,557,350,29,357,895,223],"tar":[17,160,146,304,90,237,197,24,55,5,87,49,20,207,463,399,3,6,316,77,247,110,7],"tas":[0,2,637,385,203,72,201,426,329,220,20,10,74,182,667,38],"tat":[2567],"tau":[406,1094,553,422,286],"tav":[436,2470,409],"taw":[358,853],"tay":[626],"taz":[1081],"tba":[1734],"tbe":[3145],"tca":[2293,617],"tch":[399,868,1460],"te ":[167,39,137,72,136,149,34,15,1,44,15,77,167,208,135,57,10,134,106,6,103,15,43,3,14,67,13,18,61,136,11,13,32,124,10,110,4,5,1,4,30,61,112,59,36,31,95,50,55,41,136,9,4,64,69],"tea":[1010],"teb":[253,1469,352],"tec":[75,906,1382,301],"ted":[583,254,1435,210,69,50,51,230,573],"tee":[539,348],"tef":[60,94,161,133,55,312,225,10,35,145,76,260,30,61,175,272,28,247,6,318,8,19,166,63,29,118,127,69,7],"teg":[819,98,515],"tei":[118,1,742,119,291,41,156,472,853],"tej":[1191],"tek":[428,224,2415],"tel":[36,49,20,83,184,64,116,486,24,286,24,242,340,541,368,10,16],"tem":[250,1508,1295,336],"ten":[39,292,8,114,64,297,156,58,268,73,83,273,86,67,52,293,75,18,165,8,111,21,63,257,34],"teo":[1197,278,1192],"tep":[87,4,76,70,190,98,421,21,395,66,206,157,23,393,46,202,217,170,42,14,118,424],"ter":[31,84,14,41,10,9,4,39,15,40,87,139,1,136,53,12,15,31,13,6,125,22,42,25,28,21,59,18,93,8,20,70,33,7,1,45,4,29,11,6,26,12,30,46,7,16,1,68,117,27,68,32,12,15,83,37,3,3,16,12,41,34,31,34,17,1,20,10,24,33,126,4,68,14,60,37,13,70,9,112,31,31,70,14,9,4,14,12,5,65,41,3,26,67,45,102,30,78],"tes":[90,364,2142,207,51,553],"tet":[397,1397,1339,258],"teu":[537,93,556,3,50,135,3,235,837,41,488],"tev":[121,505,64,755,85,409,644,146,353],"tew":[1182,533,349,314],"tez":[2029],"tfr":[1353],"th ":[69,209,106,121,81,74,2,71,256,79,65,23,13,46,2,169,225,108,31,95,111,76,78,187,26,15,113,255,21,62,142,339,27],"tha":[164,529,8,33,545,45,194,137,405,129,91,101,34,18,134,723,101,47],"the":[9,178,7,140,179,63,65,242,69,241,143,270,247,369,145,466,47,53,29,364],"thg":[2037],"thi":[209,313,469,779,190,747,67,1,74,188,320],"thk":[1887],"thl":[2224],"tho":[43,142,22,225,33,33,97,43,220,95,57,199,39,171,23,56,156,26,52,37,33,15,95,53,106,123,229,27,151,30,53,21,17,19,260,24,18,150,10,82,77,76],"thr":[1945,339,387,483,259],"thu":[773],"thy":[1785,396,371],"ti ":[52,20,200,46,361,89,33,279,253,139,22,57,67,18,21,24,153,261,76,42,68,63,46,101,48,207,13,56,5,53,116,202,64,49,163],"tia":[6,8,129,51,40,44,19,35,64,1,11,178,104,20,38,17,163,184,206,91,5,11,78,224,67,84,42,99,10,78,86,81,4,95,28,9,30,51,31,210,47,20,25,90,159,43,17,228,110],"tib":[847,1097],"tic":[523],"tid":[381],"tie":[728,257,235,221,161,100,27,125,286,155,228,88,98,394,169],"tig":[1646,685,890],"tii":[168,775,389,1762],"tik":[656,287,1509],"til":[385,19,511,272,16,4,319,30,86,14,134,285,281,520,108],"tim":[200,456,95,461,457,242,471,324,285,226],"tin":[10,14,99,4,14,7,5,27,6,5,48,12,10,4,33,38,39,88,5,28,2,9,53,2,45,18,17,9,15,1,9,20,10,2,71,67,2,16,35,26,55,21,41,14,15,10,19,16,23,16,28,55,15,84,3,25,74,18,66,12,1,36,43,55,74,9,82,5,39,108,14,7,37,12,23,79,34,23,29,42,4,5,122,30,82,26,13,28,13,22,5,20,38,24,67,43,54,45,78,18,71,32,77,18,2,33,5,12,5,32,44,23,67],"tio":[921],"tip":[1613],"tir":[90,73,1085,749,914],"tis":[285,90,175,370,1,414,146,223,101,505,176,130,61],"tit":[1118,385],"tiy":[2438],"tiz":[1344,1783],"tj ":[3098],"tja":[1679,11,194],"tka":[838,1367,294],"tke":[13,1116,398,339],"tko":[114,175,269,117,874,219,193,79,221,159],"tky":[1410],"tl ":[421,46,135,512],"tla":[481,1471,965],"tle":[398,289,332,121,110,153,198,253,926,611],"tli":[1199,583],"tlo":[557,629,283],"tlu":[1061,1089],"tma":[1745,483,200,119,782,35],"tna":[1532,136,1005],"tne":[506,400,249,196],"tni":[81,1605,1600],"tno":[2324],"to ":[18,30,287,30,147,34,59,6,70,134,171,58,52,189,153,86,297,39,159,46,92,64,104,134,97,23,113,78,33,4,4,89,215,47,172,145],"tob":[326,746,1259,172,868],"toc":[130,647,213,446,127,429,1129],"tod":[1007],"toe":[2269],"tof":[99,329,428,6,282,41,870,69,84,33,88,23,68,24,163,53,14,17,49,275,203,29,168,28,13],"toi":[2002],"toj":[1987],"tok":[519,89,1786],"tol":[62,407,47,281,489,54,94,173,285,131,78,507,115,384,114,73],"tom":[34,32,66,167,146,39,54,11,196,8,47,3,181,48,269,32,31,35,125,138,288,36,144,3,242,168,47,71,51,356,166,7],"ton":[15,177,185,56,143,94,9,106,164,332,60,39,30,121,111,17,4,44,1,73,10,151,129,63,3,125,81,54,163,1,101,125,23,9,151,7,134,19,25,4,15,19,9,83,65,23,29,25],"too":[718,796],"top":[452,116,62,569,108,86,88,307,561,288,827],"tor":[7,16,73,240,193,60,168,140,108,50,35,181,76,128,76,260,178,29,80,399,20,79,21,61,79,57,86,50,11,47,38,40,230],"tos":[25,106,234,277,136,703,256,81,58,485,101,224,176,21,507],"tot":[1719,987],"tou":[102,2209,85],"tov":[1255,460,346,36,906,39],"tow":[1069,400,433,435,493,631],"toy":[1229],"tph":[1172],"tr ":[44,51,132,130,23,55,131,5,120,13,9,766,13,182,19,81,84,337,93,115,399,53,512,15,27,37],"tra":[32,111,126,7,36,29,76,16,280,8,234,214,181,140,207,260,68,392,98,29,135,492,98,7],"tre":[699,371,163,234,335,534,124,308,302,78],"tri":[54,156,67,44,158,60,182,47,12,200,158,300,107,85,15,86,64,17,41,231,22,2,18,74,39,30,197,159,93,188,37,17,39,184,11,119,13,93,1],"trn":[2154],"tro":[289,5,4,289,33,270,29,8,9,170,69,213,87,111,677,126,75,352,11,109,492],"tru":[1297,367],"try":[1283,62,1456,362],"trz":[510,292,267,322,817,807,421,41],"ts ":[238,331,220,25,366,967,57,99,101,94,232,207,358,11],"tsa":[1200,1117,135],"tsc":[92,296,2249,8,21,605],"tse":[716,296,812],"tsi":[12],"tso":[12,1937],"tss":[160,2025],"tsv":[1768],"tt ":[71,77,214,325,2,61,150,17,167,231,254,31,61,399,110,219,200,163,105,90,47,19],"tta":[269,76,644,129,23,191,56,280,56,363,262,692],"tte":[513,190,27,50,14,15,77,167,144,172,27,57,144,56,174,43,3,57,24,13,18,197,54,126,10,117,2,104,72,32,126,42,31,123,4,41,136,9,62,210],"ttf":[1353],"tth":[9,200,304,1257,937,67],"tti":[72,81,165,205,245,11,146,323,166,58,22,42,20,62,18,45,21,132,86,125,50,64,12,120,53,46,101,48,170,37,40,29,5,91,73,5,266,49,163],"ttk":[1129],"ttl":[687,453,263,451,926,137,474],"ttm":[2547],"ttn":[906,445,181],"tto":[642,136,208,874,159,42,276,433,130,527],"tts":[92],"ttu":[1184],"tty":[3269],"tu ":[2560],"tua":[2549],"tud":[2253],"tuk":[446,1412],"tul":[2365,373],"tum":[730,114],"tun":[152,134,898,14,801,659,522],"tuo":[509],"tup":[954,1167],"tur":[391,253,333,100,3,122,129,39,41,751,566,45,378,170,26,88],"tus":[25,483,1159],"tuz":[1890],"tva":[661,535,1491,279],"twi":[1917,559],"two":[2659],"txe":[3207],"ty ":[324,2182,342,421],"tyb":[1095,236],"tyl":[2822],"tym":[64,2915],"tyn":[114,1156,694,51,20,607,756],"tyo":[2097],"tz ":[127,183,217,193,116,350,552,167,637,86,83,94,56,40,47,34,11,80],"tza":[455,310],"tze":[1493,1877,85],"tzi":[1572,1584],"tzk":[259,1512],"tzm":[1217,2028],"tzn":[2110],"tzo":[921,2264],"tzs":[1416],"ua ":[1092,283],"uab":[1849],"uad":[2020],"uai":[3240],"ual":[1163],"uan":[690,225,16,165,177,68,5,35,712,127,511,182,462,15,11,78],"uar":[48,60,201,2,1113,193,22,910],"uay":[939],"ub ":[142,112,479,255,77,63,558,224,1082],"uba":[2046,338,393,153],"ubb":[2760],"ubc":[606,1332],"ube":[326,324,152,15,74,165,183,928,20,637,34,120,121],"ubi":[370,334,99,405,281,21,372,9,3,22],"ubk":[824],"ubl":[630,1250],"ubn":[248],"ubo":[229,13,592,739,494,982,416],"ubr":[680],"uc ":[1147,94,1565,335,285],"uca":[37,618,1703,221,883],"ucc":[1427,1634,89],"uce":[1105,428,860,896,136],"uch":[67,28,83,393,138,402,41,522,365,376,67,437,61,29,403],"uci":[16,464,185,228,18,969,388,304,123,265,13,148],"uck":[84,372,16,816,387,226,6,121,862,170,103],"ucl":[654],"uct":[1722],"ucu":[1150],"ucy":[1154,1051],"ucz":[2033,864,154],"ud ":[251,90,27,174,374,75,204,578,185,1411],"uda":[125,1404,744],"udb":[2357],"ude":[102,467,456,472,47,709,185,624,274],"udi":[52,466,404,63,314,132,156,81,27,24,410,468,105,87,15,12,213,138,190],"udl":[616,42],"udm":[1711,683,517],"udn":[3198],"udo":[464,26,428,1128,36,232,206],"udr":[13,57,309],"udt":[1585],"udv":[2747],"udw":[466],"udy":[1236],"udz":[622,1996],"ue ":[179,191,218,217,572,473,45,46,108,329,167,138,435],"uec":[394],"ued":[1628],"uee":[3450],"ueh":[3058],"uel":[223,126,21,50,31,93,32,28,30,104,41,136,84,57,102,127,59,78,2,8,105,91,1,47,75,83,160,30,234,134,56,128,464,29,42,68,1,56,85,52,2,42,62],"uen":[309,355,1529,909],"uer":[214,321,133,274,353,58,179,202,1,302,184,64,769,353],"ues":[488,1338,351],"uet":[625,1078,334],"uev":[451],"uez":[128,148,723,274,3,265,347,118,478,309,17,565,51],"uf ":[91,1074,290,986],"uff":[486,894],"ufi":[1909],"ufo":[820],"uft":[2368],"ufu":[1150],"ufv":[251],"ug ":[2412],"uga":[986,1289,234,564],"uge":[625,942,37],"ugg":[34,393,923,301],"ugh":[40,596,52,226,883,553,163,460],"ugi":[610],"ugl":[611,1249],"ugn":[2733],"ugo":[1933,760,591],"ugu":[3162],"uh ":[331],"uha":[822,1799,534,282],"uhi":[2923],"uhl":[1757,246],"uhm":[1280],"uhn":[1072,1800],"uho":[3354],"uhr":[2182,512],"ui ":[3079,88],"uia":[108,2150],"uib":[3073],"uic":[1645],"uid":[813,560],"uie":[98],"uig":[72,1295,109,170,54,471],"uij":[1190,994],"uil":[15,958,454,93,52,372,692,88,669],"uin":[830,5,385,176,963,1016],"uir":[1264,1247,46,874],"uis":[342,7,1,254,163,356,104,37,375,75,37,144,217,146,53,217,226,245,159,3],"uiv":[307],"uiz":[350,749,122,55,525,701,628,271],"uja":[108,220,1487,985,337],"ujn":[1833],"ujo":[3252],"uk ":[161,320,218,139,40,254,18,85,66,285,61,147,64,161,14,393,29,62,300,229],"uka":[111,323,66,79,239,341,36,188,53,230,201,297,448,210,92,25],"uke":[446,1373,722],"ukh":[1298,515,160,896],"ukk":[300,572,265,263],"ukl":[1391,42,1951],"uko":[231,641,1184,16,586],"ul ":[33,57,165,1,2,33,197,43,233,23,95,101,232,153,80,132,3,118,48,434,45,340,693,39,56,38],"ula":[12,63,16,265,275,16,15,376,183,406,383,289,61,3,61,56,258,354,222,37],"ulb":[853,116,1189],"ulc":[55,1302,1369],"uld":[447,853],"ule":[639,78,685,26,50,822,381],"ulf":[814,1439],"ulg":[268],"uli":[310,152,170,13,82,79,21,67,9,32,279,83,317,260,12,44,34,245,148,139,264,87,58,78,124,74,9,8,56,47,18,16],"ulk":[2490],"ull":[191,149,36,596,63,202,267,112,284,199,223,312,275],"ulm":[1373],"ulo":[417,304,760,37,977,638],"ulr":[181,207,83,110,255,175,229,383,346],"uls":[161,456,450,404,309,585],"ult":[2754],"ulu":[2273],"ulv":[56],"uly":[1511,1226],"ulz":[910,1593,721],"um ":[270,1862,632,92,313],"uma":[304,89,7,277,167,475,762,1145,12,216],"umb":[1664,716],"ume":[15,160,1212,659,678,669],"umg":[1155,1089],"umh":[310],"umi":[152,520,30,313,282,281],"uml":[724],"umm":[2202],"ump":[730,2557],"ums":[2069,729],"un ":[13,243,105,315,355,217,353,36,451,68,178,731,155,9],"una":[781,376,792,284,212,805,166],"unc":[152,1731],"und":[11,126,370,112,152,161,60,69,10,169,7,432,127,35,164,45,206,17,3,581,54,44,78,234,207],"une":[53,974,157,256,559,17,164,116,252,110,296,101,415],"ung":[322,775,174,362,52,105,768,622,173],"uni":[623,132,375,68,772,562,715,185,10],"unk":[751],"unl":[3024],"unn":[139,1275,390,1388],"uno":[144,30,83,78,451,622,1051,92,766,146],"unr":[1968],"uns":[50,230,6,1772,834,269],"unt":[375,139,530,282,339,200,32,27,120,614,324,244,231],"uo ":[347,1337,1302],"uom":[509],"uon":[712,197,791],"uop":[1212,786],"uor":[1020],"upa":[859,95,1596],"upi":[2,1198,378,196,347,9,199,104],"upp":[300,440],"upr":[357],"ups":[2508],"upt":[463],"uqu":[2177],"ur ":[140,213,38,15,367,304,125,129,39,409,532,23,248],"ura":[76,43,67,80,58,57,170,93,39,36,210,16,799,122,228,103,282,191,194,319,2,255],"urb":[265,461,375,1074,928,286],"urc":[1143,1752,523],"urd":[63,11,1088,426,211,373],"ure":[156,358,1095,114,542,468,340,248,12],"urf":[2576],"urg":[1034,34,109,273,260,249,130,496,17,15],"uri":[137,67,595,281,68,210,129,16,153,33,73,93,27,7,396,390,26,450,94],"urk":[977,280,1358,158],"url":[2640],"urm":[1298,950,276,813],"urn":[766,54,114,1228,1123],"uro":[810,148,280,377,5,329,648,78,557],"urp":[591,519,295,423,1512],"urr":[1559,82,293,324,613,159,59,201],"urs":[647,391,293,76,4,457,515,41,923,88],"urt":[662,6,37,494,546,60,498,607,158,76],"uru":[2046,42],"urw":[3087],"urz":[2728],"us ":[31,192,48,40,1,21,17,46,116,116,237,111,34,186,12,4,79,197,12,43,15,9,17,173,25,87,5,44,404,76,21,56,136,135,254,151,19,29,45,79,46,47,34],"usa":[211,293,221,41,248,1561,284,30,56,227,28,122,85],"usc":[503,328,254,503,584,37],"use":[199,10,592,84,179,223,92,63,57,18,127,2,59,390,180,140,377,409,175],"ush":[1550,969,69,825],"usi":[145,363,42,541,261,37,847,114,489,249],"usk":[172,99,72,814,1314,55,235],"usl":[485,1683,241,172,331,133,32,36],"usm":[868],"uso":[1667,455,217],"usp":[2369],"uss":[201,245,87,390,42,212,260,518,177,1179],"ust":[52,62,66,1355,91,16,219,154,230,397,80,114,70,100,156,153],"usz":[3,1,21,199,166,34,15,2,95,1,202,114,80,5,21,46,68,59,44,13,205,40,57,58,63,114,265,22,14,123,59,99,4,42,11,125,48,4,112,63,25,7,27,76,63,2,138,114,15,81,53,22,108,21],"ut ":[292,194,330,1580,77,117,100,49,34,507],"uta":[871,356,12,261,164,262,527,22,286,94,49,443,113],"utc":[399,2328],"ute":[188,822,203,1269,10,34,198,487,137],"uth":[278,455,335,318,724,174,1013],"uti":[272,456,171,321,509,1374],"utk":[675],"utl":[1186,64,532],"utn":[1686],"uto":[2311,250],"utr":[2679,122],"uts":[716],"utt":[318,27,385,176,278,148,1017,1078,56],"utz":[720,2181],"uu ":[2625],"uul":[2183],"uur":[1779],"uus":[2236,1008],"uva":[366,329],"uwa":[1595,242],"uwe":[5,972,154,662,99,174,383,379,577],"uxa":[811],"uxt":[1663],"uy ":[1163,2189],"uyd":[2943],"uye":[595],"uyn":[1413],"uyo":[59],"uz ":[556,1173,393,828],"uza":[165,141,2020,233,413,315,28],"uzd":[3472],"uze":[975,888,229,955],"uzi":[355,1049,130,604,11],"uzm":[1420],"uzn":[1059,1595],"uzo":[959,2259],"uzs":[1719],"uzz":[1890,468],"va ":[56,99,10,7,31,62,122,7,3,49,5,31,42,11,71,59,46,139,40,172,63,50,79,88,87,226,12,48,20,100,50,11,142,23,11,11,20,72,76,25,3,21,94,60,172,117,111,72,45,143,19,49,16,64,25,28,110],"vaa":[695],"vac":[2067,469,444,174],"vad":[319],"vag":[1957,33],"vah":[189,1023],"vai":[80,263,149,289,786,1227,225,320],"vaj":[1432,1984],"vak":[459,47],"val":[10,28,19,79,5,74,151,102,51,63,2,381,71,94,84,269,92,129,109,335,137,234,42,76,268,127,94,26,10,131,105,74,1],"van":[173,68,16,179,13,4,19,10,173,6,55,78,69,25,75,233,17,10,111,1,7,56,163,186,46,27,32,33,117,81,108,9,85,66,54,80,3,86,113,110,31,12,84,42,24,36,56,107,91,1,171],"vap":[434],"var":[6,4,274,46,85,59,212,143,62,29,131,409,11,18,131,197,346,967,170],"vas":[49,1125,51,817,410,75,1],"vat":[529,460,1334,128,865],"vau":[2284],"vaz":[128,1413,1256],"vch":[3123],"ve ":[355,179,147,9,152,688,225,1413,53],"vec":[1287],"ved":[3256],"vee":[2306],"veg":[2521],"vei":[2413,81],"vel":[49,2,5,95,165,127,159,1,145,191,81,492,171,299,155,647,30,186,26,36,153,74,60,21,76],"ven":[16,105,505,380,74,859,63,233,81,169,98,97,36,13,353,35,204],"ver":[10,52,98,112,472,166,22,89,13,12,185,178,59,172,139,154,13,103,243,157,40,29,175,8,78,86,117,74,355,14],"ves":[126,935,1005,78,892],"vet":[1597,171,414,280,29,729],"vey":[1763],"vez":[187],"vge":[2963,323,84],"vhe":[1813],"vi ":[677,30,497,477,420,719],"via":[248,336,282,807,25,16,115,27,510,230,227,404],"vic":[312,24,215,299,579,46,68,243,80,121,488,203,136,147,56,74,358],"vid":[157,84,169,47,83,8,116,159,16,56,29,17,241,13,23,11,30,187,180,11,46,15,55,72,64,15,322,162,69,4,117,111,16,133,30,3,142,290,24],"vie":[153,243,881,62,15,256,63,61,377,7,330,62,31,81,254,52,25,433,2],"vig":[307,2344],"vii":[1044],"vik":[7,16,1490,80,425,499,230],"vil":[338,100,54,105,127,25,638,267,220,432],"vin":[30,606,80,42,212,84,113,215,146,80,123,83,31,24,30,216,40,37,110,329,343,143,3,204,79,26],"vio":[7,429,690,505,259,94],"vir":[681,586,288,661,713,369],"vis":[386,115,283,17,504,447,38,106,290,332],"vit":[481,49,2200,71],"viu":[1471],"viv":[677],"viz":[2794],"vko":[731,1520],"vla":[402,483,453,1049],"vli":[1334],"vo ":[2154,752,283,126],"vod":[667,114],"voe":[3082],"vog":[540,160],"voh":[2213],"vol":[173,70,1,104,65,766,31,82,153,460,645,300,225,200],"von":[249,206,779,797,401,628],"vor":[479,193,1250,408,438,302,78],"vos":[1136,820,1316],"vou":[958],"voz":[1174],"vra":[285,1057,1204,349,398],"vri":[1836],"vs ":[46,356,1085,30,1158,81],"vsk":[1,142,1301,16,52,103,1321],"vud":[251],"vuo":[712,197,111],"vy ":[767,122,832,1113],"vya":[1885],"vyc":[1445],"vyd":[3125],"vyk":[2462],"vyt":[1500,1261],"vza":[771],"wa ":[103,382,69,413,72,726,83,28,167,33,127,96,164,49,288,112,325,216],"wab":[1303],"wac":[65,28,857,798,68,575],"wad":[1144,2004,273],"wag":[212],"wah":[583],"wai":[1740],"waj":[1595],"wak":[3,1868],"wal":[193,120,28,18,55,96,57,29,45,88,209,170,150,147,432,190,104,5,154,76,48,8,223,350],"wan":[88,552,405,126,1214,158],"war":[118,137,143,265,96,423,29,504,349,154,160,100,473,16,2],"was":[762,539,1611],"waw":[65],"way":[2249,838],"wcz":[435,1200,246,545,222,161],"wde":[2620,548],"we ":[5,405,567,154,761,174,1339],"web":[787,302,1020],"wee":[2239,274],"wef":[836],"weg":[2438,456],"wei":[487,535,666,78,1253,378],"wel":[42,96,158,305,51,103,41,58,90,291,7,42,79,127,26,512,254,422,124,244,93,143,22],"wem":[1752],"wen":[50,33,1196,26,202,53,233,656,50,26,61,323],"wer":[177,5,503,13,579,109,107,52,1272,43,300],"wes":[1172,301,1062,9,424,177],"wet":[3379],"wgo":[171],"whe":[384],"whi":[687,1014,8,145,1425,32],"wi ":[1952],"wia":[81,33,901,534,491,95,126,58,58,54,104,452,345,12],"wic":[103,43,3,209,100,116,44,55,234,350,137,75,84,164,9,191,63,20,14,29,34,47,253,63,103,92,26,88,14,67,84,73,259,121,7,9,70,8],"wid":[992,1284,487,308,48],"wie":[147,347,867,780,381,152,163,2,301,148,88],"wif":[2957],"wig":[58,2097,321],"wij":[863,1860,267],"wik":[466],"wil":[40,169,276,127,4,298,392,695,9,282,271,283,61,569],"wim":[2355,510],"win":[466,100,129,378,173,1,55,670,19,762,13,121,150,122],"wis":[1149,116,1012,282],"wit":[323,474,216,642,368,221,422,20,175,87],"wiz":[1562],"wka":[1662],"wko":[800,965],"wla":[862,94,895,1028],"wli":[457],"wlo":[930,74,44,235,213,1480,87],"wlu":[2033],"wma":[2397],"wn ":[79,468,394,1910,205],"wna":[1527],"wne":[43,1281,279],"wni":[3277],"woc":[3308],"woj":[480,169,24,26,38,8,358,461,88,334,457,269,118,116,322],"wol":[22,7,205,54,33,320,93,348,15,224,198,338,103,7,257,42,75,185,330,111,29,82,2,67,69],"wom":[558,178,524,517,69,1575],"won":[499,818,53,1595],"woo":[215,37,1117,6,1284],"wor":[678,491,1004,556,37,597],"wos":[944,991],"wou":[1213],"wow":[2218],"woz":[2565],"wra":[1668],"wre":[1185,1933],"wri":[112,1961,1188],"wro":[538,2074],"wrz":[65],"ws ":[1559,1312],"wsk":[88,26,3,15,46,40,13,65,29,31,4,54,59,63,22,7,5,17,35,1,26,9,13,4,61,9,10,4,17,24,2,49,4,37,4,23,11,3,17,9,8,31,7,25,15,3,11,10,9,17,16,77,82,14,26,15,5,31,3,7,12,76,25,17,45,3,30,3,17,20,93,53,33,17,18,38,31,59,25,49,96,37,8,23,4,109,34,29,10,21,10,4,15,52,27,18,6,53,16,7,28,11,32,6,94,10,57,1,24,7,4,6,10,11,24,12,18,12,82,77,35,9,34,1,30,16,23,4,28,12,8,52,52,16],"wso":[2064,124],"wsz":[1232],"wte":[2991],"wth":[1209],"wto":[1281],"wu ":[925],"wul":[1067],"wus":[1918,1082],"wut":[2855],"wye":[3225],"wyg":[184,1317],"wyl":[247],"wyn":[491],"wys":[541],"xad":[811],"xan":[26,170,64,503,119,761,49,576,104,42,848],"xao":[2117],"xav":[2448,174,766],"xe ":[827],"xea":[3207],"xei":[1940,853],"xey":[1507,1076],"xim":[573,146,427,865,810,40],"xio":[2129],"xis":[1943,218],"xon":[1594,1702],"xpo":[2459,1020],"xto":[1663],"xy ":[2165],"ya ":[1229,746,463,36,263],"yac":[194],"yah":[1853],"yak":[1668,1168],"yal":[1337],"yam":[702],"yan":[200,208,307,111,429,413,762,335,67,463],"yap":[1668],"yar":[1885],"yat":[1445],"yaz":[1458],"yb ":[1470],"yba":[106,2411],"ybo":[1095],"ybu":[1331],"yby":[818,240],"yc ":[1598,1459],"yca":[2869,41],"yce":[2086,614],"ych":[197,915,333,758,743],"ycj":[1283,1880],"yck":[711],"ycz":[1625,819],"yd ":[612,753,475],"yda":[2462,663],"yde":[8,411,180,1168,852],"ydi":[1722],"ydo":[1059],"ydt":[2943],"ye ":[2899,425],"yel":[3220],"yem":[2046],"yeo":[179],"yer":[595,1178,175,316,62,899],"yev":[1813],"yfa":[586],"yga":[184,138,1179],"ygi":[1378,1177],"ygm":[1326,339,1792],"yha":[792],"yhi":[3441],"yi ":[1872,978],"yk ":[8,17,210,31,126,43,58,68,53,390,48,49,110,71,1,34,40,4,90,45,100,8,277,155,16,143,13,261,139,368,16,43,10,64,121],"yke":[2818],"ykh":[1586],"yko":[1574,364,626],"yku":[617],"yky":[2462],"yl ":[1174,1712],"yla":[818,371,892,236,293,212],"yle":[267,507,349,101,453,932],"yli":[825,282],"ylk":[2035,917],"yll":[247],"ylo":[626],"ylv":[80,168,1818,52,901],"ylw":[1473,846,216,433,19,345,12],"ym ":[2801],"yma":[325,1077,71,452,719],"yme":[64,149],"ymi":[1785,1194],"ymo":[120,303,235,193,115,616,260,226],"yms":[1492],"ymu":[266,802],"ymy":[1445,1105,300],"yn ":[567,13,765,95,1231,113,28,188,398],"yna":[114,63,146,394,186,248,119,52,69,166,39,2,366,51,20,170,258,67,112,143,77,117,211,29,222],"ync":[3235],"ynd":[491,1807],"yne":[939,474,72,527,315,674,69,102],"yni":[8,57],"ynn":[2549],"yns":[17,125,85,212,300,146,594,536,562,71,69,23,29,2,5,33,103,325,231],"yo ":[59,1692,342,4,816,437],"yon":[732,1140,1151],"yor":[1196,328,733,713,7,189],"yos":[1002],"you":[1027,606,52],"yov":[2743],"yoz":[3138],"ypk":[2286],"yr ":[94,1351,1105,300],"yra":[2702],"yrc":[2308],"yre":[123],"yri":[1754,327,563,349],"yrj":[3016],"yrm":[3042],"yrn":[758,229],"yro":[2260,1124],"yrr":[3076],"ys ":[2453,349],"ysa":[3193],"yse":[2018,82,632,640,58],"ysh":[580,765],"ysi":[1707,605],"ysk":[1171],"ysl":[63,170,723,505,914,9,272,425,4,337],"yso":[541,11,2,1046,1000],"yss":[1752,1433],"yst":[1112,158,198,50,83,363,71],"ysz":[99,121,93,109,6,434,196,86,41,3,183,158,526,69,19,65,33,88,23,68,24,163,53,14,17,49,27,95,153,203,29,165,3,28,13],"yta":[1088,412,1261,716],"ytr":[289,1056],"ytt":[2489],"ytu":[2365],"yul":[662,2536],"yur":[1615],"yuv":[366],"yva":[3189],"yve":[1468,129,585,309],"yvi":[2155],"yvo":[249,985,1826],"ywa":[1816,575],"yza":[3220,167],"za ":[100,206,298,113,43,5,922,114,515,58,290,133,175,125,218],"zab":[709,198,2379],"zac":[3186],"zad":[1759],"zaf":[1604,448],"zag":[1145],"zah":[455,1420,215],"zai":[1401],"zaj":[279],"zak":[66,7,37,102,298,39,80,108,201,235,276,42,136,8,119,129,134,10,207,167,327,38,131,204,86,290],"zal":[495,397,417,329,436,513,108,90,143,308,107],"zam":[799],"zan":[165,106,266,84,61,89,948,141,300,54,112,91,54,88,202,526,13,87,58],"zap":[709,284,443,1339],"zar":[2,64,154,3,90,109,182,30,14,540,87,96,158,106,441,67,290,6,328,515,130,27],"zas":[2422],"zat":[53,14,724,755,287,802,156,93,54,449],"zav":[3220],"zaw":[1144,625,1652],"zay":[2255,377],"zbe":[1183],"zbi":[35,526,124,172,98,27,31,317,216,604,87,143,55,156,456,89,112,144],"zca":[166],"zch":[369,992,485],"zci":[3436],"zco":[1506],"zcz":[25,35,1241,134,44,495,176,432,270,249],"zda":[2938],"zde":[172,2390,229,323,358],"zdo":[2755],"zdu":[3247],"zdz":[993,503,1928],"ze ":[371,539,64,289,230,230,140],"zeb":[1069,1946],"zec":[802],"zed":[745],"zef":[494,229,987,264,68,680],"zeg":[292,309,32,1079,25,78,326,69,32,62,102,171,25,4,589],"zeh":[1796],"zei":[183,2883],"zej":[17,56,146,148,91,129,42,14,119,106,67,82,394,90,216,13,30,142,75,56,59,107,175,69,34,213,27,59,309,235],"zek":[75,204,113,93,17,77,99,26,253,491,14,204,244,4,178,191,80,323,216,227,307,34],"zel":[515,455,62,811,29,296,81,461,293],"zem":[233,1996,146,281,425,44,297],"zen":[118,423,404,337,280,57,71,71,533,1089],"zep":[60,1375],"zer":[975,395,1097,193,387,202,173,33],"zes":[816,151,48,733,629,213,179,83,8,241],"zet":[1458,1563],"zeu":[2675],"zev":[3370],"zew":[132,1580,86,83,105,28,117,68,653,1,35,331,73,100,52],"zez":[1242],"zga":[1122],"zgl":[422,895],"zgo":[246,770],"zhu":[2056,990],"zi ":[888,34,121,361,734,59,575,44,322],"zia":[760,185,406,131,540,29,55,32,1057],"zic":[590,868],"zie":[355,69,198,11,543,108,288,154,117,137,396,242,426,65,258,7],"zig":[2271],"zih":[1009],"zii":[3156],"zij":[1749],"zik":[741,2269],"zil":[1534,1167,347],"zim":[1837,251,990],"zin":[470,123,7,642,580,7,636,456,112,410],"zio":[156,48,156,515,29,752,493,840,478],"zir":[3051],"zis":[268,725,88,415,1796,132],"zit":[2673],"ziu":[2088,84],"ziw":[944],"zji":[2586],"zka":[4,31,293,101,238,62,366,86,270,131,160,905,21,235,82],"zki":[259,885,419,208,272,424,194,326],"zko":[1015,1362,161,76],"zl ":[1219],"zla":[343],"zle":[2499,378],"zlo":[340,370,85,713,1247,17,688],"zma":[1217,745,357,422,162,342],"zmi":[1420,814,533,420],"zne":[1174,936],"zni":[1059,1506,89],"zny":[211,24,240,961],"zo ":[72,1427,217,75,99,9,21,438,780],"zod":[1479],"zoe":[267,2092],"zof":[65,2854,369],"zog":[1557],"zoi":[921],"zok":[1625,1721],"zol":[1232,742],"zon":[2794],"zop":[1391,773],"zor":[1030,895,717,199,97,322],"zos":[358],"zou":[1404,1781],"zow":[959,366,1328,565],"zoz":[2653,537],"zpa":[1461,1883],"zpo":[1540],"zqu":[128,1413,744],"zro":[2577],"zsa":[1719],"zsc":[1416],"zse":[459,592],"zso":[183,319,545,1919,127],"zsu":[1719],"zte":[917,121,1594],"zti":[710,1922],"zto":[99,329,91,343,282,41,378,492,69,84,33,88,23,68,24,163,53,14,17,49,122,153,203,29,168,28,13],"ztu":[1858,915],"zu ":[1975],"zub":[1882],"zuc":[3150],"zue":[223],"zuk":[699,139,294,169,732,393,391],"zul":[55,36,556,391,335,591,460,72,694],"zum":[3169],"zun":[3442],"zur":[140,2442],"zut":[816,1774],"zuz":[165,3122],"zwa":[212],"zwi":[494],"zwo":[2967],"zwy":[184],"zy ":[63,18,735,253,32,99,157,21,398,87,58,79,245,115,528,4,5,72,51,79],"zyb":[818,240,412],"zyc":[1598],"zyd":[1059],"zyg":[1326,339,1792],"zyk":[25,367,43,58,68,53,3,387,48,49,110,71,1,34,40,94,45,100,8,277,155,16,143,13,261,139,368,16,43,10,185],"zyl":[2035],"zym":[120,146,157,235,193,115,507,109,343,143],"zyn":[17,48,77,35,50,96,116,278,22,164,248,171,69,88,78,41,865,114,71,69,23,29,2,5,9,24,53,50,307,18,231],"zys":[63,36,329,126,308,282,41,276,594,69,84,33,88,23,32,36,24,163,53,14,17,49,275,70,133,29,168,28,13],"zyt":[2365],"zyw":[1816,575],"zyz":[3387],"zza":[1801,996],"zze":[1458],"zzi":[922,1275],"zzo":[1404,387,99,30,438],"αθα":[1376],"ανα":[1376],"αρι":[1376],"ασο":[1376],"θαν":[1376],"ια ":[1376],"λου":[1376],"μαρ":[1376],"νασ":[1376],"οπο":[1376],"ου ":[1376],"ουλ":[1376],"που":[1376],"ρια":[1376],"σοπ":[1376],"υλο":[1376]}};
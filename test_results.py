@@ -0,0 +1,31 @@
+import json
+
+from results import ResultsStore
+
+def write_prog(path, events, competitors):
+    with open(path, 'w') as f:
+        json.dump({'competitors': competitors, 'events': events}, f)
+
+def shot_put_heat(heat, performance):
+    return {'eventId': 'e1', 'eventCode': 'SP', 'round': 1, 'heat': heat,
+            'results': [{'bib': '1', 'place': 1, 'performance': performance}]}
+
+def test_reload_drops_units_missing_from_the_snapshot(tmp_path):
+    # Units stream before their event record, so the first pass already
+    # ranks shot put marks higher-is-better
+    prog = tmp_path / 'prog.json'
+    competitors = [{'competitorId': '1', 'firstName': 'A', 'lastName': 'B', 'ageGroup': 'W40', 'gender': 'F'}]
+    write_prog(prog, [{'eventId': 'e1', 'eventCode': 'SP', 'name': 'Shot Put',
+                       'units': [shot_put_heat(1, '10.00'), shot_put_heat(2, '12.00')]}], competitors)
+    store = ResultsStore(tmp_path / 'results')
+    store.load_meeting(prog)
+    store.flush()
+    assert store.rankings['e1', 'W40'][0]['mark'] == 12.0
+
+    write_prog(prog, [{'eventId': 'e1', 'eventCode': 'SP', 'name': 'Shot Put',
+                       'units': [shot_put_heat(1, '10.00')]}], competitors)
+    store.load_meeting(prog)
+    assert store.stale_units == {'e1-r1-h2'}
+    store.flush()
+    assert store.rankings['e1', 'W40'][0]['mark'] == 10.0
+    assert not (tmp_path / 'results' / 'units' / 'e1-r1-h2.json').exists()
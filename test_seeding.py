@@ -0,0 +1,46 @@
+import json
+
+from seeding import Seeding
+
+def write_prog(path, events, competitors):
+    with open(path, 'w') as f:
+        json.dump({'events': events, 'competitors': competitors}, f)
+
+def test_reload_sorts_groups_entered_before_their_event(tmp_path):
+    # Entries for an event that is not in the first prog.json are seeded
+    # without a code; once the event appears, its groups are re-sorted by it
+    prog = tmp_path / 'prog.json'
+    competitors = [
+        {'competitorId': bib, 'gender': 'F', 'ageGroup': 'W40', 'eventsEntered': [{'eventId': 'e1', 'eventCode': 'SP', 'qp': qp}]}
+        for bib, qp in (('1', '9.50'), ('2', '11.20'), ('3', '10.05'))
+    ]
+    write_prog(prog, [], competitors)
+    seeding = Seeding()
+    seeding.load_meeting(prog)
+    seeding.seed()
+
+    write_prog(prog, [{'eventId': 'e1', 'eventCode': 'SP', 'genders': 'F', 'units': []}], competitors)
+    seeding.load_meeting(prog)
+    seeding.seed()
+
+    assert [bib for key, bib, qp in seeding.groups['e1', 'F', 'W40']] == ['2', '3', '1']
+    fresh = Seeding()
+    fresh.load_meeting(prog)
+    fresh.seed()
+    assert seeding.units == fresh.units
+
+def test_placeholder_marks_seed_last(tmp_path):
+    # "0.00" is a placeholder, not the fastest time; it seeds with no mark
+    prog = tmp_path / 'prog.json'
+    competitors = [
+        {'competitorId': bib, 'gender': 'M', 'ageGroup': 'V45', 'eventsEntered': [{'eventId': 'e1', 'eventCode': '60', 'qp': qp}]}
+        for bib, qp in (('1', '0.00'), ('2', '7.95'), ('3', ''), ('4', '7.60'), ('5', '0'))
+    ]
+    write_prog(prog, [{'eventId': 'e1', 'eventCode': '60', 'genders': 'M', 'lanes': 8, 'units': []}], competitors)
+    seeding = Seeding()
+    seeding.load_meeting(prog)
+    seeding.seed()
+
+    assert [bib for key, bib, qp in seeding.groups['e1', 'M', 'V45']] == ['4', '2', '1', '3', '5']
+    lanes = {a['bib']: a['lane'] for a in seeding.units['e1', 'M', 'V45']['units'][0]['athletes']}
+    assert lanes['4'] == 4 and lanes['2'] == 5
@@ -0,0 +1,188 @@
+import argparse
+import itertools
+import json
+import time
+
+import numpy as np
+
+from compact_schedule import decode, expand
+from competitor_store import CompetitorStore
+from conflicts import SESSION_MINUTES
+from event_classifier import EventClassifier
+from occupancy import areas_by_slot, build_sessions, event_rules, round_heats
+from seeding import DEFAULT_LANES, LANE_EVENTS, MASS_START_SIZE
+
+# Projected start times for the track sessions from the entries. Each
+# session (a timetable line, from occupancy.build_sessions) runs
+#
+#   heats = ceil(athletes / lanes)          lane races and pentathlon
+#           ceil(athletes / mass start size) or one race otherwise
+#
+# capped at the heats of a semi or final, and takes heats x HEAT_MINUTES.
+# The track runs one session at a time, so a session starts at the later of
+# its printed time and the end of the one before:
+#
+#   start[i] = max(scheduled[i], start[i-1] + duration[i-1])
+#
+# which unrolls to start = C + running max of (scheduled - C), with C the
+# durations summed before each session. That is two prefix operations per
+# scenario, so a batch of scenarios (lane counts, per-event heat-time
+# scales) is evaluated as one (scenarios x sessions) array.
+#
+# HEAT_MINUTES are what the printed timetable allows per heat (its lower
+# quartile for the current entries). Field and outside sessions use parallel
+# pits and circles and keep their printed times.
+
+HEAT_MINUTES = {
+    '60': 5, '60H': 5, '200': 5, '400': 6, '800': 7, '1500': 9, '3000': 15,
+    '3000W': 25, '4x200': 6, 'PEN': 4
+}
+DEFAULT_HEAT_MINUTES = 6
+LATE_MINUTES = 5
+
+class Budget:
+    def __init__(self, sessions, lanes=None, heat_minutes=None):
+        minutes = {**HEAT_MINUTES, **(heat_minutes or {})}
+        track = [s for s in sessions if s['area'] == 'TRACK']
+        self.sessions = sorted(track, key=lambda s: (s['start'], s['eventCode'], s['desc']))
+        self.codes = sorted({s['eventCode'] for s in self.sessions})
+        code_ids = {code: i for i, code in enumerate(self.codes)}
+
+        self.scheduled = np.array([s['start'] for s in self.sessions], dtype=np.float64)
+        self.athletes = np.array([s['athletes'] for s in self.sessions], dtype=np.float64)
+        self.code = np.array([code_ids[s['eventCode']] for s in self.sessions], dtype=np.int64)
+        self.minutes = np.array([minutes.get(code, DEFAULT_HEAT_MINUTES) for code in self.codes], dtype=np.float64)
+        # Lane races take the scenario's lane count; mass starts a fixed size (inf: one race)
+        laned = [s['eventCode'] in LANE_EVENTS or s['eventCode'] == 'PEN' for s in self.sessions]
+        self.laned = np.array(laned)
+        self.size = np.array([np.inf if laned[i] or not MASS_START_SIZE.get(s['eventCode'], DEFAULT_LANES) else
+                              MASS_START_SIZE.get(s['eventCode'], DEFAULT_LANES) for i, s in enumerate(self.sessions)])
+        self.max_heats = np.array([round_heats(s['round']) if s['later'] else np.inf for s in self.sessions])
+        self.lanes = lanes or DEFAULT_LANES
+
+    def durations(self, lanes, scale):
+        # lanes (S,), scale (S, codes) -> minutes per session (S, n)
+        size = np.where(self.laned, lanes[:, None], self.size)
+        heats = np.minimum(np.ceil(self.athletes / size), self.max_heats)
+        return heats * self.minutes[self.code] * scale[:, self.code]
+
+    def project(self, lanes, scale):
+        # Projected starts and durations, each (S, n)
+        durations = self.durations(lanes, scale)
+        before = np.cumsum(durations, axis=1) - durations
+        return before + np.maximum.accumulate(self.scheduled - before, axis=1), durations
+
+    def base(self):
+        return np.array([self.lanes]), np.ones((1, len(self.codes)))
+
+    def grid(self, lanes, scales):
+        # Every combination of the lane counts and the per-code scale lists;
+        # scales: {code or 'all': [factors]}
+        keys = list(scales)
+        combos = list(itertools.product(lanes, *(scales[k] for k in keys)))
+        lane_values = np.array([c[0] for c in combos], dtype=np.float64)
+        scale = np.ones((len(combos), len(self.codes)))
+        for j, key in enumerate(keys):
+            factors = np.array([c[j + 1] for c in combos])
+            columns = range(len(self.codes)) if key == 'all' else [self.codes.index(key)]
+            for col in columns:
+                scale[:, col] *= factors
+        return lane_values, scale, [dict(lanes=int(c[0]), **dict(zip(keys, c[1:]))) for c in combos]
+
+def summarise(starts, budget, late=LATE_MINUTES):
+    delay = starts - budget.scheduled
+    return {
+        'late': (delay > late).sum(axis=1),
+        'maxDelay': delay.max(axis=1),
+        'totalDelay': delay.sum(axis=1)
+    }
+
+def format_minute(minute):
+    minute = int(round(minute))
+    return f"{minute % 1440 // 60:02d}:{minute % 60:02d}"
+
+def late_sessions(budget, starts, durations, late=LATE_MINUTES):
+    found = []
+    for i, s in enumerate(budget.sessions):
+        delay = starts[i] - budget.scheduled[i]
+        if delay > late:
+            found.append({
+                'eventCode': s['eventCode'], 'desc': s['desc'], 'day': s['day'], 'time': s['time'],
+                'projected': format_minute(starts[i]), 'delay': round(float(delay), 1),
+                'athletes': s['athletes'], 'minutes': round(float(durations[i]), 1)
+            })
+    return found
+
+def parse_values(text):
+    # "0.8,1,1.2" or "0.8:1.2:0.1" (inclusive range)
+    if ':' in text:
+        lo, hi, step = (float(x) for x in text.split(':'))
+        return [round(v, 6) for v in np.arange(lo, hi + step / 2, step)]
+    return [float(x) for x in text.split(',')]
+
+def parse_scales(items):
+    scales = {}
+    for item in items:
+        code, _, values = item.partition('=')
+        scales[code] = parse_values(values)
+    return scales
+
+def parse_heat_minutes(items):
+    return {code: float(minutes) for code, _, minutes in (item.partition('=') for item in items)}
+
+def load_budget(prog_path, schedule_path, parsed_path, heat_minutes=None):
+    with open(schedule_path, 'r') as f:
+        rows = expand(decode(json.load(f)))
+    classifier = EventClassifier()
+    with open(parsed_path, 'r') as f:
+        areas = areas_by_slot(json.load(f), classifier)
+    rules = event_rules(prog_path)
+    sessions = build_sessions(rows, CompetitorStore.load(prog_path).group_counts(), rules, areas, classifier, SESSION_MINUTES)
+    lanes = max((r.get('lanes') or 0 for r in rules.values() if r['eventCode'] in LANE_EVENTS), default=0) or None
+    return Budget(sessions, lanes, heat_minutes)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Project track session start times from the entries and flag the ones that will run late.')
+    parser.add_argument('--prog', default='prog.json')
+    parser.add_argument('--schedule', default='schedule_compact.json')
+    parser.add_argument('--timetable', default='parsed_timetable_v6.json')
+    parser.add_argument('--heat-minutes', action='append', default=[], metavar='CODE=MINUTES', help='minutes per heat for an event code')
+    parser.add_argument('--late', type=float, default=LATE_MINUTES, help='minutes behind the timetable that count as late')
+    parser.add_argument('--lanes', type=int, nargs='+', help='lane counts to try')
+    parser.add_argument('--scale', action='append', default=[], metavar='CODE=VALUES',
+                        help="heat time factors to try for an event code (or 'all'), e.g. 400=0.9,1,1.1 or all=0.8:1.2:0.05")
+    parser.add_argument('--top', type=int, default=10, help='scenarios to list')
+    parser.add_argument('--json', metavar='PATH', help='also write the projections as JSON')
+    args = parser.parse_args()
+
+    budget = load_budget(args.prog, args.schedule, args.timetable, parse_heat_minutes(args.heat_minutes))
+    scales = parse_scales(args.scale)
+    unknown = sorted(set(scales) - set(budget.codes) - {'all'})
+    if unknown:
+        parser.error(f"--scale: no track sessions for {', '.join(unknown)}; codes are {', '.join(budget.codes)} or 'all'")
+    starts, durations = budget.project(*budget.base())
+    late = late_sessions(budget, starts[0], durations[0], args.late)
+    print(f"{len(budget.sessions)} track sessions with {budget.lanes} lanes: {len(late)} projected more than {args.late:g} min late")
+    for s in late:
+        print(f"  day {s['day']} {s['time']} -> {s['projected']} (+{s['delay']:g} min)  {s['desc']} "
+              f"({s['athletes']} athletes, {s['minutes']:g} min)")
+    result = {'lanes': budget.lanes, 'late': late}
+
+    if args.lanes or args.scale:
+        lanes, scale, labels = budget.grid(args.lanes or [budget.lanes], scales)
+        start = time.perf_counter()
+        starts, durations = budget.project(lanes, scale)
+        summary = summarise(starts, budget, args.late)
+        elapsed = time.perf_counter() - start
+        print(f"\n{len(labels)} scenarios in {elapsed * 1000:.1f} ms; fewest late sessions:")
+        order = np.lexsort((summary['totalDelay'], summary['late']))[:args.top]
+        for i in order:
+            what = ' '.join(f"{k}={v:g}" for k, v in labels[i].items())
+            print(f"  {what:40} {summary['late'][i]:4} late  max +{summary['maxDelay'][i]:.0f} min  "
+                  f"total {summary['totalDelay'][i]:.0f} min")
+        result['scenarios'] = [{**labels[i], 'late': int(summary['late'][i]), 'maxDelay': float(summary['maxDelay'][i]),
+                                'totalDelay': float(summary['totalDelay'][i])} for i in range(len(labels))]
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
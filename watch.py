@@ -0,0 +1,251 @@
+import argparse
+import json
+import os
+import time
+import traceback
+
+import pdfplumber
+
+import build_schedule
+import bundle_data
+import conflicts
+import facets
+import join_schedule
+import occupancy
+import parse_v6
+import results
+import schedule_diff
+import search_index
+import seeding
+from compact_schedule import ScheduleIndex, decode, expand
+from common import write_atomic
+from competitor_store import CompetitorStore
+from event_classifier import EventClassifier
+from extract_cache import ExtractCache, page_content_hash
+
+# Long-running rebuild loop for the championships. Polls timetable.pdf and
+# prog.json, waits for a burst of writes to settle, then rebuilds in-process:
+#
+#   timetable.pdf -> parsed_timetable_v6.json, schedule.json, schedule_compact.json,
+#                    src/js/schedule.js, src/js/schedule_lookup.js, conflicts.json,
+#                    occupancy.json
+#   prog.json     -> src/js/schedule_lookup.js, conflicts.json, occupancy.json, src/js/data.js,
+#                    src/results (only units and rankings whose results changed),
+#                    seeding.json (only groups whose entries changed are re-seeded),
+#                    src/js/search.js (new and renamed competitors only)
+#   either        -> src/shards (only shards whose content changed), src/js/facets.js
+#
+# Page layouts are kept in memory by page content hash, so an overwritten PDF
+# only re-parses the pages whose content changed. Every output is written to
+# a temporary file and renamed over the old one, but a rebuild that fails
+# partway (e.g. on a PDF caught mid-copy) keeps whatever outputs it already
+# wrote. The watcher then drops its in-memory state (schedule, results,
+# seeding) for what is on disk and retries the whole rebuild every
+# RETRY_SECONDS until it succeeds.
+
+POLL_INTERVAL = 0.5
+SETTLE_SECONDS = 1.0
+RETRY_SECONDS = 10.0
+
+def log(message):
+    print(f"{time.strftime('%H:%M:%S')} {message}", flush=True)
+
+def file_signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+class Debouncer:
+    # A path is reported once its signature has stopped changing for `settle` seconds
+    def __init__(self, paths, settle=SETTLE_SECONDS):
+        self.settle = settle
+        self.current = {path: file_signature(path) for path in paths}
+        self.changed_at = {}
+
+    def poll(self, now):
+        ready = []
+        for path, previous in self.current.items():
+            signature = file_signature(path)
+            if signature != previous:
+                self.current[path] = signature
+                self.changed_at[path] = now
+            elif path in self.changed_at and now - self.changed_at[path] >= self.settle:
+                del self.changed_at[path]
+                if signature is not None:
+                    ready.append(path)
+        return ready
+
+class Watcher:
+    def __init__(self, pdf_path='timetable.pdf', prog_path='prog.json', use_cache=True):
+        self.pdf_path = pdf_path
+        self.prog_path = prog_path
+        self.cache = ExtractCache() if use_cache else None
+        self.classifier = EventClassifier()
+        self.layouts = {}
+        self.reset()
+
+    def reset(self):
+        # Incremental state, rebuilt from the files on disk
+        self.results = results.ResultsStore()
+        self.seeding = seeding.Seeding()
+        self.slots = self._load_slots()
+        self.index = ScheduleIndex(self.slots)
+
+    def _load_slots(self):
+        try:
+            with open('schedule_compact.json', 'r') as f:
+                return decode(json.load(f))
+        except FileNotFoundError:
+            return []
+
+    def parse_timetable(self):
+        layouts = {}
+        pages = []
+        reparsed = 0
+        with pdfplumber.open(self.pdf_path) as pdf:
+            for page in pdf.pages:
+                key = self.cache.page_key(page) if self.cache else page_content_hash(page)
+                if key not in self.layouts:
+                    self.layouts[key] = parse_v6.cached_layout_page(page, self.cache)
+                    reparsed += 1
+                layouts[key] = self.layouts[key]
+                pages.append(layouts[key])
+        # Forget pages that are no longer in the PDF
+        self.layouts = layouts
+
+        events = []
+        state = parse_v6.initial_state()
+        for page_num, (boundaries, layout) in enumerate(pages):
+            parse_v6.segment_page(page_num, boundaries, layout, state, events)
+        write_atomic('parsed_timetable_v6.json', json.dumps(events, indent=2))
+        log(f"timetable: {len(pages)} pages, {reparsed} re-parsed, {len(events)} events")
+        return events
+
+    def rebuild_schedule(self, events):
+        slots = build_schedule.build_slots(events, self.classifier)
+        schedule = build_schedule.write_schedule(slots)
+        changes = schedule_diff.diff(expand(self.slots), schedule, self.classifier)
+        log(f"schedule: {len(schedule)} entries ({len(slots)} slots), {len(changes['moved'])} moved, "
+            f"{len(changes['added'])} added, {len(changes['removed'])} removed")
+        for key, old, new in changes['moved']:
+            log(f"  moved   {schedule_diff.format_key(key)}: {schedule_diff.format_when(old)} -> {schedule_diff.format_when(new)}")
+        for key, row in changes['added']:
+            log(f"  added   {schedule_diff.format_key(key)}: {schedule_diff.format_when(row)}")
+        for key, row in changes['removed']:
+            log(f"  removed {schedule_diff.format_key(key)}")
+        if changes['moved'] or changes['removed']:
+            affected = schedule_diff.affected_competitors(changes, self.store.dicts())
+            log(f"  {len({a['competitorId'] for a in affected})} competitors affected")
+        self.slots = slots
+        self.index = ScheduleIndex(slots)
+
+    def rebuild_lookup(self):
+        table, entries = join_schedule.join(self.prog_path, self.index, self.store.dicts())
+        unmatched = sum(count for key, count in entries.items() if table[key] is None)
+        log(f"lookup: {len(table)} groups, {sum(entries.values())} entries, {unmatched} without a slot")
+
+    def rebuild_conflicts(self):
+        result = conflicts.detect(self.store.dicts(), expand(self.slots))
+        write_atomic('conflicts.json', json.dumps(result, indent=2))
+        overlaps = sum(1 for c in result['conflicts'] if c['kind'] == 'overlap')
+        log(f"conflicts: {overlaps} overlaps, {len(result['conflicts']) - overlaps} under {result['recovery']} min recovery")
+
+    def rebuild_occupancy(self):
+        result = occupancy.build_occupancy(self.prog_path, expand(self.slots), store=self.store)
+        write_atomic('occupancy.json', json.dumps(result, separators=(',', ':')))
+        busiest = max((p['athletes'], area, day['day'], p['time']) for day in result['days']
+                      for area, peaks in day['peaks'].items() for p in [peaks['callroom']])
+        log(f"occupancy: {result['sessions']} sessions, busiest call room {busiest[1]} day {busiest[2]} "
+            f"{busiest[3]} ({busiest[0]} athletes)")
+
+    def rebuild_bundle(self):
+        bundle, digest, payload = bundle_data.build_bundle(self.prog_path)
+        log(f"bundle: {bundle['count']} competitors, {len(bundle['qp'])} entries, hash {digest}")
+
+    def rebuild_results(self):
+        changed = self.results.load_meeting(self.prog_path)
+        units, rankings = self.results.flush()
+        log(f"results: {changed} units changed, {units} unit and {rankings} ranking files updated")
+
+    def rebuild_seeding(self):
+        dirty = self.seeding.load_meeting(self.prog_path)
+        changed = self.seeding.seed()
+        if changed or not os.path.exists(seeding.SEEDING_PATH):
+            seeding.write_seeding(self.seeding)
+        log(f"seeding: {dirty} groups to re-seed, {len(changed)} changed")
+
+    def rebuild_search(self):
+        index, how, (added, renamed, removed), payload = search_index.write_index(self.prog_path)
+        log(f"search: {how}, {added} added, {renamed} renamed, {removed} removed")
+
+    def rebuild_shards(self):
+        # Shard days come from the schedule, so this follows either input
+        manifest, written = bundle_data.write_shards(self.prog_path, self.index, jobs=1)
+        log(f"shards: {len(manifest['teams'])} team and {len(manifest['events'])} event files, {written} rewritten")
+
+    def rebuild_facets(self):
+        result, payload = facets.write_facets(self.prog_path, self.index)
+        log(f"facets: {result['rows']} rows, {len(payload) // 1024} KB")
+
+    def handle(self, changed):
+        # One pass over prog.json for the steps that only read competitors and entries
+        self.store = CompetitorStore.load(self.prog_path)
+        if self.pdf_path in changed:
+            self.rebuild_schedule(self.parse_timetable())
+        if self.pdf_path in changed or self.prog_path in changed:
+            self.rebuild_lookup()
+            self.rebuild_conflicts()
+            self.rebuild_occupancy()
+        if self.prog_path in changed:
+            self.rebuild_bundle()
+            self.rebuild_results()
+            self.rebuild_seeding()
+            self.rebuild_search()
+        if self.pdf_path in changed or self.prog_path in changed:
+            self.rebuild_shards()
+            self.rebuild_facets()
+
+    def run(self, interval=POLL_INTERVAL, settle=SETTLE_SECONDS, retry=RETRY_SECONDS):
+        debouncer = Debouncer([self.pdf_path, self.prog_path], settle)
+        log(f"watching {self.pdf_path} and {self.prog_path}")
+        failed = set()
+        retry_at = None
+        while True:
+            now = time.monotonic()
+            changed = debouncer.poll(now)
+            if changed:
+                log(f"changed: {', '.join(changed)}")
+            elif failed and now >= retry_at:
+                log(f"retrying: {', '.join(sorted(failed))}")
+            else:
+                time.sleep(interval)
+                continue
+            try:
+                self.handle(failed | set(changed))
+                failed = set()
+            except Exception:
+                failed |= set(changed)
+                retry_at = time.monotonic() + retry
+                log(f"rebuild failed, outputs may be partly updated; retrying in {retry:g}s:\n{traceback.format_exc()}")
+                self.reset()
+            time.sleep(interval)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Rebuild the schedule and data bundle whenever timetable.pdf or prog.json changes.')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, help='seconds between polls')
+    parser.add_argument('--settle', type=float, default=SETTLE_SECONDS, help='seconds a file must stay unchanged before rebuilding')
+    parser.add_argument('--retry', type=float, default=RETRY_SECONDS, help='seconds before retrying a failed rebuild')
+    parser.add_argument('--no-cache', action='store_true', help='do not use the on-disk extraction cache')
+    parser.add_argument('--once', action='store_true', help='rebuild everything once and exit')
+    args = parser.parse_args()
+
+    watcher = Watcher(use_cache=not args.no_cache)
+    if args.once:
+        watcher.handle({watcher.pdf_path, watcher.prog_path})
+    else:
+        try:
+            watcher.run(args.interval, args.settle, args.retry)
+        except KeyboardInterrupt:
+            pass